@@ -1,8 +1,17 @@
 from .api_handler import *
+from .asset_index import *
+from .asset_sort import *
 from .db import *
 from .dcc_handler import *
+from .hdri_analytics import *
+from .hdri_proxies import *
+from .image_search import *
+from .job_queue import *
 from .maya_cmds import *
 from .metadata_handler import *
 from .pool_handler import *
+from .render_daemon import *
 from .settings import *
 from .thread_worker import *
+from .thumbnail_cache import *
+from .thumbnail_pack import *
@@ -0,0 +1,414 @@
+import json
+import os
+from pathlib import Path
+from threading import Lock, RLock
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from ..core import Logger, fs
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def read_arrays(path: Path) -> Optional[dict]:
+    import numpy as np
+
+    if not path.exists():
+        return None
+
+    try:
+        with np.load(path) as data:
+            return dict(data)
+    except Exception as e:
+        Logger.exception(e)
+        return None
+
+
+def write_arrays(path: Path, **arrays) -> None:
+    import numpy as np
+
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(exist_ok=True)
+        with open(tmp_path, "wb") as file:
+            np.savez(file, **arrays)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        Logger.exception(e)
+
+
+class AssetIndex:
+    """Per pool store for data derived from the assets, kept in <Pool>/Index.
+
+    Thumbnail sources record the asset (mtime, size, content hash) and the
+    generation parameters a thumbnail was made from, so only outdated
+    thumbnails have to be regenerated. Image features are keyed by asset
+    name and remember the mtime of the file (thumbnail or HDRI) they were
+    computed from.
+    """
+
+    FOLDER = "Index"
+    THUMBNAIL_SOURCES = "thumbnail_sources.json"
+    IMAGE_HASHES = "image_hashes.json"
+    PALETTES = "palettes.json"
+    COLOR_HISTOGRAMS = "color_histograms.npz"
+    EMBEDDINGS = "embeddings.npz"
+    EMBEDDING_BASIS = "embedding_basis.npz"
+    HDRI_STATS = "hdri_stats.json"
+
+    FEATURE_STORES = (IMAGE_HASHES, PALETTES, HDRI_STATS)
+    FEATURE_MATRICES = (COLOR_HISTOGRAMS, EMBEDDINGS)
+
+    _indices: dict[Path, "AssetIndex"] = {}
+    _indices_lock = Lock()
+
+    def __init__(self, pool_root: Path):
+        self.pool_root = pool_root
+        self.path = pool_root / self.FOLDER
+        self._lock = RLock()
+        self._stores: dict[str, dict] = {}
+        self._matrices: dict[str, FeatureMatrix] = {}
+        self._dirty: set[str] = set()
+
+    @classmethod
+    def for_pool(cls, pool_root: Union[str, Path]) -> "AssetIndex":
+        pool_root = Path(pool_root)
+        with cls._indices_lock:
+            index = cls._indices.get(pool_root)
+            if index is None:
+                index = AssetIndex(pool_root)
+                cls._indices[pool_root] = index
+
+        return index
+
+    @classmethod
+    def for_asset(cls, asset_path: Path) -> "AssetIndex":
+        return cls.for_pool(asset_path.parent.parent)
+
+    @property
+    def thumbnail_sources(self) -> dict[str, dict]:
+        return self.store(self.THUMBNAIL_SOURCES)
+
+    def store(self, name: str) -> dict:
+        with self._lock:
+            data = self._stores.get(name)
+            if data is None:
+                data = self._stores[name] = self.load_json(name)
+
+        return data
+
+    def matrix(self, name: str) -> "FeatureMatrix":
+        with self._lock:
+            matrix = self._matrices.get(name)
+            if matrix is None:
+                matrix = self._matrices[name] = FeatureMatrix(self.path / name)
+
+        return matrix
+
+    def read_arrays(self, name: str) -> Optional[dict]:
+        return read_arrays(self.path / name)
+
+    def write_arrays(self, name: str, **arrays) -> None:
+        write_arrays(self.path / name, **arrays)
+
+    def load_json(self, name: str) -> dict:
+        path = self.path / name
+        if not path.exists():
+            return {}
+
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except Exception as e:
+            Logger.exception(e)
+            return {}
+
+    def save_json(self, name: str, data: dict) -> None:
+        path = self.path / name
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.path.mkdir(exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=4)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            Logger.exception(e)
+
+    def is_thumbnail_stale(
+        self,
+        asset_path: Path,
+        thumbnail: Optional[Union[str, Path]],
+        params: Optional[dict] = None,
+    ) -> bool:
+        if not thumbnail:
+            return True
+
+        try:
+            stat = asset_path.stat()
+        except OSError:
+            return False
+
+        with self._lock:
+            source = self.thumbnail_sources.get(asset_path.name)
+
+        if source is None:
+            # thumbnails made before the index existed count as current as
+            # long as they are newer than their asset
+            try:
+                thumbnail_mtime = os.stat(thumbnail).st_mtime_ns
+            except OSError:
+                return True
+
+            if thumbnail_mtime < stat.st_mtime_ns:
+                return True
+
+            self.set_thumbnail_source(asset_path, stat, None, params)
+            return False
+
+        if params is not None and source.get("params") != params:
+            return True
+
+        if source["mtime_ns"] == stat.st_mtime_ns and source["size"] == stat.st_size:
+            return False
+
+        if not source["hash"] or source["size"] != stat.st_size:
+            return True
+
+        content_hash = fs.file_hash(asset_path)
+        if content_hash != source["hash"]:
+            return True
+
+        # touched but unchanged
+        self.set_thumbnail_source(asset_path, stat, content_hash, source.get("params"))
+        return False
+
+    def stale_assets(
+        self,
+        assets: Iterable[tuple[Path, Optional[str]]],
+        params: Optional[dict] = None,
+    ) -> list[Path]:
+        stale = [
+            asset_path
+            for asset_path, thumbnail in assets
+            if self.is_thumbnail_stale(asset_path, thumbnail, params)
+        ]
+        self.save()
+
+        return stale
+
+    def record_thumbnail(self, asset_path: Path, params: Optional[dict] = None) -> None:
+        try:
+            stat = asset_path.stat()
+            content_hash = fs.file_hash(asset_path)
+        except OSError as e:
+            Logger.exception(e)
+            return
+
+        self.set_thumbnail_source(asset_path, stat, content_hash, params)
+
+    def set_thumbnail_source(
+        self,
+        asset_path: Path,
+        stat: os.stat_result,
+        content_hash: Optional[str],
+        params: Optional[dict],
+    ) -> None:
+        with self._lock:
+            self.thumbnail_sources[asset_path.name] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": content_hash,
+                "params": params,
+            }
+            self._dirty.add(self.THUMBNAIL_SOURCES)
+
+    def forget(self, asset_path: Path) -> None:
+        with self._lock:
+            if self.thumbnail_sources.pop(asset_path.name, None) is not None:
+                self._dirty.add(self.THUMBNAIL_SOURCES)
+
+            # image features are keyed by thumbnail, which shares the stem
+            for name in self.FEATURE_STORES:
+                if self.store(name).pop(asset_path.stem, None) is not None:
+                    self._dirty.add(name)
+
+            for name in self.FEATURE_MATRICES:
+                self.matrix(name).remove(asset_path.stem)
+
+        self.save()
+
+    def outdated_features(
+        self, name: str, thumbnails: dict[str, Path]
+    ) -> dict[str, Path]:
+        """Thumbnails (by asset name) without current features in the store.
+
+        Features of thumbnails that no longer exist are dropped.
+        """
+
+        features = self.store(name)
+        outdated = {}
+        with self._lock:
+            for asset_name in features.keys() - thumbnails.keys():
+                del features[asset_name]
+                self._dirty.add(name)
+
+            for asset_name, thumbnail in thumbnails.items():
+                try:
+                    mtime = thumbnail.stat().st_mtime_ns
+                except OSError:
+                    continue
+
+                record = features.get(asset_name)
+                if not record or record["mtime_ns"] != mtime:
+                    outdated[asset_name] = thumbnail
+
+        return outdated
+
+    def set_features(
+        self, name: str, asset_name: str, thumbnail: Path, values: dict
+    ) -> None:
+        try:
+            mtime = thumbnail.stat().st_mtime_ns
+        except OSError:
+            return
+
+        with self._lock:
+            self.store(name)[asset_name] = {"mtime_ns": mtime, **values}
+            self._dirty.add(name)
+
+    def save(self) -> None:
+        with self._lock:
+            dirty = {name: dict(self._stores[name]) for name in self._dirty}
+            self._dirty.clear()
+            matrices = list(self._matrices.values())
+
+        for name, data in dirty.items():
+            self.save_json(name, data)
+
+        for matrix in matrices:
+            matrix.save()
+
+
+class FeatureMatrix:
+    """Float32 feature rows keyed by asset name, stored as one contiguous
+    matrix in Index/<name>.npz with the thumbnail mtime of every row."""
+
+    def __init__(self, path: Path):
+        import numpy as np
+
+        self.path = path
+        self._lock = RLock()
+        self._dirty = False
+        self.names: list[str] = []
+        self.rows: dict[str, int] = {}
+        self.mtimes = np.empty(0, dtype=np.int64)
+        self.matrix = np.empty((0, 0), dtype=np.float32)
+
+        self.load()
+
+    def load(self) -> None:
+        import numpy as np
+
+        data = read_arrays(self.path)
+        if data is None:
+            return
+
+        self.set_rows(
+            data["names"].tolist(),
+            data["mtimes"].astype(np.int64),
+            np.ascontiguousarray(data["matrix"], dtype=np.float32),
+        )
+
+    def set_rows(self, names: list[str], mtimes, matrix) -> None:
+        self.names = names
+        self.rows = {name: idx for idx, name in enumerate(names)}
+        self.mtimes = mtimes
+        self.matrix = matrix
+
+    def row(self, asset_name: str):
+        idx = self.rows.get(asset_name)
+        return None if idx is None else self.matrix[idx]
+
+    def outdated(self, thumbnails: dict[str, Path]) -> dict[str, Path]:
+        """Thumbnails without a current row, rows of removed thumbnails
+        are dropped."""
+
+        with self._lock:
+            self.keep(thumbnails.keys())
+
+            outdated = {}
+            for asset_name, thumbnail in thumbnails.items():
+                try:
+                    mtime = thumbnail.stat().st_mtime_ns
+                except OSError:
+                    continue
+
+                idx = self.rows.get(asset_name)
+                if idx is None or self.mtimes[idx] != mtime:
+                    outdated[asset_name] = thumbnail
+
+        return outdated
+
+    def keep(self, asset_names: Iterable[str]) -> None:
+        import numpy as np
+
+        asset_names = set(asset_names)
+        with self._lock:
+            mask = np.array([name in asset_names for name in self.names], dtype=bool)
+            if mask.all():
+                return
+
+            names = [name for name, keep in zip(self.names, mask) if keep]
+            self.set_rows(names, self.mtimes[mask], self.matrix[mask])
+            self._dirty = True
+
+    def remove(self, asset_name: str) -> None:
+        if asset_name in self.rows:
+            self.keep(name for name in self.names if name != asset_name)
+
+    def update(self, values: dict[str, tuple[Path, "np.ndarray"]]) -> None:
+        import numpy as np
+
+        with self._lock:
+            new_names, new_mtimes, new_rows = [], [], []
+            for asset_name, (thumbnail, features) in values.items():
+                try:
+                    mtime = thumbnail.stat().st_mtime_ns
+                except OSError:
+                    continue
+
+                idx = self.rows.get(asset_name)
+                if idx is not None and self.matrix.shape[1] == len(features):
+                    self.matrix[idx] = features
+                    self.mtimes[idx] = mtime
+                else:
+                    new_names.append(asset_name)
+                    new_mtimes.append(mtime)
+                    new_rows.append(features)
+
+            if new_rows:
+                new_matrix = np.asarray(new_rows, dtype=np.float32)
+                if self.matrix.shape[1] != new_matrix.shape[1]:
+                    # first rows, or the feature size changed and the old
+                    # rows can't be compared anymore
+                    self.set_rows([], self.mtimes[:0], new_matrix[:0])
+
+                self.set_rows(
+                    self.names + new_names,
+                    np.concatenate((self.mtimes, np.array(new_mtimes, np.int64))),
+                    np.concatenate((self.matrix, new_matrix)),
+                )
+
+            self._dirty = True
+
+    def save(self) -> None:
+        import numpy as np
+
+        with self._lock:
+            if not self._dirty:
+                return
+
+            self._dirty = False
+            names, mtimes, matrix = np.array(self.names), self.mtimes, self.matrix
+
+        write_arrays(self.path, names=names, mtimes=mtimes, matrix=matrix)
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock, RLock
+from typing import Callable, Iterable, Optional, Union
+
+from ..core import Logger
+from . import db
+
+
+class AssetUsage:
+    """How often each asset was imported, referenced or applied, stored in
+    the app DB.
+
+    Changes are queued and written by the DBWriter, everything queued until
+    it gets to them goes into one transaction.
+    """
+
+    TABLE = "ASSET_USAGE"
+
+    _lock = Lock()
+    _table_created = False
+    _queued: list[tuple[str, tuple]] = []
+
+    @classmethod
+    def create_table(cls, conn: sqlite3.Connection) -> None:
+        if cls._table_created:
+            return
+
+        conn.execute(
+            f"""CREATE TABLE IF NOT EXISTS {cls.TABLE}
+            (ASSET TEXT PRIMARY KEY,
+            POOL TEXT NOT NULL,
+            COUNT INTEGER NOT NULL,
+            LAST_USED REAL NOT NULL);"""
+        )
+        conn.execute(
+            f"""CREATE INDEX IF NOT EXISTS {cls.TABLE}_POOL
+            ON {cls.TABLE} (POOL);"""
+        )
+        cls._table_created = True
+
+    @classmethod
+    def execute(cls, query: str, params: Iterable = ()) -> list:
+        with cls._lock:
+            conn = db.create_connection()
+            try:
+                cls.create_table(conn)
+                rows = conn.execute(query, tuple(params)).fetchall()
+                conn.commit()
+                return rows
+            except Exception as e:
+                Logger.exception(e)
+                return []
+            finally:
+                db.close_connection(conn)
+
+    @classmethod
+    def queue(cls, changes: list[tuple[str, tuple]]) -> None:
+        with cls._lock:
+            cls._queued += changes
+        db.DBWriter.submit(cls.write_queued, key=cls.TABLE)
+
+    @classmethod
+    def write_queued(cls, conn: sqlite3.Connection) -> None:
+        with cls._lock:
+            changes, cls._queued = cls._queued, []
+
+        cls.create_table(conn)
+        for query, params in changes:
+            conn.execute(query, params)
+
+    @classmethod
+    def record(cls, path: Union[Path, list[Path]]) -> None:
+        assets = [path] if isinstance(path, Path) else path
+        now = time.time()
+        cls.queue(
+            [
+                (
+                    f"""INSERT INTO {cls.TABLE} (ASSET, POOL, COUNT, LAST_USED)
+                    VALUES (?, ?, 1, ?)
+                    ON CONFLICT(ASSET) DO UPDATE SET
+                    COUNT = COUNT + 1,
+                    LAST_USED = excluded.LAST_USED;""",
+                    (str(asset), str(asset.parent.parent), now),
+                )
+                for asset in assets
+            ]
+        )
+        for asset in assets:
+            AssetSort.for_asset(asset).add_usage(asset)
+
+    @classmethod
+    def counts(cls, pool_root: Path) -> dict[Path, int]:
+        db.DBWriter.flush()
+        rows = cls.execute(
+            f"SELECT ASSET, COUNT FROM {cls.TABLE} WHERE POOL = ?;", (str(pool_root),)
+        )
+        return {Path(asset): count for asset, count in rows}
+
+    @classmethod
+    def forget(cls, path: Path) -> None:
+        cls.queue([(f"DELETE FROM {cls.TABLE} WHERE ASSET = ?;", (str(path),))])
+
+
+class AssetSort:
+    """Sort and group orders of one pool's assets, kept in memory.
+
+    The pool scan records every asset's size and modification time, usage
+    counts and tags are loaded once when first needed. Each order is sorted
+    once into a rank per asset and cached, so switching the sort or group
+    mode only reorders the tiles already on screen.
+    """
+
+    NAME = "Name"
+    SIZE = "Size"
+    MODIFIED = "Date Modified"
+    USAGE = "Most Used"
+    EXTENSION = "Type"
+    SORT_MODES = (NAME, SIZE, MODIFIED, USAGE, EXTENSION)
+
+    NO_GROUPS = "No Groups"
+    GROUP_TAG = "Group by Tag"
+    GROUP_EXTENSION = "Group by Type"
+    GROUP_MODES = (NO_GROUPS, GROUP_TAG, GROUP_EXTENSION)
+
+    # untagged assets are grouped behind every tag
+    UNTAGGED = "\uffff"
+
+    _pools: dict[Path, "AssetSort"] = {}
+    _pools_lock = Lock()
+
+    def __init__(self, pool_root: Path):
+        self.pool_root = pool_root
+        # the HDRI worker scans the pool off the UI thread
+        self._lock = RLock()
+        self._stats: dict[Path, tuple[int, int]] = {}
+        self._usage: Optional[dict[Path, int]] = None
+        self._tags: Optional[dict[Path, list[str]]] = None
+        self._ranks: dict[str, dict[Path, int]] = {}
+        self._groups: dict[str, dict[Path, str]] = {}
+
+    @classmethod
+    def for_pool(cls, pool_root: Union[str, Path]) -> "AssetSort":
+        pool_root = Path(pool_root)
+        with cls._pools_lock:
+            sort = cls._pools.get(pool_root)
+            if sort is None:
+                sort = AssetSort(pool_root)
+                cls._pools[pool_root] = sort
+            return sort
+
+    @classmethod
+    def for_asset(cls, path: Path) -> "AssetSort":
+        return cls.for_pool(path.parent.parent)
+
+    def add(self, path: Path, stat: os.stat_result) -> None:
+        """Record an asset found by the pool scan."""
+
+        stats = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if self._stats.get(path) != stats:
+                self._stats[path] = stats
+                self._ranks.clear()
+                self._groups.clear()
+
+    def forget(self, path: Path) -> None:
+        with self._lock:
+            if self._stats.pop(path, None) is not None:
+                self._ranks.clear()
+                self._groups.clear()
+
+    def add_usage(self, path: Path) -> None:
+        with self._lock:
+            if self._usage is None:
+                return
+
+            self._usage[path] = self._usage.get(path, 0) + 1
+            self._ranks.pop(self.USAGE, None)
+
+    def set_tags(self, tags: Optional[dict[Path, list[str]]]) -> None:
+        """Replace the tags, None loads them again on next use."""
+
+        with self._lock:
+            self._tags = tags
+            self._groups.pop(self.GROUP_TAG, None)
+
+    def tags(self, load: Callable[[], dict[Path, list[str]]]) -> dict[Path, list[str]]:
+        """Asset tags, read with ``load`` on first use."""
+
+        if self._tags is None:
+            self.set_tags(load())
+        return self._tags
+
+    def sort_key(self, mode: str) -> Callable[[Path], tuple]:
+        if mode == self.USAGE and self._usage is None:
+            self._usage = AssetUsage.counts(self.pool_root)
+
+        stats, usage = self._stats, self._usage
+        keys = {
+            self.NAME: lambda path: (path.name.lower(),),
+            self.SIZE: lambda path: (-stats[path][0], path.name.lower()),
+            self.MODIFIED: lambda path: (-stats[path][1], path.name.lower()),
+            self.USAGE: lambda path: (-usage.get(path, 0), path.name.lower()),
+            self.EXTENSION: lambda path: (path.suffix.lower(), path.name.lower()),
+        }
+        return keys[mode]
+
+    def rank(self, mode: str) -> dict[Path, int]:
+        with self._lock:
+            ranks = self._ranks.get(mode)
+            if ranks is None:
+                ordered = sorted(self._stats, key=self.sort_key(mode))
+                ranks = {path: rank for rank, path in enumerate(ordered)}
+                self._ranks[mode] = ranks
+
+            return ranks
+
+    def groups(self, mode: str) -> dict[Path, str]:
+        with self._lock:
+            groups = self._groups.get(mode)
+            if groups is None:
+                if mode == self.GROUP_TAG:
+                    tags = self._tags or {}
+                    groups = {
+                        path: min(tags[path], key=str.lower).lower()
+                        if tags.get(path)
+                        else self.UNTAGGED
+                        for path in self._stats
+                    }
+                else:
+                    groups = {path: path.suffix.lower() for path in self._stats}
+                self._groups[mode] = groups
+
+            return groups
+
+    def order(
+        self, paths: Iterable[Path], mode: str, group: str = NO_GROUPS
+    ) -> list[Path]:
+        """``paths`` in sort order, clustered by group if one is given.
+        Assets with several tags are grouped under their first tag."""
+
+        ranks = self.rank(mode)
+        last = len(ranks)
+        if group == self.NO_GROUPS:
+            return sorted(paths, key=lambda path: ranks.get(path, last))
+
+        groups = self.groups(group)
+        return sorted(
+            paths,
+            key=lambda path: (groups.get(path, self.UNTAGGED), ranks.get(path, last)),
+        )
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import atexit
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from pathlib import Path
-from typing import NamedTuple
+from threading import Lock
+from typing import Callable, Hashable, NamedTuple, Optional
 
 from ..core import Logger
 from .settings import SettingsManager
@@ -53,6 +56,91 @@ def close_connection(conn: sqlite3.Connection) -> None:
     conn.close()
 
 
+class DBWriter:
+    """Runs DB writes in order on one background thread, so the ui thread
+    never waits for sqlite.
+
+    Every write gets the writer's connection, which stays open, and is
+    committed as one transaction. Writes submitted with a ``key`` replace
+    the one still waiting under that key, only the latest of them runs.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _lock = Lock()
+    _pending: dict[Hashable, Callable[[sqlite3.Connection], None]] = {}
+    _conn: Optional[sqlite3.Connection] = None
+    _conn_path: Optional[Path] = None
+
+    @classmethod
+    def submit(
+        cls, write: Callable[[sqlite3.Connection], None], key: Hashable = None
+    ) -> None:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(1, "render_vault_db")
+                atexit.register(cls.shutdown)
+
+            if key is not None:
+                waiting = key in cls._pending
+                cls._pending[key] = write
+                if waiting:
+                    return
+
+            cls._executor.submit(cls._run, write, key)
+
+    @classmethod
+    def _run(cls, write: Callable[[sqlite3.Connection], None], key: Hashable):
+        if key is not None:
+            with cls._lock:
+                write = cls._pending.pop(key)
+
+        try:
+            conn = cls._connection()
+            write(conn)
+            conn.commit()
+        except Exception as e:
+            Logger.exception(e)
+            if cls._conn:
+                cls._conn.rollback()
+
+    @classmethod
+    def _connection(cls) -> sqlite3.Connection:
+        # only used on the writer thread
+        if cls._conn_path != SettingsManager.DB_PATH:
+            cls._close()
+        if cls._conn is None:
+            cls._conn = create_connection()
+            cls._conn_path = SettingsManager.DB_PATH
+
+        return cls._conn
+
+    @classmethod
+    def _close(cls) -> None:
+        if cls._conn is not None:
+            close_connection(cls._conn)
+            cls._conn = None
+            cls._conn_path = None
+
+    @classmethod
+    def flush(cls) -> None:
+        """Wait for every write submitted so far."""
+
+        with cls._lock:
+            executor = cls._executor
+
+        if executor:
+            executor.submit(lambda: None).result()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls._lock:
+            executor, cls._executor = cls._executor, None
+
+        if executor:
+            executor.submit(cls._close).result()
+            executor.shutdown()
+
+
 def insert(table: Tables, data: DBSchema) -> None:
     if not isinstance(data, DBSchema):
         Logger.error(f"invalid db schema. expected: {DBSchema}, got {type(data)}")
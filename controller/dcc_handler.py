@@ -1,11 +1,14 @@
 import json
 import sys
+from functools import partial
 from pathlib import Path
-from typing import Generator, Union
+from typing import Generator, Optional, Union
 
 import render_vault.controller.maya_cmds as mc
 
 from ..core import Logger
+from .asset_sort import AssetUsage
+from .render_daemon import RenderDaemon
 from .settings import SettingsManager
 
 
@@ -20,6 +23,7 @@ class MayaHandler:
 
     @staticmethod
     def import_material(path: Union[Path, list[Path]], assign=False):
+        AssetUsage.record(path)
         if isinstance(path, Path):
             mc.import_material(path, assign=assign)
             return
@@ -29,6 +33,7 @@ class MayaHandler:
 
     @staticmethod
     def reference_material(path: Union[Path, list[Path]], assign=False):
+        AssetUsage.record(path)
         if isinstance(path, Path):
             mc.reference_material(path, assign=assign)
             return
@@ -37,6 +42,7 @@ class MayaHandler:
 
     @staticmethod
     def replace_material_in_scene(path: Union[Path, list[Path]]):
+        AssetUsage.record(path)
         mc.replace_material_in_scene(path)
 
     @staticmethod
@@ -49,6 +55,7 @@ class MayaHandler:
 
     @staticmethod
     def import_model(path: Union[Path, list[Path]]):
+        AssetUsage.record(path)
         if isinstance(path, Path):
             mc.import_model(path)
             return
@@ -57,6 +64,7 @@ class MayaHandler:
 
     @staticmethod
     def reference_model(path: Union[Path, list[Path]]):
+        AssetUsage.record(path)
         if isinstance(path, Path):
             mc.reference_model(path)
             return
@@ -75,6 +83,14 @@ class MayaHandler:
         logging_path = settings.LOGGING_PATH
         single_mode = True
 
+        if settings.material_settings.render_daemon:
+            return partial(
+                RenderDaemon.instance().render,
+                path,
+                single_mode,
+                settings.material_settings.to_dict(),
+            )
+
         user_render_settings = json.dumps(settings.material_settings.to_dict())
 
         if sys.platform == "win32":
@@ -92,14 +108,32 @@ class MayaHandler:
             ]
 
     @staticmethod
-    def render_all_materials_cmd(path: str):
+    def render_all_materials_cmd(
+        path: str,
+        materials_file: Optional[str] = None,
+        threads: int = 0,
+        logging_path: Optional[str] = None,
+        worker: int = 0,
+    ):
+        """``threads`` limits the render threads of the process, ``worker``
+        picks the render session when several shards render in parallel."""
+
         mayapy = mc.get_mayapy_path()
         settings = SettingsManager()
         render_script = str(settings.ROOT_PATH / "external" / "render_manager.py")
         single_mode = False
-        logger_path = settings.LOGGING_PATH
+        logger_path = logging_path or settings.LOGGING_PATH
 
-        user_render_settings = json.dumps(settings.material_settings.to_dict())
+        render_settings = {
+            **settings.material_settings.to_dict(),
+            "materials_file": materials_file,
+            "render_threads": threads,
+        }
+        if settings.material_settings.render_daemon:
+            daemon = RenderDaemon.instance(worker)
+            return partial(daemon.render, path, single_mode, render_settings)
+
+        user_render_settings = json.dumps(render_settings)
 
         if sys.platform == "win32":
             user_render_settings = user_render_settings.replace('"', '\\"')
@@ -138,16 +172,23 @@ class MayaHandler:
             ]
 
     @staticmethod
-    def create_domelight(path: Path):
-        mc.import_as_dome_light(path)
+    def create_domelight(path: Path, proxy: Optional[Path] = None):
+        AssetUsage.record(path)
+        mc.import_as_dome_light(path, proxy)
+
+    @staticmethod
+    def create_arealight(path: Path, proxy: Optional[Path] = None):
+        AssetUsage.record(path)
+        mc.import_as_area_light(path, proxy)
 
     @staticmethod
-    def create_arealight(path: Path):
-        mc.import_as_area_light(path)
+    def create_file_node(path: Path, proxy: Optional[Path] = None):
+        AssetUsage.record(path)
+        mc.import_as_file_node(path, proxy)
 
     @staticmethod
-    def create_file_node(path: Path):
-        mc.import_as_file_node(path)
+    def swap_hdri_resolution(path: Optional[Path] = None):
+        mc.swap_hdri_resolution(path)
 
     @staticmethod
     def import_render_settings(path: Path):
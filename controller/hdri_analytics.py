@@ -0,0 +1,149 @@
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..core import Logger, hdri_analysis, img, rgbe
+from .asset_index import AssetIndex
+from .hdri_proxies import PROXY_SIZES, HdriProxies
+from .pool_handler import HDRI_EXTENSIONS
+
+DIRECT_SUN_SHARE = 0.2
+
+
+def direct_sun(stats: dict) -> bool:
+    return stats["sun_share"] >= DIRECT_SUN_SHARE and stats["sun_elevation"] > 0
+
+
+def diffuse_light(stats: dict) -> bool:
+    return stats["sun_share"] < DIRECT_SUN_SHARE
+
+
+class HdriAnalytics:
+    """Lighting statistics of the pool HDRIs, computed once per file in the
+    background and kept in the pool's AssetIndex."""
+
+    SAVE_INTERVAL = 16
+
+    NAME = "Name"
+    SORT_KEYS = {
+        NAME: None,
+        "Brightness": "mean_luminance",
+        "Peak Luminance": "peak_luminance",
+        "Dynamic Range": "dynamic_range",
+        "Sun Elevation": "sun_elevation",
+        "Sun Strength": "sun_share",
+    }
+
+    ALL = "All Light"
+    FILTERS: dict[str, Optional[Callable[[dict], bool]]] = {
+        ALL: None,
+        "Direct Sun": direct_sun,
+        "Diffuse Light": diffuse_light,
+    }
+
+    @staticmethod
+    def pool_hdris(pool_root: Path) -> dict[str, Path]:
+        hdri_path = pool_root / "HDRIs"
+        if not hdri_path.is_dir():
+            return {}
+
+        return {
+            file.stem: file
+            for file in hdri_path.iterdir()
+            if file.suffix.lower() in HDRI_EXTENSIONS
+        }
+
+    @staticmethod
+    def analysis_source(hdri_path: Path) -> Path:
+        """A radiance file to stream the statistics from: the HDRI itself or
+        its smallest up to date proxy. EXRs without one are decoded in full."""
+
+        if hdri_path.suffix.lower() == ".hdr":
+            return hdri_path
+
+        for size in PROXY_SIZES:
+            if not HdriProxies.is_outdated(hdri_path, size):
+                return HdriProxies.proxy_path(hdri_path, size)
+
+        return hdri_path
+
+    @classmethod
+    def analyse(cls, hdri_path: Path) -> Optional[dict]:
+        import numpy as np
+
+        source = cls.analysis_source(hdri_path)
+        width, _ = hdri_analysis.ANALYSIS_SIZE
+        try:
+            if source.suffix.lower() == ".hdr":
+                # the peak of a proxy is that of its box filtered pixels
+                (small,), peak = rgbe.downsample_with_peak(
+                    source, [width], hdri_analysis.LUMINANCE_WEIGHTS
+                )
+            else:
+                image = img.read_hdri(source)
+                peak = float(hdri_analysis.luminance(image).max())
+                small = img.resize_hdri(image, hdri_analysis.ANALYSIS_SIZE)
+        except Exception as e:
+            Logger.exception(e)
+            return None
+
+        return hdri_analysis.analyse(np.asarray(small), peak)
+
+    @classmethod
+    def update(
+        cls, pool_root: Path, running: Callable[[], bool] = lambda: True
+    ) -> dict[str, dict]:
+        """Analyse every new or changed HDRI of a pool until ``running``
+        returns False, and return the statistics by asset name."""
+
+        index = AssetIndex.for_pool(pool_root)
+        outdated = index.outdated_features(index.HDRI_STATS, cls.pool_hdris(pool_root))
+
+        for count, (asset_name, hdri_path) in enumerate(outdated.items(), 1):
+            if not running():
+                break
+
+            stats = cls.analyse(hdri_path)
+            if stats is not None:
+                index.set_features(index.HDRI_STATS, asset_name, hdri_path, stats)
+            if count % cls.SAVE_INTERVAL == 0:
+                index.save()
+
+        index.save()
+        if outdated:
+            Logger.debug(f"analysed {len(outdated)} HDRIs in {pool_root}")
+
+        return dict(index.store(index.HDRI_STATS))
+
+    @classmethod
+    def rank(
+        cls, pool_root: Path, sort_key: str, light_filter: str = ALL
+    ) -> list[tuple[str, float]]:
+        """Asset names of a pool matching the light filter, in descending
+        order of the sort key."""
+
+        stats = cls.update(pool_root)
+        accept = cls.FILTERS.get(light_filter)
+        key = cls.SORT_KEYS.get(sort_key)
+
+        ranking = [
+            (asset_name, float(values[key]) if key else 0.0)
+            for asset_name, values in stats.items()
+            if not accept or accept(values)
+        ]
+        if key:
+            ranking.sort(key=lambda item: (-item[1], item[0].lower()))
+        else:
+            ranking.sort(key=lambda item: item[0].lower())
+
+        return ranking
+
+    @staticmethod
+    def describe(stats: dict) -> str:
+        return (
+            f"Sun: {stats['sun_elevation']:.0f}° elevation, "
+            f"{stats['sun_azimuth']:.0f}° azimuth, "
+            f"{stats['sun_share']:.0%} of the light\n"
+            f"Luminance: {stats['mean_luminance']:.3g} mean, "
+            f"{stats['peak_luminance']:.3g} peak\n"
+            f"Dynamic Range: {stats['dynamic_range']:.1f} stops"
+        )
@@ -0,0 +1,99 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..core import Logger, img, rgbe
+
+PROXY_SIZES = {"1k": 1024, "2k": 2048}
+
+
+class HdriProxies:
+    """Downsampled .hdr copies of the pool HDRIs in <Pool>/Proxies for
+    interactive look-dev, the full resolution file is kept for rendering."""
+
+    FOLDER = "Proxies"
+
+    @classmethod
+    def proxy_path(cls, hdri_path: Path, size: str) -> Path:
+        return hdri_path.parent.parent / cls.FOLDER / f"{hdri_path.stem}_{size}.hdr"
+
+    @classmethod
+    def is_outdated(cls, hdri_path: Path, size: str) -> bool:
+        proxy = cls.proxy_path(hdri_path, size)
+        try:
+            return proxy.stat().st_mtime_ns < hdri_path.stat().st_mtime_ns
+        except OSError:
+            return True
+
+    @classmethod
+    def create(cls, hdri_path: Path, sizes: Optional[list[str]] = None) -> bool:
+        """Write every outdated proxy size of one HDRI.
+
+        Radiance files are streamed scanline by scanline into all sizes at
+        once, EXRs have to be decoded in full first.
+        """
+
+        sizes = [s for s in sizes or PROXY_SIZES if cls.is_outdated(hdri_path, s)]
+        if not sizes:
+            return True
+
+        widths = [PROXY_SIZES[size] for size in sizes]
+        try:
+            if hdri_path.suffix.lower() == ".hdr":
+                proxies = rgbe.downsample(hdri_path, widths)
+            else:
+                image = img.read_hdri(hdri_path)
+                height, width = image.shape[:2]
+                proxies = [
+                    img.resize_hdri(image, (min(w, width), min(w // 2, height)))
+                    for w in widths
+                ]
+
+            for size, proxy in zip(sizes, proxies):
+                cls.write_proxy(cls.proxy_path(hdri_path, size), proxy)
+        except Exception as e:
+            Logger.exception(e)
+            return False
+
+        Logger.debug(f"created {', '.join(sizes)} proxies of {hdri_path.name}")
+        return True
+
+    @staticmethod
+    def write_proxy(path: Path, proxy) -> None:
+        # the hdr worker and an import may write the same proxy at once
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(".tmp", f"{path.stem}_", path.parent)
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            rgbe.write(tmp_path, proxy)
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    @classmethod
+    def get(cls, hdri_path: Path, size: str) -> Optional[Path]:
+        """The proxy of an HDRI, created first if it is missing or outdated."""
+
+        if not cls.create(hdri_path, [size]):
+            return None
+
+        return cls.proxy_path(hdri_path, size)
+
+    @classmethod
+    def update(
+        cls,
+        hdri_paths: list[Path],
+        sizes: Optional[list[str]] = None,
+        running: Callable[[], bool] = lambda: True,
+    ) -> None:
+        for hdri_path in hdri_paths:
+            if not running():
+                return
+            cls.create(hdri_path, sizes)
+
+    @classmethod
+    def delete(cls, hdri_path: Path) -> None:
+        for size in PROXY_SIZES:
+            cls.proxy_path(hdri_path, size).unlink(missing_ok=True)
@@ -0,0 +1,249 @@
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from Qt.QtGui import QImage
+
+from ..core import Logger, image_features
+from .asset_index import AssetIndex
+from .pool_handler import THUMBNAIL_EXTENSTIONS
+from .thumbnail_cache import ThumbnailPyramid
+
+
+class ImageSearch:
+    """Image features of the pool thumbnails, kept up to date in the pool's
+    AssetIndex and searched with vectorised NumPy."""
+
+    BATCH_SIZE = 256
+    COLOR_SIZE = (32, 32)
+    EMBEDDING_SIZE = (16, 16)
+    PCA_SAMPLES = 2000
+
+    @staticmethod
+    def pool_thumbnails(pool_root: Path) -> dict[str, Path]:
+        thumbnail_path = pool_root / "Thumbnails"
+        if not thumbnail_path.is_dir():
+            return {}
+
+        return {
+            file.stem: file
+            for file in thumbnail_path.iterdir()
+            if file.suffix.lower() in THUMBNAIL_EXTENSTIONS
+        }
+
+    @classmethod
+    def read_batches(
+        cls, thumbnails: dict[str, Path]
+    ) -> Iterator[list[tuple[str, Path, QImage]]]:
+        items = list(thumbnails.items())
+        for start in range(0, len(items), cls.BATCH_SIZE):
+            batch = []
+            for asset_name, thumbnail in items[start : start + cls.BATCH_SIZE]:
+                image = ThumbnailPyramid.read_source(str(thumbnail))
+                if image.isNull():
+                    Logger.debug(f"can't read thumbnail features from {thumbnail}")
+                    continue
+                batch.append((asset_name, thumbnail, image))
+
+            if batch:
+                yield batch
+
+    @classmethod
+    def update_hashes(cls, pool_root: Path) -> dict[str, Path]:
+        """Hash every new or changed thumbnail of a pool, batch by batch."""
+
+        import numpy as np
+
+        index = AssetIndex.for_pool(pool_root)
+        thumbnails = cls.pool_thumbnails(pool_root)
+        outdated = index.outdated_features(index.IMAGE_HASHES, thumbnails)
+
+        dhash_size = image_features.DHASH_SIZE[::-1]
+        phash_size = image_features.PHASH_SIZE[::-1]
+
+        for batch in cls.read_batches(outdated):
+            images = [image for *_, image in batch]
+            small = [ThumbnailPyramid.to_array(i, dhash_size, True) for i in images]
+            large = [ThumbnailPyramid.to_array(i, phash_size, True) for i in images]
+
+            dhashes = image_features.dhash(np.stack(small))
+            phashes = image_features.phash(np.stack(large))
+            for (asset_name, thumbnail, _), dhash, phash in zip(
+                batch, dhashes, phashes
+            ):
+                values = {"dhash": f"{int(dhash):016x}", "phash": f"{int(phash):016x}"}
+                index.set_features(index.IMAGE_HASHES, asset_name, thumbnail, values)
+
+        index.save()
+        return thumbnails
+
+    @classmethod
+    def update_colors(cls, pool_root: Path) -> None:
+        """Palette and colour histogram of every new or changed thumbnail."""
+
+        import numpy as np
+
+        index = AssetIndex.for_pool(pool_root)
+        histograms = index.matrix(index.COLOR_HISTOGRAMS)
+        thumbnails = cls.pool_thumbnails(pool_root)
+        outdated = {
+            **index.outdated_features(index.PALETTES, thumbnails),
+            **histograms.outdated(thumbnails),
+        }
+
+        for batch in cls.read_batches(outdated):
+            rgb = np.stack(
+                [ThumbnailPyramid.to_array(i, cls.COLOR_SIZE) for *_, i in batch]
+            )
+            colors, shares = image_features.dominant_colors(rgb)
+
+            rows = {}
+            for (asset_name, thumbnail, _), histogram, palette, share in zip(
+                batch, image_features.color_histogram(rgb), colors.tolist(), shares
+            ):
+                rows[asset_name] = (thumbnail, histogram)
+                # empty clusters have no share, they only pad the palette
+                palette = [
+                    (f"#{r:02x}{g:02x}{b:02x}", round(x, 3))
+                    for (r, g, b), x in zip(palette, share.tolist())
+                    if x > 0
+                ]
+                values = {"palette": palette}
+                index.set_features(index.PALETTES, asset_name, thumbnail, values)
+            histograms.update(rows)
+
+        index.save()
+
+    @classmethod
+    def rank_by_color(
+        cls, pool_root: Path, colors: list[tuple[int, int, int]]
+    ) -> list[tuple[str, float]]:
+        """Asset names of a pool ordered by how much of their thumbnail is
+        close to the given colours."""
+
+        import numpy as np
+
+        cls.update_colors(pool_root)
+        index = AssetIndex.for_pool(pool_root)
+        histograms = index.matrix(index.COLOR_HISTOGRAMS)
+        if not histograms.names:
+            return []
+
+        scores = image_features.rank_by_color(histograms.matrix, np.array(colors))
+        ranking = np.argsort(-scores, kind="stable")
+
+        return [(histograms.names[i], float(scores[i])) for i in ranking]
+
+    @classmethod
+    def pixel_vectors(cls, batch: list[tuple[str, Path, QImage]]):
+        import numpy as np
+
+        rgb = [ThumbnailPyramid.to_array(i, cls.EMBEDDING_SIZE) for *_, i in batch]
+        return image_features.pixel_vectors(np.stack(rgb))
+
+    @classmethod
+    def update_embeddings(cls, pool_root: Path) -> None:
+        """Embed every new or changed thumbnail with the pool's PCA basis.
+
+        The basis is fitted on a sample of the pool and refitted, together
+        with all embeddings, once the pool has doubled in size since.
+        """
+
+        import numpy as np
+
+        index = AssetIndex.for_pool(pool_root)
+        embeddings = index.matrix(index.EMBEDDINGS)
+        thumbnails = cls.pool_thumbnails(pool_root)
+        outdated = embeddings.outdated(thumbnails)
+        basis = index.read_arrays(index.EMBEDDING_BASIS)
+
+        if basis is None or len(thumbnails) >= 2 * int(basis["pool_size"]):
+            step = max(1, len(thumbnails) // cls.PCA_SAMPLES)
+            sample = dict(list(thumbnails.items())[::step])
+            vectors = [cls.pixel_vectors(batch) for batch in cls.read_batches(sample)]
+            if not vectors:
+                return
+
+            mean, components = image_features.fit_pca(np.concatenate(vectors))
+            basis = {
+                "mean": mean,
+                "components": components,
+                "pool_size": np.array(len(thumbnails)),
+            }
+            index.write_arrays(index.EMBEDDING_BASIS, **basis)
+            outdated = thumbnails
+            Logger.debug(f"fitted embedding basis for {pool_root} on {len(sample)}")
+
+        for batch in cls.read_batches(outdated):
+            vectors = cls.pixel_vectors(batch)
+            rows = image_features.project(vectors, basis["mean"], basis["components"])
+            embeddings.update(
+                {name: (thumbnail, row) for (name, thumbnail, _), row in zip(batch, rows)}
+            )
+
+        index.save()
+
+    @classmethod
+    def find_similar(
+        cls, pool_root: Path, asset_name: str
+    ) -> list[tuple[str, float]]:
+        """Asset names of a pool ordered by visual similarity to one asset."""
+
+        import numpy as np
+
+        cls.update_embeddings(pool_root)
+        index = AssetIndex.for_pool(pool_root)
+        embeddings = index.matrix(index.EMBEDDINGS)
+        query = embeddings.row(asset_name)
+        if query is None:
+            Logger.error(f"can't find similar assets, {asset_name} has no thumbnail")
+            return []
+
+        scores = image_features.rank_by_similarity(embeddings.matrix, query)
+        ranking = np.argsort(-scores, kind="stable")
+
+        return [(embeddings.names[i], float(scores[i])) for i in ranking]
+
+    @classmethod
+    def find_duplicates(
+        cls, pool_roots: Iterable[Path], max_distance: int
+    ) -> list[list[tuple[Path, int]]]:
+        """Groups of near duplicate thumbnails across all given pools.
+
+        A pair matches when both its pHash and dHash are within max_distance
+        bits, flat coloured thumbnails easily collide on a single hash.
+        Every group member comes with its pHash distance to the first one.
+        """
+
+        import numpy as np
+
+        thumbnails, dhashes, phashes = [], [], []
+        for pool_root in pool_roots:
+            index = AssetIndex.for_pool(pool_root)
+            hashes = index.store(index.IMAGE_HASHES)
+
+            for asset_name, thumbnail in cls.update_hashes(pool_root).items():
+                record = hashes.get(asset_name)
+                if not record:
+                    continue
+
+                thumbnails.append(thumbnail)
+                dhashes.append(int(record["dhash"], 16))
+                phashes.append(int(record["phash"], 16))
+
+        dhashes = np.array(dhashes, dtype=np.uint64)
+        phashes = np.array(phashes, dtype=np.uint64)
+
+        pairs, _ = image_features.find_near_duplicates(phashes, max_distance)
+        dhash_distances = image_features.hamming(
+            dhashes[pairs[:, 0]], dhashes[pairs[:, 1]]
+        )
+        pairs = pairs[dhash_distances <= max_distance]
+
+        groups = []
+        for group in image_features.group_pairs(pairs, len(thumbnails)):
+            distances = image_features.hamming(phashes[group[0]], phashes[group])
+            groups.append(
+                [(thumbnails[i], int(d)) for i, d in zip(group, distances.tolist())]
+            )
+
+        return groups
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import sqlite3
+from enum import Enum, IntEnum
+from pathlib import Path
+from threading import Lock
+from typing import Iterable, Optional
+
+from ..core import Logger
+from . import db
+
+
+class JobKind(Enum):
+    HDRI = "hdri"
+    MATERIAL = "material"
+
+
+class JobPriority(IntEnum):
+    SELECTED = 0
+    VISIBLE = 1
+    NORMAL = 2
+    # skipped until the pool is processed again
+    FAILED = 3
+
+
+class ThumbnailJobQueue:
+    """Persistent queue of pending thumbnail jobs, stored in the app DB.
+
+    A job is keyed by its asset path, pushing an asset again merges into the
+    existing job and keeps the higher priority. Jobs are only removed once
+    they are done, so work interrupted by a crash or shutdown is picked up
+    again the next time the pool is processed. Failed jobs are kept back
+    until then as well.
+    """
+
+    TABLE = "THUMBNAIL_JOBS"
+
+    _lock = Lock()
+    _table_created = False
+
+    @classmethod
+    def connect(cls) -> sqlite3.Connection:
+        conn = db.create_connection()
+        cls.create_table(conn)
+        return conn
+
+    @classmethod
+    def create_table(cls, conn: sqlite3.Connection) -> None:
+        if not cls._table_created:
+            conn.execute(
+                f"""CREATE TABLE IF NOT EXISTS {cls.TABLE}
+                (ASSET TEXT PRIMARY KEY,
+                KIND CHAR(16) NOT NULL,
+                POOL TEXT NOT NULL,
+                PRIORITY INTEGER NOT NULL,
+                SEQ INTEGER NOT NULL);"""
+            )
+            conn.execute(
+                f"""CREATE INDEX IF NOT EXISTS {cls.TABLE}_ORDER
+                ON {cls.TABLE} (KIND, POOL, PRIORITY, SEQ);"""
+            )
+            conn.commit()
+            cls._table_created = True
+
+    @classmethod
+    def execute(cls, query: str, params: Iterable = (), many: bool = False) -> list:
+        with cls._lock:
+            conn = cls.connect()
+            try:
+                if many:
+                    cursor = conn.executemany(query, params)
+                else:
+                    cursor = conn.execute(query, tuple(params))
+                rows = cursor.fetchall()
+                conn.commit()
+                return rows
+            except Exception as e:
+                Logger.exception(e)
+                return []
+            finally:
+                db.close_connection(conn)
+
+    @classmethod
+    def push(
+        cls,
+        kind: JobKind,
+        pool_root: Path,
+        assets: Iterable[Path],
+        priority: JobPriority = JobPriority.NORMAL,
+    ) -> None:
+        rows = [
+            (str(asset), kind.value, str(pool_root), int(priority), seq)
+            for seq, asset in enumerate(assets)
+        ]
+        if not rows:
+            return
+
+        cls.execute(
+            f"""INSERT INTO {cls.TABLE} (ASSET, KIND, POOL, PRIORITY, SEQ)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(ASSET) DO UPDATE SET
+            PRIORITY = MIN(PRIORITY, excluded.PRIORITY),
+            SEQ = excluded.SEQ;""",
+            rows,
+            many=True,
+        )
+
+    @classmethod
+    def prioritise(
+        cls,
+        kind: JobKind,
+        pool_root: Path,
+        visible: Iterable[Path],
+        selected: Optional[Path] = None,
+    ) -> None:
+        """Move the visible and selected jobs to the front, everything else
+        falls back to normal priority."""
+
+        with cls._lock:
+            conn = cls.connect()
+            try:
+                cls.update_priorities(conn, kind, pool_root, visible, selected)
+                conn.commit()
+            except Exception as e:
+                Logger.exception(e)
+            finally:
+                db.close_connection(conn)
+
+    @classmethod
+    def prioritise_later(
+        cls,
+        kind: JobKind,
+        pool_root: Path,
+        visible: Iterable[Path],
+        selected: Optional[Path] = None,
+    ) -> None:
+        """``prioritise`` on the DB writer thread, for the ui. Only the latest
+        call per pool runs if they come in faster than they're written."""
+
+        visible = list(visible)
+
+        def write(conn: sqlite3.Connection):
+            cls.create_table(conn)
+            cls.update_priorities(conn, kind, pool_root, visible, selected)
+
+        db.DBWriter.submit(write, key=(cls.TABLE, kind, str(pool_root)))
+
+    @classmethod
+    def update_priorities(
+        cls,
+        conn: sqlite3.Connection,
+        kind: JobKind,
+        pool_root: Path,
+        visible: Iterable[Path],
+        selected: Optional[Path] = None,
+    ) -> None:
+        pool = str(pool_root)
+        boosted = [(int(JobPriority.VISIBLE), str(asset)) for asset in visible]
+        if selected:
+            boosted.append((int(JobPriority.SELECTED), str(selected)))
+
+        failed = int(JobPriority.FAILED)
+        conn.execute(
+            f"""UPDATE {cls.TABLE} SET PRIORITY = ?
+            WHERE KIND = ? AND POOL = ? AND PRIORITY < ?;""",
+            (int(JobPriority.NORMAL), kind.value, pool, failed),
+        )
+        conn.executemany(
+            f"UPDATE {cls.TABLE} SET PRIORITY = ? WHERE ASSET = ? AND PRIORITY < ?;",
+            [(priority, asset, failed) for priority, asset in boosted],
+        )
+
+    @classmethod
+    def next(cls, kind: JobKind, pool_root: Path, count: int = 1) -> list[Path]:
+        rows = cls.execute(
+            f"""SELECT ASSET FROM {cls.TABLE}
+            WHERE KIND = ? AND POOL = ? AND PRIORITY < ?
+            ORDER BY PRIORITY, SEQ LIMIT ?;""",
+            (kind.value, str(pool_root), int(JobPriority.FAILED), count),
+        )
+        return [Path(asset) for asset, in rows]
+
+    @classmethod
+    def done(cls, assets: Iterable[Path]) -> None:
+        cls.execute(
+            f"DELETE FROM {cls.TABLE} WHERE ASSET = ?;",
+            [(str(asset),) for asset in assets],
+            many=True,
+        )
+
+    @classmethod
+    def fail(cls, assets: Iterable[Path]) -> None:
+        """Keep failed jobs queued, they're retried when the pool is processed
+        again and pushes them back to normal priority."""
+
+        cls.execute(
+            f"UPDATE {cls.TABLE} SET PRIORITY = ? WHERE ASSET = ?;",
+            [(int(JobPriority.FAILED), str(asset)) for asset in assets],
+            many=True,
+        )
+
+    @classmethod
+    def pending(cls, kind: JobKind, pool_root: Path) -> int:
+        rows = cls.execute(
+            f"""SELECT COUNT(*) FROM {cls.TABLE}
+            WHERE KIND = ? AND POOL = ? AND PRIORITY < ?;""",
+            (kind.value, str(pool_root), int(JobPriority.FAILED)),
+        )
+        return rows[0][0] if rows else 0
+
+    @classmethod
+    def clear(cls, kind: JobKind, pool_root: Path) -> None:
+        cls.execute(
+            f"DELETE FROM {cls.TABLE} WHERE KIND = ? AND POOL = ?;",
+            (kind.value, str(pool_root)),
+        )
@@ -9,6 +9,25 @@ from maya import cmds
 from ..core import Logger
 
 
+FULL_RES_ATTR = "rvFullResPath"
+PROXY_ATTR = "rvProxyPath"
+USE_PROXY_ATTR = "rvUseProxy"
+
+PRE_RENDER_MEL = (
+    "{string $rvNodes[] = `ls -type file`; for ($rvNode in $rvNodes) "
+    f'{{if (`attributeExists "{FULL_RES_ATTR}" $rvNode`) '
+    'setAttr -type "string" ($rvNode + ".fileTextureName") '
+    f'`getAttr ($rvNode + ".{FULL_RES_ATTR}")`;}}}}'
+)
+POST_RENDER_MEL = (
+    "{string $rvNodes[] = `ls -type file`; for ($rvNode in $rvNodes) "
+    f'{{if (`attributeExists "{PROXY_ATTR}" $rvNode`) '
+    f'if (`getAttr ($rvNode + ".{USE_PROXY_ATTR}")`) '
+    'setAttr -type "string" ($rvNode + ".fileTextureName") '
+    f'`getAttr ($rvNode + ".{PROXY_ATTR}")`;}}}}'
+)
+
+
 class ColorManagementMode(Enum):
     DISABLED = 0
     SRGB = 1
@@ -271,7 +290,34 @@ def get_file_nodes_in_scene() -> list[str]:
     return file_nodes
 
 
-def import_as_dome_light(path: Path):
+def create_hdri_file_node(path: Path, proxy: Optional[Path] = None) -> str:
+    """File node for an HDRI, pointing at the proxy when one is given.
+
+    Proxy file nodes keep both paths so swap_hdri_resolution can toggle
+    them, and renders always switch to the full resolution file.
+    """
+
+    file_node = cmds.shadingNode("file", asTexture=True)
+    cmds.setAttr(file_node + ".fileTextureName", str(proxy or path), type="string")
+    cmds.setAttr(
+        file_node + ".colorSpace",
+        convert_to_color_space_rule(get_maya_color_management_mode()),
+        type="string",
+    )
+
+    if proxy:
+        cmds.addAttr(file_node, longName=FULL_RES_ATTR, dataType="string")
+        cmds.addAttr(file_node, longName=PROXY_ATTR, dataType="string")
+        cmds.addAttr(file_node, longName=USE_PROXY_ATTR, attributeType="bool")
+        cmds.setAttr(f"{file_node}.{FULL_RES_ATTR}", str(path), type="string")
+        cmds.setAttr(f"{file_node}.{PROXY_ATTR}", str(proxy), type="string")
+        cmds.setAttr(f"{file_node}.{USE_PROXY_ATTR}", True)
+        use_full_res_at_render()
+
+    return file_node
+
+
+def import_as_dome_light(path: Path, proxy: Optional[Path] = None):
     if not path:
         Logger.debug(f"cant create dome light, path is {path}")
         return
@@ -284,20 +330,14 @@ def import_as_dome_light(path: Path):
     cmds.setAttr(f"{dome_light}.useDomeTex", 1)
     cmds.setAttr(f"{dome_light}.invisible", 1)
 
-    file_node = cmds.shadingNode("file", asTexture=True)
-    cmds.setAttr(file_node + ".fileTextureName", path, type="string")
-    cmds.setAttr(
-        file_node + ".colorSpace",
-        convert_to_color_space_rule(get_maya_color_management_mode()),
-        type="string",
-    )
+    file_node = create_hdri_file_node(path, proxy)
 
     cmds.connectAttr(file_node + ".outColor", dome_light + ".domeTex", force=True)
     dome_light = cmds.rename(dome_light, path.stem)
-    Logger.info(f"Creating Domelight with HDRI {path}")
+    Logger.info(f"Creating Domelight with HDRI {proxy or path}")
 
 
-def import_as_area_light(path: Path):
+def import_as_area_light(path: Path, proxy: Optional[Path] = None):
     if not path:
         Logger.debug(f"cant create area light, path is {path}")
         return
@@ -311,34 +351,77 @@ def import_as_area_light(path: Path):
     cmds.setAttr(f"{area_light}.showTex", 1)
     cmds.setAttr(f"{area_light}.invisible", 1)
 
-    file_node = cmds.shadingNode("file", asTexture=True)
-    cmds.setAttr(file_node + ".fileTextureName", path, type="string")
-    cmds.setAttr(
-        file_node + ".colorSpace",
-        convert_to_color_space_rule(get_maya_color_management_mode()),
-        type="string",
-    )
+    file_node = create_hdri_file_node(path, proxy)
 
     cmds.connectAttr(file_node + ".outColor", area_light + ".rectTex", force=True)
     area_light = cmds.rename(area_light, path.stem)
-    Logger.info(f"Creating Arealight with HDRI {path}")
+    Logger.info(f"Creating Arealight with HDRI {proxy or path}")
 
 
-def import_as_file_node(path: Path):
+def import_as_file_node(path: Path, proxy: Optional[Path] = None):
     if not path:
         Logger.debug(f"cant create file node, path is {path}")
         return
 
-    file_node = cmds.shadingNode("file", asTexture=True)
-    cmds.setAttr(file_node + ".fileTextureName", path, type="string")
-    cmds.setAttr(
-        file_node + ".colorSpace",
-        convert_to_color_space_rule(get_maya_color_management_mode()),
-        type="string",
-    )
+    file_node = create_hdri_file_node(path, proxy)
 
     file_node = cmds.rename(file_node, path.stem)
-    Logger.info(f"Creating File Node with HDRI {path}")
+    Logger.info(f"Creating File Node with HDRI {proxy or path}")
+
+
+def get_hdri_proxy_nodes(path: Optional[Path] = None) -> list[str]:
+    nodes = [
+        node
+        for node in cmds.ls(type="file")
+        if cmds.attributeQuery(FULL_RES_ATTR, node=node, exists=True)
+    ]
+    if path is None:
+        return nodes
+
+    return [
+        node
+        for node in nodes
+        if Path(cmds.getAttr(f"{node}.{FULL_RES_ATTR}")) == Path(path)
+    ]
+
+
+def swap_hdri_resolution(path: Optional[Path] = None) -> None:
+    """Toggle the file nodes of an HDRI (or all of them) between their
+    proxy and the full resolution file."""
+
+    nodes = get_hdri_proxy_nodes(path)
+    if not nodes:
+        Logger.warning(f"no HDRI proxy file nodes found for {path or 'the scene'}")
+        return
+
+    use_proxy = not cmds.getAttr(f"{nodes[0]}.{USE_PROXY_ATTR}")
+    source = PROXY_ATTR if use_proxy else FULL_RES_ATTR
+    for node in nodes:
+        texture = cmds.getAttr(f"{node}.{source}")
+        cmds.setAttr(f"{node}.fileTextureName", texture, type="string")
+        cmds.setAttr(f"{node}.{USE_PROXY_ATTR}", use_proxy)
+
+    Logger.info(
+        f"switched {len(nodes)} HDRI file nodes to {'proxy' if use_proxy else 'full'}"
+        " resolution"
+    )
+
+
+def use_full_res_at_render() -> None:
+    """Add pre/post render MEL that swaps proxy file nodes to the full
+    resolution file for the render and back afterwards. The snippets are
+    plain MEL so render nodes don't need the browser installed."""
+
+    for attribute, snippet in (
+        ("defaultRenderGlobals.preMel", PRE_RENDER_MEL),
+        ("defaultRenderGlobals.postMel", POST_RENDER_MEL),
+    ):
+        current = cmds.getAttr(attribute) or ""
+        if snippet in current:
+            continue
+
+        mel = f"{current.rstrip().rstrip(';')}; {snippet}" if current else snippet
+        cmds.setAttr(attribute, mel, type="string")
 
 
 def export_selected(path: Path, name: str, file_extension: str) -> None:
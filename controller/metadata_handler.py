@@ -30,3 +30,23 @@ class MetadataHandler:
         with open(path, "w") as f:
             json.dump(metadata, f, indent=4)
             Logger.debug(f"Saving metadata for {path.stem}")
+
+    @classmethod
+    def load_tags(cls, metadata_dir: Path) -> dict[Path, list[str]]:
+        """Tags of every asset with metadata in ``metadata_dir``, keyed by
+        asset path."""
+
+        tags = {}
+        for file in metadata_dir.glob("*.json"):
+            try:
+                with open(file, "r") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                Logger.exception(e)
+                continue
+
+            asset_tags = data.get("tags")
+            if asset_tags and isinstance(asset_tags, list):
+                tags[Path(data.get("path", ""))] = asset_tags
+
+        return tags
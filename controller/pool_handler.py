@@ -5,6 +5,8 @@ from typing import Generator, Optional, Protocol
 from ..core import Logger, fs
 from . import db
 from .api_handler import APIHandler
+from .asset_sort import AssetSort
+from .hdri_proxies import HdriProxies
 
 THUMBNAIL_EXTENSTIONS = (".png", ".jpg", ".jpeg")
 MODEL_EXTENSIONS = (".mb", ".ma", ".fbx", ".obj")
@@ -70,6 +72,7 @@ class MaterialPoolHandler:
         path: str,
     ) -> Generator[tuple[str, Path, Optional[str], int], None, None]:
         pool_path = Path(path, "MaterialPool")
+        sort_index = AssetSort.for_pool(pool_path)
         materials_path = pool_path / "Materials"
         thumbnail_path = pool_path / "Thumbnails"
 
@@ -90,7 +93,9 @@ class MaterialPoolHandler:
         for asset_file in asset_files:
             asset_name = asset_file.stem
             asset_path = materials_path / asset_file
-            asset_size = asset_path.stat().st_size
+            stat = asset_path.stat()
+            sort_index.add(asset_path, stat)
+            asset_size = stat.st_size
             thumbnail_path = thumbnail_files.get(asset_name)
 
             yield asset_name, asset_path, thumbnail_path, asset_size
@@ -219,6 +224,7 @@ class ModelPoolHandler:
         path: str,
     ) -> Generator[tuple[str, Path, Optional[str], int], None, None]:
         pool_path = Path(path, "ModelPool")
+        sort_index = AssetSort.for_pool(pool_path)
         model_path = pool_path / "Models"
         thumbnail_path = pool_path / "Thumbnails"
 
@@ -236,7 +242,9 @@ class ModelPoolHandler:
         for asset_file in sorted(asset_files, key=lambda x: x.name.lower()):
             asset_name = asset_file.stem
             asset_path = model_path / asset_file
-            asset_size = asset_path.stat().st_size
+            stat = asset_path.stat()
+            sort_index.add(asset_path, stat)
+            asset_size = stat.st_size
             thumbnail_path = thumbnail_files.get(asset_name)
 
             yield asset_name, asset_path, thumbnail_path, asset_size
@@ -363,6 +371,7 @@ class HDRIPoolHandler:
         path: str,
     ) -> Generator[tuple[str, Path, Optional[str], int], None, None]:
         pool_path = Path(path, "HDRIPool")
+        sort_index = AssetSort.for_pool(pool_path)
         hdri_path = pool_path / "HDRIs"
         thumbnail_path = pool_path / "Thumbnails"
 
@@ -380,7 +389,9 @@ class HDRIPoolHandler:
         for asset_file in sorted(asset_files, key=lambda x: x.name.lower()):
             asset_name: str = asset_file.stem
             asset_path: Path = hdri_path / asset_file
-            asset_size: int = asset_path.stat().st_size
+            stat = asset_path.stat()
+            sort_index.add(asset_path, stat)
+            asset_size: int = stat.st_size
             thumbnail = thumbnail_files.get(asset_name)
 
             yield asset_name, asset_path, thumbnail, asset_size
@@ -420,6 +431,7 @@ class HDRIPoolHandler:
                 metadata.unlink()
                 Logger.info(f"deleted {metadata}")
 
+            HdriProxies.delete(path)
             path.unlink()
             Logger.info(f"deleted {path}")
         except Exception as e:
@@ -466,6 +478,7 @@ class LightsetPoolHandler:
         path: str,
     ) -> Generator[tuple[str, Path, Optional[str], int], None, None]:
         pool_path = Path(path, "LightsetPool")
+        sort_index = AssetSort.for_pool(pool_path)
         ls_path = pool_path / "Lightsets"
         thumbnail_path = pool_path / "Thumbnails"
 
@@ -483,7 +496,9 @@ class LightsetPoolHandler:
         for asset_file in sorted(asset_files, key=lambda x: x.name.lower()):
             asset_name = asset_file.stem
             asset_path = ls_path / asset_file
-            asset_size = asset_path.stat().st_size
+            stat = asset_path.stat()
+            sort_index.add(asset_path, stat)
+            asset_size = stat.st_size
             thumbnail_path = thumbnail_files.get(asset_name)
 
             yield asset_name, asset_path, thumbnail_path, asset_size
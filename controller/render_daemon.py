@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import atexit
+import os
+import subprocess
+import tempfile
+import time
+from multiprocessing.connection import Client, Connection
+from pathlib import Path
+from threading import Lock
+from typing import Optional, Sequence
+
+from ..core import Logger
+from . import maya_cmds as mc
+from .settings import SettingsManager
+
+# keep in sync with RenderManager.AUTHKEY_ENV, external/ isn't importable here
+AUTHKEY_ENV = "RENDER_VAULT_DAEMON_KEY"
+
+
+class RenderDaemon:
+    """A mayapy session running ``render_manager.py --daemon`` that is kept
+    alive between material renders, so only the first render pays for the
+    maya standalone startup and plugin loading.
+
+    Jobs are sent over a local connection secured with a random key. The
+    daemon is started on the first job and again whenever it crashed or
+    exited after its job limit, a job that was running during a crash is
+    retried once. Only one job runs at a time.
+    """
+
+    START_TIMEOUT = 300
+    POLL_INTERVAL = 0.1
+
+    _instances: dict[int, "RenderDaemon"] = {}
+    _instances_lock = Lock()
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        logging_path: str,
+        max_jobs: int = 0,
+        env: Optional[dict] = None,
+    ):
+        self.command = list(command)
+        self.logging_path = logging_path
+        self.max_jobs = max_jobs
+        self.env = env
+        self.process: Optional[subprocess.Popen] = None
+        self.conn: Optional[Connection] = None
+        self.starts = 0
+        self._lock = Lock()
+
+    @classmethod
+    def instance(cls, worker: int = 0) -> "RenderDaemon":
+        """The daemon of ``worker``, parallel render shards use one each."""
+
+        settings = SettingsManager()
+        with cls._instances_lock:
+            daemon = cls._instances.get(worker)
+            if daemon is None:
+                script = settings.ROOT_PATH / "external" / "render_manager.py"
+                daemon = RenderDaemon(
+                    [str(mc.get_mayapy_path()), str(script)],
+                    str(settings.LOGGING_PATH),
+                )
+                atexit.register(daemon.stop)
+                cls._instances[worker] = daemon
+
+            daemon.max_jobs = settings.material_settings.render_daemon_jobs
+            return daemon
+
+    def is_running(self) -> bool:
+        return self.conn is not None and self.process.poll() is None
+
+    def start(self) -> bool:
+        authkey = os.urandom(16)
+        port_file = Path(tempfile.mkdtemp(prefix="render_vault_")) / "port"
+        env = dict(self.env or os.environ)
+        env[AUTHKEY_ENV] = authkey.hex()
+
+        args = [
+            *self.command,
+            "--daemon",
+            self.logging_path,
+            str(port_file),
+            str(self.max_jobs),
+        ]
+        Logger.info("starting render daemon...")
+        try:
+            self.process = subprocess.Popen(args, env=env)
+        except OSError as e:
+            Logger.exception(e)
+            return False
+        self.starts += 1
+
+        deadline = time.monotonic() + self.START_TIMEOUT
+        try:
+            while not port_file.exists():
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    Logger.error("render daemon failed to start")
+                    self.stop()
+                    return False
+                time.sleep(self.POLL_INTERVAL)
+
+            port = int(port_file.read_text(encoding="utf-8"))
+            self.conn = Client(("127.0.0.1", port), authkey=authkey)
+        except (OSError, ValueError) as e:
+            Logger.exception(e)
+            self.stop()
+            return False
+        finally:
+            port_file.unlink(missing_ok=True)
+            port_file.parent.rmdir()
+
+        return True
+
+    def render(self, pool_path: str, single_mode: bool, settings: dict) -> bool:
+        """Render a job like ``render_manager.py`` would from the command
+        line, blocks until it's done. False if it failed or the daemon
+        couldn't be started."""
+
+        job = {
+            "pool_path": pool_path,
+            "single_mode": single_mode,
+            "settings": settings,
+        }
+        with self._lock:
+            for attempt in range(2):
+                if not self.is_running():
+                    self.stop()
+                    if not self.start():
+                        return False
+
+                try:
+                    self.conn.send(job)
+                    reply = self.conn.recv()
+                except (EOFError, OSError):
+                    Logger.error(f"render daemon crashed, attempt {attempt + 1}")
+                    self.stop()
+                    continue
+
+                if reply["restart"]:
+                    self.stop()
+                return reply["ok"]
+
+            return False
+
+    def stop(self) -> None:
+        """Ask the daemon to quit, it's killed if it doesn't or if it never
+        got to accept jobs."""
+
+        connected = self.conn is not None
+        if connected:
+            try:
+                self.conn.send({"command": "quit"})
+            except OSError:
+                pass
+            self.conn.close()
+            self.conn = None
+
+        if self.process is not None:
+            if not connected:
+                self.process.kill()
+            try:
+                self.process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
@@ -7,7 +7,7 @@ from socket import gethostname
 import render_vault.ui.viewports.viewport_mode as vp_mode
 
 from ..controller import api_handler
-from ..core import Logger
+from ..core import Logger, StartupTrace
 from . import db
 
 
@@ -46,6 +46,18 @@ class MaterialSettings(Settings):
         self.render_cam = "render_cam"
         self.render_resolution_x = 350
         self.render_resolution_y = 350
+        self.render_daemon = False
+        self.render_daemon_jobs = 50
+        self.render_workers = 1
+
+    def render_params(self) -> dict:
+        return {
+            "material_renderer": self.material_renderer,
+            "render_scene": self.render_scene,
+            "render_object": self.render_object,
+            "render_cam": self.render_cam,
+            "render_resolution": [self.render_resolution_x, self.render_resolution_y],
+        }
 
 
 class ModelSettings(Settings):
@@ -61,6 +73,13 @@ class HdriSettings(Settings):
         self.current_pool = ""
         self.hdri_renderer = Renderer.VRAY.value
         self.auto_generate_thumbnails = True
+        self.tonemap = {}
+        self.generate_proxies = True
+        self.proxy_size = "2k"
+
+    def get_tonemap(self, pool: str) -> dict:
+        defaults = {"operator": "reinhard", "exposure": 1.0, "auto_exposure": False}
+        return {**defaults, **self.tonemap.get(pool, {})}
 
 
 class LightsetSettings(Settings):
@@ -75,6 +94,11 @@ class WindowSettings(Settings):
         self.current_viewport = vp_mode.ViewportMode.Materials.value
         self.asset_button_size = 350
         self.ui_scale = 1
+        self.pixmap_cache_mb = 256
+        self.packed_thumbnails = False
+        self.duplicate_distance = 6
+        self.virtual_grid = False
+        self.widget_cache_size = 5000
 
 
 class SettingsManager:
@@ -83,6 +107,7 @@ class SettingsManager:
     ROOT_PATH = Path(__file__).parent.parent
     CONFIG_PATH = ROOT_PATH / f"settings/config-{gethostname()}.json"
     DB_PATH = ROOT_PATH / "db" / "render_vault.db"
+    CACHE_PATH = ROOT_PATH / "cache"
     LOGS = ROOT_PATH / "logs"
     LOGGING_PATH = LOGS / f"{datetime.now().date()}.log"
 
@@ -101,7 +126,8 @@ class SettingsManager:
     def __init__(self, *args, **kwargs):
         if not self._initialized:
             super().__init__(*args, **kwargs)
-            db.init_db()
+            with StartupTrace.phase("db_init"):
+                db.init_db()
             self._initialized = True
 
     def load_settings(self):
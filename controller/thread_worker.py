@@ -1,13 +1,56 @@
+import heapq
+import itertools
+import os
 import pathlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import PIPE, Popen
+from threading import Condition
 from time import perf_counter
+from typing import Callable, Iterable, Optional
 
-from Qt.QtCore import QObject, QThread, Signal
+from Qt.QtCore import QCoreApplication, QObject, QThread, Signal
+from Qt.QtGui import QImage, QPixmap
 
 from ..controller import Logger
 from ..core import img
+from .asset_index import AssetIndex
+from .hdri_analytics import HdriAnalytics
+from .hdri_proxies import HdriProxies
+from .job_queue import JobKind, ThumbnailJobQueue
 from .pool_handler import PoolHandler
+from .thumbnail_cache import PixmapCache, ThumbnailPyramid
+from .thumbnail_pack import ThumbnailPack
+
+
+def run_command(command) -> None:
+    # jobs for the render daemon are callables
+    if callable(command):
+        command()
+        return
+
+    if sys.platform == "darwin":
+        with Popen(command, stdout=PIPE, stderr=PIPE) as process:
+            out, err = process.communicate()
+            Logger.info(out.decode())
+            Logger.info(err.decode())
+            process.wait()
+    elif sys.platform == "win32":
+        with Popen(command) as process:
+            # out, err = process.communicate()
+            # Logger.info(out.decode())
+            # Logger.info(err.decode())
+            process.wait()
+
+
+def thumbnail_stamp(path: pathlib.Path) -> Optional[tuple[int, int]]:
+    """(mtime_ns, size) of a thumbnail, to tell whether it was rewritten."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
 
 
 class MayaThreadWorker(QObject):
@@ -26,18 +69,7 @@ class MayaThreadWorker(QObject):
         self.running = True
         self.operation_started.emit()
 
-        if sys.platform == "darwin":
-            with Popen(self.command, stdout=PIPE, stderr=PIPE) as process:
-                out, err = process.communicate()
-                Logger.info(out.decode())
-                Logger.info(err.decode())
-                process.wait()
-        elif sys.platform == "win32":
-            with Popen(self.command) as process:
-                # out, err = process.communicate()
-                # Logger.info(out.decode())
-                # Logger.info(err.decode())
-                process.wait()
+        run_command(self.command)
 
         self.running = False
         self.operation_ended.emit()
@@ -58,13 +90,29 @@ class HdrThreadWorker(QObject):
     operation_started = Signal()
     operation_ended = Signal()
     refresh_thumb = Signal(tuple)
+    jobs_queued = Signal()
+    analytics_updated = Signal()
 
-    def __init__(self, pool_handler: PoolHandler, hdr_path, size):
+    def __init__(
+        self,
+        pool_handler: PoolHandler,
+        hdr_path,
+        size,
+        tonemap: dict,
+        proxy_size: Optional[str] = None,
+    ):
         super().__init__()
         self.running = False
         self.pool_handler = pool_handler
         self.hdr_path = hdr_path
         self.size = size
+        self.tonemap = tonemap
+        self.proxy_size = proxy_size
+
+    def thumbnail_params(self, hdr_path: pathlib.Path) -> Optional[dict]:
+        """Changing the tonemap only outdates the thumbnails it's applied to."""
+
+        return self.tonemap if img.applies_tonemap(hdr_path) else None
 
     def run(self):
         if self.running:
@@ -74,21 +122,57 @@ class HdrThreadWorker(QObject):
 
         Logger.debug("starting hdr worker operation")
         start_time = perf_counter()
-        assets = self.pool_handler.get_assets_and_thumbnails(self.hdr_path)
+        pool_root = pathlib.Path(self.hdr_path, "HDRIPool")
+        index = AssetIndex.for_pool(pool_root)
+        assets = list(self.pool_handler.get_assets_and_thumbnails(self.hdr_path))
+        stale = []
+        for _, hdr_path, thumb, _ in assets:
+            params = self.thumbnail_params(hdr_path)
+            if index.is_thumbnail_stale(hdr_path, thumb, params):
+                stale.append(hdr_path)
+        index.save()
+        ThumbnailJobQueue.push(JobKind.HDRI, pool_root, stale)
+        self.jobs_queued.emit()
 
-        for hdr_name, hdr_path, thumb, _ in assets:
-            if thumb:
-                continue
+        while self.running:
+            jobs = ThumbnailJobQueue.next(JobKind.HDRI, pool_root)
+            if not jobs:
+                break
+
+            hdr_path = jobs[0]
+            thumbnail_path = pool_root / "Thumbnails" / f"{hdr_path.stem}.jpg"
 
-            thumbnail_path = (
-                hdr_path.parent.parent
-                / "Thumbnails"
-                / f"{pathlib.Path(hdr_name).stem}.jpg"
+            before = thumbnail_stamp(thumbnail_path)
+            img.create_sdr_preview(
+                hdr_path,
+                thumbnail_path,
+                self.size,
+                operator=self.tonemap["operator"],
+                exposure=self.tonemap["exposure"],
+                auto_exposure=self.tonemap["auto_exposure"],
+                overwrite=True,
             )
+            stamp = thumbnail_stamp(thumbnail_path)
+            if stamp is None or stamp == before:
+                Logger.error(f"failed to create thumbnail of {hdr_path}")
+                ThumbnailJobQueue.fail(jobs)
+                continue
 
-            img.create_sdr_preview(hdr_path, thumbnail_path, self.size)
+            ThumbnailJobQueue.done(jobs)
+            index.record_thumbnail(hdr_path, self.thumbnail_params(hdr_path))
             self.refresh_thumb.emit((hdr_path, thumbnail_path))
 
+        index.save()
+
+        # lighting analytics run after the thumbnails, they're only needed
+        # for sorting and filtering
+        HdriAnalytics.update(pool_root, lambda: self.running)
+        self.analytics_updated.emit()
+
+        if self.proxy_size:
+            hdri_paths = [hdr_path for _, hdr_path, *_ in assets]
+            HdriProxies.update(hdri_paths, [self.proxy_size], lambda: self.running)
+
         Logger.debug(f"finished hdr worker operation {perf_counter()-start_time:.2f}s")
         self.running = False
         self.operation_ended.emit()
@@ -103,3 +187,514 @@ class HdrThreadWorker(QObject):
         current_thread = QThread.currentThread()
         if current_thread:
             current_thread.exit(0)
+
+
+class MaterialRenderThreadWorker(QObject):
+    """Renders the queued material jobs in chunks, so reprioritised jobs
+    are picked up by the next mayapy batch.
+
+    With several ``workers`` every chunk is split into shards rendered by
+    one mayapy process each, the render threads of the machine are divided
+    between them. Every shard logs to its own file which is merged into the
+    main log afterwards. Materials of a failed shard are retried in a mayapy
+    of their own, no more than ``workers`` at a time, so a material that
+    crashes maya doesn't take its shard down with it.
+    """
+
+    operation_started = Signal()
+    operation_ended = Signal()
+    chunk_rendered = Signal(object)
+    progress = Signal(int, int)
+
+    CHUNK_SIZE = 8
+
+    def __init__(self, pool_root: pathlib.Path, render_cmd: Callable, workers: int = 1):
+        super().__init__()
+        self.running = False
+        self.pool_root = pool_root
+        self.render_cmd = render_cmd
+        self.workers = max(1, workers)
+
+    @staticmethod
+    def shards(jobs: list, workers: int) -> list[list]:
+        """Round robin, so every shard gets a share of the prioritised jobs
+        at the front of the queue."""
+
+        return [shard for shard in (jobs[n::workers] for n in range(workers)) if shard]
+
+    @staticmethod
+    def render_threads(workers: int) -> int:
+        if workers == 1:
+            return 0  # all cores
+        return max(1, (os.cpu_count() or 1) // workers)
+
+    def snapshot(self, materials: list[pathlib.Path]) -> dict:
+        """Stamps of the current thumbnails of ``materials``. Comparing against
+        them doesn't depend on the clock of the file server."""
+
+        thumbnail_path = self.pool_root / "Thumbnails"
+        return {
+            thumb: thumbnail_stamp(thumb)
+            for mtl_path in materials
+            for thumb in thumbnail_path.glob(f"{mtl_path.stem}.*")
+        }
+
+    def rendered(self, materials: list[pathlib.Path], before: dict) -> dict:
+        """The thumbnail written for each of ``materials`` since ``before``."""
+
+        thumbnail_path = self.pool_root / "Thumbnails"
+        rendered = {}
+        for mtl_path in materials:
+            for thumb in thumbnail_path.glob(f"{mtl_path.stem}.*"):
+                stamp = thumbnail_stamp(thumb)
+                if stamp and stamp != before.get(thumb):
+                    rendered[mtl_path] = thumb
+                    break
+
+        return rendered
+
+    def retry(self, index: AssetIndex, failed: list[pathlib.Path], threads: int):
+        """One mayapy per material, on the shards of the workers so daemon
+        mode reuses their daemons instead of starting one per material."""
+
+        for n in range(0, len(failed), self.workers):
+            if not self.running:
+                return
+
+            retries = failed[n : n + self.workers]
+            self.render_shards(index, [[job] for job in retries], threads)
+
+    def render_shards(self, index: AssetIndex, shards: list[list], threads: int):
+        def render_shard(n: int, shard: list[pathlib.Path]):
+            materials_file = index.path / f"render_queue_{n}.json"
+            logging_path = index.path / f"render_{n}.log"
+            index.save_json(materials_file.name, {"materials": list(map(str, shard))})
+            try:
+                run_command(
+                    self.render_cmd(
+                        str(materials_file),
+                        threads=threads,
+                        logging_path=str(logging_path),
+                        worker=n,
+                    )
+                )
+            except Exception as e:
+                Logger.exception(e)
+            finally:
+                materials_file.unlink(missing_ok=True)
+                self.merge_log(n, logging_path)
+
+        with ThreadPoolExecutor(len(shards)) as executor:
+            futures = [
+                executor.submit(render_shard, n, shard)
+                for n, shard in enumerate(shards)
+            ]
+            for future in futures:
+                future.result()
+
+    @staticmethod
+    def merge_log(n: int, logging_path: pathlib.Path) -> None:
+        if not logging_path.exists():
+            return
+
+        try:
+            lines = logging_path.read_text(encoding="utf-8", errors="replace")
+            for line in lines.splitlines():
+                if line.strip():
+                    Logger.info(f"[shard {n}] {line}")
+            logging_path.unlink()
+        except OSError as e:
+            Logger.exception(e)
+
+    def run(self):
+        if self.running:
+            return
+
+        self.running = True
+        self.operation_started.emit()
+
+        index = AssetIndex.for_pool(self.pool_root)
+        materials_file = index.path / "render_queue.json"
+        threads = self.render_threads(self.workers)
+        done = 0
+
+        while self.running:
+            jobs = ThumbnailJobQueue.next(
+                JobKind.MATERIAL, self.pool_root, self.CHUNK_SIZE * self.workers
+            )
+            if not jobs:
+                break
+
+            # jobs stay queued until rendered, the queue may grow meanwhile
+            total = done + ThumbnailJobQueue.pending(JobKind.MATERIAL, self.pool_root)
+            before = self.snapshot(jobs)
+            if self.workers == 1:
+                materials = [str(mtl_path) for mtl_path in jobs]
+                index.save_json(materials_file.name, {"materials": materials})
+                run_command(self.render_cmd(str(materials_file)))
+            else:
+                self.render_shards(index, self.shards(jobs, self.workers), threads)
+
+            rendered = self.rendered(jobs, before)
+            failed = [job for job in jobs if job not in rendered]
+            # nothing rendered at all means mayapy itself is broken
+            if failed and rendered and self.running:
+                Logger.warning(f"retrying {len(failed)} failed materials")
+                self.retry(index, failed, threads)
+                rendered.update(self.rendered(failed, before))
+                failed = [job for job in failed if job not in rendered]
+
+            for mtl_path in failed:
+                Logger.error(f"failed to render {mtl_path}")
+
+            ThumbnailJobQueue.done(rendered)
+            ThumbnailJobQueue.fail(failed)
+            if rendered:
+                thumbnails = {job: rendered[job] for job in jobs if job in rendered}
+                self.chunk_rendered.emit(thumbnails)
+
+            done += len(jobs)
+            self.progress.emit(done, total)
+
+            if not rendered:
+                Logger.error("no material thumbnails were rendered, stopping")
+                break
+
+        self.running = False
+        self.operation_ended.emit()
+
+    def cancel(self):
+        if self.running:
+            self.running = False
+
+    def shutdown(self):
+        self.running = False
+
+        current_thread = QThread.currentThread()
+        if current_thread:
+            current_thread.exit(0)
+
+
+class ImageSearchThreadWorker(QObject):
+    """Runs an ImageSearch query, which may have to index new thumbnails
+    first, and keeps its result."""
+
+    operation_started = Signal()
+    operation_ended = Signal()
+
+    def __init__(self, search: Callable):
+        super().__init__()
+        self.running = False
+        self.search = search
+        self.result = None
+
+    def run(self):
+        if self.running:
+            return
+
+        self.running = True
+        self.operation_started.emit()
+
+        start_time = perf_counter()
+        try:
+            self.result = self.search()
+        except Exception as e:
+            Logger.exception(e)
+
+        Logger.debug(f"finished image search {perf_counter()-start_time:.2f}s")
+        self.running = False
+        self.operation_ended.emit()
+
+    def cancel(self):
+        if self.running:
+            self.running = False
+
+    def shutdown(self):
+        self.running = False
+
+        current_thread = QThread.currentThread()
+        if current_thread:
+            current_thread.exit(0)
+
+
+class HdriProxyThreadWorker(QObject):
+    """Creates the look-dev proxy of an HDRI if it is missing or outdated
+    and keeps its path, None if it couldn't be created."""
+
+    operation_started = Signal()
+    operation_ended = Signal()
+
+    def __init__(self, hdri_path: pathlib.Path, size: str):
+        super().__init__()
+        self.running = False
+        self.hdri_path = hdri_path
+        self.size = size
+        self.proxy: Optional[pathlib.Path] = None
+
+    def run(self):
+        if self.running:
+            return
+
+        self.running = True
+        self.operation_started.emit()
+
+        try:
+            self.proxy = HdriProxies.get(self.hdri_path, self.size)
+        except Exception as e:
+            Logger.exception(e)
+
+        self.running = False
+        self.operation_ended.emit()
+
+    def shutdown(self):
+        self.running = False
+
+        current_thread = QThread.currentThread()
+        if current_thread:
+            current_thread.exit(0)
+
+
+class ScreenshotThreadWorker(QObject):
+    """Resizes, encodes and writes a grabbed screenshot as asset thumbnail,
+    then pre-generates its pyramid levels from the image in memory."""
+
+    operation_started = Signal()
+    operation_ended = Signal()
+    thumbnail_saved = Signal(str, object)
+
+    def __init__(
+        self,
+        screenshot: tuple[bytes, tuple[int, int]],
+        thumbnail_path: pathlib.Path,
+        asset_path: pathlib.Path,
+    ):
+        super().__init__()
+        self.running = False
+        self.screenshot = screenshot
+        self.thumbnail_path = thumbnail_path
+        self.asset_path = asset_path
+
+    def run(self):
+        if self.running:
+            return
+
+        self.running = True
+        self.operation_started.emit()
+
+        start_time = perf_counter()
+        thumbnail = str(self.thumbnail_path)
+        try:
+            image = img.save_screenshot(self.thumbnail_path, *self.screenshot)
+            ThumbnailPack.discard(thumbnail)
+
+            width, height = image.size
+            qimage = QImage(
+                image.tobytes(), width, height, width * 3, QImage.Format_RGB888
+            ).copy()
+            ThumbnailPyramid.generate_from_image(thumbnail, qimage)
+
+            index = AssetIndex.for_asset(self.asset_path)
+            index.record_thumbnail(self.asset_path)
+            index.save()
+
+            self.thumbnail_saved.emit(thumbnail, self.asset_path)
+        except Exception as e:
+            Logger.exception(e)
+
+        Logger.debug(f"saved screenshot {perf_counter()-start_time:.2f}s")
+        self.running = False
+        self.operation_ended.emit()
+
+    def cancel(self):
+        if self.running:
+            self.running = False
+
+    def shutdown(self):
+        self.running = False
+
+        current_thread = QThread.currentThread()
+        if current_thread:
+            current_thread.exit(0)
+
+
+class ThumbnailPackThreadWorker(QObject):
+    operation_started = Signal()
+    operation_ended = Signal()
+
+    def __init__(self, pool_root: pathlib.Path):
+        super().__init__()
+        self.running = False
+        self.pool_root = pool_root
+        self.changed = 0
+
+    def run(self):
+        if self.running:
+            return
+        self.running = True
+        self.operation_started.emit()
+
+        start_time = perf_counter()
+        try:
+            self.changed = ThumbnailPack.update(self.pool_root)
+        except Exception as e:
+            Logger.exception(e)
+        Logger.debug(f"updated thumbnail pack in {perf_counter()-start_time:.2f}s")
+
+        self.running = False
+        self.operation_ended.emit()
+
+    def cancel(self):
+        if self.running:
+            self.running = False
+
+    def shutdown(self):
+        self.running = False
+
+        current_thread = QThread.currentThread()
+        if current_thread:
+            current_thread.exit(0)
+
+
+class ThumbnailThreadWorker(QObject):
+    """Decodes thumbnails off the ui thread, visible tiles first.
+
+    Requests are kept in a heap ordered by (priority, request order). Only
+    ``request``, ``prioritise``, ``cancel`` and ``shutdown`` may be called from
+    other threads.
+    """
+
+    VISIBLE = 0
+    HIDDEN = 1
+
+    image_loaded = Signal(tuple, QImage)
+
+    def __init__(self):
+        super().__init__()
+        self.running = False
+        self._stopped = False
+        self._condition = Condition()
+        self._counter = itertools.count()
+        self._queue: list[tuple[int, int, tuple]] = []
+        self._requests: dict[tuple, tuple[int, int]] = {}
+
+    def run(self):
+        if self.running:
+            return
+
+        self.running = True
+
+        while True:
+            with self._condition:
+                while not self._stopped and not self._queue:
+                    self._condition.wait()
+
+                if self._stopped:
+                    break
+
+                priority, order, key = heapq.heappop(self._queue)
+                # skip heap entries that were cancelled or re-prioritised
+                if self._requests.get(key) != (priority, order):
+                    continue
+
+                del self._requests[key]
+
+            path, size = key[0], key[2]
+            try:
+                image = ThumbnailPyramid.load_image(path, size)
+            except Exception as e:
+                # one bad thumbnail mustn't end the shared decode thread
+                Logger.exception(e)
+                continue
+
+            # a thumbnail that can't be decoded keeps its placeholder
+            if image.isNull():
+                Logger.debug(f"failed to decode thumbnail {path}")
+                continue
+
+            self.image_loaded.emit(key, image)
+
+        self.running = False
+
+    def request(self, key: tuple, visible=False):
+        priority = self.VISIBLE if visible else self.HIDDEN
+        with self._condition:
+            if key in self._requests:
+                return
+
+            order = next(self._counter)
+            self._requests[key] = (priority, order)
+            heapq.heappush(self._queue, (priority, order, key))
+            self._condition.notify()
+
+    def prioritise(self, visible_keys: Iterable[tuple]):
+        visible_keys = set(visible_keys)
+        with self._condition:
+            for key, (_, order) in self._requests.items():
+                priority = self.VISIBLE if key in visible_keys else self.HIDDEN
+                self._requests[key] = (priority, order)
+
+            self._queue = [(p, o, k) for k, (p, o) in self._requests.items()]
+            heapq.heapify(self._queue)
+            self._condition.notify()
+
+    def cancel(self, keys: Iterable[tuple]):
+        with self._condition:
+            for key in keys:
+                self._requests.pop(key, None)
+
+    def shutdown(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+
+class ThumbnailLoader(QObject):
+    """Owns the shared thumbnail thread and caches the decoded images.
+
+    Lives on the ui thread, ``pixmap_ready`` is emitted after the pixmap was
+    stored in the PixmapCache.
+    """
+
+    pixmap_ready = Signal(tuple, QPixmap)
+
+    _instance: Optional["ThumbnailLoader"] = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.loader_thread = QThread(self)
+        self.worker = ThumbnailThreadWorker()
+        self.worker.image_loaded.connect(self.on_image_loaded)
+        self.worker.moveToThread(self.loader_thread)
+        self.loader_thread.started.connect(self.worker.run)
+
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.shutdown)
+
+        self.loader_thread.start()
+
+    @classmethod
+    def instance(cls) -> "ThumbnailLoader":
+        if cls._instance is None:
+            cls._instance = ThumbnailLoader()
+
+        return cls._instance
+
+    def request(self, key: tuple, visible=False):
+        self.worker.request(key, visible)
+
+    def prioritise(self, visible_keys: Iterable[tuple]):
+        self.worker.prioritise(visible_keys)
+
+    def cancel(self, keys: Iterable[tuple]):
+        self.worker.cancel(keys)
+
+    def on_image_loaded(self, key: tuple, image: QImage):
+        pixmap = QPixmap.fromImage(image)
+        PixmapCache.put(key, pixmap)
+        self.pixmap_ready.emit(key, pixmap)
+
+    def shutdown(self):
+        self.worker.shutdown()
+        self.loader_thread.quit()
+        self.loader_thread.wait()
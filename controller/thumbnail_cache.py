@@ -0,0 +1,296 @@
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock, get_ident
+from typing import Optional, Union
+
+from Qt.QtCore import Qt
+from Qt.QtGui import QImage, QPixmap
+
+from ..core import Logger
+from .settings import SettingsManager
+from .thumbnail_pack import ThumbnailPack
+
+
+class ThumbnailPyramid:
+    """Downscaled copies of pool thumbnails, generated lazily in a local cache.
+
+    Every thumbnail is stored once per level, so the grid only ever decodes an
+    image close to its displayed size, no matter how large the source is.
+    """
+
+    LEVELS = (64, 128, 256, 512)
+    CACHE_PATH = SettingsManager.CACHE_PATH / "thumbnails"
+    FORMAT = "jpg"
+    QUALITY = 90
+
+    _lock = Lock()
+
+    @classmethod
+    def pick_level(cls, size: int) -> int:
+        for level in cls.LEVELS:
+            if level >= size:
+                return level
+
+        return 0
+
+    @classmethod
+    def level_path(cls, thumbnail: Union[str, Path], size: int) -> str:
+        """Returns the path of the pyramid level closest to ``size``.
+
+        Falls back to ``thumbnail`` itself for qt resources, sizes above the
+        largest level and sources that are smaller than the requested level.
+        """
+        thumbnail = str(thumbnail)
+        level = cls.pick_level(size)
+        if not level or thumbnail.startswith(":"):
+            return thumbnail
+
+        stat = cls.source_stat(thumbnail)
+        if not stat:
+            return thumbnail
+
+        key = cls.cache_key(thumbnail, *stat)
+        path = cls.CACHE_PATH / f"{key}_{level}.{cls.FORMAT}"
+        if path.exists():
+            return str(path)
+
+        # every level smaller than the source is written at once, a missing
+        # level of a generated pyramid means the source isn't larger than it
+        if cls.generated_path(key).exists():
+            return thumbnail
+
+        if not cls.generate(thumbnail, key):
+            return thumbnail
+
+        return str(path) if path.exists() else thumbnail
+
+    @classmethod
+    def generated_path(cls, key: str) -> Path:
+        return cls.CACHE_PATH / f"{key}.done"
+
+    @classmethod
+    def load_image(cls, thumbnail: Union[str, Path], size: int) -> QImage:
+        """Decodes the level closest to ``size``, safe to call from any thread."""
+        thumbnail = str(thumbnail)
+        path = cls.level_path(thumbnail, size)
+        image = cls.read_source(thumbnail) if path == thumbnail else QImage(path)
+        if not image.isNull() and max(image.width(), image.height()) < size:
+            image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.FastTransformation)
+
+        return image
+
+    @staticmethod
+    def source_stat(thumbnail: str) -> Optional[tuple[int, int]]:
+        """(mtime_ns, size) of a thumbnail, served from the pool pack if possible."""
+        packed = ThumbnailPack.find(thumbnail)
+        if packed:
+            _, entry = packed
+            return entry.mtime_ns, entry.size
+
+        try:
+            stat = os.stat(thumbnail)
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def read_source(thumbnail: str) -> QImage:
+        packed = ThumbnailPack.find(thumbnail)
+        if packed:
+            pack, entry = packed
+            image = QImage.fromData(pack.read(entry))
+            if not image.isNull():
+                return image
+
+        return QImage(thumbnail)
+
+    @staticmethod
+    def to_array(image: QImage, size: tuple[int, int], grayscale: bool = False):
+        """Image resized to (width, height) as a uint8 numpy array, shaped
+        (height, width) for grayscale and (height, width, 3) otherwise."""
+
+        import numpy as np
+
+        width, height = size
+        image_format = QImage.Format_Grayscale8 if grayscale else QImage.Format_RGB888
+        image = image.scaled(
+            width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+        ).convertToFormat(image_format)
+
+        bits = image.constBits()
+        if hasattr(bits, "setsize"):
+            # PyQt hands out a sip.voidptr without a size
+            bits.setsize(image.bytesPerLine() * height)
+
+        channels = 1 if grayscale else 3
+        rows = np.frombuffer(bits, np.uint8).reshape(height, image.bytesPerLine())
+        data = rows[:, : width * channels].copy()
+
+        return data if grayscale else data.reshape(height, width, channels)
+
+    @staticmethod
+    def cache_key(thumbnail: str, mtime_ns: int, size: int) -> str:
+        data = f"{thumbnail}|{mtime_ns}|{size}".encode("utf-8")
+        return hashlib.sha1(data).hexdigest()
+
+    @classmethod
+    def generate(cls, thumbnail: str, key: str) -> bool:
+        image = cls.read_source(thumbnail)
+        if image.isNull():
+            Logger.debug(f"can't generate thumbnail pyramid, failed to read {thumbnail}")
+            return False
+
+        return cls.write_levels(image, key)
+
+    @classmethod
+    def generate_from_image(cls, thumbnail: str, image: QImage) -> bool:
+        """Write the levels of a thumbnail that was just saved from ``image``,
+        without reading it back from the pool."""
+        stat = cls.source_stat(thumbnail)
+        if not stat:
+            return False
+
+        return cls.write_levels(image, cls.cache_key(thumbnail, *stat))
+
+    @classmethod
+    def write_levels(cls, image: QImage, key: str) -> bool:
+        with cls._lock:
+            cls.CACHE_PATH.mkdir(parents=True, exist_ok=True)
+
+        source_size = max(image.width(), image.height())
+
+        # scale down from the largest level so every step only halves the image
+        for level in reversed(cls.LEVELS):
+            if level >= source_size:
+                continue
+
+            image = image.scaled(
+                level, level, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+            path = cls.CACHE_PATH / f"{key}_{level}.{cls.FORMAT}"
+            tmp_path = path.with_suffix(f".{os.getpid()}-{get_ident()}.tmp")
+            if not image.save(str(tmp_path), cls.FORMAT.upper(), cls.QUALITY):
+                Logger.error(f"failed to write thumbnail level {path}")
+                return False
+
+            os.replace(tmp_path, path)
+
+        cls.generated_path(key).touch()
+        return True
+
+    @classmethod
+    def clear(cls) -> None:
+        if not cls.CACHE_PATH.exists():
+            return
+
+        for file in cls.CACHE_PATH.iterdir():
+            try:
+                file.unlink()
+            except Exception as e:
+                Logger.exception(e)
+
+        Logger.info(f"cleared thumbnail cache {cls.CACHE_PATH}")
+
+
+class PixmapCache:
+    """Process wide LRU cache of decoded thumbnails, bounded by memory.
+
+    Shared by every asset viewport and the attribute editor. Entries are keyed
+    by (path, mtime, size), so overwritten thumbnails are decoded again.
+    Must only be used from the ui thread.
+    """
+
+    _pixmaps: "OrderedDict[tuple[str, int, int], QPixmap]" = OrderedDict()
+    _bytes = 0
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def budget(cls) -> int:
+        return int(SettingsManager.window_settings.pixmap_cache_mb * 1_000_000)
+
+    @staticmethod
+    def make_key(path: str, size: int) -> tuple[str, int, int]:
+        if path.startswith(":"):
+            return path, 0, size
+
+        stat = ThumbnailPyramid.source_stat(path)
+        mtime = stat[0] if stat else -1
+
+        return path, mtime, size
+
+    @staticmethod
+    def pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    @classmethod
+    def get(cls, key: tuple[str, int, int]) -> Optional[QPixmap]:
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is None:
+            cls.misses += 1
+            return None
+
+        cls._pixmaps.move_to_end(key)
+        cls.hits += 1
+        return pixmap
+
+    @classmethod
+    def put(cls, key: tuple[str, int, int], pixmap: QPixmap) -> None:
+        if pixmap.isNull():
+            return
+
+        old = cls._pixmaps.pop(key, None)
+        if old is not None:
+            cls._bytes -= cls.pixmap_bytes(old)
+
+        cls._pixmaps[key] = pixmap
+        cls._bytes += cls.pixmap_bytes(pixmap)
+        cls.evict()
+
+    @classmethod
+    def get_pixmap(cls, path: Union[str, Path], size: int) -> QPixmap:
+        path = str(path)
+        key = cls.make_key(path, size)
+        pixmap = cls.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = QPixmap.fromImage(ThumbnailPyramid.load_image(path, size))
+        cls.put(key, pixmap)
+        return pixmap
+
+    @classmethod
+    def evict(cls) -> None:
+        budget = cls.budget()
+        while cls._bytes > budget and len(cls._pixmaps) > 1:
+            _, pixmap = cls._pixmaps.popitem(last=False)
+            cls._bytes -= cls.pixmap_bytes(pixmap)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._pixmaps.clear()
+        cls._bytes = 0
+
+    @classmethod
+    def stats(cls) -> dict:
+        lookups = cls.hits + cls.misses
+        return {
+            "entries": len(cls._pixmaps),
+            "bytes": cls._bytes,
+            "budget": cls.budget(),
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "hit_rate": cls.hits / lookups if lookups else 0.0,
+        }
+
+    @classmethod
+    def format_stats(cls) -> str:
+        stats = cls.stats()
+        return (
+            f"Thumbnails: {stats['entries']} "
+            f"({stats['bytes'] / 1_000_000:.1f}/{stats['budget'] / 1_000_000:.0f}MB, "
+            f"{stats['hit_rate']:.0%} hits)"
+        )
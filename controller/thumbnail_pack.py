@@ -0,0 +1,234 @@
+import mmap
+import os
+import struct
+from pathlib import Path
+from threading import Lock
+from typing import NamedTuple, Optional
+
+from ..core import Logger
+from .pool_handler import THUMBNAIL_EXTENSTIONS
+from .settings import SettingsManager
+
+PACK_NAME = "Thumbnails.rvpack"
+PACK_MAGIC = b"RVPK"
+PACK_VERSION = 1
+
+# magic, version, entry count, offset of the entry table
+HEADER = struct.Struct("<4sIIQ")
+# blob offset, blob length, source mtime_ns, source size, name length
+ENTRY = struct.Struct("<QIqQH")
+
+
+class PackEntry(NamedTuple):
+    offset: int
+    length: int
+    mtime_ns: int
+    size: int
+
+
+class ThumbnailPack:
+    """All thumbnails of a pool concatenated into a single memory mapped file.
+
+    Layout: header, encoded thumbnails, entry table (offset, length and the
+    stat of the loose file it was packed from, followed by the file name).
+    The loose files in the Thumbnails folder stay the source of truth, the
+    pack is rebuilt from them with ``update`` and entries whose loose file
+    changed since are served from the loose file.
+    """
+
+    _packs: dict[Path, Optional["ThumbnailPack"]] = {}
+    _lock = Lock()
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: dict[str, PackEntry] = {}
+        self._file = None
+        self._mmap = None
+        # the decode thread may read a pack that's being invalidated
+        self._read_lock = Lock()
+
+        self.open()
+
+    @staticmethod
+    def enabled() -> bool:
+        return SettingsManager.window_settings.packed_thumbnails
+
+    @classmethod
+    def for_pool(cls, pool_root: Path) -> Optional["ThumbnailPack"]:
+        path = pool_root / PACK_NAME
+        with cls._lock:
+            if path in cls._packs:
+                return cls._packs[path]
+
+            pack = None
+            if path.exists():
+                try:
+                    pack = ThumbnailPack(path)
+                except Exception as e:
+                    Logger.exception(e)
+
+            cls._packs[path] = pack
+            return pack
+
+    @classmethod
+    def find(cls, thumbnail: str) -> Optional[tuple["ThumbnailPack", PackEntry]]:
+        if not thumbnail or thumbnail.startswith(":") or not cls.enabled():
+            return None
+
+        thumbnail_path = Path(thumbnail)
+        pack = cls.for_pool(thumbnail_path.parent.parent)
+        if not pack:
+            return None
+
+        entry = pack.entries.get(thumbnail_path.name)
+        if not entry:
+            return None
+
+        # another session may have rewritten the loose file while it couldn't
+        # replace the pack this one still maps
+        try:
+            stat = os.stat(thumbnail_path)
+        except OSError:
+            stat = None
+
+        if (
+            stat is None
+            or stat.st_mtime_ns != entry.mtime_ns
+            or stat.st_size != entry.size
+        ):
+            pack.entries.pop(thumbnail_path.name, None)
+            return None
+
+        return pack, entry
+
+    @classmethod
+    def discard(cls, thumbnail: str) -> None:
+        """Serve a thumbnail from its loose file until the pack is rebuilt."""
+        packed = cls.find(thumbnail)
+        if packed:
+            pack, _ = packed
+            pack.entries.pop(Path(thumbnail).name, None)
+
+    @classmethod
+    def invalidate(cls, pool_root: Path) -> None:
+        with cls._lock:
+            pack = cls._packs.pop(pool_root / PACK_NAME, None)
+
+        if pack:
+            pack.close()
+
+    def open(self) -> None:
+        self._file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, table_offset = HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"{self.path} is not a version {PACK_VERSION} pack")
+
+        offset = table_offset
+        for _ in range(count):
+            blob_offset, length, mtime_ns, size, name_length = ENTRY.unpack_from(
+                self._mmap, offset
+            )
+            offset += ENTRY.size
+            name = self._mmap[offset : offset + name_length].decode("utf-8")
+            offset += name_length
+            self.entries[name] = PackEntry(blob_offset, length, mtime_ns, size)
+
+    def close(self) -> None:
+        """Unmaps the pack once the running reads are done, later reads of a
+        closed pack return no data and fall back to the loose files."""
+        with self._read_lock:
+            if self._mmap:
+                self._mmap.close()
+                self._mmap = None
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def read(self, entry: PackEntry) -> bytes:
+        with self._read_lock:
+            if self._mmap is None:
+                return b""
+            return self._mmap[entry.offset : entry.offset + entry.length]
+
+    @classmethod
+    def update(cls, pool_root: Path) -> int:
+        """Rebuilds the pack of a pool, only reading thumbnails that changed.
+
+        Returns the number of added, changed or removed thumbnails.
+        """
+        thumbnails_path = pool_root / "Thumbnails"
+        if not thumbnails_path.exists():
+            return 0
+
+        path = pool_root / PACK_NAME
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        cls.invalidate(pool_root)
+
+        old = None
+        if path.exists():
+            try:
+                old = ThumbnailPack(path)
+            except Exception as e:
+                Logger.exception(e)
+
+        old_entries = old.entries if old else {}
+        files = sorted(
+            file
+            for file in thumbnails_path.iterdir()
+            if file.suffix.lower() in THUMBNAIL_EXTENSTIONS
+        )
+        changed = len(set(old_entries) - {file.name for file in files})
+
+        try:
+            with open(tmp_path, "wb") as out:
+                out.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, 0))
+                table = []
+
+                for file in files:
+                    stat = file.stat()
+                    entry = old_entries.get(file.name)
+                    if (
+                        entry
+                        and entry.mtime_ns == stat.st_mtime_ns
+                        and entry.size == stat.st_size
+                    ):
+                        data = old.read(entry)
+                    else:
+                        data = file.read_bytes()
+                        changed += 1
+
+                    table.append(
+                        (file.name, out.tell(), len(data), stat.st_mtime_ns, stat.st_size)
+                    )
+                    out.write(data)
+
+                table_offset = out.tell()
+                for name, offset, length, mtime_ns, size in table:
+                    encoded = name.encode("utf-8")
+                    out.write(ENTRY.pack(offset, length, mtime_ns, size, len(encoded)))
+                    out.write(encoded)
+
+                out.seek(0)
+                out.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, len(table), table_offset))
+        finally:
+            if old:
+                old.close()
+
+        if not changed and path.exists():
+            tmp_path.unlink()
+            return 0
+
+        try:
+            cls.invalidate(pool_root)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # the pack is mapped by another session, keep serving the old one
+            Logger.warning(f"can't replace {path}, it's still in use: {e}")
+            tmp_path.unlink()
+            return 0
+
+        Logger.info(f"updated {changed} thumbnails in {path}")
+        return changed
@@ -1,2 +1,3 @@
 from .logger import Logger
+from .startup_trace import StartupTrace
 from .version import get_version
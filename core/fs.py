@@ -1,3 +1,4 @@
+import hashlib
 import shutil
 import sys
 from pathlib import Path
@@ -64,3 +65,12 @@ def open_dir(path: Union[str, Path]) -> None:
     elif sys.platform == "win32":
         with Popen(f"explorer {path}"):
             pass
+
+
+def file_hash(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
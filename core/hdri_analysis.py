@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+ANALYSIS_SIZE = (128, 64)
+SUN_THRESHOLD = 0.5
+SHADOW_PERCENTILE = 1.0
+MIN_LUMINANCE = 1e-6
+LUMINANCE_WEIGHTS = (0.2126, 0.7152, 0.0722)
+
+# real spherical harmonics up to band 2
+SH_CONSTANTS = (0.282095, 0.488603, 1.092548, 0.315392, 0.546274)
+
+
+def latlong_directions(height: int, width: int) -> tuple[np.ndarray, np.ndarray]:
+    """Unit directions (h, w, 3) and solid angles (h, 1) of the pixel centres
+    of a latitude-longitude image.
+
+    Y is up like in Maya, the top row looks at the zenith and the azimuth
+    starts at the left image edge and increases to the right.
+    """
+
+    import numpy as np
+
+    theta = (np.arange(height, dtype=np.float32) + 0.5) * np.pi / height
+    phi = (np.arange(width, dtype=np.float32) + 0.5) * 2 * np.pi / width
+
+    sin_theta = np.sin(theta)[:, None]
+    directions = np.empty((height, width, 3), dtype=np.float32)
+    directions[..., 0] = sin_theta * np.cos(phi)[None, :]
+    directions[..., 1] = np.cos(theta)[:, None]
+    directions[..., 2] = sin_theta * np.sin(phi)[None, :]
+
+    solid_angles = sin_theta * np.float32(2 * np.pi**2 / (height * width))
+    return directions, solid_angles
+
+
+def luminance(rgb: np.ndarray) -> np.ndarray:
+    import numpy as np
+
+    return rgb @ np.array(LUMINANCE_WEIGHTS, dtype=np.float32)
+
+
+def sh_basis(directions: np.ndarray) -> np.ndarray:
+    """The 9 real SH basis functions evaluated for (..., 3) directions."""
+
+    import numpy as np
+
+    x, y, z = directions[..., 0], directions[..., 1], directions[..., 2]
+    c0, c1, c2, c3, c4 = SH_CONSTANTS
+
+    return np.stack(
+        (
+            np.full_like(x, c0),
+            c1 * y,
+            c1 * z,
+            c1 * x,
+            c2 * x * y,
+            c2 * y * z,
+            c3 * (3 * z * z - 1),
+            c2 * x * z,
+            c4 * (x * x - y * y),
+        ),
+        axis=-1,
+    )
+
+
+def spherical_harmonics(
+    rgb: np.ndarray, directions: np.ndarray, solid_angles: np.ndarray
+) -> np.ndarray:
+    """(9, 3) SH projection of a lat-long radiance buffer, one matrix product
+    over all pixels."""
+
+    weighted = (rgb * solid_angles[..., None]).reshape(-1, 3)
+    return sh_basis(directions).reshape(-1, 9).T @ weighted
+
+
+def analyse(rgb: np.ndarray, peak_luminance: Optional[float] = None) -> dict:
+    """Lighting statistics of a linear float32 (h, w, 3) lat-long buffer.
+
+    The dominant light is the energy weighted direction of every pixel
+    brighter than SUN_THRESHOLD of the peak, ``sun_share`` is its part of
+    the total energy. Area downsampling spreads a small sun over its
+    neighbours, so pass the peak of the full resolution image if known.
+    """
+
+    import numpy as np
+
+    rgb = np.maximum(np.asarray(rgb, dtype=np.float32), 0)
+    height, width = rgb.shape[:2]
+    directions, solid_angles = latlong_directions(height, width)
+
+    lum = luminance(rgb)
+    energy = lum * solid_angles
+    total = float(energy.sum(dtype=np.float64))
+    if peak_luminance is None:
+        peak_luminance = float(lum.max())
+
+    bright = lum >= SUN_THRESHOLD * lum.max()
+    sun_energy = energy[bright]
+    sun_direction = (directions[bright] * sun_energy[:, None]).sum(axis=0)
+    sun_direction /= max(float(np.linalg.norm(sun_direction)), MIN_LUMINANCE)
+    x, y, z = sun_direction.tolist()
+
+    shadows = max(float(np.percentile(lum, SHADOW_PERCENTILE)), MIN_LUMINANCE)
+    peak = max(peak_luminance, shadows)
+
+    return {
+        "sun_direction": [round(v, 4) for v in (x, y, z)],
+        "sun_elevation": round(float(np.degrees(np.arcsin(np.clip(y, -1, 1)))), 2),
+        "sun_azimuth": round(float(np.degrees(np.arctan2(z, x)) % 360), 2),
+        "sun_share": round(float(sun_energy.sum()) / max(total, MIN_LUMINANCE), 4),
+        "mean_luminance": round(total / (4 * np.pi), 6),
+        "peak_luminance": round(peak, 6),
+        "dynamic_range": round(float(np.log2(peak / shadows)), 2),
+        "sh": np.round(spherical_harmonics(rgb, directions, solid_angles), 6).tolist(),
+    }
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+HASH_BITS = 64
+DHASH_SIZE = (8, 9)
+PHASH_SIZE = (32, 32)
+PHASH_LOW_FREQ = 8
+HASH_CHUNKS = 4
+CHUNK_BITS = HASH_BITS // HASH_CHUNKS
+COLOR_BINS = 4
+COLOR_SIGMA = 48.0
+PALETTE_SIZE = 5
+EMBEDDING_DIMS = 64
+# hash x chunk mask lookups per batch of find_near_duplicates, bounds its memory
+QUERY_BATCH = 1 << 18
+
+_dct_matrix = None
+_popcount_lut = None
+
+
+def dct_matrix(size: int = PHASH_SIZE[0]) -> np.ndarray:
+    """Orthonormal DCT-II basis, cached for the pHash size."""
+
+    global _dct_matrix
+    import numpy as np
+
+    if _dct_matrix is None or _dct_matrix.shape[0] != size:
+        n = np.arange(size, dtype=np.float32)
+        basis = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+        basis *= np.sqrt(2 / size)
+        basis[0] /= np.sqrt(2)
+        _dct_matrix = basis.astype(np.float32)
+
+    return _dct_matrix
+
+
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+    """Pack (N, 64) booleans into (N,) uint64 hashes, first bit is the msb."""
+
+    import numpy as np
+
+    packed = np.packbits(bits.reshape(len(bits), HASH_BITS), axis=1)
+    return packed.view(">u8").ravel().astype(np.uint64)
+
+
+def dhash(gray: np.ndarray) -> np.ndarray:
+    """Difference hash of a (N, 8, 9) grayscale batch."""
+
+    return pack_bits(gray[:, :, 1:] > gray[:, :, :-1])
+
+
+def phash(gray: np.ndarray) -> np.ndarray:
+    """DCT hash of a (N, 32, 32) grayscale batch.
+
+    The 8x8 low frequencies are compared against their median, the DC term
+    is left out of the median so flat images don't collapse to one bit.
+    """
+
+    import numpy as np
+
+    basis = dct_matrix(gray.shape[1])
+    coeffs = basis @ gray.astype(np.float32) @ basis.T
+    low = coeffs[:, :PHASH_LOW_FREQ, :PHASH_LOW_FREQ].reshape(len(gray), -1)
+    median = np.median(low[:, 1:], axis=1, keepdims=True)
+
+    return pack_bits(low > median)
+
+
+def popcount(values: np.ndarray) -> np.ndarray:
+    global _popcount_lut
+    import numpy as np
+
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values).astype(np.int32)
+
+    if _popcount_lut is None:
+        _popcount_lut = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1)
+        _popcount_lut = _popcount_lut.sum(axis=1).astype(np.int32)
+
+    values = np.ascontiguousarray(values, dtype=np.uint64)
+    return _popcount_lut[values.view(np.uint8)].reshape(*values.shape, 8).sum(axis=-1)
+
+
+def hamming(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    import numpy as np
+
+    return popcount(np.bitwise_xor(a, b))
+
+
+def chunk_masks(radius: int) -> list[int]:
+    """Every CHUNK_BITS wide mask with at most radius bits set."""
+
+    return [
+        sum(1 << bit for bit in bits)
+        for r in range(radius + 1)
+        for bits in itertools.combinations(range(CHUNK_BITS), r)
+    ]
+
+
+def find_near_duplicates(
+    hashes: np.ndarray, max_distance: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """All index pairs (i < j) whose hashes differ in at most max_distance bits.
+
+    Multi-index hashing: the hash is split into HASH_CHUNKS chunks, by
+    pigeonhole every match is within max_distance // HASH_CHUNKS bits on at
+    least one chunk. Those neighbours are looked up in the sorted chunk
+    values, only the resulting candidates get a full hamming distance.
+
+    The hashes are looked up in batches of QUERY_BATCH // masks, so memory
+    stays bounded at large distances, where there are thousands of masks.
+    """
+
+    import numpy as np
+
+    hashes = np.ascontiguousarray(hashes, dtype=np.uint64)
+    count = len(hashes)
+    masks = np.array(chunk_masks(max_distance // HASH_CHUNKS), dtype=np.int64)
+    batch = max(1, QUERY_BATCH // len(masks))
+    matches = [np.empty(0, dtype=np.int64)]
+
+    for chunk in range(HASH_CHUNKS):
+        shift = np.uint64(chunk * CHUNK_BITS)
+        values = ((hashes >> shift) & np.uint64(0xFFFF)).astype(np.int64)
+        order = np.argsort(values, kind="stable")
+        sorted_values = values[order]
+
+        for start in range(0, count, batch):
+            # a batch of hashes against every chunk mask in one lookup
+            query = (values[start : start + batch, None] ^ masks[None, :]).ravel()
+            left = np.searchsorted(sorted_values, query, "left")
+            counts = np.searchsorted(sorted_values, query, "right") - left
+            total = int(counts.sum())
+
+            first = start + np.repeat(np.arange(len(query)) // len(masks), counts)
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            second = order[np.repeat(left, counts) + offsets]
+
+            # verify before deduplicating, matches are far fewer than candidates
+            keep = first < second
+            first, second = first[keep], second[keep]
+            close = hamming(hashes[first], hashes[second]) <= max_distance
+            matches.append(first[close] * count + second[close])
+
+    pairs = np.unique(np.concatenate(matches))
+    first, second = pairs // count, pairs % count
+    distances = hamming(hashes[first], hashes[second])
+
+    return np.stack((first, second), axis=1), distances
+
+
+def group_pairs(pairs: np.ndarray, count: int) -> list[list[int]]:
+    """Union-find the matched pairs into groups of near duplicates."""
+
+    parent = list(range(count))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for a, b in pairs.tolist():
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    groups: dict[int, list[int]] = {}
+    for i in range(count):
+        groups.setdefault(find(i), []).append(i)
+
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def color_histogram(rgb: np.ndarray, bins: int = COLOR_BINS) -> np.ndarray:
+    """Normalised (N, bins**3) RGB histograms of a (N, h, w, 3) uint8 batch."""
+
+    import numpy as np
+
+    count = len(rgb)
+    quantised = (rgb.reshape(count, -1, 3).astype(np.int32) * bins) >> 8
+    cells = (quantised[..., 0] * bins + quantised[..., 1]) * bins + quantised[..., 2]
+    cells += np.arange(count, dtype=np.int32)[:, None] * bins**3
+
+    histograms = np.bincount(cells.ravel(), minlength=count * bins**3)
+    histograms = histograms.reshape(count, bins**3).astype(np.float32)
+    return histograms / histograms.sum(axis=1, keepdims=True)
+
+
+def dominant_colors(
+    rgb: np.ndarray, k: int = PALETTE_SIZE, iterations: int = 8
+) -> tuple[np.ndarray, np.ndarray]:
+    """Batched k-means over the pixels of a (N, h, w, 3) uint8 batch.
+
+    Returns (N, k, 3) uint8 colours and their (N, k) pixel shares, sorted by
+    share. Centroids start at luminance quantiles so the result is
+    deterministic.
+    """
+
+    import numpy as np
+
+    count = len(rgb)
+    pixels = rgb.reshape(count, -1, 3).astype(np.float32)
+    luminance = pixels @ np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+    order = np.argsort(luminance, axis=1)
+    seeds = order[:, ((np.arange(k) + 0.5) * pixels.shape[1] / k).astype(int)]
+    centroids = np.take_along_axis(pixels, seeds[..., None], axis=1)
+
+    for _ in range(iterations):
+        distances = (
+            (pixels**2).sum(axis=2, keepdims=True)
+            - 2 * pixels @ centroids.transpose(0, 2, 1)
+            + (centroids**2).sum(axis=2)[:, None, :]
+        )
+        onehot = np.eye(k, dtype=np.float32)[distances.argmin(axis=2)]
+        sizes = onehot.sum(axis=1)
+        sums = onehot.transpose(0, 2, 1) @ pixels
+        # empty clusters keep their previous centroid
+        centroids = np.where(
+            sizes[..., None] > 0, sums / np.maximum(sizes, 1)[..., None], centroids
+        )
+
+    shares = sizes / pixels.shape[1]
+    ranking = np.argsort(-shares, axis=1)
+    colors = np.take_along_axis(centroids, ranking[..., None], axis=1)
+
+    return (
+        np.clip(np.rint(colors), 0, 255).astype(np.uint8),
+        np.take_along_axis(shares, ranking, axis=1),
+    )
+
+
+def color_weights(
+    colors: np.ndarray, bins: int = COLOR_BINS, sigma: float = COLOR_SIGMA
+) -> np.ndarray:
+    """Soft (bins**3,) weights for the query colours, neighbouring bins still
+    count so colours near a bin edge match."""
+
+    import numpy as np
+
+    centres = (np.arange(bins, dtype=np.float32) + 0.5) * 256 / bins
+    grid = np.stack(np.meshgrid(centres, centres, centres, indexing="ij"), axis=-1)
+    grid = grid.reshape(-1, 3)
+
+    colors = np.asarray(colors, dtype=np.float32).reshape(-1, 3)
+    distances = ((grid[:, None, :] - colors[None, :, :]) ** 2).sum(axis=2)
+    return np.exp(-distances / (2 * sigma**2)).max(axis=1)
+
+
+def rank_by_color(histograms: np.ndarray, colors: np.ndarray) -> np.ndarray:
+    """Share of every image close to the query colours, one matrix product
+    over all (N, bins**3) histograms."""
+
+    return histograms @ color_weights(colors)
+
+
+def pixel_vectors(rgb: np.ndarray) -> np.ndarray:
+    """Flattened (N, h*w*3) pixels of a uint8 batch, zero mean and unit
+    length per image so overall brightness doesn't dominate the distance."""
+
+    import numpy as np
+
+    vectors = rgb.reshape(len(rgb), -1).astype(np.float32) / 255
+    vectors -= vectors.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-6)
+
+
+def fit_pca(
+    vectors: np.ndarray, dims: int = EMBEDDING_DIMS
+) -> tuple[np.ndarray, np.ndarray]:
+    """Mean and (dims, D) principal components of the sample vectors."""
+
+    import numpy as np
+
+    mean = vectors.mean(axis=0)
+    _, _, components = np.linalg.svd(vectors - mean, full_matrices=False)
+    return mean.astype(np.float32), components[:dims].astype(np.float32)
+
+
+def project(
+    vectors: np.ndarray, mean: np.ndarray, components: np.ndarray
+) -> np.ndarray:
+    """Unit length PCA embeddings, the dot product of two is their cosine
+    similarity."""
+
+    import numpy as np
+
+    embeddings = (vectors - mean) @ components.T
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return (embeddings / np.maximum(norms, 1e-6)).astype(np.float32)
+
+
+def rank_by_similarity(embeddings: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every (N, dims) embedding to the query."""
+
+    return embeddings @ query
@@ -1,13 +1,26 @@
+import os
 import sys
 import time
 from pathlib import Path
 
 from . import Logger
 
+TONEMAP_OPERATORS = ("reinhard", "reinhard_extended", "aces", "exposure")
+SRGB_LUT_SIZE = 4096
+AUTO_EXPOSURE_KEY = 0.18
+SCREENSHOT_SIZE = 350
+
+_srgb_lut = None
+
 
 def take_screenshot(path: Path, geometry: tuple[int, int, int, int]) -> None:
-    import mss.tools
-    from PIL import Image
+    save_screenshot(path, *grab_screen(geometry))
+
+
+def grab_screen(geometry: tuple[int, int, int, int]) -> tuple[bytes, tuple[int, int]]:
+    """Raw BGRA pixels and size of a screen region. This is the only part of
+    a screenshot that has to run on the UI thread."""
+    import mss
 
     x, y, w, h = geometry
 
@@ -20,14 +33,53 @@ def take_screenshot(path: Path, geometry: tuple[int, int, int, int]) -> None:
         }
 
         sct_img = sct.grab(monitor)
-        img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
-        img.resize((350, 350)).save(path, "JPEG")
+        return bytes(sct_img.bgra), sct_img.size
+
+
+def save_screenshot(
+    path: Path,
+    bgra: bytes,
+    size: tuple[int, int],
+    thumbnail_size: int = SCREENSHOT_SIZE,
+):
+    """Downsample a grabbed screen region and write it as thumbnail.
+
+    The image is written next to the target first and moved in place, so
+    nobody reads a half written file from a slow network share. Returns the
+    resized PIL image.
+    """
+    from PIL import Image
+
+    path = Path(path)
+    img = Image.frombytes("RGB", size, bgra, "raw", "BGRX")
+    img = img.resize((thumbnail_size, thumbnail_size), Image.LANCZOS)
+
+    image_format = "PNG" if path.suffix.lower() == ".png" else "JPEG"
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    img.save(tmp_path, image_format)
+    os.replace(tmp_path, path)
+
+    Logger.info(f"Saved Screenshot in {path}")
+    return img
+
+
+def applies_tonemap(hdri_path: Path) -> bool:
+    """Whether create_sdr_preview uses the tonemap settings for ``hdri_path``,
+    rust_thumbnails converts .hdr files (and .exr files on macOS) as is."""
 
-        Logger.info(f"Saved Screenshot in {path}")
+    return hdri_path.suffix == ".exr" and sys.platform != "darwin"
 
 
-def create_sdr_preview(hdri_path: Path, thumbnail_path: Path, size: int):
-    if not hdri_path.is_file() or thumbnail_path.exists():
+def create_sdr_preview(
+    hdri_path: Path,
+    thumbnail_path: Path,
+    size: int,
+    operator: str = "reinhard",
+    exposure: float = 1.0,
+    auto_exposure: bool = False,
+    overwrite: bool = False,
+):
+    if not hdri_path.is_file() or (thumbnail_path.exists() and not overwrite):
         return thumbnail_path
 
     try:
@@ -50,15 +102,14 @@ def create_sdr_preview(hdri_path: Path, thumbnail_path: Path, size: int):
             import imageio
             import numpy as np
 
-            imageio.plugins.freeimage.download()
-            image = imageio.imread(hdri_path, format="EXR-FI")[:, :, :3]
+            image = read_hdri(hdri_path)
         else:
             return
 
         res_img = cv2.resize(image, (size, size // 2), interpolation=cv2.INTER_LINEAR)
-        tonemapped_image = reinhard_tonemap(res_img)
-        gamma_corrected = np.power(tonemapped_image, 1.0 / 2.2)
-        jpg_image = np.clip(gamma_corrected * 255, 0, 255).astype(np.uint8)
+        res_img = np.ascontiguousarray(res_img, dtype=np.float32)
+        tonemap(res_img, operator, exposure=exposure, auto_exposure=auto_exposure)
+        jpg_image = encode_srgb(res_img)
 
         imageio.imwrite(thumbnail_path, jpg_image, format="jpg")  # type: ignore
 
@@ -66,5 +117,161 @@ def create_sdr_preview(hdri_path: Path, thumbnail_path: Path, size: int):
         Logger.exception(e)
 
 
-def reinhard_tonemap(img, exposure=1.0, white=1.0):
-    return img * (1.0 + (img / (white**2))) / (1.0 + img)
+def read_hdri(hdri_path: Path):
+    """Decode an .hdr or .exr file into a linear float32 RGB array."""
+    import cv2
+    import numpy as np
+
+    if hdri_path.suffix.lower() == ".exr":
+        import imageio
+
+        imageio.plugins.freeimage.download()
+        image = imageio.imread(hdri_path, format="EXR-FI")[:, :, :3]
+    else:
+        image = cv2.imread(str(hdri_path), cv2.IMREAD_ANYDEPTH | cv2.IMREAD_COLOR)
+        if image is None:
+            raise OSError(f"can't decode {hdri_path}")
+        image = image[:, :, ::-1]
+
+    return np.ascontiguousarray(image, dtype=np.float32)
+
+
+def resize_hdri(image, size: tuple[int, int]):
+    """Area average a float32 image down to (width, height), which keeps the
+    energy of small bright lights instead of skipping them."""
+    import cv2
+
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def tonemap(
+    img,
+    operator: str = "reinhard",
+    exposure: float = 1.0,
+    white: float = 1.0,
+    auto_exposure: bool = False,
+):
+    """Tonemap a float32 RGB image in place and return it.
+
+    The operators only allocate when they can't avoid it (at most one
+    full-size float32 buffer for ``aces`` and ``reinhard_extended``).
+    """
+    if operator not in TONEMAP_OPERATORS:
+        Logger.warning(f"unknown tonemap operator {operator}, using reinhard")
+        operator = "reinhard"
+
+    if auto_exposure:
+        exposure *= AUTO_EXPOSURE_KEY / log_average_luminance(img)
+
+    if operator == "exposure":
+        return tonemap_exposure(img, exposure)
+    elif operator == "reinhard_extended":
+        return tonemap_reinhard_extended(img, exposure, white)
+    elif operator == "aces":
+        return tonemap_aces(img, exposure)
+
+    return tonemap_reinhard(img, exposure)
+
+
+def log_average_luminance(img, step: int = 4, delta: float = 1e-4) -> float:
+    import numpy as np
+
+    sample = img[::step, ::step]
+    lum = sample[..., 0] * 0.2126
+    lum += sample[..., 1] * 0.7152
+    lum += sample[..., 2] * 0.0722
+    np.maximum(lum, 0.0, out=lum)
+    lum += delta
+    np.log(lum, out=lum)
+
+    return float(np.exp(lum.mean(dtype=np.float64)))
+
+
+def tonemap_exposure(img, exposure: float = 1.0):
+    import numpy as np
+
+    if exposure != 1.0:
+        img *= np.float32(exposure)
+    np.maximum(img, 0.0, out=img)
+    return img
+
+
+def tonemap_reinhard(img, exposure: float = 1.0):
+    import numpy as np
+
+    tonemap_exposure(img, exposure)
+
+    # x / (1 + x) == 1 - 1 / (1 + x), which can be evaluated without temporaries
+    img += np.float32(1.0)
+    np.reciprocal(img, out=img)
+    np.subtract(np.float32(1.0), img, out=img)
+    return img
+
+
+def tonemap_reinhard_extended(img, exposure: float = 1.0, white: float = 1.0):
+    import numpy as np
+
+    tonemap_exposure(img, exposure)
+
+    scale = np.multiply(img, np.float32(1.0 / (white**2)))
+    scale += np.float32(1.0)
+    tonemap_reinhard(img)
+    img *= scale
+    np.minimum(img, 1.0, out=img)
+    return img
+
+
+def tonemap_aces(img, exposure: float = 1.0):
+    """Narkowicz' fitted ACES filmic curve: x(ax+b) / (x(cx+d)+e)."""
+    import numpy as np
+
+    a, b, c, d, e = 2.51, 0.03, 2.43, 0.59, 0.14
+
+    tonemap_exposure(img, exposure)
+
+    # numerator and denominator are both linear in (x, x^2), so two buffers
+    # are enough to evaluate the ratio in place
+    sq = np.square(img)
+    sq *= np.float32(c)
+    img *= np.float32(d)
+    img += np.float32(e)
+    img += sq
+    # img: c*x^2 + d*x + e, sq: c*x^2
+    # a*x^2 + b*x == (b/d) * (img - e + sq * (a/c - b/d) / (b/d))
+    sq *= np.float32((a / c - b / d) / (b / d))
+    sq += img
+    sq -= np.float32(e)
+    sq *= np.float32(b / d)
+    np.divide(sq, img, out=img)
+    np.clip(img, 0.0, 1.0, out=img)
+    return img
+
+
+def srgb_lut():
+    global _srgb_lut
+
+    if _srgb_lut is None:
+        import numpy as np
+
+        x = np.linspace(0.0, 1.0, SRGB_LUT_SIZE, dtype=np.float64)
+        srgb = np.where(
+            x <= 0.0031308, x * 12.92, 1.055 * np.power(x, 1.0 / 2.4) - 0.055
+        )
+        _srgb_lut = np.clip(srgb * 255.0 + 0.5, 0, 255).astype(np.uint8)
+
+    return _srgb_lut
+
+
+def encode_srgb(img):
+    """Encode a linear [0, 1] float32 image to sRGB uint8 through a LUT.
+
+    ``img`` is used as scratch space and is left holding the LUT indices.
+    """
+    import numpy as np
+
+    img *= np.float32(SRGB_LUT_SIZE - 1)
+    img += np.float32(0.5)
+    np.clip(img, 0, SRGB_LUT_SIZE - 1, out=img)
+    indices = img.astype(np.uint16)
+
+    return srgb_lut()[indices]
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MAGIC = (b"#?RADIANCE", b"#?RGBE")
+RESOLUTION = re.compile(rb"^-Y (\d+) \+X (\d+)$")
+MIN_RLE_WIDTH = 8
+MAX_RLE_WIDTH = 0x7FFF
+
+
+def read_header(file: BinaryIO) -> tuple[int, int]:
+    """Skip the Radiance header and return (width, height)."""
+
+    if not file.readline().rstrip().startswith(MAGIC):
+        raise ValueError(f"{file.name} is not a Radiance .hdr file")
+
+    for line in iter(file.readline, b""):
+        if line.startswith(b"FORMAT=") and b"32-bit_rle_rgbe" not in line:
+            raise ValueError(f"unsupported Radiance format {line.strip()}")
+        if line.strip() == b"":
+            break
+
+    match = RESOLUTION.match(file.readline().strip())
+    if not match:
+        raise ValueError(f"{file.name} has an unsupported orientation")
+
+    height, width = (int(value) for value in match.groups())
+    return width, height
+
+
+def read_scanline(file: BinaryIO, width: int) -> np.ndarray:
+    """One (width, 4) uint8 RGBE scanline, flat or new style run length
+    encoded."""
+
+    import numpy as np
+
+    start = file.read(4)
+    if len(start) < 4:
+        raise EOFError("truncated Radiance scanline")
+
+    rle = (
+        MIN_RLE_WIDTH <= width <= MAX_RLE_WIDTH
+        and start[0] == 2
+        and start[1] == 2
+        and not start[2] & 0x80
+    )
+    if not rle:
+        flat = start + file.read(width * 4 - 4)
+        if len(flat) < width * 4:
+            raise EOFError("truncated Radiance scanline")
+        return np.frombuffer(flat, dtype=np.uint8).reshape(width, 4)
+
+    if (start[2] << 8 | start[3]) != width:
+        raise ValueError("Radiance scanline width mismatch")
+
+    scanline = np.empty((4, width), dtype=np.uint8)
+    for channel in scanline:
+        pos = 0
+        while pos < width:
+            code = file.read(1)
+            if not code:
+                raise EOFError("truncated Radiance scanline")
+
+            count, run = code[0], code[0] > 128
+            if run:
+                count -= 128
+            if count == 0 or pos + count > width:
+                raise ValueError("bad Radiance scanline run length")
+
+            data = file.read(1 if run else count)
+            if len(data) < (1 if run else count):
+                raise EOFError("truncated Radiance scanline")
+
+            if run:
+                channel[pos : pos + count] = data[0]
+            else:
+                channel[pos : pos + count] = np.frombuffer(data, dtype=np.uint8)
+            pos += count
+
+    return scanline.T
+
+
+def decode(rgbe: np.ndarray) -> np.ndarray:
+    """Float32 RGB of (..., 4) uint8 RGBE pixels."""
+
+    import numpy as np
+
+    exponent = rgbe[..., 3:].astype(np.int32)
+    scale = np.where(exponent > 0, np.ldexp(np.float32(1), exponent - 136), 0)
+    return ((rgbe[..., :3] + np.float32(0.5)) * scale).astype(np.float32)
+
+
+def encode(rgb: np.ndarray) -> np.ndarray:
+    """(..., 4) uint8 RGBE pixels of float RGB."""
+
+    import numpy as np
+
+    rgb = np.maximum(rgb, 0).astype(np.float32)
+    brightest = rgb.max(axis=-1)
+    mantissa, exponent = np.frexp(brightest)
+    visible = brightest > 1e-32
+    scale = np.where(visible, mantissa * 256 / np.where(visible, brightest, 1), 0)
+
+    rgbe = np.empty((*rgb.shape[:-1], 4), dtype=np.uint8)
+    rgbe[..., :3] = np.minimum(rgb * scale[..., None], 255)
+    rgbe[..., 3] = np.where(visible, exponent + 128, 0)
+    return rgbe
+
+
+def iter_scanlines(path: Path) -> Iterator[tuple[int, int, np.ndarray]]:
+    """Stream (width, height, float32 row) of a .hdr file, only one scanline
+    is decoded at a time."""
+
+    with open(path, "rb") as file:
+        width, height = read_header(file)
+        for _ in range(height):
+            yield width, height, decode(read_scanline(file, width))
+
+
+def write(path: Path, rgb: np.ndarray) -> None:
+    """Write a float RGB image as a flat (not run length encoded) .hdr."""
+
+    height, width = rgb.shape[:2]
+    header = (
+        b"#?RADIANCE\nFORMAT=32-bit_rle_rgbe\n\n"
+        + f"-Y {height} +X {width}\n".encode()
+    )
+    with open(path, "wb") as file:
+        file.write(header)
+        file.write(encode(rgb).tobytes())
+
+
+def downsample(path: Path, widths: list[int]) -> list[np.ndarray]:
+    """Box filter a .hdr file down to every given width (2:1 lat-long) in a
+    single streaming pass, memory stays at one source scanline plus the
+    outputs no matter how large the source is."""
+
+    outputs, _ = downsample_with_peak(path, widths)
+    return outputs
+
+
+def downsample_with_peak(
+    path: Path, widths: list[int], weights: Optional[tuple[float, ...]] = None
+) -> tuple[list[np.ndarray], float]:
+    """``downsample``, plus the full resolution peak of the pixels weighted
+    by ``weights``, which the box filter would average away. The peak is 0
+    without weights."""
+
+    import numpy as np
+
+    outputs, row_sums, columns, rows = [], [], [], []
+    current = []
+    peak = 0.0
+    if weights is not None:
+        weights = np.array(weights, dtype=np.float32)
+
+    for y, (width, height, scanline) in enumerate(iter_scanlines(path)):
+        if weights is not None:
+            peak = max(peak, float((scanline @ weights).max()))
+
+        if not outputs:
+            for target in widths:
+                target_width = min(target, width)
+                target_height = max(1, min(target_width // 2, height))
+                outputs.append(
+                    np.zeros((target_height, target_width, 3), dtype=np.float32)
+                )
+                row_sums.append(np.zeros((target_width, 3), dtype=np.float64))
+                columns.append(np.arange(target_width) * width // target_width)
+                rows.append(np.arange(height) * target_height // height)
+                current.append(0)
+
+        for i, output in enumerate(outputs):
+            row = rows[i][y]
+            if row != current[i]:
+                flush_row(output, row_sums[i], current[i], rows[i], columns[i], width)
+                current[i] = row
+
+            row_sums[i] += np.add.reduceat(scanline, columns[i], axis=0)
+
+    for i, output in enumerate(outputs):
+        flush_row(output, row_sums[i], current[i], rows[i], columns[i], width)
+
+    return outputs, peak
+
+
+def flush_row(
+    output: np.ndarray,
+    row_sum: np.ndarray,
+    row: int,
+    rows: np.ndarray,
+    columns: np.ndarray,
+    width: int,
+) -> None:
+    """Average the accumulated source pixels into one output row."""
+
+    import numpy as np
+
+    source_rows = np.count_nonzero(rows == row)
+    source_columns = np.diff(np.append(columns, width))
+    output[row] = row_sum / (source_rows * source_columns[:, None])
+    row_sum[:] = 0
@@ -0,0 +1,232 @@
+from typing import Hashable, Iterable, Optional
+
+TRIGRAM = 3
+# shorter queries only match substrings, fuzzy matching them finds everything
+MIN_FUZZY_LENGTH = 3
+# query characters that may be missing from a fuzzy match, per character
+TYPO_RATE = 0.25
+NAME_MATCH = 3.0
+TAG_MATCH = 2.0
+FUZZY_MATCH = 1.0
+# fuzzy matches scattered over the whole text are noise
+MIN_FUZZY_SCORE = 0.3
+
+
+def trigrams(text: str) -> set[str]:
+    return {text[i : i + TRIGRAM] for i in range(len(text) - TRIGRAM + 1)}
+
+
+def char_mask(text: str) -> int:
+    """Bit per character (folded to 64 bits), a cheap superset test of the
+    characters two strings contain."""
+
+    mask = 0
+    for char in text:
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def fuzzy_match(query: str, text: str) -> tuple[int, int]:
+    """Greedily match ``query`` as a subsequence of ``text``, characters
+    that can't be found are skipped. Returns (misses, matched span)."""
+
+    misses, start, position = 0, -1, 0
+    for char in query:
+        found = text.find(char, position)
+        if found < 0:
+            misses += 1
+            continue
+        if start < 0:
+            start = found
+        position = found + 1
+
+    return misses, position - start if start >= 0 else 0
+
+
+class NameIndex:
+    """Case insensitive search over the asset names (and tags) of one pool.
+
+    ``search`` finds name substrings: queries of three or more characters
+    only check the names sharing the query's rarest trigram, and the last
+    result is kept, so a refined query (the previous query is a part of it)
+    only filters the previous matches.
+
+    ``rank`` is typo tolerant and scores names and tags. It narrows the
+    candidates the same way: substrings are only looked for in the postings
+    of the rarest trigram, fuzzy matches among the assets sharing a trigram
+    with the query, and a refined query only looks for substrings among the
+    previous substring matches. Fuzzy matches aren't refined, a longer
+    query tolerates more typos and can match what its prefix didn't.
+    The lower-cased texts, character masks and trigram postings it needs are
+    built once here.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[tuple[Hashable, str]],
+        tags: Optional[dict[Hashable, Iterable[str]]] = None,
+    ):
+        tags = tags or {}
+        self._keys: list[Hashable] = []
+        self._names: list[str] = []
+        self._texts: list[str] = []
+        self._masks: list[int] = []
+        self._trigrams: dict[str, list[int]] = {}
+
+        for row, (key, name) in enumerate(items):
+            name = name.lower()
+            text = " ".join((name, *tags.get(key, ()))).lower()
+            self._keys.append(key)
+            self._names.append(name)
+            self._texts.append(text)
+            self._masks.append(char_mask(text))
+            # postings of the full text are a superset of the name's
+            for trigram in trigrams(text):
+                self._trigrams.setdefault(trigram, []).append(row)
+
+        self._last_query = ""
+        self._last_rows: Optional[list[int]] = None
+        self._last_rank_query = ""
+        self._last_rank_rows: Optional[set[int]] = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def keys(self) -> list[Hashable]:
+        return list(self._keys)
+
+    def search(self, query: str) -> list[Hashable]:
+        """Keys whose name contains ``query``, in insertion order."""
+
+        query = query.lower()
+        if not query:
+            self._last_query, self._last_rows = "", None
+            return self.keys()
+
+        rows = None
+        if self._last_rows is not None and self._last_query in query:
+            rows = self._last_rows
+
+        if len(query) >= TRIGRAM:
+            postings = [self._trigrams.get(t, []) for t in trigrams(query)]
+            rarest = min(postings, key=len)
+            if rows is None or len(rarest) < len(rows):
+                rows = rarest
+
+        if rows is None:
+            rows = range(len(self._names))
+
+        names = self._names
+        matches = [row for row in rows if query in names[row]]
+
+        self._last_query, self._last_rows = query, matches
+        return [self._keys[row] for row in matches]
+
+    def rank(self, query: str) -> list[tuple[Hashable, float]]:
+        """(key, score) of every match, best first.
+
+        Name substrings score highest, then tag substrings, then fuzzy
+        matches (a subsequence of the name and tags with a few characters
+        missing, e.g. typos, that shares a trigram with the query) by how
+        compact the match is and how many of the query's trigrams the asset
+        shares. Every word of the query has to match, the score is their
+        mean.
+        """
+
+        query = query.lower()
+        terms = query.split()
+        if not terms:
+            self._last_rank_query, self._last_rank_rows = "", None
+            return [(key, 0.0) for key in self._keys]
+
+        refine = None
+        if self._last_rank_rows is not None and query.startswith(
+            self._last_rank_query
+        ):
+            refine = self._last_rank_rows
+
+        scores, exact = self._term_scores(terms[0], None, refine)
+        for term in terms[1:]:
+            term_scores, term_exact = self._term_scores(term, set(scores), refine)
+            scores = {
+                row: score + term_scores[row]
+                for row, score in scores.items()
+                if row in term_scores
+            }
+            exact &= term_exact
+
+        # only substring matches are kept matching as the query grows
+        self._last_rank_query, self._last_rank_rows = query, exact
+        ranked = sorted(scores, key=lambda row: (-scores[row], row))
+        return [(self._keys[row], scores[row] / len(terms)) for row in ranked]
+
+    def _term_scores(
+        self, term: str, rows: Optional[set[int]], refine: Optional[set[int]]
+    ) -> tuple[dict[int, float], set[int]]:
+        """Scores of ``term`` among ``rows``, or every asset if None, and the
+        rows it matched as a substring. Substrings are only looked for among
+        ``refine`` if given."""
+
+        postings = [self._trigrams.get(t, []) for t in trigrams(term)]
+        # a substring match contains every trigram of the term
+        candidates: Iterable[int] = range(len(self._texts))
+        if postings:
+            candidates = min(postings, key=len)
+        # every candidate is checked, the smallest superset will do
+        for subset in (rows, refine):
+            if subset is not None and len(subset) < len(candidates):
+                candidates = subset
+
+        scores: dict[int, float] = {}
+        names, texts = self._names, self._texts
+        for row in candidates:
+            text = texts[row]
+            if term not in text:
+                continue
+            name = names[row]
+            if term in name:
+                scores[row] = NAME_MATCH + len(term) / len(name)
+            else:
+                scores[row] = TAG_MATCH + len(term) / len(text)
+
+        exact = set(scores)
+        if len(term) >= MIN_FUZZY_LENGTH:
+            scores.update(self._fuzzy_scores(term, postings, scores, rows))
+
+        return scores, exact
+
+    def _fuzzy_scores(
+        self,
+        query: str,
+        postings: list[list[int]],
+        exact: dict[int, float],
+        rows: Optional[set[int]],
+    ) -> dict[int, float]:
+        max_misses = int(len(query) * TYPO_RATE)
+        query_mask = char_mask(query)
+
+        shared: dict[int, int] = {}
+        for posting in postings:
+            for row in posting:
+                shared[row] = shared.get(row, 0) + 1
+
+        scores = {}
+        texts, masks = self._texts, self._masks
+        for row, count in shared.items():
+            if row in exact or (rows is not None and row not in rows):
+                continue
+            if bin(query_mask & ~masks[row]).count("1") > max_misses:
+                continue
+
+            misses, span = fuzzy_match(query, texts[row])
+            if misses > max_misses:
+                continue
+
+            matched = len(query) - misses
+            compactness = matched / span if span else 0.0
+            overlap = count / len(postings)
+            score = 0.5 * compactness * matched / len(query) + 0.5 * overlap
+            if score >= MIN_FUZZY_SCORE:
+                scores[row] = FUZZY_MATCH * score
+
+        return scores
@@ -0,0 +1,160 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import ContextManager, Optional
+
+from .logger import Logger
+
+
+class StartupTrace:
+    """Opt-in wall time per phase of ``render_vault.main()``, from the module
+    imports to the first painted viewport.
+
+    Enabled by setting ``RENDER_VAULT_TRACE_STARTUP`` to 1 or to the path of
+    the JSON report, which is written once the window has been painted. The
+    report also lists which heavy optional modules were imported and in
+    which phase, they are expected to load on first use only.
+    """
+
+    ENV_VAR = "RENDER_VAULT_TRACE_STARTUP"
+    REPORT_PATH = Path(__file__).parent.parent / "logs" / "startup.json"
+    HEAVY_MODULES = ("PIL", "mss", "cv2", "imageio", "numpy")
+
+    _enabled = bool(os.environ.get(ENV_VAR))
+    _origin = time.perf_counter()
+    _phases: list[dict] = []
+    _depth = 0
+    _preloaded = {name for name in HEAVY_MODULES if name in sys.modules}
+    _heavy_modules: dict[str, str] = {}
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    def start(cls) -> None:
+        """Trace from now on, regardless of the environment."""
+
+        cls._enabled = True
+        cls._origin = time.perf_counter()
+        cls._phases = []
+        cls._depth = 0
+        cls._preloaded = {name for name in cls.HEAVY_MODULES if name in sys.modules}
+        cls._heavy_modules = {}
+
+    @classmethod
+    def phase(cls, name: str, detail: str = "") -> ContextManager:
+        if not cls._enabled:
+            return nullcontext()
+        return cls._trace(name, detail)
+
+    @classmethod
+    @contextmanager
+    def _trace(cls, name: str, detail: str):
+        record = {
+            "name": name,
+            "detail": detail,
+            "depth": cls._depth,
+            "start_ms": (time.perf_counter() - cls._origin) * 1000,
+        }
+        cls._phases.append(record)
+        cls._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record["duration_ms"] = (time.perf_counter() - start) * 1000
+            cls._depth -= 1
+            cls._track_modules(name)
+
+    @classmethod
+    def mark(cls, name: str, detail: str = "") -> None:
+        """A point in time, like the first paint of the window."""
+
+        if cls._enabled:
+            with cls._trace(name, detail):
+                pass
+
+    @classmethod
+    def _track_modules(cls, phase: str) -> None:
+        for name in cls.HEAVY_MODULES:
+            if name in cls._preloaded or name in cls._heavy_modules:
+                continue
+            if name in sys.modules:
+                cls._heavy_modules[name] = phase
+
+    @classmethod
+    def report(cls) -> dict:
+        phases = [phase for phase in cls._phases if "duration_ms" in phase]
+        return {
+            "total_ms": (time.perf_counter() - cls._origin) * 1000,
+            "phases": phases,
+            "heavy_modules": dict(cls._heavy_modules),
+            "preloaded_modules": sorted(cls._preloaded),
+        }
+
+    @classmethod
+    def finish(cls, path: Optional[Path] = None) -> Optional[Path]:
+        """Write the report and stop tracing."""
+
+        if not cls._enabled:
+            return None
+
+        cls._track_modules("finish")
+        report = cls.report()
+        cls._enabled = False
+
+        value = os.environ.get(cls.ENV_VAR, "")
+        if path is None:
+            path = Path(value) if value not in ("", "1") else cls.REPORT_PATH
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(report, file, indent=4)
+        except OSError as e:
+            Logger.exception(e)
+            return None
+
+        Logger.info(cls.format_report(report))
+        Logger.info(f"wrote startup trace to {path}")
+        return path
+
+    @staticmethod
+    def format_report(report: dict) -> str:
+        lines = [f"startup took {report['total_ms']:.0f}ms"]
+        for phase in report["phases"]:
+            label = "  " * phase["depth"] + phase["name"]
+            if phase["detail"]:
+                label += f" ({phase['detail']})"
+            lines.append(f"  {label:<40}{phase['duration_ms']:>8.1f}ms")
+        for name, phase in report["heavy_modules"].items():
+            lines.append(f"  {name} imported during {phase}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def check_budget(report: dict, budget: dict) -> list[str]:
+        """Phases slower than their budget in ms, and heavy modules imported
+        during startup that the budget doesn't allow."""
+
+        totals = {"total": report["total_ms"]}
+        for phase in report["phases"]:
+            name = phase["name"]
+            totals[name] = totals.get(name, 0.0) + phase["duration_ms"]
+
+        errors = [
+            f"{name} took {totals[name]:.0f}ms, budget is {limit}ms"
+            for name, limit in budget.get("phases_ms", {}).items()
+            if totals.get(name, 0.0) > limit
+        ]
+
+        allowed = budget.get("allowed_modules", [])
+        errors += [
+            f"{name} was imported during {phase}"
+            for name, phase in report["heavy_modules"].items()
+            if name not in allowed
+        ]
+        return errors
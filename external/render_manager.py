@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import ast
 import json
+import os
 import sys
+from multiprocessing.connection import Listener
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Optional
 
 import maya.standalone
 from maya import cmds
@@ -14,30 +16,132 @@ from render_vault.external.renderer import Arnold, VRay
 
 
 class RenderManager:
+    """Renders material thumbnails in mayapy.
+
+    Runs a single render with the arguments of the command line, or with
+    ``--daemon`` keeps the maya session alive and renders the jobs sent by
+    the RenderDaemon of the ui, see ``serve``.
+    """
+
+    # the RenderDaemon passes the key of the job connection in the environment
+    AUTHKEY_ENV = "RENDER_VAULT_DAEMON_KEY"
+
     renderer = None
-    logging_path = sys.argv[1]
-    material_pool_path = sys.argv[2]
-    single_mode = ast.literal_eval(sys.argv[3])
-
-    user_render_settings = json.loads(sys.argv[4])
-    render_type = Renderer(user_render_settings["material_renderer"])
-    render_scene = user_render_settings["render_scene"]
-    render_cam = user_render_settings["render_cam"]
-    render_object = user_render_settings["render_object"]
-    render_res_x = user_render_settings["render_resolution_x"]
-    render_res_y = user_render_settings["render_resolution_y"]
+    logging_path = ""
+    material_pool_path = ""
+    single_mode = False
+
+    user_render_settings: dict = {}
+    render_type = None
+    render_scene = ""
+    render_cam = ""
+    render_object = ""
+    render_res_x = 0
+    render_res_y = 0
+    materials_file: Optional[str] = None
+    render_threads = 0
+
+    @classmethod
+    def configure(cls, material_pool_path: str, single_mode: bool, settings: dict):
+        cls.renderer = None
+        cls.material_pool_path = material_pool_path
+        cls.single_mode = single_mode
+
+        cls.user_render_settings = settings
+        cls.render_type = Renderer(settings["material_renderer"])
+        cls.render_scene = settings["render_scene"]
+        cls.render_cam = settings["render_cam"]
+        cls.render_object = settings["render_object"]
+        cls.render_res_x = settings["render_resolution_x"]
+        cls.render_res_y = settings["render_resolution_y"]
+        cls.materials_file = settings.get("materials_file")
+        cls.render_threads = settings.get("render_threads", 0)
 
     @classmethod
     def run(cls):
+        cls.logging_path = sys.argv[1]
+        cls.configure(
+            sys.argv[2], ast.literal_eval(sys.argv[3]), json.loads(sys.argv[4])
+        )
         cls.init_logger()
         cls.init_maya_standalone()
+        cls.render()
+        cls.uninit_maya_standalone()
+
+    @classmethod
+    def render(cls):
         cls.set_renderer()
         cls.load_render_scene()
 
         if cls.renderer:
             cls.renderer.render(cls.get_renderable_materials())
+
+    @classmethod
+    def serve(cls):
+        """Daemon mode, renders jobs until the ui disconnects, asks to quit
+        or ``max_jobs`` were rendered.
+
+        The port of the job connection is written to the port file once the
+        maya session is initialised. Every job is a dict with ``pool_path``,
+        ``single_mode`` and ``settings``, like the command line arguments,
+        and is answered with ``{"ok": bool, "restart": bool}``. The scene is
+        reset after every job, ``restart`` tells the ui that this process
+        exits and the next job needs a new one.
+        """
+
+        cls.logging_path = sys.argv[2]
+        port_file = Path(sys.argv[3])
+        max_jobs = int(sys.argv[4])
+        authkey = bytes.fromhex(os.environ[cls.AUTHKEY_ENV])
+
+        cls.init_logger()
+        cls.init_maya_standalone()
+
+        with Listener(("127.0.0.1", 0), authkey=authkey) as listener:
+            tmp_file = port_file.with_suffix(".tmp")
+            tmp_file.write_text(str(listener.address[1]), encoding="utf-8")
+            tmp_file.replace(port_file)
+            Logger.info(f"render daemon listening on {listener.address}")
+
+            with listener.accept() as conn:
+                jobs = 0
+                while True:
+                    try:
+                        job = conn.recv()
+                    except EOFError:
+                        break
+                    if job.get("command") == "quit":
+                        break
+
+                    ok = cls.render_job(job)
+                    jobs += 1
+                    restart = bool(max_jobs) and jobs >= max_jobs
+                    conn.send({"ok": ok, "restart": restart})
+                    if restart:
+                        Logger.info(f"render daemon restarts after {jobs} jobs")
+                        break
+
         cls.uninit_maya_standalone()
 
+    @classmethod
+    def render_job(cls, job: dict) -> bool:
+        try:
+            cls.configure(job["pool_path"], job["single_mode"], job["settings"])
+            cls.render()
+            return True
+        except Exception as e:
+            Logger.exception(e)
+            return False
+        finally:
+            cls.reset_scene()
+
+    @staticmethod
+    def reset_scene():
+        try:
+            cmds.file(new=True, force=True)
+        except Exception as e:
+            Logger.exception(e)
+
     @staticmethod
     def init_maya_standalone():
         Logger.info("initializing maya standalone...")
@@ -56,6 +160,7 @@ class RenderManager:
             (cls.render_res_x, cls.render_res_y),
             cls.material_pool_path,
             cls.single_mode,
+            cls.render_threads,
         )
 
         if cls.render_type == Renderer.VRAY:
@@ -95,6 +200,11 @@ class RenderManager:
             material_path = Path(cls.material_pool_path) / "MaterialPool" / "Materials"
             items = material_path.glob("*.m[ab]")
 
+            # only the materials with outdated thumbnails, if the ui sent a list
+            if cls.materials_file:
+                with open(cls.materials_file, "r", encoding="utf-8") as file:
+                    items = json.load(file)["materials"]
+
             for mtl in items:
                 cls.import_material(mtl)
 
@@ -105,4 +215,7 @@ class RenderManager:
 
 
 if __name__ == "__main__":
-    RenderManager.run()
+    if sys.argv[1] == "--daemon":
+        RenderManager.serve()
+    else:
+        RenderManager.run()
@@ -16,12 +16,15 @@ class Renderer(ABC):
         render_res: tuple[int, int],
         path: str,
         single_mode: bool,
+        threads: int = 0,
     ):
         self.render_cam = render_cam
         self.render_res_x, self.render_res_y = render_res
         self.render_geo = render_geo
         self.pool_path = path
         self.single_mode = single_mode
+        # render threads of this process, 0 uses all cores
+        self.threads = threads
 
     @abstractmethod
     def set_render_settings(self): ...
@@ -50,17 +53,23 @@ class Arnold(Renderer):
         render_res: tuple[int, int],
         path: str,
         single_mode: bool,
+        threads: int = 0,
     ):
         self.render_cam = render_cam
         self.render_res_x, self.render_res_y = render_res
         self.render_geo = render_geo
         self.pool_path = path
         self.single_mode = single_mode
+        # render threads of this process, 0 uses all cores
+        self.threads = threads
 
     def set_render_settings(self):
         # rendersettin
         cmds.setAttr("defaultResolution.aspectLock", 0)
         cmds.setAttr("defaultArnoldDriver.ai_translator", "jpeg", type="string")
+        if self.threads:
+            cmds.setAttr("defaultArnoldRenderOptions.threads_autodetect", 0)
+            cmds.setAttr("defaultArnoldRenderOptions.threads", self.threads)
         Logger.info("set arnold render settings")
         pass
 
@@ -132,12 +141,15 @@ class VRay(Renderer):
         render_res: tuple[int, int],
         path: str,
         single_mode: bool,
+        threads: int = 0,
     ):
         self.render_cam = render_cam
         self.render_geo = render_geo
         self.render_res_x, self.render_res_y = render_res
         self.pool_path = path
         self.single_mode = single_mode
+        # render threads of this process, 0 uses all cores
+        self.threads = threads
 
     def set_render_settings(self):
         cmds.setAttr("vraySettings.imageFormatStr", "jpg", type="string")
@@ -150,6 +162,8 @@ class VRay(Renderer):
         cmds.setAttr("vraySettings.sys_regsgen_xc", 32)
         cmds.setAttr("vraySettings.dmcThreshold", 0.01)
         cmds.setAttr("vraySettings.productionEngine", 0)
+        if self.threads:
+            cmds.setAttr("vraySettings.sys_max_threads", self.threads)
         mel.eval("vray vfbControl -testresolutionenabled 0")
         Logger.info("set v-ray render settings")
 
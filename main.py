@@ -1,7 +1,12 @@
-from . import resources  # noqa: F401
-from .ui import MainWindow
+from .core import StartupTrace
+
+with StartupTrace.phase("imports"):
+    from .resources import register_resources
+    from .ui import MainWindow
 
 
 def main():
     global view
+    with StartupTrace.phase("register_resources"):
+        register_resources()
     view = MainWindow.show_window()
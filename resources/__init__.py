@@ -1 +1,29 @@
-from .resources import qt_resource_data
+from pathlib import Path
+
+from ..core import Logger
+from .build_rcc import RCC_PATH, build_rcc
+
+_registered = False
+
+
+def register_resources(rcc_path: Path = RCC_PATH) -> bool:
+    """Register the ``:icons/`` resources with Qt, Qt maps the rcc file
+    instead of keeping a copy of every icon in the Python heap. Only the
+    first call registers, the file is compiled again if it's missing."""
+
+    global _registered
+    if _registered:
+        return True
+
+    from Qt.QtCore import QResource
+
+    try:
+        if not rcc_path.exists():
+            build_rcc(rcc_path=rcc_path)
+    except OSError as e:
+        Logger.exception(e)
+
+    _registered = QResource.registerResource(str(rcc_path))
+    if not _registered:
+        Logger.error(f"Failed to register icon resources: {rcc_path}")
+    return _registered
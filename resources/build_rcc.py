@@ -0,0 +1,118 @@
+"""Compiles resources.qrc into the binary resources.rcc registered at startup.
+
+Writes the same format as ``rcc --binary`` without needing the Qt tools,
+run it again after changing an icon:
+
+    mayapy -m render_vault.resources.build_rcc
+"""
+
+import struct
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Optional
+
+RESOURCE_DIR = Path(__file__).parent
+QRC_PATH = RESOURCE_DIR / "resources.qrc"
+RCC_PATH = RESOURCE_DIR / "resources.rcc"
+
+# version 2 has a modification time per node, version 3 only adds global flags
+RCC_VERSION = 2
+HEADER = struct.Struct(">4sIIII")
+
+DIRECTORY = 0x02
+LANGUAGE_C = 1
+
+
+def qt_hash(name: str) -> int:
+    """The hash QResource binary searches the children of a directory by."""
+
+    encoded = name.encode("utf-16-be")
+    h = 0
+    for unit in struct.unpack(f">{len(encoded) // 2}H", encoded):
+        h = (h << 4) + unit
+        h ^= (h & 0xF0000000) >> 23
+        h &= 0x0FFFFFFF
+    return h
+
+
+class Node:
+    def __init__(self, name: str, source: Optional[Path] = None):
+        self.name = name
+        self.source = source
+        self.children: dict[str, "Node"] = {}
+
+    def child(self, name: str) -> "Node":
+        return self.children.setdefault(name, Node(name))
+
+    def sorted_children(self) -> list["Node"]:
+        return sorted(self.children.values(), key=lambda node: qt_hash(node.name))
+
+
+def read_qrc(qrc_path: Path) -> Node:
+    root = Node("")
+    for resource in ET.parse(qrc_path).getroot().iter("qresource"):
+        prefix = resource.get("prefix", "/").strip("/")
+        for file in resource.iter("file"):
+            source = file.text.strip()
+            alias = file.get("alias") or source
+            parts = [part for part in f"{prefix}/{alias}".split("/") if part]
+
+            node = root
+            for part in parts[:-1]:
+                node = node.child(part)
+            node.children[parts[-1]] = Node(parts[-1], qrc_path.parent / source)
+
+    return root
+
+
+def compile_rcc(root: Node) -> bytes:
+    # breadth first, the children of every directory are stored consecutively
+    nodes = [root]
+    first_child = {}
+    for node in nodes:
+        if node.source is None:
+            first_child[id(node)] = len(nodes)
+            nodes.extend(node.sorted_children())
+
+    data, data_offsets = bytearray(), {}
+    names, name_offsets = bytearray(), {}
+    for node in nodes[1:]:
+        if node.name not in name_offsets:
+            name_offsets[node.name] = len(names)
+            encoded = node.name.encode("utf-16-be")
+            names += struct.pack(">HI", len(encoded) // 2, qt_hash(node.name))
+            names += encoded
+
+        if node.source is not None:
+            content = node.source.read_bytes()
+            data_offsets[id(node)] = len(data)
+            data += struct.pack(">I", len(content)) + content
+
+    tree = bytearray()
+    for node in nodes:
+        name_offset = name_offsets.get(node.name, 0) if node is not root else 0
+        if node.source is None:
+            count, child = len(node.children), first_child[id(node)]
+            tree += struct.pack(">IHII", name_offset, DIRECTORY, count, child)
+        else:
+            tree += struct.pack(
+                ">IHHHI", name_offset, 0, 0, LANGUAGE_C, data_offsets[id(node)]
+            )
+        # no modification times, so the output only changes with the icons
+        tree += struct.pack(">Q", 0)
+
+    data_offset = HEADER.size
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = HEADER.pack(b"qres", RCC_VERSION, tree_offset, data_offset, names_offset)
+    return header + data + names + tree
+
+
+def build_rcc(qrc_path: Path = QRC_PATH, rcc_path: Path = RCC_PATH) -> Path:
+    rcc_path.write_bytes(compile_rcc(read_qrc(qrc_path)))
+    return rcc_path
+
+
+if __name__ == "__main__":
+    path = build_rcc()
+    print(f"Wrote {path} ({path.stat().st_size / 1000:.0f}KB)")
@@ -1,6989 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 5.15.2
-# WARNING! All changes made in this file will be lost!
-
-from Qt import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x0f\xd0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:09:03+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:09:03+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:2d610\
-1a3-a5bd-a147-b9\
-79-67b75904b512\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:2d610\
-1a3-a5bd-a147-b9\
-79-67b75904b512\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:2d6101a3-a5bd\
--a147-b979-67b75\
-904b512\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:2d6\
-101a3-a5bd-a147-\
-b979-67b75904b51\
-2\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\x9f\x0b\xde\xb7\x00\
-\x00\x0a\x88IDATx\xda\xed\xdd\xbdo]E\x1a\
-\xc7q\xe7\x05V\x0a\x09ZX\xd1\x90\x82\x8a4t\xa4\
-J\xc9\x8a\x862\xb2\x90\xd3n\xc3\xbf@\x9b\x12)[\
-\xd8\xd16td\x8b]L\xe5\xad)HG\xb5\x96\xb5\
-\x82-\x22\xcb2\x96\xb2\x05\x05E$\x13\x94\x17\xce\xce\
-\xd9\xcc]m\xb2\xd8\x5c\xfb\x9es\xcf<3\x9fG\xfa\
-6\x91A\xbe\xcf\x99\xef\xf5\x9c\x99\xdf9\xb3\xd2u\xdd\
-\x0a\x80\x98h\x02@`\x00\x04\x06@`\x80\xc0\x00\x08\
-\x0c\x80\xc0\x00\x08\x0c\x10\x18\x00\x81\x01\x10\x18 0\x00\
-\x02\x03 0\x00\x02\x03\x04\x06@`\x00\x04\x06@`\
-\x80\xc0(\x90\xf3\x89\xb5\xc4\xe7\x89\xdd\xc4\xe3\xccn\xfe\
-\xb7\xb5\xfc3zE`\x14\xc4\xd9\xc4\x1f\x12\xfb\xdd\xaf\
-\xd7~\xfe\xd9\xb3\xfaF`L\xcf{\x89\xed\xee\xe4\xf5\
-m\xe2\x03\xfd#0\xa6\xe1\xed\xc4\x17\xdd\xe2\xf5e\xe2\
-\x1d\xfd$0\x96\xc3k\x89O\x12?u\xc3\xd5\xa3\xc4\
-\xa7\x897\xf4\x97\xc0\x18\x87\x97\x12\x1f%\xbe\xef\xc6\xab\
-\x1f\x12\x1f'~\xa3\xdf\x04\xc6p\xbc\x9f\xf8\xa6[^\
-\xddK|\xa8\xef\x04\xc6b\xbc\x9b\xf8\xaa\x9b\xae\xbeN\
-\x5cs\x1d\x08\x8c\x93\xf1f\xbe'}\xd2M_?\xe7\
-\xc5\xb2\xb7\x5c\x17\x02\xe3x.\xe4{\xd0\x07]yu\
-\x98\x17\xcf.\xb9N\x04\xc6\xf3\x9c\xc9\xf7\x9c\xfb]\xf9\
-u?/\xa6\x9ds\xdd\x08\x8c\xd3\x071\xa6.A\x10\
-\x02\x0bbt\xf1K\x10\x84\xc0\x82\x18\xc1K\x10\x84\xc0\
-\x82\x18\x15\x94 \x08\x81\x051*(A\x10\x02\x0bb\
-TP\x82 \x04\x16\xc4\x08^\x82 \x04\x0e\xc3+\x89\
-\x9b9\xf4\xa0\xfe?\x08r3\xf7\xc8X!\xb0 F\
-\xd0\x12\x04!\xb0 F\x05%\x08B\xe0I\xb9\x92\xd8\
-*\x5c\x92\xbb\x99\x92k+\xf7\xd2\x98\x22\xb0 \xc6\x11\
-\xdb8\xa5oc\x09\x82\x10X\x10\xe3W\x82\x14\xd1\x7f\
-\x7f\x10\xb8\xda \xc6I\xfe\x82E\x9cA\x80\xc0\xd5\x06\
-1N\xfb0A\x84\x87)\x04A\x08\x5cm\x10c\xa8\
-U\xdc\xd2W\xd1\x05A\x08\x5c\xc5\x1b1\xc6\xdcG\x8d\
-\xb0\x8f\xed\x8d \x046\x80}\x81\x11X\x10\xa3\xfe)\
-dK\xb7\x10\x04\x0e\x8aE\x9c\xb6\x17\xf1\x08\x1c\x14\xdb\
-(mo\xa3\x118(\x82\x0c\xfaG\xe0\xa0\xf8\x0bb\
-\x06C\xe0\x80\xb8\x87\xb3\x86p\x8d\xc0\x82\x18VQ\xad\
-\xe2\x13x\x09\xd8\xc7\xb4\x8f>\xe5>:\x81\x0d _\
-\xa0\xbe@\xdb\x12\xd8\x14\xce-L\xb3\xb70\x82\x18\x16\
-Q,\x22\x06\x0e\x82\x08b\xd8\xc6\xb0\x8d\x178\x08\x22\
-\x88!H\xe0\xfa\x05\xbe~\xbe\xc1\x1b\xff\x067\x83\x8a\
-=\x83r\x0f\xd5\xf8=\x945\x8c\xd8k\x18V1\x1b\
-_\xc5\xb4\x8b\x10{\x17\xa1\xb4_\xe8\xb7\x89\xbf$\x1e\
-\xdbG\xf4B\x85\xc2\xaa\xffc\xf2\xb7\xc4\xef\x08\xfc\xcb\
-\xfc\xb1\xf0\xbf\xb8\xce\xf6\x19\x9f\x08gK=\xc9c\x95\
-\xc0\x99\xf3\x89\x9d\x82/\xd8\xd3\xc4g\x89\xcb\x04[\x1a\
-\x97s\xcf\x9f\x16<.v\xf2\xd8m^\xe0\x92\xe5\xbd\
-\x9b\xb8J\xa8\xc9\xb8\xda\x95}4\xccN\xeb\x02\xdf*\
-x\x1b\xe1:\x81\x8a\xe1z\xbe&%\xd6\xadV\x05\xbe\
-X\xe0b\x95 \x86 \xc8I\xab\x1f\xc3\xaf\xb6(\xf0\
-\xed\x82.\x82 \x86 \xc8\x22\xb5\xde\xa2\xc0\x07\x854\
-\x7f\xabs\xbceDJ:\xde\xf5\xa0E\x81\xa7\x9e>\
-o\xe7\x10\x01\x19\x04A\x86\x98F7'\xf0T\xf5/\
-A\x8cj\x83 \xdfM8\xae\x08L`\x10\x98\xc0\xa6\
-\xd0\xa6\xd0\x04n@`\x8bX\x16\xb1\x08\x5c\x81\xc0\xb6\
-\x91l#\x118\xb8\xc0\x82\x1c\x82\x1c\x04\xae@\xe0Y\
-\x89R\x8aR\x128\xb0\xc0\xb3\xf20\x83\x87\x19\x08\x1c\
-X\xe0\xbe<N\xe8qB\x02\x07\x16xV\x1e\xe8\xf7\
-@?\x81\x03\x0b<+\xaf\xd4i\xf3\x95:\x04\xaeD\
-\xe0Yy\xa9]\x1b/\xb5#p\xa5\x02\xcf\xcake\
-\xeb}\xad,\x81\x1b\x10\xb8/A\x90\xba^\xecN\xe0\
-\xc6\x04\x9e\x95 H\xdc \x06\x81\x09\xfc\xdfr\xb8\xd9\
-\xf3\x94~4\x0e\x81\x09\xfc\x8b\xe5x\xd1\xf2\x8f\xc6!\
-0\x81\x8f-\x07|\x13\x98\xc0sT\xe9\xfb\x88\x87y\
-\xf1\xe6R\xc5\xe2^\xc8k\x00\x0f\x0a\xbe\x0e\xb3}|\
-\x02\x17&p\xb4\x01TS\x10\xe4L\xc0/P\x02\x17\
-(p\xa4)\x5c-A\x90\xa8\xa7\x0b\x12\xb8`\x81#\
--\xa2D\x0d\x82D?\xdf\x97\xc0\x01\x04\x8e\xb2\x8d\x11\
-)\x08\x12!\x881\xcf6\x1e\x81\x03\x09\x1c%HP\
-r\x10\xa4\xb6\xfe\x118\x98\xc0\xb5\xfd\x05\x11\xc4Xl\
-\x06C\xe0\xa0\x02\xd7r\x0f'\x88\xb1\xd8\x1a\x02\x81\x83\
-\x0b\x1c}\x15\xb5\xf5 \xc6\xa2\xab\xf8\x04\xaeD\xe0\xa8\
-\xfb\x98\xad\x071\xceU4\xfe\x08l\x00\xfb\x02#0\
-\x81[\x0c\x82\xb4z\x0bA\xe0\x06\x1aX\xf3\x22N\xeb\
-\x8bx\x04n\xa8\x815m\xa3\xd8F#p\x93\x0d\x8c\
-\x1ed\x10d!\xb0\x06\x06\xfd\x0b&JJ`\x0d\x0c\
-x\x0f\xf9\x8f\xc4\xdf+\xbd\x87'0\x81\xbd\xd7\xb8\x82\
-Ut\x02k\xa0\x93\x05\x96X\xa5\xbc\xd0\x80\xc0\x1aX\
-\xd5\xd9>cWigK\x11X\x03\xab:]o\xac\
-*\xf5tG\x02k`U\xe7\xdb\x8eQ%\x9f\xafL\
-`\x0d\x9c\x9b\x08'\xcc\x0fY\xf7\xf2g.\xf9\x9a\x10\
-X\x03\x1d-\xf2BE:Z\x86\xc0\x1a\xe8p\xaf\x5c\
-\x11\x0fw#\xb0\x06.\xc4\x95\xc4V\x05\xf2n\xe5\xcf\
-\x12\xad\xff\x04\xd6\xc0\xa6\x83 \xdb\xf9w\x8f\xdaw\x02\
-k`\x93A\x90ZN\x96 \xb0\x066\xf5J\x9b\xda\
-\xcev\xfaq\xe0\xde\x10\x98\xc0E\x06AJ\x0db,\
-\xca\xde\x80=\xda#0\x81K\x0c\x82\x94\x1c\xc4X\x94\
-\xcd\x01\xfb\xb4I`\x02\x97\xf4F\x90\xd2^,?\x06\
-7\x06\xec\xd7\x1a\x81\x09\x5cB\x10$R\x10cQ^\
-\x1eh\x1a\xbd?e\xbf\x08\x1c\x8f\xd7\x13\xeb#\xf4o\
-=\xff\xbfW\x1abu\x80\xbe\xadN\xf9\x19\x08l\x1b\
-\xa4\xd5\xfe\xcd\xd8X\xa0g\x1bS\xff\xfe\x06 \x81[\
-\x17\xf8\xec)%\xde\xc8\xff-\x81\x0d@\xfd+d:\
-}0G\x9f\x0e\xa6\x9e6\x13\x98\xc0\xfaw\xf4\xc2V\
-\xbf:\xfdyb7\xf18\xb3\x9b\xff\xedF\xfe\x99\x15\
-\x02\x1b\x80\xfa\x07\x02\x13X\xff\x08l\x00\x12\x98\x0c\x04\
-6\x00\xf5\x0f\x046\x00\xf5\x0f\x04&\xb0\xfe\x11\xd8\x00\
-$0\x08l\x00\xea\x1f\x08l\x00\xea\x1f\x08L`\xfd\
-#\xb0\x01H`\xd1G\x02\x13X\xffNI\xc8\x87\x0f\
-\x08L\xe0\xd6\xfb\x17\xfa\xf1?\x02\x13\xb8\xe5\xfe\xf5\x02\
-\xdeY\xe03n\x10\xd8\x00$pLyg\xb5J`\
-\x03\x90\xc0\xcb\x97\xf7\xb3\x81>\xe7\xa4/\xa1#0\x81\
-[\xeb\xdf\x90\xf2\xcej\x8d\xc0\x06 \x81\xe3L\x9b_\
-\xacM\x02\x1b\x80\x04\x8e)o_{\x046\x00\x09\x1c\
-k\xda\xfc\xbf\xf5\x90\xc0\x06 \x81c\xca\xdb\xd7!\x81\
-\x0d@\x02\xc7\x9a6\x9bB\x1b\x80\x04\xae@^\x8bX\
-\x06 \x81\x03N\x9bm#\x19\x80\x04\xae@^A\x0e\
-\x03\x90\xc0\x01\xa7\xcd\xb3\x12\xa54\x00\x09\x1cT^\x0f\
-3\x18\x80\x04\x0e*\xef\x9d\xce\xe3\x84\x06 \x81\xc3\xdd\
-\xf3\xf6\xf5\xd7\xc4\xb9\x1a\xc7AM\x03p\xbdk\xeb\x84\
-\xf9\x88\x02\x93\x97\xc0\xc7\xd6\x0f\x89\x8fkZe\xacH\
-`\xf2\x12x\xee\xba\x97\xf8\x90\xc0\xc5\x08L^\x02\x9f\
-\xaa\xbeN\x5c#\xf0\xa4\x02\x93\x97\xc0\x0b\xd5\xcf\x89/\
-\x12o\x11x\xe9\x02\x93\x97\xc0\x83U\xff\x04\xca'\x89\
-K\x04^\x8a\xc0\xe4\xad\x5c\xe0\x1f\xbbi\xea~\xe2\xa3\
-\x0a.t\xc9\x02\x93\xb7\x01\x81\xf7\xbaik;\xf1\x1e\
-\x81\x07\x17\x98\xbc\x8d\x08\xbc\xd9\x95Q[\x89+\x04&\
-/\x81O\xc6\x8d\xae\x9cz\x94\xf84\xf1\x06\x81\xc9K\
-\xe0\xf9x\xb9\x80i\xf4\x8b\x15)\x08R\x92\xc0\xe4m\
-P\xe0\x9e\xd5\xae\xcc\xea\x83 \xd7\x09<\xb7\xbc\x7f\xee\
-\xd4\xbc5\xe8\xe9\x89%\x0c\xc4\x8d\x82\x9b}7q\x95\
-\xc0\xc7\xca\xfb\x15'\x17\xaa\x85NO,\xe5Ef%\
-K\xfc4O\x0f/\x13\xf89\xce'\xfe\xc9\xbf\xc1\xea\
-T\xa7'\x964 \xfb\xec\xf2\xfd\x82\x1b\xdc\x07An\
-&^!\xf0\x7f\xd8\xe1\xdc(\x12\x87\x15\xb8\xe7B^\
-DzPp\x93K\x09\x82L)\xf0-\xae\x8dV\xab\
-\x91\x05\x9e\xf1f\xf7l[\xe7I\xc1\x8d\xfe6\xf1A\
-\x83\x02_\xcc\x0b1j\x9c:\xd1K\xf7J_&\x7f\
-7\xc0\x22\xc9\x97\x89w\x1a\x12\xf86\xc7F\xaf\xb5Z\
-\x04\x9e\xf1~\xe2\x9b\x82\x1b>E\x10d*\x81\x0f\xf8\
-5zm\xd6&p\xcfK\xf9\xde\xf3\xfb\x82\x1b\xbf\xcc\
- \xc8T\x02\x9b>\x8f_{5\x0a<\xe3\xb5\xee\xd9\
-c\x81?\x15|\x01\x96\xf1F\x90\xa9\x04V\xe3\xd7\xc3\
-\x9a\x05\x9e\xf1v\xf7\xecA\xfd\x92k\xcc7\x82\x10\xb8\
-\xde:lA\xe0\x19\xfd#\x81\xdb\x05_\x8c\xb1\xde\x08\
-b\x0am\x0a]\x85\xc0=g\xf2\x94u\xbf\xf0o\xd5\
-!\xdf\x08b\x11\xcb\x22V5\x02\xb7\x18\x04\x99J`\
-\xdbH\xe3\xd7Z\xab\x02\xb7\x14\x04\x99J`A\x8eq\
-\xab\xaa \x87 \x88(ekUE\x94R\x10\xc4\xc3\
-\x0c-V\xf8\x87\x19\x04A\xe6\x0f\x82L-\xb0\xc7\x09\
-\x87\x97\xf7,\x81\xdb\x09\x82L-\xb0\x07\xfa\x87\xa9\xf0\
-\x0f\xf4\x0b\x82\x1c]\xc7\x05AJ\x10\xd8+uN^\
-\xd5\xbdRG\x10\xe4\xf8:*\x08R\x8a\xc0S\xbe\xd4\
-\xee|\xeb\xe3\x97\xc0q\x83 %\x09Lb\x02\x0b\x82\
-\xccY\xb3 Hi\x02\x93\x98\xc0\x82 \x13\xd6\x0a\x89\
-\x09,\x08B`\x12\x13X\x10$\xb8\xc0$&\xb0 \
-Hp\x81IL`A\x90\xe0\x02\x93\x98\xc0\x82 \xc1\
-\x05&1\x81\x05A\x82\x0bLb\x02\x0b\x82\x04\x17\x98\
-\xc4\x04.\x9e\xfe\xdc\xa4\xfe\xfc\xa4C\x02\x93\x98\xc0q\
-\xb9\x9c\x07\xe9S\x02\x1f)\xf1\x9d%\x7f\xbe;\xdd)\
-\x1e\xd7#p\xdb\xf4g\x0b\xdf%p1\x12o\x10\x18\
-\xa7\xe1z\xf7\xec\x19_\x02O/\xf1*\x81Qc\x10\
-d\xca\x03\xde\x97yO|\xa2\x97\xc6\x11\x18Q\x82 \
-+\x0dI\xbcF`,\xca\x95\xc4\x16\x81'\x99No\
-\x12\x18\xb5\x05AV\x1a\x92x\x8f\xc0\xa8-\x08\xb2R\
-\x90\xc4cO\xa7\x1f\x12\x18\xb5\xbd\x11d\xa5!\x89\x0f\
-\x09\x8c\x9a\x82 \x8f\x0b\xec\xc1\x98\xd3iShT\x15\
-\x049(\xf4\xf3\x8f%\xb1E,T\xf5F\x90\xf5\x82\
-?\xfb\x18\xd3i\xdbH\xa8&\x08\xd2O\x9f_-\xfc\
-\xb3\x0f)\xb1 \x07&\xe5\xf5\xfc\x17\xf3\xd1@\x03\xfa\
-V\x90\xcf=\xd4tZ\x94\x12\xd5\x04Av\x82}\xe6\
-E%\xf60\x03\x8a\xe3\xf7\xa7\x9cV\xf7\xf2F|F\
-\xf6l\x16\xf14\xf2z\x9c\x10\xc5\x0e\xea?u\xf3\xbd\
-\x88\xfeI\xa0i\xf3q\xac\xe6\xd5\xf3yV\xd8Wk\
-\xbd\xf6\x06\x7f]\x5cL\xdcN|\xf7\xc2=\xf2\xa3\xfc\
-o\xb7\xf3\xcf\xd4\xf2y\xfb\x93\xfd\xfa\x13\xfe\xfa\x93\xfe\
-v\xf3\x82\xdc\xa0\xa7\xff\x11\x18\x00\x81\x01\x10\x18 0\
-\x00\x02\x03 0@`\x00\x04\x06@`\x00\x04\x06\x08\
-\x0c\x80\xc0\x00\x08\x0c\x80\xc0\x00\x81\x01\x10\x18\x00\x81\x01\
-\x02\x03 0\x00\x02\x038\x9e\x7f\x03\x9f\x96l\xe7\x22\
-ZW?\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x17\xba\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:09:02+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:09:02+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:e17a0\
-6d0-eb29-0b4c-bc\
-4b-7a6681c23609\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:e17a0\
-6d0-eb29-0b4c-bc\
-4b-7a6681c23609\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:e17a06d0-eb29\
--0b4c-bc4b-7a668\
-1c23609\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:e17\
-a06d0-eb29-0b4c-\
-bc4b-7a6681c2360\
-9\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>2>\xc0\xf5\x00\
-\x00\x12rIDATx\xda\xed\x9d{\x90\x97\xe5u\
-\xc7\x97].\x1a \x80\x5c\xb4\x9a\xc4\x12/\xa9\x9aD\
-\x0c*FH4\x96IM\x1a\x95\x88\x0a\x8d\xd5\x98X\
-\x89\xb7\xc8E\x0d\x9d45\xa8(\x18\xd2D\xb06\xb1\
-\xdeS/`2c)\x9a\xda\xcc\x98I\x831\xde\x88\
-Z\xc2E\xc5\x05\xd1I\x9b(\xbb(\xb0X\x17\xf8\xf4\
-\x8f\xf7a\xdcPp\x97\xe59\xcf\xfb\x5c\xbeg\xe6\xfb\
-\x0f\xc3\xee\xec{\x9e\xf3\xf9\xfd\x9e\xf7<\xe7\x9c\xa7\x01\
-h\x90$)M\xc9\x09\x92$\x80%I\x12\xc0\x92$\
-\x09`I\x12\xc0\x92$\x09`I\x92\x04\xb0$I\x02\
-X\x92\x04\xb0$I\x02X\x92$\x01,I\x02X\x92\
-$\x01,I\x92\x00\x96$I\x00K\x92\x00\x96$I\
-\x00K\x92$\x80%I\x12\xc0\x92$\x80\xa5\xc0\x1a\x0c\
-\x8c\x04\xc6\x03\xd3\x809\xc0\x1d\xc0B\xe0W\xc0J`\
-5\xd0\xe2\xb4\x91wmc\x87\x7fo\x06V\x00\x8f\xb9\
-\x9f\xbd\xc3\xfd\xaei\xc0\xe9\xc0'\x80}\xe4o\x01,\
-uO\xc3\x80\xb1\x0e\xa8;\x81%\xc0[\x84\xb77\x81\
-g\xdc\xdf0\xcd\xfdM\xc3\xb4>\x02XzWM\xc0\
-\x11\xc0$\xe0G\xee\xdb1v\xfb\x1d\xb0\x08\x98\x0e\x8c\
-\x01zk\x1d\x05pI:\x14\x98\x0c\xfc\xfb\x0e\xdb\xdc\
-Tm\x03\xf00p)p\xb0\xd6W\x00\xe7\xf8-\xfb\
-\x19\xe0\x1f\x81U\xe4o/\x01\xf3\x80\x13\x80F\xad\xbf\
-\x00NQ\x8dn{9\xd7m9K\xb5\xd7\xdd\xab\xc1\
-X\xc1,\x80S\xd0\x87\x80\x19\xc0Zd;\xda+\xc0\
-\xb7\x81\x0f(N\x04pL\xea\x09|\xd1\xbd\x07n\x15\
-\xa7\x9d\xda\x16\xe0!`\x9c{\xbdP\x0c\x09\xe0Z\xd4\
-\xcfe\x8f_\x10\x93\xdd\xb6\xd5.\x9b=P\xf1$\x80\
-C\xe9\x00\xe0\x06\xa0U\xfcy\xb3V`6\xf0'\x8a\
-/\x01l\xa5\xa1.\xc8\xda\xc4\x9b\x99\xfd/p\x8b@\
-\x16\xc0\xbeK\x18gPO5T\xa9\xb6\xc9e\xf0\xf7\
-U\xfc\x09\xe0\xee\xaa\x0f\xf0\x0d\xaa\x92BY=\xb6\x1e\
-\xb8\x02U{\x09\xe0\xdd\xd4)\x94Qt\x91\x8a\xbd\x04\
-\x9c\xa9\xb8\x14\xc0\x9d\xe9#\xc0\xa3\xe2%Z\xfb\x0f\xe0\
-\x10\xc5\xa9\x00\xde\xd9Y\xeet`\xb3\x18\x89\xde6\xbb\
-\x9c\x84\xb6\xd5\x02\x98\x06`\x04U\xdb\x9c,-{\x1e\
-8V\x00\x97\xfb\xf0\xbd\x80\x99T\x95A\xb24\xad\x1d\
-\xb8\xda\xed\xa0\x04pA\x1aN5\x91B\x96\x87=Y\
-\xea\xbbq\x89\xf0\x9eO\xd5\xc3*\xcb\xcb\xde\x02\xce\x13\
-\xc0\xf9jo\xe0\xae\xc4\x83\xb4\x0dXJ5\x11c\x1e\
-\xd5\xa8\x9b\xb3\x81\x93\x81c\xdc\xceb\x90S\xdf\x0e\xcf\
-\xde\xb7\xc3\xbf\x0fw\xff\xf7d\xf7\xb3\xd3\x80\x9b\xdc\xef\
-\xfc-\xe9W\x9a\xdd\x0e\xec%\x80\xf3\xdb2\xff&\xb1\
-@\x5c\xe7\xa0\xba\x1a8\xc3m\x11C\xf4\xd46QM\
-\x0d9\x13\xb8\x86\xaas\xa8%1\xdf=\x03\x1c(\x80\
-\xf3\xd0_\x00o$\x10t\xaf\x03\xf7\x01\x7f\x03\x1c\x0e\
-\xf4\x88\xc8\x87=\xdc\xdft\x01p\x7fB\xfe\x1c+\x80\
-\xd3\xd6E\x91g\x99\xff\xcb}\xc3\x8e\x22\xad\xde\xd8&\
-\xe08\xf7\x0d\xbd4\xf2,\xf5$\x01\x9c\xe6H\x9b9\
-\x91\x06\xd5r\xe0*\xe0\xcf2\xf2\xf7\xe1T\xc5\x15+\
-\x22\xf5\xf9\xec\xc8v4\x02\xb8\x93d\xd5O\x22\x0b\xa0\
-M.\x81v|\x01\xaf,c\x80\xbb#L\x86-\xc8\
-1\xb9\x95[\xf0\xf4\x07\xfe3\xa2\xa0Y\x0dL\x01\x06\
-\x14x\x5c7\xd0e\xb8\xd7D\xb4\x1e?\xa7\x9a\xa4\x22\
-\x80#\xd4 \xe0\x89H\x02\xe5)\xe0,4\xf3i{\
-\x9d\xf9D\xe2)W}\x9c\x8cF\xf8\xe4t\x1d\xc9\xb3\
-\x91$\xa5\xce\xcc\xf5}\xcb\x83\xc6\x02OG\xb0N\xbf\
-\xa1\x9a\xb0\x22\x80#\xd0P`Y\xcd\x01\xb1\x8cj\xca\
-\xa2\xc0\xed\xda\x91\xd4\xe9\x11$\xbc\x96\x02C\x04p\xbd\
-\x1aP\xf3\xd6\xac\x85\xaa\x0dQ\xadm\xdd\xdbZOr\
-\xe7\xb5u\xd9s$~\x13c\xea\x09\xab\xba\xdey\xb7\
-R]\x95\xa2k8\xf7\x5cC\x80\x1f\x02\xdbj|'\
-\xee'\x80\xc3\x1f\x15\xfd\xa2\xc6\xed\xf2\xf1\x02\xcf\xe4\xf8\
-\xa9\xaem\xf5\xa3\xa9\x1e1\xa5Z\xa4Q\xc79\xef\xf6\
-\xde\xd3>\x82\xcdt\x90\xe0L\xe7\xeb\xd06?\xc5\x1c\
-F\x8a\x8b\xfc\xdd\x9a\xcesG\x0b\xb0`:\x96j\x90\
-]h\xbb^\x00\xdb\xd76\x87\xb6\xdbr;\xfcO(\
-\xc7QG\xfb\xe7\x05\x02\xd8\xae\xab(dcB\x1bp\
-\xae@\xaa]_%\xec\xb0\xc1v\xe0\xcf\x05\xb0_\x1d\
-\x18\xf8\xb8a-U\xd3\xbb\x00\x8aCG\x01\xcd\x01\xd7\
-\x7f\x1dU\x0f\xb9\x00\xf6\x94q\x0e\xd9\x8c\xff\x0b\x1d\x0f\
-E{\xdc\xb48`\x1c<\x95Bf:\x85\x85\xbb#\
-\xe0\xa2e\xd9\xb1\x92Y\x96\xfa\x9e\x80\xf1\xf0#\x01\xbc\
-\xe7\x03\xe8B\xd95\xa8\x142\x95R\xcc\xeb\x03\xc6\xc5\
-\xb9\x02\xb8{:\x8807\x02n\xa3j{\x13\x1ci\
-\xe9\x92@\xd5[\x1b\x88xdm\xccu\xb2\xbf\x0e\x04\
-\xef\xd7\x05C\xb2\x9aDU\xd6\x1a\xe2}\xb8\x97\x00\xee\
-\xba\xae\x0d\xb0([\x81/\x0b\x82\xe4u^ \x88g\
-\x08\xe0\xae\xe9\x98\x00\xe7\xbd\xdb\x80\xaf)\xf8\xb3\x1a^\
-h\xbd\x9dn\x07F\x0a\xe0\xce\xb7\xce!\x8e\x8c\xaeT\
-\xd0g\xa7)\x01\xe2\xe6\xf9\xd8\xb6\xd2\xb1-\xc2\xdf\x05\
-\xca6+\xe0\xf3\xd4\xec\x00\xf13]\x00\xef\x5c\x87\x06\
-(\x99\xbb_GE\xd9\x1f1\xfd\x8bq\x0c\xb5\x01\x07\
-\x0b\xe0\xff\xafG\x03TXirF\xfe\xda+@\xc5\
-\xd6#\x02\xf8\x8f\xf5Ec\x877\xa3\xf2\xc8\xd2\xca.\
-_1\x8e\xa9/\x08\xe0J\xbd\x81\x17\x0d\x1d\xbd9\xc6\
-\xec\xa1d\xae\x11\xd8\x0e\x97_E\x04\xc3\x1dbp\xf4\
-\xdf\x1a\x7fR~E\xc1\x5c\xac\xce1\x8e\xadi\xa5\x03\
-<\x04x\xd3\xd0\xc1\xb7+\x88\x8b\xd7\xdd\x86\xf1\xd5Z\
-\xf7\xabY\xdd\xce\x9dc\xbc\xc5\xe9\xaf\x00.^\xfd\x8c\
-_\xd1\xae+\x15\xe0\xfd\xa8.\xfd\xb2\xaa\x9a9N\xc1\
-+u\xa8\xee{\xc7(\xd66R\xdd\x0cR\x1c\xc07\
-\x1a~*\xceP\xd0J;h\xa6a\xbc}\xb74\x80\
-\x0f0,\xdaX\xa6\xf3^i\x17\xe7\xc3Vs\xa7\xdb\
-\xdc\x8e\xb2\x18\x80\xbfc\xe4\xc8\xadh\xfc\xab\xb4k}\
-\x12\xbb\xce\xa5\xebJ\x01\xb8\xbf\xcb\xdeY\xd8\xcd\x0aR\
-\xa9\x13\xddb\x14{\xeb\xa8a\xfcp\x1d\x0e\x9cj\xe4\
-\xc0\x16`\xb0\x02T\xeaD\xfb8\xd8,\xec\xb2\xdc\x01\
-n\x02^6r\xde%\x0aNzS]\xa6=\xdf\x1d\
-\xa3\xb5\xbb-\xe3\x1a\xe0A\xaa\x19\xcb\xef\x93\x9f\xcc\xbe\
-DVS\xb5\xc4f\x0b\xb0U\xcd\xf3\xb2\xd0\x8e\x8bP\
-\xe3\xa9\xe6Ywf\xafS\x0d\x0b,\xb9+\xab\x97a\
-B\xeb\xb4\x9c\x01\xfe\xa9\x91\xd3\xc6\x15\x1c\x8c\x8d\xc0\xdc\
-n\xf8\xec\xbe\xc2\xb3\xf5g\x18\xc5\xe2\xa2\x5c\x01\xfe \
-6\xa3r\x9e)\xfc\xdbd\xee\x1e\xf8\xee\x81\x82}\xd7\
-\x03x\xd6 \x1e\xb7\xb8X\xcf\x0e\xe0\xab\x8d>\xf1>\
-W\xf8\xb6yO\xad\xe4\xa9\x9c\xa7\x1a\xc5\xe4\xb7r\x03\
-\xb8\xb1\x8b\xefg\xbbkO\x15\x9e\xb0\xf2q_\xd0z\
-\xca\xed\x95\xee\x01,1Jf\xf5\xc8\x09\xe0\x13\x8c>\
-\xe9\xce*\x18\xe0\x89\x1e\xfd8\xb5`?~\xc9(6\
-\x8f\xcf\x09\xe0\x9bsH\xd9G\xa6\x05\x1e}\xb9\xb8`\
-?\xf6t\xc7l\xbe\xed\xc6\x5c\x00n\x02\xfe\xdb\xc0A\
-S\x0a?6\xf2y\xddf\x9b{\xcd)\xd5\x97\xd3\x0c\
-\xe2\xf3\xb5\x10>\x0d\xe1\x9c\x93\x0c\x9c\xd3\x06\x0c*\x1c\
-`\xdf\xcd %\xfbs 6\xad\xad\x9f\xce\x01\xe0\x9b\
-\x0c\x1cs\xa7\xaa\x89\xbc\xcf{\x1aX\xb8?-\xc6\xd1\
-\xde\x98\x03\xc0\xabRM\x10h\x0b]\x94,\x12\xad/\
-\xa4\x0e\xf0\xa1\x06NY.x\x95\xc42:Rz\xc9\
- ^\x0fJ\x19\xe0\xc9\x06\x0e\xb9J\xc1\xa6c$#\
-Y\xdc\x8ayq\xca\x00?b\xe0\x90\xc3\x14h*\xe4\
-0\xd2G\x0d\xe2uQ\xaa\x00\xf72\xc8\xec=\xaf \
-S)\xa5\xb1\x96y\x8e\xd9\x0d\x96\xf5\x0a\x96\x8e8\xda\
-\xe0\xd3L\xc3\xea\xd4\xcc\x90\xe26\xfa\xa8\x14\x01\x9eb\
-\xe0\x88Q\x0a0\xb5\x13\x1ak\xb4A\xdc^\x9a\x22\xc0\
-\x0fxv\xc2\xebTU]\x0a25\xf4[W\x0e\xfa\
-\x1e\xb9s\x7f\x8a\x00\xbf\xe6\xd9\x09\xf7*\xb84R'\
-\xc1#:\xdc\x07kR\x00\xefg\xb0\x0d9_\x81%\
-\x05\xd2\x85\x06\xf1;4%\x80?\xab\xe3#)a}\
-\xcc ~OJ\x09\xe0\xcb=?|\x0b*\xf5\x93\xc2\
-Ve\xf9~\x0f\x9e\x9c\x12\xc0wy~\xf8\x87\x14T\
-R`\xf9\x1e\xc0x[J\x00\xfb\x1eSr\xb5\x02J\
-J\xfc<\xf8\xc9\x94\x00~\xcb\xf3\xc3\x8fW@I\x81\
-5\xc1\xe050\x09\x80\x07\x1b$\x00\x0eQ@I\x81\
-u\x98A\x1c\x0fL\x01\xe0\x91\x9e\x1fz\x93\x0a8\xa4\
-\x1a\xd4\x13\xffSOF\xa4\x00\xb0\xef\x89\xf7K\x15L\
-RMZ\xe99\x96\xc7\xa5\x00\xb0\xef#\xa4E\x0a$\
-)\x93L\xf4\xd4\x14\x00\xf6}y\xf7<\x05\xd2NK\
-$\xbbj\xed\xeeg\xe6\xbb\xdf\xa1\x06\x86\xae\xeb\x9f<\
-\xc7\xf2\x0d)\x00|\x87\xe7\x87\x9eVx\x10u\xb5I\
-\xa1\xab\xb6VY\xfd.\xeb\xca\xd8\xcf\x82-\x1ez\xa1\
-\xe7\x87>\xbb\xd0\xe0\xe9n\x9b`Wm\xae\xaa\xdb:\
-\xd59\x9e}\xfe`\x0a\x00?\xe6\xf9\xa1O.4x\
-,\xe1\xed\x08\xb1@\xdd\xb5>\xef\xd9\xdf\x8bS\x00\xd8\
-w\xe6\xee\xe8B\xb7\xcd\xa1L\xdb\xe9]k\x94g_\
-/O\x01\xe0W=?\xf4\xf0\x02\x13V\xcd\x01\x01^\
-\x03\xf4\x11\xac;\xd5A\x9e}\xfdJ\x0a\x00\xff\xc1\xf3\
-C\x0f-,h&\x12\xde&\x08\xd6 }\xed\xff\x93\
-\x02\xc0\xad\x9e\x1fz`aA\xb3\xa0\x06\x80\x17\x08\xd6\
-\x9dj\x90g?\xb7\xa6\x00\xb0\xef;{\xf6.,h\
-\x9ak\x00\xb8Y\xb0\xeeT\xef\xf3\xec\xe7M)\x00\xbc\
-\xc5\xf3C\x97V\x07\xbd\xb9\x06\x807\x0b\xd6]\x0e\xb8\
-\xf3i[\x04p\xfej\xa3\x1e\x13\xb0\x02X[\xe8D\
-\xb7\xd0\x02X[h%\xb1\x12Nb\x09`%\xb1t\
-\x8c\x94\xf01\x92\x00\xd61\x92\x0a9\x12-\xe4\x10\xc0\
-*\xe40-\xa5<\xa6\xc0\xc0\x19/\x80UJY\x17\
-\xc0jfH\xa7\x99A\x00\x87mf\xf8e\x0a\x00\xab\
-\x9d0\x8dvB\x01\xacv\xc2 \x0d\xfd\x97\x17\x1eD\
-\xbe\x1b\xfa\x05\xb0\x1a\xfa\x83\x8e\xd4\xb9I\x81\xb4G#\
-u\x04p<#uf\xa7\x00\xb0\x86\xda\x85\x91\x00N\
-o\xa8\xdd\x94\x14\x00\xf6\x9dA\xd5XY\x01\x9c\xcbX\
-\xd9\xd3R\x00\xf8\x13\x9e\x1f\xba\x0d\x0dv\x17\xc0\xe1\xd5\
-\x13x\xdb\xb3\x8f\x8fL\x01\xe0}\x0c\x82\xeb#\x0a(\
-\x01\x1cXG\x18\xf8x@\x0a\x007\x00\xeb=?\xf8\
-\x19\x0a(\x01\x1cX\xbeKZ\xd7Y\xfc\x9dV\x0f\xff\
-\x8c\xe7\x87\xbfF\x01%\x80\x03k\xa6g\xff&u\xbd\
-\xe8\x9d\x9e\x1f^\x17|\x0b\xe0\xd43\xd0\xb7\xa6\x04\xf0\
-T\xcf\x0f\xdf\x82\x86\x90\x0b\xe0\xb0Up\xbe_\x03\xbf\
-\x9e\x12\xc0c\x0d\x02\xecp\x05\x96\x00\x0e\xa4\x8f\x1b\xf8\
-\xf7\xc4\x94\x00\x1ej\xe0\x80\x0b\x14X\x028\x90.6\
-\xf0\xef\x90\x94\x00\xb6\xe8\x0b\xbe_\x81%\x80\x03\xe9\xc7\
-\x9e}\xbb\xc6\xeao\xb5t\xc2|\x834\xbc\x0a:\x04\
-p\x88\x02\x8eV\xcf\xbe\xbd7E\x80/3\x08\xb2\xe3\
-\x14`\x02\xd8X\x9f2\xf0\xed\xc5)\x02<\xd2\xc0\x11\
-:\x0f\x16\xc0\xd6\xba\xce\xc0\xb7#R\x04\xb8'\xb0\xc1\
-\xb3#\xd4\xd8 \x80\xad\xb5\xdc\xb3_\xdf\xb4|\xf5K\
-\xed0\x5c\xc7I\x02\xd8RG\x1a\xf8u\xa1\xe5\xdfl\
-\xed\x10\x8b\xf7\xe0\x19\x0a4\x01\x9c\xd0\xf6\xf9\xa2\x94\x01\
->\xc4\xc0!+\x14h\x02\xd8@=\xa8\xa6\x9d\xf8\xb6\
-\xe1)\x03\xdc\x00\xbcd\xe0\x94\xd1\x0a8\x01\xecY\x9f\
-I\xf1\xcb&\x84c\xe6\x198\xe6n\x05\x9c\x00\xf6\xac\
-{\x0c|\xfa\xfd\x1c\x00>\xc1\xc01mT\xf7\xd6\x08\
-`\x7f\xd6\xee\xb6\x90\xf3\xa9za{\x17\xe4\xcb\x81\xd8\
-\xdc\x0a9:\x07\x80\x1b\x81\xdf\x198g\xaa\x006\xb5\
-\xb5T\xf3\xcdJ\xf0\xe5\xe5\x06\xfe{\x95\x00\x1dt\xa1\
-\x1c4\xcf\xc8A\xbd\x04\xb0\xb9\xcd%\xefV\xce^T\
-w\x16\xf9\xb6\x7f\x08\xf1\xf7\x87r\xd2\x18\xa3\xe0\x9a(\
-\x80\x83A\x9c\xab\x1f\xff\xda\xc8g\xc7\xe6\x04p\xa3\xd1\
-\xa7\xdc\xd3\x028\x98\xe5\xb8\x9d\xee\x01<k\xe0\xab\x97\
-\xdd\xef\xce\x06\xe0\x06\xe0\xdbF\x81\xf5\x97\x028\x88\xad\
-\x01\xfad\xe6\xc3qF\xbe\xfaf\xa8g\x08\xe9\xac\x0f\
-\x00[\x0c\x9c\xb5$\xd4\xa7]\xe1\x00\x03L\xc8\xec\xdb\
-\xf79\xa3l\xfe\xfe9\x02\xdc\x00<l\x14X\xa7\x0b\
-\xe0 \xb6 #\xffM0\xf2\xd1\xc2\x90\xcf\x11\xdai\
-\xa7\x199mE\x81\x19\xe9:\xac9\x13\xdf\xf5\x06^\
-4\xf2\xd1)9\x03\xdc\x84M\xbd)\xc0d\x01ln\
-\x9b3\xf1\xdd\x95\x86\x1fpM9\x03l\xd5\xa1\x04\xd5\
-\xe8\xd9!\x05\x01\xdcV\x03\xc0\x9b2\xf0\xdb0\xfc\x8f\
-\x8c\xddn\x97\x84~\x9e:\x1c\xd8\xcf\xc1fa?,\
-\x08\xe0fm\xa1\xbb\xa5\xdb\x8d|\xf3\x06\xd0\xb7\x04\x80\
-\x1b\x80YFN\xdcJU4R\x02\xc0\x0b\x94\xc4\xea\
-V]\xfe6#\xdf\xd42\xee\xa9.G\xee\xef\xde\xa7\
-\xac\x12Z}\x0a\x00xb\x0d\x00\xa7|\x8c\xb4\xb7a\
-\xe2j\x13\xb0oI\x007\x00\xdf3\x0c\xb4k\x0b\x00\
-\xb8w\xe0mt\xea\x85\x1c\xb3\x0c}\xf3\x9d\xba\x9e\xab\
-N\x87\x0e\xc5\xff\xd0\xbb\x8e\x87\xe9\x9f,\x00\xe2\xf1\x01\
-\x01N\xb9\x94r46ED\xb8\x18\x1eV\x22\xc0\x0d\
-\xc0\x0d\x86\x01\xf72\xf0\xfe\x02 \x9e\x1b\x00\xde\x94\x9b\
-\x19\x06\x00\xab\x0d}3\xb3\xce\xe7\xab\xdb\xb9\x83\x0dS\
-\xfa\x00w\x15\x00p\xa31\xc4\xa9\xb7\x13\xdek\xe8\x9b\
-Vj\x1e,\x11\x83\x83\xaf0\xfe\xf68\xbf\x90\xac\xf4\
-x\xaa&|_\x96CC\xff\x85\xc6\xb15\xb9\xeeg\
-\x8c%\x19\xf3\x82\xa1\x937\x03\xc7\x14\x02qo\x97\x9d\
-\x9eOU\xf1\xd6\xbe\x9by\x83\x9cF\xea\x8c\x02\xde6\
-\x8c\xab(\xcawcq\xf6\xa9\x012\xa8%Ui\x95\
-\xaea\xf8\xbf\x1dsG\xfb\x5c\x0c\xcf\x1a\x93\xd3\x7ff\
-\xec\xf0_\x16r>\x5c\xba\xf6\x06\x1e7\x8e\xa5\x87b\
-y\xde\x98\x1c\x7f\x08\xf6\xf5\xbd\x0b(\xb3w\xb8\x14\xf5\
-0NZm/\xda8H\x00\xef\x5c\xd3\x03\x1c\x89\x5c\
-\xa7@\xcfVs\x02\xc4\xcf\xe51=sl\x0b\xd0\x93\
-j\xc2\x86\xb5}C\xc1\x9e\x9d\xa6\x06\x88\x9b\xe7\x88\xac\
-\xef<\xc6\x85\x18\xb9\x9b\xd9\xd3\xee\xd86w\xc4\xa0\xc0\
-\xcfC\x97\x06\x80\xb7\x1d8*\xb6g\x8fuAf\x04\
-X\x90\xad\xc0y\x0a\xfe\xe4u>v\x1dF\x1d\xed\xaa\
-\x18\x9f?\xd6E\xe9\x19 \x93\xb8\xfd\x9bx\xb2 H\
-\xbaPck\x808y\x8c\xc0\x936R\x07\xb8\x01\xf8\
-0\xd5\xed\xe6!\xec\xef\x05Cr\x9a\x1e(6\xd6\x03\
-\x7f\x1a\xab\x1fb_\xa4/\x13\xcef\xe9\x88)\x99\xda\
-\xef9\x01\xe3\xe2K1\xfb#\x85\x05\xbb5\xe0b\xfd\
-\xc4\x15\x02\x08\x948\xd5\x07\xb8/`<\xfc v\x9f\
-\xa4\xb0h{Q]\xa1\x12\xca\x16\xa3\xb2\xcbX\xcb#\
-\x1f\x0f\x18\x07O\xa4P\xb9\x97\xca\xe2}\x10\xf8C\xc0\
-\xc5{\x95\xaa\x18^\xe0\xc4s\xb4\xb8:\xe0\xfa\xff\x9e\
-\xea&\x91\x06\x01\xecOc\x03\x9c\x0fw\xb4\xcd\x94\xd3\
-\x8a\x18\xb3\xbe\x86mW\xd1\x8e\xf6\x0epb*\xfeI\
-m1'\x11\xde\xee\xa6\x8c\xc9\x1e1N\xd2\xb8\xb7\x86\
-\xf5\xfejJ~Jqag\xd7\xb0\xa8k(g\x5c\
-m,\xbd\xbc\xabjX\xe7kR\xf3U\xaa\x1d'\xf3\
-kX\xdcv\xaai\x97jI\xb4MX^\x8f\xdd\x00\
-\xba\xf7\xb2{R<FLy\xa1\x7fN=\xb6\x02\xf8\
-\x94`\xf3\xae\x13\xb1\x9d\xcc\xf2^\xf6\xb3T?\x98S\
-^\xf0~\x81\x8f\x15:\xda6\xe0\x9f\xa9F\xe3\x0a\xbe\
-=?\x1e\xba\x9d0\xf5\xcc;\xb3\xc7\xa8\xe1J\x14\x01\
-\xfcn\xa2\xe3i\xea\xb3V\xaa\x92>m\xabw_\xbd\
-\xa8\xea\xd0\xd7\xd7\xb8~\xcfQ\xf3T\xc9\xd2\x01np\
-E\x17K\xa9\xd7V\x02g\xa2R\xcc\xae\x96B\x9e\x85\
-\xdd5']\xb5\xa59\x14\xec\xe4\x12\x14\x83\x80'\xa9\
-\xdf\x96\x0a\xe4N\xcf\xf2\x97D\xb0NK\xc8\xa4\xda.\
-\xa7\xe0\x18\x08\xfc\x8a8l\x09\xf0WTm\x91\xda*\
-\xc3\xd9\xc0\xb3\x91\xac\xcdb\xf7\xea\xd5 \x80\xe3Ll\
-=J<\xf6\x0a0-\xf5\xf7\xac=\xd8\x15]\x81\xdf\
-a\xf3>\xb2\xcd}s\xf2s\xae\x1d+\xf7\x10\x97\xbd\
-\x0d<\xe0\xb6\x90\xb9o\xafG\x02\xb7PMo\x8c\xc9\
-\x1ep\xc7\x8f\x0d\x028\x8db\x8fY\xc4i/\xba\x82\
-\x90\x8ff\xe4\xef\x8fS]\xf2\xb5*R\x9f_\x9b\xeb\
-\x07g\xee\xdb\xb8\x0b\x08\xdb\x00\xb1\xbb\xb6\xcc\x05\xfeh\
-\x22\x1d\xd9\xc2\xaeG\x1e\x8d\xa1\x1a\xd1\xbb\x22b\xff\xbe\
-\x03|%\xe7\x18/\xe1]\xec$\xc2\xb6\x22v\xd7Z\
-\xa8\x06\xcf_\xe8\xbe\x9dc\xba\x11\xb0\x11\xf8\x18p\x11\
-\xf0cw\xfe\x1d\xbb\xfd\x9e\x84\xba\x8a\x04\xf0{\xebC\
-\xc0S\xa4e\xad\xc0\xc3\xee\x1b\xfa,\xe0\xb0@Y\xed\
-\x9e\xc0\xe1\xc0\x04\xf7\x0d\xfb\xd3\x9a\x8b-\xbacO\x90\
-H?\xaf\x00\xde\xbd\xfa\xe9[I\xdb\xde\x06\x96;\xa8\
-nvY\xdes\x80\xcfSu\xf0\x1cLU\xde9\x08\
-\xe8\xdf\xe1\xd9\xfb\xbb\x7f\x1b\xea\xfe\xcf(\xf73\xe7\xb8\
-\xdfq\xb3\xfb\x9d+\x08\xdb{ka?\xa0\xa0\xca\xb8\
-\x12\xcf%\xcf%\xdc\xb4KY8[O\xe4\x03\xe8\x04\
-\xb0?\x1dHu[\xa1,\x0f\xfb5\x11]8&\x80\
-\xc3eRgD\x9e\xa5\x96\xbd\xb7\xb5S\xcd\xf4n*\
-5\x8eU\x9f\x0bG&\x98\xe0\x92U\x9dDG\x97\x1e\
-\xbf\x02\xf8\xddo\xe3\xc9\xc0Fq\x11\xbd\xb5Q\xb5p\
-6)n\x05\xf0\x8e:\x18xD\x8cDk\x0fS]\
-\xb9\xa3X\x15\xc0\x9d\xb6\xbd\xfdV\xbcDc/\x00_\
-P\x5c\x0a\xe0\xddQo\xaa\xdb\xd8\xd7\x8b\x9f\xda\xac\x05\
-\x98Bd\x97j\x0b\xe0\xb4\xb4\x8f\xcbV\xeb\xec8\x9c\
-m\xa4\x1a\x1f<H\xf1'\x80}\x8e\xee\x99M|m\
-r9\xd9&`.\xb0\x9f\xe2M\x00[i?\xaa\x1a\
-\xe1u\xe2\xcd\x9b\xbdAU\xf3\xbd\xaf\xe2K\x00\x87R\
-_\xaa\xab^V\x8a\xbfn[\xb3;\xbe\xeb\xabx\x12\
-\xc0u\xa9\x098\x15XD=7\x0a\xa4f\xed\xc0B\
-\xe0\x14\x9d\xe5\x0a\xe0\xd8t\x00\xf0-\xf7\xcd\x22\xfbc\
-[\x05|\x13\xd8_q\x22\x80S\xd0\x11.{]2\
-\xcc\xaf\xb9\xa4\xd4\x184jW\x00'\xaaF\xe0\xd3\xc0\
-\x8d\xd4w\xf7OH[\x09|\xdfA\xdb\xa8\xf5\x17\xc0\
-\xb9\xe9\xc3\xc0\xc5\xee\x9d\xf9\xad\x0c\x80}\x13\xf87\xaa\
-q;\xc3\xb5\xbe\x02\xb8\xb4\x04\xd8\x08\xe0R\xe0>\xe2\
-\x9a\xa1\xbc+[Ku\xf1\xf6%T\x9d\x5cJD\x09\
-`i\x87\x82\x91\x93\xdc\xf1\xcamT\xad\x8e-5\x80\
-\xba\x8e\xea\xba\x9a[\x81\xcb\xdc\xdf4X\xeb#\x80\xa5\
-\xeei\x80\xfb\xb6\x1eGU\x1f|\x03\xd5\xb5\x9c\xffJ\
-u]\xc8r\xe0eW\x14\xd1\x02l\xe8\x00\xe3\x06\xf7\
-oo\xb8\xff\xb3\xdc\xfd\xcc\x83\xeeCb\x96\xfb\xc0\x18\
-\xe7\xbeU\xdf/\x7f\x0b`I\x92\x04\xb0$I\x02X\
-\x92\x04\xb0$I\x02X\x92$\x01,I\x02XN\x90\
-$\x01,I\x92\x00\x96$I\x00K\x92\x00\x96$I\
-\x00K\x92$\x80%I\x12\xc0\x92$\x80%I\x12\xc0\
-\x92$\x09`I\x12\xc0\x92$\x09`I\x92\x04\xb0$\
-I]\xd1\xff\x01\x9a.xW3\xac\xa3\xa3\x00\x00\x00\
-\x00IEND\xaeB`\x82\
-\x00\x00\x0e\xd0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.1462899, 2023/0\
-6/25-20:01:55   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-25.0 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-10-16T09:17\
-:51+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-10-16T09:27:15+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-10-\
-16T09:27:15+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:4c3b3\
-cac-583c-6f4f-81\
-b5-73a6381c377b\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:4c3b3\
-cac-583c-6f4f-81\
-b5-73a6381c377b\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:4c3b3cac-583c\
--6f4f-81b5-73a63\
-81c377b\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:4c3\
-b3cac-583c-6f4f-\
-81b5-73a6381c377\
-b\x22 stEvt:when=\x222\
-023-10-16T09:17:\
-51+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-5.0 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?> #\x98\xd7\x00\
-\x00\x09\x88IDATx\xda\xed\xdd\xcf\xaf^E\x1d\
-\xc7q0\xf6\xa7F\xa4\xadb\x0bEVjB\xf4?\
-@\xdb\xa0%V\xa1\x96\x96\x80{\xd1\xdaJ\x15\x15%\
-l%\xba0\x12kj\xa2\x18!\x80A\xba\xd0(]\
-\xd5\xc6 M\xc1va\xd1\xa2\xc6\xc5\xed-\xad\xe8\xc2\
-R\x0a&(\xb7\xad\x1dg\xees\x0c\x8aD[\x9e\x99\
-y\xce\x9c\xe7\xf5I\xde\xdb\xf6\x9e\xf3\xfd\xbc\x9f\xfb\xdc\
-3s\xce\xb9(\x84p\x11\x806q\x12\x00\x02\x03 \
-0\x00\x02\x03\x04\x06@`\x00\x04\x06@`\x80\xc0\x00\
-\x08\x0c\x80\xc0\x00\x81\x01\x10\x18\x00\x81\x01\x10\x18 0\
-\x00\x02\x03 0\x00\x02\x03\x04\x06@`\x00\x04\x06\x08\
-\x0c\x80\xc0\x00\x08\x0c\x80\xc0\x00\x81\x01\x10\x18\x00\x81\x01\
-\x1083o\x8a\x5c\x17\xb9+\xf2@\xe4`\xe4H\xe4\
-\xf9\xc8\x5c\x90\xbe\xe5t7\x9b\xa3\x91\x03\xdd\xcc\xd2\xec\
-\xd6E\x96\x12x:\xb8,r{d\x1fI\x07\x954\
-\xcb\xc7#\x9f\x8d\xbc\x9d\xc0\xc3\xe3\x03\x91\xdd\x913\xba\
->\xf8\xa4\x19?\xda\xcd\x9c\xc0\x8dsmd\xbfNO\
-m\xd2\xec\xd7\x12\xb8=VF\x1e\xd4_\xe9\x92\xbe}\
-\xad&p\x1b\xdc\x1cyAg\xe5UI\x9d\xb8\x89\xc0\
-\xfdeq\xe4;z*\xff'\xdf\x8e,\x22p\xbfx\
-sd\xafn\xcay\xe6\xb1\xc8%\x04\xee\xcf\xd2\xd0S\
-:)\x17\x98Ca\x02KN\x84\xfdO\xde\x12\xf9\x95\
-.\xca\xeb\xcc\xe1\xc8[\x09<\xb9\xbfy\x7f\xa1\x832\
-f~^\xf3ob\xe2\xbe\xc2wuO2e'\x81\
-\xebr\x93\xceI\xe6|\x9c\xc0uX\x15\xac\xf3J\xfe\
-\x9c\x8a\xbc\x83\xc0\xe5yD\xd7\xa4P\x1e\x22p\xf9\xbd\
-\xcd\x22\xa5r.\x14\xbe\x09b\xda\x05vc\x82\x94\xce\
-\xe3\x04.\xc3Z\xdd\x92J\xb9\x86\xc0\xf9\xd9\xadWR\
-)\x8f\x128/i\xcb\xdbi\xbd\x92JI\x0f\x05\xb8\
-\x8c\xc0\xf9\xb8\xbd\xf0\xc0\xfe\x1eF\xf7\x0fo\x8c\xbc3\
-\xf2\xc6\xe0j\x7f\xdfX\xd0\xcd\xe6\xc6nV/\x17\xee\
-\xc4v\x02\xe7c_\xc1A=\x1cFk\xcb$i\x8b\
-\xcbC\xd9%\xc5\xc7\x08\x9c\xef\xe9\x91%\x1e@w6\
-\xb2\x85\x08\xcd\xb3\xb5\x9be\xee\xa4\xdf\xf0K\x08<>\
-\xd7\x15\xfa\x84%\xefp\xd8V\xa8#\x1f\x22\xf0\xf8\xdc\
-U\xe8k\xb3\xe2\x0f\x8b]\x05zr'\x81\xc7\xe7\x81\
-\x02\x17\xac\xfc\xcd;<\xae(pa\xeb~\x02\x8f\xcf\
-\x81\xccCyP\xd9\x07\xcb\x0f2w\xe5I\x02\x8f\xcf\
-\xb1\xccC\xd9\xa8\xe8\x83es\xe6\xae\xcc\x12x|N\
-f\x1e\xca\x95\x8a>X\xae\xca\xdc\x95\x13\x04\x1e\x9f\xdc\
-KH\x0b\x15}\xb0,,\xb0\x94D\xe01\xc9\x1dE\
-\xd7\x97\x89\xf5\xc5@\x08\x0c\x02\x1b\x08\xf4\x85\xc0\x06\x02\
-}!0\x81A`\x03!0\x08l \xd0\x17\x02\x13\
-\x18\xfaB`\x02\x83\xc0\x06B`}!\xb0\x81@_\
-\x08L`\x10\xd8@\x08\x0c\x02\x1b\x08\xf4\x85\xc0\x04\x86\
-\xbe\x10\x98\xc0 \xb0\x81\x10\x98\xc0\x046\x10\xe8\x0b\x81\
-\x09\x0c}!0\x81A`\x03!\xb0\xbe\x10\xd8@\xa0\
-/\x04&0\x08l \x04\x06\x81\x0d\x04\xfaB`\x02\
-C_\x08L`\x10\xd8@\x08L`\x02\x1b\x08\xf4\x85\
-\xc0\x04\x86\xbe\x10\x98\xc0 \xb0\x81(\xb9\xbe\x10\xd8@\
-\xa0/\x04&0\x08l \x04\x06\x81\x0d\x04\xfaB`\
-\x02C_\x08L`\x10\xd8@\x08\xac/\x046\x10\xe8\
-\x0b\x81\x09\x0c\x02\x1b\x08\x81A`\x03\x81\xbe\x10\x98\xc0\
-\xd0\x17\x02\x13\x18\x046\x10\x02\x83\xc0\x06\x02}!0\
-\x81\xa1/\x04&0\x08l \x04\xd6\x17\x02\x1b\x08\xf4\
-\x85\xc0\x04\x06\x81\x0d\x84\xc0 \xb0\x81@_\x08L`\
-\xe8\x0b\x81\x09\x0c\x02\x1b\x08\x81\x09L`\x03\x81\xbe\x10\
-\x98\xc0\xd0\x17\x02\x13\x18\x046\x10\x02\xeb\x0b\x81\x0d\x04\
-\xfaB`\x02\x83\xc0\x06B`\x10\xd8@\xa0/\x04&\
-0\xf4\x85\xc0\x04\x06\x81\x0d\x84\xc0\x04&\xb0\x81@_\
-\x08L`\xe8\xcb\x00\x05~[d]\xe4\xb6\xc8\xce\xc8\
-\xde\xc8\xe1\xc8\x91\xc8\xf3\x91\xb9 \xad\xe6Ld&\xf2\
-H\xe4\x96\xc8B\x02\xb7/\xf0\x92\xc8\x86\xc8\x8eN\xd4\
-sz>59\x1e\xd9D\xe0\xf6\xa4}CdM\xe4\
-\xbe\xc8\x8bz<\xf5\xd9\xd1u\x82\xc0=gqdk\
-\xf7uX\xe4\xd5\x12\x13\xb8\xa7,\x8d|!\xf2g=\
-\x95\xff\x91M\x04\xee\x1f\xd7G\x8e\xea\xa6\x9cG\x9e\x89\
-,\x22p?\xb8*\xb2['\xe5\x02s\x0b\x81'\xcf\
-\xe6\xc8\x0b\xba(\xaf#\xbb\x08<9\xd2\xd7\x9f\x9d:\
-(cd\x96\xc0\x93ay\xe4\x97\xfa'c\xe6o\x04\
-\xae\xcf\xaa0\xda\x84!2n^\x22p]\xde\x13F\
-;jD|\x85nL\xe0\xd5\xe4\x15\x17\xb1\xda\x148\
-\xfd\xcd\xfb{}\x93\xcc\xb9\x99\xc0u\xae6\xbb`%\
-\xb9c#G%,\x15I\x89\xd8J\x19\xeal\xd2\x10\
-\xc9\x1d73\x84:\xdb#\xed\xb0\x92\x12\xf2\xba\x9d\xb0\
-\x02\xf66K\xce\xb8\xa1\xbf\xa2\xc0\x1b\xf4M\xc6\x8cG\
-\xeaLH\xe0\xa5\xdd\x15\xc2\x9a9\x1b\xd9\x1f\xb9;r\
-c\xe4\xea\xc8\xa5\x91\x05\xa1\x9fw_\xf5\xf5>\xecI\
-\xcd\xed+=\x9a\xdb\xd4\x0b\xfc\xc5\x8a\x058\x16\xb9#\
-\xb2\x92\x80M\xcemU\x0f\xcf\xc3T\x0b\x9c\x1e\x83S\
-\xe3I\x1a\x7f\x89\xdc\xea7l\xb3s[\xd8\xe3s1\
-\xd5\x02o\xadP\x82\x87\x22\xcbH\x97\x95O\x9b\x1b\x81\
-\xd3\xa5\xfd\xd9\x82\x058\x1d\xf9\x04\xd9\x8a\xcc\xed\x88\xb9\
-\x11xm\xc1\x12\xa4\xdb\xc6>L\xb6\x22\xac17\x02\
-'\xee/\xf8\x09\xbe\x9eh\xc5\xb8\xaf\xe0\xdcZ\xfc\xd0\
-\x9dJ\x81\xd3\x12\xc4_\x0b\x15\xc1\xd7\xe6\xb2KG/\
-\x9a\x1b\x817\x14\xbc\xf0A\xb4\xf66\xdc\xb4<\xb7\xa9\
-\x14\xf8\x9b\x05\x0e\xfc\xb9\xc8\x0a\x92\x15e\x87\xb9\x118\
-\xf1\x9b\x02\x07~+\xc1\x8as\xd8\xdc\x08\x9c^\xf1\x99\
-\xfb-\x81\xc7z\xbe\xd8?\x94W\xb3\x96\x98\xdb\x02\x02\
-\xb7%\xf0\xba\x02\x07}\x07\xc1\x8acn\x04\x9eg{\
-\xe6\x03\xfeG\xe4r\x82\x15\xe7\xb6\xccsK7&\xac\
-$p{\x02\xe7~d\xce~r5\xf9\xa8\xa3'\x06\
-r^\xa6N\xe0\xbd\x99\x0f\xf8nrU\xc1\xdc\x08<\
-\xcf\xd3\x99\x0fx#\xb9\xaa`n\x04\x9e\xe7h\xe6\x03\
-\xbe\x9a\x5cU07\x02\xcfs2\xf3\x01\xbbU\xb0\x0e\
-\xe6F\xe0y\xe62\x1f\xb0\xf5\xdf:\x98\x1b\x81\x15\x81\
-\xc0\x83\x9a\xdb\xa2\xcc\xe7\xe4e_\xa1\xe1+t=V\
-d>''\x5c\xc4\x82\x8bX\xf5xo\xe6s2\xdb\
-\x82\xc0\x96#,#\x0den\xb9_\x05\xf4\xeb\x16\x04\
-\xfe\x99\x0d\x01Mbn\xff\xcd\xd72\x9f\x93=-\x08\
-\x9c{K\xde\x93\xe4\xb2\x95rB\x1c\xcc|N\xbe\xd5\
-\x82\xc0\xb97\xc5\xa7\x9b\x19\xae Xs73\xb4>\
-\xb7t\x03\xcd\xd9\xcc\xe7dk\x0b\x02\x97\xb8-\xedK\
-\x04s;ae\xee,p>>\xd8\x82\xc0\xe9\xd2{\
-\xee\x1b\xc3\x8f[\x0f\xae\xb2dbn\xaf\xac\xff>[\
-\xe0\x1b\xc9\xf2\x16\x04.\xf5H\x9dO\x91\xac8\xe66\
-b[\x81\xf3p\xa8\xc4\xcf\xda\xd2C\xedN\x06\x0f\xb5\
-+\x8d\x87\x11\x8e~K\x9e(p\x1e\xbe\xde\x92\xc07\
-\x842y\x98dE1\xb7\x10v\x15:\x07\xeb[\x12\
-xI(\xf7\x80p_\xa5\xcb1\xeds\xdbV\xe8\xd8\
-O\x85\xd1\x1b\x1f\x9b\x118\xf1\xfdB'#]\xda\xff\
-\x18\xd9\xcc-3\x1f\x89\x9c)t\xec\xf7\x96\xfa\xb9K\
-\x9e\x905\xa1\x5c^\xeaN8\xe1\xcc-\x07\x1f\xed~\
-\xb6Ry\x7f\x8b\x02\x97~Me\xfa\xb4\xdcB\xb8\xec\
-\x5c<es\xfbL\xc1\xdf\xbc)3\xdd9mN\xe0\
-D\x8d\x17E\xff\xb0\xc4\xfa\xda\x94\xb3e\x0a\xe6\xb6\xa2\
-\xe0\x05\xab\x7f\xcf'K\x1eG\xe9\x93\x94\xfep\xffS\
-\x85\x93\xf4\x5c\xf7aa\xb3\x87\xb9\x9d\xcf&\x8dm!\
-\xff\xfd\xcf\xaf\x95?v\xff_\xb3\x02'>\x1f\xea%\
-\x9d\xb0/\x07\x0f\x82oun%\xf7N\xa7\x7f;m\
-\x8f|\xb6\xe2qm/=\xa7\x1aEH\xef\x9c\x9d\x0d\
-u\x93\xb6\xad\x1d\x88|5\xb2)\x8cn\xcc^\xee7\
-\xf4\x05/)Mrn\x9b\xbb\xb9-\xbb\xc0\xb9-\xec\
-f\xfd\xbe\xee\xdfH\xb7\x04\x1e\xec\xfe\xed\x9a\x99)\xb5\
-tT[\xe0\xc4\xf5Ad\xba\xb2\xbe\x86[5?\xd1\
-\x7fj\xa62%\xf9q-\xafj\x0a|e\x18\xedH\
-\x11\x19r\xd2\xc5\xb1\xd5C\x148\x91\x9e\x93t\xce\x8c\
-e\xa0I\xdd\xbe\xa1\xa6S\x93\xb88\xb2\xc3\x9ce\xa0\
-\xb9\xa7\xb6O\x93\xbaY\xfa\x09\xb3\x96\x81e_\x98\xc0\
-*\xc7\xa4\x96(.\x09\xa3Gl\x8a\x0c!\xbf\x0d\x13\
-z\x90\xfd$\xd7\x19\xd3\xc2\xfaq\xb3\x97\xc6s,L\
-p\xe3\xd0\xa47\x0b\xbc\xbb;\x01\x22-\xe6\x99\xc8\xbb\
-&\xe9P\x1fv\xfc\xa4\xdf\xc4\xbf\xd3\x05i,O\x87\
-\x1el\xd9\xed\xcb\xb6\xbde.lIc\x17\xac.\xed\
-\x83;}\xda{\x9b\xae\xe0\xa5%&\xeb\xc4\xd2\xd7\xa4\
-n\xde\x13z\xb4\xa7\xbe\x8f\x9b\xe8\xd3f\x8fS\xba\x22\
-=K\xdaa\xb5\xa1o\xbe\xf4\xf5N\x98\xb4\xed\xf2'\
-:#=\xc9\x8fB\xc5\xed\x91C\x10\xf8_\x5c\x1b\xf9\
-\x83\xfe\xc8\x84\x92\x1e-\xb4\xbe\xcf\x8e\xb4r_\xea\xe7\
-B\xdd\x1b\xb1e\xba\x93\x1e0\x90n\xc6_\xdcw?\
-Z{_Mz\xb6\xf0\x8c~I\xa1\xcct\x1d[\xd4\
-\x8a\x17\xad>5\xf1\x9a\xc8\xf7\x5c\xec\x92\x0cI\x1d\xba\
-\xb7\xeb\xd4\xc5\xad\xf90\x84\x87\xaf\xa5\xe7\x0c\x7f#\xf2\
-T\xa8\xff\xd8\x14i/\xa9#\x87\xba\xce\xaco\xe1k\
-\xf2\x90\x05~\xad\x17S\xa5w\xb0\xa6\x17)\xa7\xb7\xa1\
-\xef\x09\xa3\x9b&\xd2\xc5\x88\xb4\x0c0\xa7\xbf\x83\xcf\x5c\
-7\xeb#\xdd\xec\xf7t]\xd8\xdaucP\x8f \xf6\
-\xf06\x80\xc0\x00\x08\x0c\x80\xc0\x00\x81\x01\x10\x18\x00\x81\
-\x01\x10\x18 0\x00\x02\x03 0@`\x00\x04\x06@\
-`\x00\x04\x06\x08\x0c\x80\xc0\x00\x08\x0c\x80\xc0\x00\x81\x01\
-\x10\x18\x00\x81\x01\x02\x03 0\x00\x02\x03 0@`\
-\x00\x04\x06@`\x00\x04\x06Z\xe7\x9f\xfd\xde4sT\
-\x0d\xa1\x92\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x13\xeb\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.7 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-08-25T10:01\
-:53+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-08-25T10:04:26+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-08-\
-25T10:04:26+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:b0b6f\
-350-44fc-4149-9e\
-9d-8b34105b7c55\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:b0b6f\
-350-44fc-4149-9e\
-9d-8b34105b7c55\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:b0b6f350-44fc\
--4149-9e9d-8b341\
-05b7c55\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:b0b\
-6f350-44fc-4149-\
-9e9d-8b34105b7c5\
-5\x22 stEvt:when=\x222\
-023-08-25T10:01:\
-53+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.7 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>@\xa59\xf2\x00\
-\x00\x0e\xa3IDATx\xda\xed\x9dk\xb0VU\x1d\
-\x87\x8f\x17\x0e\x09\x82\xb7\xc2K\x19\xd2\xc5\x99.6c\
-\xf7f4\xc7D\xecC\xd6p\x80\xb4\xa9\xac>T\x8c\
-\x04\xe50fQ3\x99:\xd5\x97.T6\xf9!\x11\
-B\x03\xeb\x8b0v\x19&\x10E\xb4\x0b\x18\xa65S\
-\xc2Q\xd2\xb4\xec\x80\x81\xe5\x01\xea<}X\xdb\x09\x81\
-\x03\xe7\x9cw\xad\xbd\xd7\xda\xef\xf3\x9byf\x98\xe1\xb6\
-\xde\xbd\xd6s\xde\xbd\xf7Z\xeb\xbfz\x80\x1e\x11)\x13\
-/\x82\x88\x02\x8b\x88\x02\x8b\x88\x02\x8b(\xb0\x88(\xb0\
-\x88(\xb0\x88(\xb0\x88\x02\x8b\x88\x02\x8b\x88\x02\x8b(\
-\xb0\x88(\xb0\x88(\xb0\x88(\xb0\x88\x02\x8b\x88\x02\x8b\
-\x88\x02\x8b\x88\x02\x8b(\xb0H#L\x04.\x01\x16\x01\
-K\x81_\x01[\x81\x1d\xc0\x1e`o\xf5\xeb~\xe0\xfe\
-\xea\xcf,\x02f\x00\x13\x14X\xa4~N\x05\xae\x02\xee\
-\xae$\x1dk\xf6\x00\xeb\x81O\x03S\x14X$-\x17\
-\x00\xab\x81}\xc4\xcf>`U\xf5\x7f(\xb0HD.\
-\x026P_6\x00\x17*\xb0Hg\x9c\x0e,\xa3\xb9\
-\xac\x06\xceT`\x91\xd1s\x19\xf0\x0c\xcd\xe7\x19`\x8e\
-\x02\x8b\x8c\x8c\x17\x01\xdf'\xbf\xdc\x08\x8cW`\x91\xe1\
-9\x1eXC\xbeY\x07\x9c\xa0\xc0\x22\x87\x9e\x1az\x80\
-\xfc\xb39\xe7)'\x07\x924\xc1d`\x13\xe5\xe4A\
-\xe0D\x05\x16\x09\xcf\xbcwQ^~\x99\xe33\xb1\x03\
-J\xea\xe6&\xca\xcdw\x15X\xba\x999\x94\x9f\x0f(\
-\xb0t#gd2\xcf\xdbiv\x02\xa7)\xb0t\x1b\
-+hO~\xa8\xc0\xd2mk\x9b\xdb\x94!2\xd9\x04\
-\xe1\xe0\x92:\xd8@\xfb\xb2^\x81\xa5\x1b\xb8\x90\xf6\xe6\
-|\x05\x96\xb6\xb3\xba\xc5\x02\xafR`i3S\x08%\
-n\xda\x9a}\x84%\xa1\x0a\x5c\x08\xe3\x807\x00\xb3\xf9\
-\x7fM\xa6{\xab\xa5v\xfb\xd7e\xcam\x90=R\xbd\
-\x05\xbe\x1c\xe8\xad\xf1z]\x95\xf8\xb3=G\xd8?<\
-\x13\x98\x0a\x1c[\xf5\xd1T\xa0\xaf\xfa\xbd\xc1\xc4mX\
-\xa0\xc0\xf9r\x0c\xf0\x16\xe0\x1a\xe0\xe7\xc0\xb3-\xf8\xd6\
-\xd8\x0e\xcc\xaa\xe9\xfa\xdd\x9d\xf0s\xdcV\xcd-\x1f\xa9\
-\x0d/M<\x85\xb5N\x81\xf3\xe3\xcd\xc0b\xe0\xef-\
-\xbe\xfd[\x0c\x1c\x9d\xf0\x1aNLt7\xf2\x1f`\xee\
-\x18\xdase\xf5wcg\x108N\x81\xf3\xd8!s\
-5\xf0\x07\xba'\x8b\x13^\xcfK\x12\xb5yn\x07m\
-\x9a\x97\xa8M\x17+ps\x9c\x02\x5cGX\x22\xd7\x8d\
-Iu;\xbd(\xd1ms\xa7\xedZ\x99\xa0]\x9fS\
-\xe0f\xaaA|\x15\xd8Mw\xe7Q\xd2l\x93[\x9a\
-\xe0\x85\xd5\x19\x11\xda\xf5\xb2\x04/\xb6\x96(p\xbd\x5c\
-Z\x0d\x5c\x13rY\x82k|\x7f\xe46.\x8b\xd8\xb6\
-\xe5\x91\xdb\xb6Q\x81\xeba\x1a\xf03}=(+\x13\
-\x5c\xeb\xc7\x22\xb7qf\xc4\xb6\xcd\x8e\xdc\xb6m\x0a\x9c\
-\x9e\xbe.~\xcemb\x00\x0eDn\xe3\xcb#\xb6\xed\
-\xac\xc8m{Z\x81\xd31\xbez\xdb:\xa4\xa7\x87}\
-\xbe\x8c}\xddcO!\xc5\x5c\x80\xd2\x9b`*I\x81\
-\x130\x05\xf8\xb5~\x1e1\xff.@\xe0q\x0a\xdc]\
-\x02\x9f\x05\xfcI7\x1b\xbb\x85\xfeG\xc6\xb7\xd0\xd3\xbc\
-\x85\xce\x9bs\x80'\xf4\xb2\xd1\x97X\xfd\x91\xdb\xd8\x17\
-\xb1ms\x0a\xf8\x01\xd8\xb5\x02\xbf\x81\xb0\xa9\xc0\x8c<\
-\x97\x170\x8d\x14\xb3\x8c\xcd\xadN#\xe5;M\xf4W\
-}\x1cUJY\xc81H\xd8\x98\xd0i\xbb\xce\xc4\x85\
-\x1c\xd9\xbe\xb0\xf2\x99w\xf4)i)\xe5\x8a\x08\xed\xfa\
-q\x82v\xb9\x942\xc2T\x91o\x9bG\x9f\x94\x9b\x19\
-f$j\xf3\x95\x1d\xb4iA\xa26MW\xe0\xce\xf8\
-\x8e.\x8eI\xdeR\xb7\x13\xce\x1b\xa3\xbc\xffM\xd0\x1e\
-\xb7\x13vH\x9f.\x8e*m\xd9\xd0\xbf\x92\xb01a\
-$\xcf\xbc?I\xd8\x8e\xb5M\x8e\xff6\xcc\xf5\xee\xd4\
-\xc9\xc3\xa6\xc9\x92:\x9fI\xfc\xd9\x06\x09\x1b\x13fW\
-c\xa1\xb7b\x1aa\xaah9\xe9K\x1c\xcdW\xe0\xb1\
-\xd3\xe4\xc6\x84~\xe0\xe6\xea\x99l:\xf0J\xe0$\xe2\
-\xae\x18\xb2\xa8]\xfe?\x1c-j7Ff5\xd0a\
-[\x81k\x81W+\xa7ee\x81;\x9a\xbe\xbe\xa5\x0e\
-\x8a\x09\xd4\xbb\x9fw\x0bp\x05\xa1\xc8\x9dR\x8e\x8e\x0b\
-Z,\xb0\x85\xdd\xc7\xc8Wk\xea\xa0'\x81\x0f\x01G\
-)bG\xdc\xd3By\xd7\xe5pmK\xadaUG\
-\x19\x9c[\x81\x13\x94\xcf\xe3U\x0e\x91!\xe0\x9d\x0a<\
-6\xae\xab\xe1\xcd\xe6\xc7\x95.:\xb7\xb5H\xe0e\xb9\
-\x5c\xd7\x12K\xbf\xa6\xdc\xa8\xf0,\xa1\x1c\xaa\xc2\xc5\xe7\
-t\xdaq\xc0\xf7\x8e\xa6\xdf<\x97,\xf0\xd5\x09;f\
-7\xf06EK\xca\xec\x16\x08\xdc\x97\xd35-m\x00\
-<\x94\xa8S\xf6\xfa\xcd[\x1b\xdf+X\xde\xc5\xb9]\
-\xcf\x92:\xfe-\x09;\xc6g\xdez7\x9e\xac-P\
-\xde5\xd4\xbb\x8a\xadu\x02\xa7\xda\xb0\xb0R\xa9jg\
-\x12\xb0\xa9 y\xb7\x00'\xe6x-K:%\xf0\xe9\
-D\xf3\xbcN\x155\xb7\xccrs\x01\xf2\xfe\xb6jk\
-\x8f\x02\x8f\x9d\xb7&\xea\x9c\x0f*R\xe3\xc7\xdb\xfc\x22\
-cy\xd7V3\x1f=\x0a\xdc\x19\xd7$\xe8\x9cM\xb8\
-\xc2*\x97g\xe2\x1b3\x94\xf7\xdb9>\xf3\x96*\xf0\
-\xcf\x13t\xd0,\xe5\xc9n\x8aig&\xf3\xbc}\xa5\
-\x5c\xb7\x12\x1a9\xaeZ`\x113\xdbH[\x8dB\xc6\
-\xc6i\x84UNM\x9d\xa2q{N\x8b4\xda\x22\xf0\
-9\x09:\xeaZe\xc9~\x07\xd3\xfa\x1a\xc5\xbd\x8bL\
-\xd66\xb7Q\xe0\x14\xabw\xceV\x92\x228\x1fXE\
-\xd88\x9fb\xf1\xce\x1d\xc0y%_\xa3\x12\x1a\xf9\xc5\
-\xc8\x1d\xf7\xa8b\x149\xe5\xb4\x80\xb0\x85\xaf\x93\x9a\xce\
-\x83\xd5\xbf1\x1fxI\x1b\xaeM\x09\x8d\x5c\x16Y\xe0\
-\x1f(D\xd1L\x00.&\xd4b^\x02\xdcG\xa8\x94\
-2@\xa8\x7f\xb5\xa7\xfa\xf5V\xc2\x89\x097W\xb3\x18\
-\xd3i\xb0zd7\x0b\xbc!\xb2\xc0\xf3\x94@\x14\xb8\
-\xdc\x0d\x0c\xd3\xedxQ\xe0\xfa\x88]\xfb\xea\x15v\xbc\
-(p}\x0cD\x16\xf8d;^\x14\xb8>b\x17\xe6\
-\xee\xb5\xe3E\x81\x15XD\x81\xbd\x85\x16i\xb7\xc0\xfd\
-\x91\x05\x9ef\xc7\x8b\x02\xd7\xc7\xef#\x0b|\x91\x1d/\
-\x0a\xecB\x0e\x11\x05\x1e\x01K#\x0b|\xb3\x1d/\x0a\
-\x5c\x1f_\x88,\xf0cv\xbc(p}\xa48F\xd4\
-\xed\x84\xa2\xc05\xe1\x86~\x91\x82\x05\xee\xc5\x92:\x22\
-\xc5\x0a\xdcC\x9a\xa2v\xb3\x1d\x00\xa2\xc0\xf5\xf0\xd9\x04\
-\x02o\xc6\xb2\xb2\xa2\xc0\xb5\x90\xea\x5c\xa4\x0f;\x08D\
-\x81\xd3s\x0c\xf0\xb7\x04\x02?E\xa6g\xde\x88\xb4I\
-\xe0\x1e\xc2\xd1\x8e)\xe2\xe1f\xa2\xc05\xf0&\xd2\xe5\
-\x93\x0e\x06Q\xe0\xf266<\x9f\xbd\xc0\xbb\x1d\x10\xa2\
-\xc0i\xb9:\xe1\xb7\xf0n\xe0\xed\x0e\x0aQ\xe0tL\
-&\x1c>\x95*\xcf\xfaM,\x0a\x9c\x96/\x936{\
-\x80\xb9\x0e\x0eQ\xe04\x9cR\xdd\xee\xa6\xce\x0a\xa7\x98\
-D\x81\xd3\xf0\x15\xea\xc9S\xc0\x15\xae\xd8\x12\x05\x8e\xcb\
-\x04\xe2\xd7\xca:\x5c\x1e\xacD>\xc6A#\x0a\x1c\x87\
->\xeaO?p=\xf0\x1a\x07\x8f(p\xe7\xfc\x94\xe6\
-\xb2\x9dP\xeeg>0\x83P$\xe0d\xac;-\x0a\
-<b\xa6&\x9eV2\xcddO\xd5\xaf[\xab\xc7\x97\
-{\xab\x1f\x96\x8b\x08\xdb@\xcf\x01\xc6)p\xf9\x02\xf7\
-\x00\xef\x01\x86\x1c\xf3]\x97\x7f\x01k\x08\xd5U\xa6w\
-\xab\xd0m\xf9 \xdfr<w}v\x007\x01\xe7)\
-py\xf4\x12Nj7\x06\xe0a\xc2\xb2\xdb\xc9\x0a\x5c\
-\xd6\x02\x8f?:v\xcd~\xd9E\xd8\x86z\xaa\x02\x97\
-\xf3R\xebq\xc7\xad9 \xbb\x09\x8b\x7f&*p\xfe\
-\xbc\x9e\xf8'\x1a\x9avd;a\xfd\x80\x02\x17 \xb1\
-\xdf\xc4f\xb8\xdcY\xdd\xad)p\xe6\xb7\xd3>\x13\x9b\
-\xe1\xf2O`\x8e\x02\xe7\xcd\x8b\x81\x8d\x8eU3L\x86\
-\x08S\x90\xbd\x0a\x9c\xf7\x14\xd37q\xb1\x87\x19>\xf7\
-U?\xec\x158c\xde\xeb\xcb-s\x98<\x02\xbcR\
-\x81\xf3\x7f.\xbe\xd3\xb1j\x86\xc9\xe3\xd5\x0bP\x05\xce\
-\x9c\x99\x84s\x82\x8d90\x03%I\xdc\xcd;9&\
-\x027\x10V\xeb\x18s\xe07\xf1T\x05.\xa7\xd2\xe5\
-5>\x1f\x9b\x03\xf2g\x0aX\x82\xa9\xc0\xffg\x12\xb0\
-\x10x\xc8\xb1k\xaal$\xf3)&\xc5=4\xaf\x03\
-\xbe\x06<\xe9\x18\xee\xfa|C\x81\xcb\xe5\xe8J\xe6O\
-\x00\xb7\x03;\x1d\xcf]\x97\xa1\xea\xa5\xa7\x02\xb7\x80c\
-+\xa1g\x01\x9f\x07n!\x94{\xd9B(\xff2@\
-(\x07c\xda\x95\x1d\xb9\xbe\xd4RJ\xc9\x91q\xc0I\
-\x84\x85\x15\xd3\x81y\xc0\x12\xe0\xd1\x06%\xbeS\x81E\
-:\xe7l\xc2\xf1:\xdb\x1a\x90x\xa6\x02\x8b\xc4{?\
-q)\xf0\xeb\x1a\x05\xde\x0e\x1c\xaf\xc0\x22\xf18\x8ap\
-j\xc6S5I|\x83\x02\x8b\xc4\xe7D\xe0G5\x08\
-\xbc\x8bP\xc0_\x81E\x120\xb7\x86\x99\x80k\x15X\
-$\x1d\xef\x22T\xdcH\x95g\x80\x13\x14X$\x1do\
-'\xed9\xd2\x0b\x15X$\xfd7\xf1`\x22\x81\x1fV\
-`\x91z\x9e\x89S\xe5\x8d\x0a,\x92\x9e\xe5\x89\x04\xfe\
-\xa6\x02\x8b\xd43\xc5\x94b\x9e\xf8)\xe0\x18\x05\x16I\
-\xcfG\x12}\x0b\xbfI\x81E\xeaY\xb1\xf5@\x02\x81\
-\xafV`\x91zx\x7f\x02\x81\xefT`\x91\xfa6@\
-\xf4G\x16x7a\xfb\xa3\x02\x8b\xd4\xc0\xf5\x09\xbe\x85\
-_\xab\xc0\x22\xf5\xf0\x9a\x04\x02\xf7)\xb0H}\xc4\xae\
-\xec\xf1y\x05\x16\xa9\x8f[\x22\x0b|\x8b\x02\x8b\xd4\xc7\
-\xfc\xc8\x02\xdf\xa3\xc0\x22\xf5qId\x81\xb7(\xb0H\
-}\xbc*\xb2\xc0\xfd\x0a,R\x1f/\x8e,\xf0\xd3\x0a\
-,R\x1f\xe3#\x0b<\xa8\xc0\x22\x0a\xac\xc0\x22\xdeB\
-\x8b\xf8\x12\xcb\x97X\x22N#)\xb0Hl\x16D\x16\
-\xf8n\x05\x8e\xc7\xc4\xea'\xec\x22`)\xf0+\xc2\xd1\
-\x9f;\x08\x05\xbf\xf7V\xbf\xee\x07\xee\xaf\xfe\xcc\x22`\
-\x060\xc1\xc1\xdd\x15,u)e^\x9c\x0a\x5cU\xfd\
-$\xec\xa4*\xff\x1e`=\xf0i`\x8a\x03\xbd\xb5<\
-\xe6f\x86<\xb8\x00X\x0d\xec#~\xf6\x01\xab\xaa\xff\
-\xc3A\xefv\xc2\xc3\xc5\xed\x84\xa3\xe4\x22`\x03\xf5e\
-\x03p\xa1\x83\xbf\x15\xdc\x90`|\xb8\xa1\x7f\x84\x9c\x0e\
-,\xa3\xb9\xac\x06\xceT\x82\xa2K\xea\xc4\xde\x0b\xbc\x0b\
-K\xea\x8c\x88\xcb\x08\x87J5\x9dg\x809\xcaP$\
-\x97%\x18\x0f\x16\xb5;\x02/\x02\xbeO~\xb9\xb1Z\
-\x92\xa7\x18ep\x14\xf0\xbb\x04\xe3`\xa1\x02\x0f\xcf\xf1\
-\xc0\x1a\xf2\xcd:29fR\x8e\xc8\xc7\x12\x8d\x81s\
-\x15x\xf8\xa9\xa1\x07\xc8?\x9b\x9dr\xca\x9e\x93\x80\xbf\
-%\xe8\xfb'\xab\xe7j\x05>\x80\xc9\xc0&\xca\xc9\x83\
-\x84\xf3w\x94%OnM\xd4\xef_o\xfa\xb3\xe5\xfa\
-\xcc{\x17\xe5\xe5\x97>\x13g\xc9\xa7\x12\xf6\xf9\xb9\x0a\
-|07Qn\xbe\xab0Y1\x9d\xceV\xe6\x1d.\
-\x1e\xf0}\x08\xe6P~>\xa08Y\xf0\x0e\xe0\xd9\x84\
-\xfd\xbcP\x81_\xc8\x19\x99\xcc\xf3v\x9a\x9d\xc0i\x0a\
-\xd4\xf8J\xbd]\x09\xfbx\x00\x98\xa4\xc0/d\x05\xed\
-\xc9\x0f\x95\xa8\xd1g\xde\xbd\x89\xfb\xf7K\xb9|\xde\x9c\
-~b\xb6)C\xb8\x09\xa2\x89\xa9\xa2\xdbk\xe8\xdb\x7f\
-V\xff\x97\x02\xef\xc7\x06\xda\x97\xf5JU\xdb\x0a\xab\x8f\
-&\x9a\xe7=T\xae\xcf\xe9\xf3\xe7\xd0\x88\x0bio\xce\
-W\xb0\xa4\x1b\x13.\x05~Sc\x7f>F(\x18\xa1\
-\xc0\xfb\xb1\xba\xc5\x02\xafR\xb4$\xfby\xaf'\xfe\xae\
-\xa2\x91\xe4}\xb9]\x8f\xa6\x1b0\xa5\x86\x17\x0eMf\
-\x1faI\xa8\xe2\x8d\x8e^\xe0d\xe0lB\xa9\xa3\xf9\
-\x8428\xdb\x1b\xec\xcb\xd59^\xab\xa6\x1bpU\xe2\
-\x8b\xfe\x1ca\xff\xf0L`*p,a\xef\xe6TB\
-\x15\x85e\x84\xa2\xdc)\xb3\xa0\xe6\x81\x7fy\xf5F\xff\
-\x11\xd2T*\xe9\xc6\x0c\x00/W\xe0\x83\xb9;\xe1E\
-\xbf\xad\x9a[>R\x1b^\x9ax\x0ak]M\xd7r\
-V\xc3\xdfPm\xcdP\xf5\xac\xdd\xa3\xc0\x07W\x8fL\
-\xb1\xcc\xed?\xc0\xdc1\xb4\xe7\xca\xea\xef\xc6\xce p\
-\x5c\xe2\x979\x8b\xf5,Y\xbeN\xc6\x8f\x1bm*\xae\
-\xfd|\xe6v\xd0\xa6y\x89\xdatq\xc2\xeb\xa8\xbc\xe9\
-r/\x0d\x96\xcb\xc9]\xe0E\x89n\x9b;m\xd7\xca\
-\x04\xed\xfa\x5c\xc2\xdbf\x93&\x7f\x04N\xc9\xfd\x85_\
-\x9b\x8ak?7\xc2g\xde#\xf1\xb2\x04/\xb6\x96$\
-za\xb5M\xcf\x92\xe4\x89\xeaEg\x8f\x02\x0f\xcf\xfd\
-\x91/\xfa\xb2\x88m[\x1e\xb9m\x1b\x13\x5c\xbf\xcb\xf5\
-,\xd9\x1b\xe7\xd7S\xc8\x94[\x9b\xaa\xe3\xcf\x8c\xd8\xb6\
-\xd9\x91\xdb\xb6-\xc1\xf5[\xa9k\xd1\xf3\x97\x92\xe4m\
-Z\xe0\x81\xc8\x17?\xe6<\xddY\x91\xdb\x96\xe2\xfcX\
-o\x9f\xe3\xe6\x0fd:\xd7\x9b\xab\xc0\xb1\xa7\x90z#\
-?_\xc6L\x8a\x13\xdc\xff\xadsQ\xdf6\x9fR\x9a\
-\xbcm\x13x\x9c\x02\x9bQf\x880\x0d\xd7[\xa2\xbc\
-M\x0b\xfc\x8f\x8co\xa1\xa7y\x0b\xdd\x15/\xab\xde[\
-\xaa\xb89\x08\xdc\x1f\xb9Cb\x9e\x10\x17\xbb6\x97/\
-\xb1\xf2\xca\xea\x12\x9fwi\xf94R\xcc26\xb1\xeb\
-\x08;\x8d\x94G\x1e\x07\xaeh\x83\xb8\xb4p!\xc7 \
-acB\xa7\xed:\x932\x16r\x8c\xa7\x99=\xb1%\
-f\x17p\x1d0\xa1M\xf26-p\x8a\xa5\x94+\x22\
-\xb4\xeb\xc7\x09\xda\xe5R\xca\xe6\x9es\xbfDF5\xac\
-\xda$\xf0\x8cD\x9dve\x07mZ\x90\xa8M\xd3\x13\
-^G73\x1c\x9c\xdf\x13\xea6Oj\xab\xb89\x08\
-\x9cr;\xe1\xbc1\xca\xfb\xdf\x04\xedq;a=y\
-\x12\xf8\x06\x19\x1cw\xd2-\x02\xa7\xde\xd0\xbf\x92\xb01\
-a$\xcf\xbc?I\xd8\x8e\xb55]\xcbn\xdb\xd0\xbf\
-\x9bp\xb8\xf6\xc2J\xda\xa3\xbbI\xdc\x5c\x04\xfeL\xe2\
-N\x1e$lL\x98MX\x1e\xd9[1\xad\x9a*Z\
-N\xba\xb3s\x9e\xcf\xfc\x1a\xafg[J\xea\xec\xa9\x9e\
-_\xb7\x02[\x08+\xa5\x96T\xef\x12\xfa\x80\xd7\x12\xca\
-#u}\xfd0\x8b\xda\xa5\x8dE\xed\xc4\xb2\xb2\x05\xe7\
-\x0e\x07\x99\xb4]\xe0\x0bZ,\xb0\x85\xdd\xa5+\x8eV\
-\xb9\xa7\x85\xf2\xaes\x80I\xb7\x08\xdc\xb6\xe3U\x86\x80\
-w:\xc0\xa4[\x04\xee!\x14\xa4kK\x969\xb8\xa4\
-\xdb\x04>\x9dv\x1c\xf0\xbd\xc37\xcf\xd2\x8d\x02\xa7\xa8\
-E\xd5D\xfa\x1cX\xd2\xad\x02\xf7\x00\xdf+X\xde\xc5\
-\x0e*\xe9v\x81\xc7\x13\x96\x1f\x96\x965\x14\x5c\x9aE\
-\x148&\x93\x80M\x05\xc9\xbb\x058\xd1\x01%\x0a\xfc\
-\xc2e\x96\x9b\x0b\x90\xf7\xb7U[\x1dP\xa2\xc0\x07p\
-<\xf0\x8b\x8c\xe5]\x0bLv \x89\x02\x1f\xfe\x99\xf8\
-\xc6\x0c\xe5\xfd\xb6\xcf\xbc\xa2\xc0\xa3\x9bb\xda\x99\xc9<\
-\xafSE\xa2\xc0c\xe0\xb4j\x95\xd3PC\xf2\xde\xee\
-\x22\x0dQ\xe08;\x98\xd6\xd7(\xee]\xb8\xb6Y\x14\
-8:\xe7\x03\xabHSyb/a?\xefy\x0e\x14\
-Q\xe0\xf4SN\x0b\x08[\xf8:\xa9\xe9<X\xfd\x1b\
-\xf3\x81\x978@D\x81\xebg\x02p1\xa1~\xd2\x12\
-\xe0>Bm\xa5\x01B\xad\xa5\xfd\xeb-m\x04n\x06\
-\xae!\x94~=\xceA!\x0a,\x22\x0a,\x22\x0a,\
-\xa2\xc0\x22\xa2\xc0\x22\xa2\xc0\x22\xa2\xc0\x22\x0a,\x22\x0a\
-,\x22\x0a,\xa2\xc0\x22\xa2\xc0\x22\xa2\xc0\x22\xa2\xc0\x22\
-\x0a,\x22\x0a,\x22\x0a,\xa2\xc0^\x04\x11\x05\x16\x11\
-\x05\x16\x91\x91\xf3?\xae7\xd0\xfcU\x93\xe1}\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x10\xfc\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-19T09:45\
-:01+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-19T09:46:04+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-19T09:46:04+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:e734b\
-b14-4543-a44b-b9\
-36-9742dd21ef74\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:e734b\
-b14-4543-a44b-b9\
-36-9742dd21ef74\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:e734bb14-4543\
--a44b-b936-9742d\
-d21ef74\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:e73\
-4bb14-4543-a44b-\
-b936-9742dd21ef7\
-4\x22 stEvt:when=\x222\
-023-07-19T09:45:\
-01+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>R\xabm:\x00\
-\x00\x0b\xb4IDATx\xda\xed\x9dK\x8cWW\x1d\
-\xc7\x87)\xc2\xc0Fy5\xa9\xb4\xd8\xc4\xc46\x22j\
-\xe2V\x8d\x06BR\xfa\x16\xb0\xa4qa\xd4J\xa1\xa5\
-\xa9T\x8aK\x17\xa45\xb6\x1a\x06I\x9a\x9a\xf8h\x8d\
-<\x9aX[\xddH\xbb0\xd1bk\x17\x16Z[]\
-0\xbckb)-\xa8\x14F`>.\xee%1}\
-Ng\xce\xe3\x9es?\xdf\xe4\x93\x10`\xf1?\xf7\xfc\
->\xff\xff\xb9\xe7\x9es\xee\x000 \x22e\xe2E\x10\
-Q`\x11Q`\x11Q`\x11\x05\x16\x11\x05\x16\x11\x05\
-\x16\x11\x05\x16Q`\x11Q`\x11Q`\x11\x05\x16\x11\
-\x05\x16\x11\x05\x16\x11\x05\x16Q`\x11Q`\x11Q`\
-\x11Q`\x11\x05\xee$\xf3\x80\xa5\xc0:`+\xf0$\
-\xf0<0\x02\xbc\x06\x8cbj\xcfh\xdb\xd7#m\xdf\
-?\xd1\xd6\xc2\xedmm\xccU\xe0\xee0\x03\xb8\x1e\x18\
-n;k\xcc\xfa5\xef\x911`/\xb0\x19\xb8\xae\xad\
-!\x05N\xc8 \xf0Y\xe0A\xe0\xa4\xf5h&\x99\x93\
-\xc0\xc3\xc0\x92\xb6\xb6\x148\x12C\xc0\xdavhdL\
-\x8c\x8c\x00k\x80\xe9\x0a\x1c\x8e\x99\xc0]\xc0?\xac/\
-\x93(/\x03\xebK\x18^w]\xdek\x81\x03\xd6\x93\
-\xc9\x94#\xc0\x0a\x05~\xff\x5c\x0e\xfc\xd6\xfa1\x1d\xc9\
-c\xc0\x02\x05\x1e\x1f7\xd0<\x060\xa6k\x93]_\
-V\xe0wf:\xcd\xe3 c\xba\x9c\x07\xbb4\xc9\xd5\
-\x15y\xe7\x00O[\x1b\xa6\x90\xec\x06f+p\xc3\x87\
-i\x16a\x18SR^\x02.\xeb\xbb\xc0W\x02\x87\xad\
-\x05Sh\x0e\x01W\xf4U\xe0K\x81\x83\xd6\x80)<\
-G\x81\x8f\xf4M\xe09\xed\x10\xc4\x98\x1a\xf2b\xae{\
-\xe2\x5c\xb3\xcdNX\x99\xda\xf2\x140\xad\x0f\x02o\xb5\
-\xafM\xa5\xd9\x5c\xbb\xc0+\xeccSy\xbeT\xab\xc0\
-\x97\x03'\xec_Sy^'\xe1\xb2\xcb\x94\x02\xff\xc6\
-\xbe5=\xc9\xafk\x13\xf8\x06\xfb\xd4\xf4,\xd7\xd6\x22\
-\xf0L\xd2?\xef=G3+\xb8\xa9\xbd'Y\x08\xcc\
-\x02>\x00\x9d\xdf\xff,\x93cZ\xdb\xd7\x0b\xdb\xbe\xdf\
-D\xb3\xf4\xf1\x5c\xe2\x1a\xdcO\x82\xfd\xc4).\xe8\xb7\
-\x13^\xb4C\xc0\x06\xe0\x12\x0bYx\xeb\x92\xdd\x0d\xa4\
-]\xf9wg\xe9\x02\x0f\x91\xe6$\x8dW\x80[\xfc\x85\
-\x95q\xfeB\xaf\x06\x8e%\xa8\xcb\xa3D\xde\xb9\x14\xfb\
-b\xadMp\x91~AGv\x86HQ\xcc\x01\xb6%\
-\xa8\xcf\xd5\xa5\x0a<\xd8\xde\x07\xc4\xca\x7f\x81oX\x88\
-2Inmk)V\xf6\x01SJ\x14\xf8\x8b\x11/\
-\xca)\xe0*\x8bO\x02\xb1\xac\xad\xa9X\xf9|\x89\x02\
-\xff,\xe2/\xef2\x8bN\x22H\x1c\xeb\x97\xf8\xc7\xa5\
-\x09<\x13\xf8W\xa4\x8b\xe1\xb0Yb\x0e\xa7c\xe4D\
-\xacGJ\xb1.\xc4\xf5\x11'\xac,4\x89\xc9\xf6H\
-\xb5{uI\x02o\x8ep\x01^\xa5\xb2\x17SI'\
-\x99\x1d\xe9\x11\xd3\xfd%\x09\xbc7\xc2\x05\xb8\xc5\xe2\x92\
-D\xac\x89P\xbf\xcf\x95\x22\xf0<\xc2\xbf%\xf0\x10\x19\
-6KK\xaf\x17{\x1c\x09\x5c\xc3\xe7\xdbg\xcf\x9d\x17\
-xi\x84o\xaf\x0d\x16\x95$fc\x84:^R\x82\
-\xc0wD\xf8\xe6\x9aoAIb\xe6\x13~\x03\xc4m\
-%\x08\x1c\xfa\xc8\x9c\xa7,&\xc9\xc43\x81kyK\
-\x09\x02?\x19\xb8\xd1\x9b,$\xc9\xc4=\x81kyW\
-\x09\x02\xbf\x10\xb8\xd17ZH\x92\x89\xd0g\xb8\xed)\
-A\xe0\x03\x81\x1b\xbd\xd0B\x92L,\x0a\x5c\xcb\xfbK\
-\x10\xf8x\xe0F\xbbUPr17p-\x1f+A\
-\xe0\xd1\xc0\x8d\xf6\xf9\xaf\xe4bz\xe0Z>S\x82\xc0\
-\xa1c!IN:]\xcf\x0a,\xa2\xc0\x0a,\x0a\xac\
-\xc0\x0a,\x0a\xac\xc0\x22\x0a\xac\xc0\x22\x0a\xac\xc0\xa2\xc0\
-\x0a,\xa2\xc0\x0a,\xa2\xc0\x0a,\x0a\xac\xc0\x0a\x5c\x11\
-\xd3\x80U\xc0\x0e\x9a7\x11\x9c\xa59\x88\xe1 \xcd\xbb\
-r\xbfFs\xd4\xb0\x02+\xb0t\x8c\xe5\x8c\xef\x8d\x7f\
-\xc7\x80\xaf\x13\xf15#\x0a\xac\xc02~\x06\x81\xe1\x09\
-\xf4\xe76\xca\xda\xa0\xa2\xc0\x0a\x5c%\xc3\x93\xe8\xd3G\
-\x0a\xfa%V`\x05\xaer\xd8<\xd9\xacS`\x05\x96\
-<\x13V!^\x1b{\x822\x0ekP`\x05\xae\x8a\
-U\x01\xfb\xf6[\x0a\xac\xc0\x92\x96\x9d\x01\xfb\xf6\x8f\x0a\
-\xac\xc0\x92\x96\xfd\x01\xfb\xf6\x8dv6[\x81\x15X\x12\
-q:p\xff\xceR`\x05\x96t\xbc\x11\xb8\x7f?\xa4\
-\xc0\x0a,\x0e\xa1\x15X\x81\xc5I,\x05V`\x1f#\
-\xf9\x18I\x81\x15\xd8\x85\x1c\x0a\xac\xc0\xe2RJ\x05V\
-`q3\x83\x02+\xb0\xdb\x09\xddN\xa8\xc0\xe2\x86~\
-\x05V`\xf1H\x1d\x05V`\xa9\x1c\x05V`Q`\
-\x05\x16Q`\x05\xce2[\xfbQ\xe0\x1a\xe0n\xe0G\
-\xc0O\xdbG)\x8f\xb4\x7f\x1en\xff\xed\xda\xf6\xffN\
-Q\x1c\x05V\xe0|\xccn'n\xb6\x03\xafL\xa0\xcd\
-\xff\x04~\x09|\xb5\x90\xd5J\x0a\xac\xc0\xc5\x0b<\x05\
-X\xdcJ\x1br\xcf\xec\xe9\xf6\xd9\xe9beR`\x05\
-\x8e\xc3\x12\xe0Y\xe2g\x0f\xb0\xd2!\xb6\x02+p\x18\
->\x0d<M\xfa\xfc\x09\xf8\x94r)\xb0\x02O\x8c\x99\
-\xc0\xfd\xed\x82\x85\x5c9\x0b\xdcW\xf0\x02\x09\x05V\xe0\
-,\x5c\x09<Ow\xf27\xe0\x13\x8a\xa6\xc0\x0a\xfc\xde\
-|\x05\xf8\x0f\xdd\xcb\xbf\x81\x9b\x95M\x81\x15\xf8\x9d\xd9\
-\x08\x8c\xd1\xdd\x8c\x01\xdfU8\x05V\xe0\xb7.\xc4x\
-\x80r\xf2\x00\xdd?(N\x81\x158\x99\xbc?\xa7\xbc\
-l\x07\xa6*\x9f\x02\xf7Y\xe0R\xe5Ub\x05\xee\xbd\
-\xc0\xa5\xcb\xab\xc4\x0a\xdc[\x81k\x91W\x89\x15\xb8w\
-\x02\xd7&\xaf\x12+po\x04\xaeU^%V\xe0\xea\
-\x05\xae]^%V\xe0j\x05\xee\x8b\xbcJ\xac\xc0\xd5\
-\x09\xdc7y\x95X\x81\xab\x11\xb8\xaf\xf2*\xb1\x02\x17\
-/\xf0 \xf0P\x06i\xce\x00\x8f\x03\xebi6\xe6\xaf\
-\x04\xeej\xffn4\xc3\xe7y\x88|\xcb.K9+\
-L\x81;&p\x0eyG\x81\xef\x03\x17\xbf\xcb\xe7\xba\
-\x98f\x7f\xefh\xc5\x12\x97xV\x98\x02w\xa8\xc19\
-\xe4\xdd\x0b|\xfc}|\xc6\x85\xa4\xdfo\x1cS\xe2\xd2\
-\xcf\x0aS\xe0\x8e48\x87\xbc\x8f\x023&\xf0Yg\
-\xd2\xbc\x92\xa4t\x89k8+L\x81;\xd0\xe0\x1c\xf2\
->\x04\x5c4\x89\xcf|Q\xa6\xcf\x1cB\xe2\x9a\xce\x0a\
-S\xe0\xcc\x0d\xce1\xdb\xbc}\x92\xf2\xe6\xfe\xec\x13\x9d\
-\x9d\xae\xf1\xac0\x05\xce\xd8\xe0\x92\xe5-M\xe2Z\xcf\
-\x0aS\xe0L\x0d\xaeA\xdeR$\xae\xf9\xac0\x05\xce\
-\xd0\xe0\x9a\xe4\xed\xba\xc4\xb5\x9f\x15\xa6\xc0\x89\x1b\x5c\xa3\
-\xbc]\x94\xb8/g\x85)p\xc2\x06\xd7,o\x97$\
-\xee\xd3Ya\x0a\x9c\xa8\xc1}\x90\xb7\x0b\x12\xf7\xed\xac\
-0\x05N\xd0\xe0>\xc9\x9b\xb3\xcd;\xc8\xb3\x86<\xa7\
-\xc4\x0a\x1c\xb9\xc1}\x94\xd7\x1dU\xe9$V\xe0\x88\x0d\
-\xee\xb3\xbcJ\x9cFb\x05\x8e\xd4`\xe5U\xe2\x14\x12\
-+p\x84\x06+\xaf\x12\xa7\x92X\x81\x037Xy\x95\
-8\xa5\xc4\x0a\x1c\xb0\xc1\xca\xab\xc4\xa9%V\xe0@\x0d\
-V^%N\x917o\xa9T\xe0\x00\x0dV\xde\xba%\
-\xee\xf2Ya\x0a<\xc9(o\xbd\x12\x97pV\x98\x02\
-O2\xca[\xa7\xc4\xa5\x9c\x15\xa6\xc0\x85Mb\xd4$\
-oW%.\xe9\xac0\x05V^%~\xd3\xafZi\
-g\x85)\xb0\xf2*1\xe1\x0e\xcd\x1b,Xb\x05V\
-\xde\x22%\xdeA\xf9g\x85)\xb0\xf2\xf6V\xe2\x1d\x84\
-\x7f\x17S\x89\x12+\xb0\xf2\xf6\xea\xb4\xcb\xda\x86\xd3\x0a\
-\xac\xbcJ\x5c\xb0\xc4\x0a\xac\xbcJ\x5c\xf0pZ\x81\x95\
-7\x8a\xc4\x0f+\xb1\x02\x0f(o\xd1\x12\xff\xde\xe1\xb4\
-\x02+o\xd9\x12\xbf\xa4\xc4\x0a\xac\xbc\xe52U\x89\x15\
-Xy\x1dN+\xb1\x02+\xaf\x13[\xd5I\xac\xc0\xca\
-\xeb#\xa6\x82g\xa7\x15Xy\x95\xb8`\x89\x15\xf8]\
-\x12j\xb7\x8b\xe4\x1f\x86\xc6\xe8\xcb.\x0c\xa7\x15Xy\
-{#\xf1p%\xedP`\xe5\xed\xad\xc4\xcb+\x93X\
-\x81\xbd\xe7\xed\xd5=\xf1A`z%\xf7\xf6\x0a\xac\xbc\
-\xbd\x94\xf8\xa6\x8a&\xe8\x14\xd8as\xef\x86\xd3;+\
-\xba-P`\xe5\xed\x9d\xc4\xfb+\xfa2\xea\xbd\xc0\x0e\
-\x9b\xfb7\x9c>]\xd1mA\xaf\x05V\xde~J|\
-\xaa\xa2/\xa3\xde\x0a\xec\xb0\xb9\xbf\xc3\xe9\xfd\xd4s[\
-\xd0K\x81\x95\xb7\xdf\x12\xef\xac\xe8\xcb\xa8w\x02;l\
-v8}\x13\xf5\xdc\x16\xf4N`\xe5\xed\xb7\xc4\xb1\x16\
-r\x8c\xb7\x1d\x0a\xdc\xa5\x06Kq\xc3\xd0\xe5\x99\xdb\xa1\
-\xc0\x0a\xac\xc4\x13\xccp\x07\xda\xa0\xc0\x0a\xdc{\x89\x87\
-'(\xef\xa0\x02+\xb0t\x83\xe5\xc0\xe1q\xf4\xf7\xe1\
-\x0e\x0c\x9b\x15X\x81\xe5m\x98\x06\xac\xa2y\xd1\xd9>\
-\xe0l\xcb\xbe\xf6\xefV\xb5\xffg@\x81\x15XD\x81\
-\x15X\x14X\x81\x15X\x14X\x81E\x14X\x81E\x14\
-X\x81E\x81\x15X\x81E\x81\x15XD\x81\x15XD\
-\x81\x15X\x14\xb8\x5c\x81G\x037x\x9aE$\x99\x98\
-\x1e\xb8\x96\xcf\x94 \xf0\xf1\xc0\x8d\x9em!I&\xe6\
-\x05\xae\xe5c%\x08| p\xa3\x17ZH\x92\x89E\
-\x81ky\x7f\x09\x02\xbf\x10\xb8\xd17ZH\x92\x89\x15\
-\x81kyO\x09\x02?\x11\xb8\xd1\x9b,$\xc9\xc4\xbd\
-\x81k\xf9w%\x08\xbc5p\xa3w[H\x92\x89g\
-\x03\xd7\xf2p\x09\x02\xaf\x0b\xdc\xe8\xf3\xc0\xa5\x16\x93$\
-f>p.p-\xaf-A\xe0\xa5\x11\x9e\x9d\xddm\
-AIb\xbe\x13\xa1\x8e\x97\x94 \xf0\x5c`,p\xc3\
-\x0f\xfb<X\x12?\xff=\x1aa$9\xa7\x04\x81\x07\
-\x80\xbd\x11\xbe\xbdV[X\x92\x88\xdb\x22\xd4\xef_b\
-|\xd6X\x17`s\x84\x0bp\xbc\xfdu\xb7\xc0$&\
-s\xda\x05\x17\xa1s_I\x02_G\x9cl\xb3\xc0$\
-2;#\xd5\xee\xb2\x92\x04\x9e\x01\x9c\x8ct!\x1cJ\
-KICg\x80\xd7\x81\xa1\x92\x04\x1e\x00~\x12\xe9b\
-\x9c\x03n\xb0\xd8$0W\xd3\x9cQ\x1d#\x0f\xc6\xfa\
-\xdc1/\xc8\x17\x88\x97S\xed\x05\xb7\xf0$\x04\xd7\xb4\
-5\x15+\x9f+Q\xe0A`$\xe2E9\x0b\xdcj\
-\xf1I\x80a\xf3\xd9\x88u\xba\x0f\x98R\xa2\xc0\x03\xc0\
-\x1a\xe2g{\x8c\xe7kR=s#NX%\x9b\xb3\
-\x89}\x91\x86\x80\x97\x13\x5c\xa4W\xdb/\x0b\x17{\xc8\
-x\x16i\xdcN\xf8}\xebo\x97#D~9y\x8a\
-\x0b\xb6\x9et9\x02l\xa4Y\xc7j\xb1\xca\xffsY\
-\xbb<\xf2h\xc2z\xbc#v\xbbR\x5c\xb8\x994\x1b\
-\x99S\xe6<\xf0\x0cp\x0f\xcd\xab*\x17\xb5\xc3l\x7f\
-\xa1\xebg\x1a\xcd).\x9f\xa4\xd9\xcf{/\xf0\xe7\xb6\
-&Rf_\xacGG\xa9\x05\x1e\x00\xae\xc2\x98~%\
-\xc9S\x92\x94\xdf\x8c\x8f\xdb\xa7\xa6'\xf9U*\xafR\
-\x0a\xbc\x80fE\x8a15\xe7\xb5\xf6~\xbb:\x81/\
-<0\x1f\xb3\x8fM\xa5\x19#\xf1*\xc1\x1c\x93\x0c[\
-\xecgSi~\x98\xda\xa7\x5c\xcf\xe1v\xdb\xd7\xa6\xb2\
-\xfc\x81\x0cO9rM\xf5\x7f\x90\xe6\x88Mcj\xc8\
-_\x81Y9\x5c\xca}h\xd8A\xfb\xde\x14\x9e#)\
-'\xad\xba$\xf0\x00p\x05p\xc8\x1a0\x85\xe6\x10\xf0\
-\xb1\x9c\x0eua\xe5\xcc%\xc49C\xcb\x98\x98y1\
-\xe7/o\x97\x04\x1e\xa0Y\xfa\xe6\xc4\x96)i\xc2j\
-V\x17\xdc\xe9\xd2\x1a\xd6\xa9\xc0\xf7\xf09\xb1\xe9n\xc6\
-h\xde\xae\xd0\x995\xf5]\x5c\x8c~=\xcdj\x16c\
-\xba\x94\x13\xc0\xca\xae\xf9\xd2\xd5\x1d%\x0b\x80\xc7\xac\x19\
-\xd3\x91<\xda\x85\xfb\xdd\x92\x04\xbe\xc0b\xe0\xef\xd6\x8f\
-\xc9\x94\x11\x22\x1d\x07\xdb\x17\x81/\x1cQ{'i7\
-b\x9b~\xe7\x08\xcdf\xfc\xa1\xae\xfbQ\xdaQ(\xab\
-i6J\x1b\x13#\xfb\x80oR\xd0\xc1\x0f\xa5\x9e\xba\
-\xf0\x99v6\xf0\x985g\x02LN=L\xf3\xe6\xc0\
-)\xa5\xb9P\xfa\xf1)C4'\x1f\xfc\x00x\x8e\xf4\
-\xc7\xa6\x98\xf2r\x9e\xe6Ec\xf7\xb7\xf7\xb7C%;\
-P\xe3\x8b\xa9\x96\xd0\xbcHy\x0b\xb0\x8bf\xd3\xc4\x08\
-\xcd)\x84\xa3\xd6o\xf5\x19\xa59\xa5t\xa4\xfdR\xdf\
-\xd5\xd6\xc2\xda\xb66\xaa:\x82\xd8C\xd0D\x14XD\
-\x14XD\x14XD\x81ED\x81ED\x81ED\x81\
-E\x14XD\x14XD\x14XD\x81ED\x81ED\
-\x81ED\x81E\x14XD\x14XD\x14XD\x14X\
-D\x81E$7\xff\x03\xec\xd0\x0a\xc0\x82H3\xfc\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x0c\xb7\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:09:01+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:09:01+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:31994\
-09e-2e5b-4244-a9\
-d4-96db264145d6\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:31994\
-09e-2e5b-4244-a9\
-d4-96db264145d6\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:3199409e-2e5b\
--4244-a9d4-96db2\
-64145d6\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:319\
-9409e-2e5b-4244-\
-a9d4-96db264145d\
-6\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\x95\xb1\xa8\xbc\x00\
-\x00\x07oIDATx\xda\xed\xdd\xcdoUE\x1f\
-\xc0qB\xa4\xf8\x8a;\x04A\x09\x7f\x88 1\xc0\x1a\
-\x0ai\xfd\x0f\x14\x12\x82;\xe4op\xd3D\x16\xae\x90\
-\x97`\xbb\x85\x9d\x09\x12\xf0\x8d\x8d\xfc\x05\xa5\xd6n\x0d\
-\xc2\x06Z^\xc2q&\xf7\x9a\xa8\xc1rmg\xe6\xce\
-\x9c~~\xc9g\xf3\xe4y\x12=3\xdf\xe7\x9c\xde\xf6\
-\x9e\xd9\xd4u\xdd&\xa0M.\x02\x08\x18\x100 `\
-\x100 `@\xc0\x80\x80A\xc0\x80\x80\x01\x01\x83\x80\
-\x01\x01\x03\x02\x06\x04\x0c\x02\x06\x04\x0c\x08\x18\x100\x08\
-\x18\x100 `\x100 `@\xc0\x80\x80A\xc0\x80\
-\x80\x01\x01\x03\xcd\x05\xfcFp88\x1b\x5c\x08n\x07\
-\xbf\x06\x7f\x04O\xba\xfa\xe7i0\x1f\xcc\x06\xd3\xc1\x84\
-\x0dH\xdf\x03~'8\x1d\xdc\x0a\x1ew\xfd\x9a\xa5`\
-\xd2&\xa4\x8f\x01\x7f\x18\x5c\x1b\xde\xb5\xfa>_\x04\x9b\
-mF\xfa\x10\xf0G\xc1\x8f\xdd\xc6\x9b\x0b\x22\xa6\xe5\x80\
-w\x06\x17\xbb\x8d=\xdf\x04\xaf\xd8\x94\xb4\x16p\xfc@\
-\xe7Ag\xdc\x89i*\xe0W\x83\xaf4+b\xda\x0b\
-\xf8\xcd\xe0[\xadz\x9c\xa6\xbd\x80\xe3\xaf\x86\xeeh\xd4\
-\x9d\x98\xf6\x02\xde&^wb\xda\x0c8\xfe\xcc{S\
-\x93\xee\xc4\xb4\x19\xb0\x0f\xac\xdc\x89i4\xe0\xe3\x1a\x14\
-1m\x06\xfc\xae\xdf\xf3z\x9c\xa6\xdd\x80gu\xe7N\
-L\x9b\x01\x7f\xa47wb\xda\x0d\xf8{\xad\xb9\x13\xd3\
-f\xc0\xfb5\xe6NL\xbb\x01_\xd3\x97\x88i3\xe0\
-\xed\xdd\xc6\xf82\xbe\xc7iz\x19\xf0g\x997\xecJ\
-7\xf8\xfe\xf0\x91`O\xb0\xa5\xb2\x0b\xbbyxgt\
-'\xa6\xc9\x80oe\xdc\xa8W\x86\xbf[\xae\xfd\xe2\x8a\
-\x98&\x03\x8eo\x8f\xcc\xf1\x02\xbag\xc1'\x8d]`\
-\x11\xd3\x5c\xc0\x873m\xccO\x1b\xbd\xc8\x22\xa6\xa9\x80\
-\xcffzln\xf9B\x8b\x98f\x02N\xbdQ\x97\x1b\
-\xf9\x99W\xc4\xf4\x22\xe0\xdb\x897\xe1\xc5\x1e]p\x11\
-S}\xc0\x8b\x897\xe0\x91\x9e]t\x11Su\xc0\xf7\
-\x12o\xbe\xf7{x\xe1cL_\xfbc\x0fj\x0c8\
-\xf5\xaf\x90\xb6\xf4\xf4\xe2\x8b\x98*\x03N=}^\x80\
-q<N\x9b\xc1\xc4\x1bM<\xd9\xf2\xee\xf0s\x9b\xf8\
-\x7f\xa6\x9f\x07\x87\x86\x7f\xcb `\x01\x8b\xb8\xe1\xb8\xe3\
-_\x13\x9e\xee\x06\xafA\x16\xb0\x80E\xdc\xe8\xc4/\xe5\
-\x5c\x0d\xf6\x09X\xc0\x22n{\xe2\x0b*\x0e\x08X\xc0\
-5}\xb0e\xfe\xff\xc4\xef\xba\xbf'`\x01\xbb\x13\xb7\
-;\xf1M\xab\xc7\x05,`\x11\xb7=\xe7\x82\xad\x02\x16\
-\xb0\xc7\xe9v\xe7F\xf0\xb6\x80\x05\xecN\xdc\xee\xc4C\
-\xfb\xb6\x0bX\xc0\x22n;\xe2m\x02\x16\xb0\x88\xdb\x9d\
-\xeb%\x7f&\x16\xb0\x9f\x89M\x9e\x0f\xb6\x04,`\x11\
-7<\x1f\x0bX\xc0\x1e\xa7\xdb\x9d\xfb\xc1\x0e\x01\x0b\xd6\
-\x9d\xb8\xdd\xb9$`\xb1\xba\x13\xb7;\xcf\xbb\xc1\x19a\
-\x02\xc6\x9d\xb8\xd1\xb9)`^\x16\xf1\x8cN\xaa\x9e\x0f\
-\x04\xcc\xcbL\x06KZ\xa9r\xae\x0a\x98QL\x04\xd3\
-\xc1l0\xdf9!\xb2\x96\x89\xeb\xb0]\xc0\x90N|\
-\xb9\xdf\x9e\xe0\xe8\xf0\xd3\xe2\x95\xcc\x11\x9f\x120\xe4\xb3\
-k\xf8\xe4\x92kn\x08\x18\xf2;\xd1\x0dN\xc2L=\
-\xf1\x0e\xff\x9a\x80!\xbf\x93\x99\xee\xc2\x07\x05\x0ce\xcc\
-e\xd8\xcbg\x04\x0ce\xec\xce\xf0\xc1\xd6y\x01C9\
-\x97\x13\xef\xe5\x9f\x04\x0c\xe5\x1cK\xbc\x97\x17\x04\x0c\xe5\
-\xecM\xbc\x97\x7f\x170\x94\xfd\xcb\xb6\xd4\xbfJ\x120\
-\x14T\xf5~\x160\x08X\xc0\x08X\xc0\x02F\xc0\x02\
-\x06\x01\x0b\x18\x04,`\x04,`\x10\xb0\x80A\xc0\x02\
-F\xc0\x02\x160\x02\x160\x08X\xc0 `\x01#`\
-\x01\x0b\x18\x01\x0b\x18\x04,`\x04,`\x01#`\x01\
-\x83\x80\x05\x0c\x02\x160\x02\x16\xb0\x80\x11\xb0\x80A\xc0\
-\x02\x06\x01\x0b\x18\x01\x0bX\xc0\x08X\xc0 `\x01#\
-`\x01\x0b\x18\x01\x0b\x18\x04,`\x10\xb0\x80\x11\xb0\x80\
-\x05\x8c\x80\x05\x0c\x02\x160\x08X\xc0\xf4\xc1\xa3\x84{\
-\xf9\xa1\x80\xa1\xac\x85\x84{yA\xc0P\xd6\x5c\xc2\xbd\
-<'`(k:\xe1^\x9e\x120\x945\x91\xe81\
-z1\xd8*`(o2\xc1>\x9e\xcc\xf1\xcf&`\
-\x18\xcd\xcc:\xf6\xf0L\xae\x7f.\x01\xc3h6\xaf1\
-\xe2\x99\xe1\xffV\xc0P\xc9\xe3\xf4\xd2\x08\xfbv)\xd7\
-c\xb3\x80a\xfd\x1fl\xc5O\xa7g\x83\xf9\xe0\xe9\xd0\
-\xfc\xf0?\x9b\x1e\xfew6\x09\xd8f\x01\x01\x83\x80\x05\
-\x0c\x02\x160\x08\x18\x04,`\x10\xb0\x80A\xc0\x02\x06\
-\x01\x83\x80\x05\x0c\x02\x160\x08\x18\x100\x08X\xc0 \
-`\x01\x83\x80\xa1\x9d\xef\xef\x0a\x18\x1a~\x83\x86\x80a\
-4U\xbe\xc3J\xc00\x9a*\xdf\x22)`\x18\xed\xb1\
-y\xbd3)`\x013\x9e\x0f\xac\xaa=IA\xc0\xb0\
-\xba\xaa\xcf2\x120\xac\xae\xea\xd3\x04\x05\x0c\xab\xab\xfa\
-<_\x01\xc3\xea\x96\x13\xee\xbde\x01\x0b\x98\xb26\xd4\
-\xfes\x01\x11\xb0\x80\x05\x8c\x80\x05,`\xec?\x01#\
-`\x01\xbb\x80\x08X\xc0\x02F\xc0\x02\x06\xfbO\xc0\x08\
-X\xc0. \x02\xeeq\xc0\x8f\x13_\xc0\x09\x9b\x12\x01\
-\x97\x0b\xf8^\xe2\x0b\xb8\xc7\xa6D\xc0\xe5\x02\xfe-\xf1\
-\x05<jS\x22\xe0r\x01\xdfN|\x01/\xd9\x94\x08\
-\xb8\x5c\xc0\x17\x12_\xc0\x95`\x97\x8d\x89\x80\xcb\x04|\
-6\xc3E\x9c\xb51\x11p\x99\x80\x0fuy\xe6\x84\xcd\
-\x89\x80\xf3\x07\xfcz\x86_%\xc5y\x16\x9c\xb4A\x11\
-p\xde\x80\xa3\x9b]\xbe\x89/\x1a\xdbm\xa3\x22\xe0|\
-\x01\x9f\xee\xf2\xce\xca\xf0\xd3\xe9c\xc1^\x7f\xec\x81\x80\
-\xd3\xda\xde\x0dN\x7f3\xe3\x9f\x9aN\xe1{\xd1)\x81\
-\xd6\xa3\xc2\x80\xa3\xab\xda\xa9r\xc6u\x0a\xdf\xa8\xa7\x04\
-Z\x8fJ\x02\xdeom\xaa\x9eR\xa7\xf0\xad\xf5\x94@\
-\xeb1\xe6\x80\xa3\x1f\xacK\xf5\x9b&\xf7\x1e\x10o\xc6\
-\xf5\xc8\xbdx\x07\xacI\xf5\x93\xf3qz\xd2\xe5\xcd\xbb\
-\x1e%~\xf6\xb9bM\xaa\x9e\xc5.\xcf)|\xa9N\
-\x09\xb4\x1ec\x0exg\xf0\xc0\xbaT=\xd3\x19\xd6}\
-\xdae]\xf3L\xd5\x14pt\xdc\x9aT=9N\xe1\
-\x9bsY\xf3\xafG\xc9_#\x9c\xb3.\xd5N\x8eS\
-\xf8<>\x17X\x8f\x92\x01\xc7\xe7\xfa\xef\xacM\x95\xf3\
-(\xc3z/\xbb\xack\x9e\xe5\x1a\x03\x8e\xde\x0a~\xb1\
->\xd5\xcd\xc3\x0ck\xfd\xc8e\xcd\xbf\x1e\xe3\xf8s\xba\
-\xf8g\x96w\xac\x91Gh\xd3\xd6#\xf4\xdfm\x0b\xae\
-['\x1fb\x99v>\xc4z\xd1\xcf\xc4_Z\xab*\
-\xc6\xaf\x91\xea\x9a\xa9\x16\x02\xfeK\xfcJ\xe0}k6\
-\xb6\xf1\x87\x1c\x0d\xafG-\xdfk\xdc\x11\x5c\x0e\x9e[\
-\xbf\xe2\xe3O)\x1b^\x8f\xda\xbe\xa0\xbc\xbf\xcb\xfb6\
-\x0f\xf3\xcf\xf1e\x86\xc6\xd7\xa3\xd67\x0d\xec\xeb\x06\xdf\
-'~bM\xb3n\x16_'l|=j\x7f=J\
-\xfc\x95\xd3\xa9\xe0F7x\x8d\x8eY\xff\xf8B\x7f\x8f\
-\xd6\xa3\xa5w\x1d\xc5\xb7]\x1e\x0c\xce\x04\xe7\x83\x9f\x83\
-\xbb\xdd\xe0,\xa6\xc7\xf6\xc1\x7f\x8eW\xea\xf4x=\xbc\
-\x04\x0d/\xb5[}6\xe4K\xed@\xc0\x02\x06\x01\x0b\
-\x18\x01\x0b\x18\x04,`\x10\xb0\x80A\xc0\x02F\xc0\x02\
-\x06\x01\x0b\x18\x04,`\x04,`\x10\xb0\x80A\xc0\x02\
-\x06\x01\x0b\x18\x01\x0b\x18\x04,`\x10\xb0\x80A\xc0 \
-`\x01\x83\x80\x05\x0c\xeb\x92\xf2T\xc4\x87\x02\x86\xb2R\
-\x1e\xe7\xb2 `(+\xe5\xa9\x88s\x02\x86\xb2R\x9e\
-\x8a8%`(+\xd5\xa9\x88\x8b]\x9eS\x1b\x05\x0c\
-/\x91\xe2T\xc4\xc9\x16\xfe]-6}\xb5\x9e\x03\xd5\
-fZ\xf9\xf7\xb4\xd0\xf4\xd5ZOE,uj\xa3\x80\
-a\xc4\xc7\xe9QNE\x5cj\xe5\xb1Y\xc0l\xc4\x0f\
-\xb6\xfe}*bM\xa76\x0a\x186\x22\x17\x01\x04\x0c\
-\x08\x18\x100\x08\x18\x100 `@\xc0 `\xa0\x12\
-\x7f\x02\xcbn\xdd\xb08\x18\xc1n\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x0b\xb1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:09:04+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:09:04+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:f9d84\
-59b-e1db-2e4c-ba\
-94-5501768f1ada\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:f9d84\
-59b-e1db-2e4c-ba\
-94-5501768f1ada\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:f9d8459b-e1db\
--2e4c-ba94-55017\
-68f1ada\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:f9d\
-8459b-e1db-2e4c-\
-ba94-5501768f1ad\
-a\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\x87.\x8d]\x00\
-\x00\x06iIDATx\xda\xed\xdd?k$u\x1c\
-\xc7\xf1\xf3NN\x83\x85\x07V\x16Z\x09\x01;-\x82\
-\x96v\xb1\xb0\x0a\x98\x05\xe1J\x9f\x82\xad\xe4\x19\xa4\xc9\
-\x03\xb8\xeaR\xdbh\x11\xd0\xd2&\xd8\xd9\xacA\xce\xc6\
-V\xd0\xbb\xe0\x99\x1b\xbf\xc3\xcd\x82\xc5\x1d\xf9\xe3\xec\xee\
-|~\xfb\xfa\xc1\xbb9\xc2\x15\xcb\xbc`\xb3\x9f\xcc\xec\
-\xad\xae\xebnI\xca\xcc\x8b \x01,\x09`I\x00K\
-\x00K\x02X\x12\xc0\x92\x00\x96\x00\x96\x04\xb0$\x80%\
-\x80%\x01,\x09`I\x00K\x00K\x02X\x12\xc0\x92\
-\x00\x96\x00\x96\x04\xb0$\x80%\x80%\x01,\x09`I\
-\x00K\x00K\x02X\x12\xc0\x92\x00\xfeOw\xabY\xf5\
-\xb0\x9aWO\x87\xe6\xc3\xbf\xcd\x86\x9f\xf1Z\x09\xe0\x89\
-\xb5W=\xea.?\xfd\xcf\xec{\xbd\x04\xf04\xba]\
-\x1dv\xd7?'\xd5\xb6\x8bG\x00\xaf\xb7\x9b\xe0]\x9c\
-\xf3\xea\xa0\xdar\x11\x09\xe0\xf5\xbcm\x1e\xe3\xf4\xbf#\
-\xef\xba\x90\x04\xf0j?\xb0:\xeb\xc6=\xdfT\xef\xba\
-\xa0\x04\xf0\xf2\x9bu\xcb9\x7fV_U\xaf\xba\xb0\x04\
-\xf0\xf2:\xee\x96{N\xab\x1d\x17\x97\x00^Ng\xdd\
-\xf2\xcfEuT\xdds\x91\x09\xe0q{\xd2\xad\xee\xfc\
-^\xdd\xaf^q\xb1\x09\xe0qZ\xc7\xf9\xa1z\xdf\x05\
-'\x803\x01\xf7\xe7\xefa{~\xc3\x85'\x80\xf3\x00\
-/\xce/\xd5\xa7.>\x01\x9c\x09\xd8v,\x80\x1b\x00\
-l;\x16\xc0\xe1\x80\x17\xe7\xa7\xeac\x17\xa4\x00\xce\x04\
-\xdc\x9fg\xd5\x83\xea-\x17\xa6\x00\xce\x03l;\x16\xc0\
-\x0d\x00^\x1c\xf7\x1d\x0b\xe0`\xc0\xb6c\x01\x1c\x0e\xd8\
-v,\x80\x1b\x00l;\x16\xc0\x0d\x00\xb6\x1d\x0b\xe0F\
-\x8e\xedX\x00\x87\x1f\xdb1\xc0\x007pl\xc7\x00\x03\
-\xdc\xc0q\xdf1\xc0\x00_\xf3\x5cL\x0c\xb1gV\x03\
-\x0c\xf05\xce\x07\xd5\x8f\xb6c\x01\x9c\x09\xb8\xff?\xfb\
-\xafi\xf9\xb2\xfa\xc3v,\x80\xf3\x00/z{\xf8T\
-\xd8v,\x80\x03\x01/\xfa\xa4\xfa\xd9v,\x803\x01\
-\xf7\xbd^}\xdd\xad\xf61\xb6\xb6c\x80\x01\x1e\x09\xf0\
-\xa2\xf7\xaaom\xc7\x028\x13\xf0\xa2\xcf\xaa\xdfl\xc7\
-\x028\x13p\xdf\x9b\xdd\xf3\xfb{\xff\x99\x18b\xf7\x1d\
-\x03\x0c\xf05\xb2\x1d\x0b\xe0`\xc0\xb6c\x01\x1c\x0e\xd8\
-v,\x80\x1b\x00l;\x16\xc0\x0d\x00\xb6\x1d\x0b\xe0p\
-\xc0\xb6c\x01\xdc\x00`\xdb\xb1\x00n\x00\xb0\xedX\x00\
-\x87\x03\xb6\x1d\x0b\xe0\x06\x00\xdb\x8e\x05p8`\xdb\xb1\
-\x00n\x00\xb0\xedX\x007\x00\xd8v\x0c0\xc0\xe1\x80\
-m\xc7\x00\x03\xdc\x00`\xdb1\xc0\x007\x00\xd8v\x0c\
-0\xc0\xe1\x80m\xc7\x00\x03\xdc\x00`\xdb1\xc0\x00\x87\
-\x03\xb6\x1d\x03\x0cp\x03\x80m\xc7\x00\x03\xdc\x00`\xdb\
-1\xc0\x00\x87\x03\xb6\x1d\x03\x0cp\x03\x80m\xc7\x00\x03\
-\xdcH\xb6c\x80\x01n \xdb1\xc0\x00\x87g;\x06\
-\x18\xe0\x06\xb2\x1d\x03\x0cp\x03\xd9\x8e\x01\x068<\xdb\
-1\xc0\x007\x90\xed\x18`\x80m\xc7\xb6c\x80\x01\xb6\
-\x1do\xf8v\x0c0\xc0\xb6c\x80\x01\x96\xed\x18`\x80\
-m\xc7\xb6c\x80\x01\xb6\x1do\xcav\x0c0\xc0\xb6c\
-\x80\x01\x96\xed\x18`\x80m\xc7\xb6c\x80\x01\xb6\x1do\
-\xcav\x0c0\xc0\xb6\xe3\xe0\xed\x18`\x80m\xc7\xc1\xdb\
-1\xc0\x00\xdb\x8e\x83\xb7c\x80\x01\xb6\x1d\x07o\xc7\x00\
-\x03l;\x0e\xde\x8e\x01\x06x\xaamW'\x13\xdd\x8e\
-?\x07\x18`]\xad/\x064S;\x87\xc3\x87p\x00\
-\x03\xacK\xbaW\x1dU\x17\x13D\x0c0\xc0\xbab;\
-\xd5\xe9\xc4\x10\xef\x01\x0c\xb0r\xb7\xe3_\xab\xd7\x00\x06\
-X\xb9\xdb\xf1>\xc0\x00\xebf\xedV\xf35\x03>\x06\
-\x18`\xdd\xbc\xad\xea\xa0:_\x13\xe03\x80\x01V\xee\
-v\xfc\x18`\x805\xce\x83\x03\xbe[\x03\xe0\xbf\x00\x06\
-X\xdeB\x03\x0c\xb0\x0f\xb1|\x88\x050\xc0f$3\
-\x12\xc0\xf2\x87\x1c\x00\x03,\x7fJ\x090\xc0\xc1\xb9\x99\
-\x01`\x80Cs;!\xc0\x00\xfb\xa3\x8c\xd1\x8e\x1b\xfa\
-\x01Vw\xf9#u\xce'\x06\xd7#u\x00V\x97\xfb\
-P\xbb\x8f\xa6\xf8\x9a\x01\x0c\xb0M\xf7\xe5g\xf1X\xd9\
-;S}\xed\x00\x06\xd8\xa6\xfb\xe2\xd3?\xd8\xfd\x9d\xa9\
-\xbf\x86\x00\x03\xbc\xae>\xec|\xb5\x0a\xc0\x00Gn\xba\
-\xbe\xdc\x0c`\x80\x03\x9b\xea\xd7\x8b~\xdf\xf9zQ\x80\
-5\xb9\xfbt\xaf\xb2\xe9\xfa\x82o\x80e\xd3\x05\x18`\
-\x9b\xeeFo\xba\x00\x03l\xd3\x0d\xdet\x01\x06\xd8\xa6\
-\x1b\xbc\xe9\x02\x0c\xb0M7x\xd3\x05\x18`\x9bn\xf0\
-\xa6\x0b0\xc06\xdd\xe0M\x17`\x80m\xba\xc1\x9b.\
-\xc0\x00\xdbt7,\x80\x01\xb6\xe9\x02\x0c\xb0M\xd7\xa6\
-\x0b0\xc06\xdd\x0d\xdet\x01\x06\xd8\xa6\x0b0\xc0\x1b\
-\x0a\xd8\xa6\x0b0\xc06]\x9b.\xc0\x00\xdbt7p\
-\xd3\x05\x18`\x9b.\xc0\x007\x0e\xd8\xa6\x0b0\xc0\x81\
-\x80m\xba\x00\x03\x1c\x08\xd8\xa6\x0b0\xc0\xa1\x80m\xba\
-\x00\x03\x1c\x08\xd8\xa6\x0b0\xc0\xa1\x80m\xba\x00\x03\x1c\
-\x08\xd8\xa6\x0b0\xc0\x81\x80m\xba\x00\x03\x1c\x0a\xd8\xa6\
-\x0b0\xc0\x81\x80m\xba\x028\x10\xb0MW\x00\x87\x02\
-\xb6\xe9\x0a\xe0@\xc06]\x01\x1c\x0a\xd8\xa6+\x80\x03\
-\x01\xdbt\x05p `\x9b\xae\x00\x0e\x05l\xd3\x15\xc0\
-\x81\x80m\xba\x028\x10\xb0MW\x00\x87\x02\xb6\xe9\x0a\
-\xe0@\xc06]\x01\x1c\x0a\xd8\xa6+\x80\x03\x01\xdbt\
-\x05p `\x9b\xae\x00\x0e\x05l\xd3\x15\xc0\x81\x80m\
-\xba\x028\x10\xb0MW\x00\x87\x02\xb6\xe9\x0a\xe0`\xc0\
-\x17\x13\x83\xdb\x7fhvPm\xb9\xc0\x01\x068\xeb\xd8\
-t\x01\x068\xf0\xd8t\x01\x068\xf0\xd8t\x01\x068\
-\xf4\xd8t\x05p\xe0\xb1\xe9\x0a\xe0\xd0c\xd3\x15\xc0\x81\
-\xc7\xa6+\x80\x03\x01\xbbOW\x00\x87\x02>\xa9\xb6]\
-\xa4\x028\x0b\xb0MW\x00\x07\x02\xb6\xe9\x0a\xe0P\xc0\
-6]\x01\x1c\x08\xd8\xa6+\x80C\x01\xdbt\x05p \
-`\x9b\xae\x00\x0e\x04l\xd3\x15\xc0\xa1\x80\xdd\xa7+\x80\
-G\xea\xb1MW\x00\xe7v\xb6\x02\xb8\xfdcv\x8e\xba\
-\xe7_\xa5\xe2B\x13\xc0#v\xbcd\xbc\xa7\xd5\x8e\x8b\
-K\x00/\xa7\x99MW\x00\xe7vw\x09o\xa3m\xba\
-\x02x\x85\xed\x8d\x04w^\xed\xba\x90\x04\xf0\xea;\xfc\
-\x1fp={Y\x00\xaf\xb9\xdb7D\xec>]\x01<\
-\xb1\xb7\xd3\x8f\xae\x00\xb7\xff\x99}\xaf\x97\x00\x9e\xe6\x07\
-[\xfd\xa7\xd3\x0f\x87\xdfk\x9f\x0e\xcd\x87\x7f\x9b\x0d?\
-\xe3\xb5\x12\xc0\x92\x00\x96\x00\xf6\x22H\x00K\x02X\x12\
-\xc0\x12\xc0\x92\x00\x96\x04\xb0$\x80%\x80%\x01,\x09\
-`\x09`I\x00K\x02X\x12\xc0\x12\xc0\x92\x00\x96\x04\
-\xb0$\x80%\x80%\x01,\x09`\x09`I\x00K\x02\
-X\x12\xc0\x12\xc0\x92\x00\x964b\xff\x02\x19\x03\xee\xbc\
-\xf8\xc0\xcf\xd6\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x0f\xff\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:09:03+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:09:03+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:2eea1\
-a12-a9f6-1f44-a2\
-2a-2b7f5430189c\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:2eea1\
-a12-a9f6-1f44-a2\
-2a-2b7f5430189c\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:2eea1a12-a9f6\
--1f44-a22a-2b7f5\
-430189c\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:2ee\
-a1a12-a9f6-1f44-\
-a22a-2b7f5430189\
-c\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\x01\xc1Hv\x00\
-\x00\x0a\xb7IDATx\xda\xed\xdd\xbd\x8f]\xc5\x19\
-\xc7q\xbf\x01\x92\xc1V \xa2\xc1\x05\x15n\xe8pE\
-IDCi\xad\x90\xdd\xa6\xe1_\xa0u\x89\xe4\x14\xbb\
-V\x1a:\xdc\x04/\xd5\xa6\xa6\xc0\x05\x12U,+\x82\
-\x14\x96e\x99\x95\x9c\x82\x82\xc2\x92\x0d\xf2\x0b's\xe5\
-\xb9\x89p\xfc\xb2\xde{\xce=\xf3<\xf3y\xa4\xaf\x84\
-\xccbv\x9f3\xdf\xbbsf~\xe7\xcc\x81a\x18\x0e\
-\x00\x88\x89&\x00\x04\x06@`\x00\x04\x06\x08\x0c\x80\xc0\
-\x00\x08\x0c\x80\xc0\x00\x81\x01\x10\x18\x00\x81\x01\x02\x03 \
-0\x00\x02\x03 0@`\x00\x04\x06@`\x00\x04\x06\
-\x08\x8c\x069R8S\xb8T\xb8^\xb8_\xb9^\xff\
-\xecL\xfd\x1a\xbd\x220\x1a\xe2P\xe1\xcf\x85\x9b\xc3\xf3\
-\xebf\xfd\xdaC\xfaF`\xcc\xcf\x07\x85+\xc3\x8b\xd7\
-\x0f\x85\x8f\xf4\x8f\xc0\x98\x87w\x0a_\x0d\xab\xd7\xd7\x85\
-w\xf5\x93\xc0X\x0f\xaf\x17>+\xfc:\x8cW\xf7\x0a\
-\x9f\x17\xde\xd4_\x02c\x1a^*|R\xf8i\x98\xae\
-~.|ZxE\xbf\x09\x8c\xf1\xf8\xb0\xf0\xfd\xb0\xbe\
-\xbaV\xf8X\xdf\x09\x8c\xd5x\xaf\xf0\xcd0_}W\
-x\xdfu 0^\x8c\xb7\xea=\xe9\x83a\xfe\xfa\xad\
-.\x96\xbd\xed\xba\x10\x18\xcf\xe6h\xbd\x07\xbd=\xb4W\
-w\xea\xe2\xd91\xd7\x89\xc0\xf8=\x07\xeb=\xe7\xcd\xa1\
-\xfd\xbaU\x17\xd3\x0e\xbbn\x04\xc6\xfe\x83\x18s\x97 \
-\x08\x81\x051\x86\xf8%\x08B`A\x8c\xe0%\x08B\
-`A\x8c\x04%\x08B`A\x8c\x04%\x08B`A\
-\x8c\x04%\x08B`A\x8c\xe0%\x08B\xe00\xbcZ\
-8WC\x0f\xea\xff\x83 \xe7j\x8f\x8c\x15\x02\x0bb\
-\x04-A\x10\x02\x0bb$(A\x10\x02\xcf\xca\xc9\xc2\
-N\xe3\x92\x5c\xae\xb4\x5c;\xb5\x97\xc6\x14\x81\x051\x9e\
-\xb2\x8d\xd3\xfa6\x96 \x08\x81\x051\x9e\x13\xa4\x88\xfe\
-\xfd\x83\xc0i\x83\x18/\xf2\x1b,\xe2\x0c\x02\x04N\x1b\
-\xc4\xd8\xef\xc3\x04\x11\x1e\xa6\x10\x04!p\xda \xc6X\
-\xab\xb8\xad\xaf\xa2\x0b\x82\x108\xc5\x1b1\xa6\xdcG\x8d\
-\xb0\x8f\xed\x8d \x046\x80}\x80\x11X\x10#\xff\x14\
-\xb2\xa7[\x08\x02\x07\xc5\x22N\xdf\x8bx\x04\x0e\x8am\
-\x94\xbe\xb7\xd1\x08\x1c\x14A\x06\xfd#pP\xfc\x061\
-\x83!p@\xdc\xc3YCx\x9f\xc0\x82\x18VQ\xad\
-\xe2\x13x\x0d\xd8\xc7\xb4\x8f>\xe7>:\x81\x0d \x1f\
-\xa0>@\xfb\x12\xd8\x14\xce-L\xb7\xb70\x82\x18\x16\
-Q,\x22\x06\x0e\x82\x08b\xd8\xc6\xb0\x8d\x178\x08\x22\
-\x88!H\xe0\xfa\x05\xbe~>\xc1;\xff\x047\x83\x8a\
-=\x83r\x0f\xd5\xf9=\x945\x8c\xd8k\x18V1;\
-_\xc5\xb4\x8b\x10{\x17\xa1\xb5o\xe8\x0f\x85\xbf\x15\xee\
-\xdbG\xf4B\x85\xc6j\xf1\xcb\xe4\xef\x85?\x12\xf8\xc9\
-\xfc\xa5\xf1\xdf\xb8\xce\xf6\x99\x9e\x08gK=\xa8c\x95\
-\xc0\x95#\x85\xab\x0d_\xb0\x87\x85/\x0a'\x08\xb66\
-N\xd4\x9e?lx\x5c\x5c\xadc\xb7{\x81[\x96\xf7\
-r\xe1\x14\xa1f\xe3\xd4\xd0\xf6\xd10W{\x17\xf8|\
-\xc3\xdb\x08\xa7\x09\xd4\x0c\xa7\xeb5i\xb1\xce\xf7*\xf0\
-k\x0d.V\x09b\x08\x82\xbch-\xc6\xf0\xf1\x1e\x05\
-\xbe\xd0\xd0E\x10\xc4\x10\x04Y\xa56{\x14x\xb7\x91\
-\xe6\xef\x0c\x8e\xb7\x8cHK\xc7\xbb\xee\xf6(\xf0\xdc\xd3\
-\xe7+5D@\x06A\x901\xa6\xd1\xdd\x09<W\xfd\
-[\x10#m\x10\xe4\xc7\x19\xc7\x15\x81\x09\x0c\x02\x13\xd8\
-\x14\xda\x14\x9a\xc0\x1d\x08l\x11\xcb\x22\x16\x81\x13\x08l\
-\x1b\xc96\x12\x81\x83\x0b,\xc8!\xc8A\xe0\x04\x02/\
-K\x94R\x94\x92\xc0\x81\x05^\x96\x87\x19<\xcc@\xe0\
-\xc0\x02/\xca\xe3\x84\x1e'$p`\x81\x97\xe5\x81~\
-\x0f\xf4\x138\xb0\xc0\xcb\xf2J\x9d>_\xa9C\xe0$\
-\x02/\xcbK\xed\xfax\xa9\x1d\x81\x93\x0a\xbc,\xaf\x95\
-\xcd\xfbZY\x02w \xf0\xa2\x04Ar\xbd\xd8\x9d\xc0\
-\x9d\x09\xbc,A\x90\xb8A\x0c\x02\x13\xf8\xbf\xe5p\xb3\
-\xdf\xd3\xfa\xd18\x04&\xf0\x13\xcb\xf1\xa2\xed\x1f\x8dC\
-`\x02?\xb3\x1c\xf0M`\x02\xef\xa1Z\xdfG\xbcS\
-\x17o\x8e%\x16\xf7h]\x03\xb8\xdd\xf0uX\xee\xe3\
-\x13\xb81\x81\xa3\x0d\xa0LA\x90\x83\x01?@\x09\xdc\
-\xa0\xc0\x91\xa6pY\x82 QO\x17$p\xc3\x02G\
-ZD\x89\x1a\x04\x89~\xbe/\x81\x03\x08\x1ce\x1b#\
-R\x10$B\x10c/\xdbx\x04\x0e$p\x94 A\
-\xcbA\x90l\xfd#p0\x81\xb3\xfd\x06\x11\xc4Xm\
-\x06C\xe0\xa0\x02g\xb9\x87\x13\xc4Xm\x0d\x81\xc0\xc1\
-\x05\x8e\xbe\x8a\xda{\x10c\xd5U|\x02'\x118\xea\
->f\xefA\x8c\xc3\x89\xc6\x1f\x81\x0d`\x1f`\x04&\
-p\x8fA\x90^o!\x08\xdcA\x033/\xe2\xf4\xbe\
-\x88G\xe0\x8e\x1a\x98i\x1b\xc56\x1a\x81\xbbl`\xf4\
- \x83 \x0b\x8150\xe8o0QR\x02k`\xc0\
-{\xc8\x7f\x16\xfe\x91\xf4\x1e\x9e\xc0\x04\xf6^\xe3\x04\xab\
-\xe8\x04\xd6@'\x0b\xac\xb1Zy\xa1\x01\x8150\xd5\
-\xd9>SWkgK\x11X\x03S\x9d\xae7U\xb5\
-z\xba#\x8150\xd5\xf9\xb6ST\xcb\xe7+\x13X\
-\x03\xf7L\x84\x13\xe6\xc7\xack\xf5gn\xf9\x9a\x10X\
-\x03\x1d-\xf2XE:Z\x86\xc0\x1a\xe8p\xafZ\x11\
-\x0fw#\xb0\x06\xae\xc4\xc9\xc2N\x02yw\xea\xcf\x12\
-\xad\xff\x04\xd6\xc0\xae\x83 W\xea\xf7\x1e\xb5\xef\x04\xd6\
-\xc0.\x83 YN\x96 \xb0\x06v\xf5J\x9blg\
-;\xdd\x1d\xb97\x04&p\x93A\x90V\x83\x18\xabr\
-c\xc4\x1e\xdd 0\x81[\x0c\x82\xb4\x1c\xc4X\x95\xed\
-\x11\xfb\xb4M`\x02\xb7\xf4F\x90\xd6^,?\x05g\
-G\xec\xd7\x19\x02\x13\xb8\x85 H\xa4 \xc6\xaa\xbc<\
-\xd24\xfa\xe6\x9c\xfd\x22p<\xde(lN\xd0\xbf\xcd\
-\xfaw\x1f\xe8\x88\x8d\x11\xfa\xb61\xe7\xcf@`\xdb \
-\xbd\xf6o\xc9\xd6\x0a=\xdb\x9a\xfb\xfb7\x00\x09\xdc\xbb\
-\xc0\x87\xf6)\xf1V\xfdo\x09l\x00\xea_#\xd3\xe9\
-\xdd=\xf4iw\xeei3\x81\x09\xac\x7fO_\xd8Z\
-\xacN_*\x5c/\xdc\xaf\x5c\xaf\x7fv\xb6~\xcd\x01\
-\x02\x1b\x80\xfa\x07\x02\x13X\xff\x08l\x00\x12\x98\x0c\x04\
-6\x00\xf5\x0f\x046\x00\xf5\x0f\x04&\xb0\xfe\x11\xd8\x00\
-$0\x08l\x00\xea\x1f\x08l\x00\xea\x1f\x08L`\xfd\
-#\xb0\x01H`\x11I\x02\x1b\x80\xfa71!\x1fR\
- 0\x81{\xef_\xe8\xc7\x04\x09L\xe0\xde\xfb\xb7\xca\
-\x83\xfa\x17\xa3Hl\x00\x128c\xff\xc6xUN\x08\
-\x89\x0d@\x02g\xeb\xdfX/\xab[\xd4\x97\x85#\x04\
-6\x00\xf5o}\x9c\x1d\xb9/MKl\x00\x128[\
-\xff\xb6'\xe8M\xb3\xd3i\x03\x90\xc0\xd9\xfawc\x98\
-\xa6\x9a\x94\xd8\x00$p\xb6\xfe\xfd2LW\xcdM\xa7\
-\x0d@\x02g\xeb\xdf\xdda\xdajJb\x03\x90\xc0\xa6\
-\xd0\x81\xa7\xd3\x06 \x81-b\x05\x96\xd8\x00$\xb0m\
-\xa4\xc0\xd3i\x03\x90\xc0\x82\x1c\x81%6\x00\x09\x9c\xb1\
-\x7f\x1b\xc3zk\xb6\xe9\xb4\x01H\xe0\xac\xfd\xdb\xeaA\
-b\x03\x90\xc0Y\xfbw\xa8J\x95Zb\x03\x90\xc0\x99\
-\xfb\xb7\x90\xe9\x8b5K\xbc\xd6{\xe2L\x03ps\xe8\
-\xeb\x84y\x02\x938\x95\xc0\x8b\xfa\xb9\xf0i\xe1\x15\x02\
-\x13\xb8\x07\x89\xb3\x09\xbc\xack\x85\x8f\x09L\xe0\xec\x12\
-g\x15xY\xdf\x15\xde'0\x81\xb3J\x9c]\xe0E\
-\xfdV\xf8\xaa\xf06\x81-\x02f\x93\xb8\x07\x81\x97u\
-\xa7\xf0Y\xe1\x18\x81\xbb_\xc5O#q\xe6\xc7\xbe\x9e\
-V\xb7\x0a\x9f\x14\x0e\x13\xb8\xebm\xb8\x14\x12g\x7f\xec\
-\xebYu\xa5\xf0\x01\x81\xbb\x158\x85\xc4=<\xf6\xf5\
-\xbc\xda)\x9c$p\x97\x02\x87\x97\xb8\x97\xc7\xbe\x9eW\
-\xf7\x0a\x9f\x17\xde$0\x89#I\xdc\xd3c_{\xa9\
-HA\x10\x02\x93\xf8\xc0\xdcM\xdb\x18\xda\xacE\x10\xe4\
-4\x81_\xe8\xc3\xf8\xf1\xd3\xff\xd4\xdej{\x15\x89{\
-|\xec\xebE\xear\xe1\x14\x81\x9f\xfb!\xbc\xcb\xc3\x95\
-\xea\xdb\xfdJ\xdc\xca\xd4\xa5e\x89\x1f\xd6\xa9\xd5\x09\x02\
-\x87\xban\xd1\xea_\xfb\x91\xb8\xa5\x01\xb9\xc8.\xdfj\
-\xb8\xc1\x8b \xc8\xb9\xc2\xab\x04n~\xe6\x14\xb5\xaeF\
-\x16x\xc1\xd1\xba\x88t\xbb\xe1&\xb7\x12\x04\x99S\xe0\
-\x0d\xaeMV\xe7#\x0b\xbc\xe4\xad\xe1\xd1\xb6\xce\x83\x86\
-\x1b\xfdC\xe1\xa3\x0e\x05nq\xf7 S-\x16\x00\x8f\
-G\x17x\xc9{\x85o\x1ao\xf8\xd7\x85w;\x12\xf8\
-,\xc7&\xaf\xcd,\x02/\xf9\xb0\xf0}\xc3\x0d\x9f#\
-\x082\x97\xc0\xdb\xfc\x9a\xbcv\xb3\x09\xbc\xe0\xa5z\xef\
-\xf9S\xc3\x8d_g\x10d.\x81M\x9f\xd73\x8dN\
-'\xf0\x92\xd7\x87G\x8f\x05\xfe\xda\xf0\x05X\xc7\x1bA\
-\xe6\x12\xf8\x17~\xad\xa5\xd2\x0a\xbc\xe4\x9d\xe1\xd1\x83\xfa\
--\xd7\x94o\x04\x99K\xe0\xbb\xdc\x22\xf0\x98,\x1e\x09\
-\xbc\xd2\xf0\x85\x98\xea\x8d \xa6\xd0\xa6\xd0)\x04^p\
-\xb0NYo6|Q\xc6~#\x88E,\x8bXi\
-\x04\xee1\x082\x97\xc0\xb6\x91\xa6\xaf\xcd^\x05\xee)\
-\x082\x97\xc0\x82\x1c\xd3O\x9f\x8f\xf7.p\x0fA\x90\
-\xb9\x04\x16\xa5\x9c\xb6RD)\x05A<\xcc\xd0c\x85\
-\x7f\x98A\x10d\xefA\x90\xb9\x05\xf68\xe1\xb8\x15\xfe\
-qBA\x90\xff\xd5^\x82 s\x0b\xec\x81\xfe\xf1\xea\
-\xdb\xfd.j\xf6\xfc\x0e\xa4\xe8A\x90V\x04\xf6J\x9d\
-\xd5j{XaG\xa2\xf7\x17\x99E\x0e\x82\xb4$\xb0\
-\x97\xda\xed\xaf\xbe\x1cV\xdcN$p\xdc \x08\x81;\
-\x97\x97\xc0\xb1\x83 \x04\xee\x5c^\x02\xc7\x0e\x82\x10\xb8\
-sy\x09\x9c#\x08B\xe0N\xe5%p\x9e \x08\x81\
-;\x94\x97\xc0\xf9\x82 \x04\xeeH^\x02\xe7\x0d\x82\x10\
-\xb8\x03y\x09\x9c?\x08B\xe0\xc4\xf2\x12\xb8\x8f \x08\
-\x81\x93\xcaK\xe0\xbe\x82 \xbd\x0a\x9cV^\x02\x8f\xcf\
-\xe2\xdc\xa4\xc5\xf9Iw\x08L^\x02\xc7\xe5D\x1d8\
-\x0f\x09<\xab\xbc\x17\xd7\xdc\xc3\x8b\xf5\xff{\x80\xc09\
-X\x9c-|\x99\xc0]\x9c;\xbdvy\x09\xbc>N\
-\x0f\x8f\x9e\xf1%\xf0z\xd8\xe8A^\x02\x0b\x82d\x14\
-x\xdd/\xdd[\xeb=/\x81\x05A\xb2\x0b|\xb6\x17\
-y\x09</'\x0b;\x04\x1e\x9du\xbdx~\xb6i\
-3\x81\x05A2\x0b|\xa3\x17y\x09,\x08\x92Q\xe0\
-\xa9OO\x9c}\xdaL`o\x04\xc9,\xf0\xdd^\xe4\
-%\xb0 \xc8\xb2\xee\x0f\xa6\xd0a\xa6\xcd\x04\x16\x04y\
-\xbcv\x07\x8bX\xe1\xe4%\xb07\x82,k\xd36R\
-\x9ci3\x81\x05A\x1e\x9f>\x1fO\xd4\xa71\x83\x1c\
-M\xcbK\xe0\x98\xbcQ\x7fc\xde\x1bi\x90\x9eO\xd8\
-\xa31\xa2\x94\xcdN\x9b\x09,\x08\xb2\xac\xab\x89\xfb\xb3\
-\x95]^\x02\xe7\xe0O\xfb\x9cV/\xe4=\x92\xb8/\
-\xfb==q+\x8a\xbc\x04\xce5X\xff:\xec\xedE\
-\xf4\x0f\x92N\x9b\x9f5\x9d\xde\xcb\xe9\x89\xbb\xf5kC\
-\xfd|\x06\x7f.^+\x5c(\xfc\xf8\xd8=\xf2\xbd\xfa\
-g\x17\xea\xd7\xf4\xd6\x97'\x9d\x9ex\xbf\xfe\xf3\xa5\xfa\
-\xef^\x8e\xf8\xb3\x19\xf4@`4\x01 0\x00\x02\x03\
- 0@`\x00\x04\x06@`\x00\x04\x06\x08\x0c\x80\xc0\
-\x00\x08\x0c\x10\x18\x00\x81\x01\x10\x18\x00\x81\x01\x02\x03 \
-0\x00\x02\x03 0\x90\x84\xff\x00\xf0^mb\xa0\x5c\
-\xab\xc4\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x0dk\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:09:00+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:09:00+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:8b621\
-0d7-7069-494f-8e\
-80-e7367faf4ed0\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:8b621\
-0d7-7069-494f-8e\
-80-e7367faf4ed0\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:8b6210d7-7069\
--494f-8e80-e7367\
-faf4ed0\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:8b6\
-210d7-7069-494f-\
-8e80-e7367faf4ed\
-0\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\xd2\xc5U\xb1\x00\
-\x00\x08#IDATx\xda\xed\xdd\xcd\x8bUe\x1c\
-\xc0q3_\x12\xcdV:\x14\xf4\xfeo\x88\x05\x06\xae\
-\xa7A\xbc\x7fB-\x8aj\x15BFm\xddtm\xd5\
-\xa6\x1c\xcb\x97\x8b\xabpW\x90f\x16n\x8c$0\x02\
-\x9b\xa6Y\xd4\x22\x94(\x1c_\xa6<=\xa7{\x8dF\
-*\xc6\xb9\xe79\xf7\xfc\xce\xf9\xfc\xe0\x0b\xd1\x0b\xd4y\
-\x9eO\xf7\xdcs\xcf\xb9wMQ\x14k$\xc5\xccA\
-\x90\x00\x96\x04\xb0$\x80%\x80%\x01,\x09`I\x00\
-K\x00K\x02X\x12\xc0\x12\xc0\x92\x00\x96\x04\xb0$\x80\
-%\x80%\x01,\x09`I\x00K\x00\x87osjw\
-j_j6u.\xf5}\xeaJ\xeafa\xfeo\xca\
-\xe3\xf3C\xea`j\x0bH\x00\xd7\xd5T\xea\xa5\xd4\x99\
-\xd4\x0d\x0e+\x99\xdfS\x07`\x028gO\xa7N\xa6\
-\x96x\xcb6\xe7S\xeb\xa0\x02\xb8\xcav\xa5>g\xab\
-\xb6\xb9\x98Z\x0b\x16\xc0\xe3\xf6`\xea0O\x13\x99\xb3\
-^\x89\x01\x1e\xa7^\xea\x17\x8e&:\x1fx%\x06\xf8\
-n\xbb/\xf5\x0e;\x8d\x99Y\x88\x01^i\xe5G\x19\
-\x1f1\xd3\xb89\xe6t\x1a\xe0\x95|4\xf4%+^\
-\x89\x01\x8e\xd7Vx\xbd\x12\x03\x1c\xf7=\xef\xa7lx\
-%\x068f.Xy%\x068\xe8\xbf\xf8\x1e\x16 \
-VL\xc0\x0f\x15>\xe7u:\xad\xb0\x80\x8f\xdb\xff^\
-\x89\x15\x13\xf0.\xfb\xde+\xb1\xe2\x02\xfe\xcc\x9e\xf7J\
-\xac\x98\x80\x9f\xb2\xd7\xbd\x12+.\xe0\x93\xf69\xc4\x8a\
-\x09x{\xe1a|\xa7\xd3\x0a\x0b\xf8\xe5\xcc\x1b\xe7z\
-1|~x:\xf5hj}\x077\x83Wb\x80\xb3\
-u&\xe3\x869Z\x0c?[\xee\xfafp:\x0dp\
-\xb6o\x8f\xcc\xf1\x05t\xe5\x97\xb1=g\x134\x120\
-\xc4-\x02\xbc;\xd3\x06y\xde\x06h4`\x88[\x02\
-x_\xa6\xd3f\x1b\xa0\xf9\x80!n\x01\xe0\xd9\x8a7\
-\xc45\xefyC\x01\x8688\xe0s\x15o\x86\xc3\x16\
->\x1c`\x88\x03\x03\x9e\xafx#L[\xf8\x90\x80!\
-\x0e\x0a\xf8r\xc5\x9b\xe0\x11\x0b\x1f\x16\xb0\x9b=\x02\x02\
-\xae\xfa#\xa4\xf5\x16>4`\x88\x83\x01\xaez`\x8d\
-\x0f\x18b\x80\x15\x1c0\xc4\x00+8\xe0\xce#\x06X\
-\xd1\x01w\x1a1\xc0\xcau\x9c\x0fA\x0c0\xc0q\x8f\
-\xf3Z\x88\x01\x068\xf6q\x86\x18`\x80\x83\x1fg\x88\
-\x01\x068\xf8q\x86\x18`\x80\x83\x1fg\x88\x01\x068\
-\xf8q\x86\x18`\x80\x83\x1fg\x88\x01\x068\xf8q\x86\
-\x18`\x80\x83\x1fg\x88\x01\x068\xf8q\x86\x18`\x80\
-\x83\x1fg\x88\x01\x068\xf8q\x86\x18`\x80\x83\x1fg\
-\x88\x01\x068\xf8q\x86\x18`\x80\x83\x1fg\x88\x01\x06\
-x\x15\xfdZt{\x06\x11\x11\x03\xac\xdb}[\x98\xb3\
-\xd1\x10\x03\xac\xdb\x9d\xe6\xf7\xaf\xb9\x18\x091\xc0\xba\xdd\
-Qv\xff\x9e\xaf\x00\x068Z\xafp\xbbl\x0e\x00\x0c\
-p\xa4\x9edv\xd9,\xa5\xb6\x02\x0cp\xa4\xbe\xe6v\
-\xd9\xbc\x050\xc0\x91z\x93\xd9e\xb3\x000\xc0\x91\x9a\
-J\xfd\xc6\xed\xb2\xd3h\x80\x01\x0e\xd5\xeb\xdc\xc6\xd9/\
-\x00\xeb\xce\xb6\xa4~\xe2\x16`\x80\xe36\x9d\xba\xc5.\
-\xc0\x00\xc7m?\xbb\x00\x03\x1c\xb7{\x8a\xe1S:\x00\
-\x03\x0cp\xd06\xa5N\x00\x0c0\xc0\xb1_\x89\xf7w\
-\xf8=1\xc0\x00\xb7\xe6\xc2\xd6\x8f\x00\x03\x0cp\xdc6\
-\xa7^+\xba\xf5\xf0?\xc0\x00\xb7\xae\xed\xa97R\x17\
-\x00\x06\x18\xe0\xd8=Q\x0c\x1fE|?\xf5I\xea\x9b\
-\xa2]\xb7c\x02\x0c\xb0\xec\x17\x80\x01\x96\xfd\x02\xb0M\
-\x0e0\xc0\x16D\xf6\x0b\xc0\x16D\xf6\x0b\xc0\x00\x0b`\
-\x0b\x22\x80\x01\xb6 \xb2_\x00\x06X\xf6\x0b\xc0\x00\x03\
-\x0c\xb0\x05\x11\xc0\x00[\x10\xd9/\x00\x03,\xfb\x05`\
-\x01\x0c\xb0\x05\x91\xfd\x02\xb0\x05\x91\xfd\x020\xc0\x02\xd8\
-\x82\x08`\x80-\x88\xec\x17\x80\x01\x96\xfd\x020\xc0\x00\
-\x03lAd\xbf\x00lAd\xbf\x00\x0c\xb0\xec\x17\x80\
-\x050\xc0\x16D\xf6\x0b\xc0\x16D\xf6\x0b\xc0\x00\x03\x0c\
-\xb0\x05\x11\xc0\x00[\x10\xd9/\x00\x03,\xfb\x05`\x80\
-\x01\x06\xd8\x82\xc8~\x01\xd8\x82\xc8~\x01\x18`\x01l\
-A\x040\xc0\x16D\xf6\x0b\xc0\x00\xcb~\x01\x18`\x80\
-\x01\xb6 \x02\x18\xe0\xb1Z\xacp1\xae\xda\xe0\x00\x03\
-\x5cos\x15.\xc6\x9c\x0d\x0e0\xc0\xf56\xa8p1\
-\x0668\xc0\x00\xd7[\xaf\xc2\xc5\xd8k\x83\x03\x0cp\
-\xbdm\xa8\xe84z>\xb5\xd1\x06\x07\x18\xe0\xfa\x9b\xa9\
-`!fln\x80\x01\x9e\x5c\xfd1\x16\xa1oc\x03\
-\x0c\xf0d[\xbbJ\xc4\xfd\xd1?ks\x03\x0cpC\
-N\xa7\x17Vp\xe0\x17\x9c6\x03\x0cps/l\x95\
-W\xa7\x8f\xa7.\xa5\x96F]\x1a\xfd\xb9\xde\xe8\xef\xb1\
-\xa1\x01\x06X\x02\x18`\x09`\x80%\x80\x01\x16\xc0\x00\
-K\x00\x03,\x01\x0c\xb0\x04\xb0\x040\xc0\x12\xc0\x00K\
-\x00w\x18\xb0[.\x01\x068h\x1ez\x00\x18\xe0\x80\
-y\xec\x10`\x80\x037\xce\x83\xff\xb3\x10\x03\x0cp\xec\
-\xaf\xde\x81\x18`\x80't\xc1\xaa\xaa\xef\x90>\x96Z\
-\x07\x03\xc0\x00\xd7W\xaf\xe2\x85\x83\x18`\x80kl\x90\
-a\xf1\x9cN\x03\x0cpM\xcd\x15y\x06b\x80\x01\xae\
-\xa1kE\xbeq:\x0d0\xc0\x99[,\xf2\x0e\xc4\x00\
-\x03\x1c\xf0\x14\xda\xe94\xc0\x00\x07\xbd\x88\x051\xc0\x00\
-\x07\xfd\x18\xc9\xe94\xc0\x00\x07\xbd\x91\x03b\x80\x01\x0e\
-z+\xa5\xd3i\x80\x01\x9e`}\x88\x01\x068\xf6\xe3\
-\x84\xb3\x10\x03\x0cpl\xc4\x87jF\xec=1\xc0\x00\
-C,\x80\x01\x86\x18`\x80!\x86\x18`\x80!\x16\xc0\
-\x00C,\x80\xbb\x0c\x18b\x80\x01\x86\x18b\x80\x01\x86\
-X\x00\x03\x0c\xb1\x00\x86\x18b\x80\x01\x86\x18b\x80\xa3\
-\x01\xfe\xb7_\xff3+\x1b\x0f@\x00<Q\xc0+\xfd\
-\xf5?\x031\xc0\x0d\x02\xbc\xda_\xff3\x10\x03\xdc\x00\
-\xc0\xf0V?o\x83\x07p\x1d\x80gX\xcb6~d\
-\x1c\xe0\xac\x80\xeb\xfe\xd2\xb8\xae\xcd|j#\x80\x00\xe7\
-\x02\xdcc,\xfb\xec\x05\x10\xe0\x5c\x80\x07|e\x9f\x01\
-\x80\x00\xe7\x02\xec\xf49\xff\xcc\x01\x08p.\xc0\x8b|\
-e\x9fE\x00\x01\x068\xee\x5c\x05p\xec;\x03\xab\x9c\
-\xebN\xa1\x8dS\xe8\xfaz\xac\xe2\xf5\xf8\xd9E,\xe3\
-\x22V}\xed\xe9\xda\xffP}\x8c\xd4\xac\xe9A8V\
-G*^\x8f/\xda\x04\xb8\xbc\xc9`\x9e\xb1l\xe3F\
-\x8e\xf1zx\xf4\x9e\xb5\xcay\xafM\x80\xddJ\x99w\
-\xdcJ9^'2\xac\xc9\xabm\x03\xeca\x86<\xe3\
-a\x86\xf1z1\xd3\xba<\xd3F\xc0\x1e'\xacv<\
-N8>\xde?2\xacKy:\xbe\xa9\x8d\x80=\xd0\
-\x0foS\xde\xf3\x9e\xc8\xb86\xa7\x22\x1c\x07_\xa9\x03\
-o\xa4\x9b4\x1e\x1f}Tt$\xc3\x05\xab;\xe7\x85\
-.\x00n\xcb\x97\xdaE\xfcAp\xff\xf3\xcc77S\
-\xdb\x00\x867\x17^o_\xf2\xce\x87Q\xf60\xbc\xb1\
-\xf0\xba\x80X\xcf\xec\x00\x18\xde\x1c\xaf\xbc\xf0\xe6\x9f\xd3\
-\x91\xf62\xbc\xb1N\x9bM\xde\xb9\x95\xda\x09\xb0_a\
-\xf8\xe7\x94\xbf\xc2po\x05\x17\xac<\x0d\x96\x7f\x0eG\
-\xdb\xd3^yc|T\xe4A\x92\xfcs%5\x050\
-\xbcU\xe3\xf5(g=\xf3l\xc4\xbd\x0do\xf3\xf1\xfa\
-2\x85\xfc\x13\xf6^tx\x9b\x8f\xd7\xd7\x19\xe5\x9d\x8f\
-G\xd7\x18\x00v\xc1\xaa\x92\x0bV\x00\xd77\x17R\x0f\
-D\xde\xe7^y\x9b\xfd\xca\xeb\x14:\xdf\x9cOm\x8f\
-\xbe\xd7\xe1m>^\x17\xb1\xf2\x9c6\xdf\xdf\x86\xfd\xde\
-F\xc0\xfd\x96\xe1\xf51R\xb5s0\xf2{\xde\xb6\x03\
-\x9ei!^\xdfGV\xcd\x5c\x89\xfaQQW\x00\xd7\
-\xbd\xc9\xeb~\x9e\xd7\xad\x94\xab\x9b\xf2\xf6\xc8\xf2\x0e\xab\
-\xa9\xa2\x85\xd7{\xda\xf4\x1f\xd3k1^\x0f3\xacn\
-\xca\x07\x13v\x16-\xfe\xa8\xb4M\xff1\x83\x96\xe3\xf5\
-8\xe1\xca\xa6|\x18\xbf|\x9ewG\x9b\xe1\xb6\x11\xf0\
-\x5c\xcb\xf1z\xa0\xff\xbf\xa7\xfcz\x9dS\xc5\xf0kp\
-\xb6u\x01n\x1b\x01/v\x04oW\xbfR\xe7F\xea\
-r\xea\xbbb\xf8\x8b\x09\xef\x16\xc3\xefm.\xbf\xfau\
-S\x97\xd0\x02|\xf7\x93\xeb\x0e+\x09\xe0\xcc\xa7\xd0\xbe\
-=R\x00\x07\xbd\x88\x05\xaf\x00\x0e\xfa1\x92\xd3f\x01\
-\x5c\xf3E\x9d9x\x05p\xb7o\xa5t\xda,\x80'\
-X\x1f^\x01\x1c\xfbq\xc2\xd5 \xee\xc3+\x80\x9bu\
-:\xbd\x92\xbb\x95\x16\x0a?\xae-\x80\x1b{a\xeb\xce\
-\xbb\x95\x96F\x7f||\xf4\xd76\xd8\x08\x02X\x12\xc0\
-\x92\x00\x96\x00\x96\x04\xb0$\x80%\x01,\x01,\x09`\
-I\x00K]\xedOL\xdf\x0e\x12\x10Y\x1d0\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x102\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\xbbiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.7 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-08-24T16:46\
-:23+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-08-25T09:47:21+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-08-\
-25T09:47:21+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:22db4\
-e6d-aead-6249-bb\
-b8-baf165614833\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:b79ce\
-6d8-db76-6f4d-90\
-ec-ba527fc27415\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:b79ce6d8-db76\
--6f4d-90ec-ba527\
-fc27415\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:b79\
-ce6d8-db76-6f4d-\
-90ec-ba527fc2741\
-5\x22 stEvt:when=\x222\
-023-08-24T16:46:\
-23+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.7 (Windows)\x22/>\
- <rdf:li stEvt:a\
-ction=\x22saved\x22 st\
-Evt:instanceID=\x22\
-xmp.iid:22db4e6d\
--aead-6249-bbb8-\
-baf165614833\x22 st\
-Evt:when=\x222023-0\
-8-25T09:47:21+02\
-:00\x22 stEvt:softw\
-areAgent=\x22Adobe \
-Photoshop 24.7 (\
-Windows)\x22 stEvt:\
-changed=\x22/\x22/> </\
-rdf:Seq> </xmpMM\
-:History> </rdf:\
-Description> </r\
-df:RDF> </x:xmpm\
-eta> <?xpacket e\
-nd=\x22r\x22?>_V\xb2\xe5\x00\x00\x0a\x1d\
-IDATx\xda\xed\xddO\x88_W\x19\xc6\xf1;\
-\xd3\x9aRZ\x12\x8a\x14A\x047\xa2\x1bc\x05W.\
-t#t#]\x05\xa3Hq\xe7VA\xdc\x08\x22\x82\
-\xab\x12J\x93\xee\xdc\xbajEP\xe8\x22\xe0\xae\x82\x0b\
-]H\x10\x05\xc5&h(\x9d\x22&R\xc5\xa8\x99I\
-\xe2\xb9z\x07\xc7\x10\x9b\xdfo\xe6\xde{\xde\xf3\x9e\xcf\
-\x17\xdeMH\x86\xb9\xf79\xcf\xbdO\xde{\xfe\x0c\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8/\
-\x8f\x94:_\xea\x95Ro\x94\xda\x9f\xea\x8d\xe9\xcf\xce\
-O\x7f\x07@ vJ=_\xeaj\xa9{\x0f\xa9\xab\
-\xd3\xdf\xddq\xdb\x80\xfa|\xa4\xd4\x8f70\xee\xfd\xf5\
-\x93R\x1fs\xfb\x80:<Q\xea\xdb\xa5\xfey\x0c\xf3\
-\x1e\xd6\x18\xaf/\x95:\xe3v\x02\xeb\xf1\x5c\xa9\xeb'\
-0\xee\xfd\xb5W\xeaKb5\x103.\x8b\xd5@\xe3\
-qY\xac\x06\x12\xc4e\xb1\x1aH\x10\x97\xc5j\xa0\xf1\
-\xb8,V\x03\x09\xe2\xb2X\x0d$\x88\xcbb5\xd0x\
-\x5c\x16\xab\x81\x04qY\xac\x06\x12\xc4e\xb1\x1ah<\
-.\x8b\xd5\x10\x97\x13\x1bW\xac\x86\xb8,V\x0318\
-]\xea\xa5)R\xde\xeb\xbc\xf6\xa7{q\xda\xb0\x80\xb8\
-,V\x03\xe2\xb2X\x0d\xc4\x8f\xcb{S\x89\xd5@C\
-q\xf9\xe8\xe7\x9c\xc8\x9f\xaf\xc4j\x88\xcb\x1bF\xd4\x16\
-\x7fg`V2\xbc\xcdZH\x0d@\x97q\xb9\xa7\x07\
-\x11\x906.\xbb6\x88\xcb\x1d\xbd\xa5\xc4j\x88\xcb\x8d\
-\x0fh\xb1\x1a\xe2r\x82H\xe9\x1e\xa0\xc9\xb8\xfc\xc2\x10\
-w2F\x8d\xb7O\xd4\x14r\xb7\xd4\xe5RO\x1b\xb6\
-\x18\xf9r\xa9[\x83\xd9J\x0f\x22\xf2,\xb3\x83R/\
-\x1a\xbe\xfd\xb2[\xeaGA\xa3\xe2\xeb\xa5\xce\x06\xbaW\
-g\xa7\xdf)\xe2\xbd\xbaR\xeaQ\xc3\xb9?^\x0b\x1a\
-\x97\xa3\x9e\xdd{x\x06\xf1^P\x13\xa3#\xbe\x22.\
-\xa7\x8b\xd5\x17\x0c\xeb>8U\xea\xef\x83\xce\xeaI\x89\
-\xd6\xad\xde\x1f\xacn\xea\x82o\x0d\xbem\xceI\xa4n\
-\xf5E\xc3;?\xbf\x13\x97\xd3\xc6\xea\xeb\x86w~j\
-\xce4\x8a\xd6]\x9e\x9b\xda\xdd\xea}\xc3;?\xba\xcb\
-\xcbr\xd8\xad~\xbb\xd2\xbd\xee\x8a]~v\xaf\x17x\
-@\xbe\xe3m\x88Lo`\x11\xda\x1b\x18\x09\x0c\xac\x89\
-\xc5\xc0h\xdc\xc0>#10\x12\x18\xd8D\x0e\x06F\
-\x02\x03\x9bJ\xc9\xc0h\xdc\xc0\x16300\x12\x18\xd8\
-rB\x06F\x02\x03[\xd0\xcf\xc0h\xdc\xc0\xb6\xd4a\
-`$0\xb0M\xed\x18\x18\x09\x0c\xdc\xf3\xb6\xb2\x0c\x8c\
-\x14\x06\xeemcw\x06FJ\x03\xf7p\xb4\x0a\x03#\
-\xbd\x813\x1en\xc6\xc0\xe8\xca\xc0Y\x8e\x17e`t\
-m\xe0\x96\x0f\xf8f`T3p\xf4C\xd0\xa2\x1fZ\
-\xc6\xc0\xa8j\xe0\xc8\x06\xb9Y\xeaF\xf0\x07\x0c\x03\xa3\
-\xaa\x81{\x8b\xa8sG|\x06F\x08\x03\xf7\xd2$\x9a\
-\xbb\xc9\xc6\xc0\x08e\xe0\x91\x16\x17\x01\xd4Z\x94\xc1\xc0\
-\x08g\xe0CZZ\x86WkY$\x03#\xac\x81\x87\
-\xa1\x9d\x85\xf0\xb56&``\x846pO\xb1\xfa8\
-k\x98\x19\x18M\x188{\xb7\xfa\xb8\xf3\xb2\x19\x18M\
-\x0e\x98,\xdd\xea\x93\xae\x8cb`4;`Z\x8e\xd5\
-sm\xf9\xc3\xc0h~\xc0\xb4\xd6\xad\x9es\xd3=\x06\
-F\x9a\x01\x13=V/\xb1?\x17\x03#\xd5\x80\x898\
-\xb7z\xc9\xad|\x18\x18)\x07L\x94n\xf5\xd2{T\
-30R\x0f\x98Z\xb1z\xadS\x22\x18\x18\xe9\x07\xcc\
-\x9a\xb1z\xc9\xb8\xcc\xc0\xe8z\xc0,\x1d\xabk\x9c\x94\
-\xc8\xc0\xe8j\xc0\x1c\xce\xad\x9e\xfb:j\x1d\xaa\xc6\xc0\
-'\x1c\x0c=\x1a8\xc3=t\x1d\xc6\xf4\xb0\xeb\x85\x0c\
-00\x00\x06\x06\xc0\xc0\x00\x03\x03``\x00\x0c\x0c\x80\
-\x81\x01\x06\x06\xc0\xc0\x00\x18\x18``\x00\x0c\x1c\x9e\xe7\
-\x16\xf8\x99s\xef\x11E\x0fz\xe0>\xac\xa3\xb5\xae\x19\
-\x0db'\x0b;\x8b\x9ca\x83v\xe3Y\xad\xbd\xa4\xd6\
-\x88q\xf6\xf6\x8a\xa5\x07\x1a\x89gQb\x9c\xdd5\xc5\
-jqy\xb0\x9f\xb2\xfd\xad\xd1m\x5cv\xa2\x01=\x90\
- \x9e\xd5\x88q\x11\x0d\xdc\xb3\x1eh<\x9e\xad\x1d\xe3\
-\x22\x19\x98\x1eH\x13\xcfz;W\x97\x1eH\x19\xcf\xb2\
-\x9flO\x0f\xa4\x8fgK\xc6\xb8Z\x06\xa6\x07\xba\x8b\
-gK\xc4\xb8\x1a\x06\xa6\x07\xba\x8egs\xc6\xb85\x0d\
-L\x0f\xb1z#N\x97zi\x8a0\xf7:\xaf\xfd\xe9\
-^\x9c\xaeh`zl\xae\x87\xb8\xdcY<;i\x8c\
-[\xda\xc0\xf4\x10\xab\xc5\xe5\x05c\xdcR\x06\xa6\x87X\
-\xdd|\x5c\xde\x9b*r\x8c\x9b\xfbg\xd3C\xacn>\
-.\x1f\xfd|\x10\xf9s\xc9\x12\x83\x99\x1ebu\xd3q\
-\xf9\xffE\x22\x91\x92\x1e\xdd\xc7\xea\x0cOOM\x1dz\
-t9\x09$\xd3\x8d\xeea\x16\x12=\xc4\xea\xf4QG\
-\xac\xa6G\xdaX\xdd\xd3SQ\xac\xa6G\xaaX\xdd\xe3\
-\x0d\x14\xab\xe9\xd1|\xac\x16a\xc4jz4\x18\xab\x9f\
-*\xf5\x83Rw<\xed\xc4jzlUwK].\
-\xf5t-\xf3\xbeX\xea h<\xab=;\xc6\x22\x00\
-zlZ\x07\x93\x97V\xe3\xd1RW\x82\x0e\x96\xd7K\
-\x9d\x0d\xf4_\x8b\xb3\xd3\xef\xd4\xaby\xe9\xb1y]\x99\
-\xbc\xb58\x11\xcd;\xc6\xb3\xe7\x83~s\xdb\x99~\xb7\
-\xbd\xa1\xaf\xb8L\x8f\xe3\x99xQ.\x88gb5=\
-\x16\xad\x0bK]\xf0\x93\xc1.\xb6\xd5y\xa76\x83\xa3\
-\xc7\xc3\x1e\x82\x8b<\x00_\xf6-M\xb7\x9a\x1e\xab\xd4\
-\xc5%.\xf0\xfa \x9e\x89\xd5\xf4X\xa3\xae/qq\
-5/*Z7\xb3\xf7n5=\x96\x7f8\xce\x8en\
-\xa6nu\x8fz\xbc]\xe9^o\xc4n\x037rw\
-\xe8\x83Q\xb4\x9f\x97\xfa5=\xc2\xe8\xf1\xceRo\xc3\
-Z\x17$\xb2-\xc3\xe3\xa5\xbeS\xea\x1f\x22\xb4\x08\xbd\
-\xcd\x1b\xb8\x15\x03g\xde@l\xec~^\xd3\xc4\xd2\xc4\
-\xcan\xe0l\x9f->P\xea{\x83\xcfH\x91\x1e\xa4\
-\x91>\xeb\xa55p\xeb\x13\x07\x1e+\xf5\xcdR\xb7\x06\
-\x139\x22\x10ubMz\x03\xb7\x18\xe3\x9e-\xf5\xdb\
-!\xdf,,S)\x198\xf5\xe7\x8d1.\x7f?\xb1\
-q-f`\xe0\x94\xdd\xd1\xf7\x94\xfaz\xa9\xbfvd\
-^\xcb\x09\x198E\x8c\xfbt\xa9_uj\x5c\x0b\xfa\
-\x19\xb8\xd9\xee\xe8{K}w\xf8\xcf\x96)\xb6\xd2\xb1\
-\xa5\x0e\x037\xd2\x1d\xdd\x9d\x06\xe8\x9f\x98\xd5\xa6v\x0c\
-\xdc\xd6\xbe\xbc\x9f(\xf53\xe6\xb4\xad,\x03\xb7\x15\xe3\
-\x9e\x9a\x06\xe2\x01S\xda\xd8\x9d\x81\xdb\x89q;\xd3\xc0\
-\xfb#\x13:Z\x85\x81\xdb\x8aq\x1f/\xf5S\xa6s\
-\xb8\x19\x03\xb7\x15\xe3\xce\x88\xcb\xa1\xf4\xc8\xbe\x81>\x03\
-\xcf\x18\xe3>7\xd4[\xd8-V\xe7\x8f\xcbM\x1a\xb8\
-\x85C\xd0>\x1ct\xb0\xdc\xedP\x8f\xe8\x87\x96ug\
-\xe0\xc8\x82\x8co\xdb\x1f\x06\xfd\xdd~Q\xea\x93\x9d\xe9\
-q\xb3\xd4\x8d\xe0\x0f\x98\xee\x0c\xdc[$:i\xfd\xb9\
-\xd4WK=B\x8f\x90\x11\xbf[\x03\xf7\xd2\x948I\
-\x5c\x1e\x17\xfe\xbf\x8f\x1e\xa1\x9bl\xdd\x1bx\xc4\xa9~\
-\xff[\xbf,\xf5)z4\xb1(\x83\x81\x8f\xd0\xfb\xa9\
-~\x7f)\xf5\xb5\xe1\xddO\xab\xa3G\xace\x91\x0c\xfc\
-\x80\xd9N\xbd\x9d\xea7\xd6+\xa5\xdeO\x8f\xe66&\
-`\xe0\xcec\xdcoJ}\x86\x1e\xcd\xaeaf\xe0\x0e\
-\xe7\xbb\x8e\xf5\xb7R\xdf(u\x8a\x1eM\xcf\xcbf\xe0\
-\x0d\xc9\xd4\x1d\x1d\xbf5\x7f\x90\x1e)VF1pG\
-1\xeej\xa9\xcf\xd2#\xd5\x96?\x0c|\x0cZ\xeb\x8e\
-\xde\x9ef\xee<A\x8ft\x9b\xee1p\xf2\x18w\xb9\
-\xd4\x87\xe8\x91v\x7f.\x06>!Q\xe7\xf2\x8e\x03\xf9\
-\x1c=\xd2o\xe5\xc3\xc03\x11\xa5;:\xc6\xe5\x17f\
-\x8a\xcb\xf4\x88\x15\x97\x19xX\x9e\x9a1n\x1c,\x1f\
-]\xf8\xfa\xe81\xffd\x0c\x06\x0e4`j\xc4\xb8\xb7\
-J}qXg\xefcz\xd4\xdd\x89\x94\x81Wd\xe9\
-\x187\x0e\x96\x8b+\x0e\x16z\xc4\xd8{\x9a\x81W\xe4\
-p.\xef\xdc\xd71np\xf7L\x85\xeb\xa1\xc7\x83\xab\
-\xd6\xa1jU\xf4\xd8\xd9\xf2\x17\x9c[\xc0\xa1\xd2\x8d\x9e\
-\x93\xddJ\x06\xa0\x87\xeb\xf8\xf7\xe0C,\xe1\x80\xad\xde\
-\x1e\x00\x18\x18\x00\x03\x03``\x80\x81\x0100\x00\x06\
-\x06\xc0\xc0\x00\x03\x03``\x00\x0c\x0c0\xf0\xea\xd4Z\
-5\xd2:\x87\xabx\xe8\x91[\x8f\xd9\xb1n\xd3:Z\
-z\xac\xa7G\x13\x06\xb6s\xc2f\xd8\xc9\xa2?=\x9a\
-1\xf0\x92[}f\x180\xf6\x92\xeaS\x8f\xe6\x0c\xbc\
-V\x8c\xb3\x9b\xa3\xdd\x1c[\xd0\xa3Y\x03\xf7\xbe\x7f\xaf\
-\xfd\x94\xe9\xb1\x88\x81oU\x8aq=\xed\xa0\xefD\x03\
-z\x1c\x9eX9;\xd7\x92\xc48g\x0a\xd1#\xba\x1e\
-\xd7\x960\xf0\xab\x01b\x5c\xb6S\xe4\x9c\xeaG\x8f\x07\
-\xd5\xabK\x18\xf8\x0bIb\x9csu\xe9\x11]\x8f\xcf\
-/a\xe0S\x95ct\x96\x93\xd4\x9dlO\x8fw\xab\
-\xdf\x97zl\xa9V\xfa\xb9\x041\xae\xd6\x80i\xfdP\
-rz\xacS\xe7\x86\x85\xb9\x144\xc6m:\xe9`\xed\
-\x01s8Wv/\xb1q\xe91O]\x1aV`7\
-\xa8\x897\xed\x8e\xae9`Z\xeb.\xd3\xa3\xaeyW\
-]\x5c4\xbe\xea\xdfj0\xc6\xad1`z\x88\xcb\xf4\
-\x98/\xad\x9c\x1f*\x11q\xd6\xd0\xc3\xba\xa3K\x0f\x98\
-,\xddez\xe4Z4\xd2lg\xf5\xfe\xee\xe8R\x03\
-&kw\x99\x1e9\x96m6\xfdm\xf3\xe8\xd3n\xee\
-\x9f\x1d9\x85\xdc,u\x83\x1e\xa9\xa7\xa2v\x17\xab[\
-\xf8\x99s\xfe\xbf\x93\x1eyf\xad\x89\xd5\x1dFTz\
-\x88\xcb)cu/M\x22z\x88\xcb\xa9cu\x86\xcf\
-4\xdbv3\xe9\xd1IwY\xac\xce\x1d\xcf\xe8!.\
-\x8b\xd5\x09\xe2\x19=\xc4e\xb1\xba\xf1xF\x0fqY\
-\x8cK\x10\xcf\xe8!.\x8bq\x09\xe2\x19=\xc4\xe5\xad\
-\xb1\x08 \xd6\xc7\x7fz4>\x19\xa3\x16\xbd/\xc3\x8b\
-\x16\xcf\xe8!.oM\xaf\x0b\xe1\xa3\xc63z@\x8c\
-K\xd0\xcd\xa4\x07tG\x13\xc43z\xa0\xeb\xeeh\x96\
-xF\x0ft\x15\xe32\xc63z\xa0\x8b\xeeh\xf6x\
-F\x0f\xa4\x8cq\xbd\xc53z`kz;\x96\x93\x1e\
-\xf4\x10\xe3\x16\xac\xa5\x0f\xc6\xa6\x07=\xd2Rs\xd2\xc1\
-6\xa7\x12\xd0\x83\x1e\x08\x12\xe3\xc43z`!\x96\x9e\
-t\xa0\x9bI\x0f4\x18\xe3\xc43z`e\x0e'\x1d\
-\xdc9\xc1@\xb93XZF\x0fT\xe5\x99Ro\x1e\
-c\xb0\xbc9\xfd[\xd0\x03\x01b\xdc\xd8\xe88\xd8\xa2\
-)\x22\x9e\xd1\x03\xc1x\xb2\xd4\xcb\xa5\xfeP\xea\xf6\x91\
-Ar{\xfa\xb3\x8b\xa5\x1ew\x9b\xe8\x01\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc8\xc6\xbf\x00\xaa\xb9\x8d\
-6\x82\x98U\xbe\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x0d\xc1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.1462899, 2023/0\
-6/25-20:01:55   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-25.0 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-10-18T09:06\
-:39+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-10-18T09:13:01+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-10-\
-18T09:13:01+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:48f8e\
-982-d285-c349-ab\
-2f-4d4493b36dc4\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:48f8e\
-982-d285-c349-ab\
-2f-4d4493b36dc4\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:48f8e982-d285\
--c349-ab2f-4d449\
-3b36dc4\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:48f\
-8e982-d285-c349-\
-ab2f-4d4493b36dc\
-4\x22 stEvt:when=\x222\
-023-10-18T09:06:\
-39+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-5.0 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>k\x17\x7f6\x00\
-\x00\x08yIDATx\xda\xed\xddK\x8f\x15E\x1c\
-\x86\xf1\x89Q\x10Et#\x17\x01\x95\xef\xa1 Qq\
--\x97\x88\xdf@!\x12\x5c\xa9|\x0b\x8c\x9a\xb8\x11\xb9\
-f\x107\xc2J\x8d\x8e@T\x16B\xa2k\x1d/[\
-#\xb8Q\x06P\xca*N\x9b\x105Q\x9c\xae\xeeS\
-U\xbf7y\xf6s\xce\xff}&\xa7\xbb\xab\xaagB\
-\x083\x00\xca\xc4\x97\x00\x10\x18\x00\x81\x01\x10\x18 0\
-\x00\x02\x03 0\x00\x02\x03\x04\x06@`\x00\x04\x06\x08\
-\x0c\x80\xc0\x00\x08\x0c\x80\xc0\x00\x81\x01\x10\x18\x00\x81\x01\
-\x10\x18 0\x00\x02\x03 0@`\x00\x04\x06@`\
-\x00\x04\x06\x08\x0c\x80\xc0\x00\x08\x0c\xa08\x81\xef\x8e<\
-\x15\xd9\x179\x189\x17\xf96r1r5\x88\xdcZ\
-\xaet\xdd\xf9\xa6\xeb\xd2\xdb\x91W\x22[\xba\xae\x11\xb8\
-\x07VE\xf6F\xcet_\xb8\xc8Pr\x9f\xe9\xba\xb7\
-\x8a\xc0\xb7\xcec\x91S\x91k\xba$#'u\xf0d\
-d#\x81\xff\x9d\xc7#\x9f\xea\x8cLi\xceF6\x13\
-\xf8\xef\xac\x89\x1c\xd2\x0f)$\xe9\xd7\xe1z\x02O\xd8\
-\x19\xf9Y'\xa4\xb0\xa4\xce\xeehY\xe0;#o\xea\
-\x81\x14\x9e\xd7#K[\x13xy\xe4\x03\xb3\x97J2\
-\x17\xb9\xb7\x15\x81\xd3m\xf9\x0bf.\x95%uze\
-\xed\x02\xaf \xafT\x9c\xaf\x22\xf7\xd5*p\xba\xe6=\
-m\xc6Ry>\x1a\xf2\x9axH\x81\xdd\xb0\x92\x96n\
-lU%\xf0\x0e3\x95\xc6\xf2l-\x02?\x10<\xe7\
-\x95\xf6r)\xb2\xba\x06\x81g\xcdR\x1a\xcd\xe1\xd2\x05\
-~\xdc\x0c\xa5\xe1\x5c\x8fl*Y\xe0\xb3f(\x8d\xe7\
-t\xa9\x02?fv\x227\xf2h\x89\x02\x9f27\x91\
-\x1b9Y\x9a\xc0iI\x99\xcd\xf8\x22\x93$\x17V\x95\
-$\xf0\x8b\x99\xbf\x90\x850\xd9?\xfct\xe4\xa1\xc8\x1d\
-!L\xef\xb1'\x98Jn\xef\xba\xb35L\xee\x16/\
-d\xee\xec\x9e\x92\x04>\x93\xf1\x8b8\x16&\xcf\x96\x95\
-\x10}\xb26\xe4}\xe49W\x8a\xc0\xe9D\xbf\x1c\x07\
-\xd0\xfd\x16yN\xd1\x90\x99]]\xd7r\xfcj\x5cV\
-\x82\xc0Oe\xfa\x0f\xf6\xbcra vg\xea\xf0\x93\
-%\x08\xbc/\xd3\xcff\xc5\xc2\x90\x1c\xcf\xd0\xe3\x97K\
-\x10\xf8`\xcf\x1f\xfa\xb2k^\x8c\xc0\xba\x0c7\xb6\x0e\
-\x94 \xf0\xb9\x9e?\xf4!e\xc2H\x1c\xe9\xb9\xcb\x9f\
-\x95 \xf0w=\x7f\xe8\xa7\x15\x09#\xb1\xbd\xe7.\xcf\
-\x97 \xf0O=\x7f\xe8\x07\x15\x09#\xb1\xa1\xe7.\xff\
-X\x82\xc0}?B\xb2H\x03c\xb1$\xc3\xa3\xa4\xe6\
-\x04^\xa2H p\xb9?\xa1\x1fR$\x8c\xc4\xc3-\
-\xfe\x84\xfe\xbe\xe7\x0f\xbdU\x910\x12}\x9f\xe5V\xc4\
-M\xac\xbe\x1f#\x1dV$\x8c\xc4\xd1\x16\x1f#\xf5\xbd\
-\x90#]7\xacU&\x0c\xcc\xfaV\x17r\xe4XJ\
-9\xabP\x18\x98\x13\xad.\xa5\xdc\x12\xf2d\x97Ra\
- \xf6d\xea\xf0\x13%\x08|W\xc8\xb7\x9dp\xb7r\
-a\x00y\x7f\xcf\xd0\xdfb\xb6\x13&r\xbe\x03)\xed\
-\x12Y\xa7h\xc8p\xcd{\x22co\xe7r\xfc\xdd\xb9\
-\xbe\x8c\xbd!o\x16\xba\xbb\xd3\xdb\xbb\xe5n\x16{\xe0\
-\xff,\xd2\xd8\xd0=*:\x1a\xf2\x1f\xa9\xf3BI\x02\
-\xa7C\xed\xae\x06\x11I)\xeeP\xbb\xc4Is\x13\xb9\
-\x91\xf7ry\x96S\xe0M\xe6&r#E\x1e\xec\x9e\
-\xf0j\x15i=s9\x1d\xcb-\xf0f\xf3\x93\x86\x93\
-^n\xb6\xb1d\x81\x13\xc7\xccQ\x1aM\xf6\xe3\xa0\x86\
-\x10xM\xf0\x82oi/\x17C\xa6;\xcfC\x0b\x9c\
-\xe3l!\x91i\xcf \xdb`\x87|p\xfe\x86\x99J\
-#yu(\xaf\x86\x14xi\xe4c\xb3\x95\xca\xf3a\
-\x18pe\xe0\xd0\xcb\xd7\xee\x89\x9c7c\xa94_F\
-\xee\x1d\xd2\xa91\xd6\xa0\xa6e\x96\x17\xccZ*\xcb\xf9\
-\xae\xdb3\xb5\x0b\x9cX\x1ey\xdf\xcc\xa5\x92\xa4K\xc3\
-\x15c\xb84\xe6n\x90tM\xfc\x9a\xd9K\x057\xac\
-F\xdb\x0d7-\xaf\xaf\xb8\xa4\x07RX\xd2s\xde\xd1\
-OL\x9d\x96\xbd\x99\xab\xc3d\xd5\xcau\xbd\x90\x02\xf2\
-N\x18`\x91FI\x02\xdf\xbc\x83\xe9\xb4~\xc8\x94\xe6\
-\x93\x90yms\xe9\x02\xffI\xfa\x92\xd2~b\x87\x02\
-\xc8\xd8I\x1dL\xfby\x1f\x99FW\xa6\xfd\xd8\x93\x95\
-\xfa##\xe7\xfeiv\xa4\x84\xb3\x8bD\xc6\xcc\x0c\x81\
-\xa7K`\x07\xba\xd5\x0d\x81\x0d\x04\x04&\xb0\x81@_\
-\x08L`\xe8\x0b\x81\x09L`\x02\x1b\x08\xf4\x85\xc0\x06\
-\x02}!0\x81A`\x03\x01\x81\x09l \xd0\x17\x02\
-\x13\x18\xfaB`\x02\x13\x98\xc0\x06\x02\x02\x13\xd8@\xa0\
-/\x04&0\xf4\x85\xc0\x0aN`\x02\x1b\x08\xf4\x85\xc0\
-\x06\x02}!0\x81A`\x03\x01\x81\x09l \xb7F\
-z%\xc7\xce\xc8l\xe4\xeb\xc8\xb50\xfd\xb9\xd6\xfd\xad\
-\xb3\xdd\xdf\xbeD_\x08\xdc\xe2@\xb6E~\x08\xe5\xe7\
-\x87\xee\xb3\xe8\x0b\x81\x9b\x18\xc8m\x91\xfd\xa1\xbe\xec\xef\
->\x9b\xbe\x10\xb8\xea\x81\xd4(\xef\xcd\x12\xeb\x0b\x81\xab\
-\x1d\xc8\xb6P\x7f\xb6\xe9\x0b\x81k\x1cH\xba\xd93\xdf\
-\x80\xc0\xdf\x85\xc9\xbb\x9f\xf5\x85\xc0U\x0ddgh'\
-\xcf\xe8\x0b\x81k\x1b\xc8\xf1\x86\x04>\xae/\x04\xaem\
- \xf3\x0d\x09<\xaf/\x04\xaem \x97\x1b\x12\xf8\xb2\
-\xbe\x10\xb8\xb6\x81\xfc\xda\x90\xc0\xbf\xe8\x0b\x81\xfd\x84\xf6\
-\x13\x9a\xc0\x04v\x13\xcbM,\x02\x13\xd8c$\x8f\x91\
-\x08l!G\x03\xf2Z\xc8A`K)\x0b\x8e\xa5\x94\
-\x04\xb6\x99\xa1\xd0\xd8\xcc@`\xdb\x09\x0b\x96\xd7vB\
-\x02\xdb\xd0_Xl\xe8'\xb0#u\x82#u\xf4\x85\
-\xc0\xe5\x0f\x04\xfaB`\x02\x13\x98\xc0\x06\x02\x02\x13\xd8\
-@\xa0/\x04&0\xf4\x85\xc0\x04&0\x81\x0d\x04\xfa\
-B`\x03\x81\xbe\x10\x98\xc0 \xb0\x81\x80\xc0\x046\x10\
-\xe8\x0b\x81\x09\x0c}!0\x81\x09L`\x03\x01\x81\x09\
-l \xd0\x17\x02\x13\x18\xfaB`\x10\x98\xc0\x06\x02}\
-!\xb0\x81@_\x08L`\x10\xd8@@`\x02\x1b\x08\
-\xf4\x85\xc0\x04\x86\xbe\x10\x98\xc0\x04&\xb0\x81\x80\xc0\x04\
-6\x10\xe8\x0b\x81\x09\x0c}!0\x08L`\x03\x81\xbe\
-\x10\xd8@\xa0/\x04&0\x81\x09l  0\x81\x0d\
-\x04\xfaB`\x02C_\x08L`\x02\x13\xd8@\xa0/\
-\x046\x10\xe8\x0b\x81\x09\x0c\x02\x1b\x08\x08L`\x03\x81\
-\xbe\x10\x98\xc0\xd0\x17\x02\x13\x98\xc0\x046\x10\x10\x98\xc0\
-\x06\x02}!0\x81\xa1/\x04Vp\x02\x13\xd8@\xa0\
-/\x046\x10\xe8\x0b\x81\x09\x0c\x02\x1b\x08\x08L\xe0\x0c\
-\x5c\xe9y w(y\xb5,\xe9\xb9+\x0b\x04^<\
-?\xf5<\x94\x07\x15\xbdZ6\xf4\xdc\x95\x1f\x09\xbcx\
-\xbe\xedy([\x15\xbdZv\xf4\xdc\x95y\x02/\x9e\
-s=\x0f\xe5\xb0\xa2W\xcb\xd1\x9e\xbb\xf2\x19\x81\x17\xcf\
-\xc1\x0c\xd75k\x95\xbd:\xd6w\xb3\xed3\x07\x08\xbc\
-x\xf6e\xb8\xb38\xab\xf0\xd5q\x22CO^&\xf0\
-\xe2\xd9\x12\xf2d\x97\xd2W\xc3\x9eL\x1dy\x82\xc0\x8b\
-\xe7\xee\x0c\x8f\x92R~\x8b\xecV\xfe*\xe4\xfd=C\
-?\xd2\xcf\xf1e\x04\xee\x873!_\x8eG\xd6\x11\xa1\
-\xc8k\xdew3\xf6\xe2\xe3\x12\xbe\x87R\x86\xb57\xe4\
-M\xfao{$\xb2=\xf2p\xb7 \x80$\xd3\xb7H\
-cC\xf7\xa8\xe8H\xa6_e7\xe7\x05\x02\xf7\xc7\xca\
-\xc8\xd5 2L\xaeEV\x11\xb8_N\xe9\x95\x0c\x94\
-\xf7J\xf1\xa2$\x817\xe9\x95\x0c\x94G\x09\x9c\x87\xb3\
-\xba%\x993W\x92\x13\xa5\x09\xbcY\xbf$c\xaeG\
-6\x128/\xc7\xf4L2\xe5Pi>\x94(\xf0\x9a\
-\xc8\xcf\xba&=\xe7b(\xe4\xces\xe9\x02'\xb6\xeb\
-\x9b\xf4\x9c\x22\xb7\x99\x96\xfc`\xff\x0d\x9d\x93\x9e\xb2\xbf\
-T\x0fJ\x16xi\x98,w\x13YL>\x0c\x05\xaf\
-\xbc+}y\xdd=\x91\xf3:(\xff3_F\xee+\
-\xd9\x81\x1a\xd6\xc8\xa6e\x96\x17tQn1_t\xdd\
-\x99!\xf0\xf8,\x8f\xbc\xaf\x93\xf2\x1f\x93.\xbdV\xd4\
-\xd0\xfd\x9av\xab\xa4k\xe2\xd7uS\xfe%\xaf\x86\x8a\
-v\x9b\xd5\xb8\xed,=b\xba\xa4\xa7\xf2\x97\xa4\xe7\xbc\
-\xd5\x9dHZ\xeb\xde\xd1\xd5a\xb2\xaa\xe6\xba\xdeJ\xcc\
-;\xa1\xc0E\x1a-\x0b|\xf3\x0e\xa6\xd3\xfa\xdbl>\
-\x09\x85\xadm&\xf0?\x93\xb6\x87\x9d\x0c\x93\x8d\xdaR\
-w\xd2\xc1\x0fi?\xef#-t\xbb\xb5cY\xd2c\
-\x83t\x08\xda\x5c\xe8\xff\x0ca\x19/\x0b\xddL\xd31\
-8\xf7\xb7\xd4\xe9\x96\xcfX\xba+\xf2d\x98\x9c\xfd{\
- \xf2y\xe4\x9b0y\x17\xd3\x15NL]\xaet\xb3\
-I3JoLx+\xf2R\x98\x1c\xfd\xba\xac\xd5\x1e\
-;,\x0d 0\x00\x02\x03 0@`\x00\x04\x06@\
-`\x00\x04\x06\x08\x0c\x80\xc0\x00\x08\x0c\x10\x18\x00\x81\x01\
-\x10\x18\x00\x81\x01\x02\x03 0\x00\x02\x03 0@`\
-\x00\x04\x06@`\x80\xc0\x00\x08\x0c\x80\xc0\x00\x08\x0c\x10\
-\x18\x00\x81\x01\x10\x18\x00\x81\x81\xd2\xf9\x03\xd8'\x22\x80\
-O\xf0\x0d9\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x1c\xee\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x05\x82iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:ti\
-ff=\x22http://ns.ad\
-obe.com/tiff/1.0\
-/\x22 xmlns:exif=\x22h\
-ttp://ns.adobe.c\
-om/exif/1.0/\x22 xm\
-lns:xmp=\x22http://\
-ns.adobe.com/xap\
-/1.0/\x22 xmlns:dc=\
-\x22http://purl.org\
-/dc/elements/1.1\
-/\x22 xmlns:photosh\
-op=\x22http://ns.ad\
-obe.com/photosho\
-p/1.0/\x22 xmlns:xm\
-pMM=\x22http://ns.a\
-dobe.com/xap/1.0\
-/mm/\x22 xmlns:stEv\
-t=\x22http://ns.ado\
-be.com/xap/1.0/s\
-Type/ResourceEve\
-nt#\x22 tiff:Orient\
-ation=\x221\x22 exif:C\
-olorSpace=\x221\x22 ex\
-if:PixelXDimensi\
-on=\x22240\x22 exif:Pi\
-xelYDimension=\x222\
-40\x22 xmp:CreateDa\
-te=\x222023-07-17T0\
-9:42:58+02:00\x22 x\
-mp:ModifyDate=\x222\
-023-07-17T16:09:\
-04+02:00\x22 xmp:Me\
-tadataDate=\x222023\
--07-17T16:09:04+\
-02:00\x22 dc:format\
-=\x22image/png\x22 pho\
-toshop:ColorMode\
-=\x223\x22 xmpMM:Insta\
-nceID=\x22xmp.iid:5\
-0b71ea1-e3e2-664\
-8-9612-93518be83\
-5b7\x22 xmpMM:Docum\
-entID=\x22xmp.did:5\
-0b71ea1-e3e2-664\
-8-9612-93518be83\
-5b7\x22 xmpMM:Origi\
-nalDocumentID=\x22x\
-mp.did:50b71ea1-\
-e3e2-6648-9612-9\
-3518be835b7\x22> <x\
-mpMM:History> <r\
-df:Seq> <rdf:li \
-stEvt:action=\x22sa\
-ved\x22 stEvt:insta\
-nceID=\x22xmp.iid:5\
-0b71ea1-e3e2-664\
-8-9612-93518be83\
-5b7\x22 stEvt:when=\
-\x222023-07-17T16:0\
-9:04+02:00\x22 stEv\
-t:softwareAgent=\
-\x22Adobe Photoshop\
- 24.6 (Windows)\x22\
- stEvt:changed=\x22\
-/\x22/> </rdf:Seq> \
-</xmpMM:History>\
- </rdf:Descripti\
-on> </rdf:RDF> <\
-/x:xmpmeta> <?xp\
-acket end=\x22r\x22?>\xe1\
-n]a\x00\x00\x17\x12IDATx\xda\xed\x9dy\
-\x94\x97\xd5y\xc7g\xc6\x19f\xd8\x5c\x00\xdb\x135n\
-qA\x89\xc6\xa3\xf6\xb8%\x1e\xf7*\x8b,b\x12s\
-\xc0\x1eW\x10\x01\xa9\xa2\xa8iR\x8d(\x10\x16\x91h\
-\xdb\xd4h\x14\xad\x0b\xa8h5\xad\x82\x08\x22ni+\
-\x03\xa8\xd1\x14\x94\xc54\x11A\x16\x01\x07\x18\xe6\xd3?\
-\xee\x9dH\x14\x9c\x99\xdf\xdc\xe7.\xef}\x9es\xbe\xe7\
-\xe8\x00\xf3\xbb\xcf\xf2\xfd\xbd\xef\xbd\xf7Y\xca\x802\x85\
-B\x91&\xd4\x08\x0a\x85\x12X\xa1P(\x81\x15\x0a\x85\
-\x12X\xa1P\x02+\x14\x0a%\xb0B\xa1P\x02+\x14\
-\x0a%\xb0B\xa1\x04V(\x14J`\x85B\xa1\x04V\
-(\x94\xc0\x0a\x85B\x09\xacP(\x94\xc0\x0a\x85B\x09\
-\xacP(\x81\x15\x0a\x85\x12X\xa1P(\x81\x15\x0a\x85\
-\x12X\xa1P\x02+\x22A9p\x04p\x19\xf0+`\
-6P\x0b\xac\x046[\xac\xb4?\x9bm\xff\xce\xa5@\
-W\xfbo\xd5\x86J`\x85gT\x00\x7f\x0bL\x03V\
-S\xba|\x02<\x0e\x9cm\x7f\xa7\xdaV\x09\xac\x10\xc4\
-_\x037\x01\x1f\xe0^\x96\x00\xa3\x80\xbd\xd5\xceJ`\
-\x85[T\x02\xd7\x00\xeb\x91\x97\x8d\x96\xc8\x95jw%\
-\xb0\xa2\xf58\x0e\xf8/\xfcK-p\xb2\xda_\x09\xac\
-(}\x9f;\x16h \x9cl\x07n\xd7\xc3.%\xb0\
-\xa2e\xa8\x06\x1e!\x1e\x99\x0e\xb4U\xbf(\x81\x15M\
-\xa3\x13\xf02\xf1\xc9kz\xc0\xa5\x04V|=:\x02\
-\x8b\x89W\x16\x02\x1d\xd4OJ`\xc5\xce\x132\xa6\x11\
-\xbf\xcc\xd0=\xb1\x12X\xf1U\xfc\x94t\xe4\xc7\xea/\
-%\xb0\xe2\x0b\xf4\xb4'\xbe\xa9\xc8v\xa0\xbb\xfaM\x09\
-\xac0\xa7\xbb+IO>\x02\xda\xa9\xff\x94\xc0\xb9\xe3\
-\x1fHWnT\xff)\x81sF\x17O\xe9\x91R\xb2\
-\x0e\xe8\xac~T\x02\xe7\x8a)\xa4/\x93\xd4\x8fJ\xe0\
-\x1c\xb1\x07PW\x00\x02o\xb6\xf7\xd7\xeaS%pV\
-\xb8\x98\xe2\xc8\x8f\xd4\x9fJ\xe0\xdc\xf0l\x81\x08\xfc\xb4\
-\xfaS\x09\x9c\x13v\x07>/\x10\x81\xeb\xec\x96@}\
-\xab\x04\xce\x02\x03\x05\xc9T\x0b\x0c\x06\x0e\xb7w\xccm\
-1\xfd\xaf\xae\x02\x16\x09~\xee@\xf5\xab\x12\xd8':\
-`zA\xfd\x04\xb8\x0bx\x08\xf8\x0d\xa6\xeaf\x1e\xf0\
-0\xf0s`8\xd0\x1bS%\xe4\xea\xb3\x9f\x16 P\
-=0\x92\xaf\xefm\xb5\x1bp\x83P\xd6\xd7\x0c\x87\xf6\
-\xd9\x0b\xe8\x05\x0c\xc3\xd4D?\x04\xcc\xb5\xbey\x0e\x98\
-\x0aL\x06n\x06N\xcf9\xa1$7\x85\xbf\x03\x8c\x07\
-\xde\x04\xb6\x95@\x90y\x98v3\xddZ\xb1\x86CJ\
-\xf8\xec\xe6\xc8\x90\x16\xaca\xb8\xc0\xe7o\xb3\xba\x95j\
-\x97#\x81\xeb-Q[j\x9f\xad\xc0\xab\x96\xecG+\
-\x81\x8b\xd7O\xeaBK>\x97\xb2\x10\xb8\x80\x96us\
-\xac\x04\xe6\x08\x90\xe7\xe5\x12\xec2_`\x1dsiY\
-/\xadr\xa0\x9f}\xedw\xbd\x8e\xfed\xd0\xd7\xab\xe8\
-\xe4\x1d\x80|\x9e\xf1\x22\xfb\x05\xd1\x14\x91\xdbb:[\
-HH\xef\x12l\xd3Gh-O\xd0t\xf7\x8eF\xe2\
-.\x14\xf6\xcd\x0a\xe0\x87J\xe0\xf4p\x080\xd3\xf3I\
-\xec\xdb\x96\xc8U_ZK\x95}\x1a\xbc/\xf4\xb9\x1b\
-\x80\x9a\x12lTc\xff\xad\x84\xfc\x0e\xe8\xbb\x93'`\
-\xa5\xd0\x13\xb7)y\x1e8X\x09\x9c\x06\xae\xb3\xd9A\
-\xa1d-0\x0bS\x9c?\x1b\x93/,)\xd3Za\
-\xab'\x84\xd7\xf6)\xf0\xa2]\xe3,\xfb\xff\xa1d3\
-0B\x09\x1c\xf7^\xf7\x9f\xc9O.j\x85\xcd.\xce\
-\xd0^\xf7\xed\xe4-I\x09\x1c\x18{\xdao\xfa\xdcd\
-\x8b\xd5\xbdT\xbbu\xb6\xbf#7\x99IA\x12O\x8a\
-B\xdeE\xe4)\x0f:\xb0\xdfC\x99\xda\xae\xb6\x08$\
-N\x9d\xbcUvo\x95\xab\x1c\xe3\xc0\x86\xc7fl\xbf\
-9@\x1b%p8\xdc\x9fq\xf0\xcdrh\xc7\xd9\x19\
-\xdb\xf1^%p\xb8\xd3\xe6\x5c\xa5\xde\xd1\xd3w\xc7\x0c\
-\xb5\xfa\x8c\xedy\x8d\x12\xd8/\xbeE\xd8\xab\xa2\xd02\
-E\xc0\xa6wgl\xcfM\xc0AJ`\x7f\x98\x99q\
-\xb0\xad\x14:|\xd9\x13X\x96\xb1]\xffC\x09\xec\x07\
-?\xca8\xc8\xb6\x02'\x09\xda\xf6\x04\xf2\xbcVj\x94\
-\x1f(\x81\xe5\x935Vf\x1c`\xc3<\xd8xx\xc6\
-\xf6]Fb\x05\x10\xa9\x11\xf8\xfb\x19\x07\xd7\x9d\x1e\xed\
-|G\xc6v\xee\xa7\x04\x96\xc3+\x99\x06\xd5\xe4\x00\xb6\
-\x1e\x9f\xa9\xad_R\x02\xcb\x15\xe3\xe7&\x0d\xc0h\xc2\
-L\x03,\x07n\xb5k\xc8M\xbe\xad\x04v\x8f\xb1\x99\
-\x05\xd1g\x982\xc4\x18\xb6-\x9b2\xb3\xfd\x1dJ`\
-\xf7xM\xd0a\x7f\x04\xc6\x00=\x80\xe3\x80\xf3\x80q\
-\xf6\xe7!\xe4uL\x8b\x99Xl\xdf\xcd\xae)\x84|\
-\x8c\xe9M\xd6\x138\x1e\xd3+k\x9c\xfd\xb9\x94\xccW\
-\x02\xbbE;{\x85\x22\xf1\x8a:\x81]7Ek\x87\
-i\x14\xb7\xdaS\xb0\xae\xc3\xf4\xb6\xaa\x88\xd0\x07\x15\xf6\
-\x84z\x83'[\xac\xc14\xe0k\xbf\x8b\xf5\xb4\xb7\x07\
-{\x12\xb2\x85D\x1a\xe5\xa5B\xe03\x85\xc8{E3\
-?\x7fw\xbb\x1f\x94\x0a\xde\xb5\xf6\xf7wJ\xc0\x17\x9d\
-\x81\x9f\xd95Km\x1dF\xd3\xfc2\xc9AB\xeb8\
-C\x09\xec\x0e7\x0b8hB\x09\xeb\xe8\x08\x5c\xea\xe8\
-4\xbc\x01\xd3ho\x88\xfd\x82Hq\xb6\xd3Pk\x0b\
-\x17\x07]\xaf\x03\x97S\xda\x9c%\x89'\xf1MJ`\
-w\xb8K`\xcf\xdb\xdaW\xa4\x03\x81K05\xb9K\
-i^1\xc0{\xc0\x03\xc0\x95\xc0\xfe\x09\x92vW\xd8\
-\x1f\xd3L\xfeA\xabcS\x84\xae\x07>\xc0\xf4\xde\xbe\
-\xd4\xda\xb25\x9f\xdf\x1eX\xe58F&)\x81\xdd\xc1\
-u\xd1\xf9\x18\x815Va\x8a,N\x03\xce\x02\xba\xdb\
-S\xe4\xefb\x12\xe5\xdb\x14\x88\xb0M\xa1\xad\xb5\xc5w\
-1\x89\x11\xbd\xadM\xce\x00\x0eE\xa6\xa5\xcd\x04\xc71\
-\xf2\x80\x12\xd8\x1d\x9es\xec\x9c\x1e\x19\x91)\x17\xf4r\
-\x1c#\xcf(\x81\xe3\xbdB:A\x03\xbep8\xc9q\
-\x8c\xbc\xa2\x04v\x879\x8e\x9d\xd3S\x03^\x9f\xc0M\
-\xc8\x8bJ\xe0x\xf7\xc0\xe35\xe0\x0b\x87\x89\x8ec\xe4\
-A%\xb0;\x8cq\xec\x9cO0\xd3\x095\xf0\x8b\x81\
-v\xc0\x9f\x1c\xc7\xc8\xedJ`w\x18*p\xcf7J\
-\x03\xbf0\x18)\x10\x1fC\x94\xc0\xf1\xeeo\x1aS\xf5\
-\xf6\xd4\xe0O\x1e{ \x93\xea\xdaS\x09\xec\xd6I\x12\
-\xb9\xd0w(\x01\x92\x87D\xf3\x81m\xa9|\xb9\xa7\xe4\
-\xa89\x02\x8e\xda\x98h\x1a\xa3\xe2\x8b\x1c\xf5\xcf\x04\xe2\
-bN*6\xc8}\x9f\x03\xcd/hP\xc4\x87+\x85\
-bb\xa4\x12\xd8=\x8e\x10r\xd6\x9bJ\x84d\xf1\x86\
-PL\x1c\xa9\x04\x96\xc1\x02!\x87\x1d\xa8dH\x0e\x07\
-\x0a\xc5\xc2[)\xd9!5\xa7\xf5\x13r\xda\xa5J\x88\
-\xe4p\xa9P,\xf4U\x02\xcb6Z\xab\x15p\xda\xc3\
-\x89\x06\xf1\xde\xc09\x98~\xd1\xf7`\x06\x9e-\xc2\x94\
-7~\x8a\xe9,\xb1\xc5\xfe\xf7R\xfbg31cT\
-\x86\xda\x7f\xdb%Q\xdd%\xc6\xa2\xbeM\x9c\xddP\x0a\
-C`\xa9\xa7\xf0\x07\x09e\x1c\xf5\xc6\xb4\x99]\x84\x9b\
-B\xfa\x06`\xa1\xfd\x9d\xe7cJ\x01S\xb0\xc5R\x81\
-8\xe8\x9f\x1a\x1fR$\xb0\xc4S\xb8\x9ex\xebu+\
-0u\xb5\xbf\x04\xd6#/\xeb\x81\xa96yf\xb7H\
-mR\x85\xfbi\x8a\x8bS{\xfa\xa6J`\xa9\xa7\xf0\
-\xa1\x91\xe9Xc\xd3\xf9> \x9c,\x05\xae\x02\xaa#\
-\xb3\xcd!\x02\xba^\x90\x22\x17R%p\xa5\xdd\xd7\xb9\
-\x94X\x9a\x98\xb5\xc3\xcc>\xfe?\xe2\x91?\x00\xd7\x12\
-O\xa7\xc6\xd3\x1d\xeb\xf7)\x89\xcdDJ\x9d\xc0e\xf6\
-\xc0\xc6\xa5\x9c\x1b\x81N\xbd\x80\x0f\x89WVF\xb2O\
-<\xd7\xb1^\xb3S\xe5A\xca\x04\x9e\xe6\xd8\x89\xbd\x02\
-\xdfi>K:\xf2\x0ca\x9b\xf2\xb9.nyB\x09\
-\xec\x1f/:vb\x9f@z\xf4\x11\xd8\x0e\xf8\x90\xf5\
-\x98\xb1+!l\xd6\xdb\xb1./)\x81\xd3\xdf\x03\x9f\
-\xe2Y\x87j\xdc\xb7\xcb\x0d!\xbf\x0cp\xc8u\xb2c\
-\x1d\xd6\x91h\xd7P=\x85\xfeB\x0e\xf6\xb8\xfe\xce\x84\
-\x9b5$!\xaf\xe2w\xaa\xc4Az\x07\x9c.\x81\xdb\
-b\x9a\x87\xbb\x94\x06\x8f\x09\x0c\xfb`\x920\x8a&\xef\
-\x02\xdf\xf4x\xc5\xb6\xdd\xf1\xfa\xdf'\x91yH)\x13\
-\xb8\x0axR \xf8\xde\xf3\xb4\xfe\xae\xc0\x0a\x8a+\xcb\
-\x81\xc3=\xd9\xf2]\x81\xf5?\x89L\xd3y%0p\
-\x18\xf0\xb2P\xe0=\xe0a\xfd\xfb\x02\xcb(\xbe|\x04\
-\x1c\xe0\xc1\x9e\xf7\x0b\xad\x7f\x9e\x8d5%\xb0\x03\xec\x01\
-\x0c\x04\x9e\xc6\xb49\x91\x92\xc1\x1e\xf6\xbc\xef\x92\x8f\xbc\
-\xe3aO|\xa5\xe0\xfa\xb7\xd9\x98\x1bhcP\x09\xdc\
-\x02\xb4\xb3\xf7|S\xf13\x19\xbeA\xf8\x89Q]\xb0\
-\x03\xab\xe6\xca|\xe1\x93\xdd}p\x9f\x0f\xbd3\xa9\xc3\
-\xdc\xd1_\x1c#\x99cZL\x17{\xadR\xe79\xd0\
-\xa4Gh\xdcC\xbe2Y\xd8\xb6s=\xebSgc\
-\xb4\x8b\x12\xf8/\x9f\xb87\xe3\xa7\xd2fgr\xb5\xa0\
-n\xfdQ\xe9'h\xdf\xc1\x81tZ\x87\x99\x1f\xdc.\
-w\x02\xf7\xb2\x87\x1e\xa1d\xad\xe0k\xd1\x81\xd6\xd1\xb9\
-\xcbZ\xe4\xd2.;b\xfa{\x87<\xb0\xeb\x91#\x81\
-\xcb1\x93\x11\xb6\x07\x0e\xae[\x05u\xfcw\xe5\xee\x9f\
-e\x86\xa0\x9do\x09\xac[\x030\x96@\xb5\xc4\xa1z\
-\xf9>\x1dAP\xad\x17<)\xed\xa3\x9c\xfd\x8aHM\
-:\xd8+\x927\x9d\xa7\xec\x1bA\xa1\x09\xdc\x19\xd3w\
-(\x06\x19.\xb8\xa7\xf7}\xdf[oO}o\xb3{\
-\xcen6\xb0\xab\xecI\xf0^\xf6g\xfd\x80\xd1\x98\xd4\
-\xc7z\xcfk\x5c\x8a\x5c\xb6\xdb\xd5\x91\xc4\xd4b\x1b\xe3\
-\x85$p\x8d=\xf1\x8dA\xde@\xae]\xccH\x8fz\
-,\x07\xae\xc7\x5c\xa9\x94r\x0ds\x03~3\xc3F\x08\
-\xd9\xbc\x22\xa2\xd8z\xc5\xc6z\xa1\x08\x5c\x0e<\x16\x89\
-\x817\x22\xd7\xb8\xbb\x06?\x9d4Va&J\xb8\xb8\
-gm\x03\x0c\xc2\x8c\x5c\xf5q\xe8#U\xb9t\x84\xf5\
-m\x0c\xf2\x98\x8d\xf9\xc2\x10xL$\x86m@\xb6\xea\
-\xe4*\x0f:<$\xb4w\xef\x0c<\xe2a\xfd\x83\x04\
-\xed\x7f\x01n:u\xba\x901E!\xf0)\x11\x19\xf5\
-\x1f\x05\xf5\xac@\xa6\xd5i\xa3l\x05.\xf7\xe0\xaf\xc1\
-\xc8L\x82l\x94%\xc2O\xa7[\x22zX\x9c\x9c:\
-\x81+\x91\x1b\x87\xd2R\xf9'\xe1\xc09Mp\xed\x9b\
-\x80\xf3<\x9eWtG6\x8d\xf5{\xc2\xdb\xb5I\x91\
-\xc4\xdc\x22\x84\xab\x9b\xa4\x03\xe1\xbaH\x0c9\xceC\xd0\
-KU\xc7l\xf5L\xde\x1dI,\xf5$\xfeW\x0f\xeb\
-\x8f\xe5I<\x22U\x02\xff\x15\xb0!\xb0\xf1\xea0#\
-D|\xa4\x83J\xa5\x82^N\x98d\x1b\xc9T\xc5\xb5\
-\x9eNj\x87bF\xcb\x84\x94\xf5\x98\x118\xc9\x11\xf8\
-\xc6\xc0\x86[\x0e\x9c\xe8)\xd0{\x0b\x1eX\x85Nw\
-}TH7_)\x88\xc7\x09\x9fM4GF\xa5F\
-\xe0\x8a\x80F\xdb\x06L\xc1o\xe9\x97Ds\xba\xd5\xc4\
-Q\xf5\xd2I\xe8\x8ai\x82G\x1d\xf6\xb4>\xda\x16(\
-&\x97 \x94j)e\xb0s\x02\x19j&pt\x80\
- \x97\xe8quE\x04\xe4\x95\xbc\x1e[\x10@\x8f\xa3\
-l\x8c\x84\x90\xb3S\x22\xf04\x8f\x86\xa9\x03~\x0d|\
-'Pp\xef-pM\xb6\x9c\xb8z3Uc\xa62\
-\xb8\x94\xedxN;\xdc\x01\xc7`\xda(\xf9\xdc\x1f?\
-\x96\x0a\x81\xcb\xed\xeb\x9f\xa4l\xb0_\x12\x030y\xbe\
-!\x83[\xe2m\xe3\xfa\x88\xc8\xdb\x88Q\x02z\x9e\x15\
-\xc1\xf6`\x80\x8d%\xe9\x03\xd7U\x08\x5ccJ\xa5\xb4\
-I\xc9\xcb\x98\x19\xb65\x11\x05\xf60\xc7:\xd6\x03\xdf\
-\x88\x90\xc0\xfb\xe2\xbe\xfc\xf3\xea\x88\xf4\xab\xb1\x87\x91\xf3\
-\x04\xe3\xb7k\x0a\x04\xbe\x5c@\xf1\xfa\xc8\x9c\xbd#\xee\
-v\xac\xeb\xab\x91\xeaY\x86)\x02q)S\x22\xd5s\
-(2\xb5\xea\x97\xa5@`\x89\x84\x86\x91\x11\x07\xb5\xeb\
-)\x89\xa3#\xd6\xf5\x0e\xc7\xba\xbe\x10\xb1\xae\x12Ue\
-\xf7\xa5@`\xd7C\xc7j\x89{r\xfab\xc7\xfa\xf6\
-\x8dXW\xd7=\xbe\x16F\xack\x85\xc0\xed\xc2\xcc\x14\
-\x08\xbc\xc0\xb1\xd2\x83#vr\x19\xee\xe7\xf9v\x8bX\
-\xd7\xa3\x1c\xeb\xfaA\xe4\xbe\x1d\xe2X\xdf\xb7R \xb0\
-\xeb\x02\xf1\xc3#w\xb2\xeb\x13\xf7\xce\x11\xeb\xda\xc5\xb1\
-\xae\x9fD\xee\xdb#\x1d\xeb\xbb\x22\x05\x02ov\xact\
-\xdb\xc8\x9d\xec\xfa.1\xe61\x97\xd5\x02w\xf8\xb1\x0f\
-\xd2s)\x9b\x95\xc0J`%\xb0?\xb4w\xac\xef\xc6\
-\x1c_\xa1\xbb\xa2\xaf\xd0\xfa\x0a\xad\xaf\xd0\xc9\x1eb\x0d\
-\xd1C,=\xc4\x0ax\x1f\x9c\xdd!\x96\xebk\xa4E\
-\xc8u\x90\xd4k\xa4\xb0\xd7H\xb5\x11\xeb\xba\x9b\x80o\
-\x93\xb8F\xbaO\xe0\x02\xfc\x86\x88\x1d\xed\xba\xba%\xe6\
-D\x0e\xd7\xcd\x09cN\xe4\x90\xc8\xfd\xbe7\x05\x02_\
-&\xa0\xf8vL\xce\xb1\xa6R\x86\xc5\x9b\x8eu\x8d5\
-\x95r\x042\xa9\x94\x97\xa4@\xe0\xae\xc8\xc9|\xfb\x8a\
-Y\xf4b\x86}\x22\x0c\xeaoR\xfcb\x86\xbe\xf6\x0b\
-TJ\x0eK\x81\xc0\xe5\xc87\x09\xdf\x00L\xc7\x0c]\
-\x0e\xdd\xb5\x22\x97rB\x89\x16I\xa1\xcb\x09\xbb\xd8\x18\
-z\x02\xf9r\xc2\x8fI\xa4\x9c\xb0\x0cx\x1c\x7f\xb2\x05\
-\x98\x0a\x1c\x1b0\x08\x5c\x17\xf4\xaf\x88\xec>\xb8\x1a\xf7\
-c`C\x16\xf4\x1f\x07<\x8cl\xff\xeb/\xcb\xa3\x12\
-\xbaH\x19\xe8l\xc2\xc8\x8b\x84\xe9\xcc\xb1P@\x97A\
-\x11\x11Xbx\xd8[\x01\xf48\x06x)Pl\x9e\
-\x99\x12\x81+0\x8d\xbcBH\xbd=X\xf2\xd9\xa9c\
-\xb2\x80\x1e\xb14\xb5\xeb,\xb4%\x1a\xefQ\x87N\x98\
-\xc6\xfe\xf5\x81b\xf2\x7f\x11\x1a*P\xe4\xb6\xb2+\x80\
-\x93<\x05\xc8\xf9B:<\x12\x01\x81\xa5\xb6C\xdd=\
-\xad\xffx\xdc'\xdbDs\xa6!\xdd\xecm}`\xc3\
-m\xc1Oc\xf7\xb6\x82\xba\x86|\x95\x96\x9a\xbb\xbb\xd6\
-\xd3M\xc2\x08\xcf\xfb\xdc\x9d\xc9:\xc97)\x1f\x06\x8c\
-A~\xee!X\xee\x13Z{=\xd0'\x00y{ \
-\xd7G\xd9\xc7h\x95\xdb\x22\x89=\xd1\xfc\x05\x1f\xe9h\
-oEb\xc8\xd4\x87\x9b\xf5\xf0H\xde\x9e\xc8\x0e7;\
-Up\xed\xe5Bg\x12\xa5\xc8B\xcc\x80\xbfd\x09\x5c\
-\x06\xfc\x0d2Y-\xa5\xc8-\xc2\x81#9\x8db\x1b\
-~\xba\x93\x0cEv\x82\x81\xf4x\xd1\xdb#\x89\xb5\xed\
->\xce`|}\xa3\xc7b\xd4\x06\xcc\x10\xe8\xd4\x86\x81\
-\xed(\x8f\x22s\x7f\xda\x05?\xf7\xf7W\x0a\xda\xff\x87\
-\xc43\x8b\xfav\x1f\xdc\xf2E\xe0r\xfcL\x7fo\x8e\
-l\xc4\xf4\xae\x96J\xc7\xfb\x83\x07\x1dVc\xc6\x9d\xb8\
-H\xf6\xa8\xb6\x87Uk<\xac{\xa5\xfd<\xa9R\xc7\
-\xcd\x91\xc4\xd8#\xc2o\x19\xde\x09\x5cf\x83mv$\
-\x06~\x03\xb9N\x97\xd7z\xd4c%\xa6jf\xbf\x12\
-\xd6\xb9\x1f\xe6\xaa\xef#\x8f\xeb\x1d\x8e\x5c\xde\xc1k\x91\
-\xc4\xd6<\xc1/\xa9\xa0\x04n\xbcP\xaf\x8d\xc4\xd0R\
-\x8d\x02\xdab\x0a\xd5}\xef\xb7\xde\xc0\xf4m\xeeo\x9f\
-F\x9d\xec\x97f\x1b\xfb\xca}\xb4\xfd\xb31\x98\xaa\x22\
-\xdf\xe7\x12K\x04\xaf\x8eb\xb9\xed\xa8\xc5\xf3\xa8\x9f\x10\
-w\x8b\x1d0\x85\x08\xa1e\x1df\xec\xa4\x84\x8e\xe7\xa2\
-\xf2e\x91:E\xef\x02|\x16\x81~\xd3ml\x97\x15\
-\x9d\xc0\x8d{\xe2Q\x84Kmk\x94\x9f\x0a\xea\xf8\x8c\
-r\xf6\xcf\xf2$\xc5\xbd\xefm\x00\xc6\x12h\xf8@\xe8\
-4\xbd\xee\xb8o\x82\xd7\x12Y\x03t\x14\xd2m\x7fL\
-\xc6Q\xee\xb2\x06SK,a\xe3=\xec\x9bT(Y\
-\x01\x9c\x17\x92C\xb1\xf4\xde\x1d\x150\xd8%\xefV{\
-Ft\xad\x11\xea\xe9$\x99E64\x90^k1m\
-\x9e\x827\x96\x88\xa9`\xbc30\x09\xf8\xdc\xb33\xe6\
-\x08\xeb5%c\x02O\x14\xb6\xed|\xcf\xfal\x06\xee\
-$\xa2\xd6\xbf\xb1v\xc3\xef\x85)\xd2\xdf\xe8\xe9\x04w\
-_A}\xaa\x91m\xd3\x12\xab\xccC\xb6)\xc1\xfe\x9e\
-\xden\xea\x80g1\x9d;v\x8f\x8d/1\xf7\xe4m\
-\xdc\xe3\x0c\x04f \x9b\xdew\x85\x07=j3\x22\xef\
-\xdb\x98k\xac\x94\x06\x8f\xed([\x81\xa7\x80\x011\x92\
-6%\x02\xef\x88C\x80\xb9B\x0e\xbb\xcf\xc3\xfa\xf7\x05\
-\x96e@\xde\x95\xf6\xe9(m\xcf\xa9B\xeb\x7f\x09\xf8\
-V*\xbcH\x89\xc0e@\x95\xbd\x92p-\xefxZ\
-\xff\xe1\xc0\xf2\x02\x93w\x19\x02\x9d\x17w\x81\xdf\x0b\xac\
-\xffq\x84\xab\x87r'p\x19\xd0\x0ex_`\x1f\xec\
-\xab\x89\xdc7\x90\xe9\xa1\x15Z\xde\x11\xbc.\xda\xd9\xd0\
-\xb1\x06\x81\xf5\xd7\xa4\xc6\x87\x14\x09\x5c\x06\x5c(\x10\x80\
-\x07x\x5c\x7f\xa7\x82\x1dl\xcd\xc3o\x0a\xe1\xa1\x02:\
-\xf4I\x91\x0b\xa9\x12\xb8\x0d\xee[\xd8\x9c\xe8Y\x87J\
-L\x06O\xca\xf7\xc4\x0d\xc0]\xf8o\x81{\xaac=\
-\xd6\xa4\xf6\xea\x9c:\x81\xcb\x04\x0e\xb4z\x06\xd2\xe3|\
-\xe0\xd3\x04\xc9\xbb\xce\xbe\x09\x85\xb0\xd9\x05\x8eu\x99\x99\
-*\x0fR&\xf0S\x8e\x9d\xd8=\xa0.\xfb\x03O'\
-D\xde'=\xeeww\x86>\x8e\xf5yL\x09\xec\x1f\
-s\x1c;\xf1\x9c\x08t\xea\x89\xffR\xc4\x96\xc8\xd2\xc0\
-_t;6\xdc\xd3'p\xc2\x04\xae\x12\xd8\x03\x9f\x1a\
-\x89nm1\xf5\xad\x1fED\xdc\x95\x98b\xfcXN\
-i\xcf\xd2=p\xda\x04\xfe\xbe@\x90\x1e\x14\x99\x8e\xd5\
-\x98\x9e\xd0K\x02\x12w\x89]Cud\xb69LO\
-\xa1\xd3%p\x05\xee'\xa7o\x8d\xfc\x1b\xf88{\xda\
-\xbb\xda\xd3\xe1\xd4T\xfb\x94+'\xde[\x08\xd7\xb5\xe4\
-\xb5\x11\xeb[(\x02K<}\xdfOD\xf7\x1a\xbb\xff\
-\x9b\x08,\xc0M[\x9c\xed\x98\xde\xdd\x13\xed\xfe6\x95\
-d\x86\x0f\x05\xe2\xa0\xaf\x12X\xbe\x93\xc7\x22\x01\xc7\xfd\
-:\xd1\xadDg\xfb\xa4\xbc\x1a\xf8\x05\xf0\x82%\xf6R\
-\xbb\xaf\xdbb\xb1\xc6\xfe\xac\xd6\xfe\x9d)\x98b\x80\xb3\
-\x88\xa84\xae\x85\x90\xe8r\xba \xb5\xa7\xb0>}\x8d\
-\x5c\x9c\xf0i|\xae\xb8B(\x16z+\x81\xe5\xb0H\
-\xc8i\xfb)!\x92\xc3\xc1B\xb1\xf0?J`\x19|\
-[\xc8a\xf3\x95\x0c\xc9\xe2\xb7B1q\x98\x12\xd8=\
-\xa4\xe6\x0d_\xa2DH\x16\x83\x84b\xe2Z%\xb0{\
-\xbc\x22\xe0\xa8\xf5\x04\xe8\xe5\xabp\xda\xe9D\xa2\xed\xd2\
-\x8bJ`\xf7\xe5w\x12-unU\x12$\x8f\xb1\x02\
-q\xb1\xd5~9(\x81\x1d\xa1\x8f\x80\x93V\x13y\xbf\
-#E\xb3\xb0\x172\xd5\x5c\xdd\x95\xc0\xee0\x5c\xc0A\
-\xd7i\xf0\x17\x06\xa3\x04\xe2\xe3*%\xb0;\x8cw\xec\
-\x9c?bZ\xf3h\xf0\x17\x03\xed\x81\x8f\x1d\xc7\xc8h\
-%p\xbcY7c5\xe8\x0b\x87\x899f\xe7\xa5\xe2\
-\x9cy\x8e\x9ds\x9e\x06|\xe1p\xbe\xe3\x18\x99\xa5\x04\
-v\x07\xd7\xc3\x9b\x8f\xd7\x80/\x1cNv\x1c#s\x95\
-\xc0\xee\xf0\x5c\x8e'\x8c\x8a\xa0O\xe0\x19J`wx\
-\xc8\xb1s\xc6\x09\xac\xb1\x8dM\xc1;\x033\xe0\xfbB\
-\xa0?\xf0=\xfb\xf3\x9c\x0e\xcdj0\x0d\x12N\x01\xfa\
-af]\x9d\x05\x9c\x8e\x99\xb0Q%\xf0\x99\x93\x1c\xc7\
-\xc8\xfdJ`w\xb8\xcb\xb1s\xfedO.[\x9bL\
-\x7f\xb9=`[F\xf3js\xdf\xc7\x14\xcb\x0f\xc1\xcf\
-\xf8\x11_\xd8\x0f\xb8\xd2\x1e\xfc\xbcK\xd3\xadr\xb7a\
-\xca\x1b\xa7\xdaT\xd6\x03Z\xf9\xf9\x1d\x80O\x1c\xc7\xc8\
-D%\xb0;\xfcX\xe0\x9eoR\x89\xa9{\x83q\x93\
-D\xdf\x80)\xa4\x18\x9aJ\xd6\xcf\x97\xd0\xd1\xda\xe2e\
-\xdc4\x16x\xcd~!\x962p\xfd\x17\x02\xf11J\
-\x09\x1co\x13\xb3F\x19\xd4\x82l\x9fq\xc0&\xa1u\
-\xac\x05n#\x8d\xe2\xfaN\xc0-\x98&\x01\x12\xf2\x99\
-\xbd\x83m\xee\x97\x9a\xd4\x94\xc2\xd3\x94\xc0n/\xea\xb7\
-\x0a9j\xf2\xd7\xbcN\xb7\xb7\xdf\xc4\xbe\x1a\xafo\x00\
-\xae\x01v\x8b\xd0\x07\x15\xc00\xdcw\x03\xdd\x95\xac\x06\
-F~\xcd\xd9A\x07\xe4\x86\xa7\xd7a\xba\x83*\x81\x1d\
-\xe2u\xc1`Y\x05L\xb0'\x99'ar\xaf'\x09\
-\xec\xab\x9a+o\x00\xdd\x22\xb2}7\x81\xab\xbc\x96\x9c\
-W\x8c\xb7\x07a'X\x1fM\x14\xf6\xcd\xbcTx\x91\
-\x12\x81\xc7\x91\x97l\xc2\xb4\x10\x0am\xf7\x0b\x05\xb7\x0e\
-\xb1\xcah%\xb0{\x1cE~\xd2`\xf7\xc6!\x1a\xad\
-\x95\x03?#\xed\xe1k\xa5\xda\xfcH%\xb0\x0c\xe6\x92\
-\xa7\xdc\x1d\xc0\xd6\x132\xb5\xf5\xac\x948\x91\x1a\x81/\
- _\xb9\xd3\xa3\x9d\xc7dl\xe7\xf3\x95\xc0r\xa8\x04\
-Vd\x1c\x5c\xc3<\xd8xX\xc6\xf6\xfd0\xd2\x1b\x80\
-\xc2\x10\xb8\x0c\xb8(\xe3\x00\xdbbOb\xa5l{\xa2\
-\xfd\x8c\x5c\xa5\x7fj|H5u\xef\xf9\x8c\x83l\x19\
-&\xb1D\xa25\xcd\xf2\x8c\xed\xfa\x9b\x14\xb9\x90rS\
-\xef\xcd\x19\x07\x9b\xc4\xa1\xd6=\x19\xdbs\x13p\xa0\x12\
-\xd8/Fd\x1cp\xf5\xc0\xd1\x0emy\x0c\xee\xa7\xfd\
-\xe9\xd9\x82\x12\xb8I\xdc\x9bq\xd0\xb9\xec]<;c\
-;\xfeK\xca\x1cH\x9d\xc0U\xc0\xcc\x8c\x83\xcfEg\
-\x91c3\xb6\xdf\xf3\xc4=\x17\xba\xf0\x04n,\xf1\xab\
-\xcd4\x00\x1fp`\xbf\xa9\x99\xda\xae\x96\x02\xf4\x05/\
-\xd2\x88\x8d\x1c\x9f\xc4u\x98\xf2\xbeR\xed\xd6\x85<\xaf\
-\x8d^ \xcd\x1a\xec\xc2\x12\xb81\xc9#\xc7\x93\xd4\x01\
-\xad\xb0\xd9\xdfeh\xaf_!\xd3\xd2G\x09\xec\xf0t\
-:d\xf5\xccj\xfb\x0d?\xcd\xbe\x15\xac\x11\xfe\xbc\xe9\
-\xad\xb0\xd5t\xe1\xb5\xad\x03^\xb2\xb6\x98\x8di\x5c\x10\
-J6b\xba\x9f\x14*\xde\x8b\xdaT\xed \xe0?\x03\
-\xec\xa9z\xf3\xd5T\xbcJ\xa0/\xf0;\xa1\xcf\xdd\x80\
-i\x22WJ\xe3\xb9\x0dBkz\x0f\x93\xd5T\xb5\x13\
-[\xf4\x07\x16{\xf6\xcds\xb4\xbe\xef\x96\x128\x00~\
-\x80\xc9\x5c\x92\x94\x05\x96\xa0\xe5\xcd \xcc4\xa15\xf4\
-.\xc16}\x05\xdf\x08\x9a\xeafQ\x81\xa93^$\
-\xec\x9b\x0fI0=R\x09\xfc\x97\xd8\xcd\x06\xebl\xdc\
-\xd6\xb6\xfe\xb7%NKju+\x819\x02\x81ZJ\
-\x07\x89W\x05\xd61\xa7\x85\xd72\xe5\x98\xb6\xb3\x0b\x1c\
-\xae\xa1\x01S\x12\xd8\x87\xc4\x0a\x13\x94\xc0\xcdk\x0d3\
-\x1a3,\xbc\xae\x85\x81\xb1\x05\x93<\xf1\xf7\xc0\xa1\xad\
-X\xc3!\xc8\xcc:n\xc9\xfeN\x22\x8bm\xab\xd5\xad\
-T\xbb\x1c\x01\x5co\xbf\x04Zj\x9f:\xfb%v\x9b\
-\xfd=\xd9\xc4t\xce\x9d\xfc\xdbb:\x0f\xde\x88\xe9\xb1\
-t?\xa6\x1b\xff\x5c{\xf8\xf4\x80\x0d\x88!\x98I\x0e\
-.\xef\x0cg\x08\x10\xa8\xde\x12\xa0\xa2\x89\xb7\x91Q\xb8\
-i\x03\xfbey\xd2\xa1}\xf6\x04z\xda/\xa5;0\
-w\xd5\xb3\xed\x17\xef3\xd67\x93\x80\x9b\xac\x0f\xdb\xe6\
-\x1a\xc7:\x92#\x0c\x06\x0a\xee\xfb\x16\xd9/\x9d#0\
-\x1d\x1d\xdbaZ\xc4\x0c\x15><\x1a\xa0~U\x02\xe7\
-\x82\x8e\xc0\xe7\x05\xba[\xad\xa3 \x89\x11J`Es\
-\xf1L\x81\x08<C\xfd\xa9\x04\xce\x0d\x03\x0aD\xe0\x8b\
-\xd4\x9fJ\xe0\xdc\xb0{A^\xa37S\xda<#\x85\
-\x128yL.\x00\x81'\xa8\x1f\x95\xc0\xb9\xa2\x0b&\
-_8UYK\x1a\x03\xd9\x94\xc0\x0a1\xdc\x940\x81\
-\xafW\xff)\x81sG\x0di\xf6\xba\xfe(\xe7\x04\x0a\
-%\xb0bG\xf4\x10\xca\x8e\x92\x92\xed\xc0y\xea7%\
-\xb0\xe2\x0b\xfc$!\x02\xdf\xa8\xfeR\x02+\xbeZ\x99\
-3-\x01\xf2>E\x98i\x89\x0a%p\x12)\x96\x8b\
-#&o-\xd0A\xfd\xa4\x04V\xec\x1a{\x11\xe7\x18\
-\xd5W\xed\xb5\x97\xfaH\x09\xach\x02\xd5\xc0\xbfED\
-\xde\xe9\x94\xd6\xb6G\xa1\x04\xcezO<\x16\xb7]D\
-J9m\xbe]\xf7\xbcJ`E\xe98\x1e\xf8m\xa0\
-\xfd\xee\xc9j\x7f%\xb0\xa2\xf5\xa8\x04\xae\x01\xd6{ \
-\xee:\xfbY\x95jw%\xb0\xc2-\xf6\xc6\xb4\xc4Y\
-\x22@\xdc\xdf\xdb\xd4H=\xa8R\x02+\x84Q\x01\x9c\
-\x0d<\x06\xacj\x05iW\x01\x8f\x02g\xea>W\x09\
-\xac\x08\x87\xae\xc0%\x98q\xab\xb30mZW`&\
-Tl\xb2\xff\xfd\x16f\x1a\xdf\xbd\xf6\xef\x1e\xaevS\
-\x02+\x14\x0a%\xb0B\xa1P\x02+\x14J`\x85B\
-\xa1\x04V(\x14J`\x85B\xa1\x04V(\x94\xc0\x0a\
-\x85B\x09\xacP(\x94\xc0\x0a\x85B\x8d\xa0P(\x81\
-\x15\x0a\x85\x12X\xa1P(\x81\x15\x0a%\xb0B\xa1P\
-\x02+\x14\x0a%\xb0B\xa1P\x02+\x14J`\x85B\
-\xa1\x04V(\x14\xad\xc5\xff\x03\x14$\xe0\xf9\xc3\x9a\xc6\
-\xf3\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x1aN\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:09:02+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:09:02+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:18375\
-85d-04f8-7e4f-a6\
-ab-c3496b7306b4\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:18375\
-85d-04f8-7e4f-a6\
-ab-c3496b7306b4\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:1837585d-04f8\
--7e4f-a6ab-c3496\
-b7306b4\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:183\
-7585d-04f8-7e4f-\
-a6ab-c3496b7306b\
-4\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\xa0\x0bX\x0a\x00\
-\x00\x15\x06IDATx\xda\xed\x9dy\x94P\xc5\x95\
-\xc6\x9b]\x03\x0a\xc8\xa2q\x89\xe3>\xee\x1a\xdc%n\
-\xc3$&\xe3Bp#\x1a\x8dq\xdfA\xdcr\x8c\xa3\
-\xb8\x10q\x99(\x10c\x8c\x82\x92\xa8\xa8qF\x195\
-\xe3\x98\xd11J\x8c\x1bQC\x04\x17d\xd3\xe3`\x94\
-\x06\x04\x1a\xb0\x85\xdf\xfc\xf1\x8ac\xdb`\xd3K\xddz\
-U\xf5\xbe\xef\x9c\xef\x1cO\xdb\xcdyu\xeb~\xefU\
-\xdd\xba\xf7V\x0dP#\x8ab\x9a\x94\x11DQ\x02\x16\
-EQ\x02\x16EQ\x02\x16E\x09X\x14E\x09X\x14\
-E\x09X\x14E\x09X\x14%`Q\x14%`Q\x14\
-%`Q\x94\x80EQ\x94\x80EQ\x94\x80EQ\x94\
-\x80EQ\x02\x16EQ\x02\x16EQ\x02\x16EQ\x02\
-\x16E\x09X\x0c\xcc^@?\xe0(`\x18p\x130\
-\x0e\x98\x08\xfc\x09x\x0b\x98\x09\xd4:.\xe6\x0b,n\
-\xf0\xf3\x19\xc04`\x92\xfb\xdbq\xee\xdf\x1a\x06\x0c\x02\
-\xbe\x09l {K\xc0b\xeb\xd8\x17\x18\xe0\x04u7\
-0\x19\xf8\x94\xf0X\x08\xbc\xea\x9ea\x98{\xa6\xbe\x9a\
-\x1f\x09X\xfc\x82\x1d\x80\x1d\x813\x80\xdf\xb8\xafc\xec\
-\xf8\x10x\x0c\xb8\x0c\xe8\x0ft\xd6<J\xc0U\xe2\xb6\
-\xc0\x10\xe0\xbf\x1a-sS\xc5\x22\xe0\x09\xe0<`k\
-\xcd\xaf\x04\x9c\xe3W\xf6`\xe0\x17\xc0t\xf2\xc7\xbb\xc0\
-h\xe0@\xa0\xbd\xe6_\x02N\x91\xed\xdd\xf2r\x94[\
-rV\x15\x1f\xbb\xad\xc1\x00\x89Y\x02N\x81\xdf\x00\x86\
-\x03s\x10\x1ac6p\x15\xb0\xa9\xfcD\x02\x8e\x89\x1d\
-\x81\xef\xbb}\xe0\x0a\xe9t\xad\xf8\x1cx\x1c\x18\xe8\xb6\
-\x17\xf2!\x09\xb8\x14vs\xd1\xe3\xb7\xa5\xc9Vc\xa6\
-\x8bf\xf7\x90?I\xc0\xa1\xb8\x09p\x030_\xfa\xf3\
-\x86\xf9\xc0H\xe0\xeb\xf2/\x09\xd8\x8a}\x9c\x93\xd5I\
-ofX\x0e\xdc!!K\xc0\xbeS\x18\x87SN6\
-TU\xb1\xc4E\xf07\x94\xffI\xc0\xade\x17\xe0R\
-\x8a\x94B\xa1\x1c,\x00.F\xd9^\x12p\x0by8\
-\xd5H\xbaH\x05\xef\x02\xc7\xc8/%\xe0\xb5q;\xe0\
-i\xe9%Z\xfc7\xb0\x8d\xfcT\x02^\xd3Y\xeee\
-\xc0Ri$z,u1\x09-\xab%`j\x80\xdd\
-(\xca\xe6\x84\xb4\xf0\x06\xb0\x97\x04\x5c\xdd\xc1w\x02\xae\
-\xa3\xc8\x0c\x12\xd2D=p\xb5[AI\xc0\x15\xe2\x16\
-\x14\x1d)\x84<\xf0RU\xf7\xc6U\x14\xef\xa9\x145\
-\xacB^\xf8\x148Y\x02\xce\x97\xeb\x02\xf7$\xee\xa4\
-u\xc0\x14\x8a\x8e\x18\xa3)Z\xdd\x9c\x00\x1c\x0a\xec\xe9\
-V\x16=\x1d\xbb6\x18{\xd7\x06?\xdf\xc2\xfd\xee\xa1\
-\xeeo\x87\x01c\xdc\xbf\xf97\xd2\xcf4\x1b\x0b\xac#\
-\x01\xe7\xb7d\xfeKb\x8e8\xcf\x89\xeaj\xe0h\xb7\
-D\x0cQS\xdb\x81\xa2k\xc81\xc05\x14\x95C\xb5\
-\x89\xd9\xeeU`s\x098\x0f~\x07\xf8$\x01\xa7\xfb\
-\x18\xb8\x1f8\x0d\xd8\x01h\x17\x91\x0d\xdb\xb9g:\x1d\
-\x98\x90\x90=\x07H\xc0i\xf3\xec\xc8\xa3\xcc\x7fu_\
-\xd8\xbdI\xab6\xb6\x03\xb0\x8f\xfbBO\x89<J}\
-\x86\x04\x9cfK\x9b\x9b\x22u\xaa\xa9\xc0\x95\xc0?f\
-d\xef\x1d(\x92+\xa6Ej\xf3\x91\x91\xadh$\xe0\
-\xb5\x04\xab\x1e\x8e\xcc\x81\x96\xb8\x00\xda~\x15\xd8\xb2\xf4\
-\x07\xc6G\x18\x0c{0\xc7\xe0Vn\xce\xb3\x1e\xf0\xc7\
-\x88\x9cf&0\x14\xe8^\xc1\xe3\xba\x1e.\xc2=+\
-\xa2\xf9x\x86\xa2\x93\x8a\x04\x1c!{\x02/F\xe2(\
-/\x03\xc7\xa2\x9eO\xab\xf2\xcc\x07\x13O\xba\xea\x0bd\
-\xd4\xc2'\xa7\xebH^\x8b$(uL\xae\xfb-\x0f\
-\x1c\x00\xbc\x12\xc1<\xfd\x85\xa2\xc3\x8a\x04\x1c\x01\xfb\x00\
-o\x96\xec\x10oRtY\x94p\x9bw$5(\x82\
-\x80\xd7\x14\xa0\xb7\x04\x5c.\xbb\x97\xbc4\xab\xa5(C\
-Ti[\xeb\x96\xd6g\xb8\xf3\xda\xb2\xf0:\x89\xdf\xc4\
-\x98z\xc0\xaa\xac=\xef\x0a\x8a\xabRt\x0dg\xdb\xd9\
-\x1b\xf8\x15\xb0\xb2\xc4=q7\x098\xfcQ\xd1\xb3%\
-.\x97\xf7\x93\xf0L\x8e\x9f\xcaZV?\x9d\xea\x11S\
-\xaaI\x1ae\x9c\xf3\xae\xaa=\xed\x22\xb1\x996\x12\xbc\
-\xce\xd9:4\x1eH1\x86\x91\xe2$\xdf\x5c\xd2y\xee\
-\xfe\x12X0\xeeE\xd1\xc8.4~&\x01\xdb\xe76\
-\x87\xc6]\xb9\x1d\xfe'\x14\xe3(\xa3\xfc\xf3t\x09\xd8\
-\xae\xaa(daB\x1dp\x92\x84T:O!l\xb3\
-\xc1z\xe0\x9f$`\xbf\xdc<\xf0q\xc3\x1c\x8a\xa2w\
-\x09(\x0e\xee\x0e\xcc\x088\xff\xf3(j\xc8%`O\
-\x11\xe7\x90\xc5\xf8\xcf\xeax(\xda\xe3\xa6\xe7\x03\xfa\xc1\
-\xcb)D\xa6S\x98\xb8q\x01'-\x87\x8a\x95.\xc0\
-V@?\xe0\x10\x8a\xf4\xc5\x01\x14\xf5\xbb;S\xe4\x8c\
-\xa7<\xb6{\x03\xfa\xc3o$\xe0\xb67\xa0\x0b\x85k\
-\x12<F\xe8CQ4q#\xf0?\xc0\x87\xcd\x1c\xeb\
-\x22\xb7\xaa\x19\x07\x9c\x07\xec\x9a\xd0\xd8\xdb\xb9hq(\
-\x9c$\x01\xb7\x8e[\x11\xe6F\xc0\x95\x14eo\xa9\x88\
-vK\xe0\x0a\x8a\xa2\x80\x15\x1e\xed\xf0\xa1\x13\xf4wH\
-\xa3\x8a\xea\x5c\xc2do-\x22\xe2\x96\xb51\xe7\xc9\xfe\
-9\x90x\xcfO\xc0Y;\x01\xc7S\xa4\xfd\x85\xc0\x87\
-\x14],6\x89\xdc.gx~\x895\xb5\x1f\xee$\
-\x017\x9f\xd7\x06\x98\x94\x15\xc0\x8f\x22w\xd0\xce\xee\x05\
-3\x87r\xb0\xdc\x9d\xc5n\x1d\xb1\x8dN\x0e$\xe2\xe1\
-\x12p\xf3\xb8g\x80\xf3\xde\x95\xc0\x99\x91\x8b\xf78\xe0\
-=\xe2\xc0r\xe0\x96\x88\xa3\xf3g\x07XN\xd7\xbb\xc0\
-\xa0\x04\xbc\x96\xa5s\x88#\xa3K\x22\x16\xee\xc6\xc0\xa3\
-\xc4\x89\x8f\x22\x0e\xea\x0c\x0d0\xfe7b[J\xc76\
-\x09?\x0d\x14m\x8eU\xbc'\x04\x0a\xdc\xb5\x15\x0f\x11\
-g\x9f\xaf\x91\x01\xc6~\x99\x04\xbcfn\x8b}\xca\xdc\
-\x84H\x8fK\xd6\x01~MZx\xc7\x9d+\xc7v\xc4\
-\xf4[\xe3q\xd7\xc5\x14\x13\x88\xc9\xf8O\x1b\x1b\xfeY\
-\xe2\xec\x9c\xb1\x01\xe9\xde\x94\xb8\x188,\xc2\x97\xa1u\
-\xc6\xd6\x93\x12\xf0\x97\xf9}c\x83\xcf\x884\x00\xb3\x19\
-E\xa3\xf7\x94QO|\xb7\x02\xf6\x06f\x1b\x8f\xfb0\
-\x09\xf8\x8b\xa3\x92w\x0c\x0d\xbd4\xc6\xe8\xa1\x0bV\xbd\
-K\x1eXIQ5\x14\x93}w\xc3\xb6\xb9\xfct\x22\
-h\xee\x10\x83\xa1\x7fb\xec\x5c?\x8eP\xbc1t\xd2\
-\xf4\x8d\xcf)\xd2:c\xb2\xf3\x89\xc6c\x1eVu\x01\
-\xf7\x06\x16\x1a\x1axl\x84\xe2\xed\x04\xfc/y\xe23\
-\xe0\x80\xc8\xec=\xdep\xbc\xf3\xcb\xde\x9a\x95m\x5c\xcb\
-\x0b\xc8\xa6Stu\x88M\xc0\xb7\x937\xfe\x0f\xd84\
-\x22{w3\xde\xa2\x8d\xa8\xaa\x807\xa2\xb8\xf4\xcb*\
-\xb0\xb2O\x84\xe2=\x8aj`\x12q\x15D\xec\xe9V\
-\x07V\x91\xf8\xbeU\x14\xf0\xad\x86\x0e\x14c\xdejg\
-\xc2v\x95(\x1b?\x89\xcc\xfe\xd7\x19\x8e\xf5\xe6\xaa\x09\
-x\x13\xec\x926\xde$\xce\xf3\xde\xc1T\x0b\xcb)\xee\
-\x0d\x8e\xe9|\xd8\xaa\xeft\x9d[QVF\xc07\x1a\
-\x19r\x05\xf1\xb6\x7f}\x90\xea\xe1\xa9\xc8\xe6`_\xec\
-*\x97FTE\xc0\xeb\xb9\xe8\x9d\x05n\x8bT\xbc5\
-\x15[>7\xc4\xc0\xc8\xe6\xe1\x0e\xa3q\xce\xa3\x84\xf6\
-\xc3e\x18\xf0B#\x03\xd6\x02\xbd\x22\x16p\xc8\x1b\xeb\
-WP\x94\x22\xfe\x11\xf8\x83\xe3_]\xc0%4\xde \
-\xae\xfc\xf3\x0d\x9c\xd8,pA\xee\x02\xee\x80]\x8d\xeb\
-\xb9\x11\x8b7\x84\x80\xe7\x01\xbf\x04\x0em\xe2K\xd0\x1e\
-\xd8\x09\xb8\x98\xb0\xf7)\x1f\x19\xd9\x5cX}DfR\
-\x94\xc4f+`\xab\x9c\xe77C\x1b.\xa2%\xf4\x5c\
-\xf7\xe6\xffZ+\x9e\xa9?\xf0L\xa0c\xa5\xd8\x92i\
-\xa6\xe5\xf0\xb2\x0am\xb8\xdfWd\x9f\x15*\x885\x1e\
-?mb\x8fw[\x10K\xec\x18\xd9|\x1cm4\xce\
-\xc7r\x15\xf0f\xd8\xb4\xcay\x954Z\xa2\xfa<F\
-\xaa\xc7\xff\x1d>[b\x9b\x9f}Kd\xf3\xd1\xceh\
-\x1b\xf1\xb9\xf3\xf5\xec\x04|\xb5\x91c|7\x01\xf1\xae\
-jJ>\xcb\x93x\x07\x19=c/\x8a[\xeb-\xf0\
-~\x84/\xda#\x8c\xc6zEn\x02n\x8fMg\xc5\
-\x97\x13\x11\xaf\xcfT\xca\xb3\x8d\x9f\xf1\xeb\xc0\x07F\x8e\
-\xbdG\x84_\xe1\xc9F\xc1\xacv9\x09\xf8@#\x87\
-861\x01\xd7\x00\xa3\xda0\xde1\x81\x9e\xb1\xbf\xd1\
-v\xe7\xaa\x08\xe7\xe3x#\xdf\xdc/'\x01\xdf\x96C\
-\xc8\xde\xe3j\xa45\x22\x1e\xe5\xfe6\xd4s\x8e6\x98\
-\xb3?D8\x1f\x1d=mm\x1a\xe3\xd6\x5c\x04\xdc\x81\
-\xa2\xc4\xcc7\x86&(\xde\xc6\xcb\xe9\xe6l+\xe6\xb8\
-\xdf-#\xe1\xc1w\x87\xccO\x89\xf3\xda\x96a\x06\xfe\
-\xf9A\x88\x17n\x08\xe3\x1cb`\x9c:\xd2\xbee\xaf\
-a\x85\xd2`\xe0\x01\x8a\xfa\xe5z\xc7\xe9\xeeg\x83)\
-\xb70\xe3\xe7\x06s\xb7]\x84\xf3\xd0\x03\x9b\xd2\xd6\x03\
-r\x10\xf0\x18\x03\xc3\xdc\x9d\x81xS\xe0\xce\x06sw\
-x\xa4c\xb5hG{k\x0e\x02\x9e\x9ej\x80@4\
-\xc9 \xbb(\xd2qZ\x04Z\xdfN]\xc0\xdb\x1a\x18\
-e\xaaD\x95tO\xa9\x9b#\x1dg;l\xba\x84n\
-\x95\xb2\x80\x87\x18\x18\xe4J\x89*(/\xf5<\x7fc\
-#\x1e\xab\xc5\xad\x98\xe7\xa4,\xe0'\x0d\x0c\xb2\xbdD\
-\x15\x94?\xf0<\x7f\xff\x1e\xf1Xw2\xf0\xd7\xc7R\
-\x15p'\x83\xc8\xde\x1b\x12Tp\x1e\xeey\x0e\x1f\x8d\
-|\xbc\xbe\xf3\xc1\x17Y\xe6+X\x1ab\x0f\x83\xb7\xd9\
-p\x09*8\x07y\x9e\xc3\x87#\x1f\xaf\xc52z\xf7\
-\x14\x05<\xd4\xc0\x10{KP\xc1y\xa6\xe79\x9c\x10\
-\xf9x\xf77\xf0\xdb\xf3R\x14\xf0C\x9e\x8d\xf0q\xa4\
-Y<\xb9\xf3f\xcf\xf38&\xf2\xf1v\xc0\x7f\xcb\x9d\
-\x09)\x0a\xd8wE\xcb}\x12S)\xf4}U\xe7O\
-\x13\x18\xb3\xef\xe6\x0bsR\x13\xf0F\x06\xcb\x90S%\
-\xa6RR\x0c\x97{\x9e\xc7\x93\x13\x18\xf7Y\x06\xfe\xdb\
-'%\x01\x7f[\xc7GY\xf0T\x83y\xdc+\x81q\
-[\xa4\x90\x1e\x92\x92\x80/\xf2<\xf8Z\xc2\x96\xd2\x89\
-6-gVRB\xef\xe4V\x8e\xdd\xf7>xHJ\
-\x02\xbe\xc7\xf3\xe0\x1f\x97\xa0\xb2h\xfa6-\xa1\xf1\xfb\
-n\xc0xWJ\x02\xf6\xdd\xa6\xe4j\x09*(\xd7\x07\
-f\x1b\x08\xf8\xf6\x84l\xe0\xfb<\xf8\xa5\x94\x04\xec\xbb\
-\x10\xfc(\x89*\xe8\xf2\xf1\x11lp\x5cBv8\xce\
-`\x1b\x98\x84\x80{\x19L\xfc6\x12V\xf2\xddC\x97\
-\x01\xdd\x13\xb2\xc3\xf6\x066\xe8\x91\x82\x80\xfby\x1e\xf4\
-\x12%p\x04\xe3p\xec011[t\xc4\xff\x15\xb8\
-\xbb\xa5 `\xdf\xc1\x8f)\x12V\x90=\xef\xfd\xd8b\
-p\x82vy\xcb\xb3\x0d\x06\xa6 `\xdfGH\x8fI\
-`\xa6\xfb\xdd\xa3\xb1\xe9\xd9\xdd\x10s\x89\xf3\xd2\xf5\xd0\
-\x91\xe8\x0bS\x10\xb0\xef\xcb\xbbGKh&\xa5\x9e?\
-$\xdc\x0d\x85\xd7&j\xa7_z\xb6\xc3\x0d)\x08x\
-\x9c\xe7A\x0f\x93\xe0\xbc.\x95\x87\x18\x1d\x11}\x15\x16\
-\x03}\x13\xb5\xd7%\xb1\x9f\x05[\x0cz\xa2\xe7A\x9f\
- \xe1y\x09\xc8\x5cNQ\x5c\x1e\x1a#\x12\xb6\xdb\x89\
-\x9em\xf1H\x0a\x02\x9e\xe4y\xd0\x87J\x80m\xe2.\
-\x1478\x96\x81\x8fI\xbb\x7f\xf7\xf7<\xdb\xe3\xf9\x14\
-\x04\xec;r\xb7\x87D\xd8\xa6%\xe0r\xcaC\xea\x15\
-d{{\xb6\xc7\xd4\x14\x04\xfc\xbe\xe7Ao!!\xb6\
-\x98\xad\xbd\x7f\xc9'\x9e#\x8d{\x9b\x9b\xe2V\x9em\
-2;\x05\x01\xff\xdd\xf3\xa0\xfbH\x90-\xde\xef\x8e+\
-Y\xbc\x1f\x01\x9bf`K\xdfu\xedsS\x10\xf0|\
-\xcf\x83\xee!Q\xb6\x88\xbf-Y\xbc\xf5\xc0\xc1\x99\xd8\
-\xb2\xa7g\xdb\xccOA\xc0u\x9e\x07\xbd\xaeD\xd9l\
-^@\xf9\xc8\xe9\xd8\xefk\x9em\xb3$\x05\x01\xfb\xbe\
-\x18Zy\xd0\xcd\xe3\xbe%\x07\xac\x00\xfe#\x83}o\
-\xe3\x06w>\xf1\xb9\x04,\xae\x89\xdd\xf0\xdfD\xb0\xa5\
-x\xda}\xb1j$\xe0\xb4\x05\xac%t\xfa\xc5\xe7\xad\
-9\xdf\xec\x96\xa1]+\xb9\x84V\x10+,7\xa1H\
-W,\x0b\x8fd\xf8\xe5\xadt\x10K\xc7HaY\xe6\
-\x91\xd1-\xe4\xddl\xb0\x92\xc7HJ\xe4\x08\xfb\x85X\
-V\x82p\x17\x92f}\xaf\x129\x9aA\xdf\xa9\x94{\
-J\xa8_\xc93K\x10\xef\xb3\x15z\xa9V2\x95R\
-\xc5\x0c\xe18)\xa0p?\x01N\xc9\xec\x98(t1\
-\xc3s)\x08X\xe5\x84a\xb8\x19E\xa3tk,\xa6\
-(\x09\xacb0\xb1\x92\xe5\x84\xbe\x83*\x17I\xack\
-\xe4 c\xe1\xce\xa5\xe8P\xd9\xb7\xc26\xaedA\xbf\
-\xef\x96:c$\xd6\xa0g\xbf\xaf\xb9/O\x17\xd9\xd8\
-{K\x9d\x91)\x08XM\xed\xc2\xf0q\x03\xf1\x8eA\
-\x99o\x96M\xed\x86\xa6 \xe0\xa3<\x0fZme\xd7\
-\xcc\x19\x06\xd1e] g{\xa2rd\x0a\x02\xfe\xa6\
-\xe7A\xd7\xe9\xab\xb0F\xce\xf5l\xe7\x7f\x96MW\xab\
-\xab\xf6}\xc6\xbek\x0a\x02\xde\xc0`i\xb7\x9d\x1cj\
-5\xd6z\xb4\xefJ\x94s\xde\x98;\x1a\xf8q\xf7\x14\
-\x04\x5c\x03,\xf0<\xf0\xa3\xe5P\xab\xd1g\xfe\xf3\xe7\
-\xb2\xe7j\x1c\xec\xd9\x87\xe7Y<\xa7\xd5\xe0}wA\
-\xbcF\x0eeZ\xf5U'{\xae\xc6\xeb<\xfbpR\
-\xd7\x8b\xde\xedy\xf0\xba\xe0\xdb6\x885C\xf64\x8f\
-@\xdf\x99\x92\x80/\xf4<\xf8ZEHW\xe3\x83\x1e\
-\xed\xfb\xa0\xec\xb9ZWO\xdf\xdb\xc0\xf3S\x12\xf0\x00\
-\x83\x00\xc0\x0er,\xb3=\xdaq\xb2\xe7\x97\xb8\x8b\x81\
-\xff\x1e\x94\x92\x80\xfb\x18\x18\xe0t9\xd6\x97\xd8\xd9\xd3\
-2z\x16\xca\xbaj\xccs\x0c\xfc\xb7wJ\x02\xb6\xa8\
-\x0b\x9e \xc72I\x9a9Jv\x5c\x8d\xbf\xf3\xec\xbb\
-\xb3\xac\x9e\xd5\xd2\x08\x0f\x18\x84\xe1\x95\xd0\xb1:\xdbr\
-\x03\xc3(\xd9o\x8d\x09\x1c\xf3=\xfb\xee})\x0a\xd8\
-\xa2G\xf1>r\xb05\x06\x5cF\xb5R\xbc\x0a\x0c\xae\
-\xceo\x19\xf8\xed9)\x0a\xb8\x9f\x81!t\x1e\xdc\xf4\
-rzN3l8G\xcb\xe6&9\xc2\xc0owK\
-Q\xc0\x1d\xf1\x7f\x1f\xad\x0a\x1b\xd6\x1e\xd8\x1a\xec\xb6/\
-\xd3)\xae9\xa9w\xff\xfd\x80\xfb\x7f\x9de\xa7&9\
-\xd5\xb3\xcf.\xb4\xdc\xfa\xa5v\x18\xae\xe3$\xd1\x92\xbb\
-\x1a\xf8\xebD\xcbg\xb66\x88\xc5>x\xb8\x1cML\
-h\xf9|v\xca\x02\xde\xc6\xc0 \xd3\xe4h\xa2\x01\xdb\
-\xb9\xad\x86ol\x91\xb2\x80k\x80w\x0d\x8c\xb2\xbf\x1c\
-N\xf4\xcc\x83S\xfc\xd8\x840\xcch\x03\xc3\x8c\x97\xc3\
-\x89\x9ey\xaf\x81\x9f\xde\x92\x83\x80\x0f40L\x1d\xc5\
-\xad\x04r<\xd1\x07{\xe0\xffR\xbe +\xc5P\x89\
-\x06\x1f\x1a\x18\xe7B9\x9e\xe8\x89\x17\x19\xf8\xe7\xfb!\
-\x12eB\x19h\xb4\x91\x81:\xc9\xf9\xc46\xb2\x13\xc5\
-\x9dE\xbe\xf1o!\x9e?\x94\x91\xfac\x83\xc1r@\
-\xb1\x8d\xfc\xa1\x91o\xee\x95\x93\x80\xdb\x1b\xbd\xe5^\x91\
-\x03\x8am<:z\xcd\xc0/\xdf#\xd0\x1dR!\x8d\
-u\x95\xd1\x9b\xee_\xe4\x88b+9\xd0\xc8'/\x0f\
-5\x86\x90\xc6\xda\x94\xa2\xfb\xa1oL\xa6Z7\xe6\x89\
-\xfe\xbe\xbe\xaf\x1b\xf8c=\xb0q\x8e\x02\xae\x01\x9e0\
-z\xe3\x0d\x92C\x8a-\xe4qF\xbe81\xe48B\
-\x1b\xedH#\xa3MSDZl\x01;\x03\xef\x18\xf9\
-\xe2\xe19\x0b\xb8\x036\xf9\xa6\x00C\xe4\x98b3y\
-\x89\x91\x0f\xce p\xd7\x982\x8cw\x81\x91\xf1j1\
-j\x1c\x96\xd8\x97E\xf5\xc0M\xb3/\xfe[\xc6\xae\xc2\
-\xb9\xa1\xc7S\x86\x01\xbb\xe1\xf7^\x9f\x86\xf8U\x85\x1d\
-S\x1d9\x9a\xc7\xb1F\xbe\xf7\x09\xd0\xb5\x0a\x02\xae\x01\
-\xae72\xe2\x0a\x974\xa2\x9eXkG\x15{b\x1d\
-Hq\x91\x9b\x05Ji\xf7T\x96!7\x06\x96\x1a\x06\
-\xb4\xaa\xd4\xe7X])\x9b\xc7u\x0d\x03WK\x80\x0d\
-\xab$\xe0\x1a\xe0\xe7\xd8\xe1\xda\x0a-\x9b\xdb\x8a\xaa,\
-\xa7\xaf7\xf4\xb7\x1b\xcb\x1aW\x99\x06\xed\x83\xff\xa6w\
-\x0d\x0f\xd3\xf7\xad@\xc0J734\x8f\xfb\x1b%\x11\
-\xe1|\xb8o\x15\x05\x5c\x03\xdc`\xf8V|\x0fX?\
-c\xa7\xd4\xddH\xcdcw`\xa6\xa1\x9f]W\xe6\xf8\
-\xca6n/\xc3\x90>\xc0=\x19;\xa6n'l\x1e\
-\xef3\xf4\xaf\xf9\x94\xdcX\x22\x06\x03_\x8c-N\xcd\
-\xd41u?\xf0\xday\x96\xb1o\x95\x9e<\x14\xcb^\
-\xeemC#/\x05\xf6\xcc\xd09\x97z\xb6Qn\xf6\
-\xd9\x1bXf\xe8WQ\xa4\xef\xc6b\xec#\x8c\xdf\x94\
-\xb3\xc8/K\xcb\xa7s.\xcb\xcc6}\xf1\x7f;f\
-c|7\x86\xb1\xc6d\xf4\xa7\x8c\x0d\xfe\x5cf\xd1V\
-\x9f\x0d\x12fgv\xde\xfb\x82\xb1/=\x1e\xcbxc\
-2\xfc6\xd8t\x06l\x1c\xac\xc9\xa5v\xf8Q\x8fv\
-y4\x13\x9b\xb43\x0eZ\xadJ\xda\xd8J\x02^3\
-/\xc3\x1e#2q\xd6\x1f{\xb4\xc9\xc9\x99\xd8\xe4\xa6\
-\x00\xfesQLc\x8em\x02:Rt\xd8\xb0\xc6\xa5\
-\x198kW`\xae\x07[\xcc\xa5\x84$|\x03^\x18\
-\xc0o^'\xb2\xba\xf3\x18'\xa2\x1fE&\x95%V\
-\xba#\x86\xd4\x9d\xf64\x0f\xb68-\x03;\x9c\x17@\
-\xbc\xf5\xc0\xee\xb1\x8d=\xd6\x09\x19\x1e`BVd\xb2\
-t\x9c\xd0\x06\x1bL\xc8`\xfc\xa7bWa\xd4\x10W\
-\xc68\xfeX'\xa5c\x80H\xe2\xaa/\xf1\x90\xc4\x1d\
-\xb83\xf0P+\xc6\xfe\x10\xe9\x17\xf7\x9f\xe5^\xc4\xd6\
-\x98D\xe0N\x1b\xa9\x0b\xb8\x06\xd8\x92\xe2v\xf3\x10\xf8\
-\xd7\x0c\xa2\xaf\xe77\xd3^\x0b\xdd\xef\xa6\x1e\x8d\xbf,\
-\x90o,\x00\xfe!V;\xc4>I?\x22\x1c\xae\xcf\
-\xc0\xa9{\x02\xc3\xdc\x99w\xc3#\xb9:\xf7\xb3a\xa4\
-\x7f)\x5c\xfb@\xd1\xe6U8>f{\xa40aw\
-\x06\x9c\xac\x87]\x22@.I\x0d=\xc9\xeb\x16\xc7.\
-\xc0\xfd\x01\xfd\xe1\xf6\xd8m\x92\xc2\xa4\xadCq\x85J\
-(<\x8f\x9a\xe3\xc5\x9a\x1e\xf9B@?x\x91\x042\
-\xf7R\x99\xbc\xcd\x80\xbf\x07\x9c\xbc\xf7)\x92\xe1%\x9c\
-x\x8e\x16g\x06\x9c\xff\x8f(n\x12\xa9\x91\x80\xfdq\
-@\x80\xf3\xe1\x86XJ\xbe\xa5\x88)\xf1Ll\xab\x8a\
-\x1a\xe33\xe0\xa0T\xec\x93\xdad\x9eAx\x8c'\xef\
-\xce\x1e1w\xd2\xb8\xaf\x84\xf9>%%;\xa58\xb1\
-#K\x98\xd4YT\xaf]m\xd9\xb5\xbc\xd3K\x98\xe7\
-kR\xb3U\xaag\x9e\x0f\x940\xb9\xf5\x14\xdd.\xbb\
-H`\xa6\x01\xcb\x9fa\xd7\x80\xae)\xdc\x9b\xe21b\
-\xca\x13\xfd\x0c\xe5`\x1a\xf0-\x89\xcd;\x0f\xc2\xb63\
-KSx*\xd5\x17s\xca\x13\xde-\xf0\xb1BC\xac\
-\x04~M\xd1\x1aW\xe2k\xfb\xf1\xd0X\xc2\xe43\xaf\
-\x09\x93H\xb8\x1a+\x87@\xc7+\x94\x87\xf9\x14)}\
-ZV\xb7\x9c\x9d(\xf2\xd0\x17\x948\x7f\xaf\xa7\x9e\xe8\
-\x92\x83#\xf4\x06\xa6P.\xde\x02\x8e!\x9fn\x1f\xd6\
-\xa9\x90\xc7bw\xcdIs1%\x87\x84\x9d\x9cR\x06\
-_\xa2|L\x91\x90\xd7z\x96?9\x82y\x9aL&\
-\xd9v99G\x0f\xe0O\xc4\x81\xc9\xc0\x0f(\xca\x22\
-\xb5T\x86\x13\x80\xd7\x22\x99\x9b\xe7\xdd\xd6\xabF\x02\x8e\
-3\xb0\xf54\xf1`6yT\x00\xb5vUt1\xcd\
-\xbb\xb38d\xb4\xb9kNv\xce\xd1q\xba\xb83\xbd\
-\x98\xb0\x8c\xa2\x80~@\x05\x96\xd7\xfd\x80;(\xba7\
-\xc6\x84\x87\xdc\xf1c\x8d\x04\x9cF\xb2\xc7\xf5\xc4\x89w\
-\x5cB\xc8N\x19\xd9{\x17\x8aK\xbe\xa6Gj\xf3k\
-s}q\xe6\xbe\x8c;\x9d\xb0\x05\x10-\xc5\x9b\xce\xf1\
-\xf7'\xd2\x96-|u\xcb\xa3\xfe\x14-z\xa7El\
-\xdf\xcf(\xda\xeff\xeb\xe3U\xd8\x8b\x1dB\xd8R\xc4\
-\xd6\xa2\x96\xa2\xf1\xfcY\xee\xeb\xdc>\xb2\xa3\x9f\x9d\x81\
-\xb3\x81\xdf\xb9\xf3\xef\xd8\xf1\x11\x09U\x15I\xc0M\xf3\
-\x1b\xc0\xcb\xa4\x85\xf9\xc0\x13\xee\x0b},\xb0}\xa0\xa8\
-vG`\x07\x8a;\x83G\x00\xbf/9\xd9\xa25x\
-\x91D\xeay%\xe0\x96\xe5O\xdfI\xdaX\x06Lu\
-\xa2\xba\xcdEyO\x04\xbeGQ\xc1\xb35Ezg\
-O`\xbd\x06c_\xcf\xfd\xac\x8f\xfb\x9d\xbd\xdd\xdf\x9c\
-\xe8\xfe\x8d\xdb\xdc\xbf9\x8d\xb0\xb5\xb7\x16\xb8\x9d\x0ae\
-\xc6U\xf1\x5c\xf2$\xc2u\xbb\x14\xc2a\x01\x917\xa0\
-\x93\x80\xfdqs\x8a.\x8dB\x1e\xf83\x11]8&\
-\x01\x87\x8b\xa4\x0e\x8f<J-4\x8dz\x8a\x9e\xde\x1d\
-\xaa\xea\xc7\xca\xcf\x85]\x13\x0cp\x09E%\xd1\x1eU\
-\xf7_\x09\xf8\x8b\xaf\xf1\x10`\xb1t\x11=\xea(J\
-8;\xc8o%\xe0\xc6\xdc\x1axR\x1a\x89\x16OP\
-\x5c\xb9#_\x95\x80\xd7Z\xf6\xf67\xe9%\x1a\xbc\x0d\
-\x1c&\xbf\x94\x80[\xc2\xce\x14\xb7\xb1/\x90~JC\
--0\x94\xc8.\xd5\x96\x80\xd3\xe2\x06.Z\xad\xb3\xe3\
-pXL\xd1>\xb8\xa7\xfcO\x02\xf6\xd9\xbag$\xf1\
-\x95\xc9\xe5\x84%\xc0(`#\xf9\x9b\x04l\xc5\x8d(\
-r\x84\xe7Io\xde\xf0\x09E\xce\xf7\x86\xf2/\x098\
-\x14\xbbR\x5c\xf5\xf2\x96\xf4\xd7j\xccp\xc7w]\xe5\
-O\x12pY\xec\x00\x1c\x01<F97\x0a\xa4\x86z\
-`\x22p\xb8\xcer%\xe0\xd8\xb8\x09p\x85\xfb\xb2\x08\
-_\xc6t\xe0r`c\xf9\x89\x04\x9c\x02wt\xd1\xeb\
-*\x8b\xf9\x03\x17\x94\xea\x8fZ\xedJ\xc0\x89\xb2=p\
-\x00p+\xe5\xdd\xfd\x13\x12o\x01\xb78\xd1\xb6\xd7\xfc\
-K\xc0\xb9qK\xe0\x1c\xb7g\xfe4\x03\xc1.\x04\xfe\
-\x93\xa2\xdd\xce\x16\x9a_\x09\xb8j\x01\xb0\xdd\x80\xf3\x80\
-\xfb\x89\xab\x87\xf2Wa\x0e\xc5\xc5\xdb\xe7RTr)\
-\x10%\x01\x8b\x8d\x12F\x0eq\xc7+wQ\x94:\xd6\
-\x96 \xd4y\x14\xd7\xd5\xdc\x09\x5c\xe0\x9e\xa9\x97\xe6G\
-\x02\x16[\xc7\xee\xeek=\x90\x22?\xf8\x06\x8ak9\
-\x1f\xa5\xb8.d*\xf0\x9eK\x8a\xa8\x05\x165\x10\xe3\
-\x22\xf7\xb3O\xdc\xefLu\x7f\xf3\x88{I\x5c\xef^\
-\x18\x03\xddWu}\xd9[\x02\x16EQ\x02\x16EQ\
-\x02\x16E\x09X\x14E\x09X\x14E\x09X\x14%`\
-\x19A\x14%`Q\x14%`Q\x14%`Q\x94\x80\
-EQ\x94\x80EQ\x94\x80EQ\x94\x80EQ\x02\x16\
-EQ\x02\x16EQ\x02\x16E\x09X\x14E\x09X\x14\
-E\x09X\x14\xc5\xe6\xf0\xff\x01\xf4\xa2\xf1\xac\x1cS\x95\
-\xf1\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x0e\xe0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:09:01+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:09:01+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:2994e\
-395-4f5a-234b-83\
-cd-eded80a1a320\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:2994e\
-395-4f5a-234b-83\
-cd-eded80a1a320\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:2994e395-4f5a\
--234b-83cd-eded8\
-0a1a320\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:299\
-4e395-4f5a-234b-\
-83cd-eded80a1a32\
-0\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>9\xc2\x10\xef\x00\
-\x00\x09\x98IDATx\xda\xed\xdd}\xac\x96e\x1d\
-\xc0q:\x0a\x98(\xb4E\x04\xa2\x82\xb4\xfa\xa3U\xab\
-?Z\xf1\x07\xa8\xf9\xdaj5D\xca\xd6\xd2\xcd\xd6\x0b\
-\xb4\x11\xac\xb9\x09\xa93G\xab\xf52c\xe5\x9c\x96\x18\
-\xe0\x8eh/\x9b8WV\x88(\x15+\xa3\xa5\x7f\xb8\
-&/Ei[\x8e\xa3\x99\x8e\x17\xc5\xbb\xeb\xf6y\xd8\
-\x9c\xcb\xc19\xe7\xba\xae\xe7\xbe\xee\xfb\xf3\xdb>\x7f\xf3\
-\x9cs~_\xee\xe7<\xd7y\xeegBUU\x13\x80\
-2\xf9&\x80\x80\x01\x01\x03\x02\x06\x01\x03\x02\x06\x04\x0c\
-\x08\x18\x04\x0c\x08\x18\x100\x08\x18\x100 `@\xc0\
- `@\xc0\x80\x80\x01\x01\x83\x80\x01\x01\x03\x02\x06\x01\
-\x03\x02\x06\x04\x0c\x08\x18\x04\x0c\x08\x18\x100P\x5c\xc0\
-S\x82\x8b\x82\xd5\xc1\xfa`G\xb07\x18\x09\x0eW\xcd\
-\x9f\x17\x83]\xc1\xa6\xe0\xb2`\x92\x05\xa4\xed\x01\xbf5\
-X\x11<\x14\x1c\xaa\xda5\xfb\x82\xc5\x96\x906\x06|\
-Npo\xff\xaa\xd5\xf6\xf9N0d\x19iC\xc0\xe7\
-\x05\xbf\xad\xba7\xebEL\xc9\x01\xcf\x0a6T\xdd\x9e\
-;\x83\x13-%\xa5\x05\x5c\xbf\xa0\xf3le\x5c\x89)\
-*\xe0\x93\x82[4+b\xca\x0b\xf8\x94\xe0WZ\xf5\
-t\x9a\xf2\x02\xae\x8f\x86vj\xd4\x95\x98\xf2\x02\x9e*\
-^Wb\xca\x0c\xb8\xfe\x9dw\x9b&]\x89)3`\
-/X\xb9\x12Sh\xc0K4(b\xca\x0c\xf84\xe7\
-\xbc\x9eNSn\xc0\x9bt\xe7JL\x99\x01\x9f\xa77\
-Wb\xca\x0d\xf8a\xad\xb9\x12Sf\xc0gk\xcc\x95\
-\x98r\x03\xbeW_\x22\xa6\xcc\x80gT\xddx3\xbe\
-\xa7\xd3\xb42\xe0\x95\x89\x17\xf6`\xd5{\xff\xf0\xa2`\
-N0\xb1a\xdf\xd8\xa1\xfe\x95\xd1\x95\x98\x22\x03~(\
-\xe1\xa2\x0e\xf7\xcf\x96\x9b\xfe\xcd\x151E\x06\x5c\xdf=\
-2\xc5\x0d\xe8^\x0a\xbeX\xd87X\xc4\x14\x17\xf0E\
-\x89\x16si\xa1\xdfd\x11ST\xc0\xab\x13=m.\
-\xf9\x1b-b\x8a\x098\xf6\xa2\x1e(\xe4w^\x11\xd3\
-\x8a\x80wD^\xc2\x0d-\xfa\x86\x8b\x98\xc6\x07\xfc\xb7\
-\xc8\x0b\xb8\xa8e\xdft\x11\xd3\xe8\x80\xf7G^\xbe3\
-[\xf8\x8d\xafc\xfa\xb1?\xf6\xa0\x89\x01\xc7>B\x9a\
-\xd8\xd2o\xbe\x88id\xc0\xb1\xa7\xcd?\x80A<\x9d\
-6\xbd\xa9/4\xf5'[\xee\xee\xbfnS\xffg\xba\
-*\xb8\xb0\xff\xb7\x0c\x02\x16\xb0\x88\x0b\x8e\xbb\xfek\xc2\
-\x15U\xef6\xc8\x02\x16\xb0\x88\x0b\x9d\xfaM9\x9b\x83\
-\x85\x02\x16\xb0\x88\xcb\x9e\xfa\x06\x15\xe7\x0aX\xc0Mz\
-a\xcb\x8c~\xea\xf7\xba\x9f!`\x01\xbb\x12\x97;\xf5\
-\x9dV\x97\x08X\xc0\x22.{n\x0a&\x0bX\xc0\x9e\
-N\x97;[\x83i\x02\x16\xb0+q\xb9S\x7fh\xdf\
-\x0c\x01\x0bX\xc4eG<U\xc0\x02\x16q\xb9\xb3%\
-\xe7\xef\xc4\x02\xf6;\xb1I\xf3\xc2\x96\x80\x05,\xe2\x82\
-\xe7S\x02\x16\xb0\xa7\xd3\xe5\xce3\xc1L\x01\x0b\xd6\x95\
-\xb8\xdc\xd9(`\xb1\xba\x12\x97;/W\xbd\xcf\x08\x13\
-0\xae\xc4\x85\xce6\x01s\xac\x88\xd7\xea\xa4\xd1\xb3@\
-\xc0\x1c\xcb\xe2`\x9fV\x1a9\x9b\x05\xcc\xf1\x98\x14\x5c\
-\x16l\x0avU>!\xb2)S\xff\x1cf\x08\x18\xe2\
-\xa9o\xee7'\xb8\xa4\xffj\xf1\xc1\xc4\x11/\x170\
-\xa43\xbb\xff\xcc%\xd5l\x150\xa4\xb7\xac\xea}\x12\
-f\xec\xa9\xaf\xf0o\x140\xa4\xf7\xa5DW\xe1\x0b\x04\
-\x0cy\xdc\x95`\x97\xaf\x160\xe4qz\x82\x17\xb6n\
-\x170\xe4sG\xe4]\xfe\x9d\x80!\x9fK#\xef\xf2\
-\x1e\x01C>gE\xde\xe5\xa7\x05\x0cy\xff\xb2-\xf6\
-Q\x92\x80!\xa3F\xef\xb3\x80A\xc0\x02F\xc0\x02\x16\
-0\x02\x160\x08X\xc0 `\x01#`\x01\x83\x80\x05\
-\x0c\x02\x160\x02\x16pk\x02\xae\xef\xad\xf4\x81`e\
-\xf0\xf3\xe0\xd1\xe0\xc9\xe0@e\x8c\x80\x1b\x1b\xee\xdc`\
-M?Vc\x04\x5cH\xc0\xd3\x83[\x82#v\xd1\x8c\
-a&\x0bxp>\x1b\xec\xb7\x83f\x1c\xf3D\xf0a\
-\x01\xe7U\xff\xaf\xf9#\xbbg\x22\xce\xb7\x827\x088\
-\xbdS\x83\xed\xf6\xcd$\x98\x9b\xab\xdeg[\x098\x91\
-\x89\xc1/\xed\x99I8\xc3\xfd=\x13p\x02w\xda/\
-\x93\xe9\xe9\xb4\x80#\xbb\xd2^\x99LS\x9fh,\x10\
-p<\xa7\x05#\xf6\xcad\x9c\xdd\xc1)\x02\x8ec\xa3\
-}2\x03\x98\xef\x0ax\xfc\xe6T>W\xd7\x0cf\x9e\
-\x0f\xa6\x09x|\xd6\xda#3\xc0Y*\xe0\xb1\x9b\x12\
-<g\x87\xcc\x00g\xa7\x80\xc7\xee3\xf6\xc74`\xde\
-+\xe0\xb1\xf9\x8d\xdd1\x0d\x98/\x08xl/^y\
-\x87\x91i\xc2\xac\x15\xf0\xe8]koLC\xe6\xd7\x02\
-\x1e\x9d\xfa]!\xbb\xec\x8di\xc8\xfcS\xc0\xa3\xb3\xc0\
-\xce\x98\x06\xcd\x88\x80G\xe7\xb6\x04\x8f\xfb\x81\xaa\x19\xef\
-e&\xbd\xd9\x91wg\xaf\x80\x07\x7f\xf6{\x85\xc5\xee\
-\x8c\x8fD\xde\x9dG\x05|\xfc.O\xf0\x98\xff[\x8d\
-\xe1\x0f\xd3)V\xec\x17@\x1f\x16\xf0\xf1\xdb\x92\xe01\
-\xaf\xb3\xd4\x9d\xf2\xd3\xc8\xfb\xf33\x01\x0f\xf6\xecw\xa1\
-\xa5\xee\x94=\x91\xf7\xe7Z\x01\x1f\x9f\xeb\x12<\xde=\
-U\x84\x9b\x95Q\x8c7\x05/G\xde\xa1\x8f\x0axp\
-g\xbf\xd7Y\xeaN9'\xc1\x0e\xcd\x16\xf0\xb1-L\
-\xf0X\xeb\xff\x89\xe7Y\xeaNY\x19y\x87\xfe=\x9a\
-\x7f\xbf\xcb\x01\xa78\xfb\xddb\xa1;gC\xe4\x1d\xba\
-_\xc0\x83;\xfb\xbd\xdcBw\xcec\x91w\xe8\x9b\x02\
-v\xf6K\x1e'\x05\x87#\xef\xd1'\x05<\x98\xb3\xdf\
-\xdb,t\xe7\xbc?\xc1\x1e\xbdC\xc0\xce~\xc9\xe3\xf3\
-\x09\x9e\xc5\x0d\x09\xd8\xd9/y\xdc\x1cy\x8f\xb6\x8f\xf6\
-1t-`g\xbf\xc4\xb4#\xf2\x1e}_\xc0\xce~\
-\xc9\xe3\x84\xe0\x85\xc8\xbbt\xa5\x80\x9d\xfd\x92\xc7;\x13\
-\xec\xd2\xfb\x04\xec\xec\x97<>\x1dy\x8f\x0eU\xbd\x0f\
-\x92\x17\xb0\xb3_2\xf8v\xe4]\xfa\xf3X\x1eG\x97\
-\x02v\xf6K\x93\xef!\xbeN\xc0\xce~\xc9\xe7\xe9\xc8\
-\xbb\xb4\x5c\xc0\xce~\xc9\xe3\xcc\x04\xfb\xe4\x03\xbe\x9d\xfd\
-\x92\xc9\xc7\x13\x1cEN\x13\xb0\xb3_\xf2\xb8>\xf2>\
-=1\xd6\xc7\xd2\x85\x80\x9d\xfd\x12\xdb=\x91\xf7\xe9n\
-\x01;\xfb%\x9f}\x91\xf7i\x95\x80\x9d\xfd\x92\xc7\x9b\
-\x13\xec\xd4\xc5\x02v\xf6K\x1e\xe7'\xd8\xa9\x99\x02v\
-\xf6K\x1eWE\xde\xa7\xa7\xc6\xf3x\xda\x1c\xb0\xb3_\
-R\x18\x8e\xbcS\xf7\x09\xd8\xd9/\xf9<\x1ey\xa7\xd6\
-\x08\xd8\xd9/y\x9c\x1c\xbc\x14y\xaf\x16\x0b\xd8\xd9/\
-y\xccO\xb0W\xf3\x04\xec\xec\x97<\x96E\xde\xa9\xff\
-\x8c\xf75\x956\x06\xec\xec\x97Tn\x8d\xbcW\x0f\x8e\
-\xf71\xb51`g\xbf\xa4\xf2\xc7\xc8{u\xa3\x80\x9d\
-\xfd\x92\xc7\x89\xc1\x81\xc8{u\x85\x80\x9d\xfd\x92\xc7\xbb\
-\x13\xec\xd6{\x04\xec\xec\x97<b\xbf\xb6r0\x98(\
-`g\xbf\xe4qc\xe4\xddz$\xc6\xe3jS\xc0\xce\
-~I\xe9\xc1\xc8\xbb\xf5C\x01;\xfb%\x8f\xfa\xd7\xb3\
-\x91\xc8\xbb\xb5L\xc0\xce~\xc9c^\x82\xfd\x9a/`\
-g\xbf\xe4\xb18\xf2n\x1d\x89uqhC\xc0\xce~\
-ImM\xe4\xddz<\xd6ckC\xc0\xce~I\xed\
-\xbe\xc8\xfb5,`g\xbf\xe4\xf3T\xe4\xfd\xbaJ\xc0\
-\xce~\xc9cF\x82\x1d;_\xc0\xce~\xc9\xe3\xe2\x04\
-;6]\xc0\xce~\xc9cU\xe4\xfd\xda\x17\xf3\xf1\xa5\
-\xf8\x82\x0fE\xfe\x82'9\xfbe\x80\xee\x8a\xbcc\xf7\
-4=\xe0\xfd\x91\xbf\xe09\x19\xcf~\xd7YX^\xe3\
-\xaf\x91w\xec\x86\xa6\x07\xfc\xf7\xc8_\xf0%\xff\xe7\xdf\
-\x98\xeb\xec\x97\x0c\xde\xd2\x7fQ3\xe6,jz\xc0;\
-\x22\x7f\xc1\x1b3\x9d\xfd\xeer\xf6\xcbk|.\xc1\x9e\
-\xcdmz\xc0\xeb#\x7f\xc1\xf5\xfb&g;\xfb%\xb3\
-\xa1\xe0\xb1\xc8;6\x12\xfb\x22\x91\xe2\x0b_\x9d \xae\
-M\x89\xcf~\x8f\xc4\xfe\x9f\x91\xe2}\xb9\x84#\xca\x14\
-_\xf8\x85U\x9aY\x96\xf0\xec\xf7\x01\x0b\xcb\xab|\xb0\
-\xff\xcc/\xf6\xdcPB\xc0''8J\xaa\xa7\xbe#\
-\xfeW\x9c\xfd\x92X\xfd\x0c\xef\xd9D\x17\xa1\x0bJ\x08\
-\xb8\xb6\xad*g\x9e\xeb\xffQ\x88\xe5\xed\xb6\xa9\xc17\
-\xaa\xf8\x1f\x9drt^\xe8_\xdc\x8a\x08xEA\x01\
-;\xfb\xed\xee]6f\xf5\x7f\xe5\xfb^\xf0L\xe2=\
-\xfbI\x8a\xaf#\xe5\x1f\x80\xbfX\x19c\x8e\xce'J\
-\x0a\xb8\xb6\xd9\xcf\xcc\x98W\xe6_\xd5\xeb\xffIpc\
-\x03>\xdb\xcf\xcd\x98W&\xd9\xdf\x18\xa4\xfe=c\xbb\
-\x9f\x9d\xe9\xf8\xd4\xafhO/5\xe0s\xfd\xfcL\xc7\
-\xe7\xab)\x1b\xcb\xf1j\xdf\xb0\x9f\xa1\xe9\xe8\xd4\xf7V\
-\x9bRz\xc0\xb3\xaat\x07\xe3\xc64u\xeaS\x98\xf9\
-\xa9\xfb\xcau\xe6\xb6\xc4\xcf\xd3tl\xae\xc9\xd1V\xce\
-\x83\xf3\x9b\xfcLMG\xa6\xfe\x1c\xa5\x13\xda\x16\xf0\xe4\
-\xaa\xf7\xa6\x01c\xda<O\x06\xa7\xe7\xea*\xf7\x9f\xaf\
-\x9d\x1a\xfc\xc9\xcf\xd8\xb4t\xea\x1b\xd6\xbd=gS\x83\
-\xba\xcf\xeeN?k\xd3\xb2\xa9o%\xf5\xb6\xdc=\x0d\
-\xf2\x9d\x1f[\xfc\xccMKfo5\xa0\x1bB\x0c\xf2\
-\xdd \xf5\xef\xc4?\xf0\xb37\x85\xcf/\xaa\xdeQ\xe9\
-\x84\xae\x05|\xd4\xa5U\xfa\xb7r\x19\x13{\x9e\x0f\x96\
-V\x03\xbe\x11bS\xde\x9b93\xb8\xa3\x8a\x7f\x0bO\
-cR\xcc\xefs\xbfX\xd5\xf4\x80_\xfd\x0e\xa6m\xf6\
-\xc34t\xfe\xd0\x7f\xc68\xd4\x94f\x9a|_\xa2\xfa\
-\xfd\xc4\x87\xed\x8ci\xc0\xdc\x1f|\xa8\x89\xad\x94\xf0\xd1\
-\x8e\xcb\x83\xadU\x9a\xbb\x04\x1a\xf3z\xf3\x97\xe0k\xc1\
-\xbb\x9a\xdcHI\xf70\xaao\x08V\xdf\xd5\xef\xea\xe0\
-\xf6\xfe\xef!\xbb\xab\xdeg1\xb9}\x8f\x19\xed\xd4\xaf\
-\xb7\xd47Z\xffG\xf0Hpw\xf0\xf5\xe0c\xfd\x0b\
-G\x11]\xb8\xb9\x19\x14\xcc7\x01\x04\x0c\x08\x18\x100\
-\x08\x18\x100 `@\xc0 `@\xc0\x80\x80A\xc0\
-\x80\x80\x01\x01\x03\x02\x06\x01\x03\x02\x06\x04\x0c\x08\x18\x04\
-\x0c\x08\x18\x100\x08\x18\x100 `@\xc0 `@\
-\xc0\x80\x80\x01\x01\x83\x80\x01\x01\x03\x02\x06\x01\x03\x02\x06\
-\x04\x0c\x08\x18\x04\x0c\x08\x18\x88\xe2\x7f\x0d\xb2a\x17\xc2\
-\xe6\xda#\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x19\xc5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-19T09:45\
-:01+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-19T09:46:03+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-19T09:46:03+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:018a9\
-971-7d7b-5745-ac\
-fd-9055ea8dc195\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:018a9\
-971-7d7b-5745-ac\
-fd-9055ea8dc195\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:018a9971-7d7b\
--5745-acfd-9055e\
-a8dc195\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:018\
-a9971-7d7b-5745-\
-acfd-9055ea8dc19\
-5\x22 stEvt:when=\x222\
-023-07-19T09:45:\
-01+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\xa9\xdaVg\x00\
-\x00\x14}IDATx\xda\xed\x9d\x7f\x90\x96\xd5u\
-\xc7\xddE\x16T4\xa0\xe2o\xa3H\x9c`\x9c\x96\xa6\
-db\xfc\x15\x04\x8d5\xa6\x9a\x18H\xa1\x09F\x14*\
-Zk\xd31L\x93\x89\xe9\xb4N\xaa&\xa9I\xbaZ\
-\x93\x984\x8e\x10-\xee\xfa\x8b\x18u\x14ch\x0d\x91\
-h\x8cA\xd1MU\x5c\x85\x04%(\xc2\x82\xb0\xfc\x90\
-\xfd\xf4\x8f\xe7\xa2\xdbeY\xde\xf7y\xcf\xbd\xcf\xbd\xcf\
-\xf3=3\xdf\x19\x07\x17\xf6<\xe7\x9e\xcf\xfb\xde\xe7\xde\
-s\xcf\xdd\x03\xd8C\x92\xa44\xa5 H\x92\x00\x96$\
-I\x00K\x92$\x80%I\x00K\x92$\x80%I\x12\
-\xc0\x92$\x09`I\x12\xc0\x92$\x09`I\x92\x04\xb0\
-$\x09`I\x92\x04\xb0$I\x02X\x92$\x01,I\
-\x02X\x92$\x01,I\x92\x00\x96$I\x00K\x92\x00\
-\xaeK-\xc0T\xe0v`\x19\xb0\xcdi\x99\xfb\xb3\xa9\
-\xeeg4(\x8a\xb3\x14\x19\xc0\x93\x80\x15\xec\xdeV\xb8\
-\x9f\xd5\xc0(\xceR\x04\x007\x03\xad\xd4o\xad\xee\xef\
-j\x80\x14g\xa9@\x80\xf3$\xd5\x0e\x9b\xa3\xe4\x0a\x12\
-\xe7V\xc5O\x00\xefj:\xd7\xa8\x09\xe20q\xd6t\
-Z\x00\xef\xb4\x90\xd2\x89\x8d\xcd\x03\xf6\xd4@y\x8d\xf3\
-+\xc0\x10\xc5S\x00\xef\xd0TlM\x10\xfb\x8f\xf3\x14\
-\xc5S\x00\xefP\x1b\xf6\xa6\xe9\xb4\xdf8\xb7)\x9e\x02\
-x\x87:\xf1c\xb1B<\xc2)\xf4\xef\xb5\x8csg\
-\x85\xe2&\x80w\xa3n\xfcY\x0c\xd3\xe9\x11\xc0\x15\xc0\
-\xa3\xc0\xa6^\xbemr\x7fvE\xa0\xc4\xb4\x8csw\
-\x85\xe2&\x80w\xa3M\xf8\xb5\xa2 n\x02.\x07\xba\
-j\xf0\xb1\xcb\xfdl\x93G\x7f6\x1b\xc6ts\x85\xe2\
-&\x80\x0b\x9aB\x179\x9dn\x01\xdas\xf8\xd9\xee\xb1\
-tq\xb9a<\x97W(n\x02\xb8\x80E\xac\xa2!\
-\x9e\xd7\xe0\x8c\xc1\x87O\xf3\x0dc9\xbfBq\x13\xc0\
-\x81\xb7\x91\x8a\x9eN\xcf4\xf0s\xa6\x07\xbf.4\x8c\
-\xe3\xf4\x0a\xc5M\x00\x07,\xe4(\x1a\xe2}\x80U\x06\
->\xaer\xff\x96|+\xde7\x01\x5c\x83&\x11\xd6|\
-M\xa7\xf5-W\xce\xb8\x09\xe0\x1a\xd4Z\x02\x88\xf5\x9e\
-Y\xde\xb8\x09`v\x7f\xccmN\xe2\x10k\xa5\xb7\xbc\
-q\x13\xc05B|K`\x88-\xdf\x89\xb5\xd7Z\xee\
-\xb8\x09\xe0\x92ClY\x94\xb21@\xacc\xa9vJ\
--n\x02\xb8\xa4\x10\xab\xde\xb8\x9aq\x13\xc0%\x81X\
-'~\x147\x01\x9c0\xc4:s\xab\xb8\x09\xe0\x84!\
-V\xd7\x0bu\x0b\x11\xc0\x89C\xac\xbeS\xea\xd7%\x80\
-\x13\x87X\x9d\x1f\xd51S\x00'\x0c\xb1z/\xe7\x1f\
-_\xc5\xad\xc4\x00\xa78\x9d\xd6\xed\x07\x8a\x9b\x00N|\
-aK\xf7\x0f)n\x02\xb8D\x15[\x92Ty\x80\x05\
-\xb1$%\x0e\xb0 \x96\xa4\xc4\x01\x16\xc4\x92\x948\xc0\
-\x82X\xf2\xa9\xbd\xc9\x0ey\x0c\x11\xc0\x82X\x8a_M\
-\xc0Y\xc0\x7f\x01\xaf\xf6\x1a\xeb\xed\xc0\x8b\xc0w\x81?\
-\x17\xc0\x82X\x8aOc\x81'j\x1c\xf7;\x81C\x04\
-\xb0\x1f\x88\xef\x15\xc4R\x8e\x02\x92z\x9b\x0b\xac\x04\xfe\
-L\x00\xdbj4\xb0\x9a\xf0&\x88\xd3\xd5_\x00[s\
-\x8e\xfbj\x97s\x02\xd8\xe8\xdbw1\xc5\x99 NO\
-\x07\x02\x7flp\xdc\x17\xa7P\x8f\x9d\xc2`|\x96\xe2\
-M\x10\xa7\xa5o\x1b\x8d\xfbg\x05p\xe3ZL\x1c\x16\
-\x13\xc4\xfb\x03\x1f!kz~\x0d\xf0c`\x01\xf0\x0c\
-\xf0\x1a\xf0f\x9fw\xbfn\xf7g\x7f\x00\x96\xba\x9f\x9d\
-\x0b|\x1d\x98\x01\x9c\xe4\xfe\xcd2\xc0;\x14Xg4\
-\xe6\x8f\x09\xe0\xc6t0\xd0C<V$\xc4\x87\x03\xff\
-\x0atx|\xbe\x15\xc0\x1d\xc0\x17\x81\x93\x13\x9du\x9c\
-m\x18\x8f\x1e\x97\x83\x028\xa7\xce\x22>\x0b\x0dq3\
-\xf0\x15\xfc\xdf\xbb\xdc\x9f\xadu@\xcf\x88=\x91{\xe9\
-\xab\xc618K\x00\xe7\xd7\x05\xc4i\xa1 \x1eR\xc0\
-\xf6\xd9\xae\xecm\xe0!\xb2{\x8f\xde\x13q\xce\x5co\
-\xfc\xdc\x17\x08\xe0\xfc:\x9fx-\x04\xc4\xed\x91>\xfb\
-F\xe0?\x89\xb3z\xe9\xdf\x8d\x9fu\x9a\x00\xce\xaf3\
-\x88\xdb|B|\x11i\xd8c\xc0\xb9\xf8\xbd\xaa\xa5\x1e\
-}\xd9\xf8\xf9\xce\x10\xc0\x8d\xad\xb6n\xaf \xc4{\xf1\
-\xffkvS\xb0\xdf\x92U>5\x95\xe8C\x7f{\xec\
-\xab\xf3),J\xfc<\x81\xe4\xb5\x86x*\xe9\xda\x93\
-\xc0G\x0b\xcc\x97\xc1\xc0\xebF\xcf\xf2\x88\xb6\x91\x1a\xd7\
-9\x89$\xae%\xc4?&m\xeb!\xbb\x12\xe5\xbd\x05\
-\xe5\xccUF\xcf\xf1\x97\x02\xd8F\x0fV\x0c\xe2\xa5\x94\
-\xc3\xd6\x03\x97\x11\xbe$q?\xe0\xe5\x06}\x7f0\x05\
-6R\x01\xf8\x90\x06\x06d[\x82\x10\xbfF\xb9l\x11\
-pl\xe0\x9c9\x01x+\xa7\xbf/\x93\xc8\xb1\xc2\x94\
-*l\x8e\xa1\xfe*\xa47\x80\x09\xa4w\x9ex9\xe5\
-\xb3\x0d\x05l\xc9\x9c\xe6r\xa0\x1e\xebp\xb9\xa6\xe3\x84\
-\x9e\xa6F\xd7\xd7\xf8\xad\xfa\x13\xe0(\xd2l\x0a\xf0\x0b\
-\xcak7\x93\xb5\xb4\x09\x953G\xb9\x5c\xa8e\xa6v\
-\xbd\xcb1\x1d\xe8\xf7\xac#\xc8J\xe6\xfe\x87w\xcf\x09\
-w\xb9\x15\xd0\xeb\xc8\xba0\xa4\xdc\xd9\xe3\x9b\x94\xdb\x9e\
-$\xab\xed\x0e\xdd\x99\xe3:\xf7\xbb\xbb\x9c\x1f\xab]\x0e\
-}\xd5\xe5\x94Z\xeaD\xaeT \x1eG\xf9m%\xf0\
-\xa1\x8a\xe5\x9f\x00N\x14\xe2\x059 ^P\x01\x887\
-\x02\x1f\x17\x88\x028\x05\x88_\xa8\xf3\xddo\x8cK\xf0\
-\xb2\xdb\x16`\xb2`\x14\xc0)@\xfcG`\xdf:|\
-\xfc\x0c\xd9)\xa0\xb2\xdb\xdb\xc0\xe7\x05\xa4\x00N\x01\xe2\
-\xe5uN\xa7\xcfs[0U\x80\xf83\x82R\x00\xa7\
-\x00\xf1\xa2:!>\x9a\xacg\xf1\xf6\x92C\xbc\x85\xac\
-\x9b\xa4\xf2R\x00\x97ruz\x14\xf0\x0f\xee\xef.\x06\
-\x1ew`\x7f\x13\x98IV\xb4\xf2\x01`$\xd9\x89\xa6\
-\xde\xa7\x9b\x0e\x00\x8e\x03\xc6\x93\x1dU\xfc\x06p?v\
-\x85\xff\x96\x0b[\x1fVN\x0a`\xdd\x00Q\xbb\x8e\x05\
-.\x01\xe6G\xb2p\xb6\xb2\x80}b\x01,\x88\x93\x86\
-x\x87\xf6\x01\xfe\x1ax\xa0\xe0)\xfb\xaf\xfb\xcc\x22$\
-\x01,\x88\xeb\xd4h\xb2\x1e\xcbo\x15\x04\xf1-\xcaG\
-\x01,\x88mn:\xb8\x96b:cNS>\x0a\xe0\
-<z\x1f\xf9\xef\xd6)#\xc4{\x00G\x02\xb7\x05\x8e\
-\xc9z7\x16\xcaI\x01\x5c\xb3\x06\x915k+\xc2R\
-\xb8\xc6\xe5L\x1a?0_\x8f=F\x02\xf7\x14\x09\xe0\
-x\xf4\xf7\x05\xaf\xc2\xa6\x00\xf10`N\xc0\x98\x5c\xa6\
-\xbc\x14\xc0\xb5\x1eU\x5c\x1f\xc1VJ*\x17\xaa]@\
-v\xf7\x92o\xeb\x22\xd1#\x7f\x028\xac\xee\x8a\xa8\xa8\
-!\x15\x88O L\x1b\xa0;\x95\x9f\xc5\x03|\x22p\
-\x03\xb0\xa4W\xd1\xc0k\xc0\xc3\xc0lWETT@\
-&\x12\x9f\xa5\x02\xf1Q\xc0\x8b\x01\xe2qJ\x81\xcf8\
-\xd2\xe5\xe8\xc3\xbd>\xb06\xba\x5c\xbe\xc1\xe5vi\x01\
->\x0eXX\xc3\x00u\x03_#\xbb&2\xa4\x7fM\
-\xc0\x13\xc4i\xa9@|(\xf0\xac\xe7X<N\xf8\xe6\
-\xf1C]N\xd6\xf2\xaa\xb0\xd0\xe5z\xa9\x00>/G\
-1\xc0\xe3\x84\xbd\x11o2q[J\x10/\xf3\x1c\x8b\
-\xbf\x0a\xf8<\x07\xbb\x5c\xac\xc7\xder9_\x0a\x80\xcf\
-n`?u\x09a\x9a\x8c5\x03\xffK\xfc\x96\x0a\xc4\
-\xa3\xf0{5\xcc\xd3\x81\xbe\x85\xf7s9\x98\xc7\xb6\xba\
-\xdcO\x1a\xe0C\xa9\xbf\xadg_\x0bQN\xf7i\xd2\
-\xb1T \x1e\x87\xdf\xca\xad\x10\xb7&4Z\x8d\xf7\x86\
-c Y\x80\x7f`4X'x\xf6\xf3\x97\xa4e\xa9\
-@<\xddc\x0c\x1e\x0b\xf0\x01\xd4c\xe0\xe7M\xa9\x02\
-<\x02\xd8l4X\xb7z\xf4\xf3\xc3\xa4i\xa9@<\
-\xd7c\x0c\xc6y\xf4\xdb\xaadt\x0b\xd9Y\xec\xe4\x00\
-\xb6\xbc\x9c{\x03Yy\xa3\x0f?S\xbeH,\x05\x88\
-\xf7\x05:==\xff\x0f=\xf9<\x08\xdb6F\xe7\xa7\
-\x08p\xab\xf1`\x1d\xefi\x91\x22\xf5\xce\x8f)@<\
-\xd1h:\xda\xd76\xba\x99\x9e\xb5\xbf\xc7\x1b\xfb\xd9\x9a\
-\x22\xc0\xed\xc6A\xf0qS\xfa\xdfx\x82\xea%A\xbc\
-\x93n\xf5\xf4\xec3=\xf8\xfa1c\x1f\xdbR\x04\xf8\
-\x0e\xe3 \x9c\x99\xc8\xe2\xd5F\xb2\x9a]\x9d'\xde\xf9\
-(\xa2\x8fU\xe9\x05\x1e|=\xd3\xd8\xc7;R\x04\xf8\
-F\xe3 \x8c\xf5\xb0\xc5\xe5cZw\x0dj\x0a\xb0+\
-]\xeb\xe1\x99\xb7\x01\x07\x19\xfb9\xd6\xd8\xc7\x1bS\x04\
-x\x86a\x00\xba\x81\x96\x04\xa6\xcf]\xc0p\xd4\xd9c\
-\xa0\xce\x1e>\xda\xf3\x5cl\xecg\x0b\xb6'\xacf\xa4\
-\x08\xf0A\xd8]\xae}\x97\x07\xff\xee\xf5\x90H\xd7\x11\
-G{\x9e;#\x86\xf8[\x1e\x9e\xd7G~\xdcm\xe4\
-\xdb\xdbx\xbc,\xdc\xf7`\xcd3\x0a\xc2Dc\xbf\x86\
-xX}\xde\xe6\xde\xf3b\xe9\xb1\xf5D\xa4\x10\x1f\x83\
-}\xb7\xcb\xb5\x1e\x9e\xd5\xead\xda<\x9f\xf1\x0c\xd1\xd5\
-\xb0\xd1\xfd\xb4\xf9\x1e\xfc:\xc9\x030?%\xbeFy\
-/\x13\xfeTW-z\xc0\xc3\xb3\x9e\xe4\xc1\xcf\xf9\x0d\
-\xfa\xb4\xc11\x90\xf4a\x86i\x0d,\x16uzX\xa0\
-\xd8\x03\xf8\x92\x87\x04\x9aT\xc3\xef-\x02\xe2\xce\x08\xbf\
-\x89\xa7xx\xce\x7f\xf4\xf4\x1a\x98\xb7\x08\xa5\x87\x00\x1d\
-5C\x0d\xd8\xac\x1c\xef\xc3/x\xfc\xf4\xba\xcf8y\
-\xd6\xbbiy\xac-k\x1f#\xbe\xe6\xf1\xd6\xaf0\xbe\
-\xb6jF\xbb\x5c\xac\xf7ujV\x88X\x86\x1c\xb4S\
-\x80\x8e\x1a?\xb9~\xd4g5\xd7Z\xab=,\x1a\xc5\
-\xdew\xba=2\x88\xad[\x17\xbd\xe2\xd1\xd7\xe1.'\
-k\x99Iv\x10\xb0kH\x11\xedZ'\xbb\x84_\xdd\
-\xe7\x13\xab\xc3\xadP\x8e\xf1\xec\xc3A\x1e\xe0\x98\x9e\xc3\
-\x8f\xaao1\xcd\xf2\xf0|\x07z\xf6y\x8c\xcb\xd1\x8e\
->3\xca\xd5.\xa7'\xe3\xaff?\xca\xa6v\xc3\xc8\
-jY\x07\x07\xfc\x9d\x13<$\xce\xd19}\xa92\xc4\
-\xa3=<\xdb\xc9\x01\xfd\x1f\xecrwX\x91q\xacb\
-'\xbf\xbf3N\x9a\xdf7\xe8O\x95!^e\xfc\x5c\
-\x17V-\x9f\xab\x08\xf0w\x8c\x93\xc6\xa2\x88\xa0\xaa\x10\
-\xff\xd4\xf8\x99\xae\x15\xc0\xe5W\x9bq\xd2\x5ce\xe4W\
-\x15!\xb6\xae\x8d\xbeM\x00\x97_\xbf0N\x9a\xa9\x86\
-\xbe5c\x7f\x8a+f\x88/4~\x96\x9f\x09\xe0\xf2\
-\xcb\xba\xe5\xa9u\x05\xd0e\x84\xb7\xa2 \x1eo\xfc\x1c\
-\xcf\x08\xe0\xf2kM$+\xd0\xa1\x0f\xbe\xc7\x08\xf1\x18\
-\xe3gxM\x00\x97_\xd6\x87\xca\xf76\xf6\xef\x11\x8a\
-\xb3\xb6\xc0\x10\x1f`\xec\xff:\x01\x5cn5a{\x88\
-\xbf\x07\xfb\x06\xe3\x1d\x14k\xbf\x0c\x08\xf1Pc\xdf7\
-\x09\xe0rk/\xe3\x84\xe9\xf6\xe0\xe3\x9b\x14o\xcb\x08\
-s\x8a\xa9\xd9\xd8\xef\xed\x02\xb8\xdc\x1a\x92\x00\xc0o\x10\
-\x87\x858\xc5\x94\xc2\x8cH\x00k\x0a]\x97\x9e%\x1e\
-\xf3\xdd\x14 \x85\x19\x91\x00\x8eL\xd6\xb7\xc9\xefe\xec\
-\xdf\xcf\x88\xcb|\xb6\xe79\xd0\xd8\xd77\x05p\xf9\xb5\
-\xd68i\x8e2\xf6o.\xf1\x99\xaf-\xa6\xe3\x8c\xfd\
-\x5c)\x80U\xc8Q\xafY_\xbcv1q\x9a\x0f\x88\
-OW!\x87\x00.\xba\x94\xd2\xfa\xb2\xe9\xc3\xf1\xd3\xaf\
-:F\x88\xadK)\x17\x08\xe0\xf2\xcb\xba\xd6\xf8_<\
-\xf8\xf8\x14\xf1\x9a%\xc4\xdf0\xf6\xed\x16\x01\x5c~]\
-o\x9c4\xed\x1e|\xfc\x0aq\x9b\x15\xc4?1\xf6K\
-\xc7\x09+\xa0\xcb\x8d\x93f\xb9\x07\x1f\xf7\x8bh?\xd8\
-'\xc4\xd63\x0d\x1d\xe8\xaf\x80N\xf7\x90\xccGx\xf0\
-s6\xf1[\xa3\x10[\x97\x8d\x9e(\x80\xfd\xebD\xe0\
-\x06`\x09\xef\xb6\x16}\x0dx\xd8%\xedH\xcf\xbf\xff\
-0\x0f\x89\xfc9OE\x0e\x7f(9\xc4\x8b\x8c}\xd9\
-\xdfs\xee\x8ct9\xfa\xb0\xcbY\x5c\x0e/q9}\
-b\x99\x01>\x0eXX\xc3 t\x03_\xc3o-\xee\
-\x1a\x0fI\xeck\xb6\xb0\xad\xc4\x10\x7f\xcf\xd0\x87\x97=\
-\xe6\xcbP\x97\x93\xb5\x14\x01-t\xb9^*\x80\xcf\xa3\
-\xfe[\xe9\x1e\x07\x0e\xf6\xe4\x8f\xf5\xd5\x1ek\xf1\xd7Y\
-\xf3\x0b\xa4ay \xfe\x94\xe1\xef\xff\xbe\xa7\xf8\x1f\xec\
-r\xb1\x1e{\xcb\xe5|)\x00>\x1b\xd8\x9asP\x96\
-\xb8\x05\x1dk\x9f\xae\xf4\x90\xc0\xe7x\x8c\xe1\xcd%\x85\
-\xb8\x85\xac\xabg\xa3\xd6\x03\x8c\xf3\xb4\x98\xb8$\xa7O\
-[]\xee'\x0d\xf0\xa1\x06\xab\xa9>\xf6\xf6\xc6{H\
-\xde\xbb<\xc6\xb1\xa5\xc4\x10_d\xf0;\xdb<\xc5\xbd\
-\xd1&\x83o8\x06\x92\x05\xf8\x07FIa]\xae\xb8\
-7\xf6\x87\x1a\xb6\xe0\xf1\x1eX\xde-\xb3\xdcZ2\x88\
-\x9bh\xec.\xde\x15\xf8\xb9\x91a\x1c6\x15q7\xa5\
-\x0a\xf0\x08`\xb3QB\xdc\x9a\xc0{0\xc0\xd5\x01^\
-I>V\xc2\xd5\xe9\xbd\xc8w\x0ak%\xfe\xae\xe2\xb9\
-\xcd\xf0\x83\xfd\x80\x14\x01>\xdf0\x196`\x7f\xe7\xcc\
-\xa5\x1e\x92v\x0da\xae\xdahq\xdf\xc6\xabJ\x04\xf1\
-`\xb2\xd2\xcaZW\xdd\x1f\xf48=\x1dD\xe3\xf7Z\
-\xf7\xb6\xf3S\x04\xb8\xd58\x19\x8e7\xf6\xefH\xfc\x1c\
-\x1a\xf8\xa7\x80[s\xfb\xb9\x05\xb9\xa7(\xcf\x01\x88\xe3\
-\xdc\xb4\xf3\xf5~\xfe\xadn\xb2\xaba?\xee9\xae\xc7\
-\x1b\xc7\xa05E\x80\xdb\x8d\x83p\x86\x07\x1f\x9f\xf0\x90\
-\xb0]\xf8/F\xd9\xd5)\xa6\x8b\xdd\xc2\xcbC\xc0R\
-\x07\xc1\x1a\xe097E\x9d\x0b\x5c\xe2al|l1\
-5\x03\xef'\xdb\x0b?\x03\xf8 \xf6\x1d@\x07zM\
-\xb1\xb4\xb6\x14\x01\xb6>\xf5s\xa6\x07\x1f}5Q\xbf\
-\xa9\x00\x80u\x8d\x8b\x9d\xce4~\xf6;R\x04\xf8F\
-\xe3 \x8c\xf5\xe0\xe3\xfe\x86\x0bm\xbdm;a\xaf\xba\
-\x14\xc4\xb6\x1ak\xfc\xdc7\xa6\x08\xf0\x0c\xc3\x00t\xbb\
-\x85\x9b\x14\xa6\xfa;\xec9\xec\xfbe\x09\xe20j1\
-\xdef\x9c\x91\x22\xc0\x07aW\xc7\xeb\xb3Hb\x82\xc7\
-d\xfd\x8f\x04\xbem\x04q\xff\xba\xdb\xe8Y\xdf\xc6c\
-}\x80\xef \xcc3\x0a\xc2D\xcf~>\xe9)Q{\
-\x80O\x0b\xe2$!\x9eh\xf8\x9c\xc9Vb\x8d6\xd8\
-O\x9b\x1f`\xb0\xa6zL\xd4\x0d\xc0\x9f\x08\xe2]\xae\
-\xce\xc6\x0c\xf1|\x83\xb1\x1f\x9d2\xc0{\x00\xd3\x1a\xd8\
-\xa3\xectSq\xdf>\xee\xe9~\x97/\xeb\xc4sM\
-l\xc2\x10\xff\xda\xe3\xfa\x86\xc5k`\xde\xbc\xe8q\xb9\
-_\x8a\xe3\x84\xb3r\xbc\x0f\xbf\xe0\xfb\xd3\xab\x8f>\xef\
-9Q\x97\xe2\xff\xc0y\xaa\x10\xaf\x0a\xf4A\x9dw\x16\
-\xf9B\x9d\xcf\xb3\xcd\xe5|\xa9\x0e\xf4\x9fBm-T\
-z\x80\x1f\x01\xc3\x0bH\xdcg<'\xea\x13\x82x\x97\
-\xf6&\x1ek\x86\x1b\xd4p\x97\x93\xb5\xcc$;\x5c\xae\
-\x97\xb2\xa5\xce `2\xd9u\x1d\xab\xfb|bu\x00\
-\xdf\xc2_qz-\xfaD\x80D\xed \xab\x9a\x12\xc4\
-;\xdb\xef#\x7f'\x1e\xe3r\xb4\xa3\xcf\x8cr\xb5\xcb\
-\xe9\xc9\xd8\xd7\xecG\xdd\xd4n\x18\xd9\xa9\xa5\xc1\x11\x0d\
-\xd2C\x01\x12\xf5e-l\xed\xd2\x16\x92F\xb1\xc7`\
-\x97\xbb\xc3\x8a\xf4\xa3\x8a])ky\xe7\xd9\x14 Q\
-7h\x8b)\xe9}b\xb5\x95\x8dX\xa1\x1a\xab\xf7\x90\
-\x95\xd9\xa9bK\x10\x0b`C\xb5\x90\xbf\x17R\x1e{\
-\x0e8I\x10\x0bb\x01l\xa7\x0f\x04\x9aJ\xef\xb0\xed\
-d\xa7\x98\x0e\x8c8&G\xb9\xf7wA,\x80\x93\xd0\
-\xa5\x84\xb7.\xb2\xa6\x00\xc3\x22\x8a\xc3\x01\xc0\xbfa\xdf\
-GL\x10\x0b\xe0d\x8a\xda\xf3\xec\x8b^\x8d\xffFy\
-\x03i\x14\xd9epoQ\xbc\x09b\x01\x9cK\xfb\x02\
-\xcf\x16\x98\xb8[\x80{\x80O\x06\xdan\xdb\x8b\xac6\
-\xfcA7\xad\x8f\xc9\x04\xb1\x00\xce\xa5c\x88\xe3\xb6\xc0\
-u\xc0\xeddw1Y^\xa86\x9a\xac?\xf3=\xbc\
-{_U\xac&\x88\x05p.\x9d\xe6\xbe\x0dc\xb2\xe5\
-d\x0d\x09\xae\x02\xa6\xb8\x95\xecQ\xec\xdc;\xaa\xc9\x15\
-\x1d\xbc\x0f8\x95\xac\xc8\xfe\x1a\xb2\xfby_%=\x13\
-\xc4\x028\x97&\x93\x1d\xd0N\xc5zH\xa3\x11\xbc \
-\x16\xc0\xc1t\x11\xf1\xb6p\xad\x9aU\x1eb\x01\x99O\
-\x97\x0bbA,\x80\xd3\xd6\xf9\xa4qw\xaf \x16\xc0\
-\xd2.\xf4I\x8a+n\x90\x09b\x01l\xa0\x09\x91l\
-1\xc9*\x08q\xca\xc5\x15\x17\xb9\x01[\x02\xbcDv\
-\xc8\xfa^\xe0\x0a\xe0\xb0\xc0\xfe\x1cC\xd62G\x16/\
-\xc4\x87\xb9\xdc\xb8\xd7\xe5\xcaK.w\xe6\xb9\x5c\xdaW\
-\x00\x879D\xfde\xb2z\xe1\x81l+\xf0=\xb7\xf7\
-\x19\xf2C\xe5n\xf1\x13\x1d\xc4#\x5c.\xecn;\xad\
-\xcb\xe5\xd6`\x01\xec\xafC\xe0\xa2:\x07\xf2\x15\xe0O\
-\x03\xfby)aO1\xa5b[\x0a\x80\xf8\x83.\x07\
-\xea\xb1E\xc4\xdb`/Y\x80\x87\x03O\xe7\x1c\xc8\xd7\
-\xc9\xae\xac\x0c}\x14q\x89\x98}\xc7\x1e\x05\x8e&\xfc\
-y\xe2\xbc\xf7^=M\xf8\xa6\x8a\xa5\x06\xb8\xd1\x1b\x1e\
-\x96\x02C\x03\xfb\xbc'\xf0\x05l/\x8aN\xcd\xd6\xb9\
-\x18\xech\xf4VDS\x80F\xbe\xc1\x05\xb0\x81N5\
-\x1a\x90/\x16\xe4\xffh\xc24\xca\x8b\xcd\xda\xe9\xbf\x99\
-}J\x10O\x10\xc0\x8d\xeb>\xa3\xc1XI\xe0\x96\x9f\
-}t\x06\xf0T\x05\xc0\xfdU\x0d\x89\x9f\x0a\xc4\xf7\x09\
-\xe0\xc6\xb4\x1f\xb6\xc5\xf8\xa7\x16\xfc<\xcdd\x15\x5c\x9d\
-%\x04w)YaK\xcc=\xb6\xea\xb5\xad.\x07\x05\
-pN\x9df< \xb3#y\xaef\xe0\x1c`q\x09\
-\xc0]\xe4\x9e\xa5)g\x1cb\x87\xf84\x01\x9c_\xd3\
-\x8c\x07\xe3;\x91~H\xb5\x91VI\xe6\x06\xe0f\xe0\
-CF\x1ff1C\xfc9\x01\x9c_\xd3\x8d\x07#\xe6\
-\x0b\xb7G\x90\xed!\xff\x8a8O:\xbd\x0d\xfc\xb7\x1b\
-\x13\xeb\x86{1C<]\x00\xc7sW\xd1?'\xb2\
-mv8p\x09\xf0@\xc1\xdf\xcc\x1b\xc9\xee\xc8\xbd\x10\
-\x18\x19\xe0\xb5\x22F\x88?!\x80\xf3\xeb\x08\xe3\xc1\xf8\
-T\x22\x00\xf7\xd6\xde\xc0x\xb2\xdb\x22\xee\xc3\xef\xc1\x89\
-W\xc9\xda\xec\xcc\x06>B\xf8\xb2\xc2\x18!>B\x00\
-7&\xab\x8a\xa6n\xe0=\x09\x02\xdc\x9f\x0e\x01&\xba\
-)w\xab{\x87~\x14\xf8\x1d\xb0\x06X\xdf\xcf\xf3\xaf\
-#\xabJ\xfb\x9d\x9b\x0a\xdfJ\xd6\xeb\xf9\x12\xe0\xa3\xc4\
-s\xediL\x10\xffV\xdbH\x8dk\x96\xd1`\xfc\xb0\
-$\xf0\xe6\xb9&&5\x9fc\x81x\x96\x00\xb69\x81\
-\xd4h_\xe6.\xe0\xc8\x8a\x02\x9c\xaa\x8a\x86\xf8Y\x12\
-8\x99\x94\xca`\x8e%\x7fMq\x0fY\xa3rA!\
-\x88\xeb\xd9&\x1b\x9bB\x8cR\xeb|\xb1.\xc7\xd6\xc7\
-\xa5\x02A\x10\xd7i\x8f\x90Hg\x8f\xd4\x06\xf3\xfd\xd4\
-~&x\x99[\xe8\x11\x04\x828\x8f%\xd1\x9e'\xc5\
-\xc1lr{s\xf7\xf4\xb3\xda\xba\x05\xf89Y\x8b\x94\
-!J|A\x5cv\x88\xcb0\xa8\xef\x05\xc6\x01\xc7\x92\
-X;\x14I\x10W\x1d`I\x10W\x1ab%\x84$\
-\x88\x13\x86X\xc9 \x09\xe2\x84!V\x22H\x828a\
-\x88\x95\x04\xf94\x1e\xf8\xb6\xab?~\xc9\xe9Q\xf7g\
-\xe3\x15\x9f\xa0q\xab4\xc4J\xaa\xfat2\xf0\x9b\x1a\
-\x06\xf87\xeeg\x15\xb30q\xab,\xc4J\xae\xda\xf5\
-%`{\x1d\x03\xbc\xdd\xfd\x1d\xc5-L\xdc*\x09\xb1\
-\xc0\xacMW60\xc8W*n\xc1\xe2V9\x88\x05\
-\xe7\xeeuz\x9d\xdf \xfd}\xa3\x9c\xae\xb8\x05\x8b[\
-\xa5 \x16\xa0\x03k\x10\xd9Mv\x8d\xda\xf3T\xeb\xda\
-\xcb\xa2\xe3V\x19\x88\x05\xe9\xc0:\xd7p\x80\xcfU\xdc\
-\x82\xc6\xad\x12\x10\x0b\xd2\x815\xd7pp\xe7*n\xc1\
-\xe3Vz\x88\x05\xe9\xc0z\xdep`\x9fW\xdc\x0a\x89\
-[\xa9!\x16\xa4\x03\xcb\xf2\x9e\xdf\x8d\x01\xfcm!\xeb\
->r;\xd9y\xe8mN\xcb\xdc\x9fM%L\x8f\xac\
-\xd8\xe2VZ\x88\x05\xe9\xc0\xb2\xbc\x94z\x8bg_'\
-\x01+j\xf0c\x85\xfb\xd9\xaa\xc5\xad\x94\x10\x0b\xd2\x81\
-\xb5\xd2p0Wz\xf2\xb1\x99\xac\xb5l\xbd\xd6\xea\xfe\
-n\x95\xe2\xd6\x0c\xcc\x09\x0c\xf1\x1c\x8fq\x16\xc0\xbb\xd1\
-\xfd\x86\x03y\xbf'\x1f[\x1b\xf0\xa9\xb5\x82q+\x02\
-\xe2V\x01\x5c\x8c\xfe\xd6p\x10}4\xd7\x9bd\xe0\xd7\
-\xa4\x0a\xc6\xad\x08\x88'\x09\xe0\xf0\x1a\x01\xac5\x18\xbc\
-\xb5\xee\xdf\xb2^\xb0\xb2\xb8g\xf8\x15\xec\xfb\x87\xc5\x1c\
-\xb7\xa2\xde\x89}\xc4Y\x00\xd7\xa0\xd9\x06\x83\xe7\xe3^\
-\xe2\xa9\x86\xc95\xa5Bq+\x12\xe2)\x02\xb8\x98C\
-\xe3\x0b\x1a\x18\xb4\x05\x9e\x161\xda\x0c\x13\xab\xadBq\
-+r:\xdd&\x80\x8b\xd10`a\x8e\x01[\x88\xfd\
-]\xba;\xd4i\x98X\x9d\x15\x8a[\x91\x10w\x0a\xe0\
-\xe24\x18\xb8\x1a\xd8Z\xc3@mu?\xeb\xb3\xcd\xad\
-\xe5\xbd\xc1\xdd\x15\x8a[\x91\xd3\xe9n\x01\x5c\xbcF\x91\
-]\xcb\xf9b?\x03\xf4\xa2\xfb\x7f\xa3\x02\xf8\xb1\xd90\
-\xb16W(nEB\xbcQ\x00\xc7\xa5\xe1d\x97`\
-\x8du\xff\x1d\xf2w/7L\xac\xe5\x15\x8a[\x91\xd3\
-iM\xa1\xa5w4\xdf0\xb1\xe6+\x9eA \xd6\x22\
-\x96\xf4\x8e.4L\xac\xe9\x8ag\x90\xe9\xb4\xb6\x91\xa4\
-w\xb4\x0f\xb0\xca \xa9V\xb9\x7fK1\xf5\x0b\xb1\x0a\
-9\xa4\x9d4\xd3 \xb1f*\x8eA\xa6\xd3*\xa5\x94\
-\xfa\xd5\xbc\x06\x92j\x9e\xe2\x17\x04b\x1df\x90\x06\xac\
-\x89n\xcf\x91T\xed\x849\xdc_&\x88c;\xb6)\
-\x80K\xa2&\xe0r\xa0\xab\x86\x84\xear?\xdb\xa4\xb8\
-%\xdf8A\x00\x97L#\x80+\xc8\xee\x1b\xea\xdd\xd6\
-f\x93\xfb\xb3+\xf0w\xba\xa7j\xb3\x9e\x18Z\x17\x09\
-\xe0\x0a\x00-`K,\x05A\x92\x04\xb0$I\x02X\
-\x92$\x01,I\x02X\x92$\x01,I\x92\x00\x96$\
-I\x00K\x92\x00\x96$I\x00K\x92$\x80%I\x00\
-K\x92$\x80%I\x12\xc0\x92$\x09`I\x12\xc0\x92\
-$\x09`I\x92\x04\xb0$I\x02X\x92J\xa2\xff\x03\
-\xbe|\xe65\xb4Y\x0fy\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x0dl\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:08:59+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:08:59+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:bde66\
-ce7-367d-9149-93\
-8c-19e7e43f48bc\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:bde66\
-ce7-367d-9149-93\
-8c-19e7e43f48bc\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:bde66ce7-367d\
--9149-938c-19e7e\
-43f48bc\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:bde\
-66ce7-367d-9149-\
-938c-19e7e43f48b\
-c\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\x0d\xb9d\xdc\x00\
-\x00\x08$IDATx\xda\xed\xdd\xcdo\x14e\x1c\
-\xc0qD^T\x90#\x88\x1a\x89\xfa\x7f\x88\x86(g\
-\xac\x84\xfe\x09\xbe$\x06=\x19\x121z\xe5b}9\
-x\x92\x02\x81n\xbc\xc9\xcdD\x14\xc4\xc8\x05\xa21\xc1\
-\x98\xe0\x0a=\xe8\x09%\x1a\xcaK\x09\xe3\xb3\xb45\xb4\
- \xb6\xdb\x99\xd9\xfd=\xcf\xe7I\xbe\x17\x83\x89\xcc\xfc\
->\xce\xec\xec\xcc\xec\x8a\xaa\xaaVH\x8a\x99\x8d \x01\
-,\x09`I\x00K\x00K\x02X\x12\xc0\x92\x00\x96\x00\
-\x96\x04\xb0$\x80%\x80%\x01,\x09`I\x00K\x00\
-K\x02X\x12\xc0\x92\x00\x96\x00\x0e\xdf\xba\xd4\xf6\xd4\x9e\
-\xd4x\xeaT\xea\xd7\xd4\x1f\xa9\xeb\x95u\xaf\xd5\xdb>\
-\x17R\x1f\xa4\xd6\x83\x04p[mJ\xedN\x9dH]\
-\xe3\xb0\x96u#\xb5\x0f&\x80\x9b\xec\xd9\xd4\xd1\xd44\
-o\x8d\xad\xd3\xa9UP\x01\x5cg\xdbR\xdf\xb2\xd5\xda\
-:\x9bZ\x09\x16\xc0\xcbms\xea\x00O\x03Y'\x1d\
-\x89\x01^N\xa3\xa9K\x1c\x0dt\x1dr$\x06x\xa9\
-=\x90\xfa\x84\x9d\xa1Y\xe3\x10\x03\xbc\xd8z_e|\
-\xc1\xcc\xd0\xad#N\xa7\x01^\xccWCgXq$\
-\x068^\x1b\xe0u$\x068\xeeg\xde\xe3l8\x12\
-\x03\x1c3\x17\xac\x1c\x89\x01\x0e\xfa\x1f\xbe\x93\x05\x88\x15\
-\x13\xf0\xa3\x95\xefy\x9dN+,\xe0\x09\xf3\xefH\xac\
-\x98\x80\xb7\x99{Gb\xc5\x05\xfc\x8d\x99w$VL\
-\xc0[\xcd\xba#\xb1\xe2\x02>j\xce!VL\xc0\x1b\
-+\x0f\xe3;\x9dVX\xc0o4<8W\xab\x99\xe7\
-\x87w\xa4\xb6\xa4V\x178\x0c\x8e\xc4\x007\xd6\x89\x06\
-\x07\xe6p5\xf3\xddr\xe9\xc3\xe0t\x1a\xe0\xc6\xde\x1e\
-\xd9\xc4\x0b\xe8z/c{\xd9\x10\x0c%`\x883\x02\
-\xbc\xbd\xa1\x01y\xc5\x00\x0c5`\x883\x01\xbc\xa7\xa1\
-\xd3f\x030\xfc\x80!\xce\x00\xf0x\xcd\x03q\xc5g\
-\xdeP\x80!\x0e\x0e\xf8T\xcd\xc3p\xc0\x8e\x0f\x07\x18\
-\xe2\xc0\x80\xcf\xd7<\x08;\xec\xf8\x90\x80!\x0e\x0a\xf8\
-b\xcdC\xf0\x84\x1d\x1f\x16\xb0\x9b=\x02\x02\xae\xfb+\
-\xa4\xd5v|h\xc0\x10\x07\x03\x5c\xf7\x825>`\x88\
-\x01Vp\xc0\x10\x03\xac\xe0\x80\x8bG\x0c\xb0\xa2\x03.\
-\x1a1\xc0jj;\xef\x87\x18`\x80\xe3n\xe7\x95\x10\
-\x03\x0cp\xec\xed\x0c1\xc0\x00\x07\xdf\xce\x10\x03\x0cp\
-\xf0\xed\x0c1\xc0\x00\x07\xdf\xce\x10\x03\x0cp\xf0\xed\x0c\
-1\xc0\x00\x07\xdf\xce\x10\x03\x0cp\xf0\xed\x0c1\xc0\x00\
-\x07\xdf\xce\x10\x03\x0cp\xf0\xed\x0c1\xc0\x00\x07\xdf\xce\
-\x10\x03\x0cp\xf0\xed\x0c1\xc0\x00\x07\xdf\xce\x10\x03\x0c\
-p\xf0\xed\x0c1\xc0\x00\x07\xdf\xce\x10\x03\x0cp\x1f\xfd\
-U\x95\xbd:\x11\x11\x03\xac\xb9~\xae\xac\x93\xd1\x10\x03\
-\xac\xb9\xbe\xe6\xf7\xd6:\x1b\x091\xc0\x9a\xeb0\xbb\xff\
-\xae\xef\x01\x068Zor;o\xed\x03\x18\xe0H=\
-\xcd\xec\xbc5\x9d\xda\x000\xc0\x91\xfa\x91\xdby\xeb}\
-\x80\x01\x8e\xd4{\xcc\xce[\x93\x00\x03\x1c\xa9M\xa9\xbf\
-\xb9\x9dw\x1a\x0d0\xc0\xa1z\x87\xdb8\xf3\x02\xb0\x16\
-\xb6>\xf5;\xb7\x00\x03\x1c\xb7\x1d\xa9\x9b\xec\x02\x0cp\
-\xdc\xf6\xb2\x0b0\xc0q\xbb\xaf\x9ayJ\x07`\x80\x01\
-\x0e\xda\x83\xa9\xcf\x00\x06\x18\xe0\xd8G\xe2\xbd\x05\x7f&\
-\x06\x18\xe0l.l\xfd\x060\xc0\x00\xc7m]\xea\xed\
-\xaa\xac\x87\xff\x01\x068\xbb6\xa6\xdeM\xfd\x000\xc0\
-\x00\xc7\xee\xa9j\xe6Q\xc4\x83\xa9c\xa9\x9f\xaa\xbcn\
-\xc7\x04\x18`\x99\x17\x80\x01\x96y\x01\xd8\x90\x03\x0c\xb0\
-\x1d\x22\xf3\x02\xb0\x1d\x22\xf3\x020\xc0\x02\xd8\x0e\x11\xc0\
-\x00\xdb!2/\x00\x03,\xf3\x020\xc0\x00\x03l\x87\
-\x08`\x80\xed\x10\x99\x17\x80\x01\x96y\x01X\x00\x03l\
-\x87\xc8\xbc\x00l\x87\xc8\xbc\x00\x0c\xb0\x00\xb6C\x040\
-\xc0v\x88\xcc\x0b\xc0\x00\xcb\xbc\x00\x0c0\xc0\x00\xdb!\
-2/\x00\xdb!2/\x00\x03,\xf3\x02\xb0\x00\x06\xd8\
-\x0e\x91y\x01\xd8\x0e\x91y\x01\x18`\x80\x01\xb6C\x04\
-0\xc0v\x88\xcc\x0b\xc0\x00\xcb\xbc\x00\x0c0\xc0\x00\xdb\
-!2/\x00\xdb!2/\x00\x03,\x80\xed\x10\x01\x0c\
-\xb0\x1d\x22\xf3\x020\xc02/\x00\x03\x0c0\xc0v\x88\
-\x00\x06\xd8\x0eQkM\xd58+\x97\x01\x06X\xed\xd6\
-\xadqV\xba\x00\x03\xacv\xeb\xd48+\x1d\x80\x01V\
-\xbb\x8d\xd68+\xbb\x00\x06X\xed\xb6\xa6\xa6\xd3\xe8\xf3\
-\xa9\xb5\x00\x03\xac\xf6\x1b\xa9aNF\x22\xfc]\x01V\
-\xae\x8d-cF\xc6\xa2\xfc=\x01V\xae\xad\xec\x13\xf1\
-\xd8\xec\xbf\x0b0\xc0\x1a\x92\xd3\xe9\xc9E\xcc\xc5d\x94\
-\xd3f\x80U\xe2\x85\xad\xde\xd5\xe9\x89\xd4\xb9\xd4\xf4l\
-\xe7f\xff\xd9\xe8\xec\x9fY\x010\xc0\x12\xc0\x00K\x00\
-\x03,\x80\x01\x96\x00\x06X\x02\x18`\x09`\x09`\x80\
-%\x80\x01\x96\x00\x06X\x00\x03,\xb7H\x02\x0c\xb0<\
-\xa4\x000\xc0*\xf21A\x80\x01\xf6\xa0\xfe\x9dk<\
-7\xc4\x00\xab\xb4W\xe5d\x85\x18`E\xba`U\xd7\
-;\x9f\x8f\xa4V\x01\x0c\xb0\xdak\xb4\xe69\xc8\x021\
-\xc0\x8aR\xa7\x81Y\x08\x7f:\x0d\xb0\xa2\xd4\xad\x9aY\
-\xa1\x11\x03\xac(]\xa9\x9a[aO\xa7\x01V\x94\xa6\
-\xaafWH\xc4\x00\xab\xf4S\xe8\xd0\xa7\xd3\x00\xab\xe4\
-\x8bX\xe1\x11\x03\xacR\xbfF\xca\xe2t\x1a`\x95x\
-#G6\x88\x01Vi\xb7Rfu:\x0d\xb0Jz\
-\x98!;\xc4\x00+\xe2\xe3\x84\xe3\x10\x03\xac\xd8\x88\xf7\
-\xb7\x8cx(?\x13\x03,\x88\x03#\x06X\x10\x07F\
-\x0c\xb0 \x0e\x8c\x18`A\x1c\x181\xc0\x8280b\
-\x80\x05q`\xc4\x00\x0b\xe2\xc0\x88\x01\x16\xc4\x81\x11\x03\
-,\x88\x03#\x06X\x10\x07F\x0c\xb0 \x0e\x8c\x18`\
-\xfd\xdf3\xb8\x0b\x7f\xfd\xcfZ\xdcj\xe5\x01\x08\x80u\
-\xafgo'9\x1cn\xc4\x00\xebn\xa7\x9cc\xec\xc5\
-@\x0c\xb0\x06\xfd\xc0|\x09\xebC\x80\x01\xce\xf1\x955\
-%\xad\x11\x80\x01\xce\xe9\xa5q\xa5\xad\xf3\xa9\xb5\x00\x03\
-\x9c\xc3k[K]\xbb\x00\x06\xb8\xa9:|5\xbe:\
-\x00\x03\xdcTN\x9f\x9b_]\x80\x01n\xaa)\xbe\x1a\
-_S%\x02\xbeV\xf3F\x5c\x03+\xc0\x03Z\x97K\
-\x04|\xb1\xe6\x8d\xb8\x05V\xa7\xd0N\xa1\xdb\xebB\xcd\
-\x1b\xf1EX]\xc4r\x11\xab\xbdN\xd5\xbc\x11\x0f\xc2\
-\xeak\xa4\x01\xad\xd1\x12\x01\xd7\xfd3\x1aWS\x8f\x01\
-{G\xbd\x9b\x0c\xce3\xd6\xd8*\xf6F\x8e=\x0dl\
-\xcc\x09`\xddJ\xd9\xf2*\xf6V\xca\x17\x1a\xda\xa0\xaf\
-\x02\xeba\x86\x96V\xd1\x0f3<\xd4\xc0WI\xbdu\
-#\xf5\x1a\xb0\x1e'lx\x15\xff8a\xaf\xe3\x0d_\
-\x19|\x1c\x5c\x0f\xf4G\xc3\x1b\x09\xf0\xee\x867\xf4\xd5\
-\xd9\xab\xd3/\xa5\x9e\xac\xdc\xec\xe1\x95:\x01\xf0F\x02\
-\xbc\xd1\xf0,jM\xcfB\x9b\x98\x85\xe7\x7fD\x99\xff\
- x\xa4\x1d\xf19\x9fK^\x93M]\xfd\x84w\xf0\
-x\xa3\x01\xde\xcac\xdfk\xac\xcd\xa1\x82\xd7\x8b\xdd\xff\
-\xab\x93,.\x0b1\xbc\x19\xe1\x8d\x08\xf89\x0e\x97\xb5\
-F\xe0\xcd\x07oD\xc0\xbd\x0es\xd8\xf7j\xe4v\xbe\
-!\xc3;\x88_a\xb8\x7fP\x7f\xe7\x88;is\xea\
-\x12\x8b}\xaf\xd1\xca\x917\xfc\x9172\xe0^;9\
-\xec{u\xe0\xcd\x03od\xc0\xbd>f\xb1\xaf\xd5\x85\
-7\x0f\xbc\xd1\x01\xf7>\xcb\x1d\xe3q\xc9k\x0a\xde<\
-\xf0F\x07\xdc\xeb\xe1\xd4i&\x97\xb4.W.X\x85\
-\xbc`\x95#\xe0\xb9\xdb,\xcfpY\xd4)t\xf1G\
-\xde\x9c\x00\xf7\xda\x90\xfa\x92\xcd\x22.b\xc1\x9b!\xe0\
-\xb9\xcf\xc4\x1f\xf1\x99\xfd\xd7Hc\xf0\xe6\x09x\xae\xde\
-#\x81\x7frz\xd7\x15\xfdF\x8e\x11x\xf3\x07\xdc\xeb\
-\x91\xd4\xa1\xd4Mf\xe7\xad\xc8\xb7R\xb6\xfd\xd2\xbd\xa1\
-\xc7\x9b3\xe0\xdb\x9f`:\xce\xed\xad\x15\xfda\x86Q\
-x\xcb\x03<\xd73\xd5\xcc\xf3\xc4\xd7\x0b\xc6\x1b\xfdq\
-\xc2\x0e\xbc\xe5\x02\xbe\xfd+\xa7\xd7S_U3\xaf\xd1\
-\xc9}\xe5\xf4@\x7f\x17^\x80\x17\xbe\xed\xf2\xf9\xd4[\
-\xa9OS\xdf\xa5~\xa9f~\x8b\xe9ZP\xb09\xbf\
-Rg\x0a^\x80\x05\xf0\xdd\xd6\xd0\xdda\x05\xb0r\xab\
-\xeb\xc8\x0b\xb0\x5c\xc4\xca\x06/\xc0*\xf9k\xa4\xb0\xa7\
-\xcd\x00+\xeaK\xe6\xbb\xf0\x02\xac\xb2o\xa5\x0c\x7f\xda\
-\x0c\xb0J}\x98!+\xbc\x00+\xea\xe3\x84\xfd \xce\
-\xf2\xe5\xf6\x06B\x91O\xa7\x17\xf3\xeb\x89Y\xff\xbc\x8c\
-AP\xf4\x0b[\x0b\x7f=\xb1\xa8\x1fx3\x04\x12\xc0\
-\x92\x00\x96\x04\xb0\x04\xb0$\x80%\x01,\x09`\x09`\
-I\x00KZn\xff\x00\xc1\x16F\xfa\x95\x8d<\xc2\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x10i\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x06\x88iTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:08:58+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:08:58+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:6f847\
-28a-cc4f-a548-af\
-e9-8179a24b7c0d\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:98dcb\
-a42-da86-594e-8d\
-2d-1e2bcc1045c6\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:98dcba42-da86\
--594e-8d2d-1e2bc\
-c1045c6\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:98d\
-cba42-da86-594e-\
-8d2d-1e2bcc1045c\
-6\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- <rdf:li stEvt:a\
-ction=\x22saved\x22 st\
-Evt:instanceID=\x22\
-xmp.iid:ebe1cf35\
--f3d9-f34f-921f-\
-f67bb976a4c4\x22 st\
-Evt:when=\x222023-0\
-7-17T16:07:24+02\
-:00\x22 stEvt:softw\
-areAgent=\x22Adobe \
-Photoshop 24.6 (\
-Windows)\x22 stEvt:\
-changed=\x22/\x22/> <r\
-df:li stEvt:acti\
-on=\x22saved\x22 stEvt\
-:instanceID=\x22xmp\
-.iid:6f84728a-cc\
-4f-a548-afe9-817\
-9a24b7c0d\x22 stEvt\
-:when=\x222023-07-1\
-7T16:08:58+02:00\
-\x22 stEvt:software\
-Agent=\x22Adobe Pho\
-toshop 24.6 (Win\
-dows)\x22 stEvt:cha\
-nged=\x22/\x22/> </rdf\
-:Seq> </xmpMM:Hi\
-story> </rdf:Des\
-cription> </rdf:\
-RDF> </x:xmpmeta\
-> <?xpacket end=\
-\x22r\x22?>\x02\xa4/\x9d\x00\x00\x09\x87IDA\
-Tx\xda\xed\xdd\xbb\x8fUU\x14\xc7q\x19|$ \
-F\xc7\xd8@A\x05\x8d\x9dT\x94\x18\x1b\xed\x88!\xd2\
-\xd2\xf0/\xd0R\x9ah1\x18\x1b;+\xa3Vcm\
-!\x9d\x95\x13b\xa0!\xc6\xf0\x08\x16&R\x90\x8c1\
-<<\xeeI\xf6\xf8@\xc4\x99\xb9\xf7\x9c\xb3\xd6\xde\x9f\
-\x95|\x1bA2\xb3\xce\xfa\xde{\xcf\xde\xbf{\xf63\
-\xc30<\x03 '\x9a\x00\x10\x18\x00\x81\x01\x10\x18 \
-0\x00\x02\x03 0\x00\x02\x03\x04\x06@`\x00\x04\x06\
-\x08\x0c\x80\xc0\x00\x08\x0c\x80\xc0\x00\x81\x01\x10\x18\x00\x81\
-\x01\x10\x18 0\x02\xf2|\xe1l\xe1\xf3\xc2\x0f\x85\x07\
-\x95\x1f\xea\x7f;[\xff\x8e^\x11\x18\x81X)\x9c+\
-\xdc\x1e\xfe\xbfn\xd7\xbf\xbb\xa2o\x04\xc6\xfc\x9c*l\
-\x0c\xbb\xaf\x8d\xfa\xff\xea!\x811\x03\xc7\x0b\xeb\xc3\xe2\
-\xb5^\xff-=%0&`\xb5\xb0V\xb8?,\xaf\
-\xee\xd7\x7fsU\x7f\x09\x8cqx\xaep\xbe\xf0\xf30\
-^\xdd-\x5c(\xbc\xa0\xdf\x04\xc6\xf2x\xabpu\x98\
-\xae\xae\x17\xce\xe8;\x81\xb1\x18'\x0a\x97\x87\xf9\xear\
-\xfd\x19\x5c\x0b\x02c\x17\x1c)|Zx4\xcc_\x8f\
-\xea\xcfr\xc4u!0\x9e\xce\x81z\x0fzo\x88W\
-\x9b\x85\xf7\x0b\x87\x5c'\x02\xe3\x9f\xec\xab\xf7\x9c7\x86\
-\xf8u\xa7.\xa6\xedw\xdd\x08\x8c\xbd\x071\xe6.A\
-\x10\x02\x0bb\x0c\xf9K\x10\x84\xc0]\xf1J\xbd\x97\xfc\
-mh\xa7\xb6\x82 \x9f\x14^s}\x09,\x88\x91\xb7\
-\x04A\x08\xdc$\xa7k8\xa2\x97\xba^\x7fg\xd7\x9e\
-\xc0\x82\x18\x89K\x10\x84\xc0\x82\x18\xc9K\x10\x84\xc0i\
-8X\xb8XC\x0f\xea\xdfA\x90\x8b\xb5Gf\x85\xc0\
-\x82\x18IK\x10\x84\xc0\x82\x18\x0d\xd4\xb5\xc2\xdb\xe6\x87\
-\xc0\x82\x18O_D\x8a\xbe\x88&\x08B`A\x8c'\
-l\xe3\xfc\xfd\xfb\xbcS\x7f\x9fX\x10\x84\xc0\x82\x18K\
-\x0eRd\xff\xf9A\xe04O\xc4\x18\xf3\x1d,\xe3'\
-\x08\x10xO\xbcQ\xf8&\xf8=\xe4\xd7\x85\xd7\xf7\xf0\
-\xbb\x1d+|\x19\xfcw\xfb\xb6p\xd2\x1c\x12x\xb7\x1c\
-\xae\xefh\x0f;X\xc5\x8d\xbe\x8a\xfe{}\xa19j\
-.\x09\x9c\xf9\x89\x18c\xee\xa3f\xd8\xc7\xf6D\x10\x02\
-\x1b`/`\x04\x16\xc4h\xff#dO\xb7\x10\x04N\
-\x8aE\x9c\xbe\x17\xf1\x08\x9c\x14\xdb(}o\xa3\x118\
-)\x82\x0c\xfaG\xe0\xa4x\x07\xf1\x09\x86\xc0\x09q\x0f\
-g\x0d\xe1$\x81\x051\xac\xa2Z\xc5'\xf0\x04\xd8\xc7\
-\xb4\x8f>\xe7>:\x81\x0d\x90\x17P/\xa0}\x09\xec\
-#\x9c[\x98noa\x041,\xa2XDL\x1c\x04\
-\x11\xc4\xb0\x8da\x1b/q\x10D\x10C\x90\xc0\xf5K\
-|\xfd\xbc\x82w\xfe\x0a\xee\x13T\xeeOP\xee\xa1:\
-\xbf\x87\xb2\x86\x91{\x0d\xc3*f\xe7\xab\x98v\x11r\
-\xef\x22D\xfb\x81^.|Vx`\x1f\xd1\x03\x15\x82\
-\xd5\xd6\x9b\xc9W\x85W\x09\xfcd>\x0c\xfe\x8e\xebl\
-\x9f\xf1\xc9p\xb6\xd4\xc3:\xab\x04\xae<[\xb8\x12\xf8\
-\x829]oz2\x9c\xeex\xa5\xcen\xf7\x02G\x96\
-\xf7\xf2\xe0|\xdb9\x89~\xbe\xf2\x95\xde\x05\xfe \xf0\
-6\x82\x13\xe6\xe3p\xba^\x93\x88\xf5A\xaf\x02\xbf\x18\
-p\xb1J\x10C\x10d\xb7\xb55\xc3/\xf5(\xf0G\
-\x81.\x82 \x86 \xc8\x22\xb5\xd6\xa3\xc0\xb7\x824\x7f\
-}p\xbceF\x22\x1d\xefz\xabG\x81\xe7\xfe\xf8\xbc\
-QC\x04d\x10\x04Y\xc6\xc7\xe8\xee\x04\x9e\xab~\x12\
-\xc4h6\x08rs\xc6\xb9\x220\x81A`\x02\xfb\x08\
-\xed#4\x81;\x10\xd8\x22\x96E,\x027 \xb0m\
-$\xdbH\x04N.\xb0 \x87 \x07\x81\x1b\x10x\xbb\
-D)E)\x09\x9cX\xe0\xed\xf2e\x06_f p\
-b\x81\xb7\xca\xd7\x09}\x9d\x90\xc0\x89\x05\xde._\xe8\
-\xf7\x85~\x02'\x16x\xbb<R\xa7\xcfG\xea\x10\xb8\
-\x11\x81\xb7\xcbC\xed\xfax\xa8\x1d\x81\x1b\x15x\xbb<\
-V\xb6\xdd\xc7\xca\x12\xb8\x03\x81\xb7J\x10\xa4\xad\x07\xbb\
-\x13\xb83\x81\xb7K\x10$o\x10\x83\xc0\x04\xfe\xb3\x1c\
-n\xf6O\xa2\x1f\x8dC`\x02?\xb1\x1c/\x1a\xffh\
-\x1c\x02\x13\xf8\xa9\xe5\x80o\x02\x13x\x07\x15}\x1fq\
-\xb3.\xde\x1cjX\xdc\x03u\x0d\xe0^\xe0\xeb\xb0\xbd\
-\x8fO\xe0`\x02g\x1b\xa0\x96\x82 \xfb\x12\xbe\x80\x12\
-8\xa0\xc0\x99>\xc2\xb5\x12\x04\xc9z\xba \x81\x03\x0b\
-\x9ci\x11%k\x10$\xfb\xf9\xbe\x04N p\x96m\
-\x8cLA\x90\x0cA\x8c\x9dl\xe3\x118\x91\xc0Y\x82\
-\x04\x91\x83 \xad\xf5\x8f\xc0\xc9\x04n\xed\x1dD\x10c\
-\xb1O0\x04N*p+\xf7p\x82\x18\x8b\xad!\x10\
-8\xb9\xc0\xd9WQ{\x0fb,\xba\x8aO\xe0F\x04\
-\xce\xba\x8f\xd9{\x10c\x7fC\xf3G`\x03\xec\x05\x8c\
-\xc0\x04\xee1\x08\xd2\xeb-\x04\x81;h`\xcb\x8b8\
-\xbd/\xe2\x11\xb8\xa3\x06\xb6\xb4\x8db\x1b\x8d\xc0]6\
-0{\x90A\x90\x85\xc0\x1a\x98\xf4\x1dL\x94\x94\xc0\x1a\
-\x98\xf0\x1e\xf2\xfb\xc2w\x8d\xde\xc3\x13\x98\xc0\x9ek\xdc\
-\xc0*:\x815\xd0\xc9\x02\x13V\x94\x07\x1a\x10X\x03\
-\x9b:\xdbg\xec\x8av\xb6\x14\x815\xb0\xa9\xd3\xf5\xc6\
-\xaa\xa8\xa7;\x12X\x03\x9b:\xdfv\x8c\x8a|\xbe2\
-\x815p\xc7d8a~\x99u\xbd\xfe\xce\x91\xaf\x09\
-\x815\xd0\xd1\x22\x8fU\xa6\xa3e\x08\xac\x81\x0e\xf7\xaa\
-\x95\xf1p7\x02k\xe0B\x1c/\xac7 \xefz\xfd\
-]\xb2\xf5\x9f\xc0\x1a\xd8u\x10d\xa3\xfe\xecY\xfbN\
-`\x0d\xec2\x08\xd2\xca\xc9\x12\x04\xd6\xc0\xae\x1ei\xd3\
-\xda\xd9N\x04\xd6\xc0.\x82 Q\x83\x18\xe6\x8f\xc0\xe1\
-\x99;\x08\x129\x88a\xfe\x08\x9c\x86\xa9\xbf\xcf\x1b\xed\
-\xc1\xf2\xe6\x8f\xc0\xe9\x99\x22\x08\x92)\x88a\xfe\x08\x9c\
-\x92\xd5\xc2\xda\x08\xfd[\xab\xffv/}$\xb0\x06\x1a\
-@\xfd#\xb0\x01\xd4?\xfd#\xb0\x01\xd4?\x02k\xa0\
-\x01\xd4?\x02\x1b@\xfd\xd3?\x02\x1b@\xfd\xd3?\x02\
-\x1b@\xfd#\xb0\x06\x1a@\xfd#\xb0\x01\xd4?\xfd#\
-\xb0\x01\xd4?\xfd#\xb0\x01\xd4?\x02\x1b@\xfd\xd3?\
-\x02\x1b@\xfd\xd3?\x02\x1b@\xfd#\xb0\x06\x1a@\xfd\
-#\xb0\x01\xd4?\xfd#\xb0\x01\xd4?\xfd#\xb0\x01\xd4\
-?\x02k\xa0\x01\xd4?\x02\x1b@\xfd\xd3?\x02\x1b@\
-\xfd#\xb0\x06\x1a@\xfd#\xb0\x01\xd4?\xfd#\xb0\x01\
-\xd4?\xfd#\xb0\x01\xd4?\x02k\xa0\x01\xd4?\x02\x1b\
-@\xfd\xd3?\x02\x1b@\xfd\xd3?\x02\x1b@\xfd#\xb0\
-\x06\x1a@\xfd#\xb0\x01\xd4?\xfd#\xb0\x01\xd4?\x02\
-k\xa0\x01\xd4?\x02\xcf\xd7\xc0\xb5\xc1\x09\xf3\x04\xfe\x7f\
-V\xeb\xac\x108\xd8\x00n\xd5\xdd\xc2\x85\xc2\x0b\x04&\
-\xf0c<W8_\xf8y\xa4\xd9#\xf0\x12\xebz\xe1\
-\x0c\x81\x09\x5cy\xabpu\xe4\x99#\xf0\x08\xf5m\xe1\
-$\x81\xbb\x15\xf8\x8d\xc27\x13\xcd\x1a\x81G\xaa\xdf\x0b\
-_\x16\x8e\x12\xb8\x1b\x81\x0f\x17>)<\x9cp\xce\x08\
-<rm\x16\xde/\x1c\x22p\xb3\x02\x1f\xa8k \xf7\
-f\x98\xaf\xee\x04\xfeu\x98\xa7\xee\xd4\xc5\x8c\xfd\x04n\
-F\xe0}u\xcd\xe3\xc6L3\xb5\xd9\xa3\xc0?\x0e\xf3\
-\xd6F\xe1\x14\x81\xd3\x0b|\xaa^\xcb9\xeb\xc7\x1e\x05\
-\xfeb\x88Q\xeb\x85\xe3\x04N\xf7\xfb\x1f\xaf\xd7.B\
-}\xd1\xa3\xc0g\x878u\xbf.z\xbcF\xe0\xf0\xbc\
-R\xd72~\x0b4?\xef\xf5(\xf0\xf3\x01>F?\
-^\x99\x82 \xbd\x09<v\x10c\xafuc\xcey\x99\
-\xfb\xa2\xbc;\xc4\xac\xad \xc8i\x02\x87\xe1t\xbd&\
-\x11\xeb\xdd9{\x13\xe1\xe2\x5c\x1a\xe2\xd6\xe5\xc2\x09\x02\
-\xcf\xc6\x89z\x0d\xa2\xd6\xa5\xb9{\x14\xe1\x22\xad\x04\x97\
-\xf8Q\xe1\xd3\xc2\x11\x02O\xc6\x91\xda\xf3G\xc1\xe5]\
-!\xf0_\x9c\xa9{\xb4Qkk\xaf\xefb\xe1 \x81\
-G\xe3`\xed\xf1f\xe09\xb83\x04\xca\xd9K\xd2\xec\
-\xed\x02F\x08\x82\xb4$\xf0\xdcA\x8c\x9d\xbe\x80\x87K\
-\xf2\xc9\xb2\xee\xbd\xae\x15\xde&p\x13A\x8c\xa7U\xe8\
-,\xbdo\x93,^_\x17^'\xf0\xae9V\xc5\x88\
-\x5c\xe1\xbf\xcd\xe6\xfb\x9c\xcb\xa99\x82 Y\x05\x8e\x18\
-\xc4x\xd26b\x8a\xef\x93{\xa2\xc2rk\xca H\
-6\x81]\xbf\xce\x05\xf6\x0a\x9eW`\x9f\xa0\x08\xec\x1e\
-*\xa1\xc0\xd60\x08l\x153\xa1\xc0v\x11\x08l\x1f\
-1\xa1\xc0\xf6\xf1\x09l\x80\x12\x0a,\x88A`\x1f\xe1\
-\x92\x0a,\x88A`A\x90\x84\x02\x0bb\x10X\x10d\
-\x81m\x8c\xb9\x04\xb6\x8dG`A\x90\xff\xa8\xdd\x04\x09\
-\xa6\x16X\x10\x83\xc0\x82 K|\x07\x99R`A\x0c\
-\x02\x0b\x82,\xf9\x1en\x0a\x81\x051\x08,\x082\xd2\
-*\xea\x98\x02\x0bb\x10X\x10d\xe4}\xcc1\x04\x16\
-\xc4 \xb0 \xc8D\x03\xbc\xec\x12\xc4 \xb0 \x88\x9a\
-\xec\x16\x02\x04n\x22\x08\xd2r5\x1f\xc4 \xb0 H\
-\x8b\xd5M\x10\x83\xc0\x82 -UwA\x0c\x02\x0b\x82\
-\xb4P\xdd\x061\x08<\x1f\x91\x8e\xb7\xcc\x5c\xebC\xce\
-\xe3]\x09\xdc\x08\xd1\x83 QK\x10\x83\xc0\x82 \x09\
-K\x10\x83\xc0a\xc9p\xb6\xcf\x5c\x15\xedl)\x02C\
-\x10d\x07%\x88A`A\x90\xa4%\x88A`A\x10\
-A\x0c\x10X\x10D\x10\x83\xc0\x10\x04\x11\xc4 0\xb2\
-<\x11d'\xd5\xf5\x131\x08\x8c\xacA\x10A\x0c\x02\
-\xa3\xb2R8WC\x0e\x19\x82\x18\xe7\xea\xcf\xec\xda\x11\
-\x18C\x8e'\x82x\x22\x06\x81\x910\x08\x22\x88A`\
-$\x0d\x82\x08b\x10\x18\x09\x83 \x82\x18\x04F\xc2 \
-\x88 \x06\x81\x910\x08\x22\x88A`$\x0d\x82\x08b\
-\x10\x183\xf2\xe6\x1e?V\xffRxG\xff\x08\x8c\x18\
-A\x90\x8f\x0b\x0fv \xee\x83\xfaw\x051\x08\x8c\x80\
-A\x90K\x85\x9b\xf5\xbe\xf6\xef\xf7\xb87\xeb\x9f\x1d\xd0\
-'\x02\x03 0\x00\x02\x03\x04\x06@`\x00\x04\x06@\
-`\x80\xc0\x00\x08\x0c\x80\xc0\x00\x08\x0c\x10\x18\x00\x81\x01\
-\x10\x18 0\x00\x02\x03 0\x00\x02\x03\x04\x06@`\
-\x00\xcb\xe2\x0f[T>\x90\x9cN\xf3\xae\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x1an\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-19T09:45\
-:01+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-19T09:46:03+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-19T09:46:03+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:e08cd\
-77a-b867-7943-b9\
-56-b8298ca47fcf\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:e08cd\
-77a-b867-7943-b9\
-56-b8298ca47fcf\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:e08cd77a-b867\
--7943-b956-b8298\
-ca47fcf\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:e08\
-cd77a-b867-7943-\
-b956-b8298ca47fc\
-f\x22 stEvt:when=\x222\
-023-07-19T09:45:\
-01+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\x0b\x94\xcc\xab\x00\
-\x00\x15&IDATx\xda\xed\x9dy\x90\x96\xd5\x95\
-\xc6m\x10pA\x04\xa3\xb8\xeb\x08\xc9(\xa2\x92\x1a\x17\
-\xa2\x91\x8a\x221\x8eFG\x07\x1c)\xc7\x05\xf7\xc1u\
-D\xab\xe2\xa83\x9a\xa4\xa6fj4\xc4v\x0dY\xaa\
-\x94D\x11D\xc5%\x15\x95Q\x06\xa3RXI\x0d\xc6\
-\x14\xc6\x08\xcd\xa2\x10d\x93\x16\xe8\x06\xa4\xfb7\x7f\xbc\
-\x97\xb1m\x13\xf9\xbe\xef=\xe7\xbe\xdbs\xaa\x9e\xaa\xae\
-\xee\xaf\xbb\xcf=\xf7y\xbe\xef\xbe\xf7\x9es\xee\x0e\xc0\
-\x0e\x82 \x14\x13\x0a\x82 H\xc0\x82 H\xc0\x82 \
-H\xc0\x82 \x01\x0b\x82 \x01\x0b\x82 \x01\x0b\x82 \
-\x01\x0b\x82\x04,\x08\x82\x04,\x08\x82\x04,\x08\x12\xb0\
- \x08\x12\xb0 \x08\x12\xb0 \x08\x12\xb0 H\xc0\x82\
- H\xc0\x82 H\xc0\x82 H\xc0\x82 \x01\x0b9\
-Do`,\xf08\xb0\x00\xf8$`A\xf8\xde\xd8\xf0\
-\x1a\xc5J\x02\x16r\x86\xd1\xc0R\xb6oK\xc3k\x15\
-3\x09X\xc8\x01z\x00\xcd\xd4o\xcd\xe1w\x15C\x09\
-X\xc8\x10\x8d\x88\xb7\xab\x88\x15C\x09X\xc8p\xd9\x9c\
-\xd6\xb4\x9c\x96\x80\x85\x8c6\xacZ\x0c\x04\xbc\x18\xe8\xa3\
-xJ\xc0B\x5c\x8c\xc5\xce\xceS<%`!.\xa6\
-\x1a\x0ax\xaa\xe2)\x01W\x15\x03\x02b\xff\xdf\x16C\
-\x01\xb7T(n\x12\xb0\x04\xcb\x04\xe0U\xa0\xad\x8b\x08\
-\xda\xc2\xf7&D\x22f\xbb\xa1\x80\xdb+\x147\x09\xb8\
-\xa2h\x02\xae\x03Zk\x10Dkxm\x93\xa3?\x9b\
-\x0c\x05\xbc\xa9Bq\x93\x80+\xba\xe3;\xad\x01aL\
-sL]\x5cb(\xe0%\x15\x8a\x9b\x04\x5cALI\
-!\x8e)N>\xcd0\x14\xf0\x8c\x0a\xc5M\x02\xae\x18\
-.7\x10\xc8\xe5\x0e~]b(\xe0q\x15\x8a\x9b\x04\
-\x5c!\xec\x0a\xac0 \xe2\x8a\xf0\xb7\xe4[\xf6\xbeI\
-\xc0\x15\x82>\xe5\xca\x197\x09\xb8\x22\xd0sfy\xe3\
-&\x01W\x00\xda\xe9-o\xdc$\xe0\x0a@g\xad\xe5\
-\x8e\x9b\x04\x5cr\xb4\x19\x12qc\x85\xb2\x9d\x8a\x167\
-\x09\xb8\xa4P\xbeq5\xe3&\x01\x97\x04\xaa\xf8Q\xdc\
-$\xe0\x02C5\xb7\x8a\x9b\x04\x5c`\xa8\xeb\x85\xe2&\
-\x01\x17\x1c\xea;\xa5\xb8I\xc0\x05\x87:?*n\x12\
-p\x81\xa1\xde\xcb\x8a\x9b\x04\x5c\x92e\xa1n?P\xdc\
-$\xe0\x82o\xd0\xe8\xfe!\xc5M\x02\x16\x04A\x02\x16\
-\x04\x09X\x10\x04\x09X\x10\x04\x09\xb8.\xf4\x09\x09\xfb\
-\xbbhB\x85\x1a\xb1K\xe0L\x1f\x098\x1b\xfc\x0d\xf0\
- \xf0\x1e\xd0\xd1\xe5\x18b9\xf0\x18p\x1a\xea-,\
-|\xb6^\xfa\xb4\xc0\x8d\xe5]\xf8\xd2\x118\xf4`\xe0\
-\x94\x04\xec\x8c}\x80\xe95&\x03\xbc\x09\x0c\x13y+\
-\x8fa\x81\x0b\xb5\xd8\xf4\xc01\x09\xd8\x01_\x05\x96\xd5\
-\x99\xd1\xd3\xa6\xc4\x80\xca'\x90\xd4\xdb\x5c`Y\xe0\x9a\
-\x04l\x88\xc1\xc0\xca\x06sj\xb7\x00\xdf\x12\x99+\x87\
-o\x85\xb9o\xc4V\x06\xceI\xc0F\xf9\xb4sRV\
-\xb5|\x08\xec)RW\x06{\x869Ocs\x8a\x90\
-\x8f]\x84\xc98\x1f\x1b\x9b(bW\x06\x13\x8d8s\
-\xbe\x04\x9c\x1es\x8c&\xa3\x15\xd8\xb9$\x04\xdd)l\
-\xce\x9c\x0b\xdc\x06\xfc\x1c\x98\x19b\xf5;`!\xb0\x16\
-\xd8\x1c\xb06|\xefw\xc0\x1b\xe1\xb5\x8f\x00\xb7\x02c\
-\x80\xa3\xc2\xdf,Kl\xd6\x19q\xe6\x0d\x098\x1d\xf6\
-\x06:\xb1\xb3\xd3\x0bJ\xca\xc3\x81k\x80'\x81E\xdd\
-\x8e\xce\xac\xac\x83\xa4\x8b\xc6\xf4\xf0\xbf\x86\x144V\xa7\
-\x1b\xc6\xa43pP\x02n\x10\xa7\x19\x93\xf4\xf6\x82\x90\
-p pE8\xb7\xfc\x13\xd9\xd9r\xe0Q\xe02`\
-\xaf\x82\xc4\xeev\xe3\x18\x9c&\x017\x8e\x8b\x8d'\xe3\
-\xde\x9cg\x94\x9dIrc\xc2\x16\xf2g[\xc3\xd2\xfb\
-\xa2\x9cg\xbd\xddk<\xee\x8b%\xe0\xc6q\xa1\xf1d\
-\xfc0\x87c<\x0e\x98\x04|Dql-\xf0#\xe0\
-\xd8\x1c\xc6\xf3\x1e\xe3\xb1^ \x017\x8eQ\xc6\x93q\
-K\x8e\xc6v\x22\xf0\x1c\xc5\xb7\xd7\xc2\xca!/q\xbd\
-\xc5x|\xa3$\xe0\xc6\xb1\x87\xf1\x86\xcd\xa8\x9c\xbc)\
-\xbdA\xf9\xec\xf5 \xe4\xa6\x12\xbd\xe9w\x04\x0eJ\xc0\
-)\xf0\x8a\xd1d\xac!\xdb\x96-\xc7\x03\xbf\xa1\xfc\xf6\
-&0<\xc38\xf7\x02V\x19\x8d\xe5e\x1d#\xa5\xc7\
-\x99F\x93qgF\xfe\x0f \xe9\xb2\xd8Au\xac\x13\
-\x98\x9c\xe1\xce\xf5w\x8d\xc6\xf1m\x09\xd8\x06/\xa4\x9c\
-\x88E@\xbf\xc8>7\x85\x1d\xdb\x95T\xd7\xd6\x027\
-\x10?%\xb1_\x98\xf34\xf6B\x11\xb4Q\xa42\xc2\
-F'dC\x06K\xba\x83\xc2\xe6\x8e,\xb1W\x81\x03\
-#\xcf\xc1\xf00\xf7\x8d\xbe\xe1\xef#\x01\xdbb\x100\
-\xbf\xce\x89X\x0d\x9c\x94\xc1\x92\x7f\x8d4\xfbg\xe7\x22\
-\xf6\x92\xf4\xa4\xf0\x7f\xeb\xb1\xf9\x81k*'tZ\x1a\
-\xddK\xd2Ox{\xf6\x0cppD\xdfv\x0c\xcf\xd9\
-\x1d\xd2\xea\x17>\x1b7G\xdeL<8pa{\xf6\
-I\xe0V\xbf\x22i\xa2\xa8\x09\xeb\x07\x90\xa4\xcc\xcd\xee\
-\xf2\x8c\xd9\x1avy\xef&~'\x8e\x03\x81\xb9\xd2g\
-\xcd6'\xcca\xec\xce\x1cw\x07\x8e\xb4\x06?V\x06\
-\x0e\xdd\x9e\x81?jj\x97\x13\x0c\xa1\xb6kCd\x9f\
-\xb5e\xc0\x91\xe2\x8f\x04\x9cu\x1a\xe4*i1\xd5.\
-\xf5\xd7\xc5#\x098\xab\x8c\x9f\xf5\xd2`j\xdbHq\
-\xcb<%\xe0\x82\xe2\xfc\x1a7\xd2d\xb5\xd9\x16\x92\xcb\
-\xcd\xc4-\x09\xd8\x1dgH\xbcn\x22\xd6'\xb1\x04\x9c\
-\xdb\xe4\x00\xd9\xf6\xadM\xcf\xc4\x12\xb0\x17\x86\x92\xbf\x04\
-\x8d\x15$)\x7f\xcd\xc0\xd5\xc0)agw\x10I\x0e\
-v\xef\x80\x01\xe1{G\x86\xd7\x8c\x0f\xbf\xf3\x02\xe9\xbb\
-7Z\xdbj\x8a\xdb\xceG\x02\xce)\x0e\x02\xde\xcf\xc9\
-\x86\xcf\xd3\xc0\xf5\xc0\x11\xd8\x94\xee5\x05a_\x0f\xcc\
-\xa0\xfeF\xe8\x1e\xb6\x04\xd8_\xbc\x93\x80\xad\xca\xd3\xb2\
-\xac\xdf\xed \xc9\xab\xbe\x12\xd8-\xc2xw&\xe9v\
-\xf9\x1cI\x1b\x9d\xacl.\xd9\x96\x7fJ\xc0%\xc1\xc4\
-\x8c\x08\xdc\x0e\xdc\x0f\xfcU\x86c?\x84\xe4\xe2\xafM\
-\x19\xc5\xe0\xbf\xc4?\x098\x0d\xce\xc2\xb6\xadm\xad\xcb\
-\xe4\xbb\xc8W5\xcc~\xc0\x0f2X^w\x86]\x7f\
-qQ\x02n(\xbfyud\xc2>\x97\xf1'n-\
-9\xe8OD\x8e\xc9Z\xe2\x16\xa5H\xc0%@\x0f\xe2\
-\xd6\xf3\xb6\x14\xec\x93\xe6,`q\xc4\xf8\xccF\xf7=\
-K\xc0u\xe0\x8a\x88\xe4|*\x1c\xf3\x14\xb1\xb4\xf3\xf1\
-\x88q\xbaD\xbc\x94\x80k\xed\x84\x19\xa3@a\x13I\
-\xbb\x99\xa2\xc7\xeb\xcaH\x9b\x5c\xab\xd1\x0d\x93\x12p\x0d\
-\xf8i$2\x0e/Q\xccN\x88\x94\xe42I\xfc\xcc\
-^\xc0\xc7\x03\xf7\x01\xf3\xc2\x8e+$\xf7\xff\xcc\x04n\
-&\xdb;x\x8e\xc5\xbf\xa3FY\xeb`\x87\x84\x04\x0c\
-\xef3\xf1\xafe8\xc6\xbd\x02Gg\xf2\xe9\x9dU\x1b\
-\x03\x97\xef\x0b\xdc.\xad\x80\x87\x00\xb3j<\xff\xfc>\
-\xf1\xaf\xbbl\xc2\xbfo\xf3|\x0a\xda\xf9\xa1\x8e\x9d\xfb\
-w\x22$x\xc4\x1e\xd7N\x81\x93\xed5\xf87\x8b\x88\
-\xa9\xa0\xb1\x02p\x0e\xf5\x17\x01\xcc%\xee\xd5\x8eg8\
-\x13\xef}\x92\x94\xcc\xb2/\xeb\xf6\x8f\xb0C\x1d\xf3\xc6\
-\xc0\xbd\xa9\xbf]\xd2\x86\xc0\xf9R\x08\xf8t\x1a\xbfm\
-o\x1e\xf1\x9a\x8cy\x1e\x1bU-A\xffp\xe7g\xe2\
-X\x17o\xf7\x0b\x1cl\xc4\xa2\x94Gz\x07`_\x83\
-d\x88\x87#L\xd4\xc9\xce\xbb\xcd_\xa3z\x1b,'\
-8\xefN\x7f#\xc2\x18\x1e6x\xe3\xde\xb7\xc8\x02\xfe\
-\xb1\xd1dy\xef\xd8\xbe\xecH\xb4\xab+\xbcKz\xbd\
-c\x5c_t\xf6\xfdhl\xd2h'\x15U\xc0\x03\x0c\
-\xdf\x81\x7f\xe1\xe8\xe7q\x8e$\x9b\xa6\xa3\x0e\x9et\x8c\
-\xef1\x8e~?j\xe4\xe3f\xe0KE\x14\xb0\xe5\xe5\
-\xdc\xeb\x81\x9eN~Nr\x22W\x0b\xb0\xbb\x04L\x7f\
-\xc7M\xad\x87\x9c|\xee\x89m\xc3\xc2\x0b\x8b(\xe0f\
-\xe3\xc9\x1a\xeat<\xf0\x91\x13\xb9\xbe-\xf1~&w\
-\xda\xc3\xd6\x02}\x1c\xfc\x1dj\xecgs\x11\x05<\xcd\
-8\x08\x1e\x97s\xff\x83\x13\xb1\x9e\x92h?\x87g\x9d\
-b\xfd\xf7\x0e\xbe~\xd3\xd8\xc7\xa9E\x14\xb0u\xd9\xd9\
-\xa9\x0e>>\xe7@\xa8\x8ddS\xfe6\x18\xb8)<\
-\xbb\xcd\x06\xfe\x10\xce#7\x84\xafg\x87\x9f\xdd\x14^\
-\x9bEs\x00\x8fz\xe2\xa7\x1d|=\xd5\xd8\xc7'\x8a\
-(\xe0\x07\x8c\x830\xcc\xd8\xbf\x81)\xce\xa7\xbf\xc8b\
-v\x91\xd8\x9b$C\xe8\xed\x06\xfc|\x1b\xf8\x1eq\x93\
-e<\xba\x9bl\xc6\xbe\xc8a\x98\xb1\x8f\x0f\x14Q\xc0\
-\x97\x19\x06\xa0\x1d\xfb\xfeH\x97;\x90\xa9\x9d8\x9d4\
-v\x05\xbe\xc3\xa7\x97t\xa5\xb1\x0d\xc0\x7f\x12'af\
-?\xa7\xb3a\xebR\xc3\xde\xd4\x966Y\xab]VD\
-\x01\x0f\xc4\xae\x01\xfa\x93\x0e\xfe=\xe6@\xa4\xfb#\x88\
-`4I;Yk\xfb\x93\xd3\xf3dw<\xe4\xe0\xfb\
-d\x07?\x9f2\xf2m\xab\xe7\x9b\xba\xf7dM1\x0a\
-\xc2Hc\xbf\x9a\xf8\xb4\x9a\xc4\xca:\xf0m\x87\xd3\x14\
->u=\xab\xa5:\xc3\xa7q\x0f\xc7q\x0c\xc2\xbe\xcf\
-\xd8\x07\x0e~\x8e4\xf2m\x8a\xa7\xc6bl\xac\xa4=\
-O\x9b\xe1\xe0\xd7\xe1\x0e\xe4\x7f\xd91\x8e\xbb\x10\xb7\x17\
-\xd54\x92\xf6\xb2^\xe3\x99\xed\xe0\xf3\xa1\x0e~\xceH\
-\xe9\xd3z\xef\x0d\xc3\x18\x1b\x17\x17\xa4x\xc7m\x09K\
-qk\x9f\xaeu \xd08\xc7O\xde\x98\xadk\xba>\
-\xb6x\xf5\xa1\xf2\xd8\x7f\x18\xef\xf4\x18\xd8\x92b5s\
-\x81\xb7\xbeb\xed>^\xd5\xc0\xf3\xf0\x1f\x1d\xdf\xbd\xac\
-\xd3\xfb6\xe2\xd7t\xfdN\xb2\xb3\x7fu\x1a\xd3\xee\x0e\
-GJ^G5\x83\x03\x17\xeb\xb1O\x02\xe7KU\xd0\
-\x7f\x22IA{-\xef\x5c?#I\xc1\xf3\xf2eQ\
-\x01\xce\x22\xb7mXuf(\xe0N\xfc\xeaZ\xad\xcf\
-\xe0\x17:\xf2\xa5\x7f\xe0d-s1?p\xbd\x94-\
-uz\x02c\x80\xe9\xc0\xcan\xefX\xf3I\x9a\x87\x1f\
-\xe6\xec\xc3\xce\x0e\x1bA\xd79\xf8\xd9\xd7a\xa3\xad\x11\
-\xfb\xd0iu1\xc1a\x13\xd1\xbb\x8b\xcba\x81\xa3\xf3\
-\xbb\xad(W\x06N\x8f\xc1/g?\x97M\xed\xfa\x92\
-T-\xf5\x8a\xf8?\x8ft \xf9\x11%[:\xc7X\
-J\x0f+\xc8<\xfc%\xf4\x0a\xdc\xed\x9b\xa5\x86\xaa\x98\
-\x93;\xc6\x984+\x1c6{\xf6\xc6\xb6\x1a&\xad}\
-\xec\xb0\x99\xd8\x03\xfb\xf6\xbd\xa3\xab\xc6\xe7*\x0a\xf86\
-c\xd2\xfc\xca\xc1\xc7\xef\x93?\xfb\xae\xc38_4\xf6\
-\xf1V\x09\xb8\xfc\x98lL\x9a{\x1c||;\x87\x02\
-~\xcba\x9c\xf7\x19\xfb\xf8\x88\x04\x5c~X\xbf\xeb[\
-\x9f?~\x99\xfc\xda\xa0\x9c\x9f\xc7\xbf \x01\x97\x1f\xd6\
-\x97u\x9fb\xec\xdf\xcd9\x16\xf0\x8d\xc6c\xb5\xae\xbb\
-}]\x02.?\xac\x97\xa7\xd6\x9dB\xa6\xe4X\xc0\xd6\
-\xbd\xc9\x8e*\xc02_\x02\xce\x19\x16\x19\x93\xe6`c\
-\xff\xfe'\xc7\x02\x9ee<\xd6C\x8c\xfd[$\x01\x97\
-\x1f\xd6\x97v[w\x1cl\xc9\xb1\x80\xff`<\xd6=\
-\x8d\xfd[-\x01\x97\x1f\x9b\x8dIc\xddh\xa0-\xc7\
-\x02\xfe\xd8x\xac}\x8c\xfd\xdb$\x01K\xc0\x12\xb0\x04\
-,\x01k\x09\xad%\xb4\x96\xd0\x12p\x116\xb1\xac\xbb\
-p\xe4y\x13\xcb\xbai\x81\xf5&V\x8b\x04\xacc\xa4\
-z\xcd:\x81\xfe\xb1\x1c\x0b\xd8\xba\xf7\x94\x8e\x91$\xe0\
-\xcc\x139\xac\x1b\xceO\xc8\xb1\x80\xad\x139\xac\xfb/\
-\xbf&\x01+\x95\xb2^\xbb\xc6\xd8\xbf\xc19\x16\xb0u\
-*\xe5u\xc6\xfe\xfdJ\x02V1C\xbd\xe6q\xef\x8d\
-\x8a\x19\x1a\xb3\x87%\xe0\xf2\xe3vc\xd2x$\xd0\x7f\
-/\x87\x02\xbe\xd3a\x9c/\x19\xfb\xa8r\xc2\x0a\xe0\x5c\
-c\xd2|\x88\x0a\xfaU\xd0/\x01G\xc3Q\x0e\x04?\
-\xd2\xc1\xcf;r$\xe0\xdb\x1d\xc6\xf7U\x07?\x87J\
-\xc0\xfe8><\xfb\xcc#i\xc7\x0aI\xf3\xb6\x99$\
-\xa5t{9\xff\x7f\x8f\xa6v\xd7;\xf8\x99\x97\xa6v\
-\xcbH\xeeb\xca{S\xbb\xad\xf87\xb5\xdb+pt\
-f\x97\xb9\xd9\x18\xb8|_\xe0vi\x05<\x84\xa4\x9a\
-e{\xd6N\xd2R\xc6s2\x16\x19\x93g\x86\x93\x9f\
-\xe7\x90}[\xd9\xbfs\x1a\xdb\xf3\xc6\xbe.p\xe4\xcb\
-N\x81\x93\xb5\x5cx6+p\xbdT\x02>\x87\xe4\x16\
-\xbczl.~W_N7&\xcfF\xfcn\xf7\xfb\
-\xb7\x0c\x05\xec\xd5\xd8\xbd?\xb6\xb7\xffAr\x1d\x8c\x87\
-\xaf{\x07.\xd6c\x1b\xf0\xeb\xa7\x1d]\xc0\xa7\xd3\xf8\
-=\xbc\xf3\x9c\x84q\x8d\x03\xd9/q\x8a_\x13\xd9\x14\
-\xf9{^\xadr\x85\x83\xbf\xff\xe4\xe0g\xbf\xc0\xc1F\
-lK\xe0~\xa1\x05\xbc/\xe9\x8b\x07<\xce\xf6<.\
-7{\xc5\xf9\xb9=\xe6\xe5f\x8f\xe3{\xb9\xd9\xab\x0e\
->\xff\xb5\x83\x9f\x0f\xa7\xf4iu\xd0@a\x05\xfcc\
-\xa3\xc9\x19\xee\xf0\xa9\xb6\xdc\x98@\x1d\xd8g*u\xf7\
-9\xd6\xf5\xa2M\x8e\xe3\x18\xec\xf0\x5c\xff\xbe\x83\x9fG\
-\x1b\xf99\xa9\xa8\x02\x1e\x80\xddm\xec\xbfp\xf0\xefQ\
-\x07\x01<\x10i?a\xb9\x83\xef\xcb\x1d7\xac\xbab\
-\x92\x83\xef\x8f\xe4\x98\x1f\x9b\xb1/9\x8d\x22\xe0\x0b\x0d\
-'h=\xf6w\xce\x5c\xe6@\xa4v`\xbf\x08\x22\xd8\
-%|\x1a\xaf3\xf0yC\xf8\xd4\xdd-\x82\xdf\x07\x18\
-\xbe\xa9w\xb5\x8b\x8d\xfd\xec\x89m\x22\xcd\x85E\x14p\
-\xb3\xf1$Y\x1f\xd2\xef\x95bs\xed\x8b\xec\xee\x88G\
-s\x03InLx\xab\x01?\xdf\x22I\x8f\x1c\x18\xd1\
-\xdf{\x1c\xe2\xed\xf1\x097\xd4\xd8\xc7\xe6\x22\x0ax\x9a\
-q\x10F9\xf8\xf8\x8c\x03\xa1\xda\xb0/\xf2\xaf\x05\x83\
-H\x92#~\x1e6\xd4\xde\x09\x9f\x22\xeb\xc3\xd7\xb3\xc2\
-\xcf\xfe\x99\xa4\x90>\xb6\x7f\x83\x1d\x8e\x8e\x00\x9er\xf0\
-\xd5\xba_\xf5\xd4\x22\x0a\xd8z\xd7\xf4T\x07\x1f\xcf\xc5\
-\xc7\x9e\xc9@ y\xc7\xf3N\xb1>\xdb\xc1W\xeb:\
-\xe5'\x8a(\xe0\x07\x8c\x830\xcc\xc1\xc7\xde\xd8\xf7\xc8\
-\xdafgJ\xb4\x9f\xd9x\xf3\xb05$\x8d\xf1\xac\xfd\
-\x1dV\x94\xcdM\xcfI\xb3\xdc$j\xc7\xbe\xfb\xe36\
-\xfc\xc8\x89\x5c\x8bI2\x8e\xaa.\xde\x01\xc0R\xa7\x18\
-?\xe8\xe4so\xe3\xe5\xfeeE\x14\xf0@>{\x8b\
-y\x1a{\xd2\xd1\xcfc\x1d\xcfU\xa7W\x5c\xbcM$\
-y\xe2^v\xb4\xa3\xefO\x19\xf9\xb8\x15\xd8\xa7\x88\x02\
-\xde\x01\xbb\x14\xc0\x91\xce~\xcet$\xd9\xb5\x15\x16\xf0\
-\x8d\x8eq\xf5\xbe\x89p\xa4\x91\x9fS<\xfd\x8c\xb1\xf3\
-\x98\xf6<mF\x04\xa2\x9d\xe4H\xb4M\xc0\x09\x15\x14\
-\xef\x08\xec\x9b\xe8w\xb5\x11\x11\xc6\x90v\xf5\xb0>h\
-\xa0\xd0\xc5\x0c\x17\xd0xJZK\xc4s\xca_;\x92\
-m\x1dI#\x81\xaa\x88wh\xd8`\xf2\xb2\xd9\x11\xcf\
-\xd9\x1bm\xb4\xdf\x19\xb8_\x8ar\xc2\xab\x1ax\x1e\xfe\
-\xa3\xf7\xbbW7\xfc-\xbe\xf6\x01\xf67\x19\xe6\x11\x07\
-\x00K\x9ccyj\xc4\xf1\x0c\x0e\x5c\xac\xc7>\x09\x9c\
-/UA\xff\x89\xc0\xfc\x1a\xdf\xb9~\x96\xd1\x0e\xee\x9b\
-\xce\xc4{\x078\xb0\xc4\xe2=\x08x\xd79\x86s2\
-\x18W\xff\xc0\xc9ZV\x92\xf3\x03\xd7K\xd9R\xa7'\
-0&\xec\xce\xae\xec\xf6\x8e5\x1f\xf8\x01pX\x86\x04\
-<\x06\xdfj\x1fH\x8a\x06\xca\xb8\x9c>\xdc\xf1\xb8h\
-\x9bu`_\x99V\x0f\x0e\x0b\x1c\x9d\xdfmE\xb92\
-pz\x0c\xf69\xfb\xb9nj\xd77\x9c\x13\xf6\xca\x11\
-\x11'\xe1okJ\xb6\xb15\x02X\x1b!n\x0f\xe5\
-h\xcc\xbd\x02w\xfbf\xe9\x87\xb2\x84>\x8f=\xba\xad\
-\x0e\xbcl\x0bIEQS\xc1\xe3u\xa5\xf3n\xf36\
-[\x8dcY^Q\xa1 \xc4+5\xfc\xa2c\xb2\x01\
-\x05\x8cQ?\xec\x0bV\xbe\xc8\xc6\x89\x97\x12p=\x19\
-D\xb3#\x92s1pV\x81\xe2sv\x84\x9d\xe6\xae\
-6\xab\x04+\x15\x098\x83\xe3\x90U\xc4\xb5\xe7\xc8\xa6\
-\xd4\xaf\x9e\x92\xc5\xe7#\xc7dM\xd8\xdd\x16'%\xe0\
-\xbaq\x06\xf1\xfb2o\x04&\x12\xa7\xb3G\xad\xd8\x9f\
-\xa4\x18\xbf-r,:\xc2\xf9\xbc\xb8(\x017\x8c\xbb\
-\xc8\xc66\x91T\xdb\x0c\xcap\xec\x83I\xaa\xb56e\
-\x14\x83\xff\x10\xff$\xe0\xb4\xd8\x91\xe4\xe2\xe8,\xed7\
-\xc0\x0d\x91vaw\x07.\x22)\xf0\xc8\xf2V\x889\
-9;^\x94\x80\x0b\xfe<\xbc\x94\xec\xad-<'\xdf\
-\x18\x92A,6vz\x90\x5c46!<\xdf\xb6\xe7\
-`\x9c\x8bs\xf6\x08!\x01\x97\x00C\xf0\xeb\xde\xd1\xa8\
-\xad$\xb9c\xf7>\x92\xdb&\xbeI\xd2MbP8\
-\xcf\xee\x1d\xb0G\xf8\xde0\x92<\xe2k\x81\xfb\xc3\xef\
-\xae\xca\xd9\x98V\x01\x87\x8ao\x12\xb0\x07\x8e#_\xf7\
-\xf6\x96\xcd6R\xcd\xd2K\x098\x22FE\xca<\xaa\
-\x9am\x01N\x13\xbf$\xe0\x18\x18\x8bOO\xe9*\x8b\
-\xf7<\xf1J\x02\x8e\xfdI\xfc\xb1\xb4\x97\xda6\xe8\xac\
-W\x02\xce\x0a\xc7\x12\xa7\xf0\xa1\xacV\xb6\xaa,\x09\xb8\
-\x808\x8c\xb8y\xc1e\xb1\xc5\xdam\xae\xae\x80w\x03\
-.%\xe9\xf87\x0fXHRd\xfdl8\xcf\x8c}\
-\x86\xb8?\xf0\x864Y\xb3\xfd:\x839\xda/p\xe3\
-\xd9\xc0\x95\x85\x81;S\x02\x97v\x93\x80\xe3\x14Q\xdf\
-\x02\xb4\xd6\xb0)\xf2\x10q\xcb\xf4v$\xb9,\xacC\
-\xfa\xfc\x8b\xd6Ir\xd1W\xcc\x0c\xab\x01\x81\x0b\xdb\xdb\
-tl\x0d\xdc\xea%\x01\xfbu\x08\xac7\xa5q1\xf1\
-\xdb\xd7\x8c\x02VH\xab\x9f\xb3U\xc0\xe9\x91\xe7\xe2\xa8\
-\xc0\x81z\xec5\xe2\xde\xd8X\x09\x01\xf7\xa7\xb1+4\
-\xb7\x11gHd\x7f\x0f$n=q\xde\xed\x95\xf0\x98\
-\x11;s\xae\xd1,\xb3\xb7(\xc8\xb58E\x11p\xda\
-\x1b\x1e\xde\x06v\x8a\xecs\x13IQ\xc0\x87\x15\xdfe\
-\xbe\x81$\xdf:f\xecw\x0as\x9e\xc6\xa6H\xc0v\
-\x0d\xd3,\xec\xa6\x8c\xfc\x1f\x10\x9e\xfb\xb6VH\xb8\x1d\
-\xc0d`\xcf\x8cb~\xb3\xd18N\x96\x80\xd3\xc3\xaa\
-\x03\xc42\x22\xb7\xfc\xec\x86\xe1\xc0\xdc\x0a\x88w\x0eI\
-{\xde\xac\xe2\xdc3\xcc\xb5\x85=/\x01\xa7o\x9cf\
-\x99\xb28\x22\x07c:\x11\xf8\xef\x12\x0a\xf75\x92;\
-\x91\xb3\xee]5\xc2pL[\x02\x07%\xe0\x06q\x92\
-1\xc9n\xce\xd1\xd8N$\xa9\xed\xed,\x81pO\xc9\
-Q\x5co6\x1e\xdfI\x12p\xe3\xb8\xc0x2~\x98\
-\xc31\x1e\x13\xce)\xd7\x16H\xb4kH\xda\xfd\x1c\x9d\
-\xc3x\xdec<\xd6\x7f\x94\x80\x1b\xc78\xe3\xc9\xb8?\
-\xc7c\xed\x13\x96\xa0\xd3\xc8g\xb9\xe2\xe6\xb0b\xb8\x08\
-\xd89\xc7q\xbc\xdfx\xdc\xe3$\xe0t]!-\xed\
-\x8e\x82\x1c\x9b}\x09\xb8$\xec\xe4.\xcbP\xb4\x1f\x04\
-\x1f\xc6\x91t\xf5(B\xec\xee0\x8e\xc1\x19\x12p\xba\
-^T\x96vvAH\xd8\x1d\x87\x02\xe3\x81'Hr\
-x=\x8e\xa4\xb6\x02\x0b\xc2\xff\x18Oq\x0b\x0d\xce6\
-\x8e\xcb\x01\x12p:\xcc3\x9a\x88v\x92\x8e\x8be\xa8\
-B\xe9\x03\x1c\x01\x8c\x06n\x05\x1e\x06^\x04^'\xc9\
-\x22Z\x18\x9eS7\x07\xac\x09\xdf{+\xbc\xe6\xc5\xf0\
-;\xff\x12\xfe\xc6\x11\xe1o\x96!6\xbb\x91\xb4\xe6\xb1\
-\xb0\xff\xd51Rz\x5ce4\x19?)\x09A\x85\xed\
-\xe3'F\x9c\xb9J\x02\xb6\xa9@\xfa}\xca\x89h\xa5\
-\xdc\x17k\x0b\x9f\xcfEoM\xc9\x99\xdfS\x80\xca\xa4\
-\xa2L\xc80\x1a\xef\x06\xd9I\xd2\xc3J\xc4\xae^\xdf\
-\xb2F\xcf\xd8\xd7\x07\xce)\x17\xda\x10'\x03\xeb\x1a\xd8\
-\x98\x19/2W\x16\xe3\x1b\xd8\xf0[G\x01r\xa0\x8b\
-(\xe0m\xbb\xb1\xb5\xd6\x04/\x00F\x8a\xc4\x95\xc7\xc8\
-\xc0\x85Z\xb3\xca\x0a\xb5\xfb^\xc4\x09i\x0agsO\
-\xf3\xf9\xae\x90\x9bIjO/-\xd1\xae\xaa`\xb3k\
-\x7fi\xe0F\xf7$\x99\x8f\x03\x97\xce\xa0\x80w\x10\x17\
-}bz\x90\xdc\x1d{4\xf0\x15t\x19\x96P\xdb\xa6\
-\xe8W\x02g\x0e\x22~\xad\xb2\x04,\x08\x82\x04,\x08\
-\x12\xb0 \x08\x12\xb0 \x08\x12p4|\x03\x98\x08\xbc\
-\x1ar\x8c\x17\x86\xaf'\x86\x9f)F\x8a\x9b\x04\x9cC\
-|\x1d\xf8m\x0d\xe7\x89\xbf\x0d\xafU\xcc\x147\x098\
-'\xf8\x0e\xf5\xdd\xba\xd0\x11~GqS\xdc$\xe0\x8c\
-q[\x8a\xa4\xf8\xdb\x147\xc5M\x02\xce\x0e\xa7\x90\xee\
-\xbe\xa3\x0e\xf2\xd5\xf4Mq\x93\x80+\x83\x9e$7\xd9\
-\xa5\xb5wI.?S\xdc\x147\x098\x22\xce\xc2\xce\
-\xceR\xdc\x147\x098.&\x1b\x12q\xb2\xe2\xa6\xb8\
-I\xc0q\xf1\xae!\x11\xdfU\xdc\x147\x098.\xda\
-\x0c\x89\xb81\x82\xbf\xbdI:Q<NR\x03\xfbI\
-\xc0\x82\xf0\xbd\xb1\xe15\x8a\x9b\x04\x5c\x09X6X\xdf\
-\xec\xec\xebh`i\x0d~,\x0d\xafU\xdc$\xe0\xd2\
-\xc3\xb2\xa9\xfa2'\x1f{\x90\x5c_Z\xaf5\xe3W\
-\x0b[\x84\xb8I\xc0\x15\xc0/\x0d\x89\xf8K'\x1f\x9b\
-S\xf8\xd4\x5c\xe1\xb8I\xc0\x15\xc0\xd5\x86D\xf4h\xae\
-7\xda\xc0\xaf\xd1\x15\x8c\x9b\x04\x5c\x11\x0c\x00>2 \
-\xe1G\xe1oYoX\xb5\x18\xf8\xb6\x18\xfb\xfeay\
-\x8e\x9b\x04\x5c1X\xdc7\xebq/\xf1X\xc3O\xb9\
-\xf3*\x147\x09\xb8b\xe8\x01\xbc\x94\x82\x84/9m\
-\x16M5\x14\xf0\xd4\x0a\xc5M\x02\xae \xfa\x02\xb3\x1a\
- \xe1\xac\xf0\xbb\x1e>\xb5\x18\x0a\xb8\xa5Bq\x93\x80\
-+\x8a^\xc0\xbf\x03[j \xe0\x96\xf0Z\xcf6\xb7\
-\xed\x86\x02n\xafP\xdc$\xe0\x8a\xe3\x10\xe0.\xe0\xbd\
-?C\xc0\xf7\xc2\xcf\x0e\x89\xe0\xc7&C\x01o\xaaP\
-\xdc$`\xe1\xff\xd1\x9f\xe4\x12\xaca\xe1\xeb\x98\xff{\
-\x89\xa1\x80\x97T(n\x12\xb0\x90\x0b\xcc0\x14\xf0\x0c\
-\xc5S\x02\x16\xe2\xe2\x12C\x01\x8fS<%`!.\
-v\x05V\x18\x88wE\xf8[\x8a\xa9\x04,D\xc6\xe5\
-\x06\x02\xbe\x5cq\x94\x80\x85\xec0%\x85x\xa7(~\
-\x12\xb0\x90-z\x03\xd3\x1a\x10\xef4\xe2\x14\xf7\x0b\x12\
-\xb0\xb0\x1d4\x01\xd7\x01\xad5\x08\xb75\xbc\xb6Iq\
-\x93\x80\x85\xfcUOM \xb9o\xa8k[\x9b\xb6\xf0\
-\xbd\x09\xa8\xbaG\x02\x16\x0a%h\x09V\x02\x16\x04A\
-\x02\x16\x04A\x02\x16\x04A\x02\x16\x04\x09X\x10\x04\x09\
-X\x10\x04\x09X\x10$`A\x10$`A\x10$`\
-A\x10$`A\x90\x80\x05A\x90\x80\x05A\x90\x80\x05\
-A\x02V\x10\x04A\x02\x16\x04A\x02\x16\x04A\x02\x16\
-\x04\x09X\x10\x84\xbc\xe3\xff\x00\x9d\x12\xf7\xc0=G7\
- \x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x13\xb0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:08:58+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:08:58+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:d463f\
-333-9f4f-7f45-b4\
-b9-0574a0eb9611\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:d463f\
-333-9f4f-7f45-b4\
-b9-0574a0eb9611\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:d463f333-9f4f\
--7f45-b4b9-0574a\
-0eb9611\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:d46\
-3f333-9f4f-7f45-\
-b4b9-0574a0eb961\
-1\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\x19\xb2\x22\x9b\x00\
-\x00\x0ehIDATx\xda\xed\x9dk\xb0^\xd3\x19\
-\x80\x09\x12\xe2\x96j\x85\xb8\xb4\x12\x97\xb8\xb4U\x8a\x14\
-\x11\xb4(\xda\xd2&A\x8a\xa1e\xa4\x94\xd0\x9aN\xa7\
-e::\xd3\x99\x8e\xd2\xa9Qi\xea\xae.!)\xd3\
-\xd1\xa2D\x8a\xa4\xae\x9d\x9625\xc6\xb4D\xa4.C\
-\x9aD\x90\xeb\x91\xf3\xf4\xc7\xde!\x139r\xbe\xef\xac\
-\xb5\xf7\xfe\xd6z\xde\x99g\xc6Dr\xce:\xef\xfb>\
-\xe7\xdb{\xaf\xcb^\x07XGD:\x13\x93 \xa2\xc0\
-\x22\xa2\xc0\x22\xa2\xc0\x22\x0a,\x22\x0a,\x22\x0a,\x22\
-\x0a,\xa2\xc0\x22\xa2\xc0\x22\xa2\xc0\x22\x0a,\x22\x0a,\
-\x22\x0a,\x22\x0a,\xa2\xc0\x22\xa2\xc0\x22\xa2\xc0\x22\xa2\
-\xc0\x22\x0a,\x0d\xa4?0\x0e\x98\x02\xbc\x00t\x95\xbc\
-P\xfe\xd9\xb8\xf2\xef\x98+\x05\x96\x861\x06\x98\xc3\xda\
-cN\xf9w\xcd\x99\x02K\x03\xe8\x07\x5cN\xebqy\
-\xf9o\xcd\xa1\x02K\x8d\xb4#\xef\xaa\x12\x9bC\x05\x96\
-\x1a/\x9b\xfb\x1a^N+\xb0\xd4\xf4\xc0jV\x00\x81\
-g\x03\x03\xcc\xa7\x02K\xb5\x8c#\x5c\x9c`>\x15X\
-\xaaej@\x81\xa7\x9aO\x05\x96j\x99\x15P\xe0Y\
-\xe6S\x81\xa5Z\x96\x04\x14x\x89\xf9T`\xa9\x96\xd0\
-aN\x15X\x14X\x14X\x14X\x14X\x81\x15X\x81\
-E\x81E\x81E\x81E\x81E\x81E\x81\x15X\x81\x15\
-X\x14X\x14X\x14X\x148?\x16\x07\x94w\x91\xf9\
-T`q3\x83(\xb0\xf4\x12\xb7\x13\x8a\x02w0n\
-\xe8\x17\x05\xee`<RG\x14\xb8\xc3\xf1P;\x05N\
-\xeeS)\xb77\x13x\xacl\xc6\xf5O\xed\xd3(\xc7\
-7\x13x\xb0{\xc6\xf5\xb7\x81m`\xeb\xaf\xc0\x1d{\
-\x09ycb\x12\xe7v\x09\xd9\xaf\xaca\xb6\xb7\x10>\
-\xc4IO\xe2\x5c\xe8\xab\xbcI<\xc4s\x1a\xa5\x88\xdb\
-\x80\xf5\x95\xa2\xa3\xe4\xfd]\xa0\xdaw\xf44\x9a\x0b\x19\
-\x948gy;~!\x8bK\x09\xbd\x9c\xce\xf1\xb29\
-\x99\xa5\xa4.\xe6W\xe2\xdc\xe5\x85\x0e\xde\xcc\xe1v:\
-%\xce]^\xca^R\xe0\x84\x04Nq\x95R\xaeS\
-\x85\x0a\x9c\xd9%\xb4\xeb\x84\xd3\x9b*\xf4\x12:\x93\x87\
-XIM1$\xc0\x80\xb2\x06\xb1\xc3\x87X\x09L#\
-%7\xc5\x90\x00\xd68a\x81s\xfe\xed\xbc\x19p\x10\
-p\x0a\xf0\x13\xe0Z\xe0~\xe0\x19\xe0E\xe0u`>\
-\xb0\x02x\xaf\xfc\xef\xd7\xca\xff\xf740\x0d\xb8\xa6\xfc\
-\xb7\xa7\x00#\xcb\xaf\xe9U\x96\x02{\x7f\x14\xe1\x09\xec\
-\x08\xe0|`2\xf0|)f\xe8XQ~\xed\xc9\xe5\
-\xf7\x1a\xd1\x80'\xf1>\xe7p3CG>\xa1\xdc\x12\
-8\xb9\x94i.\xf5\xc5\xdcr\x0c'\x97cr\xa6A\
-\x81\x9d#\xec\x81\x0d\x81\xe3\x80\xbb(v\x105-V\
-\x00\xd3\xcbK\xee\x8d\x9d\xebW`W\xe9\x14\xec\x0d\x5c\
-\x07,\xa4s\xe2-\xe0j`\xaf\x0e\xbd\x84Nf\xa1\
-\x8e\xabu\xea{\x885\xb2\xfc\xb4\xed\xa6\xb3\xe3\x11\xe0\
-k\xc0\xba\x1d\xf2\x10+\xa9Uv\xeeT\xa9~\x8aa\
-4\xf0O\xd2\x8b'\x81\xaf7|\x1a\xe96`\xbd\x94\
-z\xde\xedf\xd5M1\xec\x03\xcc$\xfdx\x1c8 \
-P\xceB\xef\xf9^/\xb5~w\xf1{\xfc)\x86\xed\
-\x81[\x13\xb8Tn%\xba\x81\x9b\x81\xed\x1a2U\x98\
-\xec\xe6\x14w\xb0\xc4\x9db8\x8eb\x11E\xae\xb1\x10\
-\x18\x1f\xe0\xfe\xd8s\xcf2\x14\xb8\xce\x13\x0b\xb7)\x1f\
-P\x19EL\x03>\xd9\x81uT\xe0\x86P\xe5\x91\xab\
-'v\xd8\x94P\x95\x9f\xc6\xe3:\xa8\x8e\x0a\xdc0b\
-\x1f\xb9\xba>p\xb1\x9e\xae5\xae\xeac\x9es|\xfb\
-\x86\x02Gf[\xe0Q\xddli\xeex\x1b\xfbF\x81\
-\x9b\xc0^\x14\xbb\x7f\x8c\xd6\xe25`O\xfbG\x81\xeb\
-\xe4`\x8ae\x85F{\xb1\x00\x18e\x1f)p\x1d\x1c\
-K\xfc\xdd29\xc4R`\xac\xfd\xa4\xc0Ur\x12\xc5\
-Fy#Lt\xe1\xc9'\x0a\x5c\x11\xc7\xd0\xcc\xed~\
-\x9d\x1e\xcb\x81\xaf\xda_\x0a\x1c\x93/\x02Kt-Z\
-,\x06\x0e\xb1\xcf\x148\x06\xfb\x01\xef4\xac\xe1\xe7Q\
-\x9c\x85u1\xc5\x92\xc5#\x81\xdd\x80\xad\x81\x8fQ\xac\
-B\xeaW\xfe\xf7\xd6\xc0\xee\xe5\xdf\x19_\xfe\x9b\xe94\
-o\xa9\xe7B\x8a=\xd2\xf6\x9c\x02\x07c\x08\xf0j\x03\
-\x9a{\x11p\x0fp\x0e\xb0K\xc0\x9fo80\x01\xf8\
-s\xf9=\xea\x8e9\xc0V\xf6\x9d\x02\x87`\x03\xe0\xaf\
-56\xf3\x8ar\xe1\xc3x`\xd3\x0a~\xde\x8d\xf8\xe0\
-h\x9f:\x1f\xd4=JF+\xaa\x148\x1eW\xd6\xf8\
-i;\x11\x18V\xe3\xcf\xbe#0\xa9\xc6\xe9\xb2\x89\xf6\
-\x9f\x02\xf7\x85Sj\x9a\x17\xbd\x84zN\x81\xec\x89\xc1\
-\xc0\xa5\xe5\xd8\xaa\x8e\x13\xedC\x05nw#~\xd5\xab\
-\xac\xa6\x00;48'C\xa9\xe6\xb0\xf5Uc>\xc5\
-Zs{R\x81{\xcd\xba\xc0}\x156\xe9\xeb\x14+\
-\xbb:%?G\xd2\xbbm}\xa1\xe2~\xe2\x1c\x9a\xa7\
-\xc0\x89rN\x85\xcdy\x0b0\xa8\x03s4\xa8\x1c{\
-U1\xde\xbeT\xe0\xden\x0d|\xb7\xa2{\xdd\xb3\x12\
-\xc8\xd7\xd9\xc0\xb2\x0a\xf2\xf5v9\x97m\x8f*\xf0G\
-rS\x05\xcd\xf8\x06\xc5\xbb\x87R\xc9\xd9\xfe\xc0\x9b\x15\
-\xe4\xedz\xfbS\x81?\x8a\xcf\x13\xe7\xc5a\xab\xc6K\
-\x81\x17a4\x85\x1d)N\xc5\x88='\xbe\xaf}\xaa\
-\xc0==\xb8\x8a}\xaa\xc6s\x14\xab\xbaR\xbe\xfdx\
->r\x0e\x1f\xf6\x81\x96\x02\xaf\x89\xd1\x91\x1boV&\
-\xd3!\xdb\x03/G\xce\xe5\xb1\xf6\xab\x02\xaf\xce\xdf#\
-O\x13\xed\x98Q.w)\xef\xf3c\xc5\x13\xf6\xab\x02\
-\xaf\xca\xe1\x11\x9bm9pP\x869= \xf2\xd3\xe9\
-C\xed[\x05^\xc9\x83\x11\x1b\xed\x8c\x8c\xf3zV\xe4\
-\xc5\x1d\x0al\x12\xd8'b\x93\xddl~\x99\x1c1\xbf\
-{+\xb0\x0d\x16k\xb7\xd1+\x14\x1b\xe9s\xcf\xef \
-\xe2-\xbb\xfc\x8d\x02\xe7\x9d\x80\x8d(\x8e6\x0d\x1d\xdd\
-\xe5}\xb5\xbf \x0b\x8e\x8a$\xf0|`C\x05\xce\x97\
-oFj\xac)J\xfb!\xfe\x10)\xd7'(p\xbe\
-L\x8b\xd0PKh\xf6\x96\xc0\xba\x18F\x9c\xfd\xc4\xf7\
-)p\x9elA\x9c#c~\xa1\xac=\xf2\xcb\x08\xf9\
-~\xaf\xac\xa5\x02g\xc6\x89\x91>}\x87(j\x8fl\
-E\x9c\xe3y\xc6)p~\xc4\xd8\xcbz\x85\x92\xae\x95\
-\xdfF\xc8\xfb\x8d\x0a\x9c\x17\xeb\x01s#<y\x1e\xa6\
-\xa0ke\xa72W!\xe3\x0d\x8a\xf3\xaf\x158\x13F\
-D\xf8\x14xH9{\xcd\x8c\x08\xf9\xdfW\x81\xf3\xe1\
-\xfb\x11\x1a\xe8T\xc5\xec5\xdf\x8e\x90\xff\x09\x0a\xec\xf2\
-\xbe\xbe<\xbc\xdaD1{\xcd&\x84\x7f\xc7\xd4M\x0a\
-\x9c\x0f\xff\x09\xdc<\xf7*e\xcb\x84>\xf5\xf39\x05\
-\xce\x83\xcd#<D9G![\xe6\xbc\xc05X\x01\
-l\xa6\xc0q\xe8_\xce\xd5M\xa187\xa9\x95\xf7\xeb\
-v\x95\xfffJ\xf95\xfa\xfa\xbe\x9cQ\x11\xee\xbfv\
-V\xc8\x96\xd95B\x1d\x0eL\xa8O\x1b#\xf0\x18\xc2\
-\xeeF\x99S~\xcdv\xc7sj\xe0\xa6\x99\x87g4\
-\xb5{\x06\xd9\x82\xc0\xb58)\xa1>\xad]\xe0~\xc0\
-\xe5\xc4\x8b\xcb\xdb\x9c\xfb\xbb(\xf08\xa6)c\xdb<\
-\x10\xb8\x16\x17&\xd4\xa7\xb5\x0b\x1c3)\xab&\xa7\xd5\
-q]\x1fx\x0c\x17+b\xdb\x5c\x1a\xb8\x16W'\xd4\
-\xa7\xb5\x0a<\x86\xea\xa2\xd5\xcb\x94\xd0\xc7\xe7\x9c\xa1\x88\
-msf\xe0Z\xdc\x9fP\x9f\xd6&p\x7f\x8a#T\
-\xab\x8a\xd9\xc0\x80\x16\xc6\xf7\xaf\xc0\xdf\xdf\x8d\xfb\xcd\xd9\
-\xe8\xffTB}Z\x9b\xc0\xe3\xa8>Z\xd9\xd4\x1d\xba\
-h\xc3\x15\xb1m\xf6\x08\x5c\x8b\x7f'\xd4\xa7\xb5\x09<\
-\xb5\x86\xc4Lma|\xa1\xdf\xe13X\x11\xdbf\xdb\
-\xc0\xb5x5\xa1>\xadM\xe0Y5$fV\x0b\xe3\
-[\x14\xf8{o\xac\x88}:\xf0.d,L\xa8O\
-k\x13xI\x0d\x89Y\xd2\xc2\xf8B\xaf\xc2\xea\xa7\x88\
-m\xb3A\xe0Zt%\xd4\xa7\xb5\x09\xbc\xb8\x86\xc4,\
-ja|]\x81\xbf\xf7\xfa\x8a\xd86\x1b\x06\xae\xc5\xe2\
-\x84\xfa\xd4K\xe8\x1ex;\xf0\xf7v\x17Rs.\xa1\
-\xe7{\x09\xedC\xacVcKEl\x9b\xad\x03\xd7\xe2\
-5\x1fb\xa5?\x8d\x14\xfa-\x01\xbb+b\xdb\xec\x19\
-\xb8\x16/:\x8d\x94\xfeB\x8eg\x03\x7f\xff#\x14\xb1\
-m\x8e\x0e\x5c\x8b\xa7\x13\xeaS\x97RR\xcdF\xf2\xd3\
-\x14\xb1m\xc6\x07\xae\xc5\xdd\x09\xf5\xa9\x9b\x19z\xe0\xda\
-\xc0c\xb8D\x11\xdb\xe6\xb2\xc0\xb5\x98\x94P\x9f\xba\x9d\
-\xb0\x07~\x1ax\x1c\xd3\x15\xb1mf\x06\xae\xc5\x05\x09\
-\xf5\xa9\x1b\xfa{\xe0\xf4\xc0\x05\x9a\xab\x88\x8d\xd9\xd0\x7f\
-jB}\xea\x91:=p@\x84\xdf\xb2\xbb*d\xcb\
-|&B\x1d\xf6M\xa8O=\xd4\xae\x076\xa68\x00\
--dLP\xc8\xda\xcf\xe6~\x0f\x18\x98[\x1esm\
-\x9e\xe7\x037\xcf]\x0a\xd92\xf7\x04\xae\xc1\xb39\xe6\
-1\xd7\xe6\x99\x12\xb8y\x96P\x1cW\xab\x98\xbdc3\
-\xc2\xafE\xf6`\xf7\x8c\xf8A\x84\xfb\xafo)f\xaf\
-9-B\xfe\xcfS\xe0|\xd8+B\x039\x9dT\xdf\
-\xb9d\x94\x0f\xc5\x148\xa3)\x8c7\x027P7\xb0\
-\x9br\xae\x95\xe1\x84\xdf\x93\xfd:\x99\x9e\xcd\x9ds#\
-\xdd\x16\xe1S`\x92\x82\xae\x95\xab#\xe4\xfd\xa6\x5c\xf3\
-\x99s#\xc5x\xc5\xe5\x22\xe0\x13J\xda#\x83\x89\xb3\
-\x91\xfe\x14\x05\xce\x8f-\x80e\x11\x9a\xe9W\x8a\xda#\
-WD\xc8\xf72\xe0\xe3\x0a\x9c'wGj\xa8a\xca\
-\xfa!\x86F\xfa\x85yg\xcey\xcd\xbd\xa9N$N\
-LQ\xd8\x0fqG\xa4\x5c\x1f\xaf\xc0\xf92\x10x'\
-Rc\x1d\xab\xb4\xef\xf3\x95H9^\x08l\xa4\xc0y\
-s]\xa4\xe6\x9aC\x86/\x9c^\x03\x9b\x03\xafD\xca\
-\xf1U\xb9\xe7W\x81\xe1\xd3\x11\xe6%\xbd\x94\xfe\x80[\
-\x22\xe5\xd6yw\x05~\x9fi\xc4\x8b33\xce\xeb\x84\
-\x88y\xbd\xdb\xbeU\xe0\x95\x1c\x19\xb1\xd1\x96\x02_\xc8\
-0\xa7\x07Fz\xea\xbc2\x0e\xb3o\x15x\xd5\xa5\x95\
-\xcfDl\xb6\xb9\xe4\xf5\x16\xc3]\x81\xffE\xcc\xe7S\
-\xb9.\x9dT\xe0\x9e9\x9a\xb81\x0b\x18\x92A\x1e\xb7\
-\x01^\x8a\x9c\xcb/\xdb\xaf\x0a\xbc&\x1e\xa8@\xe2\x94\
-\x17y|\x92\xe2\x1d\xbd1\xe3!\xfbT\x81{bD\
-\xc4'\xd2+c6\xb0S\x82\xb9\xdb\x19x9r\xee\
-\xba\x81}\xecS\x05\xae\xf2\xb4\x8e5\xc5\x9b\xc0\xa8\x84\
-rv0\xe1\xdf9\xb5\xa6\x98l\x7f*\xf0\xda\x18B\
-\xf1\x96\xbb\xd8\xb1\x1c\xf8N\x02\xf9:\xb3\xfcYb\xc7\
-<`+\xfbS\x81{\xc3\xe9T\x17Q\x0f\xfe\x8eH\
-\xec\x03\xd1W\x0f\x8f,R\xe0\x96\xa6\x95\x1e\xa8\xb09\
-'v`\x8e&V\x98\x9f\xe9N\x1b)p\xab\x0c\xa3\
-X,_U\xfc\xb8\x83rsa\x85yy\x8bb+\
-\xa2=\xa9\xc0-s\x5c\x85\x8d\xdaMqJH\xd3s\
-rr\x05O\xeaW\xcd\xc9X\xfbP\x81\xfbB\x95\xf7\
-y\xcb)\x96u6y[`W\x85\xf9\xb8\xcc\xfeS\
-\xe0\xbe\xd2\x1f\xf8[\x85M;\x0f\xd8\xae\xa1\x8b4\x16\
-T\x98\x87\xc7\x80\x0d\xec?\x05\x0e\xc1\xf6\xc0\x7f+l\
-\xde\xbf4\xec\xc9t\xbfr\x05TU\xf12\xb0\xad}\
-\xa7\xc0!\xd9\xa3\xa2\xf9\xe1\x95q~\x83~\xf6\x1fV\
-\xfc\xd0\xea\xb3\xf6\x9b\x02\xc7`\x14\xc5{\x90\x8c8\xb1\
-\x048\xc8>S\xe0\x98\x8c\xa5x\x95\xa5\x116\xba\x80\
-\xd1\xf6\x97\x02W%\xf12\x9d\x0b\x16\xcb\x94W\x81\xab\
-\xe6(\xe2\xbce \xb7X\x8a'x*pM|\x09\
-xW\x07\xdb\x8ew\x80C\xed#\x05\xae\x93\xbd\x88\xbf\
-\x0f6\xc5\x98\x0d|\xce\xfeQ\xe0&0\x18\x98\xa9\x93\
-\xbd\x8e\x99\xc0\x96\xf6\x8d\x027\x89\x0d\x88\xf7\xfa\x90\x94\
-\xe2\x0e\x5ca\xa5\xc0\x0deC`\x86\x8e\xf6\x183\xca\
-\x1c\xd9+\x0a\xdcX\x06\x11\xffT\xc6N\x8c\x17\xcb\xdc\
-\xd8#\x0a\xdcxF\xe2b\x8fU\xa3\x0b8\xc0\xbeP\
-\xe0N\xe2\xe7z\xfb~\xfc\xcc~P\xe0Nc#\x5c\
-\xe8A\x99\x83\x81\xf6\x83\x02w\x22\xd7\xe8/W\xda\x07\
-\x0a\xdc\xa9\x0c\xa4\xda\x13,\x9ax\xef\xeb\xa7\xaf\x02w\
-4S3\x16\xf86\xeb\xaf\xc0\x9d\xcevTw\x08\x5c\
-\x93b\x05\x9e\xaa\xa1\xc0\x89\xf0H\xa6\x8b6\xac\xbd\x02\
-'\xc1E\x19\x0a|\xa1uW\xe0T80C\x81G\
-Xw\x05N\x85M#\xdc\x07\xef\x18p|\xbb\x04\x1e\
-[\xb7O\x9f\x1585^\x0d,\xc9~\x01\xc7\xb6\x7f\
-\xe0\xb1\xcd\xb1\xde\x0a\x9c\x1a\xa1\xf7\x0b\x87|\xbf\xf0!\
-\x81\xc7\xf6\xa0\xf5V\xe0\xd4\xb8+\xb0$G\x04\x1c\xdb\
-Q\x81\xc7v\xa7\xf5V\xe0\xd4\xb8=\xb0$\xc7\x04\x1c\
-\xdb7\x02\x8fm\x8a\xf5V\xe0\xd4\xb85\xb0$\xc7\x07\
-\x1c\xdb\xb8\xc0c\xbb\xc5z+pj\xdc\x1bX\x921\
-\x01\xc766\xf0\xd8\xee\xb1\xde\x0a\x9c\x1aO\x06\x96d\
-d\xc0\xb1\x8d\x0a<\xb6\x7fXo\x05N\x8d9\x81%\
-\xd9%\xe0\xd8\x86;\x8d\xa4\xc0\xf2\xd1\x84\xde\xdc\xbfy\
-\xc0\xb1\x0d\x0a<\xb6\xc5\xd6[\x81S#\xf4\xbb\x94\x06\
-\x04\x1c\xdb\x80\xc0c[j\xbd\x1585\xe6\x05\x96\xe4\
-S\x01\xc7\xb6C\xe0\xb1\xcd\xb5\xde\x0a\x9c\x1a\xa1_\xbf\
-\x12\xf2m~\xc7\x05\x1e\xdb,\xeb\xad\xc0\xa9\xf1D`\
-In\x0e8\xb6\xc9\x81\xc7\xf6\x98\xf5V\xe0\xd4\xb81\
-\xc2}f\x88\x13/\xb6/\xbfV\xc8\xb8\xc1z+p\
-j\x5c@\xf8\x08\xb1d\xf1\xf6\x08\xe3\xfa\x91\xf5V\xe0\
-\xd48\x828\xf1\xdd>\x8c\xe9\xdcHc:\xccz+\
-pj\x0c\x8c0\x95\x04\xc5+\x5c\xcenS\xde\x15\x11\
-\xc6\xb3\x94\xe2P{k\xae\xc0\xee\x09n!\xa6R\x9c\
-\x80\xd9\x9b{\xde\xdb#\x8e\xe3!\xeb\xac\xc0\xa9\xf2=\
-\xe2\xc6\xd2\xf2\xe9\xf4X`(\xd0\xbfdh9U4\
-9\xc2\x03\xab\xd5c\x82uV\xe0T\x19\x0c,'\xdd\
-\xe8\x02\xb6\xb2\xce\x0a\x9c2\x7fJX\xe0?Z_\x05\
-N\x9d\x83\x13\x16\xf8 \xeb\xab\xc09\xf0p\x82\xf2\xfa\
-\xf0J\x81\xb3\xe1\xd0\xc4\xe4\xed&\xec)\x99\xa2\xc0\xd9\
-\x9d\x91Ug\xdcd=\x1587\x86\x00o% \xef\
-|\x9f<+p\xae\x8cM@\xe0\xd1\xd6Q\x81sf\
-R\x07\xcb\xfbk\xeb\xa7\xc0\xb93\x80\xe2U$\x9d\x16\
-\xd3\xcbU^\xd6P\x81\xb3gS\xc2\x1f;\x1b3\x9e\
-!\xec\xa1z\xa2\xc0I,\xb3|\xaa\x03\xe4}\xb2\x1c\
-\xab5S`Y\x8dM\x80i\x0d\x96\xf7A`3\xeb\
-\xa4\xc0\xf2\xd1\xf7\xc4\x13\x1b\xfa\xc0\xca{^\x05\x96\x16\
-\xa6\x98\x164d\x9e\xd7\xa9\x22\x05\x966\xd8\xba\x5c\xe5\
-\xd4]\x93\xbc\xbfw\x91\x86\x02K\x98\x1dL3+\x14\
-w\x06\xaemV`\x09\xce(\x8a\xfd\xc41\x0e\x05X\
-N\xb1\x9fw\xa4yV`\x89?\xe5t.\xc5\x16\xbe\
-\xbe\x1c\x91\xb3\xb4\xfc\x1a\x13\x80-\xcd\xab\x02K\xf5\x0c\
-\x04\x0e\xa78\x8b\xf9\x06\xe0q\xe0E\x8aw1-+\
-\x99W\xfe\xd9c\xc0\xf5\xe5\xdf=\x0cO\x8fT`\x11\
-Q`\x11Q`\x11\x05\x16\x11\x05\x16\x11\x05\x16\x11\x05\
-\x16Q`\x11Q`\x11Q`\x11\x056\x09\x22\x0a,\
-\x22\x0a,\x22\x0a,\xa2\xc0\x22\xa2\xc0\x22\xa2\xc0\x22\xa2\
-\xc0\x22\x0a,\x22\x0a,\x22}\xe4\xff^W\xdd\xcf\x1d\
-\xc1\xe9\x9b\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x13u\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.1462899, 2023/0\
-6/25-20:01:55   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-25.0 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-10-06T09:12\
-:28+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-10-06T09:17:10+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-10-\
-06T09:17:10+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:3f484\
-f82-8fb1-b344-9f\
-cb-acdf148f93a4\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:3f484\
-f82-8fb1-b344-9f\
-cb-acdf148f93a4\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:3f484f82-8fb1\
--b344-9fcb-acdf1\
-48f93a4\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:3f4\
-84f82-8fb1-b344-\
-9fcb-acdf148f93a\
-4\x22 stEvt:when=\x222\
-023-10-06T09:12:\
-28+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-5.0 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\xe6m\x97X\x00\
-\x00\x0e-IDATx\xda\xed\x9di\x90]E\x19\
-@'\x01\x12 \xec\x10\x16\x01#R P\x8a\x15E\
-@\x03J\x81\x0b\xab\x14{\x04D\xabXDJ\x84\xc2\
-\x14\x22\x08\xf2C\x05\x05\x81\x88X\xa0\x14\x1a\xa0\x80@\
-dQ\xc4\x85\xad\xd8\x22\x22[\x04S\xac1F\x09k\
-\x02(\xd9\x182\xc7\x1f\xf7\x0e\x86q2\xcc\x9b\xe9\xbe\
-\xb7\xfb\xde\xf3U\x9d\x1f\x99J\xbd\xd7\xef\xbe>\xaf\xfb\
-\xf6\xf7u\xdf.\xa0KD\xf2\xc4\x8b \xa2\xc0\x22\xa2\
-\xc0\x22\xa2\xc0\x22\x0a,\x22\x0a,\x22\x0a,\x22\x0a,\
-\xa2\xc0\x22\xa2\xc0\x22\xa2\xc0\x22\x0a,\x22\x0a,\x22\x0a\
-,\x22\x0a,\xa2\xc0\x22\xa2\xc0\x22\xa2\xc0\x22\xa2\xc0\x22\
-\x0a,\x890\x1a\xd8\x09\x98\x04\x5c\x02\xdc\x01<\x0d\xcc\
-\x05^-y\xae\xfc\xdb\x1d\xe5\xff\xf9\x060\x01\x18\xe5\
-\xf5S`\xa9\x9eu\x80c\x80\xdb\x80\x85\x0c=\x16\x00\
-\x7f\x04\x8e\x02\xd6\xf6\xba*\xb0\xc4e{\xe0:`\x09\
-\xe1c\x09p-\xb0\x9d\xd7Y\x81%,\x1f\x07\xee\xa4\
-\xba\xb8\xbd\xfc\xb1\xf0\xda+\xb0\x0c\x83u\x81\xc9\xc0R\
-\xaa\x8f\x1e\xe0r`\x03\xbf\x07\x05\x96\xce\xf9<\xf0\x0a\
-\xf5\xc7\xcb\xc0>~\x1f\x0a,\x83c%\xe0\x82r\x04\
-L%z\x80\xf3\xcb\xb6\xf9\x1d)\xb0,\x871\xc0o\
-I7n\x05V\xf7{R`\xe9\xff~\xf7~\xd2\x8f\
-\xfb\xcb\xb6\xfa\x9d)\xb0\x94\xac\x0a\xdcG>\xf1(\xb0\
-\x9e\xdf\x9b\x02Kq_y\x0b\xf9\x85\x12+\xb0\x00?\
-&\xdfx\xd4\xe9\xb4\x02\xb7\x99\xbd\x12[mv$V\
-`\x19$\x1b\x01\xf3hF8\x12+p\xeb\xb8\x82f\
-E\xa8\x91x\xed\x92\xf7\x97|\xb4\xe4#\xe5\xbf\xc7\x02\
-\xab\xd8\x7f\x14\xb8N&4`\xea<\xd4\x91xc`\
-O\xe0\xab\xc0\xd9\xc0\xd5\xe5\x0a\xfcs\x1d^\x93\xb7\x80\
-\xf9\xc0\x13\xe5\x22\xe0\x85\xc0\x09\xe5m\xc9V\xb4d\xab\
-\xa42\xd5\xc3=47\x96\x95x\x0c\xc5^\xe5\x13(\
-\xea\xaa\x9f\xad\xb0\x1d\xdd\xc0\xdf(\xf6?\x1f\x01l\xa6\
-\xc0\x12\x82\x1dh~\xcc\x05\x1e(G\xc9\x94b6p\
-%\xf0\x05`\x0d\x05\x96\xa1p\x03F\x0a\xb1\x98\xa24\
-\xf4\x042\xdeq\xa5P\xd52\xb6\x9c\xda\x19iEw\
-)\xf3D2\xdb\xb0\xa1T\xd5\xf2\xb5\xc8\x1d\xf1M\x8a\
-S5\x0e\x05\xb6\x00\xd6*\xf9\x00p80\xcd\x1f\x90\
-w\x8d\x17\xca\xc5\xb5M\x15X\xfarw\xc4\x8ew\x03\
-0n\x10m\xd8\x0c\xb8IO\xdf5\x96\x00W\x01;\
-*\xb0\xf4nX\x88q\x96U\x0fp\xd2\x10\xda3\xa9\
-\xa1\xa9\xac\x18q+0^\x81\xdb\xcdn\x91:\xd7I\
-\xc3h\xd3\xd1J\xdc\xd1\x0f\xe5\xb5\xc0\xe6\x0a\xdcNN\
-\x8b\xd0\xa9~\x15\xa0]J\xdc\xf9\xea\xf5\xf9$R\xff\
-\xadX\xd51%\xc2=Z\xa8\x85\x16%\xee<\xe6S\
-\x9c\xcd\xad\xc0-az\xe0\x0etU\xc0\xb6\x8d(\xa7\
-\x87F\xe7q\x1d\xb0\xbe\x027\x9f9\x81;\xce\x81\x81\
-\xda\xb5.p\xb3\x1e\xe69\x1a+Vu\xcc\x0f\xdci\
-\xc6\x05h\xd3\xf6\x11~X\xda\x1cS\xa9\xf8\xd0?\xc5\
-\xaa\x8e7\x03w\x96\xe1V\x0c\x1dH\xf1l$#l\
-<AQ8\xa3\xc0\x0a<`\xac8\x8c\xb6|\xdbE\
-\xab\xa8\xf1\x0a\xb0\x8b\x027\x8bW\x03w\x92M\x86\xb8\
-X\xf5#\xfd\xaa$\xba\x81\xaf+ps\xf8g\xe0\x0e\
-\xb2o\x87\xef?\x12\xf8\xb9^U\x1e\x17\x96\xd7^\x81\
-3'\xf4\xa1\xed\xbf\xe8p\xe4\xbdT\x97j\x8b\xc9\x0a\
-\xec\x19X}c!\x83\xdf\xc7:9\xa3\xce\xbe\x04x\
-\x91\xe2\xf4\x8e'\x81\x07K\x1e)\xff\xf6\x0aE5T\
-nq\x80\x02\xe7\xcd\xe9\x11:\xc5\xe5\x83x\xdf3\x13\
-\xed\xd0\xcf\x01\xd7\x03\xa7Rl\x7f\x9c\x00\xbc\xa7\x9c-\
-\x0c\xe6z\x8e\x01>\x0c\xec\x0f\x9cLqt\xce\x03\xa4\
-\xbb]r60Z\x81\xf3\xe5\xb3\x91:\xc6\x91\x03\xbc\
-\xe7\xe1\x09\xad6?\x0f\x5c\x5c\x8eD\x9bD\xbc\xce\xab\
-\x02\x9f*\x7f\x18~O\x9c\x1d`C\x8d\x89\x0a\x9c/\
-\xabE\x1a\x1d\xba\x81\x83\xfby\xbf\x9d\x12\x98j\xce\x01\
-\xce)G\xd7\x915]\xf75\x81\xc3(6~\xd4\x9d\
-\xf7\x9e\xaa\xc0\xd6C\x0fF\xe2\xf5)\x0e\x96\xab+\xee\
-,\xa7\xb6+$v\xfd\xc7\x00G\x95\xf7\xd3u\xc4,\
-\x05\xce\x9b\x93\x22v\x8e\xb7\xca\x91f\x04\xf5<cx\
-iyO\xbem&\xdf\xc5N\xc05\x84/\xb0y\xb7\
-\x85G\x05\xce\x98\x8d\x88{\xd4\xea[\xd4\xf3\xc4\x87;\
-(\x9e\x9c\x90\xe3w\xf2\xbe\xf2\x87\xa7\x8a\xb5\x82\x05\x0a\
-\x9c?9>Jty\xf1\x0c\xb0O\x03\xbe\x93\x91\xc0\
-\x1f\x9cB\xcb`\xd8\xb5\x01\xe2.\x05.(W|\x9b\
- \xef\x94\x8a\xae\x9b\x8bX\x0d\xe1O\x19\xcb\xfb\x12\xb0\
-{C\xbe\x87*\xe55\x8d\xd4 v\xcbT\xde\x87\xc9\
-\xe4\xbc\xe4\x04\xe5\xb5\x90\xa3aL\xcbL\xde_\x97i\
-\x18\xe5\x1dZXJ\xd90\xde\x0b\xfc;\x13y\xaf\x22\
-\xb3G\x8e$&\xef\x85\xb1>\x8f\x22\xd5\xcb\xc1\x99\xc8\
-\xbb\x82\xf2\x0e9\xa6\xe0v\xc2FsY\xc2\xf2\xde\xe8\
-\xc8\x9b\xae\xbc\x0a\x9c\x06\xab\x10\xf7\x99IC\x8d\x07\x1b\
-v\xcf\xfb\xcb\x8a\xaf\xdf\xd5U\xcc\x5c\x14(\x0d\xd6\x06\
-\x1eKH\xde\xb9\x14Uc\x8e\xbc\x89\x8e\xbc\x0a\x9c\x1e\
-\x1b\x03O%R\xa4\xf1\x19G\xde\xb4G^\x05N\x93\
-q\x14'N\xd4\x19g+o\x1e\xf2*pZ\xecL\
-q\xa6p\xdd\xf7\xbd\xa3\x947\x0fy\x158\x0dV-\
-G\xbd\xa55\xcb\xfb&\xb0\xb5\xf7\xbci\xdf\xf3*p\
-Z\xec\x01\xfc#\x91\x85\xab\xf3\x1cy\xf3\x19y\x15\xb8\
-^\xd6\x03\xaeLh\xd5y\x1e\xb0\x8e\xf2\xe6%\xaf\x02\
-\xd7\xc3\xa1\x14;zR\x8a\xaf(o~\xf2*p\xf5\
-\xa7q\x5c\x9f`\xc1\xc6,\xf2.\x95l\xd5=\xaf\x02\
-W\xcf\x08\x8ag\xc7\xbeN\x9aq\xbc#o~#\xaf\
-\x02W\xc3\x96\xc0]\xa4\x1b\xf3)\x8e\xbbU\xde\x0c\xe5\
-U\xe0x\xac\x08\x9c\x02,\x22\xed\xf8\xbe\xf2\xe6+\xaf\
-\x02\xc7a<\xc5\xc9\x15\xa9G\x0f\xc5\x9ed\xefy3\
-^'P\xb8p\xac\x0c\x9cE\xba\xcf\xe6\xe9\x1b\xf7:\
-\xf2v\x14\x93\x14\xb8\xb9L\x00f\x92W\x1c\xaf\xbc\x1d\
-E7\xc5\x89\xa2\x0a\xdc R)\x83\xec4\x96R<\
-\x09Py;\x8b9\xc0\xea\x0al\x19\xa4\xd3\xe7\xb4\xef\
-y\x07\x8a\x8b\x148\xff\xcd\xf7\x97\x90w|Wy\x87\
-5{\xf9\x84\x02\xe7\xc9A\xa4W\x069\x94\xd8\x1d\xa7\
-\xcd\xc3\x89\xbb\x15\xd82\xc8:G\x905\x95w\xd8\xf1\
-9\x05\xb6\x0c\xb2\x8ex\xc4is\x90\xb8_\x81\xd3f\
-s\xe0v\x9a\x17S\x1cy\x83\xc5\xc7\x148\xcd2\xc8\
-\x13\x807hf\x9c\xa1\xbc\xc1\xe2R\x05N\x8bm\x81\
-\x07\x12\xeb$\xa1\xa7\xef\x879m\x0e\x16oP\xf3f\
-\x10\xa5\xfd_\x19\xe4\x99\xc0\x92\x84:\xc7\xfc\xf2\xfe\xfb\
-\xd9\xc0\xaf\xbb\x83#o\xd0\xd8_\x81-\x83\xec\x1b\xd7\
-\x02c\xcb\xf6\xbd\x10\xf8\xb57t\xe4\x0d\x1a\x97)\xb0\
-e\x90\xbd1\x17\xd8\xafO;C\xdf\x8b\xaf\xda\xe2\x91\
-\xf7\xc5\x08\xaf\xf9|\x99\xadP\xe0\x0aI\xad\x0c\xb2\x87\
-\xa2\xbak\x8d~\xd2X=\x01\xdfgi\x9d\x9d\xadf\
-y\xaf\x06\xb6 \xce\x1e\xed\xcd\x15\xb8\xbde\x90\xcf\xb0\
-\xfc].\xab\x05~\xaf\xff\xb4X\xde\xde\xfd\xbc\xe7E\
-x\xfd\x83\x15\xb8}e\x90\xdd\xc0d\x06~\x02\xe0\x86\
-\x11\xa6{m?Ic\x1c\xf0V\xe0\xf7\xf8\x81\x02\xb7\
-\xab\x0cr\x06\xb0\xdd \xda\xbeA\xe0\xf7}\xa1\xe5\xf2\
-\xf6r[\xe0\xf7\x99\xa6\xc0\xed(\x83\x5cT\xa6\xab\x06\
-\xfb\xfc\xa1\xa6L\xa1S;\xc3jR\xe0\xf7\x9a\xae\xc0\
-\xcd/\x83\xbc\x17\xd8j\x08\x1d?\xe4\x22VO\x0d\x8b\
-X)\x1e@\xb7s\xe0\xf7\x9b\xad\xc0\xcd-\x83|\x03\
-\xf8&C?\x08|A\xe0\xf6\x8ci\xb9\xbc]\x14\xa7\
-\x91\x84\x8c\xd7\x15\xb8\x99e\x90\xb70\xfc\x93\x1fC\x17\
-rlT\xa1\xbc\xa9>1at\x84\x1fi\x05\x1e\x22\
-)\x97A\x86\xf8|\xb3\x02\xb7m\xc7\x16\x8f\xbc\xcb\xce\
-\xd4B\xc6b\x05nf\x19d\x08\x1e\x0a\xdc\xbe\xc3[\
-<\xf2\xf626\xf0\xfb/P\xe0f\x96A\x86`Z\
-\xe0v~\xa7\xc5#o/;\xb8\x88e\x19\xe4\xb2+\
-\xbb\xfd\x95A\x86\xe2\xec\xc0\xed\xbd\xbc\xe5\xf2v\x01\xc7\
-\x06n\xc7\x83\x0a\xdc\xbc2\xc8P\x1c\x1d\xb8\xcd3Z\
-:m^\x96\x1b\x02\xb7\xe57\x0a\xdc\xbc2\xc8P\xec\
-\x1a\xb8\xedK\x81\xb5Z:\xf2\xf6\x0e\x04\x8b\x03\xb7\xe7\
-\x87\x0a\xdc\xbc2\xc8P\xbc7\xc2g\xd8\xa3\xa5\xf2v\
-\x01\xdf\x8a\xd0\xa6/)p\xf3\xca C\x8ep\x0b\x03\
-\x7f\x96\xef\xb5p\xda\xdc\x05\xac\x07\xcc\x8b\xd0\xae\xf1\x0a\
-\xdc\xbc2\xc8\x90\xdc\x13\xf8\xf3\xdc\xd7By\xbb\x80+\
-\x22\xb4\xeb\x15j|\xf4\xa8e\x90\x03\xc7p\xcb C\
-qV\x84\xfb\xe0\x8d[4m\xee\x02\x8e\x8a\xd4\xb6\xa9\
-u\xf6\x0d\xcb \x97\x1f!\xca C\xb1W\x84\xcfw\
-b\x8b\xe4\xdd\x97x\xcfm>\xb2\xcd\x027\xbd\x0c2\
-\x14k\x11\xbehezK\xe4=&\xa2\xbc\x8b\x81u\
-\xdb*p\x1b\xca C2#\xf0g\xed\xa18\x9d\x22\
-\xd5{\xde\xbf\x0cs\xc1p,pU\xe46N\xab\xbb\
-_X\x06YD\xac2\xc8\x90\xfc4\xc2\xe7>;\xd1\
-\x91\xb77\x1e\x07\x0e)\xd7G:\xc9\xf3\x9e\x06\xbcZ\
-A\xfb\xf6i\x9b\xc0m+\x83\x0c\xc9\xde\x11>\xff\xeb\
-\x0c\xfc\xa4\xc2T\x0e]\x7f\xa1\xfc\x01;\x88\xe2d\xc9\
-\x95x\xe7\xa9%\xe3)\xca#\xaf'\xce\xa9\x93\xfd\xc5\
-\xcc\x04\x167+\x13\xb8\xade\x90!Y\x8989\xcc\
-\x13\x13\x97wy\xb1\x90\xf0\x87\xd3u\x12I<\xa2\xa6\
-\xade\x90g\x95\x0bh\xb9m\xe4\xb8,\xc2\xf5\xf8{\
-?S\xd4&<1!f<E\x8d\xb9\xdf\xaa\x04\x1e\
-I\x9c3x\x87\x13\x0fSc\xd5L\x00v\x8ft]\
-\x8e\xcbh\xe4M!\xf6N\xa5O\xc4|\xf1\xc9\x09]\
-\xf0E\xc0)\x1d.\x86\xa4z\xe6W\x8c\xd9\xcc\xbc2\
-\x1d\xa2\xbc\xef\x1e\xd7\xa7\xd4'b\xbd\xf0\x01\x09]\xf0\
-\xbb\x80-3\x17wY~\x16\xe9:\xfd\xc4i\xf3\xa0\
-\x16\xfd\xc65]\xe0Q\x84?\xc7i(\x91J\x19d\
-hv\xd4\xa3\xdabbj\xfd!\xc6\x8bNL\xe0B\
-\xa7T\x06\x19\x83\xfbt\xa9\xf2\xb88\xc5\xbe\x10\xe3E\
-\xa7\xd6x\x91_\x02\x0em\xb0\xb8\xbd\xec\xafO\x95\xc6\
-}$\x9a\xb5\x88\xf1\xa2uM\x9f\xaf\xa4\xd8\xef\xd9\x86\
-\xe7=\x8d\x04\x9e\xd6\xabJ\xe2q`\x9dT\xfbB\x8c\
-\x17]T\xf1\x05\xce\xa1\x0c2\x06\xc7\xe9V\xf4\x98\x0d\
-l\x92r?\x88\xf1\xa2\x0b+\xba\xb89\x95A\xc6\xaa\
-)\x7fY\xc7\xa2\xc5c\xc0\xa6\xa9\xf7\x83\x5c\xa7\xd0O\
-P<\xa0\xaa\xab\xe5L\xca@\x84\x05\x19\xca;\x9d\x9a\
-\xb7\x096}\x11\xeb\x0c\xe5};e\xf7T\xc2\x22L\
-\xa18\x22\xe9\xcf\x99\xad6\x8f\xce\xa5\x0f\xe4\x9aF\xea\
-\x01\x8eP`\xba(\xb6\xb4\xa5\x18\xcbn\xc6_\x91\xe2\
-\xe0\x86\xa5\x09\x8b\xfb\x1a\x09\xe6y\xeb\x10\xb8\xaaB\x8e\
-7\x81O+0]\xc0\xef\x12\x96\xb7\xef\x19\xd73\x13\
-\x94\xf7F2\xad\x1b\x88\xf5\xc2\xfbUt\xe1_\x05\xb6\
-Q`\xb6.\x7f\xd0R\x96\xb7\xef\xe1\x85\xaf%\xd0\xd6\
-'\x81=s\xfe\xeec\xbe\xf8\x85\x15.\xf5o\xa4\xc4\
-\x9c\x9f\xc8=\xef`KW\xd7\xa3x\xd0Z\x1d+\xe9\
-3\x80/\xf2\xce\x83\x01\x14\xb8\x0f+\x007U\xf4\x85\
-<Dq2C\x9b\x05^\x19\xf8k\xc2#\xef@\xe9\
-\xb0\xe3\x80\xfb#\xb7o1\xc53\x91\xf6\xa0xp@\
-#\xbe\xf7\xd8o\xb0\x1a\xe1\x9fo\xbb\xbc\xb8\x85\xfc\xb7\
-\x0b\x0e\x97\x0fR]\x1e>\x84\xbc\xfd\x1d\xea\x7f\x1a\xc5\
-A\xf6!\x9e_4\xaf\x1cD\xbe\xcc\xc0G\x07)0\
-\x03?\xdfhvE\x1d\xe9R\xa7\xd2\x1c\x9f\xf0\xb4\xb9\
-\x13V\x01v\x01N\xa6\xd8ByG\xd9\x8f\xe6\xf7Y\
-\xcd^\x5c\xfem&psy+q,\xf0!\x9a\xb7\
-\x13\xad\xb63\xb1\xb6)/r\x15qj\xcb\x05\x1eQ\
-\xe1\xadK\xa8\x91w\xa8\x82\xb7}\xc6U\xe9\xa9\x94\x9f\
-$\xfcc\x1d\xcd\x11/\x7f\x81\xe8\xb9\x06\xcb+5\x1d\
-+;\xb1\x14\xcc\x1cq5\x07\xe7\xc7\xdaX\x12k\xda\
-,\x19\x1c\xec~ZE\xd3\xbb\xd7)\x9e\xb9\xd4\xe6/\
-\xf8\xe0\x08?\x98\x8e\xbc-\x17\xb8\x0b\xb8\xa8\x22\x89\xff\
-E\xe2\xdb\xc1*\xe0tG^\x056G\x9c7\xe78\
-\xf2*p\x8c\xfd\xacU\xedRi{\x8ex\x04\xc3{\
-2\x86\xf2*\xb09\xe2\x9a\x19\x09\x9c;\x84\xebv\xae\
-\xd3f\x056G\x9c\x0e\x07\x00s\x06q\xad\xe6\x94\xff\
-WQ\x14\xd8\x1cqb\x8c*Sz\xd7P<\xe4\xad\
-\xbb\xe4\x99\xf2o\x13\x19\xde\xb3y\xa5e\x02\x9b#\x16\
-\xc9\x5c`s\xc4\x22\x99\x0bl\x8eX$s\x81\xcd\x11\
-\x8bd,\xb09b\x91\xcc\x056G,\x92\xb9\xc0\xe6\
-\x88E2\x17\xd8\x1c\xb1H\xe6\x02\x9b#\x16\xc9\x5c`\
-s\xc4\x22\x99\x0bl\x8eX$s\x81\xcd\x11\x8bd,\
-\xb09b\x91\xcc\x056G,\x92\xb9\xc0\xe6\x88E2\
-\x17\xd8\x1c\xb1(p\x03>\x849bQ\xe0\xcc1G\
-,\x0a\x9c9\xe6\x88E\x813\xc6\x1c\xb1(p\xe6\x98\
-#\x16\x05\xce\x1cs\xc4\xa2\xc0\x99c\x8eX\x14\xd8\x1c\
-\xb19bQ`s\xc4\x22\x0al\x8eX\xa4\x8d\x02\x9b\
-#\x16\x056Gl\x8eX\x14\xd8\x1c\xb1\x88\x02\x9b#\
-\x16i\xa3\xc0\xe6\x88E\x81\xcd\x11\x9b#\x16\x056G\
-,\xa2\xc0\xe6\x88E\x81\xdb\x8c9bQ`s\xc4\xe6\
-\x88E\x81\xcd\x11\x8b(\xb09bQ`s\xc4\xe6\x88\
-E\x81\xcd\x11\x9b#\x16\x056G,\xa2\xc0\xe6\x88E\
-\x81\xcd\x11\x9b#\x16\x056Gl\x8eX\x14\xd8\x1c\xb1\
-(\xb0\x98#\x16\x056Gl\x8eX\x14\xd8\x1c\xb19\
-bQ`s\xc4\xa2\xc0b\x8eX\x148,\xa3\xca\x91\
-\xf0\x1a\xe0\x19\xa0\x1b\xa3\xaa\xe8.\xaf\xf95\xe5w0\
-J\x91\x14\xb8\x13\x0e\x00\xe6\xe8Q21\xa7\xfcN\x14\
-J\x81\x07d$0Y_\x92\x8d\xc9\xe5w\xa4X\x0a\
-\xdc/\xca\x9b\x87\xc4\x8a\xa5\xc0\xfdN\x9b\x8d<\xc2\xe9\
-\xb4\x02\xff\xdf\x82\xd5,\xbd\xc8&f\x03\xa3\x95K\x81\
-\x97\xcd\xbb\x1ay\xc5!\xca\xa5\xc0\xbdL\xd5\x87\xecb\
-\xaar)p/N\x9f\xf3\x8bY\xca\xa5\xc0\xbd,\xd2\
-\x87\xecb\x91r)p/\x0b\xf5!\xbbX\xa0\x5c\x0a\
-\xec\x14\xda)\xb4\xb8\x88e\xb8\x88\xa5\xc0\xa6\x91\x0c\xd3\
-H\x0al!G\x0b\xc2B\x0e\x05\xb6\x942\xe3\xb0\x94\
-R\x81\xdd\xcc\x90i\xb8\x99A\x81\xddN\x98\xb1\xbcn\
-'T`7\xf4g\x16n\xe8W`\x8f\xd4\xc9(<\
-RG\x81ED\x81E\x14\xd8\x8b \xa2\xc0\x22\xa2\xc0\
-\x22\xa2\xc0\x22\x0a,\x22\x0a,\x22\x0a,\x22\x0a,\xa2\
-\xc0\x22\xa2\xc0\x22\xa2\xc0\x22\x0a,\x22\x0a,\x22\x0a,\
-\x22\x0a,\xa2\xc0\x22\xa2\xc0\x22\xa2\xc0\x22\xf26\xff\x05\
-\xa3p\xd2\xf2%\xed\xe8>\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x16'\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:08:59+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:08:59+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:10011\
-6ae-fdff-2f43-b8\
-5e-50b965cdc497\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:10011\
-6ae-fdff-2f43-b8\
-5e-50b965cdc497\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:100116ae-fdff\
--2f43-b85e-50b96\
-5cdc497\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:100\
-116ae-fdff-2f43-\
-b85e-50b965cdc49\
-7\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\x15\xd7i\x87\x00\
-\x00\x10\xdfIDATx\xda\xed\x9d{\xb0VU\x19\
-\xc6\x8f 7\x15\xc3\x14\x04\x04\xc4\xec\x0f\xca.\x93v\
-Q\xf2ZH\x93\x85\x06b\x82\x8d\x8d]lTD\xb2\
-r,k\xb2\xb2\x944M\x0at\xb4\x82\x12\x11\x10M\
-\x13\xc7\xca\x0b\x08\x92\xa6\x22\x22ewP,\xb5Q<\
-\x5c\x029\x08\x9c_\x7f\xec\xc5@\x04\x9e\xcfs\xdew\
-\xef\xb5\xf6z\x9e\x99\xdf_\x22\xaco\xbd\xcf\xf3}{\
-\xafk\x13\xd0$\x84H\x13u\x82\x10\x0a\xb0\x10B\x01\
-\x16B(\xc0B(\xc0B\x08\x05X\x08\xa1\x00\x0b!\
-\x14`!\x14`!\x84\x02,\x84P\x80\x85P\x80\x85\
-\x10\x0a\xb0\x10B\x01\x16B(\xc0B(\xc0B\x08\x05\
-X\x08\xa1\x00\x0b!\x14`!\x14`Q2\x9d\x80\xfe\
-\xc0\x91\xc0i\xc0\x97\x80I\xc0\x1d\xc0B`1\xf0g\
-`9\xb0\x0aX\xc3v\xad\x06^\x0e\xff\xedO\xe1\xcf\
-.\x00~\x09\x5c\x1b\xfe\xae\xd3\xc2\xdf\xdd\x1f\xd8C\xfd\
-\xad\x00\x8b\xf6\xd3\x138\x1a\xb8\x00\x98\x06<\x05l\xa2\
-<m\x02\x96\x02S\x81\xf1\xc0\x07\x81}T\x17\x05X\
-\xec\x9a\x01\xc0g\x81\x19\xc0_\x80\xad\xc4\xa7\xad\xe1\x17\
-~:pV\xf8\xa5V\xed\x14\xe0,\xe9\x01\x0c\x03&\
-\x86\xc7\xd9V\xd2\xd4r\xe0\x86\xf0\xf8\xddSuU\x80\
-\xeb\x1e\xda1\xc0]\xc0F\xea\xa7\x8d\xe1\xb3\x9d\x1e>\
-\xabj\xae\x00\xd7b\xe0\xe9\xe8\xf0+\xb5\x96|\xf4*\
-p+0\x02\xd8S>P\x80Sc0p\x15\xf0\x02\
-\xd2\xf3\xc0\xf7\x81A\xf2\x85\x02\x1c;G\x007\x01\x9b\
-\x95\xdb]\x0e\x82\xcd\x05\x86\xca'\x0apl\x8f\xc9#\
-\x80\xfb\x94\xd1\x86\xb5\x18\xf8\xb4\x1e\xaf\x15\xe0\xaa\x83\xfb\
-\xa90\x12+\xb5O\x7f\x07\xce\x08})O)\xc0\xa5\
-1\x0cX\xa2\xfc\x99\xe9\x8fa*J\xdeR\x80]y\
-\x1f\xf0\x80\xf2\xe6\xa6E\x14\xab\xbe\xe45\x05\xd8\x94~\
-\xc0\xac\x84\x17\x5c\xa4\xa4V\xe0\x16\xa0\xaf|\xa7\x00w\
-\x94=\xc2`\xcb*\xe5\xaat\xad\x06&\xe8\xfdX\x01\
-n/o\xd1\xc8r\x14Z\x08\x0c\x91\x1f\x15\xe0F\xd9\
-3|\xf3\xafWv\xa2\xd1F\xe0[@W\xf9S\x01\
-~=\x06\x02\xbfS^\xa2\xd5\xe3\xe1\xc9H^U\x80\
-\xff\x8f\x93\x81W\x94\x91\xe8\xb5\x06\x18-\xbf*\xc0;\
->2O\xd4\x08sr#\xd5\x93\xf4H\xad\x00\x0f\x02\
-\x1eV\x1e\xf4H\xad\x00\xa7\xc71\x89>2\xff\x07x\
-\x14\x98\x03\x5c\x13\x06\xdcF\x01\x1f\x00\xde\x16\x0c}\x00\
-\xd0k\x87\xcf\xfa&`\xff\xf0\xdf\x86\x84?;*\xfc\
-\xbf\xd7\x00\xb7\x01\x8f\x85\xbf;5\xad\x22\xe3\xc5\x1f\xb9\
-\x86w\x0c\xd0\x92HX\xef\xa7\xd8\x9a86\x84\xcfs\
-^\xb4S\xf87\xc6\x02W\x86\x7f;\x85Po$\xd3\
-\xa5\x989\x86w\x02q\x9e9\xb5MO\x87w\xf2a\
-@\xb7\x08\xfa\xab3\xc56\xc9\x8b)\x96:\xc6\xdaw\
-\xada\xaaI\x01\xae)\x9d\x81\xeb#4\xdeV\x8a\xf5\
-\xd5\x9f\x01z'\xd0\x8f\xbd)\x0e\xe0\x9b\x17i\x98'\
-\x87Z+\xc05\xa2\x1b\xc5yM1\xe9I\xe0\xcb\xc0\
-A\x09\xf7\xeb\x00\xe0+\x14G\xd0\xc6\xa4;r\x19\xa1\
-\xce!\xbc]\x81_E\xf4k;\x178\xaa\x86\xfd|\
-8q\x9dFrO$\xaf \x0ap\x07\xe8\x02\xdc\x19\
-\x81\x99\xd6\x85y\xcb\x833\xf8\xc2\xec\x17\xdeE\x9b#\
-\xe8\xf7_\x06\x0f(\xc0\x89\x86\xf7\x8e\x08\x82{)y\
-\x9e\x99\xbc/\xf0\xed\x08F\xb1\xe7P\xe3\xa3{\xea<\
-`5\xb3B\xd3\xbcFq\x94\xac\xf6\xb4\x16s\xd2\x13\
-+\x9e\xb6\xabm\x88\xeb\xba\x87wz\x85f\x99\x8d\x16\
-\xdc\xef\x8aCC\x90\xaa\xd2T\x058\x0d\xbeY\x91A\
-\x9e\x07F*\xa8mr\x12\xb0\xb2\xa2\x1a}U\x01\x8e\
-\x9b\xd1\x94\xbf)\xa15<.\xebn\xa0\xc6\xd9+<\
-Vo\xa9\xa0Vc\x15\xe089\x92\xe2J\x8f2\xb5\
-\xbc\xa6SBe1\x94\xf2\x8f\xe5}\x95\xe2pB\x05\
-8\x22\x0e\x06\xfe]\xc1b\x81\xfd\x14B\x93\xd1\xeaY\
-%\xd7\xeeEjr\xd5K\x1d\x0c\xd0\x83\xe2\x02\xec\xb2\
-\xd4\x02\x8cS\xf0\xcc\x19_\xf2H\xf5R\xa0\xbb\x02\x5c\
-=e\xaeo~&\xac8R\xe0|xo\xc9\x03\x5c\
-S\x14\xe0j\x19Y\xf27\xf6A\x0aY)+\xb9\x16\
-\x97X\xd7O(\xc0\xd5-\xa4/\xeb\xbc\xe6\xdfh\x94\
-\xb9T\xf6\xa6X3^\x86\x9aS~\x1fN\xb5\xc0\x9d\
-(\xb6\xb3\x95\xa1\x9f\xa0[\xf4\xaaZM7\xa5\xa4\x1a\
-/$\xd1-\x88\xa9\x16\xf7\xd2\x92\x0a{\x85\x82T9\
-W\x95T\xebo(\xc0\xe5\xf0\x0e\x8a\xb5\xc6\xde\xba\xa6\
-\xc2\xcf\xd8\x1b\x18\x1eFf\xa7P\xdc\x10\xb1,\xcc\x99\
-6\x03\x9b(\xb6\xed\xfd#L\xc1\x8c\xa1\xde\xfb_'\
-\x96P\xef\xcd\xc0\xbb\x14`\xffu\xce\x0f\x96P\xcc\x1f\
-V\xb02\xe9\x14\xe0\xda\x10\xd4\xf6\xac&{\x0e8\xb5\
-\xc6!\xfe~\x09u\x7f(xL\x01v\xe2s%\x14\
-qR\x89\xef\xf1'\x00\xd3(\xb6\x1dZ\xb6\xbf\x8e\x17\
-\x82\xedQ\xd2;\xf1Y\x0a\xb0\x0f\xfb\x03/;\x17\xef\
-\xf6\x12\xcc\xdf\x1d8\x0fXQ\x83/\xa1*\x06/\xbd\
-\x0fhXE\xb1\x05R\x016f\xaas\xe1\x96\x84\xe9\
-\x0b\xcf\xc7\xe4/\x03/\x944(S\xd7\xc7\xe9\xbd(\
-\xce\xb0\xf6\xd4\x8d\x0a\xb0-G\xe3\xbb\xcb\xe8_@\x7f\
-\xc7\xf6\x8f\xa0X\xc5U\xa6\x9e\xa5\xbegB\x0d\xa0\xd8\
-\xbe\xe9\xa5\xad$\xb2I%\x95\x82y\xde\x18\xb8\x01\xbf\
-\xe5\x91\x83K\x5c\x90\xb0+\x8d\xa9\xf1\xa0\xd6\x11\xf8\xee\
->[\xa8\x00\xdbm\x00\xf7\xd4\xd9N\xed\x1eMq\x93\
-^\x95\x9a]\xf39\xe2s\x9c\xfbo\xb8\x02\xdc\xf1\x91\
-\xc7G\x1d\x0bt\x9bC\x9b\xbbQ\x1c.\x1e\x83Vd\
-\xb0\xd0\xc3s+\xe2\xe3\xb1O+\xe5\xbcY\xe19\xe0\
-\xcd\x0e#\xe5\x8f\x10\x8f^\xcd \xc0\xbd\xc2\xfb\xbe\x97\
-F(\xc0\xed\x9f2X\xeaT\x94\xcd\xd8\xdfh\xd7?\
-,\xc2\x88I\x1b2\x08\xf0\xb6AN\xaf\xe3y\x96\xc5\
-<\xaf\x1esQ\xc68\x1a\xfbJ\xe3\xb6\x0e\x09\xbf\xe8\
-\xb1iE&\x01n\x02\xaev\xec\xc7\xd3\x14\xe07\xce\
-\xe3N\xc5X\x09\xecc\xd8\xce\x81\x91\x867\x87A\xac\
-\x9d\xe7\x87\xbd\xa6\xea\x9eP\x80\xdf\x18G9\x9a\xfad\
-\xe3w\xde?\x11\xafN\xcf(\xc0M\x14\x97\x96{\xe9\
-\xfd\x0ap\xe3\xdc\xecT\x84{\x8cG\x9b\x1f\x898\xbc\
-u^\xc8\xf1zx\xddB\xf9\x0b\x05\xb81\xfa\xe0s\
-\xb8\xd9Fl/\x17\x9bL\xdc:5\xc3\xf06\x01\x87\
-\x84Z[\xab\x85\x08\xefo\x8e\xb1\x00_w2\xf4\xd5\
-\x86m\x1c\x1dyx'e\x1a\xdemLr\xea\xd7K\
-\x14\xe0\xb6\x8fQ\xf1\x98\xd3[\x0f\x1ch\xd4\xc6\xc1T\
-\xbf\xc2\xaa\xad\xf0v\xca<\xc0}\xc3\x14\x9a\xb5\x9e#\
-\xb2\xe3\x95b\xeb\xf8\x8f;\x99\xfar\xc36\xce\x8d4\
-\xb8u\xdf\xd0\x1f\xcb\x01\x00\x1fW\x80w\x8f\xc7\xad\x82\
-k\xb0[quJD\x81\xcd\xe9H\x9d\xf6\xce\x10\xac\
-u\xe8\xf7\x9b\x14\xe0\xdd\x8f\xeaz<\x9a~\xd7p\x9e\
-\xf1\xd9\x92C\xba\x05X\x04\x5c\x16\xa6H\x0e\xa3\xb8\xce\
-\xa5\x8b\x02\xda\x10W8\xd4duL\xa3\xfb1u\xf6\
-\x08\xa7_\xa9\x01F\xed\xfbJ\x89\xc1]\x09\x5c\x84\xef\
-\x1e\xe5\x1c\x18\x14<P\xdb\xc7\xe8\xba?>\xcf1j\
-[w\xca9I\xe3%\x8a\xed\x8dz\x1c\xb6\xe3v\x87\
-:\xfd\x5c\x01.\xe7\xf1\xf9x\xa3\xf6\x9d[Bx\xa7\
-c\xbf;J\xc0\x87\x9c\x1e\xa3\xbb*\xc0\xdb9\xd9\xa1\
-\x93\x9f\xc6f/g'|\xef\xb0}\x0d\xf8\xbc\x82\xe6\
-\xba\xa7\xfci\x87\xba}L\x01\xde\x8e\xc7\x0d\x83\x13\x8c\
-\xdav\xbccx7\x00\x1fU\xc8\xdc\x99\xe0P\xbb\x1f\
-+\xc0\xdb\xb1\xde\x10\xb0\xd5p\x00h\xaa\xe3/\xaf\xc2\
-[\x0e\xfd\x82',\xb5L\x01\xde\xbe\xf6\xd9\xfa\xc4\xc9\
-\x05\x86SGk\x9d\x02\xac\xc7\xe6rYd\x5c\xbf\xd6\
-\xe0\xdd\xec\x03\xfcI\x87p\x9c\x1f\xf9\xc2\x8d\xe9\x0aT\
--\x1e\xa3G)\xc0\xf6\xd7eX>>{,\x8aO\
-\xea\xe4\xff\x1aq\x90\xc3c\xf4$\x05\xd8~\x84p\x91\
-a\xdb<\xce\xb8:[a\xaa\x0c\xeb\xfd\xdb\xcbr\x0f\
-po\x87\xf7\xdf\xefD\xdc\xb6\x95h\x19d\x95|\xcf\
-\xe1=x\xff\x9c\x03<\xcc\xe1\x17\xee\xc3Fm\x1b\xee\
-\xd0\xb6\x8b\x14\xa2J\xf1\xa8\xe9\xf19\x07\xd8z`a\
-S\x189\xb6h\xdbx\xe3\xb6m\x09\xd3\x19\x0aR\xb5\
-\x07\xdfm2\xae\xeb\xb8\x9c\x03|\xa3qg>d\xd8\
-6\xeb#s\x16)@Q\xf0\xb0q]\xaf\xcb9\xc0\
-\xd6\x97\x96}\xcf\xb0m\xf7\x19\xb7\xed\xbb\x0aO\x14\x5c\
-n\x5c\xd7\x859\x07x\xb5qg\x8e6l\xdb\x1f\x8c\
-\xdb6R\xe1\x89\x82\xd3\x8d\xeb\xda\x9ck\x80\x07:\x0c\
-(\x0c1l\xdf3\xc6m;L\xe1\x89\x82w8\xf8\
-\xae_\x8e\x01\xb6\x1e\x81n\xc1\xf6\xc0\xb1W\x8c\xdb\xa7\
-\xad\x82q\xd0\x95b\x1d\xba\xa5N\xc81\xc0g\x1aw\
-\xe2R\xe3\xf6Y\x8fVj\x93~<Xo\x9e9#\
-\xc7\x00_d\xdc\x893\x8c\xdbgy\xfb\xfb\x06\x85&\
-*n5\xf6\xde\x859\x06\xf8\x07\xc6\x9dx\x99q\xfb\
-V\x18\xb6m\x85BS\xeb#g'\xe6\x18`\xeb3\
-\xb0\xce7n\xdfl\xc3\xb6\xcdVh\xa2\xe2K\xc6\xde\
-\x9b\x96c\x80\xef5\xeeD\xeb;\x5c-\xef'>]\
-\xa1\x89\x8a3\x8c\xbd\xf7\xeb\x1c\x03\xfc\x94q'\x1e\xeb\
-0Zi\xf1\x18\xfd,y\xde\x12\x98\xd3AwKr\
-\x0c\xf0\xca\x88\xe7\x80\xb7q\xaaA\xbbt\xddI|\xbc\
-\xdd\xd8{\xcf\xe4\x18`\xebs\x96\xbd\x8e7\xe9\xc8\xa6\
-\xfeI\x0aK\x94\xf45\xf6\xde?s\x0c\xf0K\xc6\x9d\
-\xb8\x9fS;;\xb53\xc4\xba%0^z\x1b{\xef\
-\x85\x1c\x03\xdcl\xdc\x89=\x9d\xdb{*\xc5\x0d\x80m\
-I\xb7\x04\xc6\xcf~\xc6\xde{)\xc7\x00\xaf3\xee\xc4\
-\x1e%\xb4\xb9k\x18\x9d\x9eEq3\xe0ftK`\
-\x8a\xf44\xf6^s\x8e\x01\xdeh\xdc\x89:\xaaF4\
-J\x0fc\xef\xad\xcb1\xc0\xd6\x0b\xca;\xcb\x98\xa2A\
-\xba\x19{\xef\xd5\x1c\x03\xbc\xde\xb8\x13{\xc9\x98\xa2\xa2\
-A\xac59\x06\xf8y\xe3N\x1c,c\x8a\x06y\xab\
-\xb1\xf7V\xe6\x18`\xeb\xf3\xa0\xdf-c\x8a\x069\xc2\
-\xd8{\xcbr\x0c\xb0\xf5\xe1b\xc7\xc9\x98\xa2\xa2\xa5\x94\
-\x0f\xe5\x18\xe0{\x8c;\xf1\x14\x19S4\xc8Hc\xef\
-\xdd\x9dc\x80g\x1aw\xe2\xf92\xa6h\x90\x09\xc6\xde\
-\x9b\x91c\x80\xad/\xf5\xbeF\xc6\x14\x0db}i\xdd\
-\x94\x1c\x03|\x89q'\xde)c\x8a\x06\xb9\xdb\xd8{\
-\x17\xe7\x18`\xeb\xf3y\x97\xc9\x98\xa2A\xfel\xec\xbd\
-\xd19\x06\xf8\xbd\xc6\x9d\xb8\x1e\xd8C\xe6\x14\xb4\xbd\xbb\
-\xccz\x19\xef\xe19\x06\xf8\xcd\xd8\xebP\x19T\xb4\xc1\
-\x10\x07\xdf\xf5\xca1\xc0M\xd8_\xadr\x86\x0c*\xda\
-\xe0\xd3\xc6\x9e[U\xe5\xe7\xa9\xba3\x9f0\xee\xcck\
-eP\xd1\x06?6\xf6\xdc\xa39\x07x\x86qg>\
-,\x83\x8a6\xf8\xbd\xb1\xe7\xa6\xe7\x1c\xe0/\x1aw\xe6\
-F\xb4\xa1^\xbc\xfe\x81\x0c-\xc6\x9e\xbb \xe7\x00\x0f\
-u\x18P8FF\x15\xbb\xe18\x07\xbf\x1d\x99s\x80\
-\xbbc\xbf\xb1\xffr\x19U\xec\x86\xab\x8c\xbd\xf6Z\xf0\
-p\xb6\x01\xf6\x18\xc8zJF\x15\xbb\xc1\xfaV\xc2\xc7\
-\xaa\xfeL1t\xeau\x0e\x8f5\x83dV\xb1\x13\x87\
-8\xf8l\xb2\x02\x0cg9t\xec\x17dX\xb1\x13\xe3\
-\x1c|v\x96\x02\x0c\x07;t\xec\xbd2\xac\xd8\x89y\
-u|\xd2\x8b\xa5s\xffh\xdc\xb1[\x81\x812\xad\xd8\
-\xe1Gb\xab\xb1\xc7\xa2\xd8<\x13K\x07_\xe9\xf0\xed\
-\xf85\x19W\x04.u\xf0\xd7\x15\x0a\xf0v\x8ew\xe8\
-\xe0\xbf\xa2\xddI\xa2\xf0\xc0?\xea\xba\xde \x96N\xee\
-\x82\xfd\xc6\x06\x80\xa3d\xe0\xec9\xd6\xc1W\xcd\xc0\x9e\
-\x0a\xf0\xffr\xabCG\xdf,\x03g\x8f\x87\xaff\xc6\
-\xf2\xf9b\xea\xe8O9t\xf4ft\xe0{\xce\x1c\x0a\
-lq\xf0\xd5\x18\x05\xf8\xff\xd9\x1b\xfb\x1b\x0bA\x97l\
-\xe7\x8c\xc7\x22\xa1\xb5\xc0^\x0a\xf0\xae\xf9\x99C\x87o\
-\x00\x0e\x90\x99\xb3\xa3\x0f\xc5\xa5c\xd6\xba!\xa6\xcf\x99\
-\xc3\x80\x03a\x1aA\xa6\xce\x8b\xcb\x9c\xbc4T\x01.\
-\x7f\xc8\x7f\x1d\xd0W\xa6\xce\xea\xd7\xd7\xe3u\xeco\xb1\
-MM\xe62\xe9Nx\x1f\x92\xb9\xf3\xe0F'\x0f]\
-\x12\xdbg\x8d\xb1\xf3\x07;\x8d\x1cn\x06\xde&s\xd7\
-\x9e\xc3\x9c\xfc\xb3\x85\x08\x97\xe7\xc6Z\x849N\xdf\xa0\
-se\xf0\xda\xf3k'\xef\xcc\x8c\xf1\xf3\xc6Z\x84\xf7\
-\xe3\xa7\x8f\xca\xe4\xb5\xe5c\x8e\xbe9B\x01~c\xcc\
-w*\xc4\xbf\xa8\xf0 n\xe1\xc6\xbe\xc0sN\x9e\x89\
-v{j\xcc\x059\xc9\xf1\xdb\xf4\x06\x19\xbev\xfc\xd4\
-\xd1/'*\xc0\xed\xe3I\xa7\x82\xb4\x02\xc3e\xfa\xda\
-\xf0\xa1PS\x0f-%\xe2]m\xb1\x17\xe6L\xc7o\
-\xd5\x15@O\x99\xbf\x16\x8f\xce\xcf:\xfadl\xcc\x9f\
-?\xf6\xe2t\xa68\xf9\xc0Kw\xa2=\xc3\xa9\xef\xf5\
-\x9d\xe3\xe8\x8f\xa5\x14\xb7\x19*\xc0\x1d|<\xf2\xd4\x85\
-\x0aB\xb2\x5c\xe4\xec\x8d\x13c\xef\x83T\x0a\xf5\x1b\xc7\
-\x22m\xa6X\x83\xad@\xa4\xc5P\xec/\x05\xd8Qw\
-\xa7\xd0\x0f\xa9\x14\xeb\x9dN\xabk\xb6\xe9\x05\xb4V:\
-%\xfa\x01/:\x7f\xa9\x1f\xa6\x00\xdb\xf2\x13\xe7\xc7\xa5\
-\xc75\xa8\x95\x04=\x81\xc5\xce^\xb8>\x95\xfeH\xed\
-[w\x9ds\xe1\xeeE\xb7\x1b\xc6LW\xe0>g\x0f\
-\xac\x05\x0eT\x80}8\x07\x7f\xcd\x8c}\xe41\xe3\x11\
-\xe7\x9bJ\xa8\xff\xd9)\xf5K\x8aE\x9cWB\x11\xaf\
-U`\xa2\xe3G%\xd4\xfd\xfe\xd4\xa6\x15S,\xe4`\
-\xe0?%\x14s\xb2\xe6\x88\xa3\xf9\xd2\xbe\xba\x84z\xaf\
-\xa78\x04\xafI\x01\xf6g<\x92d\xabsS\xccB\
-\xaa\x01\xee\x04,\x90\xe7$#\xcdO\xf5i+\xe5G\
-\xab\xb7\x86\x11CI\xea\x88V\x03oI5\x07\xa9\xbf\
-\x1f\x8d\xc2o\x17\x8aT\x7f\xb5\x02\xa7\xa4\x9c\x81:\x0c\
-r\x5c)\x1fJ\xed\xd4\xe5\xa9\xfb\xbf\x0e\x01\xee\x8c\xff\
-\xe4\xbeT?\xcd#\x92\x0b\xcar\x0fp\x13\xc5:\xe6\
-\x17\xe5I\xa9A=OB\xab\xadr\x08\xf0>\x14k\
-\x99%\xa9\x11-\x01\xde\xa4\x00\xc7\xc1\x81\xf8\x1d\xbd#\
-\xd5;\xc4}\x14\xe0\xea\x8fSyB^\x94\xda\xa9e\
-$~Bi\xca\xe1\xed\x0e<(\x0fJ\x1d\xd4\x03@\
-7\x05\xb8|n\x90\xf7$#MV\x80\xcb\xe54y\
-N2\xd6X\x05\xb8\x1c\xfa\x03k\xe47\xc9X\xabI\
-\xf0X\xa5\x14\x03<K^\x93\x9c4]\x01\xf6\xe5\xc3\
-\xf2\x98\xe4\xa8V\xe08\x05\xd8\x8fE\xf2\x98\xe4\xac\x05\
-\x0a\xb0\x0f'\xc8[RI:F\x01\xb6g\xae|%\
-\x95\xa4\xbb\x14`[\xfa\xe0{\x0a\xbf$\xed\xa8\xcd$\
-\xb2\xd9!\x95\x00_\xe8\x5c\xb0\x8d\xc0\xed\x14\xc7\xd6\xbe\
-\x87\x1al3\xab!]Bm\xce\x0d\xb5jq\xf6\xc4\
-\x05\x0a\xb0\x1d\x0b\x1d\x0bu\x0b\xc5\xdc\xb2B\x92\x16\x07\
-\xe1;\xa58_\x01\xb6ao`\x93C\x81\xb6\x84_\
-\x5c\x85!m\xce\xc3\xe7\xde\xac\x16\xa0\x87\x02\xdcq>\
-\xe2\xf4\x0d\xab\xf0\xd6\x87qN\x1e\xd1\xf5\xa2\x06\x5c\xe2\
-\xf4\xd8,\xe3\xd7\x8b\xd9\x0e>\xf9\xaa\x02\xdcq~\xe1\
-0`\xa5w\xde\xfa1\xc0a`k\x9a\x02\xdcq~\
-o\x5c\x94\x9bd\xf6\xdar\xb3\xb1W\x1eV\x80;\xce\
-J\xe3\xa2\x8c\x94\xd1k\xcbhc\xaf\xacP\x80;\xce\
-+\xc6E\x19$\xa3\xd7\x96\xc1\xc6^yY\x01\xee8\
-\xd6SH\xba\xc0\xbb\xbetu\x98JR\x80#\x0bp\
-\x17\x19]\x01V\x80\xf5\x08-\xe2\xe3\x10=B\xc7\xc7\
-3\xc6E\x19%\xa3\xd7\x16\xeb\xb3\xd24\x88\x15\xe14\
-\xd2t\x19\xbd\xb6\xcc\xd04R\xfd\x17r\xb4P,\x84\
-\x97\xe1\xeb\xc5@-\xe4\xc8g)\xe5,\x19\xbev\xcc\
-\xd1R\xca8\x19\x8e\x8f\xce\x93\xe9k\xc3\x05N\x1e\x19\
-\xa6\x00\xc7\xbd\x9dp\x9c\xcc_\x8b\xf0nu\xf0\x87\xb6\
-\x13\x1a\xe2\xb9\xa1\x7f6\xc5Bx\x85!\xbdw\xde\xdb\
-\x1c}1/\x85~H\xa5X_\xc4W-\x14\x0b\xe1\
-G\x87\xe5xZ\xad\x15\xe7\x22\x8dC\xc2T\xd1\xcdN\
-Oe;j\xbc\x02\xacC\xed\xa44\xa5C\xed\x1c\xd0\
-\xb1\xb2RY\xfaU*\xb9H)\xc0\xc7\xc9WRI\
-\xd2\xc1\xeeN<$oI\xce\x9a\x9fR&R\x0b\xb0\
-\xaeW\x91<\xd5\x0a\x1c\xab\x00\xfbr\x8b|&9)\
-\xb9\xe3\x96R\x0cp?t\xc1\xb7d\xaff\x12\x19y\
-N=\xc0\x1eg\x1fIR\x92\xdbLS\x9e\xd8\xbfN\
-\x9e\x93\x8c4)\xd5\x1c\xa4\x1c\xe0n\x14\xcb\xdd$\xa9\
-#\xba\x8f\x84W\xde\xa5\xbe\xbc\xae'\xf0\x84<(\xb5\
-SO\x01\xbdR\xce@\x1d\xd6\xc8\xf6\x01\x96\xc8\x8b\xd2\
-\x1b\xd4\xe2\xe0\x9d&\x05\xb8z\xf6\x01~+OJ\x0d\
-j\x1e\xb0o\x1d\xbc_\xa7\xdd*\xdd\x80)\xf2\xa6\xd4\
-\x86~D\x8dv\x9b\xd5\xf5z\x8d\xd5\xf2\xa9\xb4\x93\x9a\
-\xa9\xe1\x89\xa4u\xdd;\xda\x97bUM\xab|+\x01\
-\xb7\x92\xe0\x22\x8d\x9c\x03\xbc\xe3\x0e\xa6\x05\xf2o\xb6z\
-\x90\xc4\xd66+\xc0\xbb\xe6\x18\xe0.\x8a\x8d\xdaR\xbd\
-\xf5\x1a\xc5~\xde\xa3s\xf0vn\xc7\xb2\xf4\xa18\x04\
-m>\xf6g\x08K\xd5\xa9%\xd4t<\xd0;'O\
-\xe7|\xc6\xd2^\xc0\x89\x14g\xffN\x03\x1e\x01\x96S\
-\xdc\xc5\xb4I\x99\x88N\x9bBm\x96S\xdc\x980\x15\
-\xb8\x98\xe2\xe8\xd7\x1e\xb9\xfaX\x87\xa5\x09\xa1\x00\x0b!\
-\x14`!\x84\x02,\x84\x02,\x84P\x80\x85\x10\x0a\xb0\
-\x10B\x01\x16B\x01\x16B(\xc0B\x08\x05X\x08\x05\
-X\x08\xa1\x00\x0b!\x14`!\x84\x02,\x84\x02,\x84\
-P\x80\x85\x10\x0a\xb0\x10B\x01\x16B\x01\x16BT\xcd\
-\x7f\x01\xa5:4L\xcdO\x07\x92\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x14\xd2\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.7 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-08-17T09:26\
-:41+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-08-17T09:27:41+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-08-\
-17T09:27:41+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:83574\
-5ab-80b6-0a47-8a\
-ab-135f1c4adb0a\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:83574\
-5ab-80b6-0a47-8a\
-ab-135f1c4adb0a\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:835745ab-80b6\
--0a47-8aab-135f1\
-c4adb0a\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:835\
-745ab-80b6-0a47-\
-8aab-135f1c4adb0\
-a\x22 stEvt:when=\x222\
-023-08-17T09:26:\
-41+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.7 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\xde\x93\xde\xdd\x00\
-\x00\x0f\x8aIDATx\xda\xed\x9dk\xb0^Uy\
-\x80O\x12\x92@\xc0\x84\x80\xdc\xe4\x92 h\x11;u\
-\xb4\xb5A\xa9\x10\x04\xacJ\x03\xd6\x10A\x12\xc2\xc5 \
-\xd3ZB\x9d\xd1\xd6\xa2\xa1\x94K8\xd8:\x9d\xd4v\
-\xb8\xb4\x82\x86\x82\x1cb0\x16E\xd3\xd1q\xac\x80\x01\
-I\xccP\xbc\x04Bn\xd2\xaa\xa8\x99\x10\x92\x9c\x5c\xcf\
-\xd3\x1fkSB8'9\x97\xb5\xf6^{\xef\xe7\x9d\
-yf\x1c\x85\x98\xbd\xde\xf7\xf9\xbe\xfd\xad\xcb\xbb:\x80\
-\x0e\x11\xa9'\x0e\x82\x88\x02\x8b\x88\x02\x8b\x88\x02\x8b(\
-\xb0\x88(\xb0\x88(\xb0\x88(\xb0\x88\x02\x8b\x88\x02\x8b\
-\x88\x02\x8b(\xb0\x88(\xb0\x88(\xb0\x88(\xb0\x88\x02\
-\x8b\x88\x02\x8b\x88\x02\x8b\x88\x02\x8b(\xb0\x88(\xb0\x88\
-(\xb0\x88\x02\x8b\x88\x02\x8b\x88\x02\x8b\x88\x02\x8b(\xb0\
-\x88(\xb0\x88(\xb0\x88(p\x0d9\x1a8\x0d\xb8\x0c\
-\xb8\x16\xf8g`!\xf00\xf0\x13`\x0d\xb0\x1e\xd8A\
-\xef\xf1\x02\xf0+\xe0Y`9\xf0\x10\xf0%\xe0\xb3\xc0\
-\xd5\xc0\xb9\xc0\xef\x02cZ:\xbe\xa3\x80\x0b\x81\xfb\x80\
-\x95\xc58\xee(\xfe\xf3}\xc5\xff6J\x81e_\x8c\
-\x07\xce\x04>\x0e|\x11X\x06l\xa6\xdc\xf89\xf0M\
-\xa0\x13\x98\x0e\x9c\x0c\x0ck\xf0\x98O\x05\xd6\xf5c\x5c\
-\xd6\x15\xff\xac\x02\xcb\xff3\x11\x98\x09\xdc\x0e<\x05\xf4\
-\x90g\xac\x07\xbe\x01\xcc)\xde\x04F6`\xec\x87\x03\
-\xf3\x061\x16\xf3\x8a\x7fW\x81[\xc8\x18\xe0}E\x11\
-\xac\xa0\xbe\xb1\x11\xf8\x1a\xf01`BMs1o\x08\
-\xcf?O\x81\xdb\xc3\x81\xc0\x05\xc0W\x80-43\x9e\
-\x00\xae\x01N\xaa\xd1k\xf3Pc\xaa\x027\x97\x11\xc0\
-9\xc0\xfd\x0d\x96vo2\xcf\x06^\x9b\xf1\x84\xd5\xaa\
-\x08\xcf\xb9\x06\x18\xad\xc0\xcd\xe2\x04`.\xf0\x1c\xc66\
-\xe0\x01\xe0\xac\xcc&\xc1.\x8c\xf8\x8c\x17(p3\x98\
-\x0c,\x02v\xe9m\xaf\xf1\xd3\xe2\xf7\xf2k2\xc8U\
-W\xc4\xe7\xeaR\xe0z\xcfb~\xb8X\xea1\xfa\x17\
-\xbf\x05\xfe\x0e8\xb4\xc2\xbc\xad\x8a\xf8<\xab\x14\xb8\x9e\
-\xbfog\x00?\xd3\xc7A\xc7\x8b\xc0\xe7\x80\xc3+\xc8\
-_w\xc4\xe7\xe8V\xe0\xfa0\x0c8\xbf\xe6\xcb?9\
-\x8a|=0\xb6\xc4<\xc6\x0e\x05\xae\x01\xef\x00\x1e\xd1\
-\xb7d\xf1\x1b\xc2\x96\xce\xfd\x14X\x81c\xf2:\xe0\xcb\
-\xe4\xbbC\xaai\xf1\x14\xf0n\x05V\xe0\x18\xbfsg\
-\x13\x0e\x01\x18\xe5G\x17p\xa4\x02+\xf0`x\x0b\xb0\
-T\x87*\x8f\xf5\x84\xd3W\xc3\x14X\x81\xfb\xc3~\xc0\
-\xa7\x09\x1b\x10\x8c|\xe2?\x81c\x15X\x81\xf7\xc6\x1b\
-\x81\xc7t%\xebo\xe3i\x0a\xac\xc0\xbd1\xa3X\xce\
-0\xf2\x8f/\x00\x07)\xb0\x02w\x00\xfb3\xb4#e\
-F5\xf13\xe0\xcd\x0a\xdcny\x8f!\x9c\x9a1\xea\
-\x19\x1b\x09\x9bj\x14\xb8\x85\x9c\x0e\xfc\xba\x86E\xbb\xa9\
-\x98\x1d\xef\x22\x9cx\xba\x128\x8f\xb0\xc9\xe4D\xe00\
-z\xefi5\x9c\xd0\xaa\xe7hB\xdf\xab\xb3\x8a\x9f\x0d\
-\x7f\x0d\xdcVL\x12\xad\xa9\xe1x\xf4\x007\x0cb\x96\
-Z\x81k\xccG\x81\xed5(\xce\xad\xc0\xf7\x09}\xa9\
-\xa6\x15\x93l\xa9\xdb\xb8\x1cLh\x97s5\xa1\x91\xdb\
-\xba\x9a\x88|_\xf1sH\x81\x1b\xcc\xb0\xe2\xd3:\xd7\
-\xd8\x05<^\xfc\x1d\xdfE\x85\x07\xc5yu\xcf\xae+\
-\x08\x8d\x09\xd6g<~\x8f\x14o \x0aL3\xd7w\
-\xef\xcc\xb0\xe8v\x14\xaf\xafW\x0c\xa0\xf8\xaad$p\
-6p+\xa1Emn\xb1\x028N\x81\x9b\xc5h\xe0\
-?2+\xb4'\x81\xbf\xac\x89\xb4{\xfbP\x9c\x02,\
-(^\xf7s\x89\xb5\xc5\xcf\x0d\x05n\xc82\xd1C\x99\
-\x14\xd66`>\xf0\xf6\x06\x8e\xf3\x11\x84\x1dl?\xcf\
-d\xac\x7f\x09\xfc\x9e\x02\xd7\x9b\x03\x80\xc5\x19\x14\xd3\x06\
-\xe0&\xe0\xa8\x96\xfcT\x99\x0e\xfcw\x06\xe3\xfe<}\
-\xaf\x15+p\xe6\x8c\x02\xbeUq\x01\xad'\x5c\x81r\
-p\x0bg\xfa\x87\x11\xaejY^q\x0e~\x01\xfc\x8e\
-\x02\xd7\xef\x18\xe0\x82\x0a\x8b\xa6\x1b\xb8\xa5\xa5\xe2\xf6\xb6\
-\xfe|\x11\xe1~\xa1\xaa\xe29\xe0\xf5\x0a\x5c\x9fO\xfe\
-/TX,]\xd4\xf7\x96\x82\xd4\x13\x89\x9f\xa2\xba\xfd\
-\xe6+xe\x8fj\x05\xce\x94\xaa\xd6y\x9f\x01\xde\xa3\
-\xa8\xfb\xe4\xe8\x0a\xdf\x8e\x1e\xe5\xe5]j\x0a\x9c!\x97\
-P~\xdb\x9b\x9d\x84\xeb9\xf7W\xce\x01\xf1A\xe0\x7f\
-+\x90xQ\xf1Z\xaf\xc0\x99q:\xe5\x1f\xc2\x7f\x06\
-8U\x19\x07\xcd!\x15}\x1b\xdf\xa4\xc0yq\x1c\xe5\
-\x1fL\xb8\x9b\xa1\x9fI\x95\xc0e%\xff6\xeeQ\xe0\
-\xbc&G\x1e/1\xf9\x9b\x8b\x82S\xbc\xb8\x9cL\xbd\
-\x9b\xe4+\xf0 \xb9\xa3\xc4$\xad\x05\xde\xaal\xc9\x18\
-K\xb8\x08M\x81[\x22\xf0\x8c\x12\x13\xf40a\xbb\xa0\
-\xa2\xa5_\x06\xecT\xe0\xe6\x0b<\x91\xb0E\xb1\x8c\xf8\
-\x8a\xb3\xcc\xa53\x8bz\x9c\xd9V\xe0A0\xa2\xf8F\
-,#>O\xfaC\xf4\xd2;S\x88{\x09\x99\x02g\
-\xc25%%\xe5f%\xaa\x9c3\x08\xbd\xaf\x14\xb8!\
-\x02\x9fT\xd2\xa7r\xa7\xf2du\xa9\xdcF\x05\xae\xbf\
-\xc0\xc3\x09\xdb\xe1R\xc7-J\x93\x1d\x93\x8b%<\x05\
-\xae\xb1\xc0\xb3KH\xc4m\xc4\xbf\x87G\xe2\xf0>B\
-\x0b\x22\x05\xae\xa1\xc0G\x90\xfe\x96\xc0\x05NX\xd5b\
-\xd7V\x8f\x02\xd7O\xe0\xbb\x12'`\x09\xa1\x83\x87\x92\
-\xe4\xcfu\x0a\x5c/\x81'%\xfe\xd4]\xeb&\x8d\xda\
-m\xf6X\xa8\xc0\xf5\x118\xe5\xc4U7\xf0\x07JQ\
-;\x0e\x22\x8f\xbe[\x0a\xbc\x0f\xfe4\xf1\xc0\xcfR\x86\
-\xdarbF\xcbK\x0aL\xef;\xae\x9eJ8\xe8w\
-+A\xed\xb9X\x81\xf3ef\xc2\x01_\x0d\x8cS\x80\
-F0_\x81\xf3\xdc\xb4\x91\xea|\xe8.\xc2\xddC\x16\
-\x7f\xbc\x16\xbe\x17\x12.\x18[\x99\xf1Z\xad\x02\x97\xc8\
-\xf9\x09\x07\xfb\x1f\x95.\x1aS\xa9\xcf\x0d\x86\x0a\x5c\x22\
-\xa9.\xde^\x05\x1c\xa8xQ\xde\x90\xe6\xe9\xad\x02\xf7\
-\xc6\x99\x09\x07\xfa\xbd\xca\x17\x05\xe5U\xe0>Y\x94h\
-\x90\x17)^\xb4\xd7fC\x81{e\x02\xa1\xd7r\xec\
-\xe8\x06NP\xbe(\x13V\xab\xf4U\x81\xfb\x22U?\
-\xa4\x7fP\xbe(\x5c\xa8\xab\x0a\xdc\x17\xfb\x11\xeeu\x8d\
-\x1d\x1b\x80C\x95/\x0a]\xba\xaa\xc0}qN\xa2\xc1\
-\x9d\xa3x\xd1\xf0\xf5Y\x81K\xfdt\x7f\x01\xaf\xf9\x8c\
-I\xb7\xae*po\x8cKT\x1c\xf6\xb6\x8a\xcb\x16]\
-}UlV\xe04M\xda\xb7\x02G*\x9d\xaf\xd0\x89\
-c\x95\x02\xa7\xb9R\xc3\xd3FNb\x95\x11]m\x17\
-\xf8@\xd2t\x1c\x9c\xa4p.#\x95\x10\x17\xb4]\xe0\
-\x14\x87\xf6\x97*\x9b\x1b9J\x885\x84\x1b2[-\
-\xf0\xad\x09\x06\xf6jes+e\x091\xb5\xca\x5c\xe4\
-R\x10+#\x0f\xeav\xe0pE\xf30C\xe2\x98W\
-u\x1er(\x84\xd7'\x18\xd8\x87\x14\xcc\xe3\x84%\xc8\
-;\x5c\x81\xe1\x8a\x04\x83k\xa3:\x0f\xf4\xa7\x8auU\
-\xbf6\xe7&\xf0]\x91\x07x'p\x98b\xd9R'\
-R\xec(\x9e\xe9\xbe\xe2\x19G\xe54\xf69\xfc%b\
-\xf7\xbdzX\xa1\xa4-T\xfd\x17x-\xf1o\x5c\xb8\
-\xd6\xc4\x8a\x02\x97\xc3\xfb\x13\xbc\xf2\xbc\xd3\xc4\x8a\x02\x97\
-\xc3\xa7\x22\xcb\xbb\x89p\xa6\xd8\xe4\x8a\x02\x97\xc0=\x91\
-\x05\xfe\x8eI\x15\x05.\x8f'#\x0b|\x83I\x15\x05\
-.\x87\x11\xc0\xb6\xc8\x02\x9fkRE\x81\xcb\xeb>\x19\
-;&\x9aTQ\xe0r\x98\x1cY\xde\x8d\x84\x8b\x9fM\
-\xac(p\x09\x5c\x16Y\xe0%&T\x14\xb8<\xae\x8b\
-,\xf0\xbd&T\x14\xb8\xbeg\x80o4\xa1\xa2\xc0\xe5\
-\xb1 \xb2\xc0\x9e@\x12\x05.\x91\xefE\x16x\x8a\x09\
-\x15\x05.\x8f\xa7\x22\x0b\xfc\x0e\x13*\x0a\x5c\x1e\xab#\
-\x0b\xfc\x06\x13*\x0a\x5c\x1e\xcfG\x16\xd8\x06\xee\xa2\xc0\
-%\xb2)\xb2\xc0\xe3L\xa8(py\xc4\xbe\xc4{\xa4\
-\x09\x15\x05.\x8f]\x91\x05\x1enBE\x81\xcbc\x9b\
-\xdf\xc0\x92!'\x01W\x027\x11n\xb6\xfc[\xe0|\
-\xe0\x10\x05~%\xb1\xaf\x12\x1dm\xf1\xc9\x10\x98J\xb8\
-\x8e\xa7\xaf\xd8\x0e|\x19x\xa3\x02\xa7\x99\xc4\x1ak\x11\
-\xca \x18\x0b|u\x00u\xb6\x15\xb8J\x81\xe3/#\
-\x1dc1\xca\x009\x18X6\xc8z\x9b\xdbv\x81c\
-\xdf\x87t\xb2\x05)\x03`\x18\xf0\xf5!\xd6\xdc\xc5m\
-\x16xid\x81m'+\x03az\x84\x9a\xdb\x00\x1c\
-\xdaV\x81\xbf\x1bY\xe0\xa9\x16\xa5\x0c\xe0\xdbwE\xa4\
-\xba\xbb\xbe\xad\x02\xdf\x1fY\xe0\xab,L\xe9'\xa7D\
-\xac\xbb\xd5m\x158\xf6\xd5\x94\x9d\x16\xa6\xf4\x93\xbf\x8a\
-\x5c{\x13\xda(p\xecA\x5c`aJ?\x89}\xa1\
-\xc0Ym\x14xF\xe4A\x5cnaJE\x13\xa8\xe7\
-\xb5Q\xe0\xd3\x22\x0f\xe2fl++\xfd\x9b\xc0\x8a\xbd\
-\x89hr\x1b\x05>\x8a\xf8q\xa2\x05*\xfb\xe0\xf8\x04\
-uw\x5c\x1b\x05\xee 4c\x8f\x19\x1f\xb2@e\x1f\
-L\x8b\x5cs\x9b\xaa|\xf3k\xdao\x91\x9b-P\xd9\
-\x07\x9d\x91kni[\x97\x91R\xcc\x06z\xbd\xa8\xec\
-\x8boG\xae\xb9{\xda,\xf0'\x22\x0f\xe6\x16<V\
-(}3*\xc1\x04\xd6'\xdb,\xf0\xbb\x13L(\x9c\
-j\xa1J\x1f\xfcQ\x82z;\xa3\xcd\x02\x1f\x0c\xf4D\
-\x1e\xd09\x16\xaa\xf4\xc1\x9c\xc8\xb5\xd6S\xd4pk\x05\
-\xee\x00\x9e\x8e<\xa8\xdeR(}\xf1h\xe4Z{\xba\
-\xeag\xcaaP\xef\x8c<\xa8\xbb\x80#,V\xd9\x83\
-\xc3\x89\xdfH\xf1.\x05\x86K\x12\xfc.\xb9\xdc\x82\x95\
-=\xb84A\x9d]\xaa\xc0iv\xc6,\xb6`e\x0f\
-\xbe\x99\xa0\xce&(p`u\xe4\x81\xddQ\xbc2Y\
-\xb8\xf2\xd2\xeb\xf3\x8e\xc85\xb6*\x87g\xcbe\x80\xff\
-%\xc1\xa7\xa3\x07\xfc\xe5%\xfe\x22A}\xdd\xa6\xc0/\
-\xf3\xfe\x04\x03\xfc\xa4\x85+\x05\xcb\x12\xd4\xd79\x0a\xfc\
-2\x07\x10\x8e\x03\xc6\x8eI\x16o\xeb\x99\x94\xa0\xae\xb6\
-\x00c\x14\xf8\x95,J0\xd0wY\xc0\xad\xe7\xce\x04\
-u\xf5`.\xcf\x97\xd3@_\x94`\xa0\xb7\x11\xce\x1d\
-[\xc8\xed\xe4\x08\xe2_\xe1\x030S\x81_\xcd\x81\xc4\
-\xdfh\x0e\xe1\x92*\x8b\xb9\x9d\xdc\x9c\xa0\x9e\xba\xc9\xe8\
-.\xea\xdc\x06\xbc+\xc1\x80\xaf\xc7\xcb\xbf\xdb\xc8\xd8\x22\
-\xf7\xb1\xa3+\xa7\xe7\xccm\xd0\xcf%M\x5ckA{\
-p!R\x9c\xa7\xc0}\xb3\x1f\xf0\x5c\x82A\xdf\x00\x8c\
-\xb7\xa8[\xc3\xb8D\xdf\xbe\xbf \xb3{\xa8s\x1c\xfc\
-\x1b\x12}r\xdeba\xb7\x86\xb9\x89j\xe8\xc6\xdc\x9e\
-5\xc7\xc1?\x9e\xf8\xa7F^\x9a\x91\xb6ke\xf39\
->\xd1\xcc\xf3.`\xa2\x02\xf7\x8f\x07\x13}\x82\xdeo\
-\x817\x9e\x05\x89j\xe7\x1b9>o\xaeI\x98L\xba\
-\xf8c\x8b\xbc\xb1\x9c\x9d\xb0n\xceT\xe0\x81\xf1X\xa2\
-D\xac.\xd6\x9c-\xf8fq\x00\xf1/\x8d\x7f)\x96\
-\x93\xe9\xad\x1f9'\xe4\xa2\x84\x9f\xa6Nh5\x8f[\
-\x12\xd6\xcb\x87s}\xee\x9c\x132\x82x\x970\xef\x19\
-;\xb1{e\x938\xb5\xc8i\x8aXY,o*\xf0\
- \x98\x9e\xf0Su%p\x90\xc5_{^\x03<\x9b\
-\xb0Nf\xe6\xfc\xfc\xb9'g\x04\xf0\x93\x84\xc9\x99\xaf\
-\x00\xb5\xe7K\x09\xeb\xe3\xa7E\x0d*\xf0\x10\x98F\xda\
-\x98\xa5\x04\xb5eV\xe2\xda\xb8 \xf71\xa8C\x92\x86\
-\x01\x8f$L\xd2\x16\xe0m\xcaP;\xdeZ\xe4.U\
-<F\x0d\xee\x9b\xaeK\xb2\xfe\x90\xf878\xec\x1e\xff\
-\x03\x1c\xad\x14\xb5\xe1H`m\xc2z\xe8!\x5c\xc3\xd2\
-\xa1\xc0\xf1\xb8'\xf1\xeb\xd2\x0f\x80\xfd\x95\xa3\x16\xeb\xbd\
-K\x12\xd7\xc2\xbdu\x19\x8f:%\xeeu\xc0\x0b\x89\x13\
-\xf7@\xee\x93\x16-g\x04\xb00q\x0d\xbc\x08\x1c\xab\
-\xc0i\xb8\x8a\xf4q\xbb\xa2d\xcb?\x95\x90\xff\xab\xeb\
-4&u\xfc\x04~\xac\x84$v*K+\xda\xe3\xec\
-\x19\x8f\xd7\xed\x0d\xac\x8e\x89|\x0b\xe1h`\xea\x98\xab\
-4\x8d?\xdf\xbb{l/j\xabC\x81\xd3s\x0d\xe5\
-Dg\x1d\x96\x12\x1aNgI\xb9\xae\xe5\xbd\xd2uM\
-\xeap\xe0\xbfJJ\xec\x17\xc9x/l\xc3'\xacn\
--)\xc7\x8f\xd6u\xf2\xb2\xce\x09~C1cXF\
-,$\x93N\xfc-a\x7f\xd2\x1d\xcc\xefm\xd6\xf9\x84\
-\xba\x8eU\xdd\x13=\x9d\xf2\xe2ql\x12_\xd6&\x8d\
-%%\xe6\xf5\xe2:\x8fW\x13\x12~{\x89\xc9^\x07\
-\xbc]\xc9\x92\xf1\xb6b\x8c\xcb\x8a\xda/\x196\xe5u\
-\xebG%&}+p\xa5\xb2E\xe7\xa3\xa4iF\xd7\
-W,m\xc2\xce\xbb\xa6$\x7f\x22\xf0<\xe5\xc6\xdd\x84\
-\xee\xff\xca7\xf4\xf3\xbc\xf3K\xce\xdd\xaf\x09\xdd+;\
-\x148\xaf\xae\x0c[K.\x845\xc0iJ8hN\
-\x01\x9e)9g\xdb\x813\x9a2\x86M+\x88\x8fP\
-~\xec\x04>\xe7,\xf5\x80\x18\x03\xfc=\xe9\xda\xe0\xec\
--.m\xd2X6\xb18\xae\xa7\x9ax\x96\xd0\xd6T\
-A\xf7\xce\xd9\xa4m\x81\xb3\xb7\xb8\xb1i\xe3\xd9\xd4\x22\
-\xf9<\xd5\xc5\x83u^WL\xc8\xb1\xc5o\xdd\x9e\x8a\
-\xf2\xd2\xc8C*M\xde\xc5\xf3\xd5\x0a%\xee\x06>\x0b\
-\x1c\xaa\xb8\x1cBh\xf9\xba\xb5\xc2|4\xf6\x98h\x93\
-\x0bg4\xf0\x10\xd5\xc6\x06\xc2\xd5\xa6m\x9c\xad\x1e[\
-<\xfb\x86\x8as\xb0\x98\x067jhz\x11\x8d\x02\xbe\
-N\xf5\xb1\x11\x98G;\xda\xf6\x1c\x0e\x5c\x07\xfc6\x83\
-q_L\xe8\xe0\xd1\xa1\xc0\xf5n\xc1\xb2\x98<b+\
-\xa1\x0d\xea)\x0d\x1c\xe7I\x84\x83\x1f[3\x19\xebo\
-\xd1\x82\x16Imy\x9d\x1bMy\x9b\xe3\xfb\x1b\xcb\x80\
-\xd9\xc57V]\xc7\xf50\xe0c\xc5\xae\xa6\x9c\xe2\x01\
-Z\xd2\xdf\xacm\xc7\xd3\xee \xbf\xd8Q\xbc\xe6_^\
-\x08Q\x87W\xe4\xcb\x8a\xf9\x85\x1d\x19\x8e\xe7\xbf\xd1\xa2\
-\xbefm\x9bX\x19\x06\xdc@\xbe\xb1\x13\xf8>\xe1p\
-\xf9;\xc9\xe3\x1c\xf2H\xc2.\xb79\x84\xfe\xdc\xbb2\
-\x1e\xbf\xb9\xb4\xac\x01C[\x976ff\xf4[m_\
-\x93_\xdf)\x0a\xf3<\xc2\xfe\xdd\xd4\x05:\x01\xf8\x00\
-p\x13\xf0m`S\x0d\xc6i[\xf1\x06\xd3\xbaZn\
-\xf3\xfa\xe4\xbb\x08\x9b\xda\xeb\x16\x9b\x80'\x08\xbd\x8b;\
-\x81?\x03\xa6\x14\xdf\xd8'\x15\xaf\xe1\xe3\x8bo\xce\xdd\
-\xe7\x00\xc6\x13\xce\xda\xbe\xa9\xf8g\xff\x04\xf8sB\xb3\
-\xb8{\x8b?\xf3\xc5\x1a\x8e\xc7\xf3E.;\x14\xb8}\
-L\x04~\x88Q\xd7x\xa2\xc8a\x87\x02\xb7\x97\xd1\xc5\
-\x1a\xadQ\xaf\x98\xdf\xf45^\x05\x1e\x18\x17\x93\xfe\xe6\
-\x07c\xe8\xf1\x220\xc3zU\xe0\xbe&p\xbe\xa7#\
-\xd9\xc6\x12B3CkU\x81\xf7\xba^\xfc\x19\xcai\
-\x1eo\xf4/\xb6\x03\x9f\xc6{\xab\x14x\x00\xbc\x99p\
-c\xa1Qm,\x03~\xdfzT\xe0\xc16\x90\x9fM\
-X\x8f5\xca\x8d\x8d\x84\xcb\xec\x86[\x87\x0a<T\x8e\
-\x22l\xd4\xef\xd1\xab\xe4\xd1\x03\xfc;p\x8cu\xa7\xc0\
-)N\xdc,\xd1\xb1d\xf1\x83b\x8c\xad5\x05N\xba\
-\x9f\xfa\x83\xc0\x8f\xf5-Z\xfc\x18\x98\x86\x17\xc9)p\
-\xc9\xb3\xd53)\xbf-j\x93\xe2\xe9bM\xd7\xdf\xb9\
-\x0a\x5c\xe9D\xd7\x14_\xad\x07\x14?*>\xfc\xbc\xf5\
-Q\x81\xb3k\x99\xfa y\x1f\xb9\xab*v\x11\xce=\
-\x9fi\x9d(p\x1d\x0eI\xdc\x0c\xfcJo\xf9%\xe1\
-8\xe4D\xebB\x81\xeb\xc6\xc8\xe2\xf5\xba\x8br/\xee\
-\xaa:\xba\x09-\x8c>@h,h-(p\xed\x19\
-\x07\x5cB\xe8W\xbd\xb9\x81\xd2n\x06\xbeV<\xa3\x97\
-\xbe)p\xa3\x19C\xe8\xb0q\x07\xd5]3\x12#V\
-\x03\xff\x0a\x9c\x8bwC)p\x8b9\x1e\x98E8\xe3\
-\xba\x82|w|=M\xb8V\xf5r\x1ar=\xa7\x02\
-K\x0a\xc6\x03\xef\x05\xfe\x86\xb0\xadp\x19\xb0\xa5DQ\
-\xb7\x14\xff\x9f\xf7\x02\xd7\x00\xef)\xfeN\xe6F\x81e\
-\x08\xeb\xcd\x13\x81\xd3\x8b5\xd4k\x81\xdb\x80\x85\xc0w\
-\x81'\x81u\xc0\xfa\x82\xdd\xaf\xee\xdc\xb6\xdb\x7f\xbf\x16\
-X^\xfc;\x0f\x14\x7f\xc6g\x8a?sr\xf1\xcd\xea\
-\xc6\x0a\x05\x16\x11\x05\x16\x11\x05\x16Q`\x11Q`\x11\
-Q`\x11\x05v\x10D\x14XD\x14XD\x14XD\
-\x81ED\x81ED\x81ED\x81E\x14XD\x14X\
-D\x14XD\x81ED\x81ED\x81ED\x81E\x14\
-XD\x14XD\x14XD\x14XD\x81ED\x81E\
-D\x81E\x14XD\x14XDJ\xe1\xff\x00\xcd \xb8\
-oS\xe6\x8e\x0e\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x0c\x16\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xf0\x00\x00\x00\xf0\x08\x06\x00\x00\x00>U\xe9\x92\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x04\xeeiTXtXML\
-:com.adobe.xmp\x00\x00\
-\x00\x00\x00<?xpacket beg\
-in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
-0MpCehiHzreSzNTc\
-zkc9d\x22?> <x:xmpm\
-eta xmlns:x=\x22ado\
-be:ns:meta/\x22 x:x\
-mptk=\x22Adobe XMP \
-Core 9.1-c001 79\
-.a8d4753, 2023/0\
-3/23-08:56:37   \
-     \x22> <rdf:RDF\
- xmlns:rdf=\x22http\
-://www.w3.org/19\
-99/02/22-rdf-syn\
-tax-ns#\x22> <rdf:D\
-escription rdf:a\
-bout=\x22\x22 xmlns:xm\
-p=\x22http://ns.ado\
-be.com/xap/1.0/\x22\
- xmlns:dc=\x22http:\
-//purl.org/dc/el\
-ements/1.1/\x22 xml\
-ns:photoshop=\x22ht\
-tp://ns.adobe.co\
-m/photoshop/1.0/\
-\x22 xmlns:xmpMM=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/mm/\x22 \
-xmlns:stEvt=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/sType/R\
-esourceEvent#\x22 x\
-mp:CreatorTool=\x22\
-Adobe Photoshop \
-24.6 (Windows)\x22 \
-xmp:CreateDate=\x22\
-2023-07-17T09:42\
-:58+02:00\x22 xmp:M\
-odifyDate=\x222023-\
-07-17T16:09:00+0\
-2:00\x22 xmp:Metada\
-taDate=\x222023-07-\
-17T16:09:00+02:0\
-0\x22 dc:format=\x22im\
-age/png\x22 photosh\
-op:ColorMode=\x223\x22\
- xmpMM:InstanceI\
-D=\x22xmp.iid:2f702\
-4df-ac4a-2146-b7\
-a0-279bbc2f258d\x22\
- xmpMM:DocumentI\
-D=\x22xmp.did:2f702\
-4df-ac4a-2146-b7\
-a0-279bbc2f258d\x22\
- xmpMM:OriginalD\
-ocumentID=\x22xmp.d\
-id:2f7024df-ac4a\
--2146-b7a0-279bb\
-c2f258d\x22> <xmpMM\
-:History> <rdf:S\
-eq> <rdf:li stEv\
-t:action=\x22create\
-d\x22 stEvt:instanc\
-eID=\x22xmp.iid:2f7\
-024df-ac4a-2146-\
-b7a0-279bbc2f258\
-d\x22 stEvt:when=\x222\
-023-07-17T09:42:\
-58+02:00\x22 stEvt:\
-softwareAgent=\x22A\
-dobe Photoshop 2\
-4.6 (Windows)\x22/>\
- </rdf:Seq> </xm\
-pMM:History> </r\
-df:Description> \
-</rdf:RDF> </x:x\
-mpmeta> <?xpacke\
-t end=\x22r\x22?>\x05r\x0f\xca\x00\
-\x00\x06\xceIDATx\xda\xed\xddMo\x15U\x18\
-\xc0q\xd2H\xf1\x15w\x15\x04%|\x10\xa9\x84\x00k\
-(\x84\xfa\x0d\x14\x12\x82;\xe43\xb8i\x22\x0bW\xc8\
-K\xb0\xdd\xc2\xce\x04I\xf1\x8d\x8d|\x82Rk\xb7\x06\
-aC)/a|N\xee5\xc1\x04Bm\xe7\xcc=\
-g\xfa{\x92\xdf\x86HB\xe6\x9c\xbf3w\xee\xbds\
-\xb74M\xb3\x05\xa8\x93\x83\x00\x02\x06\x04\x0c\x08\x18\x04\
-\x0c\x08\x18\x100 `\x100 `@\xc0 `@\
-\xc0\x80\x80\x01\x01\x83\x80\x01\x01\x03\x02\x06\x04\x0c\x02\x06\
-\x04\x0c\x08\x18\x04\x0c\x08\x18\x100 `\x100 `\
-@\xc0@u\x01\xbf\x13\x0e\x87s\xe1b\xb8\x1d\xfe\x08\
-\x7f\x87'M\xf9\xf34,\x84\xd90\x1d\xc6m@\xfa\
-\x1e\xf0\x07\xe1L\xb8\x15\x1e7\xfd\x9a\xe50e\x13\xd2\
-\xc7\x80?\x0d\xd7\x87g\xad\xbe\xcf\xd7a\xccf\xa4\x0f\
-\x01\x1f\x08\xbf4\x9bo.\x8a\x98\x9a\x03\xde\x19.5\
-\x9b{\xbe\x0fo\xd8\x94\xd4\x16p\xba\xa1\xf3\xa01\xce\
-\xc4T\x15\xf0\x9b\xe1[\xcd\x8a\x98\xfa\x02~7\xfc\xa0\
-U\x97\xd3\xd4\x17pzk\xe8\x8eF\x9d\x89\xa9/\xe0\
-\xed\xe2u&\xa6\xce\x80\xd3k\xdeyM:\x13Sg\
-\xc0nX9\x13Si\xc0\xc75(b\xea\x0c\xf8C\
-\xef\xf3\xba\x9c\xa6\xde\x80gu\xe7LL\x9d\x01\x1f\xd0\
-\x9b31\xf5\x06\xfc\x93\xd6\x9c\x89\xa93\xe0I\x8d9\
-\x13So\xc0\xd7\xf5%b\xea\x0cx\xa2\xd9\x1c_\xc6\
-w9M/\x03\xfe2\xf3\x86]m\x06\xdf\x1f>\x12\
-\xf6\x84\xad\x85\x1d\xd8\xb1\xe1\x99\xd1\x99\x98*\x03\xbe\x95\
-q\xa3^\x1d\xbe\xb7\x5c\xfa\xc1\x151U\x06\x9c\x9e\x1e\
-\x99\xe3\x01t\xcf\xc2\xe7\x95\x1d`\x11S]\xc0\x873\
-m\xcc/*=\xc8\x22\xa6\xaa\x80\xcfe\xbal\xae\xf9\
-@\x8b\x98j\x02n{\xa3>\xaa\xe45\xaf\x88\xe9E\
-\xc0\xb7[\xde\x84\x97zt\xc0EL\xf1\x01/\xb5\xbc\
-\x01\x8f\xf4\xec\xa0\x8b\x98\xa2\x03\xbe\xd7\xf2\xe6\xfb\xb8\x87\
-\x07>\xc5\xf4\x9d\x0f{Pb\xc0m\xbf\x85\xb4\xb5\xa7\
-\x07_\xc4\x14\x19p\xdb\xd3\xe7\x05\x18\xc5\xe5\xb4\x19L\
-:\xd1\xa4_\xb6\xbc;\xbco\x93\xfeg\xfaU84\
-\xfc,\x83\x80\x05,\xe2\x8a\xe3N\x9f&<\xd3\x0c\x1e\
-\x83,`\x01\x8b\xb8\xd2I_\xca\xb9\x16\xf6\x09X\xc0\
-\x22\xae{\xd2\x03*\xf6\x0bX\xc0%\xdd\xd82\xff\x7f\
-\xd2w\xdd?\x12\xb0\x80\x9d\x89\xeb\x9d\xf4\xa4\xd5\xe3\x02\
-\x16\xb0\x88\xeb\x9e\xf3a\x9b\x80\x05\xecr\xba\xde\xb9\x19\
-\xde\x17\xb0\x80\x9d\x89\xeb\x9d\xf4\xa3}\x13\x02\x16\xb0\x88\
-\xeb\x8ex\xbb\x80\x05,\xe2z\xe7F\x97\xaf\x89\x05\xec\
-5\xb1\xc9scK\xc0\x02\x16q\xc5\xf3\x99\x80\x05\xec\
-r\xba\xde\xb9\x1fv\x08X\xb0\xce\xc4\xf5\xcee\x01\x8b\
-\xd5\x99\xb8\xdey\xde\x0c~#L\xc08\x13W:\xf3\
-\x02\xe6u\x11\xcf\xe8\xa4\xe8\xf9D\xc0\xbc\xceTX\xd6\
-J\x91sM\xc0\xac\xc5x\x98\x0e\xb3a\xa1\xf1\x0b\x91\
-\xa5LZ\x87\x09\x01C{\xd2\xc3\xfd\xf6\x84\xa3\xc3\xbb\
-\xc5\xab\x99#>-`\xc8g\xd7\xf0\xca%\xd7\xdc\x14\
-0\xe4w\xb2\x19\xfc\x12f\xdb\x93\xce\xf0o\x09\x18\xf2\
-;\x95\xe9,|P\xc0\xd0\x8d\xb9\x0c{\xf9\xac\x80\xa1\
-\x1b\xbb3\xdc\xd8\xba `\xe8\xce\x95\x96\xf7\xf2\xaf\x02\
-\x86\xee\x1cky//\x0a\x18\xba\xb3\xb7\xe5\xbd\xfc\x97\
-\x80\xa1\xdbO\xb6\xb5\xfdV\x92\x80\xa1CE\xefg\x01\
-\x83\x80\x05\x8c\x80\x05,`\x04,`\x10\xb0\x80A\xc0\
-\x02F\xc0\x02\x06\x01\x0b\x18\x04,`\x04,`\x01#\
-`\x01\x83\x80\x05\x0c\x02\x160\x02\x16\xb0\x80\x11\xb0\x80\
-A\xc0\x02F\xc0\x02\x160\x02\x160\x08X\xc0 `\
-\x01#`\x01\x0b\x18\x01\x0b\x18\x04,`\x10\xb0\x80\x11\
-\xb0\x80\x05\x8c\x80\x05\x0c\x02\x160\x02\x16\xb0\x80\x11\xb0\
-\x80A\xc0\x02\x06\x01\x0b\x18\x01\x0bX\xc0\x08X\xc0 \
-`\x01\x83\x80\x05\x8c\x80\x05l\x13!`\x01\x83\x80\x05\
-\x8c\x80\x05,`\x04,`\x10\xb0\x80A\xc0\x02F\xc0\
-\x02\x160\x02\x160\x08X\xc0 `\x01#`\x01\x83\
-\x80\x05\x0c\x02\x160\x02\x16\xb0\x80\x11\xb0\x80A\xc0\x02\
-\x06\x01\x0b\x18\x01\x0bX\xc0\x08X\xc0 `\x01#`\
-\x01\x0b\x18\x01\x0b\x18\x04,`\x10\xb0\x80\xd9\x04VZ\
-\xdc\xcb\x0f\x05\x0c\xddZlq//\x0a\x18\xba5\xd7\
-\xe2^\x9e\x130tk\xba\xc5\xbd|B\xc0\xd0\xad\xf1\
-\x96.\xa3\x97\xc26\x01C\xf7\xa6Z\xd8\xc7S9\xfe\
-m\x02\x86\xb5\x99\xd9\xc0\x1e\x9e\xc9\xf5\xef\x120\xac\xcd\
-\xd8:#\x9e\x19\xfe]\x01C!\x97\xd3\xcbk\xd8\xb7\
-\xcb\xb9.\x9b\x05\x0c\x1b\xbf\xb1\x95\xeeN\xcf\x86\x85\xf0\
-tha\xf8g\xd3\xc3\xfff\x8b\x80m\x16\x100\x08\
-X\xc0 `\x01\x83\x80A\xc0\x02\x06\x01\x0b\x18\x04,\
-`\x100\x08X\xc0\xb0\x19\x03~\xdcr\xc0\xe3\x16\x0a\
-\xba\x0b\xf8^\xcb\x01\xef\xb1P\xd0]\xc0\x7f\xb6\x1c\xf0\
-Q\x0b\x05\xdd\x05|\xbb\xe5\x80/[(\xe8.\xe0\x8b\
--\x07\xbc\x1avY,\xe8&\xe0s\x19\xeeD\xcfZ\
-,\xe8&\xe0CM\x9e9i\xc1 \x7f\xc0ogx\
-+)\xcd\xb3p\xca\xa2A\xde\x80\x93\xf9&\xdf\xa4\xa7\
-\xdb\xef\xb6x\x90/\xe03M\xdeY\x1d\xde\x9d>\x16\
-\xf6\xfa\xb0\x07\x02n\xd7D3x\xc8\x97\x19\xfd\x8c\xe4\
-ak\xaf\xf0\xb2\x87\xc1Y\x8f\x02\x03N\xaei\xa7\xc8\
-\xe9\xe4q\xa7/\xb1\xd6\xc7\xb1Z\x8fB\x02\x9e\xb46\
-EO\xd6\x07\x8e\xbf`\xbd\x0fD\xb7\x1e#\x0e8\xf9\
-\xd9\xba\x14\xbfir\xef\x01\xf1f\x5c\x8f\xdc\x8b\xb7\xdf\
-\x9a\x14?9/\xa7\xa7\x1c\xde\xbc\xeb\xd1\xc5k\x9f\xab\
-\xd6\xa4\xe8Yj2\xfc\xece\xd3\xde\xcfrZ\x8f\x11\
-\x07\xbc3<\xb0.E\xcft\x86u\x9fvX\xd7=\
-'J\x0a89nM\x8a\x9e\xb9\x0ck>\xe7\xb0\xe6\
-_\x8f.\xdfF8o]\x8a\x9d\xc5\x0c\xeb\xed\xf2\xb9\
-\x83\xf5\xe82\xe0t]\xff\xa3\xb5)rV2\xac\xf7\
-#\x87u\xdd\xf3\xa8\xc4\x80\x93\xf7\xc2\xef\xd6\xa7\xb8y\
-\x98a\xadW\x1c\xd6\xfc\xeb1\x8a\x8f\xd3\xa5\x8fY\xde\
-\xb1F.\xa1M]\x97\xd0/\xda\x1enX'7\xb1\
-L=7\xb1^\xf6\x9a\xf8\x1bkU\xc4x\x1b\xa9\xac\
-9QC\xc0\xffJ_\x09\xbco\xcdF6>\xc8Q\
-\xf1z\x94\xf2\xbd\xc6\x1d\xe1Jxn\xfd:\x1f\x1f\xa5\
-\xacx=J\xfb\x82\xf2d\x93\xf7i\x1e\xe6\xbf\xe3\xcb\
-\x0c\x95\xafG\xa9O\x1a\xd8\xd7\x0c\xbeO\xfc\xc4\x9af\
-\xdd,\xbeNX\xf9z\x94\xfe\xc8\x90\xf4\x96\xd3\xe9p\
-\xb3\x19<F\xc7l||\xa1\xbfG\xebQ\xd3\xf3\x7f\
-\xd2\xd3.\x0f\x86\xb3\xe1B\xf8-\xdcm\x06\xbf\xc5\xf4\
-\xd8>x\xe5x\xa4N\x8f\xd7\xc3\x83\xc1\xc0C\xed\x00\
-\x01\x03\x02\x06\x01\x03\x02\x06\x04\x0c\x08\x18\x04\x0c\x08\x18\
-\x100\x08\x18\x100 `@\xc0 `@\xc0\x80\x80\
-\x01\x01\x83\x80\x01\x01\x03\x02\x06\x01\x03\x02\x06\x04\x0c\x08\
-\x18\x04\x0c\x08\x18\x100 `\x100 `@\xc0 \
-`@\xc0\x80\x80\x01\x01\x83\x80\x01\x01\x03\x02\x86\xcd\xee\
-\x1f\xb8\x85z\xc5\x9d^\x04\xab\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x1e\
-\x0f\x88\xc6G\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00p\x00a\x00c\x00k\x00a\
-\x00g\x00e\x00-\x00i\x00m\x00p\x00o\x00r\x00t\x00.\x00p\x00n\x00g\
-\x00\x1b\
-\x05\x03_\x07\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00i\x00n\x00f\x00o\x00-\
-\x00c\x00i\x00r\x00c\x00l\x00e\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x07w\xa1g\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00s\x00c\x00r\x00i\x00p\
-\x00t\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x04\xd8Y\xa7\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00r\x00o\x00u\x00t\x00e\
-\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x0e\xc2F\x87\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00p\x00h\x00o\x00t\x00o\
-\x00.\x00p\x00n\x00g\
-\x00\x1b\
-\x06\x7f2G\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00f\x00o\x00l\x00d\x00e\
-\x00r\x00-\x00p\x00l\x00u\x00s\x00.\x00p\x00n\x00g\
-\x00\x1b\
-\x03\x94\xdbg\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00p\x00l\x00a\x00y\x00e\
-\x00r\x00-\x00p\x00l\x00a\x00y\x00.\x00p\x00n\x00g\
-\x00\x1e\
-\x0f\x88PG\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00p\x00a\x00c\x00k\x00a\
-\x00g\x00e\x00-\x00e\x00x\x00p\x00o\x00r\x00t\x00.\x00p\x00n\x00g\
-\x00\x1b\
-\x02\xf1\x13\xc7\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00f\x00i\x00l\x00e\x00-\
-\x00i\x00m\x00p\x00o\x00r\x00t\x00.\x00p\x00n\x00g\
-\x00\x18\
-\x0c\xca\x1b\xa7\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00p\x00a\x00c\x00k\x00a\
-\x00g\x00e\x00s\x00.\x00p\x00n\x00g\
-\x00\x17\
-\x00-tG\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00a\x00r\x00c\x00h\x00i\
-\x00v\x00e\x00.\x00p\x00n\x00g\
-\x00\x18\
-\x04 +G\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00s\x00e\x00t\x00t\x00i\
-\x00n\x00g\x00s\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x0d\xb4YG\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00h\x00e\x00l\x00p\x00.\
-\x00p\x00n\x00g\
-\x00\x1b\
-\x038:g\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00f\x00o\x00l\x00d\x00e\
-\x00r\x00-\x00o\x00p\x00e\x00n\x00.\x00p\x00n\x00g\
-\x00\x1e\
-\x0ba&\x07\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00l\x00i\x00v\x00e\x00-\
-\x00p\x00h\x00o\x00t\x00o\x00-\x00o\x00f\x00f\x00.\x00p\x00n\x00g\
-\x00\x1b\
-\x02\xf1\x05\xc7\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00f\x00i\x00l\x00e\x00-\
-\x00e\x00x\x00p\x00o\x00r\x00t\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x07s'\xa7\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00b\x00o\x00x\x00.\x00p\
-\x00n\x00g\
-\x00\x1a\
-\x048\xf9\xe7\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00l\x00i\x00v\x00e\x00-\
-\x00p\x00h\x00o\x00t\x00o\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x0d\xa2Y\xa7\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00b\x00u\x00l\x00b\x00.\
-\x00p\x00n\x00g\
-\x00\x14\
-\x09\xc4F\xc7\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00l\x00a\x00m\x00p\x00.\
-\x00p\x00n\x00g\
-\x00\x1c\
-\x0f}\x9eg\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00c\x00r\x00y\x00s\x00t\
-\x00a\x00l\x00-\x00b\x00a\x00l\x00l\x00.\x00p\x00n\x00g\
-\x00\x16\
-\x02w\x8c'\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00r\x00e\x00l\x00o\x00a\
-\x00d\x00.\x00p\x00n\x00g\
-\x00\x1c\
-\x0eT\x8e\xe7\
-\x00t\
-\x00a\x00b\x00l\x00e\x00r\x00-\x00i\x00c\x00o\x00n\x00-\x00f\x00o\x00l\x00d\x00e\
-\x00r\x00-\x00m\x00i\x00n\x00u\x00s\x00.\x00p\x00n\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x17\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x02L\x00\x00\x00\x00\x00\x01\x00\x00\xa1m\
-\x00\x00\x01\x8bA\xa1v\xe1\
-\x00\x00\x04\x9e\x00\x00\x00\x00\x00\x01\x00\x01\x84\xca\
-\x00\x00\x01\x8a\x02d\x9eM\
-\x00\x00\x03b\x00\x00\x00\x00\x00\x01\x00\x01\x0f#\
-\x00\x00\x01\x89d.\xe1\xc2\
-\x00\x00\x01\xda\x00\x00\x00\x00\x00\x01\x00\x00\x83\xc8\
-\x00\x00\x01\x89d.\xe3\xc5\
-\x00\x00\x02\xe4\x00\x00\x00\x00\x00\x01\x00\x00\xe6v\
-\x00\x00\x01\x89d.\xe7\xa9\
-\x00\x00\x01\x5c\x00\x00\x00\x00\x00\x01\x00\x00h\x10\
-\x00\x00\x01\x89d.\xf4F\
-\x00\x00\x02\x80\x00\x00\x00\x00\x00\x01\x00\x00\xaf2\
-\x00\x00\x01\x89mi\xcf\x0f\
-\x00\x00\x03\xca\x00\x00\x00\x00\x00\x01\x00\x01-\x00\
-\x00\x00\x01\x89m\x1d\x04\x00\
-\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x006f\
-\x00\x00\x01\x8a+\xb9\x1ci\
-\x00\x00\x00R\x00\x00\x00\x00\x00\x01\x00\x00\x0f\xd4\
-\x00\x00\x01\x89d.\xed\xa5\
-\x00\x00\x01 \x00\x00\x00\x00\x00\x01\x00\x00[U\
-\x00\x00\x01\x89d.\xe9\xb7\
-\x00\x00\x03\x9e\x00\x00\x00\x00\x00\x01\x00\x01\x1c\x93\
-\x00\x00\x01\x89d.\xdcr\
-\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x00'\x92\
-\x00\x00\x01\x8b7a\xc5\x10\
-\x00\x00\x042\x00\x00\x00\x00\x00\x01\x00\x01[&\
-\x00\x00\x01\x8b\x03\xd8\xf4j\
-\x00\x00\x03 \x00\x00\x00\x00\x00\x01\x00\x00\xf5Z\
-\x00\x00\x01\x89m\x1d\x05\xb5\
-\x00\x00\x02\x16\x00\x00\x00\x00\x00\x01\x00\x00\x917\
-\x00\x00\x01\x8a+\xa9|\xde\
-\x00\x00\x04\x04\x00\x00\x00\x00\x00\x01\x00\x01Gr\
-\x00\x00\x01\x89d.\xde\x15\
-\x00\x00\x02\xb6\x00\x00\x00\x00\x00\x01\x00\x00\xcc$\
-\x00\x00\x01\x89d.\xeb\xb4\
-\x00\x00\x04\xd0\x00\x00\x00\x00\x00\x01\x00\x01\x99\xa0\
-\x00\x00\x01\x89d.\xe5\xa7\
-\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00JU\
-\x00\x00\x01\x89m\x1d\x07V\
-\x00\x00\x04`\x00\x00\x00\x00\x00\x01\x00\x01n\x9f\
-\x00\x00\x01\x89d.\xdf\xbe\
-\x00\x00\x01\x98\x00\x00\x00\x00\x00\x01\x00\x00s\xc5\
-\x00\x00\x01\x89d.\xef\xb8\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x89d.\xf1\xa0\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,119 @@
+"""Micro-benchmark for the FlowLayout geometry pass.
+
+Simulates dragging the splitter over a grid of 1k and 10k equally sized tiles
+and compares the previous per item layout with the cached layout and its
+uniform size fast path.
+
+    mayapy -m render_vault.tests.benchmarks.bench_flow_layout
+"""
+
+import time
+
+from Qt.QtCore import QPoint, QRect, Qt
+from Qt.QtWidgets import QApplication, QSizePolicy, QWidget
+
+from ...ui.ui_components.flow_layout import FlowLayout
+
+TILE_SIZE = (150, 194)
+WIDTHS = range(400, 1600, 8)
+
+
+class LegacyFlowLayout(FlowLayout):
+    """The layout before caching, every query walks all items."""
+
+    def heightForWidth(self, width):
+        return self._do_layout(QRect(0, 0, width, 0), True)
+
+    def setGeometry(self, rect):
+        super(FlowLayout, self).setGeometry(rect)
+        self._do_layout(rect, False)
+
+    def _do_layout(self, rect, test_only):
+        x = rect.x()
+        y = rect.y()
+        line_height = 0
+        spacing = self.spacing()
+
+        for item in self._item_list:
+            style = item.widget().style()
+            layout_spacing_x = style.layoutSpacing(
+                QSizePolicy.PushButton, QSizePolicy.PushButton, Qt.Horizontal
+            )
+            layout_spacing_y = style.layoutSpacing(
+                QSizePolicy.PushButton, QSizePolicy.PushButton, Qt.Vertical
+            )
+            space_x = spacing + layout_spacing_x
+            space_y = spacing + layout_spacing_y
+            next_x = x + item.sizeHint().width() + space_x
+            if next_x - space_x > rect.right() and line_height > 0:
+                x = rect.x()
+                y = y + line_height + space_y
+                next_x = x + item.sizeHint().width() + space_x
+                line_height = 0
+
+            if not test_only:
+                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+
+            x = next_x
+            line_height = max(line_height, item.sizeHint().height())
+
+        return y + line_height - rect.y()
+
+
+def build(layout_class, count, mixed=False):
+    container = QWidget()
+    layout = layout_class(container)
+    layout.setSpacing(0)
+    for i in range(count):
+        widget = QWidget()
+        width, height = TILE_SIZE
+        widget.setFixedSize(width + (i % 7) * 10 if mixed else width, height)
+        layout.addWidget(widget)
+
+    # addWidget shows the tiles with a queued call, hidden items are skipped
+    QApplication.processEvents()
+    return container, layout
+
+
+def drag_splitter(layout):
+    """heightForWidth + setGeometry for every width, like a resize would."""
+
+    start = time.perf_counter()
+    for width in WIDTHS:
+        height = layout.heightForWidth(width)
+        layout.setGeometry(QRect(0, 0, width, height))
+    return (time.perf_counter() - start) / len(WIDTHS)
+
+
+def geometries(layout, width):
+    layout.setGeometry(QRect(0, 0, width, layout.heightForWidth(width)))
+    return [layout.itemAt(i).geometry() for i in range(layout.count())]
+
+
+def main():
+    app = QApplication.instance() or QApplication([])
+
+    for count in (1_000, 10_000):
+        for mixed in (False, True):
+            label = f"{count} {'mixed' if mixed else 'uniform'}"
+            legacy_container, legacy = build(LegacyFlowLayout, count, mixed)
+            container, layout = build(FlowLayout, count, mixed)
+
+            assert geometries(legacy, 1013) == geometries(layout, 1013)
+
+            legacy_time = drag_splitter(legacy)
+            cached_time = drag_splitter(layout)
+            print(
+                f"{label:<16}legacy {legacy_time * 1000:>8.2f}ms"
+                f"   cached {cached_time * 1000:>8.2f}ms"
+                f"   x{legacy_time / cached_time:>6.1f}"
+            )
+
+            legacy_container.deleteLater()
+            container.deleteLater()
+
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
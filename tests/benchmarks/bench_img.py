@@ -0,0 +1,60 @@
+"""Micro-benchmark for the HDRI thumbnail tonemapping.
+
+Compares the previous float64 ``reinhard + np.power`` pipeline with the in-place
+float32 operators and the LUT based sRGB encode.
+
+    mayapy -m render_vault.tests.benchmarks.bench_img
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from ...core import img
+
+
+def legacy_pipeline(image):
+    tonemapped = image * (1.0 + (image / (1.0**2))) / (1.0 + image)
+    gamma_corrected = np.power(tonemapped, 1.0 / 2.2)
+    return np.clip(gamma_corrected * 255, 0, 255).astype(np.uint8)
+
+
+def lut_pipeline(image, operator):
+    img.tonemap(image, operator)
+    return img.encode_srgb(image)
+
+
+def measure(func, image, *args, repeat=10):
+    # the input copy is not part of the measured pipeline
+    copies = [image.copy() for _ in range(repeat)]
+    func(image.copy(), *args)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for c in copies:
+        func(c, *args)
+    elapsed = (time.perf_counter() - start) / repeat
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main(width=2048):
+    rng = np.random.default_rng(0)
+    image = (rng.random((width // 2, width, 3)) * 16.0).astype(np.float32)
+    image_mb = image.nbytes / 1_000_000
+
+    print(f"image: {width}x{width // 2} float32 ({image_mb:.1f}MB)")
+
+    elapsed, peak = measure(legacy_pipeline, image)
+    print(f"{'legacy':<20}{elapsed * 1000:>8.1f}ms {peak / 1_000_000:>8.1f}MB peak")
+
+    for operator in img.TONEMAP_OPERATORS:
+        elapsed, peak = measure(lut_pipeline, image, operator)
+        print(f"{operator:<20}{elapsed * 1000:>8.1f}ms {peak / 1_000_000:>8.1f}MB peak")
+
+
+if __name__ == "__main__":
+    main()
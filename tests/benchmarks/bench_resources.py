@@ -0,0 +1,101 @@
+"""Startup cost of registering the icon resources.
+
+Compares the generated ``resources.py`` module the plugin used to import,
+rebuilt here from the same icons, with registering the compiled
+``resources.rcc`` through QResource.
+
+    mayapy -m render_vault.tests.benchmarks.bench_resources
+"""
+
+import marshal
+import time
+import tracemalloc
+
+from Qt import QtCore
+from Qt.QtCore import QFile, QResource
+
+from ...resources.build_rcc import HEADER, RCC_PATH, RCC_VERSION, build_rcc
+
+ICON = ":icons/tabler-icon-box.png"
+RUNS = 20
+
+
+def legacy_source() -> str:
+    """A module like the one pyside2-rcc generated, with the byte literals of
+    the tree, names and data sections of the rcc file."""
+
+    rcc = RCC_PATH.read_bytes()
+    _, _, tree_offset, data_offset, names_offset = HEADER.unpack_from(rcc)
+    return (
+        "from Qt import QtCore\n\n"
+        f"qt_resource_data = {rcc[data_offset:names_offset]!r}\n"
+        f"qt_resource_name = {rcc[names_offset:tree_offset]!r}\n"
+        f"qt_resource_struct = {rcc[tree_offset:]!r}\n\n"
+        f"QtCore.qRegisterResourceData({RCC_VERSION}, qt_resource_struct, "
+        "qt_resource_name, qt_resource_data)\n"
+    )
+
+
+def measure(register, unregister):
+    """Average time and the memory the registration keeps alive."""
+
+    times = []
+    for _ in range(RUNS):
+        tracemalloc.start()
+        start = time.perf_counter()
+        module = register()
+        times.append(time.perf_counter() - start)
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert QFile(ICON).exists()
+        unregister(module)
+        assert not QFile(ICON).exists()
+
+    return sum(times) / len(times), retained
+
+
+def main():
+    build_rcc()
+    source = legacy_source()
+    bytecode = marshal.dumps(compile(source, "resources.py", "exec"))
+
+    def import_source():
+        module = {}
+        exec(compile(source, "resources.py", "exec"), module)
+        return module
+
+    def import_bytecode():
+        module = {}
+        exec(marshal.loads(bytecode), module)
+        return module
+
+    def unregister_module(module):
+        QtCore.qUnregisterResourceData(
+            RCC_VERSION,
+            module["qt_resource_struct"],
+            module["qt_resource_name"],
+            module["qt_resource_data"],
+        )
+
+    def register_rcc():
+        assert QResource.registerResource(str(RCC_PATH))
+
+    def unregister_rcc(_):
+        QResource.unregisterResource(str(RCC_PATH))
+
+    rcc_size = RCC_PATH.stat().st_size
+    print(f"resources.py {len(source) / 1000:.0f}KB, rcc {rcc_size / 1000:.0f}KB")
+    for label, register, unregister in (
+        ("resources.py from source", import_source, unregister_module),
+        ("resources.py from .pyc", import_bytecode, unregister_module),
+        ("resources.rcc", register_rcc, unregister_rcc),
+    ):
+        seconds, retained = measure(register, unregister)
+        print(
+            f"{label:<26}{seconds * 1000:>8.2f}ms   {retained / 1000:>8.0f}KB retained"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Checks a startup trace against the budget, for CI.
+
+Start Maya with ``RENDER_VAULT_TRACE_STARTUP`` set to the report path, open
+Render Vault, then check the written report:
+
+    mayapy -m render_vault.tests.benchmarks.check_startup startup.json
+
+Exits with 1 if a phase took longer than its budget or a heavy optional
+module was imported during startup.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from ...core.startup_trace import StartupTrace
+
+BUDGET_PATH = Path(__file__).parent / "startup_budget.json"
+
+
+def main(args: list[str]) -> int:
+    if not args:
+        print(__doc__)
+        return 2
+
+    report_path = Path(args[0])
+    budget_path = Path(args[1]) if len(args) > 1 else BUDGET_PATH
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    budget = json.loads(budget_path.read_text(encoding="utf-8"))
+
+    print(StartupTrace.format_report(report))
+    errors = StartupTrace.check_budget(report, budget)
+    for error in errors:
+        print(f"over budget: {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
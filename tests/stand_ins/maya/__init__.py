@@ -0,0 +1,18 @@
+"""Stand-in for the maya package, used by tests that run the external
+scripts in a plain python process.
+
+Every ``cmds`` and ``mel`` call is appended to the file named by
+``MAYA_STAND_IN_LOG``. Opening a scene whose name contains ``crash``
+kills the process like a maya crash would.
+"""
+
+import os
+
+LOG_ENV = "MAYA_STAND_IN_LOG"
+
+
+def record(call: str) -> None:
+    path = os.environ.get(LOG_ENV)
+    if path:
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(f"{call}\n")
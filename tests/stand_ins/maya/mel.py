@@ -0,0 +1,5 @@
+from . import record
+
+
+def eval(command):
+    record(f"mel.eval {command}")
@@ -0,0 +1,9 @@
+from . import record
+
+
+def initialize(name="python"):
+    record("standalone.initialize")
+
+
+def uninitialize():
+    record("standalone.uninitialize")
@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from ..controller.asset_index import AssetIndex
+
+
+class TestAssetIndex(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.pool_root = Path(self.test_dir) / "MaterialPool"
+        (self.pool_root / "Materials").mkdir(parents=True)
+        (self.pool_root / "Thumbnails").mkdir()
+
+        self.asset = self.pool_root / "Materials" / "material.mb"
+        self.asset.write_bytes(b"material")
+        self.thumbnail = self.pool_root / "Thumbnails" / "material.jpg"
+        self.thumbnail.write_bytes(b"thumbnail")
+
+        self.index = AssetIndex(self.pool_root)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def set_mtime(self, path: Path, mtime: int):
+        os.utime(path, ns=(mtime, mtime))
+
+    def test_missing_thumbnail_is_stale(self):
+        self.assertTrue(self.index.is_thumbnail_stale(self.asset, None))
+
+    def test_unrecorded_thumbnail_uses_timestamps(self):
+        self.set_mtime(self.asset, 2_000_000_000)
+        self.set_mtime(self.thumbnail, 1_000_000_000)
+        self.assertTrue(self.index.is_thumbnail_stale(self.asset, self.thumbnail))
+
+        self.set_mtime(self.thumbnail, 3_000_000_000)
+        self.assertFalse(self.index.is_thumbnail_stale(self.asset, self.thumbnail))
+
+    def test_touched_asset_is_not_stale(self):
+        self.index.record_thumbnail(self.asset)
+        self.set_mtime(self.asset, 5_000_000_000)
+
+        self.assertFalse(self.index.is_thumbnail_stale(self.asset, self.thumbnail))
+
+    def test_changed_asset_is_stale(self):
+        self.index.record_thumbnail(self.asset)
+        self.asset.write_bytes(b"changed!")
+        self.set_mtime(self.asset, 5_000_000_000)
+
+        self.assertTrue(self.index.is_thumbnail_stale(self.asset, self.thumbnail))
+
+    def test_changed_params_are_stale(self):
+        self.index.record_thumbnail(self.asset, {"exposure": 1.0})
+
+        self.assertFalse(
+            self.index.is_thumbnail_stale(self.asset, self.thumbnail, {"exposure": 1.0})
+        )
+        self.assertTrue(
+            self.index.is_thumbnail_stale(self.asset, self.thumbnail, {"exposure": 2.0})
+        )
+
+    def test_records_persist(self):
+        self.index.record_thumbnail(self.asset)
+        self.index.save()
+
+        index = AssetIndex(self.pool_root)
+        self.assertIn(self.asset.name, index.thumbnail_sources)
+
+    def test_feature_matrix_updates_incrementally(self):
+        thumbnails = {self.asset.stem: self.thumbnail}
+        matrix = self.index.matrix(self.index.COLOR_HISTOGRAMS)
+        self.assertEqual(matrix.outdated(thumbnails), thumbnails)
+
+        matrix.update({self.asset.stem: (self.thumbnail, np.ones(4))})
+        self.assertEqual(matrix.outdated(thumbnails), {})
+        self.index.save()
+
+        matrix = AssetIndex(self.pool_root).matrix(self.index.COLOR_HISTOGRAMS)
+        np.testing.assert_array_equal(matrix.row(self.asset.stem), np.ones(4))
+
+        self.assertEqual(matrix.outdated({}), {})
+        self.assertEqual(matrix.names, [])
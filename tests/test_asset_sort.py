@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from ..controller.asset_sort import AssetSort, AssetUsage
+from ..controller.db import DBWriter
+from ..controller.settings import SettingsManager
+
+
+class TestAssetSort(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.pool_root = Path(self.test_dir) / "MaterialPool"
+        materials = self.pool_root / "Materials"
+        materials.mkdir(parents=True)
+
+        self.sort = AssetSort(self.pool_root)
+        self.assets = {}
+        for name, size, mtime in (
+            ("b_wood.mb", 30, 1),
+            ("A_metal.ma", 10, 3),
+            ("c_stone.mb", 20, 2),
+        ):
+            path = materials / name
+            path.write_bytes(b"x" * size)
+            os.utime(path, ns=(mtime, mtime))
+            self.sort.add(path, path.stat())
+            self.assets[name.split(".")[0]] = path
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def names(self, paths):
+        return [path.stem for path in paths]
+
+    def test_sort_modes(self):
+        paths = list(self.assets.values())
+        expected = {
+            AssetSort.NAME: ["A_metal", "b_wood", "c_stone"],
+            AssetSort.SIZE: ["b_wood", "c_stone", "A_metal"],
+            AssetSort.MODIFIED: ["A_metal", "c_stone", "b_wood"],
+            AssetSort.EXTENSION: ["A_metal", "b_wood", "c_stone"],
+        }
+        for mode, names in expected.items():
+            self.assertEqual(self.names(self.sort.order(paths, mode)), names)
+
+    def test_changed_asset_is_sorted_again(self):
+        path = self.assets["A_metal"]
+        path.write_bytes(b"x" * 40)
+        self.sort.add(path, path.stat())
+
+        order = self.sort.order(self.assets.values(), AssetSort.SIZE)
+        self.assertEqual(self.names(order)[0], "A_metal")
+
+    def test_groups(self):
+        self.sort.set_tags({self.assets["c_stone"]: ["Rough", "floor"]})
+        paths = list(self.assets.values())
+
+        by_tag = self.sort.order(paths, AssetSort.NAME, AssetSort.GROUP_TAG)
+        self.assertEqual(self.names(by_tag), ["c_stone", "A_metal", "b_wood"])
+
+        by_type = self.sort.order(paths, AssetSort.SIZE, AssetSort.GROUP_EXTENSION)
+        self.assertEqual(self.names(by_type), ["A_metal", "b_wood", "c_stone"])
+
+
+class TestAssetUsage(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db_path = SettingsManager.DB_PATH
+        SettingsManager.DB_PATH = Path(self.test_dir, "test.db")
+        AssetUsage._table_created = False
+
+        self.pool_root = Path(self.test_dir) / "MaterialPool"
+        self.assets = [self.pool_root / "Materials" / f"mtl{i}.mb" for i in range(3)]
+
+    def tearDown(self):
+        DBWriter.shutdown()
+        SettingsManager.DB_PATH = self.db_path
+        AssetUsage._table_created = False
+        shutil.rmtree(self.test_dir)
+
+    def test_changes_are_written_in_order(self):
+        AssetUsage.record(self.assets)
+        AssetUsage.record(self.assets[0])
+        AssetUsage.forget(self.assets[1])
+        AssetUsage.record(self.assets[1])
+
+        counts = AssetUsage.counts(self.pool_root)
+        self.assertEqual(
+            counts, {self.assets[0]: 2, self.assets[1]: 1, self.assets[2]: 1}
+        )
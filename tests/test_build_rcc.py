@@ -0,0 +1,51 @@
+import struct
+import unittest
+import xml.etree.ElementTree as ET
+
+from ..resources.build_rcc import HEADER, QRC_PATH, compile_rcc, qt_hash, read_qrc
+
+NODE_SIZE = 22
+
+
+class TestBuildRcc(unittest.TestCase):
+    def setUp(self):
+        rcc = compile_rcc(read_qrc(QRC_PATH))
+        magic, _, tree_offset, data_offset, names_offset = HEADER.unpack_from(rcc)
+        self.assertEqual(magic, b"qres")
+        self.tree = rcc[tree_offset:]
+        self.names = rcc[names_offset:tree_offset]
+        self.data = rcc[data_offset:names_offset]
+
+    def name(self, node):
+        offset = struct.unpack_from(">I", self.tree, node * NODE_SIZE)[0]
+        length, name_hash = struct.unpack_from(">HI", self.names, offset)
+        name = self.names[offset + 6 : offset + 6 + length * 2].decode("utf-16-be")
+        self.assertEqual(qt_hash(name), name_hash)
+        return name
+
+    def files(self, node=0, prefix=""):
+        offset = node * NODE_SIZE
+        flags = struct.unpack_from(">H", self.tree, offset + 4)[0]
+        if not flags & 0x02:
+            data = struct.unpack_from(">I", self.tree, offset + 10)[0]
+            size = struct.unpack_from(">I", self.data, data)[0]
+            return {prefix: self.data[data + 4 : data + 4 + size]}
+
+        count, first = struct.unpack_from(">II", self.tree, offset + 6)
+        children = range(first, first + count)
+        hashes = [qt_hash(self.name(child)) for child in children]
+        # QResource binary searches the children by hash
+        self.assertEqual(hashes, sorted(hashes))
+
+        files = {}
+        for child in children:
+            files.update(self.files(child, f"{prefix}/{self.name(child)}"))
+        return files
+
+    def test_round_trip(self):
+        files = self.files()
+        expected = {
+            f"/{file.text}": (QRC_PATH.parent / file.text).read_bytes()
+            for file in ET.parse(QRC_PATH).iter("file")
+        }
+        self.assertEqual(files, expected)
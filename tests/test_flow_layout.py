@@ -0,0 +1,25 @@
+import unittest
+
+from Qt.QtWidgets import QApplication, QWidget
+
+from ..ui.ui_components.flow_layout import FlowLayout
+
+
+class TestFlowLayout(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_layout_with_a_parent(self):
+        widget = QWidget()
+        layout = FlowLayout(widget)
+        self.assertIs(widget.layout(), layout)
+        self.assertEqual(layout.contentsMargins().left(), 0)
+
+        for _ in range(3):
+            tile = QWidget()
+            tile.setFixedSize(100, 100)
+            layout.addWidget(tile)
+        self.assertEqual(layout.count(), 3)
+        self.assertEqual(layout.heightForWidth(1000), 100)
+        self.assertGreater(layout.heightForWidth(250), 200)
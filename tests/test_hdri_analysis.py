@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+from ..core import hdri_analysis
+
+
+class TestHdriAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.width, self.height = hdri_analysis.ANALYSIS_SIZE
+
+    def test_uniform_environment(self):
+        rgb = np.ones((self.height, self.width, 3), dtype=np.float32)
+        stats = hdri_analysis.analyse(rgb)
+
+        self.assertAlmostEqual(stats["mean_luminance"], 1.0, places=3)
+        self.assertAlmostEqual(stats["dynamic_range"], 0.0)
+
+        # only the constant band is left, the integral of Y00 over the sphere
+        sh = np.array(stats["sh"])
+        np.testing.assert_allclose(sh[0], 0.282095 * 4 * np.pi, rtol=1e-3)
+        np.testing.assert_allclose(sh[1:], 0, atol=1e-3)
+
+    def test_sun_direction(self):
+        rgb = np.full((self.height, self.width, 3), 0.5, dtype=np.float32)
+        row, column = self.height // 4, self.width // 8
+        rgb[row, column] = 50000.0
+
+        stats = hdri_analysis.analyse(rgb, peak_luminance=1e6)
+        directions, _ = hdri_analysis.latlong_directions(self.height, self.width)
+
+        np.testing.assert_allclose(
+            stats["sun_direction"], directions[row, column], atol=1e-3
+        )
+        self.assertAlmostEqual(stats["sun_elevation"], 43.59, places=1)
+        self.assertAlmostEqual(stats["sun_azimuth"], 46.41, places=1)
+        self.assertGreater(stats["sun_share"], 0.5)
+        self.assertAlmostEqual(stats["dynamic_range"], np.log2(2e6), places=1)
+
+    def test_sh_matches_direction(self):
+        # light from straight above has no x or z component
+        rgb = np.zeros((self.height, self.width, 3), dtype=np.float32)
+        rgb[:2] = 1.0
+
+        sh = hdri_analysis.analyse(rgb)["sh"]
+        self.assertGreater(sh[1][0], 0)
+        np.testing.assert_allclose([sh[2][0], sh[3][0]], 0, atol=1e-4)
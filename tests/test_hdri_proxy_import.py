@@ -0,0 +1,82 @@
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from ..controller.hdri_proxies import HdriProxies
+from ..controller.thread_worker import HdriProxyThreadWorker
+from ..ui.viewports.hdri_viewport import HdriViewport
+
+
+class Stub:
+    def deleteLater(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+class ProxyViewport(HdriViewport):
+    """Proxy imports of HdriViewport, the workers are finished by hand."""
+
+    def __init__(self):
+        hdri_settings = SimpleNamespace(proxy_size="2k")
+        self.settings = SimpleNamespace(hdri_settings=hdri_settings)
+        self.proxy_thread_running = False
+        self.proxy_imports = []
+        self.started = []
+
+    def create_next_proxy(self):
+        path, size, _ = self.proxy_imports[0]
+        self.proxy_thread_running = True
+        self.started.append(path)
+        self.proxy_worker = HdriProxyThreadWorker(path, size)
+        self.proxy_thread = Stub()
+
+    def finish(self, proxy):
+        self.proxy_worker.proxy = proxy
+        self.proxy_worker.deleteLater = lambda: None
+        self.proxy_worker_ended()
+
+
+class TestHdriProxyImport(unittest.TestCase):
+    def setUp(self):
+        self.viewport = ProxyViewport()
+        self.imported = []
+        self.sky = Path("/project/HDRIPool/HDRIs/sky.exr")
+        self.studio = Path("/project/HDRIPool/HDRIs/studio.exr")
+
+    def create(self, path, proxy=None):
+        self.imported.append((path, proxy))
+
+    def test_imports_wait_for_the_running_proxy(self):
+        self.viewport.import_proxy(self.sky, self.create)
+        self.viewport.import_proxy(self.studio, self.create)
+        self.assertEqual(self.viewport.started, [self.sky])
+
+        self.viewport.finish(Path("sky_2k.hdr"))
+        self.assertEqual(self.imported, [(self.sky, Path("sky_2k.hdr"))])
+        self.assertEqual(self.viewport.started, [self.sky, self.studio])
+
+        self.viewport.finish(Path("studio_2k.hdr"))
+        self.assertEqual(self.imported[-1], (self.studio, Path("studio_2k.hdr")))
+        self.assertFalse(self.viewport.proxy_thread_running)
+
+    def test_failed_proxy_isnt_imported(self):
+        self.viewport.import_proxy(self.sky, self.create)
+        self.viewport.import_proxy(self.studio, self.create)
+
+        self.viewport.finish(None)
+        self.viewport.finish(Path("studio_2k.hdr"))
+        self.assertEqual(self.imported, [(self.studio, Path("studio_2k.hdr"))])
+
+    def test_worker_keeps_the_proxy(self):
+        worker = HdriProxyThreadWorker(self.sky, "2k")
+        with mock.patch.object(HdriProxies, "get", return_value=Path("sky_2k.hdr")):
+            worker.run()
+        self.assertEqual(worker.proxy, Path("sky_2k.hdr"))
+
+        worker = HdriProxyThreadWorker(self.sky, "2k")
+        with mock.patch.object(HdriProxies, "get", side_effect=OSError("offline")):
+            worker.run()
+        self.assertIsNone(worker.proxy)
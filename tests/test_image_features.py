@@ -0,0 +1,124 @@
+import unittest
+
+import numpy as np
+
+from ..core import image_features
+
+
+class TestImageHashes(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.gray = rng.random((4, 32, 32)).astype(np.float32) * 255
+
+    def test_phash_ignores_brightness_and_contrast(self):
+        gray = self.gray.copy()
+        gray[1] = gray[0] * 0.8 + 20
+
+        hashes = image_features.phash(gray)
+        distances = image_features.hamming(hashes[0], hashes)
+
+        self.assertEqual(distances[1], 0)
+        self.assertTrue(np.all(distances[2:] > 10))
+
+    def test_dhash_bits(self):
+        gray = np.tile(np.arange(9, dtype=np.float32), (1, 8, 1))
+
+        self.assertEqual(image_features.dhash(gray)[0], np.uint64(2**64 - 1))
+        self.assertEqual(image_features.dhash(gray[:, :, ::-1])[0], 0)
+
+    def test_popcount(self):
+        values = np.array([0, 1, 2**64 - 1, 0xF0F0], dtype=np.uint64)
+
+        self.assertEqual(image_features.popcount(values).tolist(), [0, 1, 64, 8])
+
+
+class TestFindNearDuplicates(unittest.TestCase):
+    def brute_force(self, hashes: np.ndarray, max_distance: int) -> set:
+        distances = image_features.hamming(hashes[:, None], hashes[None, :])
+        first, second = np.nonzero(np.triu(distances <= max_distance, 1))
+        return set(zip(first.tolist(), second.tolist()))
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(3)
+        hashes = rng.integers(0, 2**63, 2000, dtype=np.int64).astype(np.uint64)
+        for i in range(0, 200, 2):
+            flips = rng.choice(64, size=rng.integers(0, 10), replace=False)
+            hashes[i + 1] = hashes[i] ^ np.uint64(sum(1 << int(b) for b in flips))
+
+        for max_distance in (0, 3, 6, 9):
+            pairs, distances = image_features.find_near_duplicates(
+                hashes, max_distance
+            )
+            self.assertEqual(
+                set(map(tuple, pairs.tolist())), self.brute_force(hashes, max_distance)
+            )
+            self.assertTrue(np.all(distances <= max_distance))
+
+    def test_batches_match_brute_force(self):
+        rng = np.random.default_rng(5)
+        hashes = rng.integers(0, 2**63, 300, dtype=np.int64).astype(np.uint64)
+        hashes[150:] = hashes[:150] ^ np.uint64(0b1011)
+
+        query_batch = image_features.QUERY_BATCH
+        image_features.QUERY_BATCH = 1000
+        try:
+            pairs, _ = image_features.find_near_duplicates(hashes, 16)
+        finally:
+            image_features.QUERY_BATCH = query_batch
+
+        self.assertEqual(set(map(tuple, pairs.tolist())), self.brute_force(hashes, 16))
+
+    def test_group_pairs(self):
+        pairs = np.array([[0, 1], [1, 3], [4, 5]])
+
+        self.assertEqual(image_features.group_pairs(pairs, 6), [[0, 1, 3], [4, 5]])
+
+
+class TestColorFeatures(unittest.TestCase):
+    def setUp(self):
+        self.rgb = np.zeros((2, 32, 32, 3), dtype=np.uint8)
+        self.rgb[0, :16] = (230, 120, 40)
+        self.rgb[0, 16:] = (40, 60, 200)
+        self.rgb[1] = (40, 60, 200)
+
+    def test_histograms_are_normalised(self):
+        histograms = image_features.color_histogram(self.rgb)
+
+        self.assertEqual(histograms.shape, (2, image_features.COLOR_BINS**3))
+        np.testing.assert_allclose(histograms.sum(axis=1), 1.0)
+
+    def test_dominant_colors(self):
+        colors, shares = image_features.dominant_colors(self.rgb)
+
+        self.assertEqual(
+            {tuple(c) for c in colors[0][shares[0] > 0].tolist()},
+            {(230, 120, 40), (40, 60, 200)},
+        )
+        np.testing.assert_allclose(shares[1, 0], 1.0)
+
+    def test_rank_by_color(self):
+        histograms = image_features.color_histogram(self.rgb)
+
+        orange = image_features.rank_by_color(histograms, np.array([(240, 130, 30)]))
+        blue = image_features.rank_by_color(histograms, np.array([(50, 50, 210)]))
+
+        self.assertGreater(orange[0], orange[1])
+        self.assertGreater(blue[1], blue[0])
+
+
+class TestEmbeddings(unittest.TestCase):
+    def test_similar_images_rank_first(self):
+        rng = np.random.default_rng(11)
+        rgb = rng.integers(0, 256, (40, 16, 16, 3), dtype=np.uint8)
+        noise = rng.integers(-10, 10, (16, 16, 3))
+        rgb[1] = np.clip(rgb[0].astype(int) + noise + 30, 0, 255)
+
+        vectors = image_features.pixel_vectors(rgb)
+        mean, components = image_features.fit_pca(vectors, dims=16)
+        embeddings = image_features.project(vectors, mean, components)
+
+        self.assertEqual(embeddings.shape, (40, 16))
+        np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1, rtol=1e-5)
+
+        scores = image_features.rank_by_similarity(embeddings, embeddings[0])
+        self.assertEqual(np.argsort(-scores)[:2].tolist(), [0, 1])
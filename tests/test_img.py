@@ -0,0 +1,56 @@
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from ..core import img
+
+
+class TestTonemap(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.image = (rng.random((32, 64, 3)) * 8.0).astype(np.float32)
+
+    def test_operators_run_in_place(self):
+        for operator in img.TONEMAP_OPERATORS:
+            image = self.image.copy()
+            result = img.tonemap(image, operator)
+            self.assertIs(result, image)
+            self.assertEqual(result.dtype, np.float32)
+
+    def test_reinhard_matches_reference(self):
+        x = self.image
+        expected = 2.0 * x / (1.0 + 2.0 * x)
+        result = img.tonemap(x.copy(), "reinhard", exposure=2.0)
+        np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+
+    def test_aces_matches_reference(self):
+        x = self.image
+        expected = np.clip(x * (2.51 * x + 0.03) / (x * (2.43 * x + 0.59) + 0.14), 0, 1)
+        result = img.tonemap(x.copy(), "aces")
+        np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+
+    def test_auto_exposure_normalizes_key(self):
+        bright = img.tonemap(self.image * 100.0, "exposure", auto_exposure=True)
+        dark = img.tonemap(self.image.copy(), "exposure", auto_exposure=True)
+        np.testing.assert_allclose(bright, dark, rtol=1e-3)
+
+    def test_encode_srgb(self):
+        ramp = np.linspace(0, 1, 256, dtype=np.float32).reshape(1, -1, 1)
+        encoded = img.encode_srgb(np.repeat(ramp, 3, axis=2))
+        self.assertEqual(encoded.dtype, np.uint8)
+        self.assertEqual(encoded[0, 0, 0], 0)
+        self.assertEqual(encoded[0, -1, 0], 255)
+        self.assertTrue(np.all(np.diff(encoded[0, :, 0].astype(int)) >= 0))
+
+
+class TestSdrPreview(unittest.TestCase):
+    def test_tonemap_only_applies_to_decoded_exrs(self):
+        with mock.patch.object(img.sys, "platform", "win32"):
+            self.assertTrue(img.applies_tonemap(Path("sky.exr")))
+            self.assertFalse(img.applies_tonemap(Path("sky.hdr")))
+
+        # rust_thumbnails converts them on macOS
+        with mock.patch.object(img.sys, "platform", "darwin"):
+            self.assertFalse(img.applies_tonemap(Path("sky.exr")))
@@ -0,0 +1,83 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from ..controller.db import DBWriter
+from ..controller.job_queue import JobKind, JobPriority, ThumbnailJobQueue
+from ..controller.settings import SettingsManager
+
+
+class TestThumbnailJobQueue(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db_path = SettingsManager.DB_PATH
+        SettingsManager.DB_PATH = Path(self.test_dir, "test.db")
+        ThumbnailJobQueue._table_created = False
+
+        self.pool_root = Path(self.test_dir, "HDRIPool")
+        self.assets = [self.pool_root / "HDRIs" / f"hdri{i}.exr" for i in range(5)]
+
+    def tearDown(self):
+        DBWriter.shutdown()
+        SettingsManager.DB_PATH = self.db_path
+        ThumbnailJobQueue._table_created = False
+        shutil.rmtree(self.test_dir)
+
+    def test_jobs_run_in_folder_order(self):
+        ThumbnailJobQueue.push(JobKind.HDRI, self.pool_root, self.assets)
+
+        jobs = ThumbnailJobQueue.next(JobKind.HDRI, self.pool_root, count=5)
+        self.assertEqual(jobs, self.assets)
+
+    def test_duplicates_are_merged(self):
+        ThumbnailJobQueue.push(JobKind.HDRI, self.pool_root, self.assets)
+        ThumbnailJobQueue.push(
+            JobKind.HDRI, self.pool_root, self.assets[3:4], JobPriority.VISIBLE
+        )
+        ThumbnailJobQueue.push(JobKind.HDRI, self.pool_root, self.assets)
+
+        self.assertEqual(ThumbnailJobQueue.pending(JobKind.HDRI, self.pool_root), 5)
+        jobs = ThumbnailJobQueue.next(JobKind.HDRI, self.pool_root)
+        self.assertEqual(jobs, [self.assets[3]])
+
+    def test_prioritise_reorders_pending_jobs(self):
+        ThumbnailJobQueue.push(JobKind.HDRI, self.pool_root, self.assets)
+        ThumbnailJobQueue.prioritise(
+            JobKind.HDRI, self.pool_root, self.assets[2:4], selected=self.assets[4]
+        )
+
+        jobs = ThumbnailJobQueue.next(JobKind.HDRI, self.pool_root, count=5)
+        self.assertEqual(jobs[:3], [self.assets[4], self.assets[2], self.assets[3]])
+
+        ThumbnailJobQueue.prioritise(JobKind.HDRI, self.pool_root, [])
+        jobs = ThumbnailJobQueue.next(JobKind.HDRI, self.pool_root, count=5)
+        self.assertEqual(jobs, self.assets)
+
+    def test_done_removes_jobs(self):
+        ThumbnailJobQueue.push(JobKind.HDRI, self.pool_root, self.assets)
+        ThumbnailJobQueue.done(self.assets[:2])
+
+        self.assertEqual(ThumbnailJobQueue.pending(JobKind.HDRI, self.pool_root), 3)
+        self.assertEqual(ThumbnailJobQueue.pending(JobKind.MATERIAL, self.pool_root), 0)
+
+    def test_prioritise_later_keeps_the_latest_order(self):
+        ThumbnailJobQueue.push(JobKind.HDRI, self.pool_root, self.assets)
+        for visible in (self.assets[1:2], self.assets[3:4]):
+            ThumbnailJobQueue.prioritise_later(JobKind.HDRI, self.pool_root, visible)
+        DBWriter.flush()
+
+        jobs = ThumbnailJobQueue.next(JobKind.HDRI, self.pool_root)
+        self.assertEqual(jobs, [self.assets[3]])
+
+    def test_failed_jobs_wait_for_the_next_push(self):
+        ThumbnailJobQueue.push(JobKind.HDRI, self.pool_root, self.assets)
+        ThumbnailJobQueue.fail(self.assets[:2])
+        ThumbnailJobQueue.prioritise(JobKind.HDRI, self.pool_root, self.assets[:2])
+
+        jobs = ThumbnailJobQueue.next(JobKind.HDRI, self.pool_root, count=5)
+        self.assertEqual(jobs, self.assets[2:])
+        self.assertEqual(ThumbnailJobQueue.pending(JobKind.HDRI, self.pool_root), 3)
+
+        ThumbnailJobQueue.push(JobKind.HDRI, self.pool_root, self.assets[:2])
+        self.assertEqual(ThumbnailJobQueue.pending(JobKind.HDRI, self.pool_root), 5)
@@ -0,0 +1,97 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from ..controller.asset_index import AssetIndex
+from ..controller.job_queue import JobKind, ThumbnailJobQueue
+from ..controller.settings import SettingsManager
+from ..controller.thread_worker import MaterialRenderThreadWorker
+
+
+class TestMaterialRenderShards(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db_path = SettingsManager.DB_PATH
+        SettingsManager.DB_PATH = Path(self.test_dir, "test.db")
+        ThumbnailJobQueue._table_created = False
+
+        self.pool_root = Path(self.test_dir, "MaterialPool")
+        (self.pool_root / "Thumbnails").mkdir(parents=True)
+        self.materials = [
+            self.pool_root / "Materials" / f"mtl{i}.mb" for i in range(10)
+        ]
+        ThumbnailJobQueue.push(JobKind.MATERIAL, self.pool_root, self.materials)
+        self.calls = []
+        self.workers_used = set()
+        self.clock_offset = 0
+
+    def tearDown(self):
+        SettingsManager.DB_PATH = self.db_path
+        ThumbnailJobQueue._table_created = False
+        AssetIndex._indices.pop(self.pool_root, None)
+        shutil.rmtree(self.test_dir)
+
+    def render_cmd(self, materials_file, threads=0, logging_path=None, worker=0):
+        def render():
+            materials = json.loads(Path(materials_file).read_text())["materials"]
+            self.calls.append((materials, threads))
+            self.workers_used.add(worker)
+            Path(logging_path).write_text(f"rendered {len(materials)}\n")
+            # mtl3 crashes maya unless it's rendered on its own
+            if len(materials) > 1 and any("mtl3" in mtl for mtl in materials):
+                return
+            for mtl in materials:
+                thumb = self.pool_root / "Thumbnails" / f"{Path(mtl).stem}.jpg"
+                thumb.touch()
+                mtime = time.time() + self.clock_offset
+                os.utime(thumb, (mtime, mtime))
+
+        return render
+
+    def test_shards_are_round_robin(self):
+        shards = MaterialRenderThreadWorker.shards(list(range(7)), 3)
+        self.assertEqual(shards, [[0, 3, 6], [1, 4], [2, 5]])
+        self.assertEqual(MaterialRenderThreadWorker.shards([0], 3), [[0]])
+
+    def test_failed_shard_is_retried_per_material(self):
+        worker = MaterialRenderThreadWorker(self.pool_root, self.render_cmd, 2)
+        progress = []
+        worker.progress.connect(lambda done, total: progress.append((done, total)))
+        worker.run()
+
+        thumbnails = {path.stem for path in (self.pool_root / "Thumbnails").iterdir()}
+        self.assertEqual(thumbnails, {mtl.stem for mtl in self.materials})
+        self.assertIn(([str(self.materials[3])], worker.render_threads(2)), self.calls)
+        self.assertEqual(progress[-1], (10, 10))
+        self.assertEqual(ThumbnailJobQueue.pending(JobKind.MATERIAL, self.pool_root), 0)
+        index = AssetIndex.for_pool(self.pool_root)
+        self.assertFalse(list(index.path.glob("render_*")))
+
+    def test_retries_reuse_the_workers(self):
+        worker = MaterialRenderThreadWorker(self.pool_root, self.render_cmd, 2)
+        worker.run()
+
+        retries = [materials for materials, _ in self.calls if len(materials) == 1]
+        self.assertEqual(len(retries), 5)
+        self.assertEqual(self.workers_used, {0, 1})
+
+    def test_rendered_despite_the_file_server_clock(self):
+        # the share is an hour behind, and the old thumbnails are older still
+        self.clock_offset = -3600
+        for mtl in self.materials:
+            thumb = self.pool_root / "Thumbnails" / f"{mtl.stem}.jpg"
+            thumb.touch()
+            os.utime(thumb, (time.time() - 7200, time.time() - 7200))
+
+        worker = MaterialRenderThreadWorker(self.pool_root, self.render_cmd, 2)
+        rendered = []
+        worker.chunk_rendered.connect(rendered.append)
+        worker.run()
+
+        self.assertEqual(ThumbnailJobQueue.pending(JobKind.MATERIAL, self.pool_root), 0)
+        thumbnails = {mtl: thumb for chunk in rendered for mtl, thumb in chunk.items()}
+        self.assertEqual(set(thumbnails), set(self.materials))
@@ -0,0 +1,75 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from ..controller.render_daemon import RenderDaemon
+
+PACKAGE_ROOT = Path(__file__).parent.parent
+STAND_INS = Path(__file__).parent / "stand_ins"
+
+
+class TestRenderDaemon(unittest.TestCase):
+    """Runs ``render_manager.py --daemon`` with the stand-in maya modules."""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.calls = self.test_dir / "calls.log"
+        env = dict(os.environ)
+        env["MAYA_STAND_IN_LOG"] = str(self.calls)
+        env["PYTHONPATH"] = os.pathsep.join(
+            (str(STAND_INS), str(PACKAGE_ROOT.parent), env.get("PYTHONPATH", ""))
+        )
+
+        script = PACKAGE_ROOT / "external" / "render_manager.py"
+        self.daemon = RenderDaemon(
+            [sys.executable, str(script)],
+            str(self.test_dir / "render.log"),
+            max_jobs=2,
+            env=env,
+        )
+
+    def tearDown(self):
+        self.daemon.stop()
+        shutil.rmtree(self.test_dir)
+
+    def render(self, scene="render.mb"):
+        settings = {
+            "material_renderer": 1,
+            "render_scene": str(self.test_dir / scene),
+            "render_cam": "render_cam",
+            "render_object": "shaderball_object",
+            "render_resolution_x": 64,
+            "render_resolution_y": 64,
+        }
+        material = str(self.test_dir / "MaterialPool" / "Materials" / "oak.mb")
+        return self.daemon.render(material, True, settings)
+
+    def logged(self, call):
+        lines = self.calls.read_text(encoding="utf-8").splitlines()
+        return sum(line.startswith(call) for line in lines)
+
+    def test_jobs_share_a_session_until_the_job_limit(self):
+        self.assertTrue(self.render())
+        self.assertTrue(self.render())
+        self.assertEqual(self.daemon.starts, 1)
+        self.assertEqual(self.logged("standalone.initialize"), 1)
+
+        # the daemon exited after two jobs, the third one starts a new one
+        self.assertTrue(self.render())
+        self.assertEqual(self.daemon.starts, 2)
+        self.assertEqual(self.logged("standalone.initialize"), 2)
+
+        # the scene is reset after every job
+        self.assertEqual(self.logged("cmds.file  force new"), 3)
+        self.assertEqual(self.logged(f"cmds.file {self.test_dir}"), 6)
+
+    def test_crash_restarts_the_daemon(self):
+        self.assertFalse(self.render("crash.mb"))
+        # the crashed job was retried once in a new session
+        self.assertEqual(self.daemon.starts, 2)
+
+        self.assertTrue(self.render())
+        self.assertEqual(self.daemon.starts, 3)
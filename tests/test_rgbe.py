@@ -0,0 +1,88 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from ..core import rgbe
+
+
+def rle_channel(values: bytes) -> bytes:
+    """Encode one channel as a single run and the rest as literal bytes."""
+
+    run = len(values) // 2
+    literal = values[run:]
+    return bytes((128 + run, values[0], len(literal))) + literal
+
+
+class TestRgbe(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = Path(self.test_dir) / "sky.hdr"
+
+        rng = np.random.default_rng(3)
+        self.image = (rng.random((16, 32, 3)) * 100).astype(np.float32)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_roundtrip(self):
+        rgbe.write(self.path, self.image)
+        rows = [row for *_, row in rgbe.iter_scanlines(self.path)]
+
+        # the shared exponent quantises every channel relative to the brightest
+        error = np.abs(np.stack(rows) - self.image)
+        self.assertTrue(np.all(error <= self.image.max(axis=2, keepdims=True) / 128))
+
+    def test_read_rle_scanline(self):
+        width = 16
+        pixels = np.zeros((width, 4), dtype=np.uint8)
+        pixels[: width // 2] = (10, 20, 30, 129)
+        pixels[width // 2 :, 3] = np.arange(width // 2) + 120
+
+        encoded = bytes((2, 2, 0, width))
+        for channel in pixels.T:
+            encoded += rle_channel(channel.tobytes())
+
+        with open(self.path, "wb") as file:
+            file.write(b"#?RADIANCE\nFORMAT=32-bit_rle_rgbe\n\n")
+            file.write(f"-Y 1 +X {width}\n".encode())
+            file.write(encoded)
+
+        (_, _, row), = rgbe.iter_scanlines(self.path)
+        np.testing.assert_allclose(row, rgbe.decode(pixels))
+
+    def test_downsample_keeps_energy(self):
+        rgbe.write(self.path, self.image)
+        half, quarter = rgbe.downsample(self.path, [16, 8])
+
+        self.assertEqual(half.shape, (8, 16, 3))
+        self.assertEqual(quarter.shape, (4, 8, 3))
+
+        decoded = np.stack([row for *_, row in rgbe.iter_scanlines(self.path)])
+        expected = decoded.reshape(8, 2, 16, 2, 3).mean(axis=(1, 3))
+        np.testing.assert_allclose(half, expected, rtol=1e-5)
+        self.assertAlmostEqual(quarter.mean(), decoded.mean(), places=3)
+
+    def test_downsample_keeps_the_full_resolution_peak(self):
+        self.image[5, 7] = (5000, 4000, 3000)
+        rgbe.write(self.path, self.image)
+
+        weights = (0.2, 0.7, 0.1)
+        (small,), peak = rgbe.downsample_with_peak(self.path, [8], weights)
+
+        decoded = np.stack([row for *_, row in rgbe.iter_scanlines(self.path)])
+        self.assertAlmostEqual(peak, float((decoded @ np.float32(weights)).max()), 1)
+        self.assertLess(float((small @ np.float32(weights)).max()), peak / 10)
+
+    def test_bad_run_lengths_are_rejected(self):
+        width = 16
+        header = b"#?RADIANCE\nFORMAT=32-bit_rle_rgbe\n\n" + b"-Y 1 +X 16\n"
+        start = bytes((2, 2, 0, width))
+        for channel in (bytes((128, 7)), bytes((128 + 12, 7, 128 + 5, 7))):
+            with open(self.path, "wb") as file:
+                file.write(header + start + channel)
+
+            with self.assertRaises(ValueError):
+                list(rgbe.iter_scanlines(self.path))
@@ -0,0 +1,45 @@
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ..ui.viewports import base_viewport
+from ..ui.viewports.base_viewport import AssetViewport
+
+
+class CaptureViewport(AssetViewport):
+    """The screenshot capture of AssetViewport without its widgets."""
+
+    def __init__(self):
+        self.screenshot_thread_running = False
+
+
+class TestScreenshotCapture(unittest.TestCase):
+    def setUp(self):
+        self.viewport = CaptureViewport()
+        self.grabs = []
+        timer = mock.patch.object(
+            base_viewport.QTimer,
+            "singleShot",
+            lambda delay, grab: self.grabs.append(grab),
+        )
+        timer.start()
+        self.addCleanup(timer.stop)
+
+    def capture(self):
+        thumbnail = Path("/project/MaterialPool/Thumbnails/mtl.jpg")
+        asset = Path("/project/MaterialPool/Materials/mtl.mb")
+        self.viewport.capture_screenshot((0, 0, 10, 10), thumbnail, asset, print)
+
+    def test_capture_during_the_delay_is_refused(self):
+        self.capture()
+        self.capture()
+        self.assertEqual(len(self.grabs), 1)
+
+    def test_failed_grab_allows_the_next_capture(self):
+        self.capture()
+        with mock.patch.object(base_viewport.img, "grab_screen", side_effect=OSError):
+            self.grabs[0]()
+
+        self.assertFalse(self.viewport.screenshot_thread_running)
+        self.capture()
+        self.assertEqual(len(self.grabs), 2)
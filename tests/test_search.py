@@ -0,0 +1,69 @@
+import unittest
+
+from ..core.search import NameIndex
+
+
+class TestNameIndex(unittest.TestCase):
+    def setUp(self):
+        self.names = ["Rusty_Metal", "brushed_metal", "Oak", "metal_grid", "Moss"]
+        self.index = NameIndex((i, name) for i, name in enumerate(self.names))
+
+    def expected(self, query):
+        return [i for i, name in enumerate(self.names) if query in name.lower()]
+
+    def test_matches_substring_scan(self):
+        for query in ("", "o", "me", "METAL", "al_g", "sted", "xyz"):
+            self.assertEqual(self.index.search(query), self.expected(query.lower()))
+
+    def test_refined_query(self):
+        self.assertEqual(self.index.search("m"), self.expected("m"))
+        self.assertEqual(self.index.search("met"), self.expected("met"))
+        self.assertEqual(self.index.search("metal_"), [3])
+
+        # widening the query searches the whole pool again
+        self.assertEqual(self.index.search("o"), self.expected("o"))
+        self.assertEqual(self.index.search(""), list(range(len(self.names))))
+
+
+class TestFuzzyRank(unittest.TestCase):
+    def setUp(self):
+        names = ["aluminium_brushed", "brushed_steel", "oak_planks", "old_black"]
+        self.tags = {"oak_planks": ["wood", "floor"]}
+        self.index = NameIndex(((name, name) for name in names), self.tags)
+
+    def ranked(self, query):
+        return [key for key, _ in self.index.rank(query)]
+
+    def test_typos(self):
+        self.assertEqual(self.ranked("alumnium_brushed"), ["aluminium_brushed"])
+        self.assertEqual(self.ranked("alumnuim"), ["aluminium_brushed"])
+
+    def test_names_before_tags_before_fuzzy(self):
+        brushed = self.ranked("brushed")
+        self.assertEqual(brushed, ["brushed_steel", "aluminium_brushed"])
+        self.assertEqual(self.ranked("wood"), ["oak_planks"])
+        self.assertEqual(self.ranked("oak"), ["oak_planks"])
+
+    def test_every_word_has_to_match(self):
+        self.assertEqual(self.ranked("steel brushed"), ["brushed_steel"])
+        self.assertEqual(self.ranked("oak floor"), ["oak_planks"])
+        self.assertEqual(self.ranked(""), self.index.keys())
+
+    def test_refined_rank_matches_a_fresh_index(self):
+        names = self.index.keys()
+        for query in ("b", "br", "brushed", "brushed st", "old", "o", "oak"):
+            fresh = NameIndex(((name, name) for name in names), self.tags)
+            self.index.rank(query)
+            self.assertEqual(self.index.rank(query + "e"), fresh.rank(query + "e"))
+
+    def test_typed_query_matches_a_fresh_index(self):
+        names = self.index.keys()
+        for query in ("brsuhed", "alumnuim", "brushed stel", "oak flor"):
+            index = NameIndex(((name, name) for name in names), self.tags)
+            for end in range(1, len(query) + 1):
+                typed = index.rank(query[:end])
+                fresh = NameIndex(((name, name) for name in names), self.tags)
+                self.assertEqual(typed, fresh.rank(query[:end]), query[:end])
+
+        brushed = {key for key, _ in index.rank("brsuhed")}
+        self.assertEqual(brushed, {"aluminium_brushed", "brushed_steel"})
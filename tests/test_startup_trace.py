@@ -0,0 +1,73 @@
+import ast
+import sys
+import types
+import unittest
+from pathlib import Path
+
+from ..core.startup_trace import StartupTrace
+
+PACKAGE_ROOT = Path(__file__).parent.parent
+
+
+def module_level_imports(tree: ast.AST):
+    """Imports that run when the module is imported, function bodies and
+    ``if TYPE_CHECKING:`` blocks are skipped."""
+
+    for node in ast.iter_child_nodes(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            continue
+        if isinstance(node, ast.If) and "TYPE_CHECKING" in ast.dump(node.test):
+            orelse = ast.Module(body=node.orelse, type_ignores=[])
+            yield from module_level_imports(orelse)
+            continue
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            yield node.module
+        yield from module_level_imports(node)
+
+
+class TestDeferredImports(unittest.TestCase):
+    def test_heavy_modules_are_imported_on_first_use(self):
+        for path in PACKAGE_ROOT.rglob("*.py"):
+            if "tests" in path.relative_to(PACKAGE_ROOT).parts:
+                continue
+
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+            for module in module_level_imports(tree):
+                with self.subTest(path=path, module=module):
+                    top_level = module.split(".")[0]
+                    self.assertNotIn(top_level, StartupTrace.HEAVY_MODULES)
+
+
+class TestStartupTrace(unittest.TestCase):
+    def tearDown(self):
+        StartupTrace._enabled = False
+        sys.modules.pop("mss", None)
+
+    def test_disabled_records_nothing(self):
+        StartupTrace._enabled = False
+        StartupTrace._phases = []
+        with StartupTrace.phase("imports"):
+            pass
+        self.assertEqual(StartupTrace.report()["phases"], [])
+
+    def test_phases_and_heavy_modules(self):
+        sys.modules.pop("mss", None)
+        StartupTrace.start()
+        with StartupTrace.phase("main_window"):
+            with StartupTrace.phase("draw_objects", "Materials"):
+                sys.modules["mss"] = types.ModuleType("mss")
+
+        report = StartupTrace.report()
+        names = [(phase["name"], phase["depth"]) for phase in report["phases"]]
+        self.assertEqual(names, [("main_window", 0), ("draw_objects", 1)])
+        self.assertEqual(report["heavy_modules"], {"mss": "draw_objects"})
+
+        budget = {"phases_ms": {"main_window": 60_000, "total": 0}}
+        errors = StartupTrace.check_budget(report, budget)
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(errors[0].startswith("total took"))
+
+        budget["allowed_modules"] = ["mss"]
+        self.assertEqual(len(StartupTrace.check_budget(report, budget)), 1)
@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from ..controller.settings import SettingsManager
+from ..controller.thumbnail_pack import ThumbnailPack
+
+
+class TestThumbnailPack(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.pool_root = Path(self.test_dir) / "MaterialPool"
+        self.thumbnail_path = self.pool_root / "Thumbnails"
+        self.thumbnail_path.mkdir(parents=True)
+
+        for i in range(3):
+            (self.thumbnail_path / f"material{i}.jpg").write_bytes(os.urandom(64))
+
+        self.packed = SettingsManager.window_settings.packed_thumbnails
+        SettingsManager.window_settings.packed_thumbnails = True
+
+    def tearDown(self):
+        SettingsManager.window_settings.packed_thumbnails = self.packed
+        ThumbnailPack.invalidate(self.pool_root)
+        shutil.rmtree(self.test_dir)
+
+    def read_packed(self, name: str):
+        packed = ThumbnailPack.find(str(self.thumbnail_path / name))
+        if not packed:
+            return None
+
+        pack, entry = packed
+        return pack.read(entry)
+
+    def test_pack_matches_loose_files(self):
+        self.assertEqual(ThumbnailPack.update(self.pool_root), 3)
+
+        for file in self.thumbnail_path.iterdir():
+            self.assertEqual(self.read_packed(file.name), file.read_bytes())
+
+    def test_update_is_incremental(self):
+        ThumbnailPack.update(self.pool_root)
+        self.assertEqual(ThumbnailPack.update(self.pool_root), 0)
+
+        (self.thumbnail_path / "material1.jpg").write_bytes(b"changed")
+        (self.thumbnail_path / "material2.jpg").unlink()
+
+        self.assertEqual(ThumbnailPack.update(self.pool_root), 2)
+        self.assertEqual(self.read_packed("material1.jpg"), b"changed")
+        self.assertIsNone(self.read_packed("material2.jpg"))
+
+    def test_missing_pack_falls_back(self):
+        self.assertIsNone(self.read_packed("material0.jpg"))
+
+    def test_update_doesnt_break_running_reads(self):
+        ThumbnailPack.update(self.pool_root)
+        pack, entry = ThumbnailPack.find(str(self.thumbnail_path / "material0.jpg"))
+
+        (self.thumbnail_path / "material1.jpg").write_bytes(b"changed")
+        ThumbnailPack.update(self.pool_root)
+
+        self.assertEqual(pack.read(entry), b"")
+        self.assertEqual(self.read_packed("material1.jpg"), b"changed")
+
+    def test_rewritten_loose_file_isnt_served_from_the_pack(self):
+        ThumbnailPack.update(self.pool_root)
+        thumbnail = self.thumbnail_path / "material0.jpg"
+        stat = thumbnail.stat()
+
+        # rewritten by another session that couldn't replace the pack
+        thumbnail.write_bytes(b"changed")
+        os.utime(thumbnail, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertIsNone(self.read_packed("material0.jpg"))
+        self.assertIsNotNone(self.read_packed("material1.jpg"))
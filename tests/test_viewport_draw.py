@@ -0,0 +1,92 @@
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ..ui.ui_components.widget_cache import WidgetCache
+from ..ui.viewports.base_viewport import AssetViewport
+from ..ui.viewports.material_viewport import MaterialsViewport
+from .test_widget_cache import Tile
+
+
+class Layout:
+    def __init__(self):
+        self.widgets = []
+
+    def addWidget(self, widget):
+        self.widgets.append(widget)
+
+
+class Attribute:
+    current_asset = None
+
+    def __init__(self):
+        self.displayed = []
+
+    def display_asset(self, path):
+        self.displayed.append(path)
+
+
+class PoolHandler:
+    def __init__(self, paths):
+        self.paths = paths
+
+    def get_assets_and_thumbnails(self, path):
+        # the real pool handler yields its assets lazily
+        return ((p.stem, p, None, 0) for p in self.paths)
+
+
+class DrawnViewport(MaterialsViewport):
+    """The tile loop of MaterialsViewport without the widgets around it."""
+
+    def __init__(self, paths):
+        self.pool_handler = PoolHandler(paths)
+        self.asset_grid = None
+        self.attribute = Attribute()
+        self.flow_layout = Layout()
+        self._button_cache = WidgetCache(lambda: 100)
+
+    def get_current_project(self):
+        return "project", "/project"
+
+    def get_pool_root(self):
+        return Path("/project/MaterialPool")
+
+    def tile_sizes(self):
+        return (100, 100), (80, 80)
+
+    def clear_layout(self):
+        self.flow_layout.widgets.clear()
+
+    def acquire_button(self, path, name, button_size, filesize, checkable=False):
+        tile = self._button_cache.pop(path, None) or Tile()
+        self._button_cache[path] = tile
+        return tile
+
+    def set_button_icon(self, btn, thumbnail, icon_size):
+        pass
+
+
+class TestViewportDraw(unittest.TestCase):
+    def setUp(self):
+        self.paths = [Path(f"/project/MaterialPool/Materials/{i}.mb") for i in range(5)]
+        patcher = mock.patch.object(AssetViewport, "draw_objects")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_every_asset_gets_a_tile(self):
+        viewport = DrawnViewport(self.paths)
+        viewport.draw_objects()
+
+        self.assertEqual(len(viewport.flow_layout.widgets), len(self.paths))
+        self.assertEqual(set(viewport._button_cache), set(self.paths))
+        self.assertEqual(viewport.attribute.displayed, [self.paths[0]])
+
+        viewport.draw_objects()
+        self.assertEqual(len(viewport.flow_layout.widgets), len(self.paths))
+
+    def test_empty_pool_draws_nothing(self):
+        viewport = DrawnViewport([])
+        viewport.draw_objects()
+
+        self.assertEqual(viewport.flow_layout.widgets, [])
+        self.assertEqual(viewport.attribute.displayed, [])
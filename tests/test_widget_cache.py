@@ -0,0 +1,64 @@
+import unittest
+from pathlib import Path
+
+from ..ui.ui_components.widget_cache import WidgetCache
+
+
+class Tile:
+    def __init__(self):
+        self._parent = None
+        self.deleted = False
+
+    def parent(self):
+        return self._parent
+
+    def setParent(self, parent):
+        self._parent = parent
+
+    def deleteLater(self):
+        self.deleted = True
+
+
+class TestWidgetCache(unittest.TestCase):
+    def setUp(self):
+        self.budget = 4
+        self.cache = WidgetCache(lambda: self.budget)
+        self.created = 0
+
+    def assets(self, pool):
+        return [Path(f"/project/{pool}/Materials/{i}.mb") for i in range(4)]
+
+    def draw(self, pool):
+        paths = self.assets(pool)
+        missing = sum(1 for path in paths if path not in self.cache)
+        self.cache.reserve(Path(f"/project/{pool}"), missing)
+        for path in paths:
+            if path in self.cache:
+                continue
+            tile = self.cache.recycle()
+            if tile is None:
+                tile = Tile()
+                self.created += 1
+            self.cache[path] = tile
+
+    def test_switching_pools_recycles_tiles(self):
+        self.draw("A")
+        self.assertEqual(self.created, 4)
+
+        for pool in ("B", "A", "B"):
+            self.draw(pool)
+        self.assertEqual(self.created, 4)
+        self.assertEqual(self.cache.recycled, 12)
+        self.assertEqual(len(self.cache), 4)
+
+    def test_tiles_beyond_the_budget_are_deleted(self):
+        self.draw("A")
+        tiles = [self.cache[path] for path in self.assets("A")]
+        self.budget = 2
+        self.cache.evict(Path("/project/B"))
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(sum(tile.deleted for tile in tiles), 2)
+        kept = [self.cache.recycle(), self.cache.recycle()]
+        self.assertFalse(any(tile.deleted for tile in kept))
+        self.assertIsNone(self.cache.recycle())
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from maya import OpenMayaUI
 from Qt import QtCompat
-from Qt.QtCore import Qt
+from Qt.QtCore import Qt, QTimer
 from Qt.QtGui import QIcon
 from Qt.QtWidgets import QHBoxLayout, QMainWindow, QSplitter, QWidget
 
 from ..controller import SettingsManager
-from ..core import Logger, get_version
+from ..core import Logger, StartupTrace, get_version
 from .ui_components import AttributeEditor, Sidebar
 from .viewports.viewport_container import ViewportContainer, ViewportMode
 
@@ -22,7 +22,8 @@ class MainWindow(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.settings = SettingsManager()
+        with StartupTrace.phase("settings_manager"):
+            self.settings = SettingsManager()
         self.setWindowTitle(f"Render Vault - {get_version()}")
         self.setWindowIcon(QIcon(":icons/tabler-icon-packages.png"))
         self.setWindowFlag(Qt.WindowType.Window)
@@ -32,18 +33,22 @@ class MainWindow(QWidget):
         Logger.set_propagate(False)
         Logger.info("starting Render Vault...")
 
-        self.settings.load_settings()
-        self.init_widgets()
-        self.init_layouts()
-        self.init_signals()
+        with StartupTrace.phase("load_settings"):
+            self.settings.load_settings()
+        with StartupTrace.phase("init_widgets"):
+            self.init_widgets()
+            self.init_layouts()
+            self.init_signals()
 
         self.load_settings(initial=True)
 
     @classmethod
     def show_window(cls) -> MainWindow:
         if not cls.win_instance:
-            cls.win_instance = MainWindow(parent=get_maya_main_window())
-            cls.win_instance.show()
+            with StartupTrace.phase("main_window"):
+                cls.win_instance = MainWindow(parent=get_maya_main_window())
+            with StartupTrace.phase("show"):
+                cls.win_instance.show()
         elif cls.win_instance.isHidden():
             cls.win_instance.show()
             cls.win_instance.load_settings()
@@ -85,7 +90,14 @@ class MainWindow(QWidget):
         s.about.clicked.connect(lambda: c.set_mode(ViewportMode.About))
         s.settings_btn.clicked.connect(lambda: c.set_mode(ViewportMode.Settings))
 
-        c.settings_vp.save.clicked.connect(self.save_and_update_settings)
+        c.save_requested.connect(self.save_and_update_settings)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if StartupTrace.enabled():
+            # the viewport is painted right after the window in the same pass
+            StartupTrace.mark("first_paint")
+            QTimer.singleShot(0, StartupTrace.finish)
 
     def closeEvent(self, event):
         self.save_settings()
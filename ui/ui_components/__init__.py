@@ -1,3 +1,4 @@
+from .asset_grid import *
 from .attribute_editor import *
 from .buttons import *
 from .dialogs import *
@@ -5,3 +6,4 @@ from .flow_layout import *
 from .separator import *
 from .tags import *
 from .toolbar import *
+from .widget_cache import *
@@ -0,0 +1,360 @@
+from pathlib import Path
+from typing import Iterable, Optional
+
+from Qt.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QPoint,
+    QRect,
+    QSize,
+    Qt,
+    Signal,
+)
+from Qt.QtGui import QColor, QPainter, QPixmap
+from Qt.QtWidgets import QAbstractItemView, QListView, QStyle, QStyledItemDelegate
+
+from ...controller.thread_worker import ThumbnailLoader
+from ...controller.thumbnail_cache import PixmapCache
+from .buttons import format_filesize
+
+
+class AssetItem:
+    __slots__ = ("name", "path", "thumbnail", "filesize", "suffix", "icon_key")
+
+    def __init__(
+        self, name: str, path: Path, thumbnail: Optional[str], filesize: int
+    ):
+        self.name = name
+        self.path = path
+        self.thumbnail = thumbnail
+        self.filesize = filesize
+        self.suffix = path.suffix.replace(".", "")
+        self.icon_key: Optional[tuple] = None
+
+
+class AssetListModel(QAbstractListModel):
+    """Flat list of pool assets, only the rows in ``_rows`` are shown.
+
+    Searching, filtering and ranking only reorder ``_rows``, the items
+    themselves are created once per pool load.
+    """
+
+    PathRole = Qt.UserRole + 1
+    ItemRole = Qt.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: list[AssetItem] = []
+        self._rows: list[int] = []
+        self._shown: dict[int, int] = {}
+        self._by_path: dict[Path, int] = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+
+        item = self._items[self._rows[index.row()]]
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return item.name
+        if role == self.PathRole:
+            return item.path
+        if role == self.ItemRole:
+            return item
+
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def set_assets(self, items: Iterable[AssetItem]) -> None:
+        self.beginResetModel()
+        self._items = list(items)
+        self._by_path = {item.path: row for row, item in enumerate(self._items)}
+        self.set_rows(list(range(len(self._items))))
+        self.endResetModel()
+
+    def set_rows(self, rows: list[int]) -> None:
+        self._rows = rows
+        self._shown = {row: shown for shown, row in enumerate(rows)}
+
+    def show(self, paths: Optional[Iterable[Path]] = None) -> None:
+        """Show only ``paths`` in the given order, or every asset if None."""
+
+        self.beginResetModel()
+        if paths is None:
+            self.set_rows(list(range(len(self._items))))
+        else:
+            rows = (self._by_path.get(path) for path in paths)
+            self.set_rows(list(dict.fromkeys(r for r in rows if r is not None)))
+        self.endResetModel()
+
+    def paths(self) -> list[Path]:
+        return [item.path for item in self._items]
+
+    def shown_paths(self) -> list[Path]:
+        return [self._items[row].path for row in self._rows]
+
+    def path_at(self, row: int) -> Path:
+        return self._items[self._rows[row]].path
+
+    def item(self, path: Path) -> Optional[AssetItem]:
+        row = self._by_path.get(path)
+        return None if row is None else self._items[row]
+
+    def index_of(self, path: Path) -> QModelIndex:
+        shown = self._shown.get(self._by_path.get(path, -1))
+        if shown is None:
+            return QModelIndex()
+
+        return self.index(shown)
+
+    def set_thumbnail(self, path: Path, thumbnail: Optional[str]) -> None:
+        item = self.item(path)
+        if not item:
+            return
+
+        item.thumbnail = thumbnail
+        item.icon_key = None
+        index = self.index_of(path)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+
+    def refresh_thumbnails(self) -> None:
+        for item in self._items:
+            item.icon_key = None
+
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1))
+
+    def remove(self, path: Path) -> None:
+        row = self._by_path.get(path)
+        if row is None:
+            return
+
+        self.beginResetModel()
+        del self._items[row]
+        self._by_path = {item.path: row for row, item in enumerate(self._items)}
+        self.set_rows([r - (r > row) for r in self._rows if r != row])
+        self.endResetModel()
+
+
+class AssetTileDelegate(QStyledItemDelegate):
+    """Paints an asset tile (thumbnail, name, size and type) the way a
+    ViewportButton looks, without any widgets per asset.
+
+    Thumbnails come from the PixmapCache, missing ones are requested from
+    the ThumbnailLoader once and painted when they arrive.
+    """
+
+    LABEL_HEIGHT = 22
+    INFO_HEIGHT = 22
+    # same colours as viewport_button_style
+    BACKGROUND = QColor(60, 60, 60)
+    SELECTED = QColor(235, 177, 52)
+    HOVER = QColor(128, 128, 128)
+    BORDER = QColor(0, 0, 0)
+    TEXT = QColor(220, 220, 220)
+
+    def __init__(
+        self,
+        view: "AssetGridView",
+        tile_size: tuple[int, int],
+        icon_size: tuple[int, int],
+        placeholder: str,
+    ):
+        super().__init__(view)
+        self.view = view
+        self.tile_size = tile_size
+        self.icon_size = icon_size
+        self.placeholder = placeholder
+        self.thumbnail_loader = ThumbnailLoader.instance()
+        self._pending: dict[tuple, Path] = {}
+
+        self.thumbnail_loader.pixmap_ready.connect(self.on_pixmap_ready)
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        width, height = self.tile_size
+        return QSize(width, height + self.LABEL_HEIGHT + self.INFO_HEIGHT)
+
+    def display_size(self) -> int:
+        return int(max(self.icon_size) * self.view.devicePixelRatioF())
+
+    def pixmap(self, item: AssetItem) -> QPixmap:
+        display_size = self.display_size()
+        if not item.thumbnail:
+            return PixmapCache.get_pixmap(self.placeholder, display_size)
+
+        # the key stats the thumbnail, only do that once per item
+        if item.icon_key is None or item.icon_key[2] != display_size:
+            item.icon_key = PixmapCache.make_key(item.thumbnail, display_size)
+
+        pixmap = PixmapCache.get(item.icon_key)
+        if pixmap is not None:
+            return pixmap
+
+        if item.icon_key not in self._pending:
+            self._pending[item.icon_key] = item.path
+            self.thumbnail_loader.request(item.icon_key, visible=True)
+
+        return PixmapCache.get_pixmap(self.placeholder, display_size)
+
+    def paint(self, painter: QPainter, option, index: QModelIndex) -> None:
+        item: AssetItem = index.data(AssetListModel.ItemRole)
+        if item is None:
+            return
+
+        rect = option.rect
+        painter.save()
+
+        background = self.BACKGROUND
+        if option.state & QStyle.State_Selected:
+            background = self.SELECTED
+        elif option.state & QStyle.State_MouseOver:
+            background = self.HOVER
+        painter.fillRect(rect, background)
+        painter.setPen(self.BORDER)
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
+        icon_width, icon_height = self.icon_size
+        icon_rect = QRect(0, 0, icon_width, icon_height)
+        icon_rect.moveCenter(
+            QPoint(rect.center().x(), rect.top() + self.tile_size[1] // 2)
+        )
+        pixmap = self.pixmap(item)
+        target = QSize(icon_width, icon_height)
+        scaled = pixmap.size().scaled(target, Qt.KeepAspectRatio)
+        pixmap_rect = QRect(QPoint(0, 0), scaled)
+        pixmap_rect.moveCenter(icon_rect.center())
+        painter.drawPixmap(pixmap_rect, pixmap)
+
+        painter.setPen(self.TEXT)
+        label_top = rect.top() + self.tile_size[1]
+        label_rect = QRect(rect.left(), label_top, rect.width(), self.LABEL_HEIGHT)
+        name = painter.fontMetrics().elidedText(
+            item.name, Qt.ElideRight, label_rect.width() - 10
+        )
+        painter.drawText(label_rect, Qt.AlignCenter, name)
+
+        info_rect = label_rect.translated(0, self.LABEL_HEIGHT)
+        info_rect.setHeight(self.INFO_HEIGHT)
+        font = painter.font()
+        font.setPointSize(8)
+        painter.setFont(font)
+        painter.setPen(self.BORDER)
+        middle = info_rect.center().x()
+        painter.drawLine(info_rect.topLeft(), info_rect.topRight())
+        painter.drawLine(middle, info_rect.top(), middle, info_rect.bottom())
+
+        painter.setPen(self.TEXT)
+        size_rect = info_rect.adjusted(0, 0, -info_rect.width() // 2, 0)
+        type_rect = info_rect.adjusted(info_rect.width() // 2, 0, 0, 0)
+        painter.drawText(
+            size_rect, Qt.AlignCenter, f"Size: {format_filesize(item.filesize)}"
+        )
+        painter.drawText(type_rect, Qt.AlignCenter, f"Type: {item.suffix}")
+
+        painter.restore()
+
+    def on_pixmap_ready(self, key: tuple, pixmap: QPixmap) -> None:
+        path = self._pending.pop(key, None)
+        if path is None:
+            return
+
+        index = self.view.model().index_of(path)
+        if index.isValid():
+            self.view.update(index)
+
+    def visible_keys(self, paths: Iterable[Path]) -> list[tuple]:
+        model = self.view.model()
+        items = (model.item(path) for path in paths)
+        return [item.icon_key for item in items if item and item.icon_key]
+
+    def cancel_pending(self) -> None:
+        self.thumbnail_loader.cancel(self._pending)
+        self._pending.clear()
+
+
+class AssetGridView(QListView):
+    """Virtualised asset grid, Qt only lays out and paints the visible
+    tiles, so pools with tens of thousands of assets show instantly.
+
+    Selection works like the checkable ViewportButtons: click selects one
+    asset, shift/ctrl extend the selection.
+    """
+
+    asset_clicked = Signal(object)
+    asset_context_menu = Signal(object, QPoint)
+
+    def __init__(
+        self,
+        tile_size: tuple[int, int],
+        icon_size: tuple[int, int],
+        placeholder: str,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.setViewMode(QListView.IconMode)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.setMouseTracking(True)
+        self.setSpacing(3)
+
+        self.asset_model = AssetListModel(self)
+        self.setModel(self.asset_model)
+        self.delegate = AssetTileDelegate(self, tile_size, icon_size, placeholder)
+        self.setItemDelegate(self.delegate)
+
+        self.clicked.connect(
+            lambda index: self.asset_clicked.emit(index.data(AssetListModel.PathRole))
+        )
+        self.customContextMenuRequested.connect(self.on_context_menu)
+
+    def on_context_menu(self, point: QPoint) -> None:
+        index = self.indexAt(point)
+        if not index.isValid():
+            return
+
+        if not self.selectionModel().isSelected(index):
+            self.setCurrentIndex(index)
+
+        path = index.data(AssetListModel.PathRole)
+        self.asset_context_menu.emit(path, self.viewport().mapToGlobal(point))
+
+    def selected_paths(self) -> list[Path]:
+        rows = sorted(index.row() for index in self.selectionModel().selectedIndexes())
+        return [self.asset_model.path_at(row) for row in rows]
+
+    def visible_paths(self) -> list[Path]:
+        """Paths of the tiles inside the viewport. Rows are laid out top to
+        bottom, so the first visible row is found by bisection."""
+
+        count = self.asset_model.rowCount()
+        viewport = self.viewport().rect()
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if self.visualRect(self.asset_model.index(middle)).bottom() < 0:
+                low = middle + 1
+            else:
+                high = middle
+
+        visible = []
+        for row in range(low, count):
+            rect = self.visualRect(self.asset_model.index(row))
+            if rect.top() > viewport.bottom():
+                break
+            if rect.intersects(viewport):
+                visible.append(self.asset_model.path_at(row))
+
+        return visible
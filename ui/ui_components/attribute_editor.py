@@ -1,5 +1,6 @@
 from functools import partial
 from pathlib import Path
+from typing import Optional
 
 from Qt.QtCore import Qt, Signal
 from Qt.QtWidgets import (
@@ -39,6 +40,11 @@ class Asset:
     def path(self, value: Path):
         self._path = value
 
+    @property
+    def file_path(self) -> Optional[Path]:
+        """The loaded asset, None if nothing was loaded yet."""
+        return self._path if self.asset_name else None
+
     def load(self, asset_path: Path):
         self._path = asset_path
         self.asset_name = asset_path.name
@@ -1,5 +1,8 @@
-from Qt.QtCore import QSize, Qt, Signal
-from Qt.QtGui import QIcon
+from pathlib import Path
+from typing import Optional
+
+from Qt.QtCore import QPoint, QSize, Qt, Signal
+from Qt.QtGui import QIcon, QPixmap
 from Qt.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -9,6 +12,7 @@ from Qt.QtWidgets import (
     QApplication,
 )
 
+from ...controller.thumbnail_cache import PixmapCache
 from ..qss import viewport_button_style
 
 
@@ -19,23 +23,50 @@ class IconButton(QPushButton):
         super().__init__(parent)
         self.setCheckable(checkable)
         self.setFixedSize(*size)
+        self.pending_key: Optional[tuple] = None
         self.clicked.connect(self.handle_shift)
 
     def set_icon(self, icon_path: str, icon_size: tuple[int, int]) -> None:
         width, height = icon_size
         self.icon_path = icon_path
-        icon = QIcon(icon_path)
-        available_sizes = icon.availableSizes()
-        if available_sizes and available_sizes[0].width() < width:
-            pixmap = icon.pixmap(available_sizes[0])
-            scaled_pixmap = pixmap.scaled(
-                width, height, Qt.KeepAspectRatio, Qt.FastTransformation
-            )
-            icon = QIcon(scaled_pixmap)
+        self.pending_key = None
+        pixmap = PixmapCache.get_pixmap(icon_path, self.display_size(icon_size))
 
-        self.setIcon(icon)
+        self.setIcon(QIcon(pixmap))
+        self.setIconSize(QSize(width, height))
+
+    def set_icon_cached(
+        self, icon_path: str, icon_size: tuple[int, int], placeholder: str
+    ) -> Optional[tuple]:
+        """Sets the icon if it's already decoded, otherwise shows ``placeholder``.
+
+        Returns the PixmapCache key that still has to be loaded, or None.
+        """
+        width, height = icon_size
+        self.icon_path = icon_path
+        display_size = self.display_size(icon_size)
+        key = PixmapCache.make_key(icon_path, display_size)
+        pixmap = PixmapCache.get(key)
+        missing = pixmap is None
+        if missing:
+            pixmap = PixmapCache.get_pixmap(placeholder, display_size)
+
+        self.pending_key = key if missing else None
+        self.setIcon(QIcon(pixmap))
         self.setIconSize(QSize(width, height))
 
+        return self.pending_key
+
+    def set_pixmap(self, key: tuple, pixmap: QPixmap) -> None:
+        if key != self.pending_key:
+            return
+
+        self.pending_key = None
+        self.setIcon(QIcon(pixmap))
+
+    def display_size(self, icon_size: tuple[int, int]) -> int:
+        return int(max(icon_size) * self.devicePixelRatioF())
+
     def set_tooltip(self, text: str) -> None:
         self.setToolTip(text)
 
@@ -69,6 +100,14 @@ class SidebarButton(QPushButton):
 
 
 class ViewportButton(QWidget):
+    """Asset tile of the AssetViewports. Tiles are recycled between assets
+    and pools, ``bind`` shows another asset in an existing tile."""
+
+    # path of the asset the tile is bound to
+    asset_clicked = Signal(object)
+    # (tile, path, point)
+    asset_context_menu = Signal(object, object, QPoint)
+
     def __init__(
         self,
         name: str,
@@ -79,6 +118,7 @@ class ViewportButton(QWidget):
         parent=None,
     ):
         super().__init__(parent)
+        self.path: Optional[Path] = None
         self.button_size = button_size
         self.name = name
         self.filesize = filesize
@@ -127,15 +167,55 @@ class ViewportButton(QWidget):
         self.main_layout.addLayout(self.info_layout)
 
     def init_signals(self):
-        pass
+        self.icon.clicked.connect(self.on_clicked)
+        self.customContextMenuRequested.connect(self.on_context_menu)
+
+    def on_clicked(self):
+        if self.path is not None:
+            self.asset_clicked.emit(self.path)
+
+    def on_context_menu(self, point: QPoint):
+        if self.path is not None:
+            self.asset_context_menu.emit(self, self.path, point)
+
+    def bind(
+        self,
+        path: Path,
+        name: str,
+        filesize: int,
+        suffix: str,
+        button_size: Optional[tuple[int, int]] = None,
+    ) -> None:
+        """Show the asset at ``path``, the thumbnail is set by the viewport."""
+
+        self.path = path
+        self.name = name
+        self.filesize = filesize
+        self.suffix = suffix.replace(".", "")
+        self.setToolTip(name)
+        self.label.setText(name)
+        self.file_size.setText(f"Size: {self.format_filesize()}")
+        self.file_type.setText(f"Type: {self.suffix}")
+        self.icon.setChecked(False)
+        self.icon.pending_key = None
+
+        if button_size and button_size != self.button_size:
+            self.button_size = button_size
+            self.setMinimumSize(*button_size)
+            self.icon.setFixedSize(*button_size)
+            self.label.setMaximumWidth(button_size[0])
 
     def format_filesize(self) -> str:
-        # bytes
+        return format_filesize(self.filesize)
+
+
+def format_filesize(filesize: int) -> str:
+    # bytes
 
-        filesize = f"{self.filesize / 1_000:.2f}KB"
-        if self.filesize >= 100_000_000:
-            filesize = f"{self.filesize / 1_000_000_000:.2f}GB"
-        elif self.filesize >= 100_000:
-            filesize = f"{self.filesize / 1_000_000:.2f}MB"
+    formatted = f"{filesize / 1_000:.2f}KB"
+    if filesize >= 100_000_000:
+        formatted = f"{filesize / 1_000_000_000:.2f}GB"
+    elif filesize >= 100_000:
+        formatted = f"{filesize / 1_000_000:.2f}MB"
 
-        return filesize
+    return formatted
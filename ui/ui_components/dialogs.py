@@ -22,6 +22,7 @@ from Qt.QtWidgets import (
 )
 
 from ...controller import Logger, PoolHandler
+from ...core import fs
 from .buttons import IconButton
 
 
@@ -398,6 +399,68 @@ class ArchiveViewerDialog(QDialog):
         return import_path
 
 
+class DuplicatesDialog(QDialog):
+    def __init__(self, duplicates: list[list[tuple[Path, int]]], parent=None):
+        super().__init__(parent)
+        self.duplicates = duplicates
+
+        self.setWindowTitle("Duplicate Finder")
+        self.resize(600, 400)
+
+        self.init_widgets()
+        self.init_layouts()
+        self.init_signals()
+
+    def init_widgets(self):
+        self.summary = QLabel(f"{len(self.duplicates)} groups of near duplicates")
+        self.open_folder = QPushButton("Open Folder")
+
+        self.tree_widget = QTreeWidget(self)
+        self.tree_widget.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.tree_widget.setHeaderLabels(["Asset", "Pool", "Distance"])
+
+        for idx, group in enumerate(self.duplicates, 1):
+            group_item = QTreeWidgetItem(
+                self.tree_widget, [f"Group {idx}", f"{len(group)} Assets", ""]
+            )
+            for thumbnail, distance in group:
+                item = QTreeWidgetItem(
+                    group_item,
+                    [thumbnail.stem, str(thumbnail.parent.parent), str(distance)],
+                )
+                item.setData(0, Qt.UserRole, str(thumbnail))
+            group_item.setExpanded(True)
+
+        self.tree_widget.resizeColumnToContents(0)
+
+    def init_layouts(self):
+        self.main_layout = QVBoxLayout(self)
+        self.select_layout = QHBoxLayout()
+
+        self.select_layout.addWidget(self.summary)
+        self.select_layout.addStretch()
+        self.select_layout.addWidget(self.open_folder)
+
+        self.main_layout.addWidget(self.tree_widget)
+        self.main_layout.addLayout(self.select_layout)
+
+    def init_signals(self):
+        self.open_folder.clicked.connect(lambda: self.open_selection())
+        self.tree_widget.itemDoubleClicked.connect(lambda: self.open_selection())
+
+    def open_selection(self):
+        selected = self.tree_widget.selectedItems()
+        if not selected:
+            return
+
+        thumbnail = selected[0].data(0, Qt.UserRole)
+        if not thumbnail:
+            Logger.error("select an asset instead of the group")
+            return
+
+        fs.open_dir(Path(thumbnail).parent.parent)
+
+
 class CreateTagDialog(QDialog):
     tag_created = Signal(str)
 
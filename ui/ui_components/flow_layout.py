@@ -1,16 +1,40 @@
+from typing import Optional
+
 from Qt.QtCore import QPoint, QRect, QSize, Qt
-from Qt.QtWidgets import QLayout, QSizePolicy
+from Qt.QtWidgets import (
+    QApplication,
+    QLayout,
+    QLayoutItem,
+    QSizePolicy,
+    QWidget,
+)
 
 
 class FlowLayout(QLayout):
+    """Left to right wrapping layout.
+
+    Hidden items are skipped. Spacing and item size hints are cached until
+    items are added, removed, shown, hidden or invalidated, so resizing only
+    recomputes positions. When every item
+    has the same size hint, which is the case for the asset grids, the
+    positions are computed arithmetically instead of walking the rows.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # assigned first, setContentsMargins calls invalidate
+        self._item_list = []
+        self._spacing: Optional[tuple[int, int]] = None
+        self._items: Optional[list[QLayoutItem]] = None
+        self._hints: Optional[list[QSize]] = None
+        self._uniform_hint: Optional[QSize] = None
+        self._heights: dict[int, int] = {}
+        self._geometry = QRect()
+
         if parent is not None:
             self.setContentsMargins(0, 0, 0, 0)
 
-        self._item_list = []
-
     def __del__(self):
         item = self.takeAt(0)
         while item:
@@ -18,6 +42,7 @@ class FlowLayout(QLayout):
 
     def addItem(self, item):
         self._item_list.append(item)
+        self._clear_cache()
 
     def count(self):
         return len(self._item_list)
@@ -30,10 +55,28 @@ class FlowLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self._item_list):
+            self._clear_cache()
             return self._item_list.pop(index)
 
         return None
 
+    def reorder(self, widgets: list[QWidget]) -> None:
+        """Move the items of ``widgets`` to the front in that order, the
+        other items keep their order behind them."""
+
+        order = {widget: i for i, widget in enumerate(widgets)}
+        last = len(order)
+        self._item_list.sort(key=lambda item: order.get(item.widget(), last))
+        self.invalidate()
+
+    def invalidate(self):
+        self._clear_cache()
+        super().invalidate()
+
+    def setSpacing(self, spacing):
+        super().setSpacing(spacing)
+        self._clear_cache()
+
     def expandingDirections(self):
         return Qt.Orientation(0)
 
@@ -41,12 +84,20 @@ class FlowLayout(QLayout):
         return True
 
     def heightForWidth(self, width):
-        height = self._do_layout(QRect(0, 0, width, 0), True)
+        height = self._heights.get(width)
+        if height is None:
+            height = self._do_layout(QRect(0, 0, width, 0), True)
+            self._heights[width] = height
+
         return height
 
     def setGeometry(self, rect):
         super().setGeometry(rect)
+        if rect == self._geometry:
+            return
+
         self._do_layout(rect, False)
+        self._geometry = QRect(rect)
 
     def sizeHint(self):
         return self.minimumSize()
@@ -54,41 +105,108 @@ class FlowLayout(QLayout):
     def minimumSize(self):
         size = QSize()
 
-        for item in self._item_list:
-            size = size.expandedTo(item.minimumSize())
+        if self._uniform_size_hint() is not None:
+            size = self._visible_items()[0].minimumSize()
+        else:
+            for item in self._visible_items():
+                size = size.expandedTo(item.minimumSize())
 
         size += QSize(
             2 * self.contentsMargins().top(), 2 * self.contentsMargins().top()
         )
         return size
 
+    def _clear_cache(self):
+        self._spacing = None
+        self._items = None
+        self._hints = None
+        self._uniform_hint = None
+        self._heights.clear()
+        self._geometry = QRect()
+
+    def _layout_spacing(self) -> tuple[int, int]:
+        if self._spacing is None:
+            spacing = self.spacing()
+            widget = next(
+                (item.widget() for item in self._item_list if item.widget()), None
+            )
+            style = widget.style() if widget else QApplication.style()
+            self._spacing = (
+                spacing
+                + style.layoutSpacing(
+                    QSizePolicy.PushButton, QSizePolicy.PushButton, Qt.Horizontal
+                ),
+                spacing
+                + style.layoutSpacing(
+                    QSizePolicy.PushButton, QSizePolicy.PushButton, Qt.Vertical
+                ),
+            )
+
+        return self._spacing
+
+    def _visible_items(self) -> list[QLayoutItem]:
+        self._size_hints()
+        return self._items
+
+    def _size_hints(self) -> list[QSize]:
+        if self._hints is None:
+            self._items = [item for item in self._item_list if not item.isEmpty()]
+            self._hints = [item.sizeHint() for item in self._items]
+            first = self._hints[0] if self._hints else None
+            if first is not None and all(hint == first for hint in self._hints):
+                self._uniform_hint = first
+
+        return self._hints
+
+    def _uniform_size_hint(self) -> Optional[QSize]:
+        self._size_hints()
+        return self._uniform_hint
+
     def _do_layout(self, rect, test_only):
+        if not self._visible_items():
+            return 0
+
+        hint = self._uniform_size_hint()
+        if hint is not None and hint.width() + self._layout_spacing()[0] > 0:
+            return self._do_uniform_layout(rect, test_only, hint)
+
         x = rect.x()
         y = rect.y()
         line_height = 0
-        spacing = self.spacing()
+        space_x, space_y = self._layout_spacing()
 
-        for item in self._item_list:
-            style = item.widget().style()
-            layout_spacing_x = style.layoutSpacing(
-                QSizePolicy.PushButton, QSizePolicy.PushButton, Qt.Horizontal
-            )
-            layout_spacing_y = style.layoutSpacing(
-                QSizePolicy.PushButton, QSizePolicy.PushButton, Qt.Vertical
-            )
-            space_x = spacing + layout_spacing_x
-            space_y = spacing + layout_spacing_y
-            next_x = x + item.sizeHint().width() + space_x
+        for item, size in zip(self._visible_items(), self._size_hints()):
+            width = size.width()
+            next_x = x + width + space_x
             if next_x - space_x > rect.right() and line_height > 0:
                 x = rect.x()
                 y = y + line_height + space_y
-                next_x = x + item.sizeHint().width() + space_x
+                next_x = x + width + space_x
                 line_height = 0
 
             if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+                item.setGeometry(QRect(QPoint(x, y), size))
 
             x = next_x
-            line_height = max(line_height, item.sizeHint().height())
+            line_height = max(line_height, size.height())
 
         return y + line_height - rect.y()
+
+    def _do_uniform_layout(self, rect, test_only, hint):
+        space_x, space_y = self._layout_spacing()
+        step_x = hint.width() + space_x
+        step_y = hint.height() + space_y
+
+        # same wrapping rule as the general layout: an item wraps once its
+        # right edge passes rect.right(), but a row always holds one item
+        columns = max(1, (rect.width() - 1 - hint.width()) // step_x + 1)
+        items = self._visible_items()
+        rows = -(-len(items) // columns)
+
+        if not test_only:
+            for i, item in enumerate(items):
+                row, column = divmod(i, columns)
+                position = QPoint(rect.x() + column * step_x, rect.y() + row * step_y)
+                item.setGeometry(QRect(position, hint))
+
+        return rows * step_y - space_y
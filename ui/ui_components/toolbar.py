@@ -4,6 +4,7 @@ from typing import Union
 from Qt.QtCore import Qt
 from Qt.QtWidgets import (
     QHBoxLayout,
+    QLabel,
     QLineEdit,
     QPushButton,
     QVBoxLayout,
@@ -173,6 +174,9 @@ class Statusbar(Toolbar):
         self.info.setCursorPosition(0)
         self.info.setMinimumWidth(20)
 
+        self.cache_info = QLabel("")
+        self.cache_info.setContentsMargins(10, 0, 10, 0)
+
         self.clear_btn = QPushButton("x")
         self.clear_btn.setFixedWidth(15)
         self.clear_btn.setStyleSheet(
@@ -186,6 +190,7 @@ class Statusbar(Toolbar):
 
         self.main_layout.addWidget(self.info)
         self.main_layout.addWidget(self.clear_btn)
+        self.main_layout.addWidget(self.cache_info)
 
     def init_signals(self) -> None:
         Logger.register_callback(self.update_info)
@@ -207,3 +212,6 @@ class Statusbar(Toolbar):
 
     def update_status(self, status: Status):
         pass
+
+    def update_cache_info(self, text: str) -> None:
+        self.cache_info.setText(text)
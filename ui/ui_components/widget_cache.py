@@ -0,0 +1,188 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from Qt.QtWidgets import QWidget
+
+
+class WidgetCache:
+    """Asset tiles of an AssetViewport, scoped per pool and bounded by a
+    tile budget.
+
+    Behaves like the ``dict[Path, QWidget]`` it replaces. Pools and the
+    tiles inside them are kept in least recently used order; when the
+    budget is exceeded whole pools that aren't on screen are evicted first,
+    then the oldest tiles of the current pool that aren't laid out. Evicted
+    tiles are handed to ``on_evict`` in one batch and kept for ``recycle``
+    while the budget has room, the rest is deleted.
+    """
+
+    # rough size of one ViewportButton with its child widgets and style,
+    # the thumbnail pixmaps are shared through the PixmapCache
+    WIDGET_BYTES = 12_000
+
+    def __init__(
+        self,
+        budget: Callable[[], int],
+        on_evict: Optional[Callable[[list[tuple[Path, QWidget]]], None]] = None,
+    ):
+        self.budget = budget
+        self.on_evict = on_evict
+        self._pools: "OrderedDict[Path, OrderedDict[Path, QWidget]]" = OrderedDict()
+        self._count = 0
+        self._free: list[QWidget] = []
+        self.evictions = 0
+        self.recycled = 0
+
+    @staticmethod
+    def pool_of(path: Path) -> Path:
+        return path.parent.parent
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, path: Path) -> bool:
+        pool = self._pools.get(self.pool_of(path))
+        return pool is not None and path in pool
+
+    def __iter__(self) -> Iterator[Path]:
+        for pool in list(self._pools.values()):
+            yield from list(pool)
+
+    def __getitem__(self, path: Path) -> QWidget:
+        pool_root = self.pool_of(path)
+        pool = self._pools[pool_root]
+        widget = pool[path]
+        pool.move_to_end(path)
+        self._pools.move_to_end(pool_root)
+        return widget
+
+    def __setitem__(self, path: Path, widget: QWidget) -> None:
+        pool_root = self.pool_of(path)
+        pool = self._pools.setdefault(pool_root, OrderedDict())
+        if path not in pool:
+            self._count += 1
+        pool[path] = widget
+        self._pools.move_to_end(pool_root)
+
+    def get(self, path: Path, default=None) -> Optional[QWidget]:
+        path = Path(path)
+        return self[path] if path in self else default
+
+    def pop(self, path: Path, *default) -> QWidget:
+        pool_root = self.pool_of(path)
+        pool = self._pools.get(pool_root, {})
+        if path not in pool:
+            if default:
+                return default[0]
+            raise KeyError(path)
+
+        widget = pool.pop(path)
+        self._count -= 1
+        if not pool:
+            del self._pools[pool_root]
+        return widget
+
+    def keys(self) -> list[Path]:
+        return list(self)
+
+    def items(self) -> list[tuple[Path, QWidget]]:
+        return [item for pool in self._pools.values() for item in pool.items()]
+
+    def pool(self, pool_root: Path) -> dict[Path, QWidget]:
+        """The tiles of one pool, without touching their LRU order."""
+
+        return dict(self._pools.get(pool_root, {}))
+
+    def evict(self, current_pool: Optional[Path] = None) -> int:
+        """Drop tiles until the cache fits its budget. Tiles of the current
+        pool that are laid out are never evicted."""
+
+        budget = self.budget()
+        evicted = []
+        for pool_root in list(self._pools):
+            if self._count <= budget:
+                break
+            if pool_root == current_pool:
+                continue
+
+            evicted += [(path, self.pop(path)) for path in list(self._pools[pool_root])]
+
+        pool = self._pools.get(current_pool, {})
+        for path, widget in list(pool.items()):
+            if self._count <= budget:
+                break
+            if widget.parent() is None:
+                evicted.append((path, self.pop(path)))
+
+        self.release(evicted)
+        return len(evicted)
+
+    def reserve(self, current_pool: Optional[Path], count: int) -> int:
+        """Evict other pools until ``count`` more tiles fit the budget, so the
+        current pool is drawn with their recycled tiles."""
+
+        budget = self.budget()
+        evicted = []
+        for pool_root in list(self._pools):
+            if self._count + count <= budget:
+                break
+            if pool_root == current_pool:
+                continue
+
+            evicted += [(path, self.pop(path)) for path in list(self._pools[pool_root])]
+
+        self.release(evicted)
+        return len(evicted)
+
+    def recycle(self) -> Optional[QWidget]:
+        """An evicted tile to bind to another asset, None if there is none."""
+
+        if not self._free:
+            return None
+
+        self.recycled += 1
+        return self._free.pop()
+
+    def release(self, evicted: list[tuple[Path, QWidget]]) -> None:
+        if not evicted:
+            return
+
+        if self.on_evict:
+            self.on_evict(evicted)
+
+        room = self.budget() - self._count - len(self._free)
+        for _, widget in evicted:
+            widget.setParent(None)
+            if room > 0:
+                self._free.append(widget)
+                room -= 1
+            else:
+                widget.deleteLater()
+
+        self.evictions += len(evicted)
+
+    def clear(self) -> None:
+        self.release([(path, self.pop(path)) for path in list(self)])
+        for widget in self._free:
+            widget.deleteLater()
+        self._free.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": self._count,
+            "pools": len(self._pools),
+            "budget": self.budget(),
+            "bytes": (self._count + len(self._free)) * self.WIDGET_BYTES,
+            "free": len(self._free),
+            "evictions": self.evictions,
+            "recycled": self.recycled,
+        }
+
+    def format_stats(self) -> str:
+        stats = self.stats()
+        return (
+            f"Tiles: {stats['entries']}/{stats['budget']} "
+            f"in {stats['pools']} pools (~{stats['bytes'] / 1_000_000:.0f}MB), "
+            f"{stats['free']} free, {stats['recycled']} recycled"
+        )
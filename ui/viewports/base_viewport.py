@@ -1,8 +1,12 @@
 import json
+from functools import partial
 from pathlib import Path
+from typing import Callable, Iterable, Optional
 
-from Qt.QtCore import Qt
+from Qt.QtCore import QPoint, QRect, Qt, QThread, QTimer
+from Qt.QtGui import QColor, QPixmap
 from Qt.QtWidgets import (
+    QColorDialog,
     QComboBox,
     QHBoxLayout,
     QLabel,
@@ -12,10 +16,26 @@ from Qt.QtWidgets import (
     QWidget,
 )
 
+from ...controller.asset_index import AssetIndex
+from ...controller.asset_sort import AssetSort, AssetUsage
+from ...controller.image_search import ImageSearch
+from ...controller.job_queue import JobKind, ThumbnailJobQueue
+from ...controller.metadata_handler import MetadataHandler
 from ...controller.settings import SettingsManager
-from ...core import Logger
+from ...controller.thread_worker import (
+    ImageSearchThreadWorker,
+    ScreenshotThreadWorker,
+    ThumbnailLoader,
+    ThumbnailPackThreadWorker,
+)
+from ...controller.thumbnail_cache import PixmapCache
+from ...controller.thumbnail_pack import ThumbnailPack
+from ...core import Logger, img
+from ...core.search import NameIndex
 from ..qss import toolbar_style
 from ..ui_components import (
+    AssetGridView,
+    AssetItem,
     FlowLayout,
     IconButton,
     Status,
@@ -23,20 +43,27 @@ from ..ui_components import (
     Toolbar,
     ToolbarDirection,
     ViewportButton,
+    WidgetCache,
+)
+from ..ui_components.dialogs import (
+    CreatePoolDialog,
+    DeletePoolDialog,
+    DuplicatesDialog,
 )
-from ..ui_components.dialogs import CreatePoolDialog, DeletePoolDialog
 from ..ui_components.separator import VLine
 
 
 class AssetViewport(QWidget):
-    _register = []
     metadata_path: Path
+    job_kind: Optional[JobKind] = None
+    # viewports that can show their pool in the virtual AssetGridView
+    supports_asset_grid = False
 
-    def __new__(cls, *args, **kwargs):
-        if cls not in cls._register:
-            cls._register.append(cls)
-
-        return super().__new__(cls, *args, **kwargs)
+    PLACEHOLDER_ICON = ":icons/tabler-icon-photo.png"
+    # time for the compositor to remove the hidden screenshot frame
+    SCREENSHOT_DELAY_MS = 200
+    # typing pause before the search runs
+    SEARCH_DELAY_MS = 150
 
     def __init__(self, attribute, parent=None):
         super().__init__(parent)
@@ -45,7 +72,17 @@ class AssetViewport(QWidget):
         self.ui_scale = SettingsManager().window_settings.ui_scale
         self.toolbar_btn_size = (20 * self.ui_scale, 20 * self.ui_scale)
         self.pools = {}
-        self._button_cache: dict[Path, ViewportButton] = {}
+        self._button_cache = WidgetCache(self.widget_cache_budget, self.release_buttons)
+        self._pending_icons: dict[tuple, ViewportButton] = {}
+        self.asset_grid: Optional[AssetGridView] = None
+        self.name_index: Optional[NameIndex] = None
+        self._search_query = ""
+        self._search_shown: Optional[set[Path]] = None
+        self._layout_order: Optional[list[QWidget]] = None
+        self.thumbnail_loader = ThumbnailLoader.instance()
+        self.pack_thread_running = False
+        self.search_thread_running = False
+        self.screenshot_thread_running = False
         self.settings = SettingsManager()
 
         self.init_widgets()
@@ -76,6 +113,16 @@ class AssetViewport(QWidget):
             ":icons/tabler-icon-folder-open.png", self.toolbar_btn_size
         )
 
+        self.order_box = QComboBox()
+        self.order_box.addItems(AssetSort.SORT_MODES)
+        self.order_box.setFixedHeight(self.toolbar_btn_size[0])
+        self.order_box.setToolTip("Sort the current Pool")
+
+        self.group_box = QComboBox()
+        self.group_box.addItems(AssetSort.GROUP_MODES)
+        self.group_box.setFixedHeight(self.toolbar_btn_size[0])
+        self.group_box.setToolTip("Group the current Pool by Tag or File Type")
+
         self.grid_widget = QWidget()
         self.grid_widget.setContentsMargins(5, 5, 5, 5)
         self.scroll_area = QScrollArea()
@@ -84,8 +131,19 @@ class AssetViewport(QWidget):
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
         self.scroll_area.setWidget(self.grid_widget)
 
+        if self.supports_asset_grid and self.settings.window_settings.virtual_grid:
+            self.asset_grid = AssetGridView(*self.tile_sizes(), self.PLACEHOLDER_ICON)
+
         self.statusbar = Statusbar(20 * self.ui_scale)
 
+        self.visible_timer = QTimer(self)
+        self.visible_timer.setSingleShot(True)
+        self.visible_timer.setInterval(50)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY_MS)
+
     def init_layouts(self):
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
@@ -98,6 +156,10 @@ class AssetViewport(QWidget):
         self.toolbar.main_layout.addWidget(self.remove_project)
         self.toolbar.main_layout.addWidget(self.open_folder)
         self.toolbar.main_layout.addWidget(VLine())
+        if hasattr(self, "metadata_path"):
+            self.toolbar.main_layout.addWidget(self.order_box)
+            self.toolbar.main_layout.addWidget(self.group_box)
+            self.toolbar.main_layout.addWidget(VLine())
 
         self.flow_layout = FlowLayout(self.grid_widget)
         self.flow_layout.setSpacing(0)
@@ -105,7 +167,7 @@ class AssetViewport(QWidget):
         self.infobar_layout = QHBoxLayout(self.statusbar)
 
         self.main_layout.addWidget(self.toolbar)
-        self.main_layout.addWidget(self.scroll_area)
+        self.main_layout.addWidget(self.asset_grid or self.scroll_area)
         self.main_layout.addWidget(self.statusbar)
 
     def init_signals(self):
@@ -116,39 +178,572 @@ class AssetViewport(QWidget):
             lambda: self.draw_objects(force=False)
         )
         self.attribute.tag_selected.connect(self.filter_tags)
+        self.order_box.currentIndexChanged.connect(self.apply_order)
+        self.group_box.currentIndexChanged.connect(self.apply_order)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(
+            self.visible_timer.start
+        )
+        self.visible_timer.timeout.connect(self.update_visible_thumbnails)
+        self.search_timer.timeout.connect(self.apply_search)
+        self.thumbnail_loader.pixmap_ready.connect(self.on_pixmap_ready)
+
+        if self.asset_grid:
+            self.asset_grid.verticalScrollBar().valueChanged.connect(
+                self.visible_timer.start
+            )
+            self.asset_grid.asset_clicked.connect(self.attribute.display_asset)
+            self.asset_grid.asset_clicked.connect(self.visible_timer.start)
+            self.asset_grid.asset_context_menu.connect(
+                lambda path, point: self.on_context_menu(None, path, point)
+            )
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.visible_timer.start()
+
+    def tile_sizes(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """(tile, icon) size of one asset in the grid."""
+
+        width = self.settings.window_settings.asset_button_size
+        return (width, width), (width - 20, width - 20)
+
+    def show_assets(self, assets) -> None:
+        """Fill the asset grid from get_assets_and_thumbnails."""
+
+        self.asset_grid.delegate.cancel_pending()
+        self.asset_grid.asset_model.set_assets(
+            AssetItem(name, path, thumbnail, size)
+            for name, path, thumbnail, size in assets
+        )
+        paths = self.asset_grid.asset_model.paths()
+        if paths and not self.attribute.current_asset:
+            self.attribute.display_asset(paths[0])
+
+    def selected_assets(self) -> list[Path]:
+        if self.asset_grid:
+            return self.asset_grid.selected_paths()
+
+        return [
+            path for path, btn in self.pool_buttons().items() if btn.icon.isChecked()
+        ]
+
+    def visible_assets(self) -> list[Path]:
+        if self.asset_grid:
+            return self.asset_grid.visible_paths()
+
+        return [
+            path
+            for path, btn in self.pool_buttons().items()
+            if self.is_button_visible(btn)
+        ]
+
+    def widget_cache_budget(self) -> int:
+        return self.settings.window_settings.widget_cache_size
+
+    def pool_buttons(self) -> dict[Path, ViewportButton]:
+        """Cached tiles of the pool on screen."""
+
+        pool_root = self.get_pool_root()
+        return self._button_cache.pool(pool_root) if pool_root else {}
+
+    def release_buttons(self, evicted: list[tuple[Path, ViewportButton]]):
+        """Cancel the pending thumbnails of evicted tiles before the cache
+        recycles or deletes them."""
+
+        buttons = {id(btn) for _, btn in evicted}
+        pending = [
+            key for key, btn in self._pending_icons.items() if id(btn) in buttons
+        ]
+        self.thumbnail_loader.cancel(pending)
+        for key in pending:
+            del self._pending_icons[key]
+
+        for _, btn in evicted:
+            btn.path = None
+
+    def reserve_buttons(self, paths: Iterable[Path]) -> None:
+        """Recycle the tiles of other pools when the budget can't hold the
+        tiles about to be drawn."""
+
+        missing = sum(1 for path in paths if path not in self._button_cache)
+        if missing:
+            self._button_cache.reserve(self.get_pool_root(), missing)
+
+    def acquire_button(
+        self,
+        path: Path,
+        name: str,
+        button_size: tuple[int, int],
+        filesize: int,
+        checkable=False,
+    ) -> ViewportButton:
+        """A tile bound to the asset at ``path``. Reuses the asset's own tile
+        or a recycled one, a new widget is only created if there is none."""
+
+        btn = self._button_cache.pop(path, None) or self._button_cache.recycle()
+        if btn is None:
+            btn = ViewportButton(name, button_size, filesize, path.suffix, checkable)
+            btn.setContextMenuPolicy(Qt.CustomContextMenu)
+            btn.asset_clicked.connect(self.attribute.display_asset)
+            btn.icon.clicked.connect(self.visible_timer.start)
+            btn.asset_context_menu.connect(self.on_context_menu)
+
+        btn.bind(path, name, filesize, path.suffix, button_size)
+        self._button_cache[path] = btn
+        return btn
 
     def clear_layout(self):
+        if self.asset_grid:
+            return
+
+        searched = self._search_shown is not None
+        self._search_shown = None
+        self._layout_order = None
+
         while self.flow_layout.count():
             widget = self.flow_layout.takeAt(0).widget()
             widget.icon.setChecked(False)
+            # undo the search's explicit hide, or addWidget keeps it hidden
+            if searched and widget.isHidden():
+                widget.setVisible(True)
             widget.setParent(None)
 
     def draw_objects(self, force=False):
         text = f"{'force ' if force else ''}reloaded {self.label.text()} pool: {self.pool_box.currentText()}"
         Logger.info(text)
         self.statusbar.update_status(Status.Idle)
+        self.visible_timer.start()
+        self._button_cache.evict(self.get_pool_root())
+        self.statusbar.update_cache_info(
+            f"{PixmapCache.format_stats()}   {self._button_cache.format_stats()}"
+        )
 
-    def search(self, input: str):
-        if not input:
-            self.draw_objects()
+        # the pool's assets may have changed, index them again on the next search
+        self.name_index = None
+        pool_root = self.get_pool_root()
+        if pool_root:
+            AssetSort.for_pool(pool_root).set_tags(None)
+        if not self.is_default_order():
+            self.apply_order()
+        if self._search_query:
+            self.search_timer.start()
 
+        if force:
+            self.update_thumbnail_pack()
+
+    def get_pool_root(self) -> Optional[Path]:
         _, path = self.get_current_project()
-        path = str(Path(path))
+        if not path or not hasattr(self, "metadata_path"):
+            return None
+
+        return (Path(path) / self.metadata_path).parent
+
+    def update_thumbnail_pack(self):
+        if not ThumbnailPack.enabled() or self.pack_thread_running:
+            return
+
+        pool_root = self.get_pool_root()
+        if not pool_root:
+            return
+
+        self.pack_thread_running = True
+        self.pack_thread = QThread(self)
+        self.pack_worker = ThumbnailPackThreadWorker(pool_root)
+
+        self.pack_worker.operation_ended.connect(self.pack_worker_ended)
+        self.pack_thread.started.connect(self.pack_worker.run)
+        self.pack_thread.finished.connect(self.pack_thread.deleteLater)
+
+        self.pack_worker.moveToThread(self.pack_thread)
+        self.pack_thread.start()
+
+    def pack_worker_ended(self):
+        changed = self.pack_worker.changed
+        self.pack_worker.deleteLater()
+        self.pack_thread.quit()
+        self.pack_thread_running = False
+
+        if changed:
+            self.refresh_icons()
+
+    def start_image_search(self, search: Callable, on_result: Callable):
+        if self.search_thread_running:
+            Logger.info("an image search is already running")
+            return
+
+        self.on_search_result = on_result
+        self.search_thread_running = True
+        self.search_thread = QThread(self)
+        self.search_worker = ImageSearchThreadWorker(search)
+
+        self.search_worker.operation_ended.connect(self.search_worker_ended)
+        self.search_thread.started.connect(self.search_worker.run)
+        self.search_thread.finished.connect(self.search_thread.deleteLater)
+
+        self.search_worker.moveToThread(self.search_thread)
+        self.search_thread.start()
+
+    def search_worker_ended(self):
+        result = self.search_worker.result
+        self.search_worker.deleteLater()
+        self.search_thread.quit()
+        self.search_thread_running = False
+
+        if result is not None:
+            self.on_search_result(result)
+
+    def capture_screenshot(
+        self,
+        geometry: tuple[int, int, int, int],
+        thumbnail_path: Path,
+        asset_path: Path,
+        on_saved: Callable,
+    ):
+        """Grab a screen region as thumbnail after the frame is gone.
+
+        Only the grab runs on the UI thread, resizing, encoding and writing
+        to the pool happen on a worker which calls ``on_saved`` with the
+        thumbnail and asset path when done.
+        """
+
+        if self.screenshot_thread_running:
+            Logger.warning("the previous screenshot is still being saved")
+            return
+
+        # set before the delay, a second capture meanwhile is refused too
+        self.screenshot_thread_running = True
+        grab = partial(
+            self.grab_screenshot, geometry, thumbnail_path, asset_path, on_saved
+        )
+        QTimer.singleShot(self.SCREENSHOT_DELAY_MS, grab)
+
+    def grab_screenshot(
+        self,
+        geometry: tuple[int, int, int, int],
+        thumbnail_path: Path,
+        asset_path: Path,
+        on_saved: Callable,
+    ):
+        try:
+            screenshot = img.grab_screen(geometry)
+        except Exception as e:
+            Logger.exception(e)
+            self.screenshot_thread_running = False
+            return
+
+        self.screenshot_thread = QThread(self)
+        self.screenshot_worker = ScreenshotThreadWorker(
+            screenshot, thumbnail_path, asset_path
+        )
+
+        self.screenshot_worker.thumbnail_saved.connect(on_saved)
+        self.screenshot_worker.operation_ended.connect(self.screenshot_worker_ended)
+        self.screenshot_thread.started.connect(self.screenshot_worker.run)
+        self.screenshot_thread.finished.connect(self.screenshot_thread.deleteLater)
+
+        self.screenshot_worker.moveToThread(self.screenshot_thread)
+        self.screenshot_thread.start()
+
+    def screenshot_worker_ended(self):
+        self.screenshot_worker.deleteLater()
+        self.screenshot_thread.quit()
+        self.screenshot_thread_running = False
+
+    def find_duplicates(self):
+        pool_roots = [
+            Path(path) / self.metadata_path.parent for path in self.pools.values()
+        ]
+        max_distance = self.settings.window_settings.duplicate_distance
+        Logger.info(f"searching near duplicates in {len(pool_roots)} pools")
+
+        self.start_image_search(
+            partial(ImageSearch.find_duplicates, pool_roots, max_distance),
+            self.show_duplicates,
+        )
+
+    def show_duplicates(self, duplicates: list[list[tuple[Path, int]]]):
+        Logger.info(f"found {len(duplicates)} groups of near duplicates")
+        dialog = DuplicatesDialog(duplicates, self)
+        dialog.exec_()
+
+    def filter_by_color(self):
+        pool_root = self.get_pool_root()
+        if not pool_root:
+            return
+
+        # offer the palette of the selected asset as custom colours
+        asset_path = self.attribute.current_asset.file_path
+        index = AssetIndex.for_pool(pool_root)
+        palettes = index.store(index.PALETTES)
+        features = palettes.get(asset_path.stem, {}) if asset_path else {}
+        for idx, (color, _) in enumerate(features.get("palette", [])):
+            QColorDialog.setCustomColor(idx, QColor(color))
+
+        color = QColorDialog.getColor(parent=self, title="Filter by Colour")
+        if not color.isValid():
+            return
+
+        rgb = (color.red(), color.green(), color.blue())
+        self.start_image_search(
+            partial(ImageSearch.rank_by_color, pool_root, [rgb]), self.show_ranking
+        )
+
+    def find_similar(self, path: Path):
+        pool_root = self.get_pool_root()
+        if not pool_root:
+            return
+
+        self.start_image_search(
+            partial(ImageSearch.find_similar, pool_root, path.stem), self.show_ranking
+        )
+
+    def show_ranking(
+        self, ranking: list[tuple[str, float]], keep_unranked: bool = True
+    ):
+        """Lay out the current pool in ranked order, assets that weren't
+        ranked (no thumbnail) go last unless they are filtered out."""
+
+        pool_root = self.get_pool_root()
+        if not pool_root:
+            return
+
+        if self.asset_grid:
+            model = self.asset_grid.asset_model
+            paths = {path.stem: path for path in model.paths()}
+            ranked = [paths.pop(name) for name, _ in ranking if name in paths]
+            model.show(ranked + list(paths.values()) if keep_unranked else ranked)
+            self.asset_grid.scrollToTop()
+            self.visible_timer.start()
+            return
+
+        buttons = {path.stem: btn for path, btn in self.pool_buttons().items()}
 
-        for k, v in self._button_cache.items():
-            if path not in str(k):
+        self.clear_layout()
+        for asset_name, _ in ranking:
+            btn = buttons.pop(asset_name, None)
+            if btn:
+                self.flow_layout.addWidget(btn)
+
+        if keep_unranked:
+            for btn in buttons.values():
+                self.flow_layout.addWidget(btn)
+
+        self.scroll_area.verticalScrollBar().setValue(0)
+        self.visible_timer.start()
+
+    def refresh_icons(self):
+        pool_root = self.get_pool_root()
+        if not pool_root:
+            return
+
+        if self.asset_grid:
+            self.asset_grid.asset_model.refresh_thumbnails()
+            return
+
+        for btn in self.pool_buttons().values():
+            icon_path = getattr(btn.icon, "icon_path", None)
+            if icon_path == self.PLACEHOLDER_ICON:
                 continue
-            if input.lower() in k.stem.lower():
-                if v.parent():
-                    continue
-                self.flow_layout.addWidget(v)
 
-            v.setParent(None)
+            size = btn.icon.iconSize()
+            self.set_button_icon(btn, icon_path, (size.width(), size.height()))
+
+    def set_button_icon(
+        self,
+        btn: ViewportButton,
+        thumbnail: Optional[str],
+        icon_size: tuple[int, int],
+    ):
+        if not thumbnail:
+            btn.icon.set_icon(self.PLACEHOLDER_ICON, icon_size)
+            return
 
-    def filter_tags(self, clicked_tag: QPushButton):
-        curr_vp_idx = self.settings.window_settings.current_viewport - 1
+        key = btn.icon.set_icon_cached(thumbnail, icon_size, self.PLACEHOLDER_ICON)
+        if key is None:
+            return
+
+        self._pending_icons[key] = btn
+        self.thumbnail_loader.request(key)
+
+    def cancel_pending_icons(self):
+        self.thumbnail_loader.cancel(self._pending_icons)
+        self._pending_icons.clear()
+        if self.asset_grid:
+            self.asset_grid.delegate.cancel_pending()
+
+    def on_pixmap_ready(self, key: tuple, pixmap: QPixmap):
+        btn = self._pending_icons.pop(key, None)
+        if btn:
+            btn.icon.set_pixmap(key, pixmap)
+
+    def is_button_visible(self, btn: ViewportButton) -> bool:
+        if not btn.isVisible():
+            return False
+
+        viewport = self.scroll_area.viewport()
+        rect = QRect(btn.mapTo(viewport, QPoint(0, 0)), btn.size())
+        return viewport.rect().intersects(rect)
+
+    def update_visible_thumbnails(self):
+        if self.asset_grid:
+            visible = self.asset_grid.visible_paths()
+            keys = self.asset_grid.delegate.visible_keys(visible)
+            self.thumbnail_loader.prioritise(keys)
+        elif self._pending_icons:
+            visible = [
+                key
+                for key, btn in self._pending_icons.items()
+                if self.is_button_visible(btn)
+            ]
+            self.thumbnail_loader.prioritise(visible)
+
+        self.prioritise_thumbnail_jobs()
+
+    def prioritise_thumbnail_jobs(self):
+        pool_root = self.get_pool_root()
+        if not self.job_kind or not pool_root:
+            return
+
+        visible = self.visible_assets()
+        selected = self.attribute.current_asset.file_path
+        ThumbnailJobQueue.prioritise_later(self.job_kind, pool_root, visible, selected)
+
+    def sort_mode(self) -> str:
+        """The AssetSort mode picked in the order box."""
+
+        return self.order_box.currentText()
+
+    def is_default_order(self) -> bool:
+        """Name order without groups is the order the pool is scanned in."""
+
+        return (
+            self.order_box.currentText() == AssetSort.NAME
+            and self.group_box.currentText() == AssetSort.NO_GROUPS
+        )
+
+    def load_tags(self) -> dict[Path, list[str]]:
+        _, path = self.get_current_project()
+        return MetadataHandler.load_tags(Path(path) / self.metadata_path)
+
+    def ordered(self, paths: list[Path]) -> list[Path]:
+        pool_root = self.get_pool_root()
+        if not pool_root:
+            return paths
+
+        sort = AssetSort.for_pool(pool_root)
+        group = self.group_box.currentText()
+        if group == AssetSort.GROUP_TAG:
+            sort.tags(self.load_tags)
+
+        return sort.order(paths, self.sort_mode(), group)
+
+    def apply_order(self):
+        """Reorder the tiles on screen by the selected sort and group mode,
+        from the ranks kept in the pool's AssetSort, without any I/O."""
 
-        if not isinstance(self, self._register[curr_vp_idx]):
+        pool_root = self.get_pool_root()
+        if not pool_root:
+            return
+
+        if self.asset_grid:
+            model = self.asset_grid.asset_model
+            model.show(self.ordered(model.shown_paths()))
+            self.asset_grid.scrollToTop()
+            self.visible_timer.start()
+            return
+
+        sort = AssetSort.for_pool(pool_root)
+        ordered = self.ordered(list(sort.rank(AssetSort.NAME)))
+        widgets = [
+            self._button_cache[path] for path in ordered if path in self._button_cache
+        ]
+
+        if self._layout_order is not None:
+            # search results keep their score order, the new order is
+            # restored once the search is cleared
+            self._layout_order = widgets
+        else:
+            self.flow_layout.reorder(widgets)
+            self.scroll_area.verticalScrollBar().setValue(0)
+
+        self.visible_timer.start()
+
+    def search(self, input: str):
+        self._search_query = input
+        self.search_timer.start()
+
+    def get_name_index(self) -> Optional[NameIndex]:
+        """Name and tag index of the pool on screen, built on the first
+        search."""
+
+        if self.name_index is not None:
+            return self.name_index
+
+        pool_root = self.get_pool_root()
+        if not pool_root:
+            return None
+
+        if self.asset_grid:
+            paths = self.asset_grid.asset_model.paths()
+        else:
+            paths = list(self.pool_buttons())
+
+        tags = AssetSort.for_pool(pool_root).tags(self.load_tags)
+        self.name_index = NameIndex(((path, path.stem) for path in paths), tags)
+        return self.name_index
+
+    def apply_search(self):
+        """Show the assets matching the search query ordered by score. Tiles
+        stay in the flow layout, only the ones whose match changed are shown
+        or hidden, and the layout order is restored once the query is empty.
+        """
+
+        index = self.get_name_index()
+        if index is None:
+            return
+
+        query = self._search_query
+        matches = [path for path, _ in index.rank(query)]
+        if self.asset_grid:
+            model = self.asset_grid.asset_model
+            model.show(matches if query.strip() else self.ordered(model.paths()))
+            self.asset_grid.scrollToTop()
+            self.visible_timer.start()
+            return
+
+        shown = set(matches)
+        previous = self._search_shown
+        if previous is None:
+            previous = set(index.keys())
+            self._layout_order = [
+                self.flow_layout.itemAt(i).widget()
+                for i in range(self.flow_layout.count())
+            ]
+
+        for path in previous - shown:
+            btn = self._button_cache.get(path)
+            # assets taken out of the layout by a tag filter stay out
+            if btn and btn.parent():
+                btn.setVisible(False)
+        for path in shown - previous:
+            btn = self._button_cache.get(path)
+            if btn and btn.parent():
+                btn.setVisible(True)
+
+        if query.strip():
+            self._search_shown = shown
+            self.flow_layout.reorder([self._button_cache[path] for path in matches])
+        else:
+            self.flow_layout.reorder(self._layout_order)
+            self._search_shown = None
+            self._layout_order = None
+
+        self.scroll_area.verticalScrollBar().setValue(0)
+        self.visible_timer.start()
+
+    def filter_tags(self, clicked_tag: QPushButton):
+        # every created viewport gets the tag, only the one on screen filters
+        if not self.isVisible():
             return
 
         text, checked = clicked_tag.text(), clicked_tag.isChecked()
@@ -164,6 +759,7 @@ class AssetViewport(QWidget):
         metadata_path.mkdir(exist_ok=True)
 
         self.clear_layout()
+        tagged = []
 
         for file in metadata_path.glob("*.json"):
             with open(file, "r") as f:
@@ -175,7 +771,16 @@ class AssetViewport(QWidget):
             if text not in tags:
                 continue
 
-            self.flow_layout.addWidget(self._button_cache[file_path])
+            if self.asset_grid:
+                tagged.append(file_path)
+                continue
+
+            btn = self._button_cache.get(file_path)
+            if btn:
+                self.flow_layout.addWidget(btn)
+
+        if self.asset_grid:
+            self.asset_grid.asset_model.show(tagged)
 
     def open_new_pool_dialog(self):
         create_pool_dialog = CreatePoolDialog()
@@ -248,10 +853,19 @@ class AssetViewport(QWidget):
         self.pool_box.setMinimumWidth(max_item_width + 50)
         # self.pool_box.blockSignals(False)
 
-    def delete_asset(self, path: Path, btn: ViewportButton):
+    def delete_asset(self, path: Path, btn: Optional[ViewportButton]):
         self.pool_handler.delete_asset(path)
-        self._button_cache.pop(path)
-        btn.deleteLater()
+        AssetIndex.for_asset(path).forget(path)
+        AssetSort.for_asset(path).forget(path)
+        AssetUsage.forget(path)
+        self.name_index = None
+        if self._search_shown is not None:
+            self._search_shown.discard(path)
+        if self.asset_grid:
+            self.asset_grid.asset_model.remove(path)
+            return
+
+        self._button_cache.release([(path, self._button_cache.pop(path))])
 
 
 class DataViewport(QWidget):
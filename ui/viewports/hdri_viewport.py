@@ -1,16 +1,23 @@
 from functools import partial
 from pathlib import Path
+from typing import Callable
 
-from Qt.QtCore import QCoreApplication, Qt, QThread
-from Qt.QtWidgets import QAction, QLabel, QLineEdit, QMenu
+from Qt.QtCore import QCoreApplication, QThread
+from Qt.QtWidgets import QAction, QComboBox, QLabel, QLineEdit, QMenu
 
 from ...controller import (
+    AssetIndex,
+    AssetSort,
+    HdriAnalytics,
     HDRIPoolHandler,
+    HdriProxyThreadWorker,
     HdrThreadWorker,
+    JobKind,
     MayaHandler,
     SettingsManager,
+    ThumbnailPack,
 )
-from ...core import utils
+from ...core import Logger, utils
 from ..ui_components.attribute_editor import AttributeEditor
 from ..ui_components.buttons import IconButton, ViewportButton
 from ..ui_components.separator import VLine
@@ -19,6 +26,7 @@ from .base_viewport import AssetViewport
 
 class HdriViewport(AssetViewport):
     metadata_path = Path("HDRIPool/Metadata")
+    job_kind = JobKind.HDRI
 
     def __init__(
         self,
@@ -32,6 +40,9 @@ class HdriViewport(AssetViewport):
 
         self.live_mode = False
         self.thread_running = False
+        self.proxy_thread_running = False
+        # (path, size, create) of the proxy imports, the first one is running
+        self.proxy_imports: list[tuple[Path, str, Callable]] = []
 
     def init_widgets(self):
         super().init_widgets()
@@ -62,6 +73,23 @@ class HdriViewport(AssetViewport):
         self.reload.set_icon(":icons/tabler-icon-reload.png", size)
         self.reload.set_tooltip("Reload the current Pool")
 
+        self.duplicates = IconButton(size)
+        self.duplicates.set_icon(":icons/tabler-icon-packages.png", size)
+        self.duplicates.set_tooltip("Find near duplicate HDRIs across all Pools")
+
+        self.color_filter = IconButton(size)
+        self.color_filter.set_icon(":icons/tabler-icon-crystal-ball.png", size)
+        self.color_filter.set_tooltip("Sort the current Pool by Colour")
+
+        # the lighting sorts share the order box with the file sorts
+        self.order_box.addItems(self.lighting_sorts())
+        self.order_box.setToolTip("Sort the current Pool by Name, File or Lighting")
+
+        self.light_filter = QComboBox()
+        self.light_filter.addItems(HdriAnalytics.FILTERS)
+        self.light_filter.setFixedHeight(size[0])
+        self.light_filter.setToolTip("Filter the current Pool by its Lighting")
+
         self.search_bar = QLineEdit(placeholderText="Search")
         self.search_bar.setFixedHeight(20 * self.ui_scale)
 
@@ -73,6 +101,10 @@ class HdriViewport(AssetViewport):
         self.toolbar.main_layout.addWidget(self.render_thumbnail)
         self.toolbar.main_layout.addWidget(VLine())
         self.toolbar.main_layout.addWidget(self.reload)
+        self.toolbar.main_layout.addWidget(self.duplicates)
+        self.toolbar.main_layout.addWidget(self.color_filter)
+        self.toolbar.main_layout.addWidget(VLine())
+        self.toolbar.main_layout.addWidget(self.light_filter)
         self.toolbar.main_layout.addWidget(VLine())
         self.toolbar.main_layout.addWidget(self.search_bar)
         self.toolbar.main_layout.addStretch()
@@ -80,7 +112,10 @@ class HdriViewport(AssetViewport):
     def init_signals(self):
         super().init_signals()
         self.reload.clicked.connect(lambda: self.draw_objects(force=True))
+        self.duplicates.clicked.connect(self.find_duplicates)
+        self.color_filter.clicked.connect(self.filter_by_color)
         self.render_thumbnail.clicked.connect(self.create_hdr_thumbnails)
+        self.light_filter.currentIndexChanged.connect(self.sort_by_lighting)
         self.search_bar.textChanged.connect(self.search)
 
     def load_pools(self):
@@ -99,36 +134,31 @@ class HdriViewport(AssetViewport):
             return
 
         self.clear_layout()
+        if force:
+            self.cancel_pending_icons()
 
         width = self.settings.window_settings.asset_button_size
-        assets = self.pool_handler.get_assets_and_thumbnails(path)
+        assets = list(self.pool_handler.get_assets_and_thumbnails(path))
+        index = AssetIndex.for_pool(Path(path) / self.metadata_path.parent)
+        stats = index.store(index.HDRI_STATS)
 
+        btn_size = (width, (width // 2) + 10)
+        self.reserve_buttons(hdr_path for _, hdr_path, _, _ in assets)
         for hdr_name, hdr_path, thumb, hdr_size in assets:
             if not force and hdr_path in self._button_cache:
                 self.flow_layout.addWidget(self._button_cache[hdr_path])
                 continue
 
-            btn_size = (width, (width // 2) + 10)
-            suffix = hdr_path.suffix
-
-            btn = ViewportButton(hdr_name, btn_size, hdr_size, suffix)
-            btn.icon.set_icon(
-                thumb or ":icons/tabler-icon-photo.png",
-                (width - 20, (width // 2)),
-            )
-            btn.icon.clicked.connect(partial(self.attribute.display_asset, hdr_path))
-
-            btn.setContextMenuPolicy(Qt.CustomContextMenu)
-            btn.customContextMenuRequested.connect(
-                partial(self.on_context_menu, btn, hdr_path)
-            )
-
+            btn = self.acquire_button(hdr_path, hdr_name, btn_size, hdr_size)
+            self.set_button_icon(btn, thumb, (width - 20, (width // 2)))
+            if hdr_name in stats:
+                btn.setToolTip(HdriAnalytics.describe(stats[hdr_name]))
             self.flow_layout.addWidget(btn)
-            self._button_cache[hdr_path] = btn
 
-        if not self.attribute.current_asset:
-            self.attribute.display_asset(next(iter(self._button_cache)))
+        if not self.attribute.current_asset and assets:
+            self.attribute.display_asset(assets[0][1])
 
+        # sorting by lighting is applied by apply_order
         super().draw_objects(force=force)
         if force:
             self.create_hdr_thumbnails()
@@ -141,6 +171,23 @@ class HdriViewport(AssetViewport):
         import_file = QAction("Import as File Node", self)
         import_file.triggered.connect(lambda: self.dcc_handler.create_file_node(path))
 
+        size = self.settings.hdri_settings.proxy_size
+        proxy_dome = QAction(f"Import as Domelight ({size} Proxy)", self)
+        proxy_dome.triggered.connect(
+            lambda: self.import_proxy(path, self.dcc_handler.create_domelight)
+        )
+        proxy_area = QAction(f"Import as Arealight ({size} Proxy)", self)
+        proxy_area.triggered.connect(
+            lambda: self.import_proxy(path, self.dcc_handler.create_arealight)
+        )
+        swap_proxy = QAction("Swap Proxy / Full Resolution", self)
+        swap_proxy.triggered.connect(
+            lambda: self.dcc_handler.swap_hdri_resolution(path)
+        )
+
+        similar_btn = QAction("Find Similar", self)
+        similar_btn.triggered.connect(lambda: self.find_similar(path))
+
         delete_btn = QAction("Delete HDRI", self)
         delete_btn.triggered.connect(lambda: self.delete_asset(path, button))
 
@@ -149,6 +196,12 @@ class HdriViewport(AssetViewport):
         pop_menu.addAction(import_area)
         pop_menu.addAction(import_file)
         pop_menu.addSeparator()
+        pop_menu.addAction(proxy_dome)
+        pop_menu.addAction(proxy_area)
+        pop_menu.addAction(swap_proxy)
+        pop_menu.addSeparator()
+        pop_menu.addAction(similar_btn)
+        pop_menu.addSeparator()
         pop_menu.addAction(delete_btn)
 
         pop_menu.exec_(button.mapToGlobal(point))
@@ -161,6 +214,7 @@ class HdriViewport(AssetViewport):
         if not btn:
             return
 
+        ThumbnailPack.discard(str(thumbnail_path))
         btn.icon.set_icon(str(thumbnail_path), (width - 20, (width // 2)))
         btn.update()
         QCoreApplication.processEvents()
@@ -172,16 +226,24 @@ class HdriViewport(AssetViewport):
         self.thread_running = True
         self.hdr_thread = QThread(self)
 
-        _, path = self.get_current_project()
+        name, path = self.get_current_project()
         if not path:
             return
 
         width = self.settings.window_settings.asset_button_size
+        tonemap = self.settings.hdri_settings.get_tonemap(name)
+        proxy_size = None
+        if self.settings.hdri_settings.generate_proxies:
+            proxy_size = self.settings.hdri_settings.proxy_size
 
-        self.hdr_worker = HdrThreadWorker(self.pool_handler, path, width)
+        self.hdr_worker = HdrThreadWorker(
+            self.pool_handler, path, width, tonemap, proxy_size
+        )
 
         self.hdr_worker.operation_ended.connect(self.render_worker_ended)
         self.hdr_worker.refresh_thumb.connect(self.refresh_thumbnail)
+        self.hdr_worker.jobs_queued.connect(self.prioritise_thumbnail_jobs)
+        self.hdr_worker.analytics_updated.connect(self.refresh_lighting)
         self.hdr_thread.started.connect(self.hdr_worker.run)
         self.hdr_thread.finished.connect(self.hdr_thread.deleteLater)
 
@@ -192,6 +254,120 @@ class HdriViewport(AssetViewport):
         self.hdr_worker.deleteLater()
         self.hdr_thread.quit()
         self.thread_running = False
+        self.update_thumbnail_pack()
+
+    def import_proxy(self, path: Path, create: Callable):
+        """Import an HDRI with its look-dev proxy, which is downsampled in
+        the background first if it doesn't exist yet. Imports requested
+        meanwhile wait for their turn."""
+
+        size = self.settings.hdri_settings.proxy_size
+        self.proxy_imports.append((path, size, create))
+        if not self.proxy_thread_running:
+            self.create_next_proxy()
+
+    def create_next_proxy(self):
+        path, size, _ = self.proxy_imports[0]
+
+        self.proxy_thread_running = True
+        self.proxy_thread = QThread(self)
+        self.proxy_worker = HdriProxyThreadWorker(path, size)
+
+        self.proxy_worker.operation_ended.connect(self.proxy_worker_ended)
+        self.proxy_thread.started.connect(self.proxy_worker.run)
+        self.proxy_thread.finished.connect(self.proxy_thread.deleteLater)
+
+        self.proxy_worker.moveToThread(self.proxy_thread)
+        self.proxy_thread.start()
+
+    def proxy_worker_ended(self):
+        proxy = self.proxy_worker.proxy
+        self.proxy_worker.deleteLater()
+        self.proxy_thread.quit()
+        self.proxy_thread_running = False
+
+        path, size, create = self.proxy_imports.pop(0)
+        if proxy is None:
+            Logger.error(
+                f"couldn't create the {size} proxy of {path.name}, nothing imported"
+            )
+        else:
+            create(path, proxy)
+
+        if self.proxy_imports:
+            self.create_next_proxy()
+
+    @staticmethod
+    def lighting_sorts() -> list[str]:
+        return [key for key in HdriAnalytics.SORT_KEYS if key != HdriAnalytics.NAME]
+
+    def lighting_sort(self) -> str:
+        """The HdriAnalytics sort key picked in the order box."""
+
+        mode = self.order_box.currentText()
+        return mode if mode in self.lighting_sorts() else HdriAnalytics.NAME
+
+    def sort_mode(self) -> str:
+        if self.lighting_sort() != HdriAnalytics.NAME:
+            return AssetSort.NAME
+        return super().sort_mode()
+
+    def is_default_order(self) -> bool:
+        return (
+            super().is_default_order()
+            and self.light_filter.currentText() == HdriAnalytics.ALL
+        )
+
+    def is_sorted_by_lighting(self) -> bool:
+        return (
+            self.lighting_sort() != HdriAnalytics.NAME
+            or self.light_filter.currentText() != HdriAnalytics.ALL
+        )
+
+    def apply_order(self):
+        if self.is_sorted_by_lighting():
+            self.sort_by_lighting()
+        else:
+            super().apply_order()
+
+    def refresh_lighting(self):
+        if self.is_sorted_by_lighting():
+            self.sort_by_lighting()
+
+    def sort_by_lighting(self):
+        pool_root = self.get_pool_root()
+        if not pool_root:
+            return
+
+        if not self.is_sorted_by_lighting():
+            self.draw_objects()
+            return
+
+        sort_key = self.lighting_sort()
+        light_filter = self.light_filter.currentText()
+
+        Logger.info(f"sorting HDRIs by {sort_key}, {light_filter}")
+        self.start_image_search(
+            partial(HdriAnalytics.rank, pool_root, sort_key, light_filter),
+            partial(self.show_lighting, pool_root),
+        )
+
+    def show_lighting(self, pool_root: Path, ranking: list[tuple[str, float]]):
+        index = AssetIndex.for_pool(pool_root)
+        stats = index.store(index.HDRI_STATS)
+        for path, btn in self.pool_buttons().items():
+            if path.stem in stats:
+                btn.setToolTip(HdriAnalytics.describe(stats[path.stem]))
+
+        if self.lighting_sort() == HdriAnalytics.NAME:
+            # only filtered by lighting, the assets keep the picked order
+            names = {asset_name for asset_name, _ in ranking}
+            paths = AssetSort.for_pool(pool_root).rank(AssetSort.NAME)
+            ordered = self.ordered([path for path in paths if path.stem in names])
+            ranking = [(path.stem, 0.0) for path in ordered]
+
+        keep_unranked = self.light_filter.currentText() == HdriAnalytics.ALL
+        self.show_ranking(ranking, keep_unranked)
 
     def start_live_mode(self):
         pass
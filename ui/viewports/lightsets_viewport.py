@@ -1,11 +1,14 @@
-from functools import partial
 from pathlib import Path
 
-from Qt.QtCore import Qt
 from Qt.QtWidgets import QAction, QLineEdit, QMenu
 
-from ...controller import LightsetPoolHandler, MayaHandler, SettingsManager
-from ...core import Logger, img, utils
+from ...controller import (
+    LightsetPoolHandler,
+    MayaHandler,
+    SettingsManager,
+    ThumbnailPack,
+)
+from ...core import Logger, utils
 from ..ui_components.attribute_editor import AttributeEditor
 from ..ui_components.buttons import IconButton, ViewportButton
 from ..ui_components.dialogs import ArchiveViewerDialog, ExportModelDialog
@@ -113,37 +116,29 @@ class LightsetsViewport(AssetViewport):
         width = self.settings.window_settings.asset_button_size
 
         self.clear_layout()
+        if force:
+            self.cancel_pending_icons()
 
-        assets = self.pool_handler.get_assets_and_thumbnails(path)
+        assets = list(self.pool_handler.get_assets_and_thumbnails(path))
+        self.reserve_buttons(model_path for _, model_path, _, _ in assets)
         for model, model_path, thumb, size in assets:
             if not force and model_path in self._button_cache:
                 self.flow_layout.addWidget(self._button_cache[model_path])
                 continue
 
-            btn = ViewportButton(
-                model, (width, width), size, model_path.suffix, checkable=True
-            )
-            btn.icon.set_icon(
-                thumb or ":icons/tabler-icon-photo.png", (width - 20, width - 20)
-            )
-            btn.icon.clicked.connect(partial(self.attribute.display_asset, model_path))
-
-            btn.setContextMenuPolicy(Qt.CustomContextMenu)
-            btn.customContextMenuRequested.connect(
-                partial(self.on_context_menu, btn, model_path)
+            btn = self.acquire_button(
+                model_path, model, (width, width), size, checkable=True
             )
+            self.set_button_icon(btn, thumb, (width - 20, width - 20))
             self.flow_layout.addWidget(btn)
-            self._button_cache[model_path] = btn
 
-        if not self.attribute.current_asset:
-            self.attribute.display_asset(next(iter(self._button_cache)))
+        if not self.attribute.current_asset and assets:
+            self.attribute.display_asset(assets[0][1])
 
         super().draw_objects(force=force)
 
     def on_context_menu(self, button: ViewportButton, path: Path, point):
-        selected = [
-            path for path, btn in self._button_cache.items() if btn.icon.isChecked()
-        ]
+        selected = self.selected_assets()
         multi_path = selected or path
         tooltip = button.toolTip()
 
@@ -187,14 +182,11 @@ class LightsetsViewport(AssetViewport):
         _, path = self.get_current_project()
         if not path:
             return
-        screenshot_path = str(
-            Path(path, "LightsetPool", "Thumbnails", f"{asset_name}.png")
-        )
-        img.take_screenshot(
-            screenshot_path,
-            geometry,
+        screenshot_path = Path(path, "LightsetPool", "Thumbnails", f"{asset_name}.png")
+
+        self.capture_screenshot(
+            geometry, screenshot_path, asset_path, self.refresh_thumbnail
         )
-        self.refresh_thumbnail(screenshot_path, asset_path)
 
     def refresh_thumbnail(self, screen_path: str, model_path: Path):
         width = self.settings.window_settings.asset_button_size
@@ -202,8 +194,10 @@ class LightsetsViewport(AssetViewport):
         if not btn:
             return
 
+        ThumbnailPack.discard(screen_path)
         btn.icon.set_icon(screen_path, (width - 20, width - 20))
         btn.update()
+        self.update_thumbnail_pack()
 
     def show_screenshot_frame(self, asset_name, asset_path):
         self.screenshot_frame = ScreenshotFrame(asset_name, asset_path)
@@ -1,15 +1,22 @@
+import time
 from functools import partial
 from pathlib import Path
+from typing import Optional
 
-from Qt.QtCore import Qt, QThread
+from Qt.QtCore import QThread
 from Qt.QtWidgets import QAction, QLineEdit, QMenu
 
 from ...controller import (
+    AssetIndex,
     Logger,
     MaterialPoolHandler,
     MayaHandler,
+    JobKind,
+    MaterialRenderThreadWorker,
     MayaThreadWorker,
     SettingsManager,
+    ThumbnailJobQueue,
+    ThumbnailPack,
 )
 from ...core import utils
 from ..ui_components.attribute_editor import AttributeEditor
@@ -21,6 +28,8 @@ from .base_viewport import AssetViewport
 
 class MaterialsViewport(AssetViewport):
     metadata_path = Path("MaterialPool/Metadata")
+    job_kind = JobKind.MATERIAL
+    supports_asset_grid = True
 
     def __init__(
         self,
@@ -32,6 +41,7 @@ class MaterialsViewport(AssetViewport):
         self.pool_handler = MaterialPoolHandler()
         self.dcc_handler = MayaHandler()
         self.tag_cache = {}
+        self.queue_thread_running = False
 
     def init_widgets(self):
         super().init_widgets()
@@ -66,6 +76,14 @@ class MaterialsViewport(AssetViewport):
         self.reload.set_icon(":icons/tabler-icon-reload.png", size)
         self.reload.set_tooltip("Reload the current Pool")
 
+        self.duplicates = IconButton(size)
+        self.duplicates.set_icon(":icons/tabler-icon-packages.png", size)
+        self.duplicates.set_tooltip("Find near duplicate Materials across all Pools")
+
+        self.color_filter = IconButton(size)
+        self.color_filter.set_icon(":icons/tabler-icon-crystal-ball.png", size)
+        self.color_filter.set_tooltip("Sort the current Pool by Colour")
+
         self.search_bar = QLineEdit(placeholderText="Search")
         self.search_bar.setFixedHeight(20 * self.ui_scale)
 
@@ -78,6 +96,8 @@ class MaterialsViewport(AssetViewport):
         self.toolbar.main_layout.addWidget(self.repath)
         self.toolbar.main_layout.addWidget(VLine())
         self.toolbar.main_layout.addWidget(self.reload)
+        self.toolbar.main_layout.addWidget(self.duplicates)
+        self.toolbar.main_layout.addWidget(self.color_filter)
         self.toolbar.main_layout.addWidget(VLine())
         self.toolbar.main_layout.addWidget(self.search_bar)
         self.toolbar.main_layout.addStretch()
@@ -88,6 +108,8 @@ class MaterialsViewport(AssetViewport):
         self.archive_viewer.clicked.connect(self.open_archive_viewer)
         self.render_materials.clicked.connect(self.render_material_thumbnails)
         self.reload.clicked.connect(lambda: self.draw_objects(force=True))
+        self.duplicates.clicked.connect(self.find_duplicates)
+        self.color_filter.clicked.connect(self.filter_by_color)
         self.repath.clicked.connect(self.repath_material_textures)
         self.search_bar.textChanged.connect(self.search)
 
@@ -135,44 +157,38 @@ class MaterialsViewport(AssetViewport):
         if not path:
             return
 
-        btn_width = self.settings.window_settings.asset_button_size
-        btn_size = btn_width, btn_width
-        icon_size = btn_width - 20, btn_width - 20
+        btn_size, icon_size = self.tile_sizes()
         self.clear_layout()
+        if force:
+            self.cancel_pending_icons()
 
-        assets = self.pool_handler.get_assets_and_thumbnails(path)
+        assets = list(self.pool_handler.get_assets_and_thumbnails(path))
+        if self.asset_grid:
+            self.show_assets(assets)
+            super().draw_objects(force=force)
+            return
+
+        self.reserve_buttons(mtl_path for _, mtl_path, _, _ in assets)
         for mtl, mtl_path, thumb, size in assets:
             if not force and mtl_path in self._button_cache:
                 self.flow_layout.addWidget(self._button_cache[mtl_path])
                 continue
 
-            suffix = mtl_path.suffix
-
-            btn = ViewportButton(mtl, btn_size, size, suffix, checkable=True)
-            btn.icon.set_icon(
-                thumb or ":icons/tabler-icon-photo.png",
-                icon_size,
-            )
-            btn.setContextMenuPolicy(Qt.CustomContextMenu)
-            btn.customContextMenuRequested.connect(
-                partial(self.on_context_menu, btn, mtl_path)
-            )
-            btn.icon.clicked.connect(partial(self.attribute.display_asset, mtl_path))
+            btn = self.acquire_button(mtl_path, mtl, btn_size, size, checkable=True)
+            self.set_button_icon(btn, thumb, icon_size)
             self.flow_layout.addWidget(btn)
-            self._button_cache[mtl_path] = btn
 
-        if not self.attribute.current_asset:
-            self.attribute.display_asset(next(iter(self._button_cache)))
+        if not self.attribute.current_asset and assets:
+            self.attribute.display_asset(assets[0][1])
 
         super().draw_objects(force=force)
 
-    def on_context_menu(self, button: ViewportButton, path: Path, point):
-        selected = [
-            path for path, btn in self._button_cache.items() if btn.icon.isChecked()
-        ]
-        multi_path = selected or path
+    def on_context_menu(self, button: Optional[ViewportButton], path: Path, point):
+        """``point`` is relative to ``button``, or global for the asset grid."""
+
+        multi_path = self.selected_assets() or path
 
-        tooltip = button.toolTip()
+        tooltip = path.stem
         open_btn = QAction("Open Scene", self)
         open_btn.triggered.connect(lambda: self.dcc_handler.open_scene(path))
 
@@ -212,6 +228,9 @@ class MaterialsViewport(AssetViewport):
             lambda: self.render_material_thumbnails(path=path, single=True)
         )
 
+        similar_btn = QAction("Find Similar", self)
+        similar_btn.triggered.connect(lambda: self.find_similar(path))
+
         pop_menu = QMenu(self)
         pop_menu.addAction(open_btn)
         pop_menu.addSeparator()
@@ -224,36 +243,105 @@ class MaterialsViewport(AssetViewport):
         pop_menu.addAction(archive)
         pop_menu.addSeparator()
         pop_menu.addAction(render_btn)
+        pop_menu.addAction(similar_btn)
         pop_menu.addSeparator()
         pop_menu.addAction(delete_btn)
 
-        pop_menu.exec_(button.mapToGlobal(point))
+        pop_menu.exec_(button.mapToGlobal(point) if button else point)
 
     def render_material_thumbnails(self, path=None, single=False):
         if not path:
             _, path = self.get_current_project()
             if not path:
                 return
+
         if single:
             command = self.dcc_handler.render_single_material_cmd(path)
-        else:
-            command = self.dcc_handler.render_all_materials_cmd(path)
+            self.render_job = (time.time_ns(), [Path(path)])
+
+            self.render_thread = QThread(self)
+            self.render_worker = MayaThreadWorker(command)
+
+            self.render_worker.operation_ended.connect(self.render_worker_ended)
+
+            self.render_thread.started.connect(self.render_worker.run)
+            self.render_thread.finished.connect(self.render_thread.deleteLater)
+
+            self.render_worker.moveToThread(self.render_thread)
+            self.render_thread.start()
+            return
+
+        pool_root = Path(path, "MaterialPool")
+        index = AssetIndex.for_pool(pool_root)
+        assets = self.pool_handler.get_assets_and_thumbnails(path)
+        materials = index.stale_assets(
+            ((mtl_path, thumb) for _, mtl_path, thumb, _ in assets),
+            self.settings.material_settings.render_params(),
+        )
+        ThumbnailJobQueue.push(JobKind.MATERIAL, pool_root, materials)
+        self.prioritise_thumbnail_jobs()
+
+        pending = ThumbnailJobQueue.pending(JobKind.MATERIAL, pool_root)
+        if not pending:
+            Logger.info("all material thumbnails are up to date")
+            return
+
+        Logger.info(f"rendering {pending} outdated material thumbnails")
+        if self.queue_thread_running:
+            return
 
-        self.render_thread = QThread(self)
-        self.render_worker = MayaThreadWorker(command)
+        self.queue_thread_running = True
+        self.queue_thread = QThread(self)
+        self.queue_worker = MaterialRenderThreadWorker(
+            pool_root,
+            partial(self.dcc_handler.render_all_materials_cmd, path),
+            self.settings.material_settings.render_workers,
+        )
 
-        self.render_worker.operation_ended.connect(self.render_worker_ended)
+        self.queue_worker.chunk_rendered.connect(self.on_materials_rendered)
+        self.queue_worker.progress.connect(self.on_render_progress)
+        self.queue_worker.operation_ended.connect(self.queue_worker_ended)
 
-        self.render_thread.started.connect(self.render_worker.run)
-        self.render_thread.finished.connect(self.render_thread.deleteLater)
+        self.queue_thread.started.connect(self.queue_worker.run)
+        self.queue_thread.finished.connect(self.queue_thread.deleteLater)
 
-        self.render_worker.moveToThread(self.render_thread)
-        self.render_thread.start()
+        self.queue_worker.moveToThread(self.queue_thread)
+        self.queue_thread.start()
 
     def render_worker_ended(self):
         self.render_worker.deleteLater()
         self.render_thread.quit()
-        self.draw_objects(force=True)
+        self.on_materials_rendered(*self.render_job)
+
+    def queue_worker_ended(self):
+        self.queue_worker.deleteLater()
+        self.queue_thread.quit()
+        self.queue_thread_running = False
+        self.update_thumbnail_pack()
+
+    def on_render_progress(self, done: int, total: int):
+        Logger.info(f"rendered {done}/{total} material thumbnails")
+
+    def on_materials_rendered(self, thumbnails: dict[Path, Path]):
+        if not thumbnails:
+            return
+
+        index = AssetIndex.for_asset(next(iter(thumbnails)))
+        render_params = self.settings.material_settings.render_params()
+        _, icon_size = self.tile_sizes()
+
+        for mtl_path, thumb in thumbnails.items():
+            index.record_thumbnail(mtl_path, render_params)
+            ThumbnailPack.discard(str(thumb))
+            if self.asset_grid:
+                self.asset_grid.asset_model.set_thumbnail(mtl_path, str(thumb))
+                continue
+
+            btn = self._button_cache.get(mtl_path)
+            if btn:
+                self.set_button_icon(btn, str(thumb), icon_size)
+
+        index.save()
 
     def repath_material_textures(self, materials=None):
         _, path = self.get_current_project()
@@ -1,17 +1,17 @@
-import time
-from functools import partial
 from pathlib import Path
 
-from Qt.QtCore import QCoreApplication, Qt, QThread
+from Qt.QtCore import QThread
 from Qt.QtWidgets import QAction, QLineEdit, QMenu
 
 from ...controller import (
+    AssetIndex,
     MayaHandler,
     MayaThreadWorker,
     ModelPoolHandler,
     SettingsManager,
+    ThumbnailPack,
 )
-from ...core import Logger, img, utils
+from ...core import Logger, utils
 from ..ui_components import Status
 from ..ui_components.attribute_editor import AttributeEditor
 from ..ui_components.buttons import IconButton, ViewportButton
@@ -54,6 +54,10 @@ class ModelsViewport(AssetViewport):
         self.reload.set_icon(":icons/tabler-icon-reload.png", size)
         self.reload.set_tooltip("Reload the current Pool")
 
+        self.select_outdated = IconButton(size)
+        self.select_outdated.set_icon(":icons/tabler-icon-photo-search.png", size)
+        self.select_outdated.set_tooltip("Select Models with outdated Thumbnails")
+
         self.search_bar = QLineEdit(placeholderText="Search")
         self.search_bar.setFixedHeight(20 * self.ui_scale)
 
@@ -63,6 +67,7 @@ class ModelsViewport(AssetViewport):
         self.toolbar.main_layout.addWidget(self.archive_viewer)
         self.toolbar.main_layout.addWidget(VLine())
         self.toolbar.main_layout.addWidget(self.reload)
+        self.toolbar.main_layout.addWidget(self.select_outdated)
         self.toolbar.main_layout.addWidget(VLine())
         self.toolbar.main_layout.addWidget(self.search_bar)
         self.toolbar.main_layout.addStretch()
@@ -72,6 +77,7 @@ class ModelsViewport(AssetViewport):
         self.export_selected.clicked.connect(self.open_export_model_dialog)
         self.reload.clicked.connect(lambda: self.draw_objects(force=True))
         self.archive_viewer.clicked.connect(self.open_archive_viewer)
+        self.select_outdated.clicked.connect(self.select_outdated_thumbnails)
         self.search_bar.textChanged.connect(self.search)
 
     def load_pools(self):
@@ -121,36 +127,28 @@ class ModelsViewport(AssetViewport):
         width = self.settings.window_settings.asset_button_size
 
         self.clear_layout()
-        assets = self.pool_handler.get_assets_and_thumbnails(path)
+        if force:
+            self.cancel_pending_icons()
+        assets = list(self.pool_handler.get_assets_and_thumbnails(path))
+        self.reserve_buttons(model_path for _, model_path, _, _ in assets)
         for model, model_path, thumb, size in assets:
             if not force and model_path in self._button_cache:
                 self.flow_layout.addWidget(self._button_cache[model_path])
                 continue
 
-            btn = ViewportButton(
-                model, (width, width), size, model_path.suffix, checkable=True
-            )
-            btn.icon.set_icon(
-                thumb or ":icons/tabler-icon-photo.png", (width - 20, width - 20)
-            )
-            btn.icon.clicked.connect(partial(self.attribute.display_asset, model_path))
-
-            btn.setContextMenuPolicy(Qt.CustomContextMenu)
-            btn.customContextMenuRequested.connect(
-                partial(self.on_context_menu, btn, model_path)
+            btn = self.acquire_button(
+                model_path, model, (width, width), size, checkable=True
             )
+            self.set_button_icon(btn, thumb, (width - 20, width - 20))
             self.flow_layout.addWidget(btn)
-            self._button_cache[model_path] = btn
 
-        if not self.attribute.current_asset:
-            self.attribute.display_asset(next(iter(self._button_cache)))
+        if not self.attribute.current_asset and assets:
+            self.attribute.display_asset(assets[0][1])
 
         super().draw_objects(force=force)
 
     def on_context_menu(self, button: ViewportButton, path: Path, point):
-        selected = [
-            path for path, btn in self._button_cache.items() if btn.icon.isChecked()
-        ]
+        selected = self.selected_assets()
 
         multi_path = selected or path
         tooltip = button.toolTip()
@@ -172,6 +170,9 @@ class ModelsViewport(AssetViewport):
         render_btn = QAction("Create Thumbnail", self)
         render_btn.triggered.connect(lambda: self.show_screenshot_frame(tooltip, path))
 
+        similar_btn = QAction("Find Similar", self)
+        similar_btn.triggered.connect(lambda: self.find_similar(path))
+
         archive = QAction("Archive and Replace", self)
         archive.triggered.connect(lambda: self.archive_and_replace(path))
 
@@ -185,6 +186,7 @@ class ModelsViewport(AssetViewport):
         pop_menu.addAction(archive)
         pop_menu.addSeparator()
         pop_menu.addAction(render_btn)
+        pop_menu.addAction(similar_btn)
         pop_menu.addSeparator()
         pop_menu.addAction(delete_btn)
 
@@ -193,16 +195,31 @@ class ModelsViewport(AssetViewport):
     def take_screenshot(self, data):
         geometry, model_name, model_path = data
         self.screenshot_frame.setVisible(False)
-        QCoreApplication.processEvents()
 
         _, path = self.get_current_project()
         if not path:
             return
-        time.sleep(0.2)
         screen_path = Path(path, "ModelPool", "Thumbnails", f"{model_name}.jpg")
 
-        img.take_screenshot(screen_path, geometry)
-        self.refresh_thumbnail(str(screen_path), model_path)
+        self.capture_screenshot(
+            geometry, screen_path, model_path, self.refresh_thumbnail
+        )
+
+    def select_outdated_thumbnails(self):
+        _, path = self.get_current_project()
+        if not path:
+            return
+
+        index = AssetIndex.for_pool(Path(path, "ModelPool"))
+        assets = self.pool_handler.get_assets_and_thumbnails(path)
+        outdated = set(
+            index.stale_assets((model_path, thumb) for _, model_path, thumb, _ in assets)
+        )
+
+        for model_path, btn in self.pool_buttons().items():
+            btn.icon.setChecked(model_path in outdated)
+
+        Logger.info(f"{len(outdated)} models have outdated thumbnails")
 
     def refresh_thumbnail(self, screen_path: str, model_path: str):
         width = self.settings.window_settings.asset_button_size
@@ -210,8 +227,10 @@ class ModelsViewport(AssetViewport):
         if not btn:
             return
 
+        ThumbnailPack.discard(screen_path)
         btn.icon.set_icon(screen_path, (width - 20, width - 20))
         btn.update()
+        self.update_thumbnail_pack()
 
     def show_screenshot_frame(self, model_name, path):
         self.screenshot_frame = ScreenshotFrame(model_name, path)
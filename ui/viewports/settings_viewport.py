@@ -14,7 +14,8 @@ from Qt.QtWidgets import (
     QSpinBox,
 )
 
-from ...controller import SettingsManager
+from ...controller import PROXY_SIZES, PixmapCache, SettingsManager
+from ...core.img import TONEMAP_OPERATORS
 from .base_viewport import DataViewport
 
 
@@ -37,6 +38,22 @@ class SettingsViewport(DataViewport):
         self.ui_scale.setRange(0, 10)
         self.ui_scale.setButtonSymbols(QAbstractSpinBox.NoButtons)
 
+        self.pixmap_cache_mb = QSpinBox()
+        self.pixmap_cache_mb.setRange(16, 16000)
+        self.pixmap_cache_mb.setButtonSymbols(QAbstractSpinBox.NoButtons)
+        self.packed_thumbnails = QCheckBox()
+        self.duplicate_distance = QSpinBox()
+        self.duplicate_distance.setRange(0, 16)
+        self.duplicate_distance.setButtonSymbols(QAbstractSpinBox.NoButtons)
+        self.virtual_grid = QCheckBox()
+        self.virtual_grid.setToolTip("Paint large pools without a widget per asset")
+        self.widget_cache_size = QSpinBox()
+        self.widget_cache_size.setRange(100, 1_000_000)
+        self.widget_cache_size.setButtonSymbols(QAbstractSpinBox.NoButtons)
+        self.widget_cache_size.setToolTip(
+            "Asset tiles kept across pools, the least recently used are deleted"
+        )
+
         self.material_settings = QGroupBox("Material Settings")
         self.material_renderer = QComboBox()
         self.material_renderer.addItems(("Default", "V-Ray", "Arnold", "Redshift"))
@@ -52,6 +69,24 @@ class SettingsViewport(DataViewport):
         self.render_resolution_y = QSpinBox()
         self.render_resolution_y.setRange(0, 5000)
         self.render_resolution_y.setButtonSymbols(QAbstractSpinBox.NoButtons)
+        self.render_daemon = QCheckBox()
+        self.render_daemon.setToolTip(
+            "Keep a mayapy session running between renders instead of starting "
+            "one per render"
+        )
+        self.render_daemon_jobs = QSpinBox()
+        self.render_daemon_jobs.setRange(0, 10_000)
+        self.render_daemon_jobs.setButtonSymbols(QAbstractSpinBox.NoButtons)
+        self.render_daemon_jobs.setToolTip(
+            "Restart the render session after this many renders, 0 never restarts"
+        )
+        self.render_workers = QSpinBox()
+        self.render_workers.setRange(1, 64)
+        self.render_workers.setButtonSymbols(QAbstractSpinBox.NoButtons)
+        self.render_workers.setToolTip(
+            "Render thumbnails in this many mayapy processes at once, "
+            "the cores are shared between them"
+        )
 
         self.model_settings = QGroupBox("Model Settings")
         self.screenshot_opacity = QDoubleSpinBox()
@@ -63,6 +98,15 @@ class SettingsViewport(DataViewport):
         self.hdri_renderer = QComboBox()
         self.hdri_renderer.addItems(("Default", "V-Ray", "Arnold", "Redshift"))
         self.auto_generate_thumb = QCheckBox()
+        self.tonemap_operator = QComboBox()
+        self.tonemap_operator.addItems(TONEMAP_OPERATORS)
+        self.tonemap_exposure = QDoubleSpinBox()
+        self.tonemap_exposure.setRange(0, 100)
+        self.tonemap_exposure.setButtonSymbols(QAbstractSpinBox.NoButtons)
+        self.tonemap_auto_exposure = QCheckBox()
+        self.generate_proxies = QCheckBox()
+        self.proxy_size = QComboBox()
+        self.proxy_size.addItems(PROXY_SIZES)
 
         self.save = QPushButton("Save")
 
@@ -75,6 +119,19 @@ class SettingsViewport(DataViewport):
             "Asset Button Size (px)", self.button_resolution
         )
         self.general_settings_layout.addRow("UI Scale", self.ui_scale)
+        self.general_settings_layout.addRow(
+            "Thumbnail Memory Budget (MB)", self.pixmap_cache_mb
+        )
+        self.general_settings_layout.addRow(
+            "Packed Thumbnails", self.packed_thumbnails
+        )
+        self.general_settings_layout.addRow(
+            "Duplicate Distance (bits)", self.duplicate_distance
+        )
+        self.general_settings_layout.addRow(
+            "Virtual Asset Grid (restart)", self.virtual_grid
+        )
+        self.general_settings_layout.addRow("Tile Cache Size", self.widget_cache_size)
         self.render_scene_layout = QHBoxLayout()
         self.render_scene_layout.addWidget(self.render_scene)
         self.render_scene_layout.addWidget(self.browse_render_scene)
@@ -95,6 +152,15 @@ class SettingsViewport(DataViewport):
         self.material_settings_layout.addRow(
             QLabel("Render Resolution"), self.resolution_layout
         )
+        self.material_settings_layout.addRow(
+            QLabel("Keep Render Session"), self.render_daemon
+        )
+        self.material_settings_layout.addRow(
+            QLabel("Restart Session After (renders)"), self.render_daemon_jobs
+        )
+        self.material_settings_layout.addRow(
+            QLabel("Render Workers"), self.render_workers
+        )
 
         self.model_settings_layout = QFormLayout(self.model_settings)
         self.model_settings_layout.addRow(
@@ -106,6 +172,19 @@ class SettingsViewport(DataViewport):
         self.hdri_settings_layout.addRow(
             QLabel("Auto Generate Thumbnails"), self.auto_generate_thumb
         )
+        self.hdri_settings_layout.addRow(
+            QLabel("Tonemap Operator (current Pool)"), self.tonemap_operator
+        )
+        self.hdri_settings_layout.addRow(
+            QLabel("Thumbnail Exposure (current Pool)"), self.tonemap_exposure
+        )
+        self.hdri_settings_layout.addRow(
+            QLabel("Auto Exposure (current Pool)"), self.tonemap_auto_exposure
+        )
+        self.hdri_settings_layout.addRow(
+            QLabel("Generate Proxies"), self.generate_proxies
+        )
+        self.hdri_settings_layout.addRow(QLabel("Proxy Resolution"), self.proxy_size)
 
         self.save_layout = QHBoxLayout()
         self.save_layout.addStretch()
@@ -133,6 +212,15 @@ class SettingsViewport(DataViewport):
     def read_from_settings_manager(self):
         self.button_resolution.setValue(self.settings.window_settings.asset_button_size)
         self.ui_scale.setValue(self.settings.window_settings.ui_scale)
+        self.pixmap_cache_mb.setValue(self.settings.window_settings.pixmap_cache_mb)
+        self.packed_thumbnails.setChecked(
+            self.settings.window_settings.packed_thumbnails
+        )
+        self.duplicate_distance.setValue(
+            self.settings.window_settings.duplicate_distance
+        )
+        self.virtual_grid.setChecked(self.settings.window_settings.virtual_grid)
+        self.widget_cache_size.setValue(self.settings.window_settings.widget_cache_size)
 
         self.material_renderer.setCurrentIndex(
             self.settings.material_settings.material_renderer
@@ -146,6 +234,11 @@ class SettingsViewport(DataViewport):
         self.render_resolution_y.setValue(
             self.settings.material_settings.render_resolution_y
         )
+        self.render_daemon.setChecked(self.settings.material_settings.render_daemon)
+        self.render_daemon_jobs.setValue(
+            self.settings.material_settings.render_daemon_jobs
+        )
+        self.render_workers.setValue(self.settings.material_settings.render_workers)
 
         self.screenshot_opacity.setValue(
             self.settings.model_settings.screenshot_opacity
@@ -154,10 +247,30 @@ class SettingsViewport(DataViewport):
         self.auto_generate_thumb.setChecked(
             self.settings.hdri_settings.auto_generate_thumbnails
         )
+        tonemap = self.settings.hdri_settings.get_tonemap(
+            self.settings.hdri_settings.current_pool
+        )
+        self.tonemap_operator.setCurrentText(tonemap["operator"])
+        self.tonemap_exposure.setValue(tonemap["exposure"])
+        self.tonemap_auto_exposure.setChecked(tonemap["auto_exposure"])
+        self.generate_proxies.setChecked(self.settings.hdri_settings.generate_proxies)
+        self.proxy_size.setCurrentText(self.settings.hdri_settings.proxy_size)
 
     def write_to_settings_manager(self):
         self.settings.window_settings.asset_button_size = self.button_resolution.value()
         self.settings.window_settings.ui_scale = self.ui_scale.value()
+        self.settings.window_settings.pixmap_cache_mb = self.pixmap_cache_mb.value()
+        PixmapCache.evict()
+        self.settings.window_settings.packed_thumbnails = (
+            self.packed_thumbnails.isChecked()
+        )
+        self.settings.window_settings.duplicate_distance = (
+            self.duplicate_distance.value()
+        )
+        self.settings.window_settings.virtual_grid = self.virtual_grid.isChecked()
+        self.settings.window_settings.widget_cache_size = (
+            self.widget_cache_size.value()
+        )
 
         self.settings.material_settings.render_resolution_x = (
             self.render_resolution_x.value()
@@ -165,6 +278,13 @@ class SettingsViewport(DataViewport):
         self.settings.material_settings.render_resolution_y = (
             self.render_resolution_y.value()
         )
+        self.settings.material_settings.render_daemon = (
+            self.render_daemon.isChecked()
+        )
+        self.settings.material_settings.render_daemon_jobs = (
+            self.render_daemon_jobs.value()
+        )
+        self.settings.material_settings.render_workers = self.render_workers.value()
         self.settings.material_settings.render_object = self.render_object.text()
         self.settings.material_settings.render_scene = self.render_scene.text()
         self.settings.material_settings.render_cam = self.render_cam.text()
@@ -180,3 +300,15 @@ class SettingsViewport(DataViewport):
         self.settings.hdri_settings.auto_generate_thumbnails = (
             self.auto_generate_thumb.isChecked()
         )
+        self.settings.hdri_settings.generate_proxies = (
+            self.generate_proxies.isChecked()
+        )
+        self.settings.hdri_settings.proxy_size = self.proxy_size.currentText()
+
+        current_hdri_pool = self.settings.hdri_settings.current_pool
+        if current_hdri_pool:
+            self.settings.hdri_settings.tonemap[current_hdri_pool] = {
+                "operator": self.tonemap_operator.currentText(),
+                "exposure": self.tonemap_exposure.value(),
+                "auto_exposure": self.tonemap_auto_exposure.isChecked(),
+            }
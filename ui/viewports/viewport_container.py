@@ -1,9 +1,11 @@
-from Qt.QtWidgets import QStackedWidget
+from Qt.QtCore import Signal
+from Qt.QtWidgets import QStackedWidget, QWidget
 
 from ...controller import SettingsManager
-from ...core import Logger
+from ...core import Logger, StartupTrace
 from ..ui_components import AttributeEditor
 from .about_viewport import AboutViewport
+from .base_viewport import AssetViewport
 from .hdri_viewport import HdriViewport
 from .help_viewport import HelpViewport
 from .lightsets_viewport import LightsetsViewport
@@ -15,48 +17,76 @@ from .viewport_mode import ViewportMode
 
 
 class ViewportContainer(QStackedWidget):
+    """Stack of the viewports behind the sidebar buttons.
+
+    A viewport is only created, and its pools loaded, the first time its
+    mode is shown, so opening the window only costs the active viewport.
+    """
+
+    save_requested = Signal()
+
+    VIEWPORTS = {
+        ViewportMode.Materials: MaterialsViewport,
+        ViewportMode.Models: ModelsViewport,
+        ViewportMode.Hdri: HdriViewport,
+        ViewportMode.Lightsets: LightsetsViewport,
+        ViewportMode.Utility: UtilityViewport,
+        ViewportMode.Help: HelpViewport,
+        ViewportMode.About: AboutViewport,
+        ViewportMode.Settings: SettingsViewport,
+    }
+    POOL_SETTINGS = {
+        ViewportMode.Materials: "material_settings",
+        ViewportMode.Models: "model_settings",
+        ViewportMode.Hdri: "hdri_settings",
+        ViewportMode.Lightsets: "lightset_settings",
+    }
+
     def __init__(self, attribute: AttributeEditor, parent=None):
         super().__init__(parent)
         self.viewport_mode = ViewportMode.Materials
         self.settings = SettingsManager()
         self.attribute = attribute
-        self.init_widgets()
-        self.init_layouts()
-
-    def init_widgets(self):
-        self.material_vp = MaterialsViewport(self.attribute)
-        self.model_vp = ModelsViewport(self.attribute)
-        self.hdri_vp = HdriViewport(self.attribute)
-        self.lightsets_vp = LightsetsViewport(self.attribute)
-        self.utility_vp = UtilityViewport(self.attribute)
-
-        self.help_vp = HelpViewport()
-        self.about_vp = AboutViewport()
-        self.settings_vp = SettingsViewport()
-
-    def init_layouts(self):
-        self.addWidget(self.material_vp)
-        self.addWidget(self.model_vp)
-        self.addWidget(self.hdri_vp)
-        self.addWidget(self.lightsets_vp)
-        self.addWidget(self.utility_vp)
-        self.addWidget(self.help_vp)
-        self.addWidget(self.about_vp)
-        self.addWidget(self.settings_vp)
+        self.viewports: dict[ViewportMode, QWidget] = {}
+
+    def viewport(self, mode: ViewportMode) -> QWidget:
+        """The viewport of ``mode``, created on first use."""
+
+        viewport = self.viewports.get(mode)
+        if viewport is not None:
+            return viewport
+
+        with StartupTrace.phase("create_viewport", mode.name):
+            viewport_class = self.VIEWPORTS[mode]
+            if issubclass(viewport_class, AssetViewport):
+                viewport = viewport_class(self.attribute)
+                if mode in self.POOL_SETTINGS:
+                    viewport.load_pools()
+            else:
+                viewport = viewport_class()
+
+        if isinstance(viewport, SettingsViewport):
+            viewport.read_from_settings_manager()
+            viewport.save.clicked.connect(self.save_requested.emit)
+
+        self.addWidget(viewport)
+        self.viewports[mode] = viewport
+        Logger.debug(f"created {mode.name} viewport")
+        return viewport
 
     def write_to_settings_manager(self):
         self.settings.window_settings.current_viewport = self.viewport_mode.value
 
-        mat_name, _ = self.material_vp.get_current_project()
-        self.settings.material_settings.current_pool = mat_name
-        model_name, _ = self.model_vp.get_current_project()
-        self.settings.model_settings.current_pool = model_name
-        hdri_name, _ = self.hdri_vp.get_current_project()
-        self.settings.hdri_settings.current_pool = hdri_name
-        lightset_name, _ = self.lightsets_vp.get_current_project()
+        # viewports that were never opened keep the pool they were saved with
+        for mode, settings_name in self.POOL_SETTINGS.items():
+            viewport = self.viewports.get(mode)
+            if viewport is not None:
+                pool_name, _ = viewport.get_current_project()
+                getattr(self.settings, settings_name).current_pool = pool_name
 
-        self.settings.lightset_settings.current_pool = lightset_name
-        self.settings_vp.write_to_settings_manager()
+        settings_vp = self.viewports.get(ViewportMode.Settings)
+        if settings_vp is not None:
+            settings_vp.write_to_settings_manager()
         Logger.debug("updated settings manager values.")
 
     def update_current_viewport(self, mode: ViewportMode) -> None:
@@ -64,56 +94,24 @@ class ViewportContainer(QStackedWidget):
         self.settings.window_settings.current_viewport = mode.value
 
     def read_from_settings_manager(self, initial=False):
-        self.settings_vp.read_from_settings_manager()
-
-        self.material_vp.load_pools()
-        self.model_vp.load_pools()
-        self.hdri_vp.load_pools()
-        self.lightsets_vp.load_pools()
+        for mode, viewport in self.viewports.items():
+            if mode in self.POOL_SETTINGS:
+                viewport.load_pools()
+            elif isinstance(viewport, SettingsViewport):
+                viewport.read_from_settings_manager()
 
         current_vp = self.settings.window_settings.current_viewport
         self.set_mode(ViewportMode(current_vp), initial=initial)
 
     def set_mode(self, mode: ViewportMode, initial=False):
-        curr = self.currentWidget()
-        if mode == ViewportMode.Materials:
-            if initial:
-                self.material_vp.draw_objects()
-                return
-            if curr == self.material_vp:
-                return
-            self.setCurrentWidget(self.material_vp)
-            self.material_vp.draw_objects()
-
-        elif mode == ViewportMode.Models:
-            if curr == self.model_vp:
-                return
-            self.setCurrentWidget(self.model_vp)
-            self.model_vp.draw_objects()
-
-        elif mode == ViewportMode.Hdri:
-            if curr == self.hdri_vp:
-                return
-            self.setCurrentWidget(self.hdri_vp)
-            self.hdri_vp.draw_objects()
-
-        elif mode == ViewportMode.Lightsets:
-            if curr == self.lightsets_vp:
-                return
-            self.setCurrentWidget(self.lightsets_vp)
-            self.lightsets_vp.draw_objects()
-
-        elif mode == ViewportMode.Utility:
-            if curr == self.utility_vp:
-                return
-            self.setCurrentWidget(self.utility_vp)
-            self.utility_vp.draw_objects()
-
-        elif mode == ViewportMode.Help:
-            self.setCurrentWidget(self.help_vp)
-        elif mode == ViewportMode.About:
-            self.setCurrentWidget(self.about_vp)
-        elif mode == ViewportMode.Settings:
-            self.setCurrentWidget(self.settings_vp)
+        viewport = self.viewport(mode)
+        is_asset_viewport = isinstance(viewport, AssetViewport)
+        if is_asset_viewport and not initial and self.currentWidget() is viewport:
+            return
+
+        self.setCurrentWidget(viewport)
+        if is_asset_viewport:
+            with StartupTrace.phase("draw_objects", mode.name):
+                viewport.draw_objects()
 
         self.update_current_viewport(mode)